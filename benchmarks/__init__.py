@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import glob
+import os
+import typing
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS = (
+    'print("{index}:", {index} + 1 * 2)',
+    "items{group} <- [{index}, {index} + 1, {index} + 2]",
+    "print([item + 1 for item in items{group} if item > 0])",
+    'print({{"a": {index}, "b": [-{index}]}})',
+    "print(items{group}[0:2], 1 in items{group}, {index} == 1 or {index} != 2)",
+)
+
+
+def corpus() -> dict[str, str]:
+    sources: dict[str, str] = {}
+
+    for path in sorted(glob.glob(os.path.join(ROOT, "tests", "*.srp"))):
+        with open(path, "r") as fp:
+            sources[os.path.basename(path)] = fp.read()
+
+    return sources
+
+
+def fill(templates: typing.Sequence[str], size: int) -> str:
+    lines: list[str] = []
+    written = 0
+
+    while written < size:
+        index = len(lines)
+        group, template = divmod(index, len(templates))
+        line = templates[template].format(index=index, group=group)
+
+        lines.append(line)
+        written += len(line) + 1
+
+    return "\n".join(lines) + "\n"
+
+
+def generate(size: int) -> str:
+    return fill(STATEMENTS, size)
+
+
+def nesting(size: int, depth: int = 64) -> str:
+    # Kept below the recursion limit of `compile`.
+    sums = "(" * depth + "{index}" + " + 1)" * depth
+    lists = "[" * depth + "{index}" + "]" * depth
+
+    return fill((f"nested{{index}} <- {sums}", f"nested{{index}} <- {lists}"), size)
+
+
+def arguments(size: int, count: int = 256) -> str:
+    values = ", ".join(f"{{index}} + {item}" for item in range(count))
+    keywords = ", ".join(f"key{item}={item}" for item in range(count))
+
+    return fill(
+        (f"called{{index}} <- max({values})", f"called{{index}} <- dict({keywords})"),
+        size,
+    )
+
+
+def containers(size: int, width: int = 1024) -> str:
+    items = ", ".join(map(str, range(width)))
+    pairs = ", ".join(f'"{item}": {{index}}' for item in range(width))
+
+    return fill(
+        (
+            f"wide{{index}} <- [{items}, {{index}}]",
+            f"wide{{index}} <- ({items}, {{index}})",
+            f"wide{{index}} <- {{{{{items}, {{index}}}}}}",
+            f"wide{{index}} <- {{{{{pairs}}}}}",
+        ),
+        size,
+    )
+
+
+def comprehensions(size: int) -> str:
+    return fill(
+        (
+            "comp{index} <- [x * {index} for x in range(32) if x % 3 == 0]",
+            "comp{index} <- {{x: [y for y in range(x)] for x in range(8)}}",
+            "comp{index} <- {{x exp 2 for x in range(16) if x not in [1, 2]}}",
+            "comp{index} <- sum((x for x in [y + 1 for y in range(16)] if x > 4))",
+        ),
+        size,
+    )
+
+
+GENERATORS: dict[str, typing.Callable[[int], str]] = {
+    "mixed": generate,
+    "nesting": nesting,
+    "arguments": arguments,
+    "containers": containers,
+    "comprehensions": comprehensions,
+}
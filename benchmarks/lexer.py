@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import time
+import typing
+from argparse import ArgumentParser
+
+from serpentes.lexer import tokenize
+from serpentes.parser import build_parser, lexer_options
+
+from . import GENERATORS, corpus
+
+COLUMNS = ("lark lex", "srp lex", "lark parse", "srp parse", "srp replay")
+
+
+def measure(function: typing.Callable[[], typing.Any], repeat: int) -> float:
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main() -> None:
+    parser = ArgumentParser(prog="Lexer benchmark")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[10_000, 100_000])
+    parser.add_argument(
+        "--inputs",
+        nargs="*",
+        choices=("corpus", *GENERATORS),
+        default=["corpus", "mixed"],
+    )
+
+    args = parser.parse_args()
+
+    # `lex()` always uses lark's basic lexer, the parsers use what they are built with.
+    # Only LALR takes the serpentes lexer, Earley keeps its dynamic one.
+    lark = build_parser("lalr")
+    srp = build_parser("lalr", **lexer_options("lalr"))
+
+    inputs = corpus() if "corpus" in args.inputs else {}
+    inputs.update(
+        {
+            f"{name}/{size}": GENERATORS[name](size)
+            for name in args.inputs
+            if name in GENERATORS
+            for size in args.sizes
+        }
+    )
+
+    print(
+        f"{'input':<24} {'tokens':>8}" + "".join(f" {column:>12}" for column in COLUMNS)
+    )
+
+    for name, text in inputs.items():
+        tokens = len(tokenize(text))
+
+        # Replaying includes lexing the stream, like `SrpParser.parse` does.
+        timings = (
+            measure(lambda: list(lark.lex(text)), args.repeat),
+            measure(lambda: tokenize(text), args.repeat),
+            measure(lambda: lark.parse(text, start="module"), args.repeat),
+            measure(lambda: srp.parse(text, start="module"), args.repeat),
+            measure(lambda: srp.parse(tokenize(text), start="module"), args.repeat),
+        )
+
+        print(
+            f"{name:<24} {tokens:>8}"
+            + "".join(f" {tokens / elapsed:>12,.0f}" for elapsed in timings)
+        )
+
+    print("\nTokens per second, higher is better.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import ast
+import marshal
+import time
+import typing
+from argparse import ArgumentParser
+
+from serpentes import SrpTransformer, get_parser
+
+BRACKETS: dict[str, tuple[str, str]] = {
+    "list": ("[", "]"),
+    "tuple": ("(", ")"),
+    "set": ("{", "}"),
+    "dict": ("{", "}"),
+}
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+
+def literal(kind: str, size: int) -> str:
+    opening, closing = BRACKETS[kind]
+    template = '"{0}": {0}' if kind == "dict" else "{0}"
+
+    return opening + ", ".join(map(template.format, range(size))) + closing
+
+
+def timed(function: typing.Callable[[typing.Any], typing.Any], value: typing.Any):
+    start = time.perf_counter()
+    result = function(value)
+
+    return time.perf_counter() - start, result
+
+
+def measure(source: str, optimize: int = 1) -> dict[str, typing.Any]:
+    lalr = get_parser("lalr")
+    parse, tree = timed(lambda source: lalr.parse(source, start="module"), source)
+    transform, module = timed(SrpTransformer(optimize=optimize).transform, tree)
+    build, built = timed(lambda module: module.build(), module)
+    compiled, code = timed(lambda built: compile(built, "<literal>", "exec"), built)
+
+    return {
+        "parse": parse,
+        "transform": transform,
+        "build": build,
+        "compile": compiled,
+        "nodes": sum(1 for _ in ast.walk(built)),
+        "bytecode": len(marshal.dumps(code)),
+    }
+
+
+def main() -> None:
+    parser = ArgumentParser(prog="Container literal benchmark")
+    parser.add_argument("--sizes", type=int, nargs="*", default=list(SIZES))
+    parser.add_argument("-O", dest="optimize", type=int, choices=(0, 1, 2), default=1)
+    parser.add_argument(
+        "--kinds", nargs="*", choices=list(BRACKETS), default=list(BRACKETS)
+    )
+
+    args = parser.parse_args()
+    get_parser("lalr")
+
+    print(
+        f"{'kind':<6} {'elements':>9} {'parse (s)':>10} {'transform':>10} {'build':>8}"
+        f" {'compile':>8} {'ast nodes':>10} {'bytecode':>10}"
+    )
+
+    for kind in args.kinds:
+        for size in args.sizes:
+            result = measure(f"data <- {literal(kind, size)}\n", args.optimize)
+            print(
+                f"{kind:<6} {size:>9} {result['parse']:>10.3f}"
+                f" {result['transform']:>10.3f} {result['build']:>8.3f}"
+                f" {result['compile']:>8.3f} {result['nodes']:>10} {result['bytecode']:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import ast
+import gc
+import tracemalloc
+import typing
+from argparse import ArgumentParser
+
+from serpentes.linetable import statement_lines
+from serpentes.nodes import Interner
+from serpentes.parser import LineTransformer, SrpParser, SrpTransformer
+
+from . import GENERATORS
+
+
+class UnsharedTransformer(LineTransformer):
+    # The position-free transform as it was before subtrees were shared.
+    def create(
+        self, node: typing.Any, meta: typing.Any, **data: typing.Any
+    ) -> typing.Any:
+        return node(meta=None, **data)
+
+    def share(self, node: typing.Any) -> typing.Any:
+        return node
+
+
+def measure(
+    transformer: SrpTransformer, tree: typing.Any, lines: typing.Any
+) -> dict[str, typing.Any]:
+    # Interned strings and lark's caches stay from the first transform, so it isn't traced.
+    transformer.transform(tree)
+
+    gc.collect()
+    tracemalloc.start()
+
+    module = transformer.transform(tree)
+    nodes, _ = tracemalloc.get_traced_memory()
+
+    built = module.build(lines)
+    requested, shared = transformer.interner.requested, len(transformer.interner.nodes)
+
+    # Only the built module is kept once it is compiled.
+    del module
+    transformer.interner = Interner()
+    gc.collect()
+
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "nodes": nodes,
+        "ast": retained,
+        "peak": peak,
+        "objects": len({id(node) for node in ast.walk(built)}),
+        "shared": 1 - shared / requested if requested else 0.0,
+    }
+
+
+def main() -> None:
+    parser = ArgumentParser(prog="Interning memory report")
+    parser.add_argument("--sizes", type=int, nargs="*", default=[100_000, 1_000_000])
+    parser.add_argument(
+        "--inputs", nargs="*", choices=list(GENERATORS), default=["mixed"]
+    )
+
+    args = parser.parse_args()
+
+    positioned = SrpParser("lalr")
+    lines = SrpParser("lalr", positions=False)
+
+    print(
+        f"{'input':<20} {'transform':<10} {'nodes MB':>9} {'ast MB':>8} {'peak MB':>8}"
+        f" {'ast objects':>12} {'shared':>7}"
+    )
+
+    for name in args.inputs:
+        for size in args.sizes:
+            text = GENERATORS[name](size)
+            runs = (
+                ("positions", SrpTransformer(), positioned),
+                ("unshared", UnsharedTransformer(), lines),
+                ("shared", LineTransformer(), lines),
+            )
+
+            for mode, transformer, srp in runs:
+                # Lark adds metas to the trees it transforms, they are made up front so
+                # only the transform is measured.
+                tree = srp.parse(text)
+                table = None if srp is positioned else statement_lines(tree)
+
+                for subtree in tree.iter_subtrees():
+                    subtree.meta
+
+                result = measure(transformer, tree, table)
+                print(
+                    f"{f'{name}/{size}':<20} {mode:<10}"
+                    f" {result['nodes'] / 2**20:>9.1f} {result['ast'] / 2**20:>8.1f}"
+                    f" {result['peak'] / 2**20:>8.1f} {result['objects']:>12,}"
+                    f" {result['shared']:>6.0%}"
+                )
+
+    print("\nMemory traced while transforming and building, lower is better.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import os
+import time
+from argparse import ArgumentParser
+
+from serpentes.compiler import compile_source, split_chunks, warm
+
+from . import GENERATORS
+
+WORKERS = (1, 2, 4, 8, 16)
+
+
+def main() -> None:
+    parser = ArgumentParser(prog="Parallel parsing benchmark")
+    parser.add_argument("--parser", choices=("lalr", "earley"), default="lalr")
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--input", choices=list(GENERATORS), default="mixed")
+    parser.add_argument("--workers", type=int, nargs="*", default=list(WORKERS))
+    parser.add_argument("--no-positions", dest="positions", action="store_false")
+
+    args = parser.parse_args()
+    text = GENERATORS[args.input](args.size)
+
+    start = time.perf_counter()
+    split_chunks(text, max(args.workers))
+    scanned = time.perf_counter() - start
+
+    print(f"{len(text):,} bytes, split in {scanned:.3f}s, {os.cpu_count()} cpus")
+    print(f"{'workers':>7} {'chunks':>7} {'seconds':>9} {'speedup':>8}")
+
+    # The serial parse loads its parser up front, like every worker of the pool does.
+    warm(args.parser, args.positions)
+    serial = None
+
+    for workers in args.workers:
+        chunks = split_chunks(text, workers) if workers != 1 else None
+
+        start = time.perf_counter()
+        compile_source(
+            text, parser=args.parser, positions=args.positions, workers=workers
+        )
+        elapsed = time.perf_counter() - start
+
+        serial = serial or elapsed
+        print(
+            f"{workers:>7} {len(chunks) if chunks else 1:>7} {elapsed:>9.3f}"
+            f" {serial / elapsed:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
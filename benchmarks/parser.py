@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import time
+from argparse import ArgumentParser
+
+from serpentes import build_parser
+
+from . import corpus, generate
+
+
+def measure(parse, text: str, repeat: int) -> float:
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(text)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main() -> None:
+    parser = ArgumentParser(prog="Parser benchmark")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[1_000, 10_000, 30_000])
+
+    args = parser.parse_args()
+    lalr, earley = build_parser("lalr"), build_parser("earley")
+
+    inputs = corpus()
+    inputs.update({f"generated-{size}": generate(size) for size in args.sizes})
+
+    print(
+        f"{'input':<24} {'bytes':>8} {'earley (s)':>12} {'lalr (s)':>12} {'speedup':>8}"
+    )
+
+    for name, text in inputs.items():
+        slow = measure(earley.parse, text, args.repeat)
+        # The LALR grammar also starts at `rest`, for statements parsed apart.
+        fast = measure(lambda text: lalr.parse(text, start="module"), text, args.repeat)
+
+        print(
+            f"{name:<24} {len(text):>8} {slow:>12.5f} {fast:>12.5f} {slow / fast:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
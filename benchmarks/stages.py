@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import typing
+from argparse import ArgumentParser
+
+import lark
+
+from serpentes import (
+    LineTransformer,
+    SrpParser,
+    SrpTransformer,
+    __version__,
+    build_parser,
+    get_parser,
+)
+from serpentes.linetable import statement_lines
+from serpentes.parser import PARSERS
+
+from . import GENERATORS, corpus
+
+STAGES = ("parse", "transform", "build", "compile", "exec")
+SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+Stage: typing.TypeAlias = typing.Callable[[typing.Any], typing.Any]
+
+
+def stages(name: str, parser: str, positions: bool) -> dict[str, Stage]:
+    # `run` rebuilds Earley's trees for the standalone transformer, `parse` would lex too.
+    srp_parser = SrpParser(parser, positions=positions)
+    transformer = SrpTransformer() if positions else LineTransformer()
+
+    def transform(tree: typing.Any) -> tuple[typing.Any, typing.Any]:
+        # Without positions, the lines of the statements come from their tokens.
+        return transformer.transform(tree), None if positions else statement_lines(tree)
+
+    def execute(code: typing.Any) -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            exec(code, {"__name__": "__benchmark__"})
+
+    return {
+        "parse": lambda text: srp_parser.run(parser, text),
+        "transform": transform,
+        "build": lambda transformed: transformed[0].build(transformed[1]),
+        "compile": lambda module: compile(module, name, "exec"),
+        "exec": execute,
+    }
+
+
+def timed(function: Stage, value: typing.Any, repeat: int) -> tuple[float, typing.Any]:
+    best, result = float("inf"), None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(value)
+        best = min(best, time.perf_counter() - start)
+
+    return best, result
+
+
+def traced(function: Stage, value: typing.Any) -> tuple[int, typing.Any]:
+    tracemalloc.reset_peak()
+    current, _ = tracemalloc.get_traced_memory()
+
+    result = function(value)
+    return tracemalloc.get_traced_memory()[1] - current, result
+
+
+def measure(
+    name: str, text: str, parser: str, repeat: int, memory: bool, positions: bool
+) -> dict[str, dict[str, float]]:
+    chain = stages(name, parser, positions)
+    results: dict[str, dict[str, float]] = {}
+
+    value: typing.Any = text
+    for stage in STAGES:
+        elapsed, value = timed(chain[stage], value, repeat)
+        results[stage] = {"time": elapsed}
+
+    # Tracing slows allocation heavy code down a lot, so memory gets a run of its own.
+    if memory:
+        tracemalloc.start()
+
+        value = text
+        for stage in STAGES:
+            results[stage]["peak"], value = traced(chain[stage], value)
+
+        tracemalloc.stop()
+
+    return results
+
+
+def grammar(parser: str, repeat: int) -> dict[str, float]:
+    def cached(_: typing.Any) -> None:
+        # Parsers without positions are kept under a key of their own, `lalr:lines`.
+        for key in [key for key in PARSERS if key.split(":")[0] == parser]:
+            del PARSERS[key]
+
+        get_parser(parser)
+
+    get_parser(parser)
+
+    return {
+        "build": timed(lambda _: build_parser(parser), None, repeat)[0],
+        "cached": timed(cached, None, repeat)[0],
+    }
+
+
+def inputs(names: list[str], sizes: list[int]) -> typing.Iterator[tuple[str, str]]:
+    if "corpus" in names:
+        yield from ((f"corpus/{name}", text) for name, text in corpus().items())
+
+    for generator in names:
+        if generator in GENERATORS:
+            for size in sizes:
+                yield f"{generator}/{size}", GENERATORS[generator](size)
+
+
+def compare(baseline: dict[str, typing.Any], report: dict[str, typing.Any]) -> None:
+    previous = {entry["name"]: entry["stages"] for entry in baseline["inputs"]}
+
+    print(
+        f"{'input':<28} {'stage':<10} {'before (s)':>12} {'after (s)':>12} {'ratio':>8}"
+    )
+
+    for entry in report["inputs"]:
+        if (old := previous.get(entry["name"])) is None:
+            continue
+
+        for stage in STAGES:
+            before, after = old[stage]["time"], entry["stages"][stage]["time"]
+            ratio = after / before if before else float("nan")
+
+            print(
+                f"{entry['name']:<28} {stage:<10} {before:>12.5f} {after:>12.5f}"
+                f" {ratio:>7.2f}x"
+            )
+
+
+def main() -> None:
+    parser = ArgumentParser(prog="Stage benchmark")
+    parser.add_argument("--parser", choices=("lalr", "earley"), default="lalr")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--sizes", type=int, nargs="*", default=list(SIZES))
+    parser.add_argument(
+        "--inputs",
+        nargs="*",
+        choices=("corpus", *GENERATORS),
+        default=["corpus", *GENERATORS],
+    )
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument(
+        "--no-positions",
+        action="store_false",
+        dest="positions",
+        help="Parse without positions and build with statement lines only.",
+    )
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout.")
+    parser.add_argument("--compare", help="A previous JSON report to compare against.")
+
+    args = parser.parse_args()
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+
+    report: dict[str, typing.Any] = {
+        "meta": {
+            "serpentes": __version__,
+            "lark": lark.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "parser": args.parser,
+            "repeat": args.repeat,
+            "positions": args.positions,
+        },
+        "grammar": grammar(args.parser, args.repeat),
+        "inputs": [],
+    }
+
+    for name, text in inputs(args.inputs, args.sizes):
+        print(f"{name} ({len(text)} bytes)", file=sys.stderr)
+
+        report["inputs"].append(
+            {
+                "name": name,
+                "bytes": len(text),
+                "stages": measure(
+                    name,
+                    text,
+                    args.parser,
+                    args.repeat,
+                    not args.no_memory,
+                    args.positions,
+                ),
+            }
+        )
+
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(report, fp, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r") as fp:
+            compare(json.load(fp), report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+from argparse import ArgumentParser
+
+from serpentes import AstTransformer, SrpTransformer, get_parser
+
+from . import generate
+
+
+def nodes(tree):
+    return SrpTransformer().transform(tree).build()
+
+
+def direct(tree):
+    return AstTransformer().transform(tree)
+
+
+def measure(build, tree) -> tuple[float, int, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    module = build(tree)
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    blocks = sum(
+        stat.count for stat in tracemalloc.take_snapshot().statistics("filename")
+    )
+    tracemalloc.stop()
+
+    del module
+    return elapsed, peak, blocks
+
+
+def main() -> None:
+    parser = ArgumentParser(prog="Transform benchmark")
+    parser.add_argument(
+        "--sizes", type=int, nargs="*", default=[10_000, 100_000, 500_000]
+    )
+
+    args = parser.parse_args()
+    lalr = get_parser("lalr")
+
+    print(
+        f"{'bytes':>8} {'mode':<8} {'time (s)':>10} {'peak (KiB)':>12} {'live blocks':>12}"
+    )
+
+    for size in args.sizes:
+        tree = lalr.parse(generate(size), start="module")
+
+        for name, build in (("nodes", nodes), ("direct", direct)):
+            elapsed, peak, blocks = measure(build, tree)
+            print(
+                f"{size:>8} {name:<8} {elapsed:>10.4f} {peak / 1024:>12.1f} {blocks:>12}"
+            )
+
+
+if __name__ == "__main__":
+    main()
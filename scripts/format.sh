@@ -1,2 +1,2 @@
-poetry run black ./ --line-length=90
-poetry run isort ./ --profile="black"
+poetry run black ./ --line-length=90 --extend-exclude="_generated\.py"
+poetry run isort ./ --profile="black" --skip="_generated.py"
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+from argparse import ArgumentParser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules which must only be imported once something is compiled.
+HEAVY = (
+    "lark",
+    "rich",
+    "serpentes.parser",
+    "serpentes.parser._generated",
+    "serpentes.compiler",
+)
+
+# Importing a module out of the bytecode cache compiles nothing, so it never parses.
+PARSING = ("lark", "serpentes.parser", "serpentes.parser._generated")
+
+COMMANDS = {
+    "import serpentes": (["-c", "import serpentes"], HEAVY),
+    "serpentes --version": (["-m", "serpentes", "--version"], HEAVY),
+    "cached .srp import": (["-c", "import serpentes, cached"], PARSING),
+}
+
+
+def importtime(arguments: list[str], path: str) -> dict[str, int]:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join((ROOT, path)))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *arguments],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+
+    # import time: self [us] | cumulative | imported package
+    modules: dict[str, int] = {}
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        modules[name.strip()] = int(cumulative)
+
+    return modules
+
+
+def main() -> None:
+    parser = ArgumentParser(prog="Import time check")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=60.0,
+        help="The most `import serpentes` may take, in milliseconds.",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+
+    args = parser.parse_args()
+    failures = 0
+
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, "cached.srp"), "w") as fp:
+            fp.write('value <- "cached"\n')
+
+        # The first run compiles the module and writes its bytecode.
+        importtime(COMMANDS["cached .srp import"][0], directory)
+
+        results = {
+            command: (
+                [importtime(arguments, directory) for _ in range(args.repeat)],
+                heavy,
+            )
+            for command, (arguments, heavy) in COMMANDS.items()
+        }
+
+    for command, (runs, modules) in results.items():
+        heavy = sorted({name for run in runs for name in run if name in modules})
+
+        best = min(run.get("serpentes", 0) for run in runs) / 1000
+
+        if heavy:
+            status = f"imports {', '.join(heavy)}"
+        elif best > args.budget:
+            status = f"over the {args.budget:.0f}ms budget"
+        else:
+            status = "ok"
+
+        failures += status != "ok"
+        print(f"{command:<24} {best:>8.2f}ms  {status}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import ast
+import contextlib
+import glob
+import io
+import os
+import sys
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from serpentes import AstTransformer, SrpParser, SrpTransformer  # noqa: E402
+from serpentes.compiler import compile_source  # noqa: E402
+
+
+def execute(text: str, optimize: int = 0, direct: bool = False) -> str:
+    # What a run prints, followed by what it raised, so failing runs compare too.
+    output = io.StringIO()
+
+    with warnings.catch_warnings(), contextlib.redirect_stdout(output):
+        warnings.simplefilter("ignore")
+
+        try:
+            exec(compile_source(text, direct=direct, optimize=optimize), {})
+        except Exception as error:
+            print(f"{type(error).__name__}: {error}")
+
+    return output.getvalue()
+
+
+def dump(parser: SrpParser, text: str, direct: bool = False) -> str:
+    try:
+        tree = parser.parse(text)
+
+        if direct:
+            return ast.dump(AstTransformer().transform(tree), include_attributes=True)
+
+        module = SrpTransformer().transform(tree).build()
+    except Exception as error:
+        return f"{type(error).__name__}: {error}"
+
+    return ast.dump(module, include_attributes=True)
+
+
+def main() -> None:
+    parser = SrpParser()
+    failures = 0
+
+    print(
+        f"{'file':<24} {'direct ast':<12} {'direct output':<14}"
+        f" {'-O output':<12} {'-OO output':<12}"
+    )
+
+    for path in sorted(glob.glob(os.path.join(ROOT, "tests", "*.srp"))):
+        with open(path, "r") as fp:
+            text = fp.read()
+
+        baseline = execute(text)
+        checks = [
+            dump(parser, text) == dump(parser, text, direct=True),
+            execute(text, direct=True) == baseline,
+            *(execute(text, level) == baseline for level in (1, 2)),
+        ]
+
+        failures += not all(checks)
+        print(
+            f"{os.path.basename(path):<24}",
+            *(
+                f"{'ok' if ok else 'MISMATCH':<{width}}"
+                for ok, width in zip(checks, (12, 14, 12, 12))
+            ),
+        )
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
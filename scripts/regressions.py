@@ -0,0 +1,880 @@
+from __future__ import annotations
+
+import ast
+import asyncio
+import codecs
+import contextlib
+import glob
+import io
+import itertools
+import os
+import subprocess
+import sys
+import tempfile
+import typing
+import warnings
+from importlib.util import cache_from_source
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from serpentes import compiler  # noqa: E402
+from serpentes import LineTransformer, SrpParser, SrpTransformer  # noqa: E402
+from serpentes.cache import bytecode_path, load_bytecode  # noqa: E402
+from serpentes.compiler import (  # noqa: E402
+    IncrementalCompiler,
+    build_source,
+    cache_tag,
+)
+from serpentes.nodes import Module, Node  # noqa: E402
+from serpentes.optimizer import LEVELS, fold, optimize  # noqa: E402
+from serpentes.parser import ParseError, build_parser, lexer_options  # noqa: E402
+from serpentes.profiling import Event, add_listener, remove_listener  # noqa: E402
+from serpentes.scanner import split_statements  # noqa: E402
+from serpentes.session import Session  # noqa: E402
+from serpentes.transpiler import transpile_source  # noqa: E402
+
+CHECKS: dict[str, typing.Callable[[], None]] = {}
+
+
+def check(function: typing.Callable[[], None]) -> typing.Callable[[], None]:
+    CHECKS[function.__name__.replace("_", " ")] = function
+    return function
+
+
+# Names starting with a keyword, neither parser may read them as the keyword and a name.
+KEYWORD_PREFIXED = (
+    *("index", "island", "orange", "andy", "exponent", "expression", "int", "input"),
+    *("format", "nonempty", "truest", "falsey", "elsewhere", "iffy", "matches", "cases"),
+)
+
+
+def corpus() -> list[str]:
+    texts = []
+
+    for path in sorted(glob.glob(os.path.join(ROOT, "tests", "*.srp"))):
+        with open(path, "r") as fp:
+            texts.append(fp.read())
+
+    return texts
+
+
+def dump(tree: typing.Any, attributes: bool = False) -> str:
+    module = SrpTransformer().transform(tree).build()
+    return ast.dump(module, include_attributes=attributes)
+
+
+def serpentes(*arguments: str, cwd: str | None = None) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    return subprocess.run(
+        [sys.executable, "-m", "serpentes", *arguments],
+        capture_output=True,
+        cwd=cwd,
+        env=env,
+        text=True,
+    )
+
+
+@check
+def transpile_into_current_directory() -> None:
+    # Outputs without a directory are written next to where the command runs.
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, "main.srp"), "w") as fp:
+            fp.write('print("ok")\n')
+
+        os.chmod(os.path.join(directory, "main.srp"), 0o644)
+        umask = os.umask(0o022)
+
+        try:
+            result = serpentes("transpile", "main.srp", cwd=directory)
+        finally:
+            os.umask(umask)
+
+        assert result.returncode == 0, result.stderr
+        assert os.path.exists(os.path.join(directory, "main.py")), result.stdout
+
+        # Outputs are as readable as their source.
+        for name in ("main.py", "main.py.map"):
+            mode = os.stat(os.path.join(directory, name)).st_mode & 0o777
+            assert mode == 0o644, (name, oct(mode))
+
+
+@check
+def transpiled_tracebacks_resolve_to_sources() -> None:
+    # The `.py` files run on a bare interpreter, and `resolve` points their tracebacks back
+    # at the `.srp` lines through the map files.
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "src", "pkg", "main.srp")
+        os.makedirs(os.path.dirname(source))
+
+        with open(source, "w") as fp:
+            fp.write("// Fails on the last line.\nx <- [1,\n  2]\nprint(x)\ny <- x[5]\n")
+
+        output = os.path.join(directory, "out")
+        result = serpentes("transpile", os.path.join(directory, "src"), "-o", output)
+        assert result.returncode == 0, result.stderr
+
+        result = subprocess.run(
+            [sys.executable, "-I", os.path.join(output, "pkg", "main.py")],
+            capture_output=True,
+            text=True,
+        )
+        assert result.stdout == "[1, 2]\n", result.stderr
+
+        traceback = result.stderr
+        result = subprocess.run(
+            [sys.executable, "-m", "serpentes", "resolve"],
+            input=traceback,
+            capture_output=True,
+            env=dict(os.environ, PYTHONPATH=ROOT),
+            text=True,
+        )
+
+        assert f'File "{source}", line 5, in <module>\n' in result.stdout, result.stdout
+        assert "    y <- x[5]\nIndexError" in result.stdout, result.stdout
+
+
+@check
+def transpiled_constants_keep_positions() -> None:
+    # Folded constants don't unparse to the same tree, the nodes after them still map,
+    # and sets don't depend on what `frozenset` names.
+    text = "items <- [1, 2, 3]\nfrozenset <- none\nprint(2 in {1, 2, 3}, items, 4)\n"
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        python, mapping = transpile_source(text, optimize=1)
+
+    assert "frozenset(" not in python, python
+
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        exec(python, {})
+
+    assert output.getvalue() == "True [1, 2, 3] 4\n", output.getvalue()
+
+    columns = {column for line, _, _, column in mapping["positions"] if line == 3}
+    assert {7, 23, 30} <= columns, mapping["positions"]
+
+
+@check
+def formatting_is_not_folded() -> None:
+    # Widths are only known once formatted, folding would allocate them first.
+    for text in ('"%0999999999d" % 1', 'b"%0999999999d" % 1'):
+        module = build_source(text, optimize=2)
+        value = getattr(module.body[0], "value", None)
+        assert isinstance(value, ast.BinOp), ast.dump(module)
+
+
+@check
+def folding_leaves_its_input_alone() -> None:
+    # Parsed trees share nodes with each other, folding one must not change another.
+    text = "x <- 1 + 2 or y\nx <- [1, 2, 3] + [2]\nprint(x in [1, 2, 3], (1 + 2) * x)\n"
+
+    def built(module: Module | ast.Module) -> str:
+        return ast.dump(module if isinstance(module, ast.Module) else module.build())
+
+    for direct in (False, True):
+        module = compiler.transform_source(text, direct=direct)
+        before = built(module)
+        folded = optimize(module, 2)
+
+        assert built(module) == before, built(module)
+        assert "value=3" in built(folded), built(folded)
+
+
+@check
+def shared_subtrees_fold_apart() -> None:
+    # Without positions, equal statements are the same node. Folding one leaves the other
+    # as it was parsed.
+    tree = SrpParser(positions=False).parse("print(1 + 2 or y)\nprint(1 + 2 or y)\n")
+    first, second = LineTransformer().transform(tree).body
+
+    assert first is second
+    before = ast.dump(second.build((2, 2)))
+
+    folded = fold(first, 2)
+    assert isinstance(folded, Node)
+
+    dumped = ast.dump(folded.build((1, 1)))
+    assert "value=3" in dumped and "BinOp" not in dumped, dumped
+    assert ast.dump(second.build((2, 2))) == before
+
+
+@check
+def constant_literals_pack_into_one_constant() -> None:
+    # Once optimizing, literals of constants build from one packed constant. Lists and sets
+    # still come out new every time they are evaluated, at every level.
+    values = ", ".join(map(str, range(6000)))
+    text = (
+        f"rows <- [[{values}] for _ in range(2)]\n"
+        f"unique <- {{{values}}}\n"
+        "mixed <- [rows, 1, 2]\n"
+    )
+
+    for optimize in LEVELS:
+        module = build_source(text, optimize=optimize)
+        packed = [node for node in ast.walk(module) if isinstance(node, ast.Starred)]
+
+        assert len(packed) == (2 if optimize else 0), ast.dump(module)[:1000]
+        assert all(isinstance(node.value, ast.Constant) for node in packed)
+
+        namespace: dict[str, typing.Any] = {}
+        exec(compile(module, "<packed>", "exec"), namespace)
+
+        rows = namespace["rows"]
+        assert rows[0] == list(range(6000)) and rows[0] is not rows[1]
+        assert namespace["unique"] == set(range(6000))
+        assert namespace["mixed"] == [rows, 1, 2]
+
+
+@check
+def precompiled_bytecode_is_readable() -> None:
+    # Bytecode is as readable as its source, like CPython's `.pyc` files.
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "main.srp")
+
+        with open(source, "w") as fp:
+            fp.write('print("ok")\n')
+
+        os.chmod(source, 0o644)
+        umask = os.umask(0o022)
+
+        try:
+            result = serpentes("compile", directory)
+        finally:
+            os.umask(umask)
+
+        assert result.returncode == 0, result.stderr
+
+        mode = os.stat(bytecode_path(source, cache_tag())).st_mode & 0o777
+        assert mode == 0o644, oct(mode)
+
+
+@check
+def parallel_compile_caches_every_file() -> None:
+    # Workers cache the code a serial compile builds, a broken file only fails itself.
+    with tempfile.TemporaryDirectory() as directory:
+        sources = []
+
+        for index, text in enumerate([*corpus(), "print(1 +\n"]):
+            sources.append(os.path.join(directory, f"part{index % 2}", f"m{index}.srp"))
+            os.makedirs(os.path.dirname(sources[-1]), exist_ok=True)
+
+            with open(sources[-1], "w") as fp:
+                fp.write(text)
+
+        *compiled, broken = sources
+        result = serpentes("compile", directory, "-j", "2")
+
+        assert result.returncode == 1, result.stderr
+        assert f"*** {broken}: " in result.stderr, result.stderr
+        assert len(result.stdout.splitlines()) == len(compiled), result.stdout
+
+        for source in compiled:
+            with open(source, "r") as fp, warnings.catch_warnings():
+                warnings.simplefilter("ignore", SyntaxWarning)
+                code = compiler.compile_source(fp.read(), source)
+
+            assert load_bytecode(source, cache_tag()) == code, source
+
+        result = serpentes("compile", directory, "-j", "2")
+        assert result.stdout.count(": up to date") == len(compiled), result.stdout
+
+
+@check
+def binary_operators_group_like_earley() -> None:
+    # LALR has to take every pair of operators in the first statement but those below, and
+    # whatever it takes has to give the tree Earley gives, or falling back would change the
+    # meaning. Earley here is lark's own on grammar.lark, what files have always meant.
+    operators = (
+        *("*", "@", "/", "%", "exp", "<<", ">>", "&", "|", "^", "and", "or"),
+        *("<", ">", "==", ">=", "<=", "!=", "in", "not in", "is", "is not", "+", "-"),
+    )
+    contexts = {"{}": True, "print({})": True, "y <- {}": True, "x\ny <- {}": False}
+    # Comparisons after `in` or `is`, and operators after `exp`, are left to Earley. It nests
+    # the first to the left outside of arguments, and ends the statement after `exp` past
+    # the first one. It also reads keywords as names where a call or a subscript follows,
+    # and splits `if` expressions past the first statement.
+    words = ("in", "not in", "is", "is not")
+    lines = (
+        "x <- 2 in [1, 2] < 3",
+        "a in b < c",
+        "x <- a is b < c",
+        "print(a not in b == c)",
+        "x\na is not b >= c",
+        "x\ny <- a exp b @ c",
+        "x\na / b exp c * d",
+        "x\na exp (b, c)",
+        "a and (b, c)",
+        "y <- a in (b + c)",
+        "print(a is not [b])",
+        "[not (a + b)]",
+        "a if (b + c) else d",
+        "x\na if b else c",
+        "x\na if b else c @ d",
+        "x\na if b else c @ d[e]",
+        "x\nprint(a) if b else print(c)",
+        "print(1) print(2)",
+        *(f"print(1)\n{name} <- 2" for name in KEYWORD_PREFIXED),
+    )
+    parser, earley = SrpParser(), SrpParser("earley")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+
+        for first, second in itertools.product(operators, repeat=2):
+            for context, first_statement in contexts.items():
+                text = context.format(f"a {first} b {second} c")
+                taken = first_statement and not (
+                    (first in words and second in operators[12:22])
+                    or (first == "exp" and second in operators[:5])
+                )
+                tree = parser.run("lalr", text) if taken else parser.parse(text)
+
+                assert dump(tree, True) == dump(earley.parse(text), True), text
+
+        for text in [*lines, *corpus()]:
+            assert dump(parser.parse(text), True) == dump(earley.parse(text), True), text
+
+
+@check
+def keyword_prefixed_names_stay_on_lalr() -> None:
+    # Keywords end with a word, so names starting with one don't leave a file to Earley,
+    # neither do keywords in strings and comments. Earley reads those names the same way.
+    texts = [
+        "\n".join(f"x <- {name}(1)" for name in KEYWORD_PREFIXED),
+        "print(1)\n" + "\n".join(f"{name} <- 2" for name in KEYWORD_PREFIXED),
+        'print("index, int and format") // input or order\n',
+        "x <- [notes]\nprint([a for a in index if isx])\n",
+    ]
+    parsers: list[str] = []
+
+    def listen(event: Event) -> None:
+        if event.stage == "parse":
+            parsers.append(event.details["parser"])
+
+    parser, earley = SrpParser(), SrpParser("earley")
+    add_listener(listen)
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+
+            for text in texts:
+                del parsers[:]
+                tree = parser.parse(text)
+
+                assert parsers == ["lalr"], (text, parsers)
+                assert dump(tree, True) == dump(earley.parse(text), True), text
+    finally:
+        remove_listener(listen)
+
+
+@check
+def statements_parse_apart_like_whole() -> None:
+    # Statements split off by `serpentes.scanner` parse like in the whole module, those
+    # after the first one through the `rest` rule, or Earley behind a statement of its own.
+    texts = [
+        "x <- 1\nprint(x)\ny <- 3 if x else 4\nprint(y)",
+        "x <- 1\ny <- a if b else c",
+        'x\n"s" exp 2 exp 3',
+        "x\na if b else c @ d[e]",
+        "print(1)\nx <- [notes]\nx <- nonempty\nindex <- 2",
+        *corpus(),
+    ]
+    parser = SrpParser()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+
+        for text in texts:
+            parts = [
+                build_source(statement, parser, line, first=index == 0).body
+                for index, (line, statement) in enumerate(split_statements(text))
+            ]
+            whole = build_source(text, parser)
+
+            split = ast.Module(body=list(itertools.chain(*parts)), type_ignores=[])
+
+            assert ast.dump(whole, include_attributes=True) == ast.dump(
+                split, include_attributes=True
+            ), text
+
+        # Trees straight from lark's Earley parser still go through the transformer.
+        earley = SrpParser("earley")
+
+        for text in texts[:5]:
+            tree = earley.lark("earley").parse(text)
+            built = SrpTransformer().transform(tree).build()
+            assert ast.dump(built) == ast.dump(build_source(text, "earley")), text
+
+        # Deeper than the recursion limit.
+        deep = "x <- " + "[" * 400 + "1" + "]" * 400
+        assert isinstance(SrpTransformer().transform(earley.parse(deep)), Module)
+
+
+@check
+def serpentes_lexer_parses_like_larks() -> None:
+    # The single pattern of `serpentes.lexer` has to feed LALR the tokens its contextual
+    # lexer would, down to their positions and where lexing fails.
+    from benchmarks import GENERATORS
+
+    texts = [
+        *corpus(),
+        *(generate(2000) for generate in GENERATORS.values()),
+        "x <- 1_000 + 0x_ff + 0o17 + 0b1 + 1e5 + .5j + 1_0.0_1e-1_0\n",
+        "print([-1], [+2], [~3], [not none], 1 is not 2, 3 not in [4], 5 <= 6 != 7)\n",
+        r"""print(isnot, notin, nothing, is_, r'\'', b"\"", '''a
+b''')""",
+        "print(x.y, a * 2, 1 << 2 >> 3, {1: 2}) // a comment\n",
+        "x <- 1 $ 2\n",
+        'x <- "unterminated\n',
+    ]
+
+    def parse(lark: typing.Any, text: str) -> str:
+        try:
+            module = SrpTransformer().transform(lark.parse(text, "module")).build()
+        except Exception as error:
+            return f"{type(error).__name__} {getattr(error, 'line', None)}"
+
+        return ast.dump(module, include_attributes=True)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        lark = build_parser("lalr")
+        srp = build_parser("lalr", **lexer_options("lalr"))
+
+        for text in texts:
+            assert parse(srp, text) == parse(lark, text), text[:200]
+
+
+@check
+def parser_cache_hits() -> None:
+    # The second process loads the tables the first one saved, with and without positions.
+    code = (
+        "from serpentes.parser import load_parser\n"
+        "for positions in (True, False):\n"
+        "    details = {}\n"
+        "    load_parser('lalr', details, positions)\n"
+        "    print(details['cached'])\n"
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(
+            os.environ,
+            PYTHONPATH=ROOT,
+            SERPENTES_CACHE=directory,
+            SERPENTES_STANDALONE="0",
+        )
+        runs = [
+            subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, env=env, text=True
+            )
+            for _ in range(2)
+        ]
+
+    assert [run.stdout.split() for run in runs] == [["False"] * 2, ["True"] * 2], runs
+
+
+@check
+def cached_parsers_parse_like_built_ones() -> None:
+    # Tables loaded from the cache parse the corpus like those just built, and a broken
+    # cache file is built again.
+    code = (
+        "import ast, glob, hashlib, sys\n"
+        "from serpentes import parser\n"
+        "details = {}\n"
+        "parser.PARSERS['lalr'] = parser.load_parser('lalr', details)\n"
+        "digest = hashlib.sha256()\n"
+        "for path in sorted(glob.glob(sys.argv[1])):\n"
+        "    tree = parser.SrpParser().parse(open(path).read())\n"
+        "    module = parser.SrpTransformer().transform(tree).build()\n"
+        "    digest.update(ast.dump(module, include_attributes=True).encode())\n"
+        "print(details['cached'], digest.hexdigest())\n"
+    )
+    pattern = os.path.join(ROOT, "tests", "*.srp")
+
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(
+            os.environ,
+            PYTHONPATH=ROOT,
+            SERPENTES_CACHE=directory,
+            SERPENTES_STANDALONE="0",
+        )
+
+        def run() -> list[str]:
+            result = subprocess.run(
+                [sys.executable, "-c", code, pattern],
+                capture_output=True,
+                env=env,
+                text=True,
+            )
+            assert result.returncode == 0, result.stderr
+            return result.stdout.split()
+
+        built, loaded = run(), run()
+
+        for name in os.listdir(os.path.join(directory, "parsers")):
+            with open(os.path.join(directory, "parsers", name), "wb") as fp:
+                fp.write(b"broken")
+
+        rebuilt = run()
+
+    assert [built[0], loaded[0], rebuilt[0]] == ["False", "True", "False"]
+    assert built[1] == loaded[1] == rebuilt[1]
+
+
+@check
+def bundles_run_without_serpentes() -> None:
+    # An archive imports its packages on a bare interpreter, runs as a script through its
+    # shebang and comes out the same every time it's built.
+    with tempfile.TemporaryDirectory() as directory:
+        for name, text in {
+            "pkg/__init__.srp": 'name <- "pkg"',
+            "pkg/util.srp": "value <- 40 + 2",
+            "main.srp": 'print(__import__("pkg.util", none, none, ["value"]).value)',
+        }.items():
+            os.makedirs(
+                os.path.join(directory, "app", os.path.dirname(name)), exist_ok=True
+            )
+
+            with open(os.path.join(directory, "app", name), "w") as fp:
+                fp.write(text + "\n")
+
+        archives = [os.path.join(directory, name) for name in ("app.pyz", "again.pyz")]
+
+        for archive in archives:
+            arguments = ("-o", archive, "-m", "main", "-p", sys.executable)
+            result = serpentes("bundle", os.path.join(directory, "app"), *arguments)
+            assert result.returncode == 0, result.stderr
+
+        for command in ([sys.executable, "-I", archives[0]], [archives[0]]):
+            result = subprocess.run(command, capture_output=True, text=True)
+            assert result.stdout == "42\n", result.stderr
+
+        with open(archives[0], "rb") as first, open(archives[1], "rb") as second:
+            assert first.read() == second.read()
+
+
+@check
+def srp_modules_do_not_shadow_python_ones() -> None:
+    # `.srp` files only win where a `.py` file in their place would.
+    code = (
+        "import sys\n"
+        "sys.path.append(sys.argv[1])\n"
+        "import serpentes, colorsys, shadowed, srponly\n"
+        "print(colorsys.__file__.endswith('.py'), shadowed.value, srponly.value)\n"
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, text in {
+            "colorsys.srp": "value <- 1",
+            "shadowed.py": "value = 'py'",
+            "shadowed.srp": 'value <- "srp"',
+            "srponly.srp": 'value <- "srp"',
+        }.items():
+            with open(os.path.join(directory, name), "w") as fp:
+                fp.write(text + "\n")
+
+        result = subprocess.run(
+            [sys.executable, "-c", code, directory],
+            capture_output=True,
+            env=dict(os.environ, PYTHONPATH=ROOT),
+            text=True,
+        )
+
+    assert result.stdout.split() == ["True", "py", "srp"], result.stderr
+
+
+@check
+def imported_modules_cache_their_bytecode() -> None:
+    # Imports read and write the `.srpc` files of `serpentes compile`, apart from the `.py`
+    # module of the same name and for each `-O` level. A precompiled one loads no parser.
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "mod.srp")
+
+        with open(source, "w") as fp:
+            fp.write("value <- 1\n")
+
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, directory]))
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+        code = (
+            "import sys, serpentes, mod\n"
+            "print('serpentes.parser' in sys.modules, mod.__cached__)"
+        )
+        result = serpentes("compile", directory)
+        assert result.returncode == 0, result.stderr
+
+        for flags, optimize, parsed in (([], 0, "False"), (["-O"], 1, "True")):
+            result = subprocess.run(
+                [sys.executable, *flags, "-c", code],
+                capture_output=True,
+                env=env,
+                text=True,
+            )
+            path = bytecode_path(source, cache_tag(optimize=optimize))
+
+            assert result.stdout.split() == [parsed, path], (result.stdout, result.stderr)
+            assert os.path.exists(path)
+
+        cached = os.listdir(os.path.dirname(bytecode_path(source)))
+        assert all(name.endswith(".srpc") for name in cached), cached
+        assert not os.path.exists(cache_from_source(os.path.join(directory, "mod.py")))
+
+
+@check
+def position_free_tracebacks_recover_columns() -> None:
+    # Without positions, code only knows the lines of each statement. A traceback through
+    # it still points at the failing expression, like one from a full build.
+    text = "x <- 1\nitems <- [1, 2, 3]\nprint(x,\n  items)\nprint(items[x] + (items[7] * 2))\n"
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "main.srp")
+
+        with open(source, "w") as fp:
+            fp.write(text)
+
+        code = compiler.compile_source(text, source, positions=False)
+        spans = {(start, end) for start, end, _, _ in code.co_positions() if start}
+
+        assert spans == {(1, 1), (2, 2), (3, 4), (5, 5)}, spans
+        assert {column for *_, column in code.co_positions()} == {0}
+
+        results = [
+            serpentes("--no-cache", *flags, "--run", source)
+            for flags in ((), ("--no-positions",))
+        ]
+
+    assert results[0].stdout == results[1].stdout == "1 [1, 2, 3]\n", results
+    assert results[0].stderr == results[1].stderr, results[1].stderr
+    assert "    print(items[x] + (items[7] * 2))\n" in results[1].stderr
+    assert "                       ~~~~^^^^\n" in results[1].stderr, results[1].stderr
+
+
+@check
+def incremental_statements_keep_columns() -> None:
+    # Indented statements are positioned like in a full build, and cached apart from the
+    # same text at another indentation.
+    text = "items <- [1, 2]\nprint(\n    items)\n    print(items)\n"
+    compiler = IncrementalCompiler()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+
+        built = compiler.build(text)
+        assert ast.dump(built, include_attributes=True) == ast.dump(
+            build_source(text), include_attributes=True
+        )
+
+        compiler.build("print(items)\n  print(items)\n")
+        assert compiler.reparsed == 2, compiler.reparsed
+
+        # Split statements build like the whole module, conditional expressions and right
+        # associative powers included.
+        for text in (
+            "x <- 1\ny <- a if b else c",
+            'x\n"s" exp 2 exp 3',
+            "x\ny <- 2 exp 3 exp 4",
+            "x <- 1\ny <- x +\n    1\nprint(y)",
+        ):
+            assert ast.dump(compiler.build(text), include_attributes=True) == ast.dump(
+                build_source(text), include_attributes=True
+            ), text
+
+        broken = "items <- [1, 2]\n    print(items +)\n"
+        columns = []
+
+        for build in (compiler.build, build_source):
+            try:
+                build(broken)
+            except ParseError as error:
+                columns.append(error.offset)
+
+        assert columns == [18, 18], columns
+
+
+@check
+def codec_decodes_like_a_whole_file() -> None:
+    # The incremental decoder gives what a whole decode gives, fed one byte at a time and
+    # carried over to another decoder through its state.
+    texts = [
+        "x <- 1\ny <- a if b else c\n",
+        'x\n"s" exp 2 exp 3',
+        "x\ny <- 2 exp 3 exp 4\nprint(\n    y)\n",
+        "# -*- coding: serpentes -*-\nx <- 'é'\n\n\nprint(x)\n",
+        "x <- 1\nprint(x +)\ny <- 2\n",
+        *corpus(),
+    ]
+
+    def decode(data: bytes, step: typing.Callable[[bytes, bool], str]) -> str:
+        try:
+            return str().join(
+                step(data[index : index + 1], index + 1 >= len(data))
+                for index in range(len(data))
+            )
+        except Exception as error:
+            return repr(error)
+
+    for text in texts:
+        data = text.encode()
+        decoders = [codecs.getincrementaldecoder("serpentes")()]
+        whole = decode(data, lambda byte, final: codecs.decode(data, "serpentes") * final)
+
+        def carry(byte: bytes, final: bool) -> str:
+            decoder = codecs.getincrementaldecoder("serpentes")()
+            decoder.setstate(decoders[-1].getstate())
+            decoders.append(decoder)
+
+            return decoder.decode(byte, final)
+
+        assert decode(data, carry) == whole, text
+        decoder = codecs.getincrementaldecoder("serpentes")()
+        assert decode(data, decoder.decode) == whole, text
+
+
+@check
+def streamed_statements_run_before_close() -> None:
+    # A statement runs as soon as the next one starts, and a stream prints what a whole
+    # file run prints.
+    session = Session()
+
+    for line in ("x <- 1\n", "// comment\n", "y <- x +\n", "    1\n"):
+        session.feed(line)
+
+    assert "x" in session.namespace and "y" not in session.namespace, session.namespace
+
+    session.feed("print(y)\n")
+    assert session.namespace.get("y") == 2, session.namespace
+
+    # Names starting with a keyword are names to LALR, they don't stop the stream.
+    for line in ("index <- 1\n", "input <- [index]\n"):
+        session.feed(line)
+
+    assert session.namespace.get("index") == 1, session.namespace
+    assert not session.rejected
+
+    def stream(text: str) -> None:
+        session = Session()
+
+        for line, part in enumerate(text.splitlines(True), 1):
+            session.feed(part, line)
+
+        session.close()
+
+    def run(execute: typing.Callable[[str], None], text: str) -> str:
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            try:
+                execute(text)
+            except Exception as error:
+                print(type(error).__name__)
+
+        return output.getvalue()
+
+    # Statements LALR rejects are left to Earley from the first one that didn't run.
+    texts = [
+        "print(1) print(2)\nindex <- 5\nprint(index)\n",
+        "x <- [1]\nprint(x)\nisnot(2)\nprint(3)\n",
+        "print(1)\ny <- a if b else index\n",
+        *corpus(),
+    ]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+
+        for text in texts:
+            whole = run(lambda text: exec(compiler.compile_source(text), {}), text)
+            assert run(stream, text) == whole, text
+
+
+@check
+def parallel_chunks_build_like_serial() -> None:
+    # Chunks start with the line of their first statement, split where the parser ends
+    # statements, and parse errors are reported against the whole source.
+    text = "".join(
+        f"value{index} <- {index}\n    print(value{index})\n" for index in range(8)
+    )
+    mixed = (
+        "x <- 1\nprint(x)\ny <- 3 if x else 4\nprint(y)\n"
+        "z <- x\n    + y // comment\n    if y\n    else 0\n"
+        '(x, "// not a comment")\n[y]\ns <- """one\ntwo"""\nprint(s, z)\n'
+    ) * 4
+    size, compiler.CHUNK_SIZE = compiler.CHUNK_SIZE, 16
+
+    try:
+        for source, workers in ((text, 2), (mixed, 2), (mixed, 4)):
+            built = compiler.build_parallel(source, workers=workers)
+            assert built is not None
+            assert ast.dump(built[0], include_attributes=True) == ast.dump(
+                build_source(source), include_attributes=True
+            ), source
+
+        try:
+            compiler.compile_source(text + "print(value0 +)\n", workers=2)
+        except ParseError as error:
+            assert error.lineno == 17, error
+        else:
+            raise AssertionError("no error")
+
+    finally:
+        compiler.CHUNK_SIZE = size
+
+
+@check
+def async_compile_survives_parse_errors() -> None:
+    # A parse error in a worker reaches the caller as is, and the pool keeps working after
+    # it.
+    from serpentes import engine
+
+    async def run() -> None:
+        try:
+            await engine.acompile("print(", "broken.srp")
+        except ParseError as error:
+            assert error.filename == "broken.srp", error.filename
+        else:
+            raise AssertionError("no error")
+
+        await engine.acompile("print(1)")
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            asyncio.run(run())
+    finally:
+        engine.shutdown()
+
+
+@check
+def rendered_metrics_keep_every_digit() -> None:
+    # Counters past a million used to lose digits to `:g`, sums keep them too.
+    from serpentes.metrics import Registry
+
+    registry = Registry()
+    registry.count("serpentes_source_bytes_total", 12_345_678)
+    registry.observe("serpentes_stage_seconds", 0.1 + 0.2, stage="parse")
+    text = registry.render()
+
+    assert "serpentes_source_bytes_total 12345678\n" in text, text
+    assert (
+        'serpentes_stage_seconds_sum{stage="parse"} 0.30000000000000004\n' in text
+    ), text
+
+
+def main() -> None:
+    failures = 0
+
+    for name, function in CHECKS.items():
+        try:
+            function()
+        except Exception as error:
+            status = f"FAILED {type(error).__name__}: {error}"
+        else:
+            status = "ok"
+
+        failures += status != "ok"
+        print(f"{name:<40} {status}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
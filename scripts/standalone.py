@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import io
+import os
+import sys
+from argparse import ArgumentParser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOCK = os.path.join(ROOT, "poetry.lock")
+sys.path.insert(0, ROOT)
+
+# Generating a new module must not depend on the one being replaced.
+os.environ["SERPENTES_STANDALONE"] = "0"
+
+import lark  # noqa: E402
+from lark.tools.standalone import gen_standalone  # noqa: E402
+
+from serpentes.parser import (  # noqa: E402
+    GENERATED,
+    GRAMMARS,
+    build_parser,
+    standalone_key,
+)
+
+
+def generated_value(path: str, name: str) -> str | None:
+    try:
+        with open(path, "r") as fp:
+            for line in fp:
+                if line.startswith(f"{name} = "):
+                    return line.split("=", 1)[1].strip().strip('"')
+    except OSError:
+        pass
+
+    return None
+
+
+def locked_version(package: str) -> str | None:
+    # The lock lists every package as a `name` line followed by its `version` line.
+    try:
+        with open(LOCK, "r") as fp:
+            lines = fp.read().splitlines()
+    except OSError:
+        return None
+
+    for line, following in zip(lines, lines[1:]):
+        if line == f'name = "{package}"' and following.startswith("version = "):
+            return following.split("=", 1)[1].strip().strip('"')
+
+    return None
+
+
+def check_lark(version: str | None) -> None:
+    # The generated module is a copy of lark, so it has to come from the locked one.
+    if (locked := locked_version("lark")) is not None and version != locked:
+        sys.exit(
+            f"error: lark {version} doesn't match the {locked} in"
+            f" {os.path.relpath(LOCK)}, install the locked version"
+        )
+
+
+def generate(path: str) -> None:
+    output = io.StringIO()
+    gen_standalone(build_parser("lalr"), out=output)
+
+    # lark's template leaves out the `cast` Transformer_NonRecursive returns through.
+    output.write("\n\nfrom typing import cast  # noqa: E402")
+    output.write(
+        f"\n\n# Generated by scripts/standalone.py from {GRAMMARS['lalr']}, do not edit."
+        f'\nGRAMMAR_KEY = "{standalone_key()}"\n'
+    )
+
+    with open(path, "w") as fp:
+        fp.write(output.getvalue())
+
+
+def main() -> None:
+    parser = ArgumentParser(prog="Standalone parser generator")
+    parser.add_argument("--output", default=GENERATED)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Fail if the generated parser doesn't match the grammar, instead of writing it.",
+    )
+
+    args = parser.parse_args()
+
+    if not args.check:
+        check_lark(lark.__version__)
+        generate(args.output)
+        print(f"Generated {os.path.relpath(args.output)}")
+        return
+
+    if (key := generated_value(args.output, "GRAMMAR_KEY")) is None:
+        sys.exit(f"error: {os.path.relpath(args.output)} is missing")
+
+    check_lark(generated_value(args.output, "__version__"))
+
+    if key != standalone_key():
+        sys.exit(
+            f"error: {os.path.relpath(args.output)} is out of date with"
+            f" {GRAMMARS['lalr']}, run `python scripts/standalone.py`"
+        )
+
+    print(f"{os.path.relpath(args.output)} is up to date")
+
+
+if __name__ == "__main__":
+    main()
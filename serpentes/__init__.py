@@ -1,8 +1,59 @@
 from __future__ import annotations
 
+__version__ = "v0.1.0"
+__author__ = "EOF-D <END-OFD@pm.me>"
+
+import importlib
+import os
+import typing
+
 from .encoding import *
+from .importer import *
 from .nodes import *
-from .parser import *
 
-__version__ = "v0.1.0"
-__author__ = "EOF-D <END-OFD@pm.me>"
+# Importing lark costs more than the rest of the package, so the parser and the engine
+# are only loaded once one of their names is used. `import serpentes` stays cheap enough
+# for `.pth` files.
+LAZY: dict[str, str] = {
+    **dict.fromkeys(
+        (
+            "AstTransformer",
+            "LineTransformer",
+            "GRAMMARS",
+            "PARSERS",
+            "ParseError",
+            "SrpParser",
+            "SrpTransformer",
+            "build_parser",
+            "get_parser",
+            "isnode",
+            "load_grammar",
+            "parser_key",
+            "parser_options",
+        ),
+        ".parser",
+    ),
+    **dict.fromkeys(("Engine", "compile_source", "exec_source", "acompile"), ".engine"),
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name not in LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(LAZY[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def _install_metrics() -> None:
+    # Processes that only use the codec or the importer get their metrics through the
+    # environment, see `serpentes.metrics`.
+    if path := os.environ.get("SERPENTES_METRICS"):
+        from .metrics import install
+
+        install(path)
+
+
+_install_metrics()
@@ -1,12 +1,41 @@
 import ast
 import os
-from argparse import ArgumentParser
+import sys
+import time
+import traceback
+import typing
+from argparse import SUPPRESS, ArgumentParser, Namespace
 from sysconfig import get_paths
 
-import rich
-from lark import Lark
+from serpentes import __author__, __version__
 
-from serpentes import SrpTransformer, __author__, __version__
+
+def add_build_arguments(parser: ArgumentParser, default: typing.Any = None) -> None:
+    parser.add_argument(
+        "--parser",
+        choices=("lalr", "earley"),
+        default=default or "lalr",
+        help="The parser to use, LALR falls back to Earley on failure.",
+    )
+
+    parser.add_argument(
+        "-O",
+        action="count",
+        default=default or 0,
+        dest="optimize",
+        help="Fold constants (-O), and pack membership tests into constants (-OO).",
+    )
+
+
+def add_positions_argument(parser: ArgumentParser, default: typing.Any = None) -> None:
+    parser.add_argument(
+        "--no-positions",
+        action="store_false",
+        default=default if default is not None else True,
+        dest="positions",
+        help="Only track the lines of each statement, which builds faster. Tracebacks"
+        " recover the columns by reparsing the failing statement.",
+    )
 
 
 def gen_parser() -> ArgumentParser:
@@ -14,7 +43,9 @@ def gen_parser() -> ArgumentParser:
 
     parser.add_argument("--author", action="store_true", help="The author of Serpentes.")
     parser.add_argument(
-        "--hook", action="store_true", help="Hooks the Serpentes codec to Python."
+        "--hook",
+        action="store_true",
+        help="Hooks the Serpentes codec and importer to Python.",
     )
 
     parser.add_argument(
@@ -26,14 +57,189 @@ def gen_parser() -> ArgumentParser:
     parser.add_argument("--lark", help="Run a file with debug.")
     parser.add_argument("--run", help="Run a file without debug.")
 
+    add_build_arguments(parser)
+
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Don't read or write cached bytecode."
+    )
+
+    add_positions_argument(parser)
+
+    parser.add_argument(
+        "--server",
+        nargs="?",
+        const="fork",
+        choices=("fork", "code"),
+        help="Hand --run to `serpentes serve`, which either forks a warm child to run"
+        " the file (fork) or sends back its compiled code (code).",
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Run each statement of --run as soon as it is parsed, without reading the"
+        " whole file first.",
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Rerun the file given to --run whenever it changes, reparsing only the"
+        " statements that changed.",
+    )
+
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="-",
+        metavar="JSON",
+        help="Report where the time goes per stage and grammar rule, or write it as JSON.",
+    )
+
+    parser.add_argument(
+        "--metrics",
+        nargs="?",
+        const="-",
+        metavar="FILE",
+        help="Write counters and latency histograms in the Prometheus text format to"
+        " stdout or a file once serpentes exits.",
+    )
+
+    commands = parser.add_subparsers(dest="command")
+
+    compile_parser = commands.add_parser(
+        "compile", help="Compile every `.srp` file under a directory into the cache."
+    )
+    compile_parser.add_argument("path", help="The directory or file to compile.")
+    compile_parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="The number of worker processes, 0 uses every CPU.",
+    )
+    compile_parser.add_argument(
+        "-f", "--force", action="store_true", help="Recompile up-to-date files too."
+    )
+
+    # Suppressed, so the same flags given before the command aren't overwritten.
+    add_build_arguments(compile_parser, SUPPRESS)
+    add_positions_argument(compile_parser, SUPPRESS)
+
+    transpile_parser = commands.add_parser(
+        "transpile", help="Write a `.py` file and a line map for every `.srp` file."
+    )
+    transpile_parser.add_argument("path", help="The directory or file to transpile.")
+    transpile_parser.add_argument(
+        "-o",
+        "--output",
+        help="The file or directory to write to, defaults to next to the sources.",
+    )
+    transpile_parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="Overwrite `.py` files that weren't written by a previous transpile.",
+    )
+
+    add_build_arguments(transpile_parser, SUPPRESS)
+
+    bundle_parser = commands.add_parser(
+        "bundle",
+        help="Pack the compiled `.srp` modules under a directory into one zip archive.",
+    )
+    bundle_parser.add_argument("path", help="The directory or file to bundle.")
+    bundle_parser.add_argument(
+        "-o", "--output", required=True, help="The archive to write, e.g. `app.pyz`."
+    )
+    bundle_parser.add_argument(
+        "-m",
+        "--main",
+        help="The module `python <archive>` runs, unless the tree has a `__main__.srp`.",
+    )
+    bundle_parser.add_argument(
+        "-p",
+        "--python",
+        metavar="INTERPRETER",
+        help="Prepend a shebang for this interpreter and make the archive executable."
+        " It must be the Python version that built the archive.",
+    )
+
+    add_build_arguments(bundle_parser, SUPPRESS)
+
+    resolve_parser = commands.add_parser(
+        "resolve", help="Point a traceback from transpiled files back at the sources."
+    )
+    resolve_parser.add_argument(
+        "file", nargs="?", help="A file holding the traceback, defaults to stdin."
+    )
+
+    serve_parser = commands.add_parser(
+        "serve", help="Keep a warm compiler running behind a Unix socket."
+    )
+    serve_parser.add_argument("--socket", help="Defaults to $SERPENTES_SOCKET.")
+    serve_parser.add_argument(
+        "--max-children",
+        type=int,
+        help="How many files may run at once, defaults to the number of CPUs.",
+    )
+    serve_parser.add_argument(
+        "--cache-size", type=int, default=1024, help="How many code objects to keep."
+    )
+
     return parser
 
 
+def compile_command(args: Namespace) -> None:
+    from serpentes.compiler import compile_tree
+    from serpentes.metrics import count, observe
+
+    failed = 0
+
+    results = compile_tree(
+        args.path,
+        args.workers,
+        args.parser,
+        min(args.optimize, 2),
+        args.force,
+        args.positions,
+    )
+
+    # Workers keep the metrics of their stages, so every file is counted here.
+    for result in results:
+        if result.error is not None:
+            failed += 1
+            count("serpentes_files_total", result="failed")
+            # Parse errors go on with what was expected, indented under the file.
+            message = result.error.replace("\n", "\n    ")
+            print(f"*** {result.path}: {message}", file=sys.stderr)
+
+        elif result.skipped:
+            count("serpentes_files_total", result="skipped")
+            print(f"{result.path}: up to date")
+
+        else:
+            count("serpentes_files_total", result="compiled")
+            observe("serpentes_file_seconds", result.elapsed)
+            print(f"{result.path}: {result.elapsed * 1000:.2f}ms")
+
+    if failed:
+        sys.exit(1)
+
+
 def main() -> None:
     parser = gen_parser()
     args = parser.parse_args()
 
-    if args.version is True:
+    if args.metrics is not None:
+        from serpentes.metrics import install
+
+        install(args.metrics)
+
+    if args.command == "compile":
+        compile_command(args)
+
+    elif args.version is True:
         print(f"Serpentes {__version__}")
 
     elif args.author is True:
@@ -43,34 +249,234 @@ def main() -> None:
         path = get_paths()["purelib"]
 
         with open(path + "/serpentes_autoload.pth", "a") as fp:
-            fp.write("import serpentes")
+            fp.write("import serpentes\n")
 
         print(f"Wrote `serpentes_autoload.pth` to {path}")
 
+    elif args.command == "transpile":
+        transpile_command(args)
+
+    elif args.command == "bundle":
+        bundle_command(args)
+
+    elif args.command == "resolve":
+        from serpentes.transpiler import resolve_traceback
+
+        if args.file:
+            with open(args.file, "r") as fp:
+                text = fp.read()
+        else:
+            text = sys.stdin.read()
+
+        sys.stdout.write(resolve_traceback(text))
+
+    elif args.command == "serve":
+        from serpentes.server import Server
+
+        Server(args.socket, args.max_children, args.cache_size).serve()
+
+    elif args.run and args.server:
+        remote(args)
+
+    elif args.run and args.watch:
+        try:
+            watch(args)
+        except KeyboardInterrupt:
+            pass
+
+    elif args.run and args.stream:
+        from serpentes.session import run_stream
+
+        run_stream(args.run, min(args.optimize, 2))
+
     elif args.lark or args.run:
-        path = os.path.dirname(__file__)
+        if args.profile is None:
+            execute(args)
+            return
+
+        from serpentes.profiling import Profiler
+
+        with Profiler() as profiler:
+            execute(args)
+
+        profiler.dump(args.profile)
+
+    else:
+        from serpentes.session import repl
+
+        repl(min(args.optimize, 2))
+
+
+def transpile_command(args: Namespace) -> None:
+    from serpentes.transpiler import transpile_tree
+
+    failed = 0
+    results = transpile_tree(
+        args.path, args.output, args.parser, min(args.optimize, 2), args.force
+    )
+
+    for source, output, error in results:
+        if error is not None:
+            failed += 1
+            print(f"*** {source}: {type(error).__name__}: {error}", file=sys.stderr)
+        else:
+            print(f"{source} -> {output}")
+
+    if failed:
+        sys.exit(1)
+
+
+def bundle_command(args: Namespace) -> None:
+    from serpentes.bundle import compile_bundle, write_bundle
+
+    failed = 0
+    modules: dict[str, bytes] = {}
+
+    for source, name, data, error in compile_bundle(
+        args.path, args.parser, min(args.optimize, 2)
+    ):
+        if data is None:
+            failed += 1
+            print(f"*** {source}: {type(error).__name__}: {error}", file=sys.stderr)
+        else:
+            modules[name] = data
+
+    # A bundle missing modules would only fail once they are imported.
+    if failed:
+        sys.exit(1)
+
+    if not modules:
+        sys.exit(f"serpentes: {args.path}: no `.srp` files to bundle")
+
+    try:
+        write_bundle(args.output, modules, args.main, args.python)
+    except ValueError as error:
+        sys.exit(f"serpentes: {args.output}: {error}")
+
+    print(f"Bundled {len(modules)} modules into {args.output}")
+
+
+def remote(args: Namespace) -> None:
+    from serpentes.server import Client, ServerError
+
+    client = Client()
+    optimize = min(args.optimize, 2)
+
+    try:
+        if args.server == "code":
+            code = client.compile(args.run, args.parser, optimize)
+        else:
+            sys.exit(client.run(args.run, parser=args.parser, optimize=optimize))
+
+    except (ServerError, ConnectionRefusedError, FileNotFoundError) as error:
+        sys.exit(f"serpentes: server: {error}")
+
+    exec(code)
+
+
+def watch(args: Namespace, interval: float = 0.25) -> None:
+    from serpentes.compiler import IncrementalCompiler
+    from serpentes.profiling import stage
+
+    compiler = IncrementalCompiler(args.parser, min(args.optimize, 2))
+    modified = None
+
+    while True:
+        try:
+            current = os.stat(args.run).st_mtime_ns
+        except FileNotFoundError:
+            current = None
+
+        if current is None or current == modified:
+            time.sleep(interval)
+            continue
+
+        modified = current
+
+        with open(args.run, "r") as fp:
+            text = fp.read()
+
+        start = time.perf_counter()
+
+        try:
+            code = compiler.compile(text, args.run)
+        except Exception:
+            traceback.print_exc()
+            continue
+
+        total = compiler.reparsed + compiler.reused
+        print(
+            f"Compiled {args.run} in {(time.perf_counter() - start) * 1000:.2f}ms,"
+            f" reparsed {compiler.reparsed} of {total} statements",
+            file=sys.stderr,
+        )
+
+        try:
+            with stage("exec"):
+                exec(code, {"__name__": "__main__", "__file__": args.run})
+        except Exception:
+            traceback.print_exc()
+
+
+def execute(args: Namespace) -> None:
+    # Only the commands that compile something pay for importing lark and rich.
+    from serpentes.compiler import compile_file
+    from serpentes.profiling import count_rules, profiled, stage
+
+    if args.lark and not args.run:
+        import rich
+
+        from serpentes.nodes import Module
+        from serpentes.optimizer import optimize as fold_constants
+        from serpentes.parser import SrpParser, SrpTransformer
+
+        srp = SrpParser(args.parser)
+        optimize = min(args.optimize, 2)
+
+        with open(args.lark, "r") as fp:
+            parsed = srp.parse(fp.read())
+
+        with stage("transform") as details:
+            transformer = SrpTransformer(optimize=optimize)
+
+            if profiled():
+                details["rules"] = count_rules(transformer)
+
+            tree = transformer.transform(parsed)
+
+        with stage("optimize", level=optimize):
+            tree = typing.cast(Module, fold_constants(tree, optimize))
+
+        rich.inspect(tree, methods=True)
+
+        with stage("build"):
+            module = tree.build()
+
+        for index, children in enumerate(module.body):
+            rich.print(index, ast.dump(children, indent=2))
 
-        with open(f"{path}/parser/grammar.lark", "r") as fp:
-            parser = Lark(
-                fp.read(), start="module", parser="earley", propagate_positions=True
-            )
+        with stage("compile"):
+            code = compile(module, args.lark, "exec")
 
-        with open(args.lark or args.run, "r") as fp:
-            tree = SrpTransformer().transform(parser.parse(fp.read()))
+        with stage("exec"):
+            exec(code)
 
-            if args.lark and not args.run:
-                rich.inspect(tree, methods=True)
+    else:
+        if not args.positions:
+            from serpentes.linetable import install
 
-                module = tree.build()
-                for index, children in enumerate(module.body):
-                    rich.print(index, ast.dump(children, indent=2))
+            install()
 
-                code = compile(module, "<string>", "exec")
-                exec(code)
+        code = compile_file(
+            args.run,
+            args.parser,
+            cache=not args.no_cache,
+            optimize=min(args.optimize, 2),
+            positions=args.positions,
+        )
 
-            elif args.run:
-                code = compile(tree.build(), "<string>", "exec")
-                exec(code)
+        with stage("exec"):
+            exec(code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import io
+import marshal
+import os
+import struct
+import typing
+import zipfile
+from importlib.util import MAGIC_NUMBER
+from types import CodeType
+
+from ..cache import write_atomic
+from ..compiler import compile_source, find_sources
+
+__all__ = ("archive_name", "compile_bundle", "write_bundle")
+
+# Zeroed timestamps keep bundles of the same sources identical, and zipimport only
+# compares them against a `.py` file, which a bundle never has.
+PYC_HEADER = MAGIC_NUMBER + struct.pack("<III", 0, 0, 0)
+DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+MAIN = "import runpy\nrunpy.run_module({module!r}, run_name='__main__', alter_sys=True)\n"
+
+Entry: typing.TypeAlias = "tuple[str, str, bytes | None, Exception | None]"
+
+
+def archive_name(source: str, root: str) -> str:
+    relative = os.path.splitext(os.path.relpath(source, root))[0]
+    return relative.replace(os.sep, "/") + ".pyc"
+
+
+def pyc(code: CodeType) -> bytes:
+    return PYC_HEADER + marshal.dumps(code)
+
+
+def compile_bundle(
+    root: str, parser: str = "lalr", optimize: int = 0
+) -> typing.Iterator[Entry]:
+    directory = os.path.dirname(root) if os.path.isfile(root) else root
+
+    for source in find_sources(root):
+        # Tracebacks point at the sources relative to the root of the bundle.
+        filename = os.path.relpath(source, directory)
+
+        try:
+            with open(source, "r") as fp:
+                code = compile_source(fp.read(), filename, parser, optimize=optimize)
+        except Exception as error:
+            yield source, archive_name(source, directory), None, error
+            continue
+
+        yield source, archive_name(source, directory), pyc(code), None
+
+
+def info(name: str, mode: int) -> zipfile.ZipInfo:
+    entry = zipfile.ZipInfo(name, DATE_TIME)
+    entry.external_attr = mode << 16
+
+    if not name.endswith("/"):
+        entry.compress_type = zipfile.ZIP_DEFLATED
+
+    return entry
+
+
+def write_bundle(
+    output: str,
+    modules: dict[str, bytes],
+    main: str | None = None,
+    interpreter: str | None = None,
+) -> None:
+    if main is not None:
+        if "__main__.pyc" in modules:
+            raise ValueError("The bundle already has a `__main__` module")
+
+        code = compile(MAIN.format(module=main), "__main__", "exec")
+        modules = {**modules, "__main__.pyc": pyc(code)}
+
+    data = io.BytesIO()
+
+    # zipimport skips anything in front of the archive, like `zipapp` shebangs.
+    if interpreter is not None:
+        data.write(f"#!{interpreter}\n".encode())
+
+    # Python 3.10 and 3.11 only find packages in a zip through directory entries.
+    directories = sorted(
+        {
+            "/".join(parts[:index]) + "/"
+            for parts in (name.split("/") for name in modules)
+            for index in range(1, len(parts))
+        }
+    )
+
+    with zipfile.ZipFile(data, "w") as archive:
+        for directory in directories:
+            archive.writestr(info(directory, 0o40755), b"")
+
+        for name in sorted(modules):
+            archive.writestr(info(name, 0o100644), modules[name])
+
+    write_atomic(output, data.getvalue())
+    os.chmod(output, 0o755 if interpreter is not None else 0o644)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import marshal
+import os
+import struct
+from importlib.util import MAGIC_NUMBER, cache_from_source, source_hash
+from types import CodeType
+
+from .. import __version__
+
+__all__ = (
+    "cache_dir",
+    "write_atomic",
+    "source_mode",
+    "bytecode_path",
+    "validation",
+    "check_bytecode",
+    "load_bytecode",
+    "dump_bytecode",
+    "TIMESTAMP",
+    "HASHED",
+)
+
+SIGNATURE = b"SRPC"
+VERSION = __version__.encode().ljust(16, b"\0")[:16]
+
+# signature, python magic, serpentes version, flags, mtime/size or source hash
+HEADER = struct.Struct("<4s4s16sI8s")
+
+TIMESTAMP = 0
+HASHED = 1
+
+
+def cache_dir(*parts: str) -> str:
+    root = os.environ.get("SERPENTES_CACHE")
+
+    if not root:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+        root = os.path.join(os.path.expanduser(base), "serpentes")
+
+    return os.path.join(root, *parts)
+
+
+def write_atomic(path: str, data: bytes, mode: int = 0o666) -> None:
+    directory = os.path.dirname(path) or os.curdir
+    os.makedirs(directory, exist_ok=True)
+
+    # Like importlib, the file gets `mode` less the umask, `mkstemp` would keep it private.
+    temp = os.path.join(directory, f".tmp-{os.urandom(6).hex()}")
+    fd = os.open(temp, os.O_EXCL | os.O_CREAT | os.O_WRONLY, mode & 0o666)
+
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(data)
+
+        os.replace(temp, path)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+
+def source_mode(source: str) -> int:
+    # Files made from a source can be read by whoever can read it, and replaced by its owner.
+    try:
+        return os.stat(source).st_mode & 0o777 | 0o200
+    except OSError:
+        return 0o666
+
+
+def bytecode_path(source: str, optimization: str = "") -> str:
+    path = cache_from_source(os.path.abspath(source), optimization=optimization)
+    return os.path.splitext(path)[0] + ".srpc"
+
+
+def validation(source: str, flags: int = TIMESTAMP, data: bytes | None = None) -> bytes:
+    if flags == HASHED:
+        if data is None:
+            with open(source, "rb") as fp:
+                data = fp.read()
+
+        return source_hash(data)
+
+    stat = os.stat(source)
+    return struct.pack("<II", int(stat.st_mtime) & 0xFFFFFFFF, stat.st_size & 0xFFFFFFFF)
+
+
+def fresh(source: str, data: bytes) -> bool:
+    if len(data) < HEADER.size:
+        return False
+
+    signature, magic, version, flags, check = HEADER.unpack_from(data)
+
+    if (signature, magic, version) != (SIGNATURE, MAGIC_NUMBER, VERSION):
+        return False
+
+    try:
+        return flags in (TIMESTAMP, HASHED) and check == validation(source, flags)
+    except OSError:
+        return False
+
+
+def check_bytecode(source: str, optimization: str = "") -> bool:
+    try:
+        with open(bytecode_path(source, optimization), "rb") as fp:
+            return fresh(source, fp.read(HEADER.size))
+    except OSError:
+        return False
+
+
+def load_bytecode(source: str, optimization: str = "") -> CodeType | None:
+    try:
+        with open(bytecode_path(source, optimization), "rb") as fp:
+            data = fp.read()
+    except OSError:
+        return None
+
+    if not fresh(source, data):
+        return None
+
+    try:
+        code = marshal.loads(memoryview(data)[HEADER.size :])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+    return code if isinstance(code, CodeType) else None
+
+
+def dump_bytecode(
+    source: str,
+    code: CodeType,
+    check: bytes,
+    optimization: str = "",
+    flags: int = TIMESTAMP,
+) -> None:
+    header = HEADER.pack(SIGNATURE, MAGIC_NUMBER, VERSION, flags, check)
+    write_atomic(
+        bytecode_path(source, optimization),
+        header + marshal.dumps(code),
+        source_mode(source),
+    )
@@ -0,0 +1,565 @@
+from __future__ import annotations
+
+import ast
+import functools
+import hashlib
+import itertools
+import os
+import sys
+import threading
+import time
+import typing
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from types import CodeType
+
+from ..cache import TIMESTAMP, check_bytecode, dump_bytecode, load_bytecode, validation
+from ..linetable import LineTable, register, statement_lines
+from ..metrics import count
+from ..nodes import Module, Node
+from ..optimizer import optimize as fold_constants
+from ..profiling import count_rules, profiled, stage
+from ..scanner import StatementScanner, split_statements
+
+# Code loaded from the bytecode cache needs neither the parser nor lark, so both are only
+# imported once something is compiled.
+if typing.TYPE_CHECKING:
+    from ..parser import SrpParser, SrpTransformer
+
+__all__ = (
+    "cache_tag",
+    "transform_tree",
+    "transform_source",
+    "build_source",
+    "build_lines",
+    "split_chunks",
+    "build_parallel",
+    "compile_source",
+    "compile_file",
+    "compile_tree",
+    "IncrementalCompiler",
+    "CompileResult",
+    "SourceWriter",
+)
+
+
+GRAMMARS = tuple(
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "parser", name)
+    for name in ("grammar.lark", "grammar_lalr.lark")
+)
+
+
+@functools.cache
+def grammar_tag() -> str:
+    # Read directly, a cache hit shouldn't load the parser just to hash its grammars.
+    digest = hashlib.blake2b(digest_size=4)
+
+    for path in GRAMMARS:
+        with open(path, "rb") as fp:
+            digest.update(fp.read())
+
+    return digest.hexdigest()
+
+
+def cache_tag(parser: str = "lalr", optimize: int = 0, positions: bool = True) -> str:
+    # Bytecode is only as fresh as the grammar and the lexer which read its source.
+    return (
+        ("" if parser == "lalr" else parser)
+        + (str(optimize) if optimize else "")
+        + ("" if positions else "lines")
+        + ("lark" if os.environ.get("SERPENTES_LEXER") == "lark" else "")
+        + grammar_tag()
+    )
+
+
+def transform_tree(
+    tree: typing.Any, transformer: SrpTransformer, optimize: int = 0
+) -> Module | ast.Module:
+    with stage("transform") as details:
+        if profiled():
+            details["rules"] = count_rules(transformer)
+
+        module = transformer.transform(tree)
+
+    with stage("optimize", level=optimize):
+        return fold_constants(module, optimize)
+
+
+def transform_source(
+    text: str,
+    parser: str | SrpParser = "lalr",
+    direct: bool = False,
+    optimize: int = 0,
+    first: bool = True,
+) -> Module | ast.Module:
+    from ..parser import AstTransformer, SrpParser, SrpTransformer
+
+    if not isinstance(parser, SrpParser):
+        parser = SrpParser(parser)
+
+    tree = parser.parse(text, first)
+    transformer = (AstTransformer if direct else SrpTransformer)(optimize=optimize)
+
+    return transform_tree(tree, transformer, optimize)
+
+
+def build_source(
+    text: str,
+    parser: str | SrpParser = "lalr",
+    line: int = 1,
+    direct: bool = False,
+    optimize: int = 0,
+    first: bool = True,
+) -> ast.Module:
+    from ..parser import ParseError
+
+    # Without `first`, the text comes after another statement, see `SrpParser.parse`.
+    try:
+        module = transform_source(text, parser, direct, optimize, first)
+    except ParseError as error:
+        raise error.located(line=line) from None
+
+    if isinstance(module, Module):
+        with stage("build"):
+            module = module.build()
+
+    if line > 1:
+        ast.increment_lineno(module, line - 1)
+
+    return module
+
+
+def build_lines(
+    text: str,
+    parser: str = "lalr",
+    optimize: int = 0,
+    line: int = 1,
+    first: bool = True,
+) -> tuple[ast.Module, array[int]]:
+    from ..parser import LineTransformer, ParseError, SrpParser
+
+    try:
+        tree = SrpParser(parser, positions=False).parse(text, first)
+    except ParseError as error:
+        raise error.located(line=line) from None
+
+    table = statement_lines(tree)
+
+    module = typing.cast(
+        Module, transform_tree(tree, LineTransformer(optimize=optimize), optimize)
+    )
+    statements = [item for item in module.body if isinstance(item, Node)]
+
+    if len(statements) * 2 != len(table):
+        built = build_source(text, parser, line, optimize=optimize, first=first)
+        lines = [(item.lineno, item.end_lineno or item.lineno) for item in built.body]
+
+        return built, array("I", itertools.chain.from_iterable(lines))
+
+    # Shared subtrees make the built statements graphs, the lines are moved beforehand.
+    if line > 1:
+        table = array("I", (item + line - 1 for item in table))
+
+    with stage("build"):
+        return module.build(table), table
+
+
+# Building is iterative, but `compile` walks the AST with the interpreter's limit.
+RECURSION_LIMIT = 10_000
+RECURSION_LOCK = threading.Lock()
+
+
+def compile_module(module: ast.Module, filename: str) -> CodeType:
+    # The limit is the whole interpreter's, threads compiling at once would restore each
+    # other's. `compile` holds the GIL throughout anyway.
+    with RECURSION_LOCK, stage("compile"):
+        previous = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(previous, RECURSION_LIMIT))
+
+        try:
+            return compile(module, filename, "exec")
+        finally:
+            sys.setrecursionlimit(previous)
+
+
+# Smaller sources are parsed faster than a pool of workers starts.
+CHUNK_SIZE = 1 << 16
+
+
+def split_chunks(text: str, count: int) -> list[tuple[int, str]] | None:
+    scanner = StatementScanner()
+    statements = scanner.feed(text, final=True)
+
+    # Statements end where the parser ends them, unless the scanner met something the
+    # parser rejects anyway.
+    if scanner.unsure:
+        return None
+
+    size = max(len(text) // count, CHUNK_SIZE)
+    chunks: list[tuple[int, str]] = []
+    parts: list[str] = []
+    start = written = 0
+
+    for line, statement in statements:
+        if not parts:
+            start = line
+
+        parts.append(statement)
+        written += len(statement)
+
+        if written >= size:
+            chunks.append((start, "".join(parts)))
+            parts, written = [], 0
+
+    if parts:
+        chunks.append((start, "".join(parts)))
+
+    return chunks
+
+
+def build_chunk(
+    line: int,
+    text: str,
+    parser: str = "lalr",
+    direct: bool = False,
+    optimize: int = 0,
+    positions: bool = True,
+    first: bool = True,
+) -> tuple[ast.Module, array[int] | None]:
+    if positions:
+        return build_source(text, parser, line, direct, optimize, first), None
+
+    return build_lines(text, parser, optimize, line, first)
+
+
+def build_parallel(
+    text: str,
+    parser: str = "lalr",
+    direct: bool = False,
+    optimize: int = 0,
+    positions: bool = True,
+    workers: int | None = None,
+) -> tuple[ast.Module, array[int] | None] | None:
+    from ..parser import ParseError
+
+    chunks = split_chunks(text, workers or os.cpu_count() or 1)
+
+    if chunks is None or len(chunks) < 2:
+        return None
+
+    with stage("parallel", chunks=len(chunks)):
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers or None,
+                initializer=warm,
+                initargs=(parser, positions),
+            ) as executor:
+                built = list(
+                    executor.map(
+                        build_chunk,
+                        *zip(*chunks),
+                        itertools.repeat(parser),
+                        itertools.repeat(direct),
+                        itertools.repeat(optimize),
+                        itertools.repeat(positions),
+                        # Chunks after the first one come after a statement of another.
+                        [index == 0 for index in range(len(chunks))],
+                    )
+                )
+        except ParseError:
+            # Parse errors are left to a serial parse, which reports them against the
+            # whole source.
+            return None
+
+    body = [statement for module, _ in built for statement in module.body]
+    tables = [table for _, table in built if table is not None]
+
+    return (
+        ast.Module(body=body, type_ignores=[]),
+        array("I", itertools.chain.from_iterable(tables)) if tables else None,
+    )
+
+
+def compile_source(
+    text: str,
+    filename: str = "<string>",
+    parser: str | SrpParser = "lalr",
+    direct: bool = False,
+    optimize: int = 0,
+    positions: bool = True,
+    workers: int | None = 1,
+) -> CodeType:
+    from ..parser import ParseError, SrpParser
+
+    name = parser.parser if isinstance(parser, SrpParser) else parser
+    built = None
+
+    if workers != 1:
+        built = build_parallel(text, name, direct, optimize, positions, workers)
+
+    try:
+        if built is not None:
+            module, table = built
+        elif positions:
+            module = build_source(text, parser, direct=direct, optimize=optimize)
+            table = None
+        else:
+            module, table = build_lines(text, name, optimize)
+
+    except ParseError as error:
+        # The parser never knows which file its text comes from.
+        raise error.located(filename) from None
+
+    if not positions:
+        register(LineTable(filename, name, optimize, table))
+
+    return compile_module(module, filename)
+
+
+def compile_file(
+    path: str,
+    parser: str = "lalr",
+    cache: bool = True,
+    flags: int = TIMESTAMP,
+    optimize: int = 0,
+    force: bool = False,
+    positions: bool = True,
+    workers: int | None = 1,
+) -> CodeType:
+    optimization = cache_tag(parser, optimize, positions)
+
+    if cache and not force:
+        with stage("cache", path=path) as details:
+            code = load_bytecode(path, optimization)
+            details["hit"] = code is not None
+
+        if code is not None:
+            # The line table of cached code is rebuilt from the source when it's needed.
+            if not positions:
+                register(LineTable(path, parser, optimize))
+
+            return code
+
+    with open(path, "rb") as fp:
+        data = fp.read()
+
+    check = validation(path, flags, data)
+    code = compile_source(
+        data.decode(),
+        path,
+        parser,
+        optimize=optimize,
+        positions=positions,
+        workers=workers,
+    )
+
+    # `force` is used to precompile, where failing to write is an error of its own.
+    if force:
+        dump_bytecode(path, code, check, optimization, flags)
+
+    elif cache and not sys.dont_write_bytecode:
+        try:
+            dump_bytecode(path, code, check, optimization, flags)
+        except OSError:
+            pass
+
+    return code
+
+
+class IncrementalCompiler:
+    def __init__(self, parser: str = "lalr", optimize: int = 0) -> None:
+        self.parser = parser
+        self.optimize = optimize
+
+        # Transformed statements by the hash of their source, positioned at line 1.
+        self.statements: dict[bytes, Module] = {}
+
+        self.reparsed = 0
+        self.reused = 0
+
+    def build(self, text: str) -> ast.Module:
+        statements: dict[bytes, Module] = {}
+        body: list[ast.stmt] = []
+
+        scanner = StatementScanner()
+        split = scanner.feed(text, final=True)
+
+        self.reparsed = self.reused = 0
+
+        # Statements only parse on their own like in the module where the scanner ends
+        # them where the parser does, it can't tell for text the parser rejects.
+        if scanner.unsure:
+            return self.build_whole(text, len(split))
+
+        try:
+            for index, (line, statement) in enumerate(split):
+                # The first statement of a module may group apart from the same text after
+                # another one, so they are cached apart.
+                first = index == 0
+                key = hashlib.blake2b(
+                    statement.encode(), digest_size=16, person=b"first" if first else b""
+                ).digest()
+
+                if (module := statements.get(key) or self.statements.get(key)) is None:
+                    module = typing.cast(
+                        Module,
+                        transform_source(
+                            statement, self.parser, optimize=self.optimize, first=first
+                        ),
+                    )
+                    self.reparsed += 1
+                else:
+                    self.reused += 1
+
+                statements[key] = module
+
+                with stage("build"):
+                    built = module.build()
+
+                if line > 1:
+                    ast.increment_lineno(built, line - 1)
+
+                body.extend(built.body)
+
+        except BaseException:
+            # Keep what was parsed already, the next attempt likely fixes one statement.
+            self.statements.update(statements)
+            raise
+
+        count("serpentes_statements_total", self.reparsed, result="reparsed")
+        count("serpentes_statements_total", self.reused, result="reused")
+
+        # Only the statements of the latest version are kept around.
+        self.statements = statements
+        return ast.Module(body=body, type_ignores=[])
+
+    def build_whole(self, text: str, statements: int) -> ast.Module:
+        self.reparsed, self.reused = statements, 0
+        count("serpentes_statements_total", statements, result="reparsed")
+
+        return build_source(text, self.parser, optimize=self.optimize)
+
+    def compile(self, text: str, filename: str = "<string>") -> CodeType:
+        module = self.build(text)
+
+        return compile_module(module, filename)
+
+
+class CompileResult(typing.NamedTuple):
+    path: str
+    elapsed: float = 0.0
+    skipped: bool = False
+    error: str | None = None
+
+
+def find_sources(root: str) -> list[str]:
+    if os.path.isfile(root):
+        return [root]
+
+    sources: list[str] = []
+
+    for directory, folders, files in os.walk(root):
+        folders[:] = sorted(folder for folder in folders if folder != "__pycache__")
+        sources.extend(
+            os.path.join(directory, file)
+            for file in sorted(files)
+            if file.endswith(".srp")
+        )
+
+    return sources
+
+
+def warm(parser: str = "lalr", positions: bool = True) -> None:
+    from ..parser import SrpParser
+
+    SrpParser(parser, positions=positions).warm()
+
+
+def compile_one(
+    path: str,
+    parser: str = "lalr",
+    optimize: int = 0,
+    force: bool = False,
+    positions: bool = True,
+) -> CompileResult:
+    if not force and check_bytecode(path, cache_tag(parser, optimize, positions)):
+        return CompileResult(path, skipped=True)
+
+    start = time.perf_counter()
+
+    try:
+        compile_file(path, parser, optimize=optimize, force=True, positions=positions)
+    except Exception as error:
+        return CompileResult(
+            path,
+            time.perf_counter() - start,
+            error=f"{type(error).__name__}: {str(error).strip()}",
+        )
+
+    return CompileResult(path, time.perf_counter() - start)
+
+
+def compile_tree(
+    root: str,
+    workers: int = 1,
+    parser: str = "lalr",
+    optimize: int = 0,
+    force: bool = False,
+    positions: bool = True,
+) -> typing.Iterator[CompileResult]:
+    sources = find_sources(root)
+
+    if workers == 1 or len(sources) < 2:
+        warm(parser, positions)
+        yield from (
+            compile_one(path, parser, optimize, force, positions) for path in sources
+        )
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers or None, initializer=warm, initargs=(parser, positions)
+    ) as executor:
+        yield from executor.map(
+            compile_one,
+            sources,
+            itertools.repeat(parser),
+            itertools.repeat(optimize),
+            itertools.repeat(force),
+            itertools.repeat(positions),
+        )
+
+
+class SourceWriter:
+    def __init__(self) -> None:
+        self.line = 1
+        self.empty = True
+
+    def write(self, module: ast.Module) -> str:
+        parts: list[str] = []
+
+        for statement in module.body:
+            source = ast.unparse(statement)
+
+            # Keep every statement on its original line, so tracebacks still line up.
+            if statement.lineno > self.line:
+                parts.append("\n" * (statement.lineno - self.line))
+                self.line = statement.lineno
+
+            elif not self.empty:
+                parts.append("; ")
+
+            parts.append(source)
+
+            self.line += source.count("\n")
+            self.empty = False
+
+        return str().join(parts)
+
+    def close(self) -> str:
+        if self.empty:
+            return str()
+
+        self.line += 1
+        self.empty = True
+
+        return "\n"
@@ -1,30 +1,139 @@
 from __future__ import annotations
 
+import codecs
+import re
 import typing
-from codecs import BufferedIncrementalDecoder, CodecInfo, register, utf_8_encode
-from traceback import format_exc
+from codecs import CodecInfo, IncrementalDecoder, register, utf_8_decode, utf_8_encode
 
+from ..scanner import StatementScanner
 
-class _IncrDecoder(BufferedIncrementalDecoder):
-    def _buffer_decode(self, data: bytes, *_: tuple[str, bool]) -> tuple[str, int]:
-        if data != b"":
-            return decode(data)
+if typing.TYPE_CHECKING:
+    from _typeshed import ReadableBuffer
 
-        return str(), 0
+# Python only accepts `# -*- coding: serpentes -*-` on one of the first two lines.
+COOKIE = re.compile(r"^([ \t\f]*)#")
 
 
-def decode(input: bytes | memoryview, errors: str = "strict") -> tuple[str, int]:
-    parse: bytes = typing.cast(bytes, input)
+def uncomment(text: str) -> str:
+    lines = text.split("\n", 2)
 
-    if isinstance(input, memoryview):
-        parse = input.tobytes()
+    for index in range(min(len(lines), 2)):
+        lines[index] = COOKIE.sub(r"\1//", lines[index], count=1)
 
-    try:
-        return parse.decode(), len(parse)
-    except Exception:
-        print(format_exc)
-        print(errors)
-        raise
+    return "\n".join(lines)
+
+
+# Lines are packed into the integer of the decoder state, each in as many bits.
+LINE_BITS = 32
+
+
+class _IncrDecoder(IncrementalDecoder):
+    def __init__(self, errors: str = "strict") -> None:
+        super().__init__(errors)
+        self.reset()
+
+    def reset(self) -> None:
+        from ..compiler import SourceWriter
+
+        self.utf_8 = codecs.getincrementaldecoder("utf-8")(self.errors)
+        self.head: str | None = str()
+        self.scanner = StatementScanner()
+        self.writer = SourceWriter()
+
+        # Once the scanner is unsure of its boundaries, everything from there on is
+        # transpiled at once, so it splits where the parser does.
+        self.rest: str | None = None
+        self.rest_line = 1
+
+    def getstate(self) -> tuple[bytes, int]:
+        pending, _ = self.utf_8.getstate()
+
+        if self.head is not None:
+            return self.head.encode("utf-8", self.errors) + pending, 0
+
+        text = (self.rest or str()) + self.scanner.text
+        line = self.scanner.start_line if self.rest is None else self.rest_line
+
+        flags = 1 | (self.rest is not None) << 1 | self.writer.empty << 2
+        flags |= (self.writer.line << 3) | (line << (3 + LINE_BITS))
+
+        return text.encode("utf-8", self.errors) + pending, flags
+
+    def setstate(self, state: tuple[bytes, int]) -> None:
+        pending, flags = state
+        self.reset()
+
+        # What was buffered is decoded again with the next input.
+        self.utf_8.setstate((pending, 0))
+
+        if not flags:
+            return
+
+        line = flags >> (3 + LINE_BITS)
+
+        self.head = None
+        self.writer.empty = bool(flags & 4)
+        self.writer.line = (flags >> 3) & ((1 << LINE_BITS) - 1)
+        self.scanner.line = self.scanner.start_line = line
+
+        if flags & 2:
+            self.rest, self.rest_line = str(), line
+
+    def decode(self, input: ReadableBuffer, final: bool = False) -> str:
+        from ..profiling import stage
+
+        with stage("decode", size=memoryview(input).nbytes):
+            return self.translate(self.utf_8.decode(input, final), final)
+
+    def translate(self, text: str, final: bool) -> str:
+        from ..compiler import build_source
+
+        output: list[str] = []
+
+        if self.head is not None:
+            self.head += text
+
+            if self.head.count("\n") < 2 and not final:
+                return str()
+
+            text, self.head = uncomment(self.head), None
+
+        statements = self.scanner.feed(text, final)
+
+        if self.scanner.unsure and self.rest is None:
+            self.rest = str()
+            self.rest_line = statements[0][0] if statements else self.scanner.start_line
+
+        # Statements after the first one are parsed as such, see `SrpParser.parse`.
+        for line, statement in statements:
+            if self.rest is None:
+                module = build_source(statement, line=line, first=self.writer.empty)
+                output.append(self.writer.write(module))
+            else:
+                self.rest += statement
+
+        if final:
+            if self.rest:
+                module = build_source(
+                    self.rest, line=self.rest_line, first=self.writer.empty
+                )
+                output.append(self.writer.write(module))
+                self.rest = str()
+
+            output.append(self.writer.close())
+
+        return str().join(output)
+
+
+def decode(input: ReadableBuffer, errors: str = "strict") -> tuple[str, int]:
+    from ..compiler import SourceWriter, build_source
+    from ..profiling import stage
+
+    with stage("decode", size=memoryview(input).nbytes):
+        text, consumed = utf_8_decode(input, errors, True)
+        writer = SourceWriter()
+
+        return writer.write(build_source(uncomment(text))) + writer.close(), consumed
 
 
 ENCODINGS: dict[str, CodecInfo] = {
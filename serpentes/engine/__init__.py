@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import hashlib
+import marshal
+import multiprocessing
+import os
+import queue
+import threading
+import typing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.context import ForkServerContext, SpawnContext
+from types import CodeType
+
+from ..compiler import compile_source as build_code
+from ..compiler import warm
+from ..metrics import count
+from ..parser import SrpParser
+
+__all__ = (
+    "ParserPool",
+    "CodeCache",
+    "Engine",
+    "compile_source",
+    "exec_source",
+    "acompile",
+    "shutdown",
+)
+
+Key: typing.TypeAlias = "tuple[bytes, str, str, int]"
+
+
+class ParserPool:
+    def __init__(self, parser: str = "lalr", size: int | None = None) -> None:
+        self.parser = parser
+        self.size = size or os.cpu_count() or 1
+
+        # Most recently used first, so a quiet service keeps reusing the same parsers.
+        self.idle: queue.LifoQueue[SrpParser] = queue.LifoQueue()
+        self.created = 0
+        self.lock = threading.Lock()
+
+    def create(self) -> SrpParser | None:
+        with self.lock:
+            if self.created >= self.size:
+                return None
+
+            self.created += 1
+
+        try:
+            parser = SrpParser(self.parser, shared=False)
+            parser.warm()
+        except BaseException:
+            with self.lock:
+                self.created -= 1
+            raise
+
+        return parser
+
+    @contextlib.contextmanager
+    def acquire(self) -> typing.Iterator[SrpParser]:
+        try:
+            parser = self.idle.get_nowait()
+        except queue.Empty:
+            # Once the pool is full, threads wait for a parser to be released.
+            parser = self.create() or self.idle.get()
+
+        try:
+            yield parser
+        finally:
+            self.idle.put(parser)
+
+
+class CodeCache:
+    # Shared by the engine and the compile server, `name` tells their metrics apart.
+    def __init__(self, size: int = 1024, name: str = "engine") -> None:
+        self.size = size
+        self.name = name
+        self.entries: collections.OrderedDict[Key, CodeType] = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(text: str, filename: str, parser: str, optimize: int) -> Key:
+        # Code objects remember their filename, so it is part of the key.
+        digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        return digest, filename, parser, optimize
+
+    def get(self, key: Key) -> CodeType | None:
+        with self.lock:
+            if (code := self.entries.get(key)) is None:
+                self.misses += 1
+                count("serpentes_cache_requests_total", cache=self.name, result="miss")
+                return None
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+            count("serpentes_cache_requests_total", cache=self.name, result="hit")
+
+            return code
+
+    def put(self, key: Key, code: CodeType) -> None:
+        with self.lock:
+            self.entries[key] = code
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+                count("serpentes_cache_evictions_total", cache=self.name)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+def compile_marshal(text: str, filename: str, parser: str, optimize: int) -> bytes:
+    code = build_code(text, filename, parser, optimize=optimize)
+
+    # Code objects can't be pickled, they leave the worker processes marshalled.
+    return marshal.dumps(code)
+
+
+def context() -> ForkServerContext | SpawnContext:
+    # Workers never come from a fork of their caller, which may run threads and so hold
+    # locks no thread of the fork would ever release.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+
+    return multiprocessing.get_context("spawn")
+
+
+class Engine:
+    def __init__(
+        self,
+        cache_size: int = 1024,
+        pool_size: int | None = None,
+        workers: int | None = None,
+    ) -> None:
+        self.cache = CodeCache(cache_size)
+        self.pool_size = pool_size
+        self.workers = workers
+
+        self.pools: dict[str, ParserPool] = {}
+        self.executor: Executor | None = None
+        self.lock = threading.Lock()
+
+    def pool(self, parser: str) -> ParserPool:
+        if (pool := self.pools.get(parser)) is None:
+            with self.lock:
+                pool = self.pools.setdefault(parser, ParserPool(parser, self.pool_size))
+
+        return pool
+
+    def compile(
+        self,
+        text: str,
+        filename: str = "<string>",
+        parser: str = "lalr",
+        optimize: int = 0,
+    ) -> CodeType:
+        key = self.cache.key(text, filename, parser, optimize)
+
+        if (code := self.cache.get(key)) is not None:
+            return code
+
+        with self.pool(parser).acquire() as srp:
+            code = build_code(text, filename, srp, optimize=optimize)
+
+        self.cache.put(key, code)
+        return code
+
+    def exec(
+        self,
+        text: str,
+        namespace: dict[str, typing.Any] | None = None,
+        filename: str = "<string>",
+        parser: str = "lalr",
+        optimize: int = 0,
+    ) -> dict[str, typing.Any]:
+        if namespace is None:
+            namespace = {"__name__": "__main__"}
+
+        exec(self.compile(text, filename, parser, optimize), namespace)
+        return namespace
+
+    def start(self, parser: str = "lalr") -> Executor:
+        with self.lock:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=context(),
+                    initializer=warm,
+                    initargs=(parser,),
+                )
+
+            return self.executor
+
+    async def acompile(
+        self,
+        text: str,
+        filename: str = "<string>",
+        parser: str = "lalr",
+        optimize: int = 0,
+    ) -> CodeType:
+        key = self.cache.key(text, filename, parser, optimize)
+
+        if (code := self.cache.get(key)) is not None:
+            return code
+
+        executor = self.start(parser)
+
+        try:
+            data = await asyncio.get_running_loop().run_in_executor(
+                executor, compile_marshal, text, filename, parser, optimize
+            )
+        except BrokenProcessPool:
+            # A pool never recovers from a lost worker, the next call starts a new one.
+            with self.lock:
+                if self.executor is executor:
+                    self.executor = None
+
+            executor.shutdown(wait=False)
+            raise
+
+        code = marshal.loads(data)
+        self.cache.put(key, code)
+
+        return code
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self.lock:
+            executor, self.executor = self.executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+ENGINE = Engine()
+
+
+def compile_source(
+    text: str, filename: str = "<string>", parser: str = "lalr", optimize: int = 0
+) -> CodeType:
+    return ENGINE.compile(text, filename, parser, optimize)
+
+
+def exec_source(
+    text: str,
+    namespace: dict[str, typing.Any] | None = None,
+    filename: str = "<string>",
+    parser: str = "lalr",
+    optimize: int = 0,
+) -> dict[str, typing.Any]:
+    return ENGINE.exec(text, namespace, filename, parser, optimize)
+
+
+async def acompile(
+    text: str, filename: str = "<string>", parser: str = "lalr", optimize: int = 0
+) -> CodeType:
+    return await ENGINE.acompile(text, filename, parser, optimize)
+
+
+def shutdown(wait: bool = True) -> None:
+    ENGINE.shutdown(wait)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import sys
+from importlib.machinery import (
+    BYTECODE_SUFFIXES,
+    EXTENSION_SUFFIXES,
+    SOURCE_SUFFIXES,
+    ExtensionFileLoader,
+    FileFinder,
+    ModuleSpec,
+    SourceFileLoader,
+    SourcelessFileLoader,
+)
+from types import CodeType
+
+__all__ = ("SrpLoader", "install", "uninstall")
+
+SUFFIX = ".srp"
+
+
+def level() -> int:
+    # Like Python's, imports build at the level of `-O`.
+    return min(sys.flags.optimize, 2)
+
+
+# `importlib.abc` pulls in `importlib.resources` and pathlib, which is more than the
+# rest of `import serpentes` costs, so the concrete loader is used.
+class SrpLoader(SourceFileLoader):
+    def create_module(self, spec: ModuleSpec) -> None:
+        from ..cache import bytecode_path
+        from ..compiler import cache_tag
+
+        # Python only knows where the `.pyc` file of a source goes, `__cached__` is taken
+        # from the spec.
+        if spec.origin is not None:
+            spec.cached = bytecode_path(spec.origin, cache_tag(optimize=level()))
+
+    def get_code(self, fullname: str) -> CodeType:
+        from ..compiler import compile_file
+
+        # Imports share their `.srpc` file with `--run` and `serpentes compile`, so a
+        # precompiled module never loads the parser. `-B` is honored when writing it.
+        return compile_file(self.get_filename(fullname), optimize=level())
+
+
+# `.srp` files are found next to the regular ones by the same finder, so they take part
+# in the `sys.path` order like any other source and `.py` files win within a directory.
+LOADERS = (
+    (ExtensionFileLoader, EXTENSION_SUFFIXES),
+    (SourceFileLoader, SOURCE_SUFFIXES),
+    (SourcelessFileLoader, BYTECODE_SUFFIXES),
+    (SrpLoader, [SUFFIX]),
+)
+
+HOOK = FileFinder.path_hook(*LOADERS)
+
+
+def install() -> None:
+    if HOOK in sys.path_hooks:
+        return
+
+    # Takes the place of the default hook, whose finders would never look for `.srp`.
+    for index, hook in enumerate(sys.path_hooks):
+        if getattr(hook, "__qualname__", "").startswith("FileFinder.path_hook"):
+            sys.path_hooks.insert(index, HOOK)
+            break
+    else:
+        sys.path_hooks.append(HOOK)
+
+    sys.path_importer_cache.clear()
+
+
+def uninstall() -> None:
+    if HOOK in sys.path_hooks:
+        sys.path_hooks.remove(HOOK)
+        sys.path_importer_cache.clear()
+
+
+install()
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import importlib
+import re
+import sys
+import typing
+
+__all__ = ("SrpLexer", "TokenStream", "scan", "tokenize")
+
+_DEC = r"[0-9](?:_?[0-9])*"
+_FLOAT = (
+    rf"(?:{_DEC}[eE][+-]?{_DEC}|(?:\.{_DEC}|{_DEC}\.(?:{_DEC})?)(?:[eE][+-]?{_DEC})?)"
+)
+
+# Every token of both grammars in one pattern, tried in the order lark's lexers use.
+TOKEN = re.compile(
+    rf"""
+    (?P<WS>[ \t\f\r\n]+)
+    | (?P<COMMENT>//[^\n]*)
+    | (?P<LONG_STRING>(?i:[ubf]?r?|r[ubf])(?s:\"\"\".*?(?<!\\)(?:\\\\)*?\"\"\"
+        |'''.*?(?<!\\)(?:\\\\)*?'''))
+    | (?P<STRING>(?i:[ubf]?r?|r[ubf])(?:"(?!"").*?(?<!\\)(?:\\\\)*?"
+        |'(?!'').*?(?<!\\)(?:\\\\)*?'))
+    | (?P<IMAG_NUMBER>(?:{_FLOAT}|{_DEC})[jJ])
+    | (?P<FLOAT_NUMBER>{_FLOAT})
+    | (?P<HEX_NUMBER>0[xX](?:_?[0-9a-fA-F])+)
+    | (?P<OCT_NUMBER>0[oO](?:_?[0-7])+)
+    | (?P<BIN_NUMBER>0[bB](?:_?[01])+)
+    | (?P<DEC_NUMBER>[1-9](?:_?[0-9])*|0(?:_?0)*(?![1-9]))
+    | (?P<PHRASE>is\ not\b|not\ in\b)
+    | (?P<NAME>[^\W\d]\w*)
+    | (?P<SYMBOL>\[not\b|\[[+\-~]|<-|\*\*|<<|>>|[<>=!]=|[-+*/%@<>|^&.,:=()\[\]{{}}])
+    """,
+    re.VERBOSE,
+)
+
+# Named kinds of tokens, lark prefixes the ones imported from `python.lark`.
+KINDS = (
+    "NAME",
+    "STRING",
+    "LONG_STRING",
+    "IMAG_NUMBER",
+    "FLOAT_NUMBER",
+    "HEX_NUMBER",
+    "OCT_NUMBER",
+    "BIN_NUMBER",
+    "DEC_NUMBER",
+)
+
+# Fixed tokens the grammars spell as regular expressions.
+PATTERNS = ("is not", "not in", "[not")
+
+# The key of a token, its text, offsets and then 1-based start and end positions.
+Scanned: typing.TypeAlias = "tuple[str, str, int, int, int, int, int]"
+
+
+def scan(
+    text: str, pos: int = 0, endpos: int | None = None, line: int = 1, start: int = 0
+) -> typing.Iterator[Scanned]:
+    endpos = len(text) if endpos is None else endpos
+    match = None
+
+    for match in TOKEN.finditer(text, pos, endpos):
+        kind = match.lastgroup
+        begin = match.start()
+
+        if begin != pos:
+            break
+
+        pos = match.end()
+
+        if kind == "WS":
+            if (newlines := text.count("\n", begin, pos)) > 0:
+                line += newlines
+                start = text.rindex("\n", begin, pos) + 1
+
+            continue
+
+        elif kind == "COMMENT":
+            continue
+
+        value = match.group()
+        column = begin - start + 1
+
+        if kind == "LONG_STRING" and (newlines := value.count("\n")) > 0:
+            first, line = line, line + newlines
+            start = begin + value.rindex("\n") + 1
+
+            yield kind, value, begin, first, column, line, pos - start + 1
+            continue
+
+        # Symbols are their own key, keywords are looked up by the lexer using them.
+        key = value if kind in {"SYMBOL", "PHRASE"} else typing.cast(str, kind)
+        yield key, value, begin, line, column, line, pos - start + 1
+
+    if pos < endpos:
+        yield "", text[pos], pos, line, pos - start + 1, line, pos - start + 1
+
+
+class TokenStream:
+    # Tokens keyed independently of the grammars, so LALR and Earley can both replay them.
+    __slots__ = ("text", "tokens")
+
+    def __init__(self, text: str, tokens: list[Scanned]) -> None:
+        self.text = text
+        self.tokens = tokens
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def __iter__(self) -> typing.Iterator[Scanned]:
+        return iter(self.tokens)
+
+
+def tokenize(text: str) -> TokenStream:
+    return TokenStream(text, list(scan(text)))
+
+
+class SrpLexer:
+    # Lark takes it as the contextual lexer of LALR through `_plugins`. Earley keeps its
+    # dynamic lexer, a lexer of its own changes which tree it picks.
+    __future_interface__ = 2
+
+    def __init__(
+        self,
+        conf: typing.Any,
+        states: dict[typing.Any, typing.Collection[str]],
+        always_accept: typing.Collection[str] = (),
+    ) -> None:
+        # Tokens and errors have to come from the lark running the parser, the standalone
+        # module or lark itself.
+        module = sys.modules[type(conf).__module__]
+
+        if not hasattr(module, "UnexpectedCharacters"):
+            module = importlib.import_module("lark")
+
+        self.Token = module.Token
+        self.UnexpectedCharacters = module.UnexpectedCharacters
+
+        # Keys of tokens to the terminal names lark gave this grammar.
+        self.terminals: dict[str, str] = {}
+        self.keywords: dict[str, str] = {}
+
+        for terminal in conf.terminals:
+            name, pattern = terminal.name, terminal.pattern
+
+            if pattern.type == "str":
+                table = self.keywords if pattern.value.isidentifier() else self.terminals
+                table[pattern.value] = name
+
+            elif (kind := name.rpartition("__")[2]) in KINDS:
+                self.terminals[kind] = name
+
+            else:
+                for value in PATTERNS:
+                    if re.fullmatch(pattern.to_regexp(), value):
+                        self.terminals[value] = name
+
+        self.name = self.terminals["NAME"]
+
+        # Keywords the grammar keeps out of its names, lark's lexers never take those as one.
+        pattern = next(
+            terminal.pattern for terminal in conf.terminals if terminal.name == self.name
+        )
+        self.reserved = frozenset(
+            keyword
+            for keyword in self.keywords
+            if not re.fullmatch(pattern.to_regexp(), keyword)
+        )
+
+        # Like lark's contextual lexer, a token the parser can't take falls back to the
+        # longest one it can, `is not` to `is` and `[-` to `[`.
+        self.fallbacks: dict[str, tuple[str, ...]] = {
+            key: shorter
+            for key in self.terminals
+            if (
+                shorter := tuple(
+                    prefix
+                    for prefix in (
+                        key[:end].rstrip() for end in range(len(key) - 1, 0, -1)
+                    )
+                    if prefix in self.terminals or prefix in self.keywords
+                )
+            )
+        }
+
+        self.states: dict[typing.Any, frozenset[str]] = {
+            state: frozenset((*accepted, *always_accept))
+            for state, accepted in states.items()
+        }
+
+    def accepts(self, parser_state: typing.Any, name: str) -> bool:
+        if parser_state is None:
+            return True
+
+        return name in self.states[parser_state.position]
+
+    def shorten(self, key: str, parser_state: typing.Any) -> str | None:
+        for shorter in self.fallbacks[key]:
+            name = self.keywords.get(shorter) or self.terminals[shorter]
+
+            if self.accepts(parser_state, name):
+                return shorter
+
+        return None
+
+    def resolve(self, key: str, value: str, parser_state: typing.Any) -> str | None:
+        if key == "NAME":
+            name = self.keywords.get(value)
+
+            # Unless reserved, keywords are names wherever the parser can't take the keyword.
+            if name is None or (
+                value not in self.reserved
+                and parser_state is not None
+                and not self.accepts(parser_state, name)
+                and self.accepts(parser_state, self.name)
+            ):
+                return self.name
+
+            return name
+
+        return self.terminals.get(key)
+
+    def lex(
+        self, lexer_state: typing.Any, parser_state: typing.Any
+    ) -> typing.Iterator[typing.Any]:
+        text = lexer_state.text
+        counter = lexer_state.line_ctr
+
+        if isinstance(text, TokenStream):
+            source, endpos = text.text, len(text.text)
+            tokens: typing.Iterator[Scanned] = iter(text.tokens)
+        else:
+            source, endpos = text.text, text.end
+            tokens = scan(
+                source, counter.char_pos, endpos, counter.line, counter.line_start_pos
+            )
+
+        Token, fallbacks, resolve = self.Token, self.fallbacks, self.resolve
+        token = None
+
+        try:
+            while True:
+                for key, value, begin, line, column, end_line, end_column in tokens:
+                    if (name := resolve(key, value, parser_state)) is None:
+                        raise self.error(lexer_state, source, begin, line, column)
+
+                    shorter = (
+                        self.shorten(key, parser_state)
+                        if key in fallbacks
+                        and parser_state is not None
+                        and not self.accepts(parser_state, name)
+                        else None
+                    )
+
+                    if shorter is not None:
+                        value, end_column = shorter, column + len(shorter)
+                        name = self.keywords.get(shorter) or self.terminals[shorter]
+
+                    token = Token(
+                        name,
+                        value,
+                        begin,
+                        line,
+                        column,
+                        end_line,
+                        end_column,
+                        begin + len(value),
+                    )
+                    lexer_state.last_token = token
+
+                    yield token
+
+                    # Scanning starts over after the part of the token that was taken.
+                    if shorter is not None:
+                        tokens = scan(
+                            source, token.end_pos, endpos, line, begin - column + 1
+                        )
+                        break
+                else:
+                    return
+
+        finally:
+            if token is not None and counter is not None:
+                counter.char_pos = token.end_pos
+                counter.line = token.end_line
+                counter.column = token.end_column
+                counter.line_start_pos = token.end_pos - token.end_column + 1
+
+    def error(
+        self, lexer_state: typing.Any, source: str, pos: int, line: int, column: int
+    ) -> Exception:
+        return self.UnexpectedCharacters(
+            source,
+            pos,
+            line,
+            column,
+            token_history=lexer_state.last_token and [lexer_state.last_token],
+        )
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import bisect
+import dis
+import linecache
+import sys
+import traceback
+import typing
+from array import array
+from types import CodeType, TracebackType
+
+__all__ = (
+    "LineTable",
+    "line_table",
+    "statement_lines",
+    "register",
+    "recover",
+    "install",
+    "uninstall",
+)
+
+Positions: typing.TypeAlias = "tuple[int, int, int, int]"
+
+
+def line_table(statements: typing.Iterable[tuple[int, str]]) -> array[int]:
+    table = array("I")
+
+    for line, statement in statements:
+        lines = statement.rstrip().split("\n")
+
+        # The scanner leaves comments in front of the next statement at the end of this one.
+        while len(lines) > 1 and lines[-1].lstrip().startswith("//"):
+            lines.pop()
+
+        table.append(line)
+        table.append(line + len(lines) - 1)
+
+    return table
+
+
+def edge(node: typing.Any, last: bool = False) -> typing.Any:
+    stack = [node]
+
+    while stack:
+        node = stack.pop()
+
+        if not hasattr(node, "children"):
+            return node
+
+        children = [child for child in node.children if child is not None]
+        stack.extend(children if last else reversed(children))
+
+    return None
+
+
+def statement_lines(tree: typing.Any) -> array[int]:
+    table = array("I")
+
+    # Tokens keep their lines without `propagate_positions`, only the trees lose them.
+    for statement in tree.children:
+        if statement is None:
+            continue
+
+        if (first := edge(statement)) is None:
+            continue
+
+        table.append(first.line)
+        table.append(edge(statement, last=True).end_line)
+
+    return table
+
+
+class LineTable:
+    __slots__ = ("filename", "parser", "optimize", "lines")
+
+    def __init__(
+        self,
+        filename: str,
+        parser: str = "lalr",
+        optimize: int = 0,
+        lines: array[int] | None = None,
+    ) -> None:
+        self.filename = filename
+        self.parser = parser
+        self.optimize = optimize
+
+        # Start and end line of every statement. Code loaded from the bytecode cache
+        # only gets its table once a traceback needs it.
+        self.lines = lines
+
+    def statement(self, line: int) -> tuple[int, int] | None:
+        if self.lines is None:
+            from ..scanner import split_statements
+
+            source = "".join(linecache.getlines(self.filename))
+            self.lines = line_table(split_statements(source))
+
+        index = bisect.bisect_right(self.lines[::2], line) - 1
+
+        if index < 0:
+            return None
+
+        # Dropped tokens like closing brackets may end a statement after its last line,
+        # so it reaches up to the next one.
+        if index * 2 + 2 < len(self.lines):
+            return self.lines[index * 2], self.lines[index * 2 + 2] - 1
+
+        return self.lines[index * 2], sys.maxsize
+
+
+TABLES: dict[str, LineTable] = {}
+
+
+def register(table: LineTable) -> None:
+    TABLES[table.filename] = table
+
+
+def instructions(code: CodeType) -> list[dis.Instruction]:
+    return [item for item in dis.get_instructions(code) if item.opname != "EXTENDED_ARG"]
+
+
+def line_of(item: dis.Instruction) -> int | None:
+    return None if item.positions is None else item.positions.lineno
+
+
+def counterpart(code: CodeType, root: CodeType) -> CodeType | None:
+    # Nested code objects are matched by name and instructions, only positions differ.
+    opnames = [item.opname for item in instructions(code)]
+    stack = [root]
+
+    while stack:
+        candidate = stack.pop()
+
+        if candidate.co_qualname == code.co_qualname and opnames == [
+            item.opname for item in instructions(candidate)
+        ]:
+            return candidate
+
+        stack.extend(
+            const for const in candidate.co_consts if isinstance(const, CodeType)
+        )
+
+    return None
+
+
+def recover(code: CodeType, lasti: int) -> Positions | None:
+    if (table := TABLES.get(code.co_filename)) is None or not hasattr(
+        code, "co_positions"
+    ):
+        return None
+
+    found = instructions(code)
+    # Calls leave `lasti` on their inline caches, past the instruction's own offset.
+    failing = next((item for item in reversed(found) if item.offset <= lasti), None)
+
+    if failing is None or failing.positions is None or failing.positions.lineno is None:
+        return None
+
+    if (lines := table.statement(failing.positions.lineno)) is None:
+        return None
+
+    from ..compiler import build_source
+
+    start, end = lines
+    source = linecache.getlines(code.co_filename)
+
+    end = min(end, len(source))
+    text = "".join(source[start - 1 : end])
+
+    # Only the failing statement is parsed again, this time with its positions.
+    try:
+        module = build_source(text, table.parser, line=start, optimize=table.optimize)
+        rebuilt = compile(module, code.co_filename, "exec")
+    except Exception:
+        return None
+
+    if code.co_name == "<module>":
+        # A statement's instructions in the module are the same as when it's on its own.
+        current = [item for item in found if line_of(item) == start]
+        original = [
+            item
+            for item in instructions(rebuilt)
+            if (line := line_of(item)) is not None and start <= line <= end
+        ]
+    else:
+        if (nested := counterpart(code, rebuilt)) is None:
+            return None
+
+        current, original = found, instructions(nested)
+
+    index = current.index(failing)
+
+    if index >= len(original) or any(
+        old.opname != new.opname for old, new in zip(current[: index + 1], original)
+    ):
+        return None
+
+    positions = original[index].positions
+
+    if positions is None or None in positions:
+        return None
+
+    return typing.cast("Positions", tuple(positions))
+
+
+def patch(exception: traceback.TracebackException, tb: TracebackType | None) -> None:
+    for index, summary in enumerate(exception.stack):
+        if tb is None:
+            break
+
+        if (positions := recover(tb.tb_frame.f_code, tb.tb_lasti)) is not None:
+            lineno, end_lineno, colno, end_colno = positions
+            exception.stack[index] = traceback.FrameSummary(
+                summary.filename,
+                lineno,
+                summary.name,
+                end_lineno=end_lineno,
+                colno=colno,
+                end_colno=end_colno,
+            )
+
+        tb = tb.tb_next
+
+
+def hook(
+    kind: type[BaseException], error: BaseException, tb: TracebackType | None
+) -> None:
+    exception = traceback.TracebackException(kind, error, tb)
+    pending = [(exception, error)]
+
+    while pending:
+        current, raised = pending.pop()
+        patch(current, raised.__traceback__)
+
+        for chained, cause in (
+            (current.__cause__, raised.__cause__),
+            (current.__context__, raised.__context__),
+        ):
+            if chained is not None and cause is not None:
+                pending.append((chained, cause))
+
+    sys.stderr.write("".join(exception.format()))
+
+
+PREVIOUS: list[typing.Callable[..., typing.Any]] = []
+
+
+def install() -> None:
+    if sys.excepthook is not hook:
+        PREVIOUS.append(sys.excepthook)
+        sys.excepthook = hook
+
+
+def uninstall() -> None:
+    if sys.excepthook is hook:
+        sys.excepthook = PREVIOUS.pop() if PREVIOUS else sys.__excepthook__
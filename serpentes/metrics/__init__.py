@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import atexit
+import bisect
+import sys
+import threading
+import typing
+
+from ..profiling import Event, add_listener, remove_listener
+
+__all__ = (
+    "Registry",
+    "REGISTRY",
+    "enable",
+    "disable",
+    "enabled",
+    "install",
+    "count",
+    "observe",
+    "source",
+    "snapshot",
+    "render",
+    "dump",
+)
+
+# Latency buckets in seconds, from single statements to files of megabytes.
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+METRICS: dict[str, tuple[str, str]] = {
+    "serpentes_stage_seconds": (
+        "histogram",
+        "Time spent lexing, parsing, transforming, building, compiling and running.",
+    ),
+    "serpentes_stage_errors_total": ("counter", "Stages which raised an error."),
+    "serpentes_cache_requests_total": ("counter", "Lookups of compiled code by result."),
+    "serpentes_cache_evictions_total": ("counter", "Code dropped from full caches."),
+    "serpentes_source_bytes_total": ("counter", "Bytes of source parsed."),
+    "serpentes_statements_total": (
+        "counter",
+        "Statements the incremental compiler reparsed or reused.",
+    ),
+    "serpentes_files_total": ("counter", "Files `serpentes compile` went through."),
+    "serpentes_file_seconds": ("histogram", "Time to compile a file, in any worker."),
+}
+
+Series: typing.TypeAlias = "tuple[str, tuple[tuple[str, str], ...]]"
+
+
+def escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def series_name(name: str, labels: tuple[tuple[str, str], ...], **extra: str) -> str:
+    pairs = (*labels, *extra.items())
+
+    if not pairs:
+        return name
+
+    return name + "{" + ",".join(f'{key}="{escape(value)}"' for key, value in pairs) + "}"
+
+
+def bound(value: float) -> str:
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+def sample(value: float) -> str:
+    # Counts stay exact however large, anything else keeps every digit of the float.
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+class Registry:
+    def __init__(self, buckets: typing.Sequence[float] = BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.lock = threading.Lock()
+
+        self.counters: dict[Series, float] = {}
+        # Observations per bucket, the ones above every bucket last, then their sum.
+        self.histograms: dict[Series, list[float]] = {}
+
+    def count(self, name: str, value: float = 1, /, **labels: str) -> None:
+        key = (name, tuple(labels.items()))
+
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, /, **labels: str) -> None:
+        key = (name, tuple(labels.items()))
+        index = bisect.bisect_left(self.buckets, value)
+
+        with self.lock:
+            if (histogram := self.histograms.get(key)) is None:
+                histogram = self.histograms[key] = [0] * (len(self.buckets) + 2)
+
+            histogram[index] += 1
+            histogram[-1] += value
+
+    def clear(self) -> None:
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def cumulative(self, histogram: list[float]) -> dict[str, int]:
+        buckets: dict[str, int] = {}
+        total = 0
+
+        for upper, observed in zip((*self.buckets, float("inf")), histogram):
+            total += int(observed)
+            buckets[bound(upper)] = total
+
+        return buckets
+
+    def snapshot(self) -> dict[str, typing.Any]:
+        with self.lock:
+            counters = dict(self.counters)
+            histograms = {key: list(value) for key, value in self.histograms.items()}
+
+        result: dict[str, typing.Any] = {
+            series_name(name, labels): value for (name, labels), value in counters.items()
+        }
+
+        for (name, labels), histogram in histograms.items():
+            buckets = self.cumulative(histogram)
+            result[series_name(name, labels)] = {
+                "count": buckets["+Inf"],
+                "sum": histogram[-1],
+                "buckets": buckets,
+            }
+
+        return result
+
+    def render(self) -> str:
+        with self.lock:
+            counters = dict(self.counters)
+            histograms = {key: list(value) for key, value in self.histograms.items()}
+
+        names = sorted({name for name, _ in (*counters, *histograms)})
+        lines: list[str] = []
+
+        for name in names:
+            kind, description = METRICS.get(name, ("untyped", name))
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+
+            for (metric, labels), value in counters.items():
+                if metric == name:
+                    lines.append(f"{series_name(name, labels)} {sample(value)}")
+
+            for (metric, labels), histogram in histograms.items():
+                if metric != name:
+                    continue
+
+                buckets = self.cumulative(histogram)
+
+                for upper, total in buckets.items():
+                    lines.append(
+                        f"{series_name(name + '_bucket', labels, le=upper)} {total}"
+                    )
+
+                lines.append(
+                    f"{series_name(name + '_sum', labels)} {sample(histogram[-1])}"
+                )
+                lines.append(f"{series_name(name + '_count', labels)} {buckets['+Inf']}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+REGISTRY = Registry()
+
+# Checked before anything is recorded, so disabled metrics cost one lookup.
+ENABLED = False
+
+
+def record(event: Event) -> None:
+    labels = {"stage": event.stage}
+
+    if parser := event.details.get("parser"):
+        labels["parser"] = parser
+
+    REGISTRY.observe("serpentes_stage_seconds", event.elapsed, **labels)
+
+    if "error" in event.details:
+        REGISTRY.count("serpentes_stage_errors_total", **labels)
+
+    elif event.stage == "cache":
+        result = "hit" if event.details.get("hit") else "miss"
+        REGISTRY.count("serpentes_cache_requests_total", cache="bytecode", result=result)
+
+
+def enable() -> None:
+    global ENABLED
+
+    if not ENABLED:
+        ENABLED = True
+        add_listener(record)
+
+
+def disable() -> None:
+    global ENABLED
+
+    ENABLED = False
+    remove_listener(record)
+
+
+def enabled() -> bool:
+    return ENABLED
+
+
+def count(name: str, value: float = 1, /, **labels: str) -> None:
+    if ENABLED:
+        REGISTRY.count(name, value, **labels)
+
+
+def observe(name: str, value: float, /, **labels: str) -> None:
+    if ENABLED:
+        REGISTRY.observe(name, value, **labels)
+
+
+def source(text: str | bytes) -> None:
+    if not ENABLED:
+        return
+
+    size = len(text) if isinstance(text, bytes) or text.isascii() else len(text.encode())
+    REGISTRY.count("serpentes_source_bytes_total", size)
+
+
+def snapshot() -> dict[str, typing.Any]:
+    return REGISTRY.snapshot()
+
+
+def render() -> str:
+    return REGISTRY.render()
+
+
+def dump(path: str = "-") -> None:
+    if path == "-":
+        sys.stdout.write(render())
+        sys.stdout.flush()
+        return
+
+    from ..cache import write_atomic
+
+    write_atomic(path, render().encode())
+
+
+INSTALLED: set[str] = set()
+
+
+def install(path: str = "-") -> None:
+    enable()
+
+    # Dumped when the process exits, like `--profile` reports once the run is over.
+    if path not in INSTALLED:
+        INSTALLED.add(path)
+        atexit.register(dump, path)
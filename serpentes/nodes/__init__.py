@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 import ast
+import sys
 import typing
 from functools import partial
 
 __all__ = (
     "define",
+    "getfield",
+    "setfield",
+    "iterfields",
+    "kind",
+    "replace",
+    "singleton",
+    "Interner",
     "Literals",
     "Variables",
     "Expressions",
@@ -17,15 +25,72 @@ __all__ = (
 )
 
 NodeT = typing.TypeVar("NodeT")
+T = typing.TypeVar("T")
+ASTNode = typing.TypeVar("ASTNode", bound=ast.AST)
 
 
 def define(node: NodeT) -> partial[Node[NodeT]]:
     return partial(Node, ast=node)
 
 
+def getfield(node: Node[typing.Any] | ast.AST, name: str) -> typing.Any:
+    return node.get(name) if isinstance(node, Node) else getattr(node, name, None)
+
+
+def setfield(node: Node[typing.Any] | ast.AST, name: str, value: typing.Any) -> None:
+    if isinstance(node, Node):
+        node.set(name, value)
+    else:
+        setattr(node, name, value)
+
+
+def iterfields(
+    node: Node[typing.Any] | ast.AST,
+) -> typing.Iterator[tuple[str, typing.Any]]:
+    if not isinstance(node, Node):
+        yield from ast.iter_fields(node)
+        return
+
+    for name, value in zip(node.ast._fields, node.values):
+        if value is not MISSING:
+            yield name, value
+
+
+def kind(node: Node[typing.Any] | ast.AST) -> type[typing.Any]:
+    return node.ast if isinstance(node, Node) else type(node)
+
+
+def replace(node: NodeT, **data: typing.Any) -> NodeT:
+    if isinstance(node, Node):
+        return typing.cast(NodeT, node.derive(node.ast, **{**node.data, **data}))
+
+    original = typing.cast(ast.AST, node)
+    fields = {**dict(ast.iter_fields(original)), **data}
+    return typing.cast(NodeT, ast.copy_location(type(original)(**fields), original))
+
+
+# Operators and contexts have neither fields nor positions, so one of each serves every
+# tree, like in the trees of `ast.parse`.
+SINGLETONS: dict[type[ast.AST], ast.AST] = {
+    node: node()
+    for base in (ast.expr_context, ast.boolop, ast.operator, ast.unaryop, ast.cmpop)
+    for node in base.__subclasses__()
+}
+
+
+def singleton(node: type[T]) -> T:
+    return typing.cast(T, SINGLETONS[typing.cast(type[ast.AST], node)])
+
+
+# Marks fields which weren't passed, so `build()` leaves them unset like `ast` does.
+MISSING: typing.Any = object()
+
+
 class Node(typing.Generic[NodeT]):
-    ast: type[NodeT]
-    data: dict[str, typing.Any]
+    __slots__ = ("ast", "values", "lineno", "end_lineno", "col_offset", "end_col_offset")
+
+    ast: type[typing.Any]
+    values: tuple[typing.Any, ...]
 
     lineno: int
     end_lineno: int
@@ -34,62 +99,203 @@ class Node(typing.Generic[NodeT]):
     end_col_offset: int
 
     def __init__(self, **data: typing.Any) -> None:
-        meta = data.pop("meta")
-        self.lineno = meta.line
-        self.end_lineno = meta.end_line
+        # Without a meta, the statement's lines are given to `build()` instead.
+        if (meta := data.pop("meta")) is None:
+            self.lineno = self.end_lineno = self.col_offset = self.end_col_offset = 0
+        else:
+            self.lineno = meta.line
+            self.end_lineno = meta.end_line
 
-        self.col_offset = meta.column
-        self.end_col_offset = meta.end_column
+            self.col_offset = meta.column
+            self.end_col_offset = meta.end_column
 
-        self.data = data
         self.ast = data.pop("ast")
+        self.values = tuple(data.pop(name, MISSING) for name in self.ast._fields)
+
+        if data:
+            raise TypeError(f"{self.ast.__name__} has no fields {', '.join(data)}.")
 
     def __repr__(self) -> str:
         return f"<Node={self.ast.__name__} id={id(self)}>"
 
-    def build(self) -> NodeT:
-        parsed: dict[str, ast.AST | int] = {}
+    @property
+    def data(self) -> dict[str, typing.Any]:
+        return {
+            name: value
+            for name, value in zip(self.ast._fields, self.values)
+            if value is not MISSING
+        }
+
+    def get(self, name: str, default: typing.Any = None) -> typing.Any:
+        if name not in self.ast._fields:
+            return default
+
+        value = self.values[self.ast._fields.index(name)]
+        return default if value is MISSING else value
+
+    def derive(self, node: type[ASTNode], **data: typing.Any) -> Node[ASTNode]:
+        derived: Node[ASTNode] = Node.__new__(Node)
+
+        derived.lineno = self.lineno
+        derived.end_lineno = self.end_lineno
+
+        derived.col_offset = self.col_offset
+        derived.end_col_offset = self.end_col_offset
 
-        def recurse(value: Node[typing.Any] | list[Node[typing.Any]]) -> typing.Any:
-            if isinstance(value, Node):
-                return value.build()
+        derived.ast = node
+        derived.values = tuple(data.get(name, MISSING) for name in node._fields)
 
-            elif isinstance(value, list):  # pyright: ignore
-                for index, node in enumerate(value):
-                    value[index] = recurse(node)
+        return derived
 
-                return value
+    def set(self, name: str, value: typing.Any) -> None:
+        values = list(self.values)
+        values[self.ast._fields.index(name)] = value
 
+        self.values = tuple(values)
+
+    def build(self, lines: tuple[int, int] | None = None) -> NodeT:
+        order: list[Node[typing.Any]] = []
+        stack: list[Node[typing.Any]] = [self]
+
+        # Parents always come before their children, so the reversed walk is post-order.
+        while stack:
+            node = stack.pop()
+            order.append(node)
+
+            for value in node.values:
+                if isinstance(value, Node):
+                    stack.append(value)
+
+                elif isinstance(value, list):
+                    stack.extend(item for item in value if isinstance(item, Node))
+
+        built: dict[int, typing.Any] = {}
+
+        for node in reversed(order):
+            # Shared subtrees are in the walk once for every parent, but built only once.
+            if id(node) in built:
+                continue
+
+            if lines is None:
+                parsed: dict[str, typing.Any] = {
+                    "lineno": node.lineno,
+                    "end_lineno": node.end_lineno,
+                    "col_offset": node.col_offset,
+                    "end_col_offset": node.end_col_offset,
+                }
+            else:
+                parsed = {
+                    "lineno": lines[0],
+                    "end_lineno": lines[1],
+                    "col_offset": 0,
+                    "end_col_offset": 0,
+                }
+
+            for name, value in zip(node.ast._fields, node.values):
+                if value is MISSING:
+                    continue
+
+                if isinstance(value, Node):
+                    value = built[id(value)]
+
+                elif isinstance(value, list):
+                    value = [
+                        built[id(item)] if isinstance(item, Node) else item
+                        for item in value
+                    ]
+
+                parsed[name] = value
+
+            built[id(node)] = node.ast(**parsed)
+
+        return built[id(self)]
+
+
+def leaf_key(value: typing.Any) -> typing.Hashable:
+    if type(value) is str or value is None:
+        return value
+
+    # `1`, `1.0` and `True` are equal, as are `0.0` and `-0.0`, but aren't the same constant.
+    if isinstance(value, (tuple, frozenset)):
+        return type(value), tuple(leaf_key(item) for item in value)
+
+    if isinstance(value, (float, complex)):
+        return type(value), repr(value)
+
+    return type(value), value
+
+
+# Values which are their own key, `MISSING` is a plain `object`.
+IDENTICAL = frozenset({Node, str, type(None), object, *SINGLETONS})
+
+
+class Interner:
+    def __init__(self) -> None:
+        self.leaves: dict[typing.Hashable, typing.Any] = {}
+        self.nodes: dict[typing.Hashable, Node[typing.Any]] = {}
+        self.requested = 0
+
+    def leaf(self, value: T) -> T:
+        if type(value) is str:
+            return typing.cast(T, sys.intern(value))
+
+        try:
+            return self.leaves.setdefault(leaf_key(value), value)
+        except TypeError:
             return value
 
-        for name, value in self.data.items():
-            parsed[name] = recurse(value)
+    def key(self, value: typing.Any) -> typing.Hashable:
+        if type(value) is list:
+            return tuple(
+                item if type(item) in IDENTICAL else self.key(item) for item in value
+            )
 
-        parsed.update(
-            {
-                "lineno": self.lineno,
-                "end_lineno": self.end_lineno,
-                "col_offset": self.col_offset,
-                "end_col_offset": self.end_col_offset,
-            }
-        )
+        # Nodes and operators compare by identity, the children of a node are shared before
+        # it is, and operators are the singletons.
+        if isinstance(value, ast.AST):
+            return value
 
-        return self.ast(**parsed)
+        return leaf_key(value)
+
+    def node(self, node: Node[NodeT]) -> Node[NodeT]:
+        # Only for nodes without positions, which are equal when their fields are. Shared
+        # nodes can't be changed anymore, only replaced.
+        self.requested += 1
+        key = self.key
+
+        try:
+            return self.nodes.setdefault(
+                (
+                    node.ast,
+                    *[
+                        value if type(value) in IDENTICAL else key(value)
+                        for value in node.values
+                    ],
+                ),
+                node,
+            )
+        except TypeError:
+            return node
 
 
 class Module:
     def __init__(
-        self, body: tuple[Node[typing.Any]], type_ignores: list[typing.Any]
+        self, body: tuple[Node[typing.Any], ...], type_ignores: list[typing.Any]
     ) -> None:
         self.type_ignores = type_ignores
         self.body = body
 
-    def build(self) -> ast.Module:
-        body: list[ast.AST] = []
+    def build(self, lines: typing.Sequence[int] | None = None) -> ast.Module:
+        body: list[ast.stmt] = []
 
+        # `lines` holds the start and end line of every statement, one pair after another.
         for children in self.body:
             if isinstance(children, Node):
-                body.append(children.build())
+                if lines is None:
+                    body.append(children.build())
+                else:
+                    index = len(body) * 2
+                    body.append(children.build((lines[index], lines[index + 1])))
 
         return ast.Module(body=body, type_ignores=self.type_ignores)
 
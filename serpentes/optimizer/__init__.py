@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import ast
+import operator
+import typing
+import warnings
+
+from ..nodes import Module, Node, getfield, iterfields, kind, replace, singleton
+
+__all__ = ("optimize", "fold", "collapse", "LEVELS")
+
+LEVELS = (0, 1, 2)
+
+# Same limits CPython's own AST optimizer uses to avoid blowing up the constants.
+MAX_INT_BITS = 128
+MAX_STR_SIZE = 4096
+MAX_COLLECTION_SIZE = 256
+
+# Same threshold CPython uses to build lists and sets from a single constant.
+MIN_PACKED_SIZE = 3
+
+FOLDABLE = (int, float, complex, str, bytes, bool, type(None), tuple, frozenset)
+
+BINARY: dict[
+    type[ast.operator], typing.Callable[[typing.Any, typing.Any], typing.Any]
+] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.LShift: operator.lshift,
+    ast.RShift: operator.rshift,
+    ast.BitOr: operator.or_,
+    ast.BitXor: operator.xor,
+    ast.BitAnd: operator.and_,
+}
+
+UNARY: dict[type[ast.unaryop], typing.Callable[[typing.Any], typing.Any]] = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+    ast.Invert: operator.invert,
+    ast.Not: operator.not_,
+}
+
+# `is` and `is not` depend on object identity, so they are never folded.
+COMPARE: dict[type[ast.cmpop], typing.Callable[[typing.Any, typing.Any], typing.Any]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.In: lambda left, right: left in right,
+    ast.NotIn: lambda left, right: left not in right,
+}
+
+Folded: typing.TypeAlias = "Node[typing.Any] | ast.AST"
+
+LOAD = singleton(ast.Load)
+
+
+def isconstant(node: typing.Any) -> bool:
+    return (
+        isinstance(node, (Node, ast.AST))
+        and kind(node) is ast.Constant
+        and isinstance(getfield(node, "value"), FOLDABLE)
+    )
+
+
+def derive(node: Folded, new: type[ast.AST], **data: typing.Any) -> Folded:
+    if isinstance(node, Node):
+        return node.derive(new, **data)
+
+    return ast.copy_location(new(**data), node)
+
+
+def constant(node: Folded, value: typing.Any) -> Folded:
+    return derive(node, ast.Constant, value=value)
+
+
+def elements(node: Folded) -> list[typing.Any] | None:
+    items = getfield(node, "elts")
+
+    # A collapsed list or set unpacks one constant.
+    if len(items) == 1 and kind(items[0]) is ast.Starred:
+        value = getfield(items[0], "value")
+
+        if isconstant(value) and isinstance(getfield(value, "value"), (tuple, frozenset)):
+            return list(getfield(value, "value"))
+
+    if not all(isconstant(item) for item in items):
+        return None
+
+    return [getfield(item, "value") for item in items]
+
+
+def collapse(node: Folded) -> Folded:
+    container = kind(node)
+
+    if container not in {ast.List, ast.Tuple, ast.Set}:
+        return node
+
+    items = getfield(node, "elts")
+
+    if len(items) < MIN_PACKED_SIZE or not all(isconstant(item) for item in items):
+        return node
+
+    values = [getfield(item, "value") for item in items]
+
+    try:
+        packed = frozenset(values) if container is ast.Set else tuple(values)
+    except TypeError:
+        return node
+
+    if container is ast.Tuple:
+        return constant(node, packed)
+
+    # `[*(1, 2, 3)]` still builds a new list every time it runs.
+    starred = derive(node, ast.Starred, value=constant(node, packed), ctx=LOAD)
+    return replace(node, elts=[starred])
+
+
+def sized(value: typing.Any) -> bool:
+    if isinstance(value, bool):
+        return True
+
+    if isinstance(value, int):
+        return value.bit_length() <= MAX_INT_BITS
+
+    if isinstance(value, (str, bytes)):
+        return len(value) <= MAX_STR_SIZE
+
+    if isinstance(value, (tuple, frozenset)):
+        return len(value) <= MAX_COLLECTION_SIZE and all(sized(item) for item in value)
+
+    return True
+
+
+def bounded(op: ast.operator, left: typing.Any, right: typing.Any) -> bool:
+    # Checked before evaluating, so `"x" * 10 exp 9` never gets allocated.
+    if isinstance(op, ast.Mult):
+        for sequence, count in ((left, right), (right, left)):
+            if isinstance(sequence, (str, bytes, tuple)) and isinstance(count, int):
+                limit = (
+                    MAX_COLLECTION_SIZE if isinstance(sequence, tuple) else MAX_STR_SIZE
+                )
+                return count <= 0 or len(sequence) * count <= limit
+
+        if isinstance(left, int) and isinstance(right, int):
+            return left.bit_length() + right.bit_length() <= MAX_INT_BITS
+
+    elif isinstance(op, ast.Pow) and isinstance(left, int) and isinstance(right, int):
+        return right < 0 or left.bit_length() * right <= MAX_INT_BITS
+
+    elif isinstance(op, ast.LShift) and isinstance(left, int) and isinstance(right, int):
+        return right < 0 or left.bit_length() + right <= MAX_INT_BITS
+
+    # Like CPython, formatting is never folded, its widths can't be bounded up front.
+    elif isinstance(op, ast.Mod) and isinstance(left, (str, bytes)):
+        return False
+
+    return True
+
+
+def evaluate(function: typing.Callable[..., typing.Any], *args: typing.Any) -> typing.Any:
+    # Anything that raises or warns is left for runtime, so it behaves the same.
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        return function(*args)
+
+
+def pack(node: Folded, op: ast.cmpop) -> Folded:
+    if not isinstance(op, (ast.In, ast.NotIn)):
+        return node
+
+    container = kind(node)
+
+    if container not in {ast.List, ast.Tuple, ast.Set}:
+        return node
+
+    if (values := elements(node)) is None:
+        return node
+
+    try:
+        packed = frozenset(values) if container is ast.Set else tuple(values)
+    except TypeError:
+        return node
+
+    return constant(node, packed) if sized(packed) else node
+
+
+def simplify(node: Folded, level: int) -> Folded:
+    node_kind = kind(node)
+
+    if node_kind is ast.UnaryOp:
+        operand = getfield(node, "operand")
+        function = UNARY.get(type(getfield(node, "op")))
+
+        if function is None or not isconstant(operand):
+            return node
+
+        try:
+            value = evaluate(function, getfield(operand, "value"))
+        except Exception:
+            return node
+
+        return constant(node, value) if sized(value) else node
+
+    elif node_kind is ast.BinOp:
+        left, right, op = (
+            getfield(node, "left"),
+            getfield(node, "right"),
+            getfield(node, "op"),
+        )
+        function = BINARY.get(type(op))
+
+        if function is None or not (isconstant(left) and isconstant(right)):
+            return node
+
+        left, right = getfield(left, "value"), getfield(right, "value")
+
+        if not bounded(op, left, right):
+            return node
+
+        try:
+            value = evaluate(function, left, right)
+        except Exception:
+            return node
+
+        return constant(node, value) if sized(value) else node
+
+    elif node_kind is ast.BoolOp:
+        values = list(getfield(node, "values"))
+        short = isinstance(getfield(node, "op"), ast.Or)
+
+        # Leading constants either decide the result or can be dropped.
+        while values and isconstant(values[0]):
+            if bool(getfield(values[0], "value")) is short or len(values) == 1:
+                return values[0]
+
+            values.pop(0)
+
+        if len(values) == 1:
+            return values[0]
+
+        if len(values) != len(getfield(node, "values")):
+            return replace(node, values=values)
+
+        return node
+
+    elif node_kind is ast.Compare:
+        ops = getfield(node, "ops")
+        comparators = getfield(node, "comparators")
+
+        if level >= 2:
+            packed = [pack(item, op) for item, op in zip(comparators, ops)]
+
+            if any(new is not old for new, old in zip(packed, comparators)):
+                node, comparators = replace(node, comparators=packed), packed
+
+        left = getfield(node, "left")
+        functions = [COMPARE.get(type(op)) for op in ops]
+
+        if None in functions or not all(map(isconstant, [left, *comparators])):
+            return node
+
+        current = getfield(left, "value")
+
+        try:
+            for function, comparator in zip(functions, comparators):
+                value = getfield(comparator, "value")
+
+                if not evaluate(typing.cast(typing.Callable, function), current, value):
+                    return constant(node, False)
+
+                current = value
+        except Exception:
+            return node
+
+        return constant(node, True)
+
+    elif node_kind is ast.IfExp:
+        test = getfield(node, "test")
+
+        if isconstant(test):
+            return getfield(node, "body" if getfield(test, "value") else "orelse")
+
+    elif node_kind in {ast.List, ast.Tuple, ast.Set}:
+        # Elements folded into constants may complete a container the parser couldn't.
+        return collapse(node)
+
+    return node
+
+
+def fold(root: Folded, level: int = 1) -> Folded:
+    order: list[Folded] = []
+    stack: list[Folded] = [root]
+
+    while stack:
+        node = stack.pop()
+        order.append(node)
+
+        for _, value in iterfields(node):
+            if isinstance(value, (Node, ast.AST)):
+                stack.append(value)
+
+            elif isinstance(value, list):
+                stack.extend(item for item in value if isinstance(item, (Node, ast.AST)))
+
+    replaced: dict[int, Folded] = {}
+
+    # Trees may share nodes with others, see `Interner`, so nodes are never changed in
+    # place. One with a folded child is replaced by a copy, like the child itself.
+    for node in reversed(order):
+        fields: dict[str, typing.Any] = {}
+
+        for name, value in iterfields(node):
+            if isinstance(value, list):
+                if any(id(item) in replaced for item in value):
+                    fields[name] = [replaced.get(id(item), item) for item in value]
+
+            elif isinstance(value, (Node, ast.AST)) and id(value) in replaced:
+                fields[name] = replaced[id(value)]
+
+        copied = replace(node, **fields) if fields else node
+
+        if (result := simplify(copied, level)) is not node:
+            replaced[id(node)] = result
+
+    return replaced.get(id(root), root)
+
+
+def optimize(module: Module | ast.Module, level: int = 1) -> Module | ast.Module:
+    if level not in LEVELS:
+        raise ValueError(f"Unknown optimization level: {level}")
+
+    if level == 0:
+        return module
+
+    if isinstance(module, ast.Module):
+        body = [
+            typing.cast(ast.stmt, fold(statement, level)) for statement in module.body
+        ]
+        return replace(module, body=body)
+
+    body = tuple(fold(item, level) if item is not None else None for item in module.body)
+    return Module(body=body, type_ignores=module.type_ignores)  # pyright: ignore
@@ -1,22 +1,42 @@
 from __future__ import annotations
 
 import ast
+import hashlib
+import io
+import os
+import pickle
+import types
 import typing
+import warnings
+from functools import partial
 
-from lark import Token, Transformer, Tree, v_args
-from lark.tree import Meta
-
+from ..cache import cache_dir, write_atomic
+from ..lexer import TokenStream, tokenize
+from ..metrics import source as count_source
 from ..nodes import (
     Comprehensions,
     Controlflow,
     Expressions,
+    Interner,
     Literals,
     Module,
     Node,
     Objects,
     Subscripting,
     Variables,
+    getfield,
+    kind,
+    replace,
+    singleton,
 )
+from ..optimizer import collapse
+from ..profiling import stage
+
+if typing.TYPE_CHECKING:
+    from lark import Lark
+
+T = typing.TypeVar("T")
+Rules = typing.TypeVar("Rules", bound=type)
 
 Context: typing.TypeAlias = ast.Load | ast.Store | ast.Del
 Containers: typing.TypeAlias = (
@@ -48,44 +68,447 @@ DictComp: typing.TypeAlias = tuple[
     tuple[Node[typing.Any], ...], list[Node[type[ast.comprehension]]]
 ]
 
+__all__ = (
+    "AstTransformer",
+    "LineTransformer",
+    "GRAMMARS",
+    "PARSERS",
+    "ParseError",
+    "SrpParser",
+    "SrpTransformer",
+    "build_parser",
+    "get_parser",
+    "isnode",
+    "load_grammar",
+    "parser_key",
+    "parser_options",
+)
+
 COMP_OPERATORS: dict[str, CompOp] = {
-    "==": ast.Eq(),
-    "!=": ast.NotEq(),
-    "<": ast.Lt(),
-    "<=": ast.LtE(),
-    ">": ast.Gt(),
-    ">=": ast.GtE(),
-    "is": ast.Is(),
-    "is not": ast.IsNot(),
-    "in": ast.In(),
-    "not in": ast.NotIn(),
+    "==": singleton(ast.Eq),
+    "!=": singleton(ast.NotEq),
+    "<": singleton(ast.Lt),
+    "<=": singleton(ast.LtE),
+    ">": singleton(ast.Gt),
+    ">=": singleton(ast.GtE),
+    "is": singleton(ast.Is),
+    "is not": singleton(ast.IsNot),
+    "in": singleton(ast.In),
+    "not in": singleton(ast.NotIn),
+}
+
+MUL_OPERATORS: dict[str, MulOp] = {
+    "*": singleton(ast.Mult),
+    "/": singleton(ast.Div),
+    "%": singleton(ast.Mod),
+    "exp": singleton(ast.Pow),
+    "@": singleton(ast.MatMult),
 }
 
+BIT_OPERATORS: dict[str, BitOp] = {
+    "<<": singleton(ast.LShift),
+    ">>": singleton(ast.RShift),
+    "|": singleton(ast.BitOr),
+    "^": singleton(ast.BitXor),
+    "&": singleton(ast.BitAnd),
+}
+
+UNARY_OPERATORS: dict[str, UnaryOp] = {
+    "[+": singleton(ast.UAdd),
+    "[-": singleton(ast.USub),
+    "[~": singleton(ast.Invert),
+    "[not": singleton(ast.Not),
+}
+
+LOAD = singleton(ast.Load)
+STORE = singleton(ast.Store)
+
+
+GRAMMARS: dict[str, str] = {"lalr": "grammar_lalr.lark", "earley": "grammar.lark"}
+PARSERS: dict[str, Lark] = {}
+
+# The statement `SrpParser.parse` puts in front of text which doesn't start a module.
+PRELUDE = "none"
+
+GENERATED = os.path.join(os.path.dirname(__file__), "_generated.py")
+
 
 def isnode(item: typing.Any) -> bool:
-    return isinstance(item, Node)
+    return isinstance(item, (Node, ast.expr))
+
+
+def standalone_tree(tree: typing.Any) -> Tree:
+    order: list[typing.Any] = []
+    stack: list[typing.Any] = [tree]
+
+    # Parents always come before their children, so the reversed walk is post-order.
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        stack.extend(child for child in node.children if hasattr(child, "children"))
+
+    built: dict[int, Tree] = {}
+
+    for node in reversed(order):
+        children = [
+            built[id(child)] if hasattr(child, "children") else child
+            for child in node.children
+        ]
+        built[id(node)] = Tree(node.data, children, node.meta)
+
+    return built[id(tree)]
+
+
+def shift(tree: Tree[Token], lines: int, chars: int) -> None:
+    # Moves every position of the tree back by as many lines and characters.
+    stack: list[typing.Any] = [tree]
+
+    while stack:
+        node = stack.pop()
+
+        # Tokens of Earley may be lark's own, so they aren't told apart by their type.
+        if hasattr(node, "children"):
+            stack.extend(node.children)
+            items = [] if node.meta.empty else [node.meta]
+        elif hasattr(node, "end_pos"):
+            items = [node]
+        else:
+            continue
+
+        for item in items:
+            item.line -= lines
+            item.end_line -= lines
+            item.start_pos -= chars
+            item.end_pos -= chars
+
+
+def load_grammar(parser: str = "lalr") -> str:
+    with open(os.path.join(os.path.dirname(__file__), GRAMMARS[parser]), "r") as fp:
+        return fp.read()
+
+
+def parser_options(parser: str = "lalr") -> dict[str, typing.Any]:
+    # Only the LALR grammar tells statements after the first one apart, see `rest` there.
+    start = ["module", "rest"] if parser == "lalr" else "module"
+    return {"start": start, "parser": parser, "propagate_positions": True}
+
+
+def build_parser(parser: str = "lalr", **options: typing.Any) -> Lark:
+    from lark import Lark
+
+    return Lark(load_grammar(parser), **{**parser_options(parser), **options})
+
+
+def lexer_options(parser: str = "lalr") -> dict[str, typing.Any]:
+    if not LEXER:
+        return {}
+
+    from ..lexer import SrpLexer
+
+    # LALR keeps its per state terminals by taking the place of the contextual lexer.
+    # Earley stays on its dynamic lexer, which decides how ambiguous lines group.
+    if parser == "lalr":
+        return {"_plugins": {"ContextualLexer": SrpLexer}}
+
+    return {}
+
+
+def parser_key(parser: str = "lalr") -> str:
+    import lark
+
+    digest = hashlib.sha256(load_grammar(parser).encode())
+    digest.update(lark.__version__.encode())
+    digest.update(repr(sorted(parser_options(parser).items())).encode())
+
+    return digest.hexdigest()
+
+
+def standalone_key() -> str:
+    # The generated module carries its own copy of lark, so its version doesn't matter.
+    digest = hashlib.sha256(load_grammar("lalr").encode())
+    digest.update(repr(sorted(parser_options("lalr").items())).encode())
+
+    return digest.hexdigest()
+
+
+def load_standalone() -> types.ModuleType | None:
+    if os.environ.get("SERPENTES_STANDALONE") == "0":
+        return None
+
+    try:
+        from . import _generated
+    except ImportError:
+        return None
+
+    if getattr(_generated, "GRAMMAR_KEY", None) != standalone_key():
+        warnings.warn(
+            f"{GENERATED} is out of date with {GRAMMARS['lalr']}, falling back to lark."
+            " Regenerate it with `python scripts/standalone.py`.",
+            RuntimeWarning,
+        )
+        return None
+
+    return _generated
+
+
+STANDALONE = load_standalone()
+
+# `SERPENTES_LEXER=lark` goes back to the lexers lark builds from the grammars.
+LEXER = os.environ.get("SERPENTES_LEXER") != "lark"
+
+# Trees and tokens have to come from the same lark as the parser which builds them. Type
+# checkers only follow lark, the standalone module is a copy of it.
+if STANDALONE is not None and not typing.TYPE_CHECKING:
+    from ._generated import (
+        InteractiveParser,
+        LexerState,
+        LexerThread,
+        LineCounter,
+        Meta,
+        TextSlice,
+        Token,
+        Transformer_NonRecursive,
+        Tree,
+        UnexpectedCharacters,
+        UnexpectedInput,
+        v_args,
+    )
+else:
+    from lark import (
+        Token,
+        Transformer_NonRecursive,
+        Tree,
+        UnexpectedCharacters,
+        UnexpectedInput,
+        v_args,
+    )
+    from lark.lexer import LexerState, LexerThread, LineCounter
+    from lark.parsers.lalr_interactive_parser import InteractiveParser
+    from lark.tree import Meta
+    from lark.utils import TextSlice
 
 
-@v_args(inline=True, meta=True)
-class SrpTransformer(Transformer):
+def rules(cls: Rules) -> Rules:
+    # `v_args` is typed for functions, type checkers lose the class it decorates.
+    return typing.cast(Rules, v_args(inline=True, meta=True)(cls))
+
+
+def get_parser(parser: str = "lalr", positions: bool = True) -> Lark:
+    key = parser if positions else f"{parser}:lines"
+
+    if cached := PARSERS.get(key):
+        return cached
+
+    with stage("grammar", parser=parser) as details:
+        PARSERS[key] = load_parser(parser, details, positions)
+
+    return PARSERS[key]
+
+
+def load_parser(
+    parser: str, details: dict[str, typing.Any], positions: bool = True
+) -> Lark:
+    details["cached"] = False
+    details["standalone"] = False
+
+    # Positions don't change the tables, so they can be turned off when loading too.
+    options = lexer_options(parser)
+
+    if not positions:
+        options["propagate_positions"] = False
+
+    if parser != "lalr":
+        return build_parser(parser, **options)
+
+    if STANDALONE is not None:
+        details["standalone"] = True
+        return STANDALONE.Lark_StandAlone(**options)
+
+    # Lark pickles the lexer plugin and positions along with the tables, so each way of
+    # building the parser gets its own file.
+    variant = parser + ("" if positions else "-lines") + ("" if LEXER else "-lark")
+    path = cache_dir("parsers", f"{variant}-{parser_key(parser)}.lark")
+
+    from lark import Lark
+
+    try:
+        with open(path, "rb") as fp:
+            loaded = Lark.load(fp)
+
+    except (OSError, EOFError, AttributeError, ImportError, pickle.UnpicklingError):
+        loaded = build_parser(parser, **options)
+
+        try:
+            data = io.BytesIO()
+            loaded.save(data)
+            write_atomic(path, data.getvalue())
+        except OSError:
+            pass
+
+    else:
+        details["cached"] = True
+
+    return loaded
+
+
+# Input neither parser takes. Lark's own errors can't be unpickled and may come from the
+# standalone module, callers only ever see this one.
+class ParseError(SyntaxError):
+    def located(self, filename: str | None = None, line: int = 1) -> ParseError:
+        # Pickles only keep the arguments of an exception, so the file and the line the text
+        # starts at go into a new one.
+        lineno = None if self.lineno is None else self.lineno + line - 1
+        location = (filename or self.filename, lineno, self.offset, self.text)
+
+        return ParseError(self.msg, location)
+
+
+class SrpParser:
+    def __init__(
+        self, parser: str = "lalr", shared: bool = True, positions: bool = True
+    ) -> None:
+        if parser not in GRAMMARS:
+            raise ValueError(f"Unknown parser: {parser}")
+
+        self.parser = parser
+        self.positions = positions
+
+        # Without `shared`, the lark parsers belong to this instance alone.
+        self.instances: dict[str, Lark] | None = None if shared else {}
+
+    def lark(self, parser: str) -> Lark:
+        if self.instances is None:
+            return get_parser(parser, self.positions)
+
+        if (instance := self.instances.get(parser)) is None:
+            with stage("grammar", parser=parser) as details:
+                instance = self.instances[parser] = load_parser(
+                    parser, details, self.positions
+                )
+
+        return instance
+
+    def warm(self) -> None:
+        self.lark(self.parser)
+
+    def parse(self, text: str, first: bool = True) -> Tree[Token]:
+        # Without `first` the text comes after a statement of its own, Earley groups those
+        # apart from the first statement of a module.
+        source: str | TokenStream = text
+        count_source(text)
+
+        if self.parser == "lalr":
+            if LEXER:
+                with stage("lex", size=len(text)):
+                    source = tokenize(text)
+
+            # Whatever the LALR grammar takes, Earley groups the same way. Only what it
+            # rejects is left to Earley.
+            try:
+                return self.run("lalr", source, "module" if first else "rest")
+            except UnexpectedInput:
+                pass
+
+        from lark import UnexpectedInput as EarleyInput
+
+        try:
+            return self.earley(text, first)
+        except EarleyInput as error:
+            # Earley's errors at the end of the input have no position, the others count
+            # the line put in front of statements after the first.
+            line, column = (error.line, error.column) if error.line > 0 else (None, None)
+
+            if line is not None and not first:
+                line -= 1
+
+            raise ParseError(str(error), (None, line, column, None)) from None
+
+    def earley(self, text: str, first: bool = True) -> Tree[Token]:
+        if first:
+            return self.run("earley", text)
+
+        # Earley has no rule for those statements, so one is put in front of them which
+        # nothing after it can continue, on a line of its own.
+        tree = self.run("earley", f"{PRELUDE}\n{text}")
+        shift(tree, 1, len(PRELUDE) + 1)
+
+        return Tree("rest", tree.children[1:], tree.meta)
+
+    def run(
+        self, parser: str, text: str | TokenStream, start: str = "module"
+    ) -> Tree[Token]:
+        lark_parser = self.lark(parser)
+        size = len(text.text) if isinstance(text, TokenStream) else len(text)
+
+        with stage("parse", parser=parser, size=size):
+            tree = (
+                lark_parser.parse(text, start)
+                if parser == "lalr"
+                else lark_parser.parse(text)
+            )
+
+        # Earley always comes from lark, its trees are rebuilt for the standalone transformer.
+        if STANDALONE is not None and parser != "lalr":
+            return standalone_tree(tree)
+
+        return tree
+
+
+@rules
+class SrpTransformer(Transformer_NonRecursive):
+    def __init__(self, visit_tokens: bool = True, optimize: int = 0) -> None:
+        super().__init__(visit_tokens)
+        self.interner = Interner()
+        self.optimize = optimize
+
+    def transform(self, tree: Tree[Token]) -> typing.Any:
+        # Values are only shared within one tree.
+        self.interner = Interner()
+
+        # Trees of lark's own parsers aren't the standalone module's, they are rebuilt.
+        if not isinstance(tree, Tree) and hasattr(tree, "children"):
+            tree = standalone_tree(tree)
+
+        return super().transform(tree)
+
+    def create(
+        self, node: partial[Node[typing.Any]], meta: Meta, **data: typing.Any
+    ) -> typing.Any:
+        return node(meta=meta, **data)
+
+    def share(self, node: typing.Any) -> typing.Any:
+        return node
+
+    def store(self, node: T) -> T:
+        # Targets are copies, the same node may be loaded elsewhere.
+        return self.share(replace(node, ctx=STORE))
+
     def module(self, _: Meta, *items: Node[typing.Any]) -> Module:
         return Module(body=items, type_ignores=[])
 
+    rest = module
+
     def expr_statement(self, meta: Meta, expr: Node[typing.Any]) -> Node[type[ast.Expr]]:
-        return Expressions.Expr(meta=meta, value=expr)
+        return self.create(Expressions.Expr, meta, value=expr)
 
     def list_comp(self, meta: Meta, comp: CompExpr) -> Node[type[ast.ListComp]]:
-        return Comprehensions.ListComp(meta=meta, elt=comp[0], generators=comp[1])
+        return self.create(Comprehensions.ListComp, meta, elt=comp[0], generators=comp[1])
 
     def gen_expr(self, meta: Meta, comp: CompExpr) -> Node[type[ast.GeneratorExp]]:
-        return Comprehensions.GeneratorExp(meta=meta, elt=comp[0], generators=comp[1])
+        return self.create(
+            Comprehensions.GeneratorExp, meta, elt=comp[0], generators=comp[1]
+        )
 
     def set_expr(self, meta: Meta, comp: CompExpr) -> Node[type[ast.SetComp]]:
-        return Comprehensions.SetComp(meta=meta, elt=comp[0], generators=comp[1])
+        return self.create(Comprehensions.SetComp, meta, elt=comp[0], generators=comp[1])
 
     def dict_expr(self, meta: Meta, comp: DictComp):
-        return Comprehensions.DictComp(
-            meta=meta, key=comp[0][0], value=comp[0][1], generators=comp[1]
+        return self.create(
+            Comprehensions.DictComp,
+            meta,
+            key=comp[0][0],
+            value=comp[0][1],
+            generators=comp[1],
         )
 
     def comp_expr(
@@ -106,22 +529,29 @@ class SrpTransformer(Transformer):
         iterator: Node[typing.Any],
         ifs: Node[typing.Any],
     ) -> list[Node[type[ast.comprehension]]]:
-        if ctx := target.data.get("ctx"):
+        if ctx := getfield(target, "ctx"):
             if not isinstance(ctx, ast.Store):
-                target.data["ctx"] = ast.Store()
+                target = self.store(target)
+
+        if "elts" in kind(target)._fields:
+            elements: list[Node[typing.Any]] = []
+
+            for item in getfield(target, "elts"):
+                if kind(item) is ast.Name:
+                    item = self.store(item)
 
-        if "elts" in target.ast._fields:
-            for item in target.data["elts"]:
-                if item.ast is ast.Name:
-                    item.data["ctx"] = ast.Store()
+                elif kind(item) is ast.Attribute:
+                    item = replace(item, value=self.store(getfield(item, "value")))
+                    item = self.store(item)
 
-                elif item.ast is ast.Attribute:
-                    item.data["value"].data["ctx"] = ast.Store()
-                    item.data["ctx"] = ast.Store()
+                elements.append(item)
+
+            target = self.share(replace(target, elts=elements))
 
         return [
-            Comprehensions.Comphrehension(
-                meta=meta,
+            self.create(
+                Comprehensions.Comphrehension,
+                meta,
                 target=target,
                 iter=iterator,
                 ifs=[ifs] if ifs is not None else [],
@@ -134,9 +564,11 @@ class SrpTransformer(Transformer):
         meta: Meta,
         target: Node[typing.Any],
         slice: Node[typing.Any],
-        ctx: Context = ast.Load(),
+        ctx: Context = LOAD,
     ) -> Node[type[ast.Subscript]]:
-        return Subscripting.Subscript(meta=meta, value=target, slice=slice, ctx=ctx)
+        return self.create(
+            Subscripting.Subscript, meta, value=target, slice=slice, ctx=ctx
+        )
 
     def slice(self, meta: Meta, *items: Node[typing.Any]):
         lower, upper, step = items
@@ -144,7 +576,7 @@ class SrpTransformer(Transformer):
         if lower is not None and step is None and upper is None:
             return lower
 
-        return Subscripting.Slice(meta=meta, lower=lower, upper=upper, step=step)
+        return self.create(Subscripting.Slice, meta, lower=lower, upper=upper, step=step)
 
     def assign_expr(
         self,
@@ -152,14 +584,16 @@ class SrpTransformer(Transformer):
         target: Node[type[ast.Name | ast.Attribute]],
         value: Node[typing.Any],
     ) -> Node[type[ast.NamedExpr]]:
-        if ctx := target.data.get("ctx"):
+        if ctx := getfield(target, "ctx"):
             if not isinstance(ctx, ast.Store):
-                target.data["ctx"] = ast.Store()
+                target = self.store(target)
 
-        return Expressions.NamedExpr(meta=meta, target=target, value=value)
+        return self.create(Expressions.NamedExpr, meta, target=target, value=value)
 
     def if_expr(self, meta: Meta, *items: Node[typing.Any]) -> Node[type[ast.IfExp]]:
-        return Expressions.IfExp(meta=meta, test=items[1], body=items[0], orelse=items[2])
+        return self.create(
+            Expressions.IfExp, meta, test=items[1], body=items[0], orelse=items[2]
+        )
 
     def sum_atom(self, _: Meta, atom: Node[type[ast.BinOp]]) -> Node[type[ast.BinOp]]:
         return atom
@@ -175,7 +609,7 @@ class SrpTransformer(Transformer):
 
         if isinstance(arguments, list):
             for argument in arguments:
-                if argument.ast is ast.keyword:
+                if kind(argument) is ast.keyword:
                     keywords.append(argument)
 
                 else:
@@ -185,16 +619,18 @@ class SrpTransformer(Transformer):
             if arguments is None:
                 pass
 
-            elif arguments.ast is not ast.keyword:
+            elif kind(arguments) is not ast.keyword:
                 passed = [arguments]
 
-            elif arguments.ast is ast.keyword:
+            elif kind(arguments) is ast.keyword:
                 keywords = [arguments]
 
-        return Expressions.Call(meta=meta, func=func, args=passed, keywords=keywords)
+        return self.create(
+            Expressions.Call, meta, func=func, args=passed, keywords=keywords
+        )
 
     def call_kwargs(self, meta: Meta, items: Node[typing.Any]) -> Node[type[ast.keyword]]:
-        return Expressions.Keyword(meta=meta, arg=None, value=items)
+        return self.create(Expressions.Keyword, meta, arg=None, value=items)
 
     def arguments(self, _: Meta, *items: Node[typing.Any]) -> list[Node[typing.Any]]:
         return list(items)
@@ -203,33 +639,33 @@ class SrpTransformer(Transformer):
         return item
 
     def keyword(self, meta: Meta, *argument: Node[typing.Any]) -> Node[typing.Any]:
-        return Expressions.Keyword(
-            meta=meta, arg=argument[0].data["id"], value=argument[1]
+        return self.create(
+            Expressions.Keyword, meta, arg=getfield(argument[0], "id"), value=argument[1]
         )
 
     def attr(
-        self, meta: Meta, first: Node[type[ast.Name]], *items, ctx: Context = ast.Load()
+        self, meta: Meta, first: Node[type[ast.Name]], *items, ctx: Context = LOAD
     ) -> Node[type[ast.Attribute]]:
         listed = list(items)
 
         def parse(
             attr: Node[type[ast.Name] | type[ast.Attribute]],
         ) -> str | Node[type[ast.Attribute]]:
-            if id := attr.data.get("id"):
+            if id := getfield(attr, "id"):
                 return id
 
-            elif attribute := attr.data.get("attr"):
+            elif attribute := getfield(attr, "attr"):
                 return attribute
 
             raise ValueError("Unknown type.")
 
-        attribute = Expressions.Attribute(
-            meta=meta, value=first, attr=parse(listed.pop(0)), ctx=ctx
+        attribute = self.create(
+            Expressions.Attribute, meta, value=first, attr=parse(listed.pop(0)), ctx=ctx
         )
 
         for other in listed:
-            attribute = Expressions.Attribute(
-                meta=meta, value=attribute, attr=parse(other), ctx=ctx
+            attribute = self.create(
+                Expressions.Attribute, meta, value=attribute, attr=parse(other), ctx=ctx
             )
 
         return attribute
@@ -244,14 +680,14 @@ class SrpTransformer(Transformer):
         comparators: list[Node[typing.Any]] = []
 
         for potential in listed:
-            if isinstance(potential, Node):
-                comparators.append(potential)
+            if isinstance(potential, ast.cmpop):
+                operators.append(potential)
                 continue
 
-            operators.append(potential)
+            comparators.append(potential)
 
-        return Expressions.Compare(
-            meta=meta, left=left, ops=operators, comparators=comparators
+        return self.create(
+            Expressions.Compare, meta, left=left, ops=operators, comparators=comparators
         )
 
     def comp_op(self, _: Meta, token: Token) -> CompOp:
@@ -269,82 +705,62 @@ class SrpTransformer(Transformer):
             raise ValueError("Unknown bool operator.")
 
         items.pop(items.index(op))
-        return Expressions.BoolOp(meta=meta, op=op, values=items)
+        return self.create(Expressions.BoolOp, meta, op=op, values=items)
 
     def bool_op(self, _: Meta, token: Token) -> ast.Or | ast.And:
-        return ast.Or() if token.value == "or" else ast.And()
+        return singleton(ast.Or) if token.value == "or" else singleton(ast.And)
 
     def product(
         self,
         meta: Meta,
         *operation: tuple[Node[typing.Any], MulOp | ast.Add | ast.Sub, Node[typing.Any]],
     ) -> Node[type[ast.BinOp]]:
-        return Expressions.BinOp(
-            meta=meta, left=operation[0], op=operation[1], right=operation[2]
+        return self.create(
+            Expressions.BinOp,
+            meta,
+            left=operation[0],
+            op=operation[1],
+            right=operation[2],
         )
 
     sum = product
 
     def add_op(self, _: Meta, token: Token) -> ast.Add | ast.Sub:
-        return ast.Add() if token.value == "+" else ast.Sub()
+        return singleton(ast.Add) if token.value == "+" else singleton(ast.Sub)
 
     def mul_op(self, _: Meta, token: Token) -> MulOp:
-        match token.value:
-            case "*":
-                return ast.Mult()
-            case "/":
-                return ast.Div()
-            case "%":
-                return ast.Mod()
-            case "exp":
-                return ast.Pow()
-            case "@":
-                return ast.MatMult()
-
-            case _:
-                raise ValueError("Unknown mult operator.")
+        if (op := MUL_OPERATORS.get(token.value)) is None:
+            raise ValueError("Unknown mult operator.")
+
+        return op
 
     def bit_expr(
         self, meta: Meta, *operation: tuple[Node[typing.Any], BitOp, Node[typing.Any]]
     ) -> Node[type[ast.BinOp]]:
-        return Expressions.BinOp(
-            meta=meta, left=operation[0], op=operation[1], right=operation[2]
+        return self.create(
+            Expressions.BinOp,
+            meta,
+            left=operation[0],
+            op=operation[1],
+            right=operation[2],
         )
 
     def bit_op(self, _: Meta, token: Token) -> BitOp:
-        match token.value:
-            case "<<":
-                return ast.LShift()
-            case ">>":
-                return ast.RShift()
-            case "|":
-                return ast.BitOr()
-            case "^":
-                return ast.BitXor()
-            case "&":
-                return ast.BitAnd()
-
-            case _:
-                raise ValueError("Unknown bit operator.")
+        if (op := BIT_OPERATORS.get(token.value)) is None:
+            raise ValueError("Unknown bit operator.")
+
+        return op
 
     def unary_expr(
         self, meta: Meta, op: UnaryOp, oper: Node[typing.Any]
     ) -> Node[type[ast.UnaryOp]]:
-        return Expressions.UnaryOp(meta=meta, op=op, operand=oper)
+        return self.create(Expressions.UnaryOp, meta, op=op, operand=oper)
 
     def unary_operator(self, _: Meta, token: Token) -> UnaryOp:
-        match token.value:
-            case "[+":
-                return ast.UAdd()
-            case "[-":
-                return ast.USub()
-            case "[~":
-                return ast.Invert()
-            case "[not":
-                return ast.Not()
-
-            case _:
-                raise ValueError("Unknown unary operator.")
+        if (op := UNARY_OPERATORS.get(token.value)) is None:
+            raise ValueError("Unknown unary operator.")
+
+        return op
 
     unary_add = unary_operator
     unary_neg = unary_operator
@@ -352,21 +768,19 @@ class SrpTransformer(Transformer):
     unary_not = unary_operator
 
     def star_expr(
-        self, meta: Meta, expr: Node[typing.Any], ctx: Context = ast.Load()
+        self, meta: Meta, expr: Node[typing.Any], ctx: Context = LOAD
     ) -> Node[type[ast.Starred]]:
-        return Variables.Starred(meta=meta, value=expr, ctx=ctx)
+        return self.create(Variables.Starred, meta, value=expr, ctx=ctx)
 
-    def name(
-        self, meta: Meta, token: Token, ctx: Context = ast.Load()
-    ) -> Node[type[ast.Name]]:
-        return Variables.Name(meta=meta, id=token.value, ctx=ctx)
+    def name(self, meta: Meta, token: Token, ctx: Context = LOAD) -> Node[type[ast.Name]]:
+        return self.create(
+            Variables.Name, meta, id=self.interner.leaf(token.value), ctx=ctx
+        )
 
     def variable(self, _: Meta, item: Node[type[ast.Name]]) -> Node[type[ast.Name]]:
         return item
 
-    def parse_container(
-        self, meta: Meta, items: Tree, ctx: Context = ast.Load()
-    ) -> Containers:
+    def parse_container(self, meta: Meta, items: Tree, ctx: Context = LOAD) -> Containers:
         if items.data == "dict":
             keys: list[Node[typing.Any]] = []
             values: list[Node[typing.Any]] = []
@@ -375,18 +789,20 @@ class SrpTransformer(Transformer):
                 keys.append(pair[0])
                 values.append(pair[1])
 
-            return Literals.Dict(meta=meta, keys=keys, values=values)
+            return self.create(Literals.Dict, meta, keys=keys, values=values)
 
         types = {"list": Literals.List, "tuple": Literals.Tuple, "set": Literals.Set}
 
-        elements: list[Node] = []
-        for element in items.scan_values(isnode):
-            elements.append(element)
+        # The elements are already transformed, so only the direct children are needed.
+        elements = [element for element in items.children if isnode(element)]
 
         node = types[items.data]
         kwargs = {"ctx": ctx} if not node is Literals.Set else {}
 
-        return node(meta=meta, elts=elements, **kwargs)
+        container = self.create(node, meta, elts=elements, **kwargs)
+
+        # Packing constants is an optimization, without one every element is kept.
+        return self.share(collapse(container) if self.optimize else container)
 
     def key_value(self, _: Meta, key, value) -> tuple[Node[typing.Any], Node[typing.Any]]:
         return key, value
@@ -404,11 +820,9 @@ class SrpTransformer(Transformer):
     ) -> Node[type[ast.Constant]]:
         values: dict[str, bool | None] = {"true": True, "false": False}
 
-        if isinstance(item, Token):
-            return Literals.Constant(
-                value=values.get(item.value),
-                meta=meta,
-            )
+        # Earley tokens come from lark even when the standalone parser is in use.
+        if isinstance(item, str):
+            return self.create(Literals.Constant, meta, value=values.get(item.value))
 
         elif isinstance(item, Tree):
             token: Token = typing.cast(Token, item.children[0])
@@ -428,7 +842,7 @@ class SrpTransformer(Transformer):
             elif token.type == "python__FLOAT_NUMBER":
                 value = int(float(token.value))
 
-            return Literals.Constant(value=value, meta=meta)
+            return self.create(Literals.Constant, meta, value=self.interner.leaf(value))
 
         raise ValueError("Unknown type.")
 
@@ -443,4 +857,39 @@ class SrpTransformer(Transformer):
         return string
 
     def string(self, meta: Meta, token: Token) -> Node[type[ast.Constant]]:
-        return Literals.Constant(value=token.value.replace('"', ""), meta=meta)
+        value = self.interner.leaf(token.value.replace('"', ""))
+        return self.create(Literals.Constant, meta, value=value)
+
+
+@rules
+class LineTransformer(SrpTransformer):
+    # Meant for trees parsed without positions, see `serpentes.linetable`. Equal subtrees
+    # are the same node, they only get their lines once built.
+    def create(
+        self, node: partial[Node[typing.Any]], meta: Meta, **data: typing.Any
+    ) -> typing.Any:
+        return self.interner.node(node(meta=None, **data))
+
+    def share(self, node: typing.Any) -> typing.Any:
+        return self.interner.node(node) if isinstance(node, Node) else node
+
+
+@rules
+class AstTransformer(SrpTransformer):
+    def create(
+        self, node: partial[Node[typing.Any]], meta: Meta, **data: typing.Any
+    ) -> typing.Any:
+        return node.keywords["ast"](
+            **data,
+            lineno=meta.line,
+            end_lineno=meta.end_line,
+            col_offset=meta.column,
+            end_col_offset=meta.end_column,
+        )
+
+    def module(self, _: Meta, *items: typing.Any) -> typing.Any:
+        return ast.Module(
+            body=[item for item in items if item is not None], type_ignores=[]
+        )
+
+    rest = module
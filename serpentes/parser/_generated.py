@@ -0,0 +1,3578 @@
+# The file was automatically generated by Lark v1.3.1
+__version__ = "1.3.1"
+
+#
+#
+#   Lark Stand-alone Generator Tool
+# ----------------------------------
+# Generates a stand-alone LALR(1) parser
+#
+# Git:    https://github.com/erezsh/lark
+# Author: Erez Shinan (erezshin@gmail.com)
+#
+#
+#    >>> LICENSE
+#
+#    This tool and its generated code use a separate license from Lark,
+#    and are subject to the terms of the Mozilla Public License, v. 2.0.
+#    If a copy of the MPL was not distributed with this
+#    file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#    If you wish to purchase a commercial license for this tool and its
+#    generated code, you may contact me via email or otherwise.
+#
+#    If MPL2 is incompatible with your free or open-source project,
+#    contact me and we'll work it out.
+#
+#
+
+from copy import deepcopy
+from abc import ABC, abstractmethod
+from types import ModuleType
+from typing import (
+    TypeVar, Generic, Type, Tuple, List, Dict, Iterator, Collection, Callable, Optional, FrozenSet, Any,
+    Union, Iterable, IO, TYPE_CHECKING, overload, Sequence,
+    Pattern as REPattern, ClassVar, Set, Mapping
+)
+
+
+class LarkError(Exception):
+    pass
+
+
+class ConfigurationError(LarkError, ValueError):
+    pass
+
+
+def assert_config(value, options: Collection, msg='Got %r, expected one of %s'):
+    if value not in options:
+        raise ConfigurationError(msg % (value, options))
+
+
+class GrammarError(LarkError):
+    pass
+
+
+class ParseError(LarkError):
+    pass
+
+
+class LexError(LarkError):
+    pass
+
+T = TypeVar('T')
+
+class UnexpectedInput(LarkError):
+    #--
+    line: int
+    column: int
+    pos_in_stream = None
+    state: Any
+    _terminals_by_name = None
+    interactive_parser: 'InteractiveParser'
+
+    def get_context(self, text: str, span: int=40) -> str:
+        #--
+        pos = self.pos_in_stream or 0
+        start = max(pos - span, 0)
+        end = pos + span
+        if not isinstance(text, bytes):
+            before = text[start:pos].rsplit('\n', 1)[-1]
+            after = text[pos:end].split('\n', 1)[0]
+            return before + after + '\n' + ' ' * len(before.expandtabs()) + '^\n'
+        else:
+            before = text[start:pos].rsplit(b'\n', 1)[-1]
+            after = text[pos:end].split(b'\n', 1)[0]
+            return (before + after + b'\n' + b' ' * len(before.expandtabs()) + b'^\n').decode("ascii", "backslashreplace")
+
+    def match_examples(self, parse_fn: 'Callable[[str], Tree]',
+                             examples: Union[Mapping[T, Iterable[str]], Iterable[Tuple[T, Iterable[str]]]],
+                             token_type_match_fallback: bool=False,
+                             use_accepts: bool=True
+                         ) -> Optional[T]:
+        #--
+        assert self.state is not None, "Not supported for this exception"
+
+        if isinstance(examples, Mapping):
+            examples = examples.items()
+
+        candidate = (None, False)
+        for i, (label, example) in enumerate(examples):
+            assert not isinstance(example, str), "Expecting a list"
+
+            for j, malformed in enumerate(example):
+                try:
+                    parse_fn(malformed)
+                except UnexpectedInput as ut:
+                    if ut.state == self.state:
+                        if (
+                            use_accepts
+                            and isinstance(self, UnexpectedToken)
+                            and isinstance(ut, UnexpectedToken)
+                            and ut.accepts != self.accepts
+                        ):
+                            logger.debug("Different accepts with same state[%d]: %s != %s at example [%s][%s]" %
+                                         (self.state, self.accepts, ut.accepts, i, j))
+                            continue
+                        if (
+                            isinstance(self, (UnexpectedToken, UnexpectedEOF))
+                            and isinstance(ut, (UnexpectedToken, UnexpectedEOF))
+                        ):
+                            if ut.token == self.token:  ##
+
+                                logger.debug("Exact Match at example [%s][%s]" % (i, j))
+                                return label
+
+                            if token_type_match_fallback:
+                                ##
+
+                                if (ut.token.type == self.token.type) and not candidate[-1]:
+                                    logger.debug("Token Type Fallback at example [%s][%s]" % (i, j))
+                                    candidate = label, True
+
+                        if candidate[0] is None:
+                            logger.debug("Same State match at example [%s][%s]" % (i, j))
+                            candidate = label, False
+
+        return candidate[0]
+
+    def _format_expected(self, expected):
+        if self._terminals_by_name:
+            d = self._terminals_by_name
+            expected = [d[t_name].user_repr() if t_name in d else t_name for t_name in expected]
+        return "Expected one of: \n\t* %s\n" % '\n\t* '.join(expected)
+
+
+class UnexpectedEOF(ParseError, UnexpectedInput):
+    #--
+    expected: 'List[Token]'
+
+    def __init__(self, expected, state=None, terminals_by_name=None):
+        super(UnexpectedEOF, self).__init__()
+
+        self.expected = expected
+        self.state = state
+        from .lexer import Token
+        self.token = Token("<EOF>", "")  ##
+
+        self.pos_in_stream = -1
+        self.line = -1
+        self.column = -1
+        self._terminals_by_name = terminals_by_name
+
+
+    def __str__(self):
+        message = "Unexpected end-of-input. "
+        message += self._format_expected(self.expected)
+        return message
+
+
+class UnexpectedCharacters(LexError, UnexpectedInput):
+    #--
+
+    allowed: Set[str]
+    considered_tokens: Set[Any]
+
+    def __init__(self, seq, lex_pos, line, column, allowed=None, considered_tokens=None, state=None, token_history=None,
+                 terminals_by_name=None, considered_rules=None):
+        super(UnexpectedCharacters, self).__init__()
+
+        ##
+
+        self.line = line
+        self.column = column
+        self.pos_in_stream = lex_pos
+        self.state = state
+        self._terminals_by_name = terminals_by_name
+
+        self.allowed = allowed
+        self.considered_tokens = considered_tokens
+        self.considered_rules = considered_rules
+        self.token_history = token_history
+
+        if isinstance(seq, bytes):
+            self.char = seq[lex_pos:lex_pos + 1].decode("ascii", "backslashreplace")
+        else:
+            self.char = seq[lex_pos]
+        self._context = self.get_context(seq)
+
+
+    def __str__(self):
+        message = "No terminal matches '%s' in the current parser context, at line %d col %d" % (self.char, self.line, self.column)
+        message += '\n\n' + self._context
+        if self.allowed:
+            message += self._format_expected(self.allowed)
+        if self.token_history:
+            message += '\nPrevious tokens: %s\n' % ', '.join(repr(t) for t in self.token_history)
+        return message
+
+
+class UnexpectedToken(ParseError, UnexpectedInput):
+    #--
+
+    expected: Set[str]
+    considered_rules: Set[str]
+
+    def __init__(self, token, expected, considered_rules=None, state=None, interactive_parser=None, terminals_by_name=None, token_history=None):
+        super(UnexpectedToken, self).__init__()
+
+        ##
+
+        self.line = getattr(token, 'line', '?')
+        self.column = getattr(token, 'column', '?')
+        self.pos_in_stream = getattr(token, 'start_pos', None)
+        self.state = state
+
+        self.token = token
+        self.expected = expected  ##
+
+        self._accepts = NO_VALUE
+        self.considered_rules = considered_rules
+        self.interactive_parser = interactive_parser
+        self._terminals_by_name = terminals_by_name
+        self.token_history = token_history
+
+
+    @property
+    def accepts(self) -> Set[str]:
+        if self._accepts is NO_VALUE:
+            self._accepts = self.interactive_parser and self.interactive_parser.accepts()
+        return self._accepts
+
+    def __str__(self):
+        message = ("Unexpected token %r at line %s, column %s.\n%s"
+                   % (self.token, self.line, self.column, self._format_expected(self.accepts or self.expected)))
+        if self.token_history:
+            message += "Previous tokens: %r\n" % self.token_history
+
+        return message
+
+
+
+class VisitError(LarkError):
+    #--
+
+    obj: 'Union[Tree, Token]'
+    orig_exc: Exception
+
+    def __init__(self, rule, obj, orig_exc):
+        message = 'Error trying to process rule "%s":\n\n%s' % (rule, orig_exc)
+        super(VisitError, self).__init__(message)
+
+        self.rule = rule
+        self.obj = obj
+        self.orig_exc = orig_exc
+
+
+class MissingVariableError(LarkError):
+    pass
+
+
+import sys, re
+import logging
+from dataclasses import dataclass
+from typing import Generic, AnyStr
+
+logger: logging.Logger = logging.getLogger("lark")
+logger.addHandler(logging.StreamHandler())
+##
+
+##
+
+logger.setLevel(logging.CRITICAL)
+
+
+NO_VALUE = object()
+
+T = TypeVar("T")
+
+
+def classify(seq: Iterable, key: Optional[Callable] = None, value: Optional[Callable] = None) -> Dict:
+    d: Dict[Any, Any] = {}
+    for item in seq:
+        k = key(item) if (key is not None) else item
+        v = value(item) if (value is not None) else item
+        try:
+            d[k].append(v)
+        except KeyError:
+            d[k] = [v]
+    return d
+
+
+def _deserialize(data: Any, namespace: Dict[str, Any], memo: Dict) -> Any:
+    if isinstance(data, dict):
+        if '__type__' in data:  ##
+
+            class_ = namespace[data['__type__']]
+            return class_.deserialize(data, memo)
+        elif '@' in data:
+            return memo[data['@']]
+        return {key:_deserialize(value, namespace, memo) for key, value in data.items()}
+    elif isinstance(data, list):
+        return [_deserialize(value, namespace, memo) for value in data]
+    return data
+
+
+_T = TypeVar("_T", bound="Serialize")
+
+class Serialize:
+    #--
+
+    def memo_serialize(self, types_to_memoize: List) -> Any:
+        memo = SerializeMemoizer(types_to_memoize)
+        return self.serialize(memo), memo.serialize()
+
+    def serialize(self, memo = None) -> Dict[str, Any]:
+        if memo and memo.in_types(self):
+            return {'@': memo.memoized.get(self)}
+
+        fields = getattr(self, '__serialize_fields__')
+        res = {f: _serialize(getattr(self, f), memo) for f in fields}
+        res['__type__'] = type(self).__name__
+        if hasattr(self, '_serialize'):
+            self._serialize(res, memo)
+        return res
+
+    @classmethod
+    def deserialize(cls: Type[_T], data: Dict[str, Any], memo: Dict[int, Any]) -> _T:
+        namespace = getattr(cls, '__serialize_namespace__', [])
+        namespace = {c.__name__:c for c in namespace}
+
+        fields = getattr(cls, '__serialize_fields__')
+
+        if '@' in data:
+            return memo[data['@']]
+
+        inst = cls.__new__(cls)
+        for f in fields:
+            try:
+                setattr(inst, f, _deserialize(data[f], namespace, memo))
+            except KeyError as e:
+                raise KeyError("Cannot find key for class", cls, e)
+
+        if hasattr(inst, '_deserialize'):
+            inst._deserialize()
+
+        return inst
+
+
+class SerializeMemoizer(Serialize):
+    #--
+
+    __serialize_fields__ = 'memoized',
+
+    def __init__(self, types_to_memoize: List) -> None:
+        self.types_to_memoize = tuple(types_to_memoize)
+        self.memoized = Enumerator()
+
+    def in_types(self, value: Serialize) -> bool:
+        return isinstance(value, self.types_to_memoize)
+
+    def serialize(self) -> Dict[int, Any]:  ##
+
+        return _serialize(self.memoized.reversed(), None)
+
+    @classmethod
+    def deserialize(cls, data: Dict[int, Any], namespace: Dict[str, Any], memo: Dict[Any, Any]) -> Dict[int, Any]:  ##
+
+        return _deserialize(data, namespace, memo)
+
+
+try:
+    import regex
+    _has_regex = True
+except ImportError:
+    _has_regex = False
+
+if sys.version_info >= (3, 11):
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+else:
+    import sre_parse
+    import sre_constants
+
+categ_pattern = re.compile(r'\\p{[A-Za-z_]+}')
+
+def get_regexp_width(expr: str) -> Union[Tuple[int, int], List[int]]:
+    if _has_regex:
+        ##
+
+        ##
+
+        ##
+
+        regexp_final = re.sub(categ_pattern, 'A', expr)
+    else:
+        if re.search(categ_pattern, expr):
+            raise ImportError('`regex` module must be installed in order to use Unicode categories.', expr)
+        regexp_final = expr
+    try:
+        ##
+
+        return [int(x) for x in sre_parse.parse(regexp_final).getwidth()]
+    except sre_constants.error:
+        if not _has_regex:
+            raise ValueError(expr)
+        else:
+            ##
+
+            ##
+
+            c = regex.compile(regexp_final)
+            ##
+
+            ##
+
+            MAXWIDTH = getattr(sre_parse, "MAXWIDTH", sre_constants.MAXREPEAT)
+            if c.match('') is None:
+                ##
+
+                return 1, int(MAXWIDTH)
+            else:
+                return 0, int(MAXWIDTH)
+
+
+@dataclass(frozen=True)
+class TextSlice(Generic[AnyStr]):
+    #--
+    text: AnyStr
+    start: int
+    end: int
+
+    def __post_init__(self):
+        if not isinstance(self.text, (str, bytes)):
+            raise TypeError("text must be str or bytes")
+
+        if self.start < 0:
+            object.__setattr__(self, 'start', self.start + len(self.text))
+            assert self.start >=0
+
+        if self.end is None:
+            object.__setattr__(self, 'end', len(self.text))
+        elif self.end < 0:
+            object.__setattr__(self, 'end', self.end + len(self.text))
+            assert self.end <= len(self.text)
+
+    @classmethod
+    def cast_from(cls, text: 'TextOrSlice') -> 'TextSlice[AnyStr]':
+        if isinstance(text, TextSlice):
+            return text
+
+        return cls(text, 0, len(text))
+
+    def is_complete_text(self):
+        return self.start == 0 and self.end == len(self.text)
+
+    def __len__(self):
+        return self.end - self.start
+
+    def count(self, substr: AnyStr):
+        return self.text.count(substr, self.start, self.end)
+
+    def rindex(self, substr: AnyStr):
+        return self.text.rindex(substr, self.start, self.end)
+
+
+TextOrSlice = Union[AnyStr, 'TextSlice[AnyStr]']
+LarkInput = Union[AnyStr, TextSlice[AnyStr], Any]
+
+
+
+class Meta:
+
+    empty: bool
+    line: int
+    column: int
+    start_pos: int
+    end_line: int
+    end_column: int
+    end_pos: int
+    orig_expansion: 'List[TerminalDef]'
+    match_tree: bool
+
+    def __init__(self):
+        self.empty = True
+
+
+_Leaf_T = TypeVar("_Leaf_T")
+Branch = Union[_Leaf_T, 'Tree[_Leaf_T]']
+
+
+class Tree(Generic[_Leaf_T]):
+    #--
+
+    data: str
+    children: 'List[Branch[_Leaf_T]]'
+
+    def __init__(self, data: str, children: 'List[Branch[_Leaf_T]]', meta: Optional[Meta]=None) -> None:
+        self.data = data
+        self.children = children
+        self._meta = meta
+
+    @property
+    def meta(self) -> Meta:
+        if self._meta is None:
+            self._meta = Meta()
+        return self._meta
+
+    def __repr__(self):
+        return 'Tree(%r, %r)' % (self.data, self.children)
+
+    __match_args__ = ("data", "children")
+
+    def _pretty_label(self):
+        return self.data
+
+    def _pretty(self, level, indent_str):
+        yield f'{indent_str*level}{self._pretty_label()}'
+        if len(self.children) == 1 and not isinstance(self.children[0], Tree):
+            yield f'\t{self.children[0]}\n'
+        else:
+            yield '\n'
+            for n in self.children:
+                if isinstance(n, Tree):
+                    yield from n._pretty(level+1, indent_str)
+                else:
+                    yield f'{indent_str*(level+1)}{n}\n'
+
+    def pretty(self, indent_str: str='  ') -> str:
+        #--
+        return ''.join(self._pretty(0, indent_str))
+
+    def __rich__(self, parent:Optional['rich.tree.Tree']=None) -> 'rich.tree.Tree':
+        #--
+        return self._rich(parent)
+
+    def _rich(self, parent):
+        if parent:
+            tree = parent.add(f'[bold]{self.data}[/bold]')
+        else:
+            import rich.tree
+            tree = rich.tree.Tree(self.data)
+
+        for c in self.children:
+            if isinstance(c, Tree):
+                c._rich(tree)
+            else:
+                tree.add(f'[green]{c}[/green]')
+
+        return tree
+
+    def __eq__(self, other):
+        try:
+            return self.data == other.data and self.children == other.children
+        except AttributeError:
+            return False
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self) -> int:
+        return hash((self.data, tuple(self.children)))
+
+    def iter_subtrees(self) -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        queue = [self]
+        subtrees = dict()
+        for subtree in queue:
+            subtrees[id(subtree)] = subtree
+            queue += [c for c in reversed(subtree.children)
+                      if isinstance(c, Tree) and id(c) not in subtrees]
+
+        del queue
+        return reversed(list(subtrees.values()))
+
+    def iter_subtrees_topdown(self):
+        #--
+        stack = [self]
+        stack_append = stack.append
+        stack_pop = stack.pop
+        while stack:
+            node = stack_pop()
+            if not isinstance(node, Tree):
+                continue
+            yield node
+            for child in reversed(node.children):
+                stack_append(child)
+
+    def find_pred(self, pred: 'Callable[[Tree[_Leaf_T]], bool]') -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        return filter(pred, self.iter_subtrees())
+
+    def find_data(self, data: str) -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        return self.find_pred(lambda t: t.data == data)
+
+
+from functools import wraps, update_wrapper
+from inspect import getmembers, getmro
+
+_Return_T = TypeVar('_Return_T')
+_Return_V = TypeVar('_Return_V')
+_Leaf_T = TypeVar('_Leaf_T')
+_Leaf_U = TypeVar('_Leaf_U')
+_R = TypeVar('_R')
+_FUNC = Callable[..., _Return_T]
+_DECORATED = Union[_FUNC, type]
+
+class _DiscardType:
+    #--
+
+    def __repr__(self):
+        return "lark.visitors.Discard"
+
+Discard = _DiscardType()
+
+##
+
+
+class _Decoratable:
+    #--
+
+    @classmethod
+    def _apply_v_args(cls, visit_wrapper):
+        mro = getmro(cls)
+        assert mro[0] is cls
+        libmembers = {name for _cls in mro[1:] for name, _ in getmembers(_cls)}
+        for name, value in getmembers(cls):
+
+            ##
+
+            if name.startswith('_') or (name in libmembers and name not in cls.__dict__):
+                continue
+            if not callable(value):
+                continue
+
+            ##
+
+            if isinstance(cls.__dict__[name], _VArgsWrapper):
+                continue
+
+            setattr(cls, name, _VArgsWrapper(cls.__dict__[name], visit_wrapper))
+        return cls
+
+    def __class_getitem__(cls, _):
+        return cls
+
+
+class Transformer(_Decoratable, ABC, Generic[_Leaf_T, _Return_T]):
+    #--
+    __visit_tokens__ = True   ##
+
+
+    def __init__(self,  visit_tokens: bool=True) -> None:
+        self.__visit_tokens__ = visit_tokens
+
+    def _call_userfunc(self, tree, new_children=None):
+        ##
+
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            try:
+                wrapper = getattr(f, 'visit_wrapper', None)
+                if wrapper is not None:
+                    return f.visit_wrapper(f, tree.data, children, tree.meta)
+                else:
+                    return f(children)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError(tree.data, tree, e)
+
+    def _call_userfunc_token(self, token):
+        try:
+            f = getattr(self, token.type)
+        except AttributeError:
+            return self.__default_token__(token)
+        else:
+            try:
+                return f(token)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError(token.type, token, e)
+
+    def _transform_children(self, children):
+        for c in children:
+            if isinstance(c, Tree):
+                res = self._transform_tree(c)
+            elif self.__visit_tokens__ and isinstance(c, Token):
+                res = self._call_userfunc_token(c)
+            else:
+                res = c
+
+            if res is not Discard:
+                yield res
+
+    def _transform_tree(self, tree):
+        children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree, children)
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        #--
+        res = list(self._transform_children([tree]))
+        if not res:
+            return None     ##
+
+        assert len(res) == 1
+        return res[0]
+
+    def __mul__(
+            self: 'Transformer[_Leaf_T, Tree[_Leaf_U]]',
+            other: 'Union[Transformer[_Leaf_U, _Return_V], TransformerChain[_Leaf_U, _Return_V,]]'
+    ) -> 'TransformerChain[_Leaf_T, _Return_V]':
+        #--
+        return TransformerChain(self, other)
+
+    def __default__(self, data, children, meta):
+        #--
+        return Tree(data, children, meta)
+
+    def __default_token__(self, token):
+        #--
+        return token
+
+
+def merge_transformers(base_transformer=None, **transformers_to_merge):
+    #--
+    if base_transformer is None:
+        base_transformer = Transformer()
+    for prefix, transformer in transformers_to_merge.items():
+        for method_name in dir(transformer):
+            method = getattr(transformer, method_name)
+            if not callable(method):
+                continue
+            if method_name.startswith("_") or method_name == "transform":
+                continue
+            prefixed_method = prefix + "__" + method_name
+            if hasattr(base_transformer, prefixed_method):
+                raise AttributeError("Cannot merge: method '%s' appears more than once" % prefixed_method)
+
+            setattr(base_transformer, prefixed_method, method)
+
+    return base_transformer
+
+
+class InlineTransformer(Transformer):   ##
+
+    def _call_userfunc(self, tree, new_children=None):
+        ##
+
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            return f(*children)
+
+
+class TransformerChain(Generic[_Leaf_T, _Return_T]):
+
+    transformers: 'Tuple[Union[Transformer, TransformerChain], ...]'
+
+    def __init__(self, *transformers: 'Union[Transformer, TransformerChain]') -> None:
+        self.transformers = transformers
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        for t in self.transformers:
+            tree = t.transform(tree)
+        return cast(_Return_T, tree)
+
+    def __mul__(
+            self: 'TransformerChain[_Leaf_T, Tree[_Leaf_U]]',
+            other: 'Union[Transformer[_Leaf_U, _Return_V], TransformerChain[_Leaf_U, _Return_V]]'
+    ) -> 'TransformerChain[_Leaf_T, _Return_V]':
+        return TransformerChain(*self.transformers + (other,))
+
+
+class Transformer_InPlace(Transformer[_Leaf_T, _Return_T]):
+    #--
+    def _transform_tree(self, tree):           ##
+
+        return self._call_userfunc(tree)
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        for subtree in tree.iter_subtrees():
+            subtree.children = list(self._transform_children(subtree.children))
+
+        return self._transform_tree(tree)
+
+
+class Transformer_NonRecursive(Transformer[_Leaf_T, _Return_T]):
+    #--
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        ##
+
+        rev_postfix = []
+        q: List[Branch[_Leaf_T]] = [tree]
+        while q:
+            t = q.pop()
+            rev_postfix.append(t)
+            if isinstance(t, Tree):
+                q += t.children
+
+        ##
+
+        stack: List = []
+        for x in reversed(rev_postfix):
+            if isinstance(x, Tree):
+                size = len(x.children)
+                if size:
+                    args = stack[-size:]
+                    del stack[-size:]
+                else:
+                    args = []
+
+                res = self._call_userfunc(x, args)
+                if res is not Discard:
+                    stack.append(res)
+
+            elif self.__visit_tokens__ and isinstance(x, Token):
+                res = self._call_userfunc_token(x)
+                if res is not Discard:
+                    stack.append(res)
+            else:
+                stack.append(x)
+
+        result, = stack  ##
+
+        ##
+
+        ##
+
+        ##
+
+        return cast(_Return_T, result)
+
+
+class Transformer_InPlaceRecursive(Transformer[_Leaf_T, _Return_T]):
+    #--
+    def _transform_tree(self, tree):
+        tree.children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree)
+
+
+##
+
+
+class VisitorBase:
+    def _call_userfunc(self, tree):
+        return getattr(self, tree.data, self.__default__)(tree)
+
+    def __default__(self, tree):
+        #--
+        return tree
+
+    def __class_getitem__(cls, _):
+        return cls
+
+
+class Visitor(VisitorBase, ABC, Generic[_Leaf_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for subtree in tree.iter_subtrees():
+            self._call_userfunc(subtree)
+        return tree
+
+    def visit_topdown(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for subtree in tree.iter_subtrees_topdown():
+            self._call_userfunc(subtree)
+        return tree
+
+
+class Visitor_Recursive(VisitorBase, Generic[_Leaf_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit(child)
+
+        self._call_userfunc(tree)
+        return tree
+
+    def visit_topdown(self,tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        self._call_userfunc(tree)
+
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit_topdown(child)
+
+        return tree
+
+
+class Interpreter(_Decoratable, ABC, Generic[_Leaf_T, _Return_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        ##
+
+        ##
+
+        ##
+
+        return self._visit_tree(tree)
+
+    def _visit_tree(self, tree: Tree[_Leaf_T]):
+        f = getattr(self, tree.data)
+        wrapper = getattr(f, 'visit_wrapper', None)
+        if wrapper is not None:
+            return f.visit_wrapper(f, tree.data, tree.children, tree.meta)
+        else:
+            return f(tree)
+
+    def visit_children(self, tree: Tree[_Leaf_T]) -> List:
+        return [self._visit_tree(child) if isinstance(child, Tree) else child
+                for child in tree.children]
+
+    def __getattr__(self, name):
+        return self.__default__
+
+    def __default__(self, tree):
+        return self.visit_children(tree)
+
+
+_InterMethod = Callable[[Type[Interpreter], _Return_T], _R]
+
+def visit_children_decor(func: _InterMethod) -> _InterMethod:
+    #--
+    @wraps(func)
+    def inner(cls, tree):
+        values = cls.visit_children(tree)
+        return func(cls, values)
+    return inner
+
+##
+
+
+def _apply_v_args(obj, visit_wrapper):
+    try:
+        _apply = obj._apply_v_args
+    except AttributeError:
+        return _VArgsWrapper(obj, visit_wrapper)
+    else:
+        return _apply(visit_wrapper)
+
+
+class _VArgsWrapper:
+    #--
+    base_func: Callable
+
+    def __init__(self, func: Callable, visit_wrapper: Callable[[Callable, str, list, Any], Any]):
+        if isinstance(func, _VArgsWrapper):
+            func = func.base_func
+        self.base_func = func
+        self.visit_wrapper = visit_wrapper
+        update_wrapper(self, func)
+
+    def __call__(self, *args, **kwargs):
+        return self.base_func(*args, **kwargs)
+
+    def __get__(self, instance, owner=None):
+        try:
+            ##
+
+            ##
+
+            g = type(self.base_func).__get__
+        except AttributeError:
+            return self
+        else:
+            return _VArgsWrapper(g(self.base_func, instance, owner), self.visit_wrapper)
+
+    def __set_name__(self, owner, name):
+        try:
+            f = type(self.base_func).__set_name__
+        except AttributeError:
+            return
+        else:
+            f(self.base_func, owner, name)
+
+
+def _vargs_inline(f, _data, children, _meta):
+    return f(*children)
+def _vargs_meta_inline(f, _data, children, meta):
+    return f(meta, *children)
+def _vargs_meta(f, _data, children, meta):
+    return f(meta, children)
+def _vargs_tree(f, data, children, meta):
+    return f(Tree(data, children, meta))
+
+
+def v_args(inline: bool = False, meta: bool = False, tree: bool = False, wrapper: Optional[Callable] = None) -> Callable[[_DECORATED], _DECORATED]:
+    #--
+    if tree and (meta or inline):
+        raise ValueError("Visitor functions cannot combine 'tree' with 'meta' or 'inline'.")
+
+    func = None
+    if meta:
+        if inline:
+            func = _vargs_meta_inline
+        else:
+            func = _vargs_meta
+    elif inline:
+        func = _vargs_inline
+    elif tree:
+        func = _vargs_tree
+
+    if wrapper is not None:
+        if func is not None:
+            raise ValueError("Cannot use 'wrapper' along with 'tree', 'meta' or 'inline'.")
+        func = wrapper
+
+    def _visitor_args_dec(obj):
+        return _apply_v_args(obj, func)
+    return _visitor_args_dec
+
+
+
+TOKEN_DEFAULT_PRIORITY = 0
+
+
+class Symbol(Serialize):
+    __slots__ = ('name',)
+
+    name: str
+    is_term: ClassVar[bool] = NotImplemented
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __eq__(self, other):
+        if not isinstance(other, Symbol):
+            return NotImplemented
+        return self.is_term == other.is_term and self.name == other.name
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.name)
+
+    fullrepr = property(__repr__)
+
+    def renamed(self, f):
+        return type(self)(f(self.name))
+
+
+class Terminal(Symbol):
+    __serialize_fields__ = 'name', 'filter_out'
+
+    is_term: ClassVar[bool] = True
+
+    def __init__(self, name: str, filter_out: bool = False) -> None:
+        self.name = name
+        self.filter_out = filter_out
+
+    @property
+    def fullrepr(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.filter_out)
+
+    def renamed(self, f):
+        return type(self)(f(self.name), self.filter_out)
+
+
+class NonTerminal(Symbol):
+    __serialize_fields__ = 'name',
+
+    is_term: ClassVar[bool] = False
+
+    def serialize(self, memo=None) -> Dict[str, Any]:
+        ##
+
+        ##
+
+        return {'name': str(self.name), '__type__': 'NonTerminal'}
+
+
+class RuleOptions(Serialize):
+    __serialize_fields__ = 'keep_all_tokens', 'expand1', 'priority', 'template_source', 'empty_indices'
+
+    keep_all_tokens: bool
+    expand1: bool
+    priority: Optional[int]
+    template_source: Optional[str]
+    empty_indices: Tuple[bool, ...]
+
+    def __init__(self, keep_all_tokens: bool=False, expand1: bool=False, priority: Optional[int]=None, template_source: Optional[str]=None, empty_indices: Tuple[bool, ...]=()) -> None:
+        self.keep_all_tokens = keep_all_tokens
+        self.expand1 = expand1
+        self.priority = priority
+        self.template_source = template_source
+        self.empty_indices = empty_indices
+
+    def __repr__(self):
+        return 'RuleOptions(%r, %r, %r, %r)' % (
+            self.keep_all_tokens,
+            self.expand1,
+            self.priority,
+            self.template_source
+        )
+
+
+class Rule(Serialize):
+    #--
+    __slots__ = ('origin', 'expansion', 'alias', 'options', 'order', '_hash')
+
+    __serialize_fields__ = 'origin', 'expansion', 'order', 'alias', 'options'
+    __serialize_namespace__ = Terminal, NonTerminal, RuleOptions
+
+    origin: NonTerminal
+    expansion: Sequence[Symbol]
+    order: int
+    alias: Optional[str]
+    options: RuleOptions
+    _hash: int
+
+    def __init__(self, origin: NonTerminal, expansion: Sequence[Symbol],
+                 order: int=0, alias: Optional[str]=None, options: Optional[RuleOptions]=None):
+        self.origin = origin
+        self.expansion = expansion
+        self.alias = alias
+        self.order = order
+        self.options = options or RuleOptions()
+        self._hash = hash((self.origin, tuple(self.expansion)))
+
+    def _deserialize(self):
+        self._hash = hash((self.origin, tuple(self.expansion)))
+
+    def __str__(self):
+        return '<%s : %s>' % (self.origin.name, ' '.join(x.name for x in self.expansion))
+
+    def __repr__(self):
+        return 'Rule(%r, %r, %r, %r)' % (self.origin, self.expansion, self.alias, self.options)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if not isinstance(other, Rule):
+            return False
+        return self.origin == other.origin and self.expansion == other.expansion
+
+
+
+from contextlib import suppress
+from copy import copy
+
+try:  ##
+
+    has_interegular = bool(interegular)
+except NameError:
+    has_interegular = False
+
+class Pattern(Serialize, ABC):
+    #--
+
+    value: str
+    flags: Collection[str]
+    raw: Optional[str]
+    type: ClassVar[str]
+
+    def __init__(self, value: str, flags: Collection[str] = (), raw: Optional[str] = None) -> None:
+        self.value = value
+        self.flags = frozenset(flags)
+        self.raw = raw
+
+    def __repr__(self):
+        return repr(self.to_regexp())
+
+    ##
+
+    def __hash__(self):
+        return hash((type(self), self.value, self.flags))
+
+    def __eq__(self, other):
+        return type(self) == type(other) and self.value == other.value and self.flags == other.flags
+
+    @abstractmethod
+    def to_regexp(self) -> str:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def min_width(self) -> int:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def max_width(self) -> int:
+        raise NotImplementedError()
+
+    def _get_flags(self, value):
+        for f in self.flags:
+            value = ('(?%s:%s)' % (f, value))
+        return value
+
+
+class PatternStr(Pattern):
+    __serialize_fields__ = 'value', 'flags', 'raw'
+
+    type: ClassVar[str] = "str"
+
+    def to_regexp(self) -> str:
+        return self._get_flags(re.escape(self.value))
+
+    @property
+    def min_width(self) -> int:
+        return len(self.value)
+
+    @property
+    def max_width(self) -> int:
+        return len(self.value)
+
+
+class PatternRE(Pattern):
+    __serialize_fields__ = 'value', 'flags', 'raw', '_width'
+
+    type: ClassVar[str] = "re"
+
+    def to_regexp(self) -> str:
+        return self._get_flags(self.value)
+
+    _width = None
+    def _get_width(self):
+        if self._width is None:
+            self._width = get_regexp_width(self.to_regexp())
+        return self._width
+
+    @property
+    def min_width(self) -> int:
+        return self._get_width()[0]
+
+    @property
+    def max_width(self) -> int:
+        return self._get_width()[1]
+
+
+class TerminalDef(Serialize):
+    #--
+    __serialize_fields__ = 'name', 'pattern', 'priority'
+    __serialize_namespace__ = PatternStr, PatternRE
+
+    name: str
+    pattern: Pattern
+    priority: int
+
+    def __init__(self, name: str, pattern: Pattern, priority: int = TOKEN_DEFAULT_PRIORITY) -> None:
+        assert isinstance(pattern, Pattern), pattern
+        self.name = name
+        self.pattern = pattern
+        self.priority = priority
+
+    def __repr__(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.pattern)
+
+    def user_repr(self) -> str:
+        if self.name.startswith('__'):  ##
+
+            return self.pattern.raw or self.name
+        else:
+            return self.name
+
+_T = TypeVar('_T', bound="Token")
+
+class Token(str):
+    #--
+    __slots__ = ('type', 'start_pos', 'value', 'line', 'column', 'end_line', 'end_column', 'end_pos')
+
+    __match_args__ = ('type', 'value')
+
+    type: str
+    start_pos: Optional[int]
+    value: Any
+    line: Optional[int]
+    column: Optional[int]
+    end_line: Optional[int]
+    end_column: Optional[int]
+    end_pos: Optional[int]
+
+
+    @overload
+    def __new__(
+            cls,
+            type: str,
+            value: Any,
+            start_pos: Optional[int] = None,
+            line: Optional[int] = None,
+            column: Optional[int] = None,
+            end_line: Optional[int] = None,
+            end_column: Optional[int] = None,
+            end_pos: Optional[int] = None
+    ) -> 'Token':
+        ...
+
+    @overload
+    def __new__(
+            cls,
+            type_: str,
+            value: Any,
+            start_pos: Optional[int] = None,
+            line: Optional[int] = None,
+            column: Optional[int] = None,
+            end_line: Optional[int] = None,
+            end_column: Optional[int] = None,
+            end_pos: Optional[int] = None
+    ) -> 'Token':        ...
+
+    def __new__(cls, *args, **kwargs):
+        if "type_" in kwargs:
+            warnings.warn("`type_` is deprecated use `type` instead", DeprecationWarning)
+
+            if "type" in kwargs:
+                raise TypeError("Error: using both 'type' and the deprecated 'type_' as arguments.")
+            kwargs["type"] = kwargs.pop("type_")
+
+        return cls._future_new(*args, **kwargs)
+
+
+    @classmethod
+    def _future_new(cls, type, value, start_pos=None, line=None, column=None, end_line=None, end_column=None, end_pos=None):
+        inst = super(Token, cls).__new__(cls, value)
+
+        inst.type = type
+        inst.start_pos = start_pos
+        inst.value = value
+        inst.line = line
+        inst.column = column
+        inst.end_line = end_line
+        inst.end_column = end_column
+        inst.end_pos = end_pos
+        return inst
+
+    @overload
+    def update(self, type: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        ...
+
+    @overload
+    def update(self, type_: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        ...
+
+    def update(self, *args, **kwargs):
+        if "type_" in kwargs:
+            warnings.warn("`type_` is deprecated use `type` instead", DeprecationWarning)
+
+            if "type" in kwargs:
+                raise TypeError("Error: using both 'type' and the deprecated 'type_' as arguments.")
+            kwargs["type"] = kwargs.pop("type_")
+
+        return self._future_update(*args, **kwargs)
+
+    def _future_update(self, type: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        return Token.new_borrow_pos(
+            type if type is not None else self.type,
+            value if value is not None else self.value,
+            self
+        )
+
+    @classmethod
+    def new_borrow_pos(cls: Type[_T], type_: str, value: Any, borrow_t: 'Token') -> _T:
+        return cls(type_, value, borrow_t.start_pos, borrow_t.line, borrow_t.column, borrow_t.end_line, borrow_t.end_column, borrow_t.end_pos)
+
+    def __reduce__(self):
+        return (self.__class__, (self.type, self.value, self.start_pos, self.line, self.column))
+
+    def __repr__(self):
+        return 'Token(%r, %r)' % (self.type, self.value)
+
+    def __deepcopy__(self, memo):
+        return Token(self.type, self.value, self.start_pos, self.line, self.column)
+
+    def __eq__(self, other):
+        if isinstance(other, Token) and self.type != other.type:
+            return False
+
+        return str.__eq__(self, other)
+
+    __hash__ = str.__hash__
+
+
+class LineCounter:
+    #--
+
+    __slots__ = 'char_pos', 'line', 'column', 'line_start_pos', 'newline_char'
+
+    def __init__(self, newline_char):
+        self.newline_char = newline_char
+        self.char_pos = 0
+        self.line = 1
+        self.column = 1
+        self.line_start_pos = 0
+
+    def __eq__(self, other):
+        if not isinstance(other, LineCounter):
+            return NotImplemented
+
+        return self.char_pos == other.char_pos and self.newline_char == other.newline_char
+
+    def feed(self, token: TextOrSlice, test_newline=True):
+        #--
+        if test_newline:
+            newlines = token.count(self.newline_char)
+            if newlines:
+                self.line += newlines
+                self.line_start_pos = self.char_pos + token.rindex(self.newline_char) + 1
+
+        self.char_pos += len(token)
+        self.column = self.char_pos - self.line_start_pos + 1
+
+
+class UnlessCallback:
+    def __init__(self, scanner: 'Scanner'):
+        self.scanner = scanner
+
+    def __call__(self, t: Token):
+        res = self.scanner.fullmatch(t.value)
+        if res is not None:
+            t.type = res
+        return t
+
+
+class CallChain:
+    def __init__(self, callback1, callback2, cond):
+        self.callback1 = callback1
+        self.callback2 = callback2
+        self.cond = cond
+
+    def __call__(self, t):
+        t2 = self.callback1(t)
+        return self.callback2(t) if self.cond(t2) else t2
+
+
+def _get_match(re_, regexp, s, flags):
+    m = re_.match(regexp, s, flags)
+    if m:
+        return m.group(0)
+
+def _create_unless(terminals, g_regex_flags, re_, use_bytes):
+    tokens_by_type = classify(terminals, lambda t: type(t.pattern))
+    assert len(tokens_by_type) <= 2, tokens_by_type.keys()
+    embedded_strs = set()
+    callback = {}
+    for retok in tokens_by_type.get(PatternRE, []):
+        unless = []
+        for strtok in tokens_by_type.get(PatternStr, []):
+            if strtok.priority != retok.priority:
+                continue
+            s = strtok.pattern.value
+            if s == _get_match(re_, retok.pattern.to_regexp(), s, g_regex_flags):
+                unless.append(strtok)
+                if strtok.pattern.flags <= retok.pattern.flags:
+                    embedded_strs.add(strtok)
+        if unless:
+            callback[retok.name] = UnlessCallback(Scanner(unless, g_regex_flags, re_, use_bytes=use_bytes))
+
+    new_terminals = [t for t in terminals if t not in embedded_strs]
+    return new_terminals, callback
+
+
+class Scanner:
+    def __init__(self, terminals, g_regex_flags, re_, use_bytes):
+        self.terminals = terminals
+        self.g_regex_flags = g_regex_flags
+        self.re_ = re_
+        self.use_bytes = use_bytes
+
+        self.allowed_types = {t.name for t in self.terminals}
+
+        self._mres = self._build_mres(terminals, len(terminals))
+
+    def _build_mres(self, terminals, max_size):
+        ##
+
+        ##
+
+        ##
+
+        mres = []
+        while terminals:
+            pattern = u'|'.join(u'(?P<%s>%s)' % (t.name, t.pattern.to_regexp()) for t in terminals[:max_size])
+            if self.use_bytes:
+                pattern = pattern.encode('latin-1')
+            try:
+                mre = self.re_.compile(pattern, self.g_regex_flags)
+            except AssertionError:  ##
+
+                return self._build_mres(terminals, max_size // 2)
+
+            mres.append(mre)
+            terminals = terminals[max_size:]
+        return mres
+
+    def match(self, text: TextSlice, pos):
+        for mre in self._mres:
+            m = mre.match(text.text, pos, text.end)
+            if m:
+                return m.group(0), m.lastgroup
+
+
+    def fullmatch(self, text: str) -> Optional[str]:
+        for mre in self._mres:
+            m = mre.fullmatch(text)
+            if m:
+                return m.lastgroup
+        return None
+
+def _regexp_has_newline(r: str):
+    #--
+    return '\n' in r or '\\n' in r or '\\s' in r or '[^' in r or ('(?s' in r and '.' in r)
+
+
+class LexerState:
+    #--
+
+    __slots__ = 'text', 'line_ctr', 'last_token'
+
+    text: TextSlice
+    line_ctr: LineCounter
+    last_token: Optional[Token]
+
+    def __init__(self, text: TextSlice, line_ctr: Optional[LineCounter] = None, last_token: Optional[Token]=None):
+        if isinstance(text, TextSlice):
+            if line_ctr is None:
+                line_ctr = LineCounter(b'\n' if isinstance(text.text, bytes) else '\n')
+
+                if text.start > 0:
+                    ##
+
+                    line_ctr.feed(TextSlice(text.text, 0, text.start))
+
+            if not (text.start <= line_ctr.char_pos <= text.end):
+                raise ValueError("LineCounter.char_pos is out of bounds")
+
+        self.text = text
+        self.line_ctr = line_ctr
+        self.last_token = last_token
+
+
+    def __eq__(self, other):
+        if not isinstance(other, LexerState):
+            return NotImplemented
+
+        return self.text == other.text and self.line_ctr == other.line_ctr and self.last_token == other.last_token
+
+    def __copy__(self):
+        return type(self)(self.text, copy(self.line_ctr), self.last_token)
+
+
+class LexerThread:
+    #--
+
+    def __init__(self, lexer: 'Lexer', lexer_state: Optional[LexerState]):
+        self.lexer = lexer
+        self.state = lexer_state
+
+    @classmethod
+    def from_text(cls, lexer: 'Lexer', text_or_slice: TextOrSlice) -> 'LexerThread':
+        text = TextSlice.cast_from(text_or_slice)
+        return cls(lexer, LexerState(text))
+
+    @classmethod
+    def from_custom_input(cls, lexer: 'Lexer', text: Any) -> 'LexerThread':
+        return cls(lexer, LexerState(text))
+
+    def lex(self, parser_state):
+        if self.state is None:
+            raise TypeError("Cannot lex: No text assigned to lexer state")
+        return self.lexer.lex(self.state, parser_state)
+
+    def __copy__(self):
+        return type(self)(self.lexer, copy(self.state))
+
+    _Token = Token
+
+
+_Callback = Callable[[Token], Token]
+
+class Lexer(ABC):
+    #--
+    @abstractmethod
+    def lex(self, lexer_state: LexerState, parser_state: Any) -> Iterator[Token]:
+        return NotImplemented
+
+    def make_lexer_state(self, text: str):
+        #--
+        return LexerState(TextSlice.cast_from(text))
+
+
+def _check_regex_collisions(terminal_to_regexp: Dict[TerminalDef, str], comparator, strict_mode, max_collisions_to_show=8):
+    if not comparator:
+        comparator = interegular.Comparator.from_regexes(terminal_to_regexp)
+
+    ##
+
+    ##
+
+    max_time = 2 if strict_mode else 0.2
+
+    ##
+
+    if comparator.count_marked_pairs() >= max_collisions_to_show:
+        return
+    for group in classify(terminal_to_regexp, lambda t: t.priority).values():
+        for a, b in comparator.check(group, skip_marked=True):
+            assert a.priority == b.priority
+            ##
+
+            comparator.mark(a, b)
+
+            ##
+
+            message = f"Collision between Terminals {a.name} and {b.name}. "
+            try:
+                example = comparator.get_example_overlap(a, b, max_time).format_multiline()
+            except ValueError:
+                ##
+
+                example = "No example could be found fast enough. However, the collision does still exists"
+            if strict_mode:
+                raise LexError(f"{message}\n{example}")
+            logger.warning("%s The lexer will choose between them arbitrarily.\n%s", message, example)
+            if comparator.count_marked_pairs() >= max_collisions_to_show:
+                logger.warning("Found 8 regex collisions, will not check for more.")
+                return
+
+
+class AbstractBasicLexer(Lexer):
+    terminals_by_name: Dict[str, TerminalDef]
+
+    @abstractmethod
+    def __init__(self, conf: 'LexerConf', comparator=None) -> None:
+        ...
+
+    @abstractmethod
+    def next_token(self, lex_state: LexerState, parser_state: Any = None) -> Token:
+        ...
+
+    def lex(self, state: LexerState, parser_state: Any) -> Iterator[Token]:
+        with suppress(EOFError):
+            while True:
+                yield self.next_token(state, parser_state)
+
+
+class BasicLexer(AbstractBasicLexer):
+    terminals: Collection[TerminalDef]
+    ignore_types: FrozenSet[str]
+    newline_types: FrozenSet[str]
+    user_callbacks: Dict[str, _Callback]
+    callback: Dict[str, _Callback]
+    re: ModuleType
+
+    def __init__(self, conf: 'LexerConf', comparator=None) -> None:
+        terminals = list(conf.terminals)
+        assert all(isinstance(t, TerminalDef) for t in terminals), terminals
+
+        self.re = conf.re_module
+
+        if not conf.skip_validation:
+            ##
+
+            terminal_to_regexp = {}
+            for t in terminals:
+                regexp = t.pattern.to_regexp()
+                try:
+                    self.re.compile(regexp, conf.g_regex_flags)
+                except self.re.error:
+                    raise LexError("Cannot compile token %s: %s" % (t.name, t.pattern))
+
+                if t.pattern.min_width == 0:
+                    raise LexError("Lexer does not allow zero-width terminals. (%s: %s)" % (t.name, t.pattern))
+                if t.pattern.type == "re":
+                    terminal_to_regexp[t] = regexp
+
+            if not (set(conf.ignore) <= {t.name for t in terminals}):
+                raise LexError("Ignore terminals are not defined: %s" % (set(conf.ignore) - {t.name for t in terminals}))
+
+            if has_interegular:
+                _check_regex_collisions(terminal_to_regexp, comparator, conf.strict)
+            elif conf.strict:
+                raise LexError("interegular must be installed for strict mode. Use `pip install 'lark[interegular]'`.")
+
+        ##
+
+        self.newline_types = frozenset(t.name for t in terminals if _regexp_has_newline(t.pattern.to_regexp()))
+        self.ignore_types = frozenset(conf.ignore)
+
+        terminals.sort(key=lambda x: (-x.priority, -x.pattern.max_width, -len(x.pattern.value), x.name))
+        self.terminals = terminals
+        self.user_callbacks = conf.callbacks
+        self.g_regex_flags = conf.g_regex_flags
+        self.use_bytes = conf.use_bytes
+        self.terminals_by_name = conf.terminals_by_name
+
+        self._scanner: Optional[Scanner] = None
+
+    def _build_scanner(self) -> Scanner:
+        terminals, self.callback = _create_unless(self.terminals, self.g_regex_flags, self.re, self.use_bytes)
+        assert all(self.callback.values())
+
+        for type_, f in self.user_callbacks.items():
+            if type_ in self.callback:
+                ##
+
+                self.callback[type_] = CallChain(self.callback[type_], f, lambda t: t.type == type_)
+            else:
+                self.callback[type_] = f
+
+        return Scanner(terminals, self.g_regex_flags, self.re, self.use_bytes)
+
+    @property
+    def scanner(self) -> Scanner:
+        if self._scanner is None:
+            self._scanner = self._build_scanner()
+        return self._scanner
+
+    def match(self, text, pos):
+        return self.scanner.match(text, pos)
+
+    def next_token(self, lex_state: LexerState, parser_state: Any = None) -> Token:
+        line_ctr = lex_state.line_ctr
+        while line_ctr.char_pos < lex_state.text.end:
+            res = self.match(lex_state.text, line_ctr.char_pos)
+            if not res:
+                allowed = self.scanner.allowed_types - self.ignore_types
+                if not allowed:
+                    allowed = {"<END-OF-FILE>"}
+                raise UnexpectedCharacters(lex_state.text.text, line_ctr.char_pos, line_ctr.line, line_ctr.column,
+                                           allowed=allowed, token_history=lex_state.last_token and [lex_state.last_token],
+                                           state=parser_state, terminals_by_name=self.terminals_by_name)
+
+            value, type_ = res
+
+            ignored = type_ in self.ignore_types
+            t = None
+            if not ignored or type_ in self.callback:
+                t = Token(type_, value, line_ctr.char_pos, line_ctr.line, line_ctr.column)
+            line_ctr.feed(value, type_ in self.newline_types)
+            if t is not None:
+                t.end_line = line_ctr.line
+                t.end_column = line_ctr.column
+                t.end_pos = line_ctr.char_pos
+                if t.type in self.callback:
+                    t = self.callback[t.type](t)
+                if not ignored:
+                    if not isinstance(t, Token):
+                        raise LexError("Callbacks must return a token (returned %r)" % t)
+                    lex_state.last_token = t
+                    return t
+
+        ##
+
+        raise EOFError(self)
+
+
+class ContextualLexer(Lexer):
+    lexers: Dict[int, AbstractBasicLexer]
+    root_lexer: AbstractBasicLexer
+
+    BasicLexer: Type[AbstractBasicLexer] = BasicLexer
+
+    def __init__(self, conf: 'LexerConf', states: Dict[int, Collection[str]], always_accept: Collection[str]=()) -> None:
+        terminals = list(conf.terminals)
+        terminals_by_name = conf.terminals_by_name
+
+        trad_conf = copy(conf)
+        trad_conf.terminals = terminals
+
+        if has_interegular and not conf.skip_validation:
+            comparator = interegular.Comparator.from_regexes({t: t.pattern.to_regexp() for t in terminals})
+        else:
+            comparator = None
+        lexer_by_tokens: Dict[FrozenSet[str], AbstractBasicLexer] = {}
+        self.lexers = {}
+        for state, accepts in states.items():
+            key = frozenset(accepts)
+            try:
+                lexer = lexer_by_tokens[key]
+            except KeyError:
+                accepts = set(accepts) | set(conf.ignore) | set(always_accept)
+                lexer_conf = copy(trad_conf)
+                lexer_conf.terminals = [terminals_by_name[n] for n in accepts if n in terminals_by_name]
+                lexer = self.BasicLexer(lexer_conf, comparator)
+                lexer_by_tokens[key] = lexer
+
+            self.lexers[state] = lexer
+
+        assert trad_conf.terminals is terminals
+        trad_conf.skip_validation = True  ##
+
+        self.root_lexer = self.BasicLexer(trad_conf, comparator)
+
+    def lex(self, lexer_state: LexerState, parser_state: 'ParserState') -> Iterator[Token]:
+        try:
+            while True:
+                lexer = self.lexers[parser_state.position]
+                yield lexer.next_token(lexer_state, parser_state)
+        except EOFError:
+            pass
+        except UnexpectedCharacters as e:
+            ##
+
+            ##
+
+            try:
+                last_token = lexer_state.last_token  ##
+
+                token = self.root_lexer.next_token(lexer_state, parser_state)
+                raise UnexpectedToken(token, e.allowed, state=parser_state, token_history=[last_token], terminals_by_name=self.root_lexer.terminals_by_name)
+            except UnexpectedCharacters:
+                raise e  ##
+
+
+
+
+_ParserArgType: 'TypeAlias' = 'Literal["earley", "lalr", "cyk", "auto"]'
+_LexerArgType: 'TypeAlias' = 'Union[Literal["auto", "basic", "contextual", "dynamic", "dynamic_complete"], Type[Lexer]]'
+_LexerCallback = Callable[[Token], Token]
+ParserCallbacks = Dict[str, Callable]
+
+class LexerConf(Serialize):
+    __serialize_fields__ = 'terminals', 'ignore', 'g_regex_flags', 'use_bytes', 'lexer_type'
+    __serialize_namespace__ = TerminalDef,
+
+    terminals: Collection[TerminalDef]
+    re_module: ModuleType
+    ignore: Collection[str]
+    postlex: 'Optional[PostLex]'
+    callbacks: Dict[str, _LexerCallback]
+    g_regex_flags: int
+    skip_validation: bool
+    use_bytes: bool
+    lexer_type: Optional[_LexerArgType]
+    strict: bool
+
+    def __init__(self, terminals: Collection[TerminalDef], re_module: ModuleType, ignore: Collection[str]=(), postlex: 'Optional[PostLex]'=None,
+                 callbacks: Optional[Dict[str, _LexerCallback]]=None, g_regex_flags: int=0, skip_validation: bool=False, use_bytes: bool=False, strict: bool=False):
+        self.terminals = terminals
+        self.terminals_by_name = {t.name: t for t in self.terminals}
+        assert len(self.terminals) == len(self.terminals_by_name)
+        self.ignore = ignore
+        self.postlex = postlex
+        self.callbacks = callbacks or {}
+        self.g_regex_flags = g_regex_flags
+        self.re_module = re_module
+        self.skip_validation = skip_validation
+        self.use_bytes = use_bytes
+        self.strict = strict
+        self.lexer_type = None
+
+    def _deserialize(self):
+        self.terminals_by_name = {t.name: t for t in self.terminals}
+
+    def __deepcopy__(self, memo=None):
+        return type(self)(
+            deepcopy(self.terminals, memo),
+            self.re_module,
+            deepcopy(self.ignore, memo),
+            deepcopy(self.postlex, memo),
+            deepcopy(self.callbacks, memo),
+            deepcopy(self.g_regex_flags, memo),
+            deepcopy(self.skip_validation, memo),
+            deepcopy(self.use_bytes, memo),
+        )
+
+class ParserConf(Serialize):
+    __serialize_fields__ = 'rules', 'start', 'parser_type'
+
+    rules: List['Rule']
+    callbacks: ParserCallbacks
+    start: List[str]
+    parser_type: _ParserArgType
+
+    def __init__(self, rules: List['Rule'], callbacks: ParserCallbacks, start: List[str]):
+        assert isinstance(start, list)
+        self.rules = rules
+        self.callbacks = callbacks
+        self.start = start
+
+
+from functools import partial, wraps
+from itertools import product
+
+
+class ExpandSingleChild:
+    def __init__(self, node_builder):
+        self.node_builder = node_builder
+
+    def __call__(self, children):
+        if len(children) == 1:
+            return children[0]
+        else:
+            return self.node_builder(children)
+
+
+
+class PropagatePositions:
+    def __init__(self, node_builder, node_filter=None):
+        self.node_builder = node_builder
+        self.node_filter = node_filter
+
+    def __call__(self, children):
+        res = self.node_builder(children)
+
+        if isinstance(res, Tree):
+            ##
+
+            ##
+
+            ##
+
+            ##
+
+
+            res_meta = res.meta
+
+            first_meta = self._pp_get_meta(children)
+            if first_meta is not None:
+                if not hasattr(res_meta, 'line'):
+                    ##
+
+                    res_meta.line = getattr(first_meta, 'container_line', first_meta.line)
+                    res_meta.column = getattr(first_meta, 'container_column', first_meta.column)
+                    res_meta.start_pos = getattr(first_meta, 'container_start_pos', first_meta.start_pos)
+                    res_meta.empty = False
+
+                res_meta.container_line = getattr(first_meta, 'container_line', first_meta.line)
+                res_meta.container_column = getattr(first_meta, 'container_column', first_meta.column)
+                res_meta.container_start_pos = getattr(first_meta, 'container_start_pos', first_meta.start_pos)
+
+            last_meta = self._pp_get_meta(reversed(children))
+            if last_meta is not None:
+                if not hasattr(res_meta, 'end_line'):
+                    res_meta.end_line = getattr(last_meta, 'container_end_line', last_meta.end_line)
+                    res_meta.end_column = getattr(last_meta, 'container_end_column', last_meta.end_column)
+                    res_meta.end_pos = getattr(last_meta, 'container_end_pos', last_meta.end_pos)
+                    res_meta.empty = False
+
+                res_meta.container_end_line = getattr(last_meta, 'container_end_line', last_meta.end_line)
+                res_meta.container_end_column = getattr(last_meta, 'container_end_column', last_meta.end_column)
+                res_meta.container_end_pos = getattr(last_meta, 'container_end_pos', last_meta.end_pos)
+
+        return res
+
+    def _pp_get_meta(self, children):
+        for c in children:
+            if self.node_filter is not None and not self.node_filter(c):
+                continue
+            if isinstance(c, Tree):
+                if not c.meta.empty:
+                    return c.meta
+            elif isinstance(c, Token):
+                return c
+            elif hasattr(c, '__lark_meta__'):
+                return c.__lark_meta__()
+
+def make_propagate_positions(option):
+    if callable(option):
+        return partial(PropagatePositions, node_filter=option)
+    elif option is True:
+        return PropagatePositions
+    elif option is False:
+        return None
+
+    raise ConfigurationError('Invalid option for propagate_positions: %r' % option)
+
+
+class ChildFilter:
+    def __init__(self, to_include, append_none, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+        self.append_none = append_none
+
+    def __call__(self, children):
+        filtered = []
+
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                filtered += children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+
+class ChildFilterLALR(ChildFilter):
+    #--
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   ##
+
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+
+class ChildFilterLALR_NoPlaceholders(ChildFilter):
+    #--
+    def __init__(self, to_include, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand in self.to_include:
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   ##
+
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+        return self.node_builder(filtered)
+
+
+def _should_expand(sym):
+    return not sym.is_term and sym.name.startswith('_')
+
+
+def maybe_create_child_filter(expansion, keep_all_tokens, ambiguous, _empty_indices: List[bool]):
+    ##
+
+    if _empty_indices:
+        assert _empty_indices.count(False) == len(expansion)
+        s = ''.join(str(int(b)) for b in _empty_indices)
+        empty_indices = [len(ones) for ones in s.split('0')]
+        assert len(empty_indices) == len(expansion)+1, (empty_indices, len(expansion))
+    else:
+        empty_indices = [0] * (len(expansion)+1)
+
+    to_include = []
+    nones_to_add = 0
+    for i, sym in enumerate(expansion):
+        nones_to_add += empty_indices[i]
+        if keep_all_tokens or not (sym.is_term and sym.filter_out):
+            to_include.append((i, _should_expand(sym), nones_to_add))
+            nones_to_add = 0
+
+    nones_to_add += empty_indices[len(expansion)]
+
+    if _empty_indices or len(to_include) < len(expansion) or any(to_expand for i, to_expand,_ in to_include):
+        if _empty_indices or ambiguous:
+            return partial(ChildFilter if ambiguous else ChildFilterLALR, to_include, nones_to_add)
+        else:
+            ##
+
+            return partial(ChildFilterLALR_NoPlaceholders, [(i, x) for i,x,_ in to_include])
+
+
+class AmbiguousExpander:
+    #--
+    def __init__(self, to_expand, tree_class, node_builder):
+        self.node_builder = node_builder
+        self.tree_class = tree_class
+        self.to_expand = to_expand
+
+    def __call__(self, children):
+        def _is_ambig_tree(t):
+            return hasattr(t, 'data') and t.data == '_ambig'
+
+        ##
+
+        ##
+
+        ##
+
+        ##
+
+        ambiguous = []
+        for i, child in enumerate(children):
+            if _is_ambig_tree(child):
+                if i in self.to_expand:
+                    ambiguous.append(i)
+
+                child.expand_kids_by_data('_ambig')
+
+        if not ambiguous:
+            return self.node_builder(children)
+
+        expand = [child.children if i in ambiguous else (child,) for i, child in enumerate(children)]
+        return self.tree_class('_ambig', [self.node_builder(list(f)) for f in product(*expand)])
+
+
+def maybe_create_ambiguous_expander(tree_class, expansion, keep_all_tokens):
+    to_expand = [i for i, sym in enumerate(expansion)
+                 if keep_all_tokens or ((not (sym.is_term and sym.filter_out)) and _should_expand(sym))]
+    if to_expand:
+        return partial(AmbiguousExpander, to_expand, tree_class)
+
+
+class AmbiguousIntermediateExpander:
+    #--
+
+    def __init__(self, tree_class, node_builder):
+        self.node_builder = node_builder
+        self.tree_class = tree_class
+
+    def __call__(self, children):
+        def _is_iambig_tree(child):
+            return hasattr(child, 'data') and child.data == '_iambig'
+
+        def _collapse_iambig(children):
+            #--
+
+            ##
+
+            ##
+
+            if children and _is_iambig_tree(children[0]):
+                iambig_node = children[0]
+                result = []
+                for grandchild in iambig_node.children:
+                    collapsed = _collapse_iambig(grandchild.children)
+                    if collapsed:
+                        for child in collapsed:
+                            child.children += children[1:]
+                        result += collapsed
+                    else:
+                        new_tree = self.tree_class('_inter', grandchild.children + children[1:])
+                        result.append(new_tree)
+                return result
+
+        collapsed = _collapse_iambig(children)
+        if collapsed:
+            processed_nodes = [self.node_builder(c.children) for c in collapsed]
+            return self.tree_class('_ambig', processed_nodes)
+
+        return self.node_builder(children)
+
+
+
+def inplace_transformer(func):
+    @wraps(func)
+    def f(children):
+        ##
+
+        tree = Tree(func.__name__, children)
+        return func(tree)
+    return f
+
+
+def apply_visit_wrapper(func, name, wrapper):
+    if wrapper is _vargs_meta or wrapper is _vargs_meta_inline:
+        raise NotImplementedError("Meta args not supported for internal transformer; use YourTransformer().transform(parser.parse()) instead")
+
+    @wraps(func)
+    def f(children):
+        return wrapper(func, name, children, None)
+    return f
+
+
+class ParseTreeBuilder:
+    def __init__(self, rules, tree_class, propagate_positions=False, ambiguous=False, maybe_placeholders=False):
+        self.tree_class = tree_class
+        self.propagate_positions = propagate_positions
+        self.ambiguous = ambiguous
+        self.maybe_placeholders = maybe_placeholders
+
+        self.rule_builders = list(self._init_builders(rules))
+
+    def _init_builders(self, rules):
+        propagate_positions = make_propagate_positions(self.propagate_positions)
+
+        for rule in rules:
+            options = rule.options
+            keep_all_tokens = options.keep_all_tokens
+            expand_single_child = options.expand1
+
+            wrapper_chain = list(filter(None, [
+                (expand_single_child and not rule.alias) and ExpandSingleChild,
+                maybe_create_child_filter(rule.expansion, keep_all_tokens, self.ambiguous, options.empty_indices if self.maybe_placeholders else None),
+                propagate_positions,
+                self.ambiguous and maybe_create_ambiguous_expander(self.tree_class, rule.expansion, keep_all_tokens),
+                self.ambiguous and partial(AmbiguousIntermediateExpander, self.tree_class)
+            ]))
+
+            yield rule, wrapper_chain
+
+    def create_callback(self, transformer=None):
+        callbacks = {}
+
+        default_handler = getattr(transformer, '__default__', None)
+        if default_handler:
+            def default_callback(data, children):
+                return default_handler(data, children, None)
+        else:
+            default_callback = self.tree_class
+
+        for rule, wrapper_chain in self.rule_builders:
+
+            user_callback_name = rule.alias or rule.options.template_source or rule.origin.name
+            try:
+                f = getattr(transformer, user_callback_name)
+                wrapper = getattr(f, 'visit_wrapper', None)
+                if wrapper is not None:
+                    f = apply_visit_wrapper(f, user_callback_name, wrapper)
+                elif isinstance(transformer, Transformer_InPlace):
+                    f = inplace_transformer(f)
+            except AttributeError:
+                f = partial(default_callback, user_callback_name)
+
+            for w in wrapper_chain:
+                f = w(f)
+
+            if rule in callbacks:
+                raise GrammarError("Rule '%s' already exists" % (rule,))
+
+            callbacks[rule] = f
+
+        return callbacks
+
+
+
+class Action:
+    def __init__(self, name):
+        self.name = name
+    def __str__(self):
+        return self.name
+    def __repr__(self):
+        return str(self)
+
+Shift = Action('Shift')
+Reduce = Action('Reduce')
+
+StateT = TypeVar("StateT")
+
+class ParseTableBase(Generic[StateT]):
+    states: Dict[StateT, Dict[str, Tuple]]
+    start_states: Dict[str, StateT]
+    end_states: Dict[str, StateT]
+
+    def __init__(self, states, start_states, end_states):
+        self.states = states
+        self.start_states = start_states
+        self.end_states = end_states
+
+    def serialize(self, memo):
+        tokens = Enumerator()
+
+        states = {
+            state: {tokens.get(token): ((1, arg.serialize(memo)) if action is Reduce else (0, arg))
+                    for token, (action, arg) in actions.items()}
+            for state, actions in self.states.items()
+        }
+
+        return {
+            'tokens': tokens.reversed(),
+            'states': states,
+            'start_states': self.start_states,
+            'end_states': self.end_states,
+        }
+
+    @classmethod
+    def deserialize(cls, data, memo):
+        tokens = data['tokens']
+        states = {
+            state: {tokens[token]: ((Reduce, Rule.deserialize(arg, memo)) if action==1 else (Shift, arg))
+                    for token, (action, arg) in actions.items()}
+            for state, actions in data['states'].items()
+        }
+        return cls(states, data['start_states'], data['end_states'])
+
+class ParseTable(ParseTableBase['State']):
+    #--
+    pass
+
+
+class IntParseTable(ParseTableBase[int]):
+    #--
+
+    @classmethod
+    def from_ParseTable(cls, parse_table: ParseTable):
+        enum = list(parse_table.states)
+        state_to_idx: Dict['State', int] = {s:i for i,s in enumerate(enum)}
+        int_states = {}
+
+        for s, la in parse_table.states.items():
+            la = {k:(v[0], state_to_idx[v[1]]) if v[0] is Shift else v
+                  for k,v in la.items()}
+            int_states[ state_to_idx[s] ] = la
+
+
+        start_states = {start:state_to_idx[s] for start, s in parse_table.start_states.items()}
+        end_states = {start:state_to_idx[s] for start, s in parse_table.end_states.items()}
+        return cls(int_states, start_states, end_states)
+
+
+
+class ParseConf(Generic[StateT]):
+    __slots__ = 'parse_table', 'callbacks', 'start', 'start_state', 'end_state', 'states'
+
+    parse_table: ParseTableBase[StateT]
+    callbacks: ParserCallbacks
+    start: str
+
+    start_state: StateT
+    end_state: StateT
+    states: Dict[StateT, Dict[str, tuple]]
+
+    def __init__(self, parse_table: ParseTableBase[StateT], callbacks: ParserCallbacks, start: str):
+        self.parse_table = parse_table
+
+        self.start_state = self.parse_table.start_states[start]
+        self.end_state = self.parse_table.end_states[start]
+        self.states = self.parse_table.states
+
+        self.callbacks = callbacks
+        self.start = start
+
+class ParserState(Generic[StateT]):
+    __slots__ = 'parse_conf', 'lexer', 'state_stack', 'value_stack'
+
+    parse_conf: ParseConf[StateT]
+    lexer: LexerThread
+    state_stack: List[StateT]
+    value_stack: list
+
+    def __init__(self, parse_conf: ParseConf[StateT], lexer: LexerThread, state_stack=None, value_stack=None):
+        self.parse_conf = parse_conf
+        self.lexer = lexer
+        self.state_stack = state_stack or [self.parse_conf.start_state]
+        self.value_stack = value_stack or []
+
+    @property
+    def position(self) -> StateT:
+        return self.state_stack[-1]
+
+    ##
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ParserState):
+            return NotImplemented
+        return len(self.state_stack) == len(other.state_stack) and self.position == other.position
+
+    def __copy__(self):
+        return self.copy()
+
+    def copy(self, deepcopy_values=True) -> 'ParserState[StateT]':
+        return type(self)(
+            self.parse_conf,
+            self.lexer, ##
+
+            copy(self.state_stack),
+            deepcopy(self.value_stack) if deepcopy_values else copy(self.value_stack),
+        )
+
+    def feed_token(self, token: Token, is_end=False) -> Any:
+        state_stack = self.state_stack
+        value_stack = self.value_stack
+        states = self.parse_conf.states
+        end_state = self.parse_conf.end_state
+        callbacks = self.parse_conf.callbacks
+
+        while True:
+            state = state_stack[-1]
+            try:
+                action, arg = states[state][token.type]
+            except KeyError:
+                expected = {s for s in states[state].keys() if s.isupper()}
+                raise UnexpectedToken(token, expected, state=self, interactive_parser=None)
+
+            assert arg != end_state
+
+            if action is Shift:
+                ##
+
+                assert not is_end
+                state_stack.append(arg)
+                value_stack.append(token if token.type not in callbacks else callbacks[token.type](token))
+                return
+            else:
+                ##
+
+                rule = arg
+                size = len(rule.expansion)
+                if size:
+                    s = value_stack[-size:]
+                    del state_stack[-size:]
+                    del value_stack[-size:]
+                else:
+                    s = []
+
+                value = callbacks[rule](s) if callbacks else s
+
+                _action, new_state = states[state_stack[-1]][rule.origin.name]
+                assert _action is Shift
+                state_stack.append(new_state)
+                value_stack.append(value)
+
+                if is_end and state_stack[-1] == end_state:
+                    return value_stack[-1]
+
+
+class LALR_Parser(Serialize):
+    def __init__(self, parser_conf: ParserConf, debug: bool=False, strict: bool=False):
+        analysis = LALR_Analyzer(parser_conf, debug=debug, strict=strict)
+        analysis.compute_lalr()
+        callbacks = parser_conf.callbacks
+
+        self._parse_table = analysis.parse_table
+        self.parser_conf = parser_conf
+        self.parser = _Parser(analysis.parse_table, callbacks, debug)
+
+    @classmethod
+    def deserialize(cls, data, memo, callbacks, debug=False):
+        inst = cls.__new__(cls)
+        inst._parse_table = IntParseTable.deserialize(data, memo)
+        inst.parser = _Parser(inst._parse_table, callbacks, debug)
+        return inst
+
+    def serialize(self, memo: Any = None) -> Dict[str, Any]:
+        return self._parse_table.serialize(memo)
+
+    def parse_interactive(self, lexer: LexerThread, start: str):
+        return self.parser.parse(lexer, start, start_interactive=True)
+
+    def parse(self, lexer, start, on_error=None):
+        try:
+            return self.parser.parse(lexer, start)
+        except UnexpectedInput as e:
+            if on_error is None:
+                raise
+
+            while True:
+                if isinstance(e, UnexpectedCharacters):
+                    s = e.interactive_parser.lexer_thread.state
+                    p = s.line_ctr.char_pos
+
+                if not on_error(e):
+                    raise e
+
+                if isinstance(e, UnexpectedCharacters):
+                    ##
+
+                    if p == s.line_ctr.char_pos:
+                        s.line_ctr.feed(s.text.text[p:p+1])
+
+                try:
+                    return e.interactive_parser.resume_parse()
+                except UnexpectedToken as e2:
+                    if (isinstance(e, UnexpectedToken)
+                        and e.token.type == e2.token.type == '$END'
+                        and e.interactive_parser == e2.interactive_parser):
+                        ##
+
+                        raise e2
+                    e = e2
+                except UnexpectedCharacters as e2:
+                    e = e2
+
+
+class _Parser:
+    parse_table: ParseTableBase
+    callbacks: ParserCallbacks
+    debug: bool
+
+    def __init__(self, parse_table: ParseTableBase, callbacks: ParserCallbacks, debug: bool=False):
+        self.parse_table = parse_table
+        self.callbacks = callbacks
+        self.debug = debug
+
+    def parse(self, lexer: LexerThread, start: str, value_stack=None, state_stack=None, start_interactive=False):
+        parse_conf = ParseConf(self.parse_table, self.callbacks, start)
+        parser_state = ParserState(parse_conf, lexer, state_stack, value_stack)
+        if start_interactive:
+            return InteractiveParser(self, parser_state, parser_state.lexer)
+        return self.parse_from_state(parser_state)
+
+
+    def parse_from_state(self, state: ParserState, last_token: Optional[Token]=None):
+        #--
+        try:
+            token = last_token
+            for token in state.lexer.lex(state):
+                assert token is not None
+                state.feed_token(token)
+
+            end_token = Token.new_borrow_pos('$END', '', token) if token else Token('$END', '', 0, 1, 1)
+            return state.feed_token(end_token, True)
+        except UnexpectedInput as e:
+            try:
+                e.interactive_parser = InteractiveParser(self, state, state.lexer)
+            except NameError:
+                pass
+            raise e
+        except Exception as e:
+            if self.debug:
+                print("")
+                print("STATE STACK DUMP")
+                print("----------------")
+                for i, s in enumerate(state.state_stack):
+                    print('%d)' % i , s)
+                print("")
+
+            raise
+
+
+class InteractiveParser:
+    #--
+    def __init__(self, parser, parser_state: ParserState, lexer_thread: LexerThread):
+        self.parser = parser
+        self.parser_state = parser_state
+        self.lexer_thread = lexer_thread
+        self.result = None
+
+    @property
+    def lexer_state(self) -> LexerThread:
+        warnings.warn("lexer_state will be removed in subsequent releases. Use lexer_thread instead.", DeprecationWarning)
+        return self.lexer_thread
+
+    def feed_token(self, token: Token):
+        #--
+        return self.parser_state.feed_token(token, token.type == '$END')
+
+    def iter_parse(self) -> Iterator[Token]:
+        #--
+        for token in self.lexer_thread.lex(self.parser_state):
+            yield token
+            self.result = self.feed_token(token)
+
+    def exhaust_lexer(self) -> List[Token]:
+        #--
+        return list(self.iter_parse())
+
+
+    def feed_eof(self, last_token=None):
+        #--
+        eof = Token.new_borrow_pos('$END', '', last_token) if last_token is not None else self.lexer_thread._Token('$END', '', 0, 1, 1)
+        return self.feed_token(eof)
+
+
+    def __copy__(self):
+        #--
+        return self.copy()
+
+    def copy(self, deepcopy_values=True):
+        return type(self)(
+            self.parser,
+            self.parser_state.copy(deepcopy_values=deepcopy_values),
+            copy(self.lexer_thread),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, InteractiveParser):
+            return False
+
+        return self.parser_state == other.parser_state and self.lexer_thread == other.lexer_thread
+
+    def as_immutable(self):
+        #--
+        p = copy(self)
+        return ImmutableInteractiveParser(p.parser, p.parser_state, p.lexer_thread)
+
+    def pretty(self):
+        #--
+        out = ["Parser choices:"]
+        for k, v in self.choices().items():
+            out.append('\t- %s -> %r' % (k, v))
+        out.append('stack size: %s' % len(self.parser_state.state_stack))
+        return '\n'.join(out)
+
+    def choices(self):
+        #--
+        return self.parser_state.parse_conf.parse_table.states[self.parser_state.position]
+
+    def accepts(self):
+        #--
+        accepts = set()
+        conf_no_callbacks = copy(self.parser_state.parse_conf)
+        ##
+
+        ##
+
+        conf_no_callbacks.callbacks = {}
+        for t in self.choices():
+            if t.isupper(): ##
+
+                new_cursor = self.copy(deepcopy_values=False)
+                new_cursor.parser_state.parse_conf = conf_no_callbacks
+                try:
+                    new_cursor.feed_token(self.lexer_thread._Token(t, ''))
+                except UnexpectedToken:
+                    pass
+                else:
+                    accepts.add(t)
+        return accepts
+
+    def resume_parse(self):
+        #--
+        return self.parser.parse_from_state(self.parser_state, last_token=self.lexer_thread.state.last_token)
+
+
+
+class ImmutableInteractiveParser(InteractiveParser):
+    #--
+
+    result = None
+
+    def __hash__(self):
+        return hash((self.parser_state, self.lexer_thread))
+
+    def feed_token(self, token):
+        c = copy(self)
+        c.result = InteractiveParser.feed_token(c, token)
+        return c
+
+    def exhaust_lexer(self):
+        #--
+        cursor = self.as_mutable()
+        cursor.exhaust_lexer()
+        return cursor.as_immutable()
+
+    def as_mutable(self):
+        #--
+        p = copy(self)
+        return InteractiveParser(p.parser, p.parser_state, p.lexer_thread)
+
+
+
+def _wrap_lexer(lexer_class):
+    future_interface = getattr(lexer_class, '__future_interface__', 0)
+    if future_interface == 2:
+        return lexer_class
+    elif future_interface == 1:
+        class CustomLexerWrapper1(Lexer):
+            def __init__(self, lexer_conf):
+                self.lexer = lexer_class(lexer_conf)
+            def lex(self, lexer_state, parser_state):
+                if isinstance(lexer_state.text, TextSlice) and not lexer_state.text.is_complete_text():
+                    raise TypeError("Interface=1 Custom Lexer don't support TextSlice")
+                lexer_state.text = lexer_state.text
+                return self.lexer.lex(lexer_state, parser_state)
+        return CustomLexerWrapper1
+    elif future_interface == 0:
+        class CustomLexerWrapper0(Lexer):
+            def __init__(self, lexer_conf):
+                self.lexer = lexer_class(lexer_conf)
+
+            def lex(self, lexer_state, parser_state):
+                if isinstance(lexer_state.text, TextSlice):
+                    if not lexer_state.text.is_complete_text():
+                        raise TypeError("Interface=0 Custom Lexer don't support TextSlice")
+                    return self.lexer.lex(lexer_state.text.text)
+                return self.lexer.lex(lexer_state.text)
+        return CustomLexerWrapper0
+    else:
+        raise ValueError(f"Unknown __future_interface__ value {future_interface}, integer 0-2 expected")
+
+
+def _deserialize_parsing_frontend(data, memo, lexer_conf, callbacks, options):
+    parser_conf = ParserConf.deserialize(data['parser_conf'], memo)
+    cls = (options and options._plugins.get('LALR_Parser')) or LALR_Parser
+    parser = cls.deserialize(data['parser'], memo, callbacks, options.debug)
+    parser_conf.callbacks = callbacks
+    return ParsingFrontend(lexer_conf, parser_conf, options, parser=parser)
+
+
+_parser_creators: 'Dict[str, Callable[[LexerConf, Any, Any], Any]]' = {}
+
+
+class ParsingFrontend(Serialize):
+    __serialize_fields__ = 'lexer_conf', 'parser_conf', 'parser'
+
+    lexer_conf: LexerConf
+    parser_conf: ParserConf
+    options: Any
+
+    def __init__(self, lexer_conf: LexerConf, parser_conf: ParserConf, options, parser=None):
+        self.parser_conf = parser_conf
+        self.lexer_conf = lexer_conf
+        self.options = options
+
+        ##
+
+        if parser:  ##
+
+            self.parser = parser
+        else:
+            create_parser = _parser_creators.get(parser_conf.parser_type)
+            assert create_parser is not None, "{} is not supported in standalone mode".format(
+                    parser_conf.parser_type
+                )
+            self.parser = create_parser(lexer_conf, parser_conf, options)
+
+        ##
+
+        lexer_type = lexer_conf.lexer_type
+        self.skip_lexer = False
+        if lexer_type in ('dynamic', 'dynamic_complete'):
+            assert lexer_conf.postlex is None
+            self.skip_lexer = True
+            return
+
+        if isinstance(lexer_type, type):
+            assert issubclass(lexer_type, Lexer)
+            self.lexer = _wrap_lexer(lexer_type)(lexer_conf)
+        elif isinstance(lexer_type, str):
+            create_lexer = {
+                'basic': create_basic_lexer,
+                'contextual': create_contextual_lexer,
+            }[lexer_type]
+            self.lexer = create_lexer(lexer_conf, self.parser, lexer_conf.postlex, options)
+        else:
+            raise TypeError("Bad value for lexer_type: {lexer_type}")
+
+        if lexer_conf.postlex:
+            self.lexer = PostLexConnector(self.lexer, lexer_conf.postlex)
+
+    def _verify_start(self, start=None):
+        if start is None:
+            start_decls = self.parser_conf.start
+            if len(start_decls) > 1:
+                raise ConfigurationError("Lark initialized with more than 1 possible start rule. Must specify which start rule to parse", start_decls)
+            start ,= start_decls
+        elif start not in self.parser_conf.start:
+            raise ConfigurationError("Unknown start rule %s. Must be one of %r" % (start, self.parser_conf.start))
+        return start
+
+    def _make_lexer_thread(self, text: Optional[LarkInput]) -> Union[LarkInput, LexerThread, None]:
+        cls = (self.options and self.options._plugins.get('LexerThread')) or LexerThread
+        if self.skip_lexer:
+            return text
+        if text is None:
+            return cls(self.lexer, None)
+        if isinstance(text, (str, bytes, TextSlice)):
+            return cls.from_text(self.lexer, text)
+        return cls.from_custom_input(self.lexer, text)
+
+    def parse(self, text: Optional[LarkInput], start=None, on_error=None):
+        if self.lexer_conf.lexer_type in ("dynamic", "dynamic_complete"):
+            if isinstance(text, TextSlice) and not text.is_complete_text():
+                raise TypeError(f"Lexer {self.lexer_conf.lexer_type} does not support text slices.")
+
+        chosen_start = self._verify_start(start)
+        kw = {} if on_error is None else {'on_error': on_error}
+        stream = self._make_lexer_thread(text)
+        return self.parser.parse(stream, chosen_start, **kw)
+
+    def parse_interactive(self, text: Optional[TextOrSlice]=None, start=None):
+        ##
+
+        ##
+
+        chosen_start = self._verify_start(start)
+        if self.parser_conf.parser_type != 'lalr':
+            raise ConfigurationError("parse_interactive() currently only works with parser='lalr' ")
+        stream = self._make_lexer_thread(text)
+        return self.parser.parse_interactive(stream, chosen_start)
+
+
+def _validate_frontend_args(parser, lexer) -> None:
+    assert_config(parser, ('lalr', 'earley', 'cyk'))
+    if not isinstance(lexer, type):     ##
+
+        expected = {
+            'lalr': ('basic', 'contextual'),
+            'earley': ('basic', 'dynamic', 'dynamic_complete'),
+            'cyk': ('basic', ),
+         }[parser]
+        assert_config(lexer, expected, 'Parser %r does not support lexer %%r, expected one of %%s' % parser)
+
+
+def _get_lexer_callbacks(transformer, terminals):
+    result = {}
+    for terminal in terminals:
+        callback = getattr(transformer, terminal.name, None)
+        if callback is not None:
+            result[terminal.name] = callback
+    return result
+
+class PostLexConnector:
+    def __init__(self, lexer, postlexer):
+        self.lexer = lexer
+        self.postlexer = postlexer
+
+    def lex(self, lexer_state, parser_state):
+        i = self.lexer.lex(lexer_state, parser_state)
+        return self.postlexer.process(i)
+
+
+
+def create_basic_lexer(lexer_conf, parser, postlex, options) -> BasicLexer:
+    cls = (options and options._plugins.get('BasicLexer')) or BasicLexer
+    return cls(lexer_conf)
+
+def create_contextual_lexer(lexer_conf: LexerConf, parser, postlex, options) -> ContextualLexer:
+    cls = (options and options._plugins.get('ContextualLexer')) or ContextualLexer
+    parse_table: ParseTableBase[int] = parser._parse_table
+    states: Dict[int, Collection[str]] = {idx:list(t.keys()) for idx, t in parse_table.states.items()}
+    always_accept: Collection[str] = postlex.always_accept if postlex else ()
+    return cls(lexer_conf, states, always_accept=always_accept)
+
+def create_lalr_parser(lexer_conf: LexerConf, parser_conf: ParserConf, options=None) -> LALR_Parser:
+    debug = options.debug if options else False
+    strict = options.strict if options else False
+    cls = (options and options._plugins.get('LALR_Parser')) or LALR_Parser
+    return cls(parser_conf, debug=debug, strict=strict)
+
+_parser_creators['lalr'] = create_lalr_parser
+
+
+
+
+class PostLex(ABC):
+    @abstractmethod
+    def process(self, stream: Iterator[Token]) -> Iterator[Token]:
+        return stream
+
+    always_accept: Iterable[str] = ()
+
+class LarkOptions(Serialize):
+    #--
+
+    start: List[str]
+    debug: bool
+    strict: bool
+    transformer: 'Optional[Transformer]'
+    propagate_positions: Union[bool, str]
+    maybe_placeholders: bool
+    cache: Union[bool, str]
+    cache_grammar: bool
+    regex: bool
+    g_regex_flags: int
+    keep_all_tokens: bool
+    tree_class: Optional[Callable[[str, List], Any]]
+    parser: _ParserArgType
+    lexer: _LexerArgType
+    ambiguity: 'Literal["auto", "resolve", "explicit", "forest"]'
+    postlex: Optional[PostLex]
+    priority: 'Optional[Literal["auto", "normal", "invert"]]'
+    lexer_callbacks: Dict[str, Callable[[Token], Token]]
+    use_bytes: bool
+    ordered_sets: bool
+    edit_terminals: Optional[Callable[[TerminalDef], TerminalDef]]
+    import_paths: 'List[Union[str, Callable[[Union[None, str, PackageResource], str], Tuple[str, str]]]]'
+    source_path: Optional[str]
+
+    OPTIONS_DOC = r"""
+    **===  General Options  ===**
+
+    start
+            The start symbol. Either a string, or a list of strings for multiple possible starts (Default: "start")
+    debug
+            Display debug information and extra warnings. Use only when debugging (Default: ``False``)
+            When used with Earley, it generates a forest graph as "sppf.png", if 'dot' is installed.
+    strict
+            Throw an exception on any potential ambiguity, including shift/reduce conflicts, and regex collisions.
+    transformer
+            Applies the transformer to every parse tree (equivalent to applying it after the parse, but faster)
+    propagate_positions
+            Propagates positional attributes into the 'meta' attribute of all tree branches.
+            Sets attributes: (line, column, end_line, end_column, start_pos, end_pos,
+                              container_line, container_column, container_end_line, container_end_column)
+            Accepts ``False``, ``True``, or a callable, which will filter which nodes to ignore when propagating.
+    maybe_placeholders
+            When ``True``, the ``[]`` operator returns ``None`` when not matched.
+            When ``False``,  ``[]`` behaves like the ``?`` operator, and returns no value at all.
+            (default= ``True``)
+    cache
+            Cache the results of the Lark grammar analysis, for x2 to x3 faster loading. LALR only for now.
+
+            - When ``False``, does nothing (default)
+            - When ``True``, caches to a temporary file in the local directory
+            - When given a string, caches to the path pointed by the string
+    cache_grammar
+            For use with ``cache`` option. When ``True``, the unanalyzed grammar is also included in the cache.
+            Useful for classes that require the ``Lark.grammar`` to be present (e.g. Reconstructor).
+            (default= ``False``)
+    regex
+            When True, uses the ``regex`` module instead of the stdlib ``re``.
+    g_regex_flags
+            Flags that are applied to all terminals (both regex and strings)
+    keep_all_tokens
+            Prevent the tree builder from automagically removing "punctuation" tokens (Default: ``False``)
+    tree_class
+            Lark will produce trees comprised of instances of this class instead of the default ``lark.Tree``.
+
+    **=== Algorithm Options ===**
+
+    parser
+            Decides which parser engine to use. Accepts "earley" or "lalr". (Default: "earley").
+            (there is also a "cyk" option for legacy)
+    lexer
+            Decides whether or not to use a lexer stage
+
+            - "auto" (default): Choose for me based on the parser
+            - "basic": Use a basic lexer
+            - "contextual": Stronger lexer (only works with parser="lalr")
+            - "dynamic": Flexible and powerful (only with parser="earley")
+            - "dynamic_complete": Same as dynamic, but tries *every* variation of tokenizing possible.
+    ambiguity
+            Decides how to handle ambiguity in the parse. Only relevant if parser="earley"
+
+            - "resolve": The parser will automatically choose the simplest derivation
+              (it chooses consistently: greedy for tokens, non-greedy for rules)
+            - "explicit": The parser will return all derivations wrapped in "_ambig" tree nodes (i.e. a forest).
+            - "forest": The parser will return the root of the shared packed parse forest.
+
+    **=== Misc. / Domain Specific Options ===**
+
+    postlex
+            Lexer post-processing (Default: ``None``) Only works with the basic and contextual lexers.
+    priority
+            How priorities should be evaluated - "auto", ``None``, "normal", "invert" (Default: "auto")
+    lexer_callbacks
+            Dictionary of callbacks for the lexer. May alter tokens during lexing. Use with caution.
+    use_bytes
+            Accept an input of type ``bytes`` instead of ``str``.
+    ordered_sets
+            Should Earley use ordered-sets to achieve stable output (~10% slower than regular sets. Default: True)
+    edit_terminals
+            A callback for editing the terminals before parse.
+    import_paths
+            A List of either paths or loader functions to specify from where grammars are imported
+    source_path
+            Override the source of from where the grammar was loaded. Useful for relative imports and unconventional grammar loading
+    **=== End of Options ===**
+    """
+    if __doc__:
+        __doc__ += OPTIONS_DOC
+
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    _defaults: Dict[str, Any] = {
+        'debug': False,
+        'strict': False,
+        'keep_all_tokens': False,
+        'tree_class': None,
+        'cache': False,
+        'cache_grammar': False,
+        'postlex': None,
+        'parser': 'earley',
+        'lexer': 'auto',
+        'transformer': None,
+        'start': 'start',
+        'priority': 'auto',
+        'ambiguity': 'auto',
+        'regex': False,
+        'propagate_positions': False,
+        'lexer_callbacks': {},
+        'maybe_placeholders': True,
+        'edit_terminals': None,
+        'g_regex_flags': 0,
+        'use_bytes': False,
+        'ordered_sets': True,
+        'import_paths': [],
+        'source_path': None,
+        '_plugins': {},
+    }
+
+    def __init__(self, options_dict: Dict[str, Any]) -> None:
+        o = dict(options_dict)
+
+        options = {}
+        for name, default in self._defaults.items():
+            if name in o:
+                value = o.pop(name)
+                if isinstance(default, bool) and name not in ('cache', 'use_bytes', 'propagate_positions'):
+                    value = bool(value)
+            else:
+                value = default
+
+            options[name] = value
+
+        if isinstance(options['start'], str):
+            options['start'] = [options['start']]
+
+        self.__dict__['options'] = options
+
+
+        assert_config(self.parser, ('earley', 'lalr', 'cyk', None))
+
+        if self.parser == 'earley' and self.transformer:
+            raise ConfigurationError('Cannot specify an embedded transformer when using the Earley algorithm. '
+                             'Please use your transformer on the resulting parse tree, or use a different algorithm (i.e. LALR)')
+
+        if self.cache_grammar and not self.cache:
+            raise ConfigurationError('cache_grammar cannot be set when cache is disabled')
+
+        if o:
+            raise ConfigurationError("Unknown options: %s" % o.keys())
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.__dict__['options'][name]
+        except KeyError as e:
+            raise AttributeError(e)
+
+    def __setattr__(self, name: str, value: str) -> None:
+        assert_config(name, self.options.keys(), "%r isn't a valid option. Expected one of: %s")
+        self.options[name] = value
+
+    def serialize(self, memo = None) -> Dict[str, Any]:
+        return self.options
+
+    @classmethod
+    def deserialize(cls, data: Dict[str, Any], memo: Dict[int, Union[TerminalDef, Rule]]) -> "LarkOptions":
+        return cls(data)
+
+
+##
+
+##
+
+_LOAD_ALLOWED_OPTIONS = {'postlex', 'transformer', 'lexer_callbacks', 'use_bytes', 'debug', 'g_regex_flags', 'regex', 'propagate_positions', 'tree_class', '_plugins'}
+
+_VALID_PRIORITY_OPTIONS = ('auto', 'normal', 'invert', None)
+_VALID_AMBIGUITY_OPTIONS = ('auto', 'resolve', 'explicit', 'forest')
+
+
+_T = TypeVar('_T', bound="Lark")
+
+class Lark(Serialize):
+    #--
+
+    source_path: str
+    source_grammar: str
+    grammar: 'Grammar'
+    options: LarkOptions
+    lexer: Lexer
+    parser: 'ParsingFrontend'
+    terminals: Collection[TerminalDef]
+
+    __serialize_fields__ = ['parser', 'rules', 'options']
+
+    def __init__(self, grammar: 'Union[Grammar, str, IO[str]]', **options) -> None:
+        self.options = LarkOptions(options)
+        re_module: types.ModuleType
+
+        ##
+
+        if self.options.cache_grammar:
+            self.__serialize_fields__ = self.__serialize_fields__ + ['grammar']
+
+        ##
+
+        use_regex = self.options.regex
+        if use_regex:
+            if _has_regex:
+                re_module = regex
+            else:
+                raise ImportError('`regex` module must be installed if calling `Lark(regex=True)`.')
+        else:
+            re_module = re
+
+        ##
+
+        if self.options.source_path is None:
+            try:
+                self.source_path = grammar.name  ##
+
+            except AttributeError:
+                self.source_path = '<string>'
+        else:
+            self.source_path = self.options.source_path
+
+        ##
+
+        try:
+            read = grammar.read  ##
+
+        except AttributeError:
+            pass
+        else:
+            grammar = read()
+
+        cache_fn = None
+        cache_sha256 = None
+        if isinstance(grammar, str):
+            self.source_grammar = grammar
+            if self.options.use_bytes:
+                if not grammar.isascii():
+                    raise ConfigurationError("Grammar must be ascii only, when use_bytes=True")
+
+            if self.options.cache:
+                if self.options.parser != 'lalr':
+                    raise ConfigurationError("cache only works with parser='lalr' for now")
+
+                unhashable = ('transformer', 'postlex', 'lexer_callbacks', 'edit_terminals', '_plugins')
+                options_str = ''.join(k+str(v) for k, v in options.items() if k not in unhashable)
+                from . import __version__
+                s = grammar + options_str + __version__ + str(sys.version_info[:2])
+                cache_sha256 = sha256_digest(s)
+
+                if isinstance(self.options.cache, str):
+                    cache_fn = self.options.cache
+                else:
+                    if self.options.cache is not True:
+                        raise ConfigurationError("cache argument must be bool or str")
+
+                    try:
+                        username = getpass.getuser()
+                    except Exception:
+                        ##
+
+                        ##
+
+                        ##
+
+                        username = "unknown"
+
+
+                    cache_fn = tempfile.gettempdir() + "/.lark_%s_%s_%s_%s_%s.tmp" % (
+                        "cache_grammar" if self.options.cache_grammar else "cache", username, cache_sha256, *sys.version_info[:2])
+
+                old_options = self.options
+                try:
+                    with FS.open(cache_fn, 'rb') as f:
+                        logger.debug('Loading grammar from cache: %s', cache_fn)
+                        ##
+
+                        for name in (set(options) - _LOAD_ALLOWED_OPTIONS):
+                            del options[name]
+                        file_sha256 = f.readline().rstrip(b'\n')
+                        cached_used_files = pickle.load(f)
+                        if file_sha256 == cache_sha256.encode('utf8') and verify_used_files(cached_used_files):
+                            cached_parser_data = pickle.load(f)
+                            self._load(cached_parser_data, **options)
+                            return
+                except FileNotFoundError:
+                    ##
+
+                    pass
+                except Exception: ##
+
+                    logger.exception("Failed to load Lark from cache: %r. We will try to carry on.", cache_fn)
+
+                    ##
+
+                    ##
+
+                    self.options = old_options
+
+
+            ##
+
+            self.grammar, used_files = load_grammar(grammar, self.source_path, self.options.import_paths, self.options.keep_all_tokens)
+        else:
+            assert isinstance(grammar, Grammar)
+            self.grammar = grammar
+
+
+        if self.options.lexer == 'auto':
+            if self.options.parser == 'lalr':
+                self.options.lexer = 'contextual'
+            elif self.options.parser == 'earley':
+                if self.options.postlex is not None:
+                    logger.info("postlex can't be used with the dynamic lexer, so we use 'basic' instead. "
+                                "Consider using lalr with contextual instead of earley")
+                    self.options.lexer = 'basic'
+                else:
+                    self.options.lexer = 'dynamic'
+            elif self.options.parser == 'cyk':
+                self.options.lexer = 'basic'
+            else:
+                assert False, self.options.parser
+        lexer = self.options.lexer
+        if isinstance(lexer, type):
+            assert issubclass(lexer, Lexer)     ##
+
+        else:
+            assert_config(lexer, ('basic', 'contextual', 'dynamic', 'dynamic_complete'))
+            if self.options.postlex is not None and 'dynamic' in lexer:
+                raise ConfigurationError("Can't use postlex with a dynamic lexer. Use basic or contextual instead")
+
+        if self.options.ambiguity == 'auto':
+            if self.options.parser == 'earley':
+                self.options.ambiguity = 'resolve'
+        else:
+            assert_config(self.options.parser, ('earley', 'cyk'), "%r doesn't support disambiguation. Use one of these parsers instead: %s")
+
+        if self.options.priority == 'auto':
+            self.options.priority = 'normal'
+
+        if self.options.priority not in _VALID_PRIORITY_OPTIONS:
+            raise ConfigurationError("invalid priority option: %r. Must be one of %r" % (self.options.priority, _VALID_PRIORITY_OPTIONS))
+        if self.options.ambiguity not in _VALID_AMBIGUITY_OPTIONS:
+            raise ConfigurationError("invalid ambiguity option: %r. Must be one of %r" % (self.options.ambiguity, _VALID_AMBIGUITY_OPTIONS))
+
+        if self.options.parser is None:
+            terminals_to_keep = '*'     ##
+
+        elif self.options.postlex is not None:
+            terminals_to_keep = set(self.options.postlex.always_accept)
+        else:
+            terminals_to_keep = set()
+
+        ##
+
+        self.terminals, self.rules, self.ignore_tokens = self.grammar.compile(self.options.start, terminals_to_keep)
+
+        if self.options.edit_terminals:
+            for t in self.terminals:
+                self.options.edit_terminals(t)
+
+        self._terminals_dict = {t.name: t for t in self.terminals}
+
+        ##
+
+        if self.options.priority == 'invert':
+            for rule in self.rules:
+                if rule.options.priority is not None:
+                    rule.options.priority = -rule.options.priority
+            for term in self.terminals:
+                term.priority = -term.priority
+        ##
+
+        ##
+
+        ##
+
+        elif self.options.priority is None:
+            for rule in self.rules:
+                if rule.options.priority is not None:
+                    rule.options.priority = None
+            for term in self.terminals:
+                term.priority = 0
+
+        ##
+
+        self.lexer_conf = LexerConf(
+                self.terminals, re_module, self.ignore_tokens, self.options.postlex,
+                self.options.lexer_callbacks, self.options.g_regex_flags, use_bytes=self.options.use_bytes, strict=self.options.strict
+            )
+
+        if self.options.parser:
+            self.parser = self._build_parser()
+        elif lexer:
+            self.lexer = self._build_lexer()
+
+        if cache_fn:
+            logger.debug('Saving grammar to cache: %s', cache_fn)
+            try:
+                with FS.open(cache_fn, 'wb') as f:
+                    assert cache_sha256 is not None
+                    f.write(cache_sha256.encode('utf8') + b'\n')
+                    pickle.dump(used_files, f)
+                    self.save(f, _LOAD_ALLOWED_OPTIONS)
+            except IOError as e:
+                logger.exception("Failed to save Lark to cache: %r.", cache_fn, e)
+
+    if __doc__:
+        __doc__ += "\n\n" + LarkOptions.OPTIONS_DOC
+
+    def _build_lexer(self, dont_ignore: bool=False) -> BasicLexer:
+        lexer_conf = self.lexer_conf
+        if dont_ignore:
+            from copy import copy
+            lexer_conf = copy(lexer_conf)
+            lexer_conf.ignore = ()
+        return BasicLexer(lexer_conf)
+
+    def _prepare_callbacks(self) -> None:
+        self._callbacks = {}
+        ##
+
+        if self.options.ambiguity != 'forest':
+            self._parse_tree_builder = ParseTreeBuilder(
+                    self.rules,
+                    self.options.tree_class or Tree,
+                    self.options.propagate_positions,
+                    self.options.parser != 'lalr' and self.options.ambiguity == 'explicit',
+                    self.options.maybe_placeholders
+                )
+            self._callbacks = self._parse_tree_builder.create_callback(self.options.transformer)
+        self._callbacks.update(_get_lexer_callbacks(self.options.transformer, self.terminals))
+
+    def _build_parser(self) -> "ParsingFrontend":
+        self._prepare_callbacks()
+        _validate_frontend_args(self.options.parser, self.options.lexer)
+        parser_conf = ParserConf(self.rules, self._callbacks, self.options.start)
+        return _construct_parsing_frontend(
+            self.options.parser,
+            self.options.lexer,
+            self.lexer_conf,
+            parser_conf,
+            options=self.options
+        )
+
+    def save(self, f, exclude_options: Collection[str] = ()) -> None:
+        #--
+        if self.options.parser != 'lalr':
+            raise NotImplementedError("Lark.save() is only implemented for the LALR(1) parser.")
+        data, m = self.memo_serialize([TerminalDef, Rule])
+        if exclude_options:
+            data["options"] = {n: v for n, v in data["options"].items() if n not in exclude_options}
+        pickle.dump({'data': data, 'memo': m}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls: Type[_T], f) -> _T:
+        #--
+        inst = cls.__new__(cls)
+        return inst._load(f)
+
+    def _deserialize_lexer_conf(self, data: Dict[str, Any], memo: Dict[int, Union[TerminalDef, Rule]], options: LarkOptions) -> LexerConf:
+        lexer_conf = LexerConf.deserialize(data['lexer_conf'], memo)
+        lexer_conf.callbacks = options.lexer_callbacks or {}
+        lexer_conf.re_module = regex if options.regex else re
+        lexer_conf.use_bytes = options.use_bytes
+        lexer_conf.g_regex_flags = options.g_regex_flags
+        lexer_conf.skip_validation = True
+        lexer_conf.postlex = options.postlex
+        return lexer_conf
+
+    def _load(self: _T, f: Any, **kwargs) -> _T:
+        if isinstance(f, dict):
+            d = f
+        else:
+            d = pickle.load(f)
+        memo_json = d['memo']
+        data = d['data']
+
+        assert memo_json
+        memo = SerializeMemoizer.deserialize(memo_json, {'Rule': Rule, 'TerminalDef': TerminalDef}, {})
+        if 'grammar' in data:
+            self.grammar = Grammar.deserialize(data['grammar'], memo)
+        options = dict(data['options'])
+        if (set(kwargs) - _LOAD_ALLOWED_OPTIONS) & set(LarkOptions._defaults):
+            raise ConfigurationError("Some options are not allowed when loading a Parser: {}"
+                             .format(set(kwargs) - _LOAD_ALLOWED_OPTIONS))
+        options.update(kwargs)
+        self.options = LarkOptions.deserialize(options, memo)
+        self.rules = [Rule.deserialize(r, memo) for r in data['rules']]
+        self.source_path = '<deserialized>'
+        _validate_frontend_args(self.options.parser, self.options.lexer)
+        self.lexer_conf = self._deserialize_lexer_conf(data['parser'], memo, self.options)
+        self.terminals = self.lexer_conf.terminals
+        self._prepare_callbacks()
+        self._terminals_dict = {t.name: t for t in self.terminals}
+        self.parser = _deserialize_parsing_frontend(
+            data['parser'],
+            memo,
+            self.lexer_conf,
+            self._callbacks,
+            self.options,  ##
+
+        )
+        return self
+
+    @classmethod
+    def _load_from_dict(cls, data, memo, **kwargs):
+        inst = cls.__new__(cls)
+        return inst._load({'data': data, 'memo': memo}, **kwargs)
+
+    @classmethod
+    def open(cls: Type[_T], grammar_filename: str, rel_to: Optional[str]=None, **options) -> _T:
+        #--
+        if rel_to:
+            basepath = os.path.dirname(rel_to)
+            grammar_filename = os.path.join(basepath, grammar_filename)
+        with open(grammar_filename, encoding='utf8') as f:
+            return cls(f, **options)
+
+    @classmethod
+    def open_from_package(cls: Type[_T], package: str, grammar_path: str, search_paths: 'Sequence[str]'=[""], **options) -> _T:
+        #--
+        package_loader = FromPackageLoader(package, search_paths)
+        full_path, text = package_loader(None, grammar_path)
+        options.setdefault('source_path', full_path)
+        options.setdefault('import_paths', [])
+        options['import_paths'].append(package_loader)
+        return cls(text, **options)
+
+    def __repr__(self):
+        return 'Lark(open(%r), parser=%r, lexer=%r, ...)' % (self.source_path, self.options.parser, self.options.lexer)
+
+
+    def lex(self, text: TextOrSlice, dont_ignore: bool=False) -> Iterator[Token]:
+        #--
+        lexer: Lexer
+        if not hasattr(self, 'lexer') or dont_ignore:
+            lexer = self._build_lexer(dont_ignore)
+        else:
+            lexer = self.lexer
+        lexer_thread = LexerThread.from_text(lexer, text)
+        stream = lexer_thread.lex(None)
+        if self.options.postlex:
+            return self.options.postlex.process(stream)
+        return stream
+
+    def get_terminal(self, name: str) -> TerminalDef:
+        #--
+        return self._terminals_dict[name]
+
+    def parse_interactive(self, text: Optional[LarkInput]=None, start: Optional[str]=None) -> 'InteractiveParser':
+        #--
+        return self.parser.parse_interactive(text, start=start)
+
+    def parse(self, text: LarkInput, start: Optional[str]=None, on_error: 'Optional[Callable[[UnexpectedInput], bool]]'=None) -> 'ParseTree':
+        #--
+        if on_error is not None and self.options.parser != 'lalr':
+            raise NotImplementedError("The on_error option is only implemented for the LALR(1) parser.")
+        return self.parser.parse(text, start=start, on_error=on_error)
+
+
+
+
+class DedentError(LarkError):
+    pass
+
+class Indenter(PostLex, ABC):
+    #--
+    paren_level: int
+    indent_level: List[int]
+
+    def __init__(self) -> None:
+        self.paren_level = 0
+        self.indent_level = [0]
+        assert self.tab_len > 0
+
+    def handle_NL(self, token: Token) -> Iterator[Token]:
+        if self.paren_level > 0:
+            return
+
+        yield token
+
+        indent_str = token.rsplit('\n', 1)[1] ##
+
+        indent = indent_str.count(' ') + indent_str.count('\t') * self.tab_len
+
+        if indent > self.indent_level[-1]:
+            self.indent_level.append(indent)
+            yield Token.new_borrow_pos(self.INDENT_type, indent_str, token)
+        else:
+            while indent < self.indent_level[-1]:
+                self.indent_level.pop()
+                yield Token.new_borrow_pos(self.DEDENT_type, indent_str, token)
+
+            if indent != self.indent_level[-1]:
+                raise DedentError('Unexpected dedent to column %s. Expected dedent to %s' % (indent, self.indent_level[-1]))
+
+    def _process(self, stream):
+        token = None
+        for token in stream:
+            if token.type == self.NL_type:
+                yield from self.handle_NL(token)
+            else:
+                yield token
+
+            if token.type in self.OPEN_PAREN_types:
+                self.paren_level += 1
+            elif token.type in self.CLOSE_PAREN_types:
+                self.paren_level -= 1
+                assert self.paren_level >= 0
+
+        while len(self.indent_level) > 1:
+            self.indent_level.pop()
+            yield Token.new_borrow_pos(self.DEDENT_type, '', token) if token else Token(self.DEDENT_type, '', 0, 0, 0, 0, 0, 0)
+
+        assert self.indent_level == [0], self.indent_level
+
+    def process(self, stream):
+        self.paren_level = 0
+        self.indent_level = [0]
+        return self._process(stream)
+
+    ##
+
+    @property
+    def always_accept(self):
+        return (self.NL_type,)
+
+    @property
+    @abstractmethod
+    def NL_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def OPEN_PAREN_types(self) -> List[str]:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def CLOSE_PAREN_types(self) -> List[str]:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def INDENT_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def DEDENT_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def tab_len(self) -> int:
+        #--
+        raise NotImplementedError()
+
+
+class PythonIndenter(Indenter):
+    #--
+
+    NL_type = '_NEWLINE'
+    OPEN_PAREN_types = ['LPAR', 'LSQB', 'LBRACE']
+    CLOSE_PAREN_types = ['RPAR', 'RSQB', 'RBRACE']
+    INDENT_type = '_INDENT'
+    DEDENT_type = '_DEDENT'
+    tab_len = 8
+
+
+import pickle, zlib, base64
+DATA = (
+{'parser': {'lexer_conf': {'terminals': [{'@': 0}, {'@': 1}, {'@': 2}, {'@': 3}, {'@': 4}, {'@': 5}, {'@': 6}, {'@': 7}, {'@': 8}, {'@': 9}, {'@': 10}, {'@': 11}, {'@': 12}, {'@': 13}, {'@': 14}, {'@': 15}, {'@': 16}, {'@': 17}, {'@': 18}, {'@': 19}, {'@': 20}, {'@': 21}, {'@': 22}, {'@': 23}, {'@': 24}, {'@': 25}, {'@': 26}, {'@': 27}, {'@': 28}, {'@': 29}, {'@': 30}, {'@': 31}, {'@': 32}, {'@': 33}, {'@': 34}, {'@': 35}, {'@': 36}, {'@': 37}, {'@': 38}, {'@': 39}, {'@': 40}, {'@': 41}, {'@': 42}, {'@': 43}, {'@': 44}, {'@': 45}, {'@': 46}, {'@': 47}, {'@': 48}, {'@': 49}, {'@': 50}, {'@': 51}, {'@': 52}, {'@': 53}, {'@': 54}, {'@': 55}, {'@': 56}, {'@': 57}, {'@': 58}, {'@': 59}], 'ignore': ['CPP_COMMENT', 'NEWLINE', 'WS'], 'g_regex_flags': 0, 'use_bytes': False, 'lexer_type': 'contextual', '__type__': 'LexerConf'}, 'parser_conf': {'rules': [{'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}, {'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}, {'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}, {'@': 133}, {'@': 134}, {'@': 135}, {'@': 136}, {'@': 137}, {'@': 138}, {'@': 139}, {'@': 140}, {'@': 141}, {'@': 142}, {'@': 143}, {'@': 144}, {'@': 145}, {'@': 146}, {'@': 147}, {'@': 148}, {'@': 149}, {'@': 150}, {'@': 151}, {'@': 152}, {'@': 153}, {'@': 154}, {'@': 155}, {'@': 156}, {'@': 157}, {'@': 158}, {'@': 159}, {'@': 160}, {'@': 161}, {'@': 162}, {'@': 163}, {'@': 164}, {'@': 165}, {'@': 166}, {'@': 167}, {'@': 168}, {'@': 169}, {'@': 170}, {'@': 171}, {'@': 172}, {'@': 173}, {'@': 174}, {'@': 175}, {'@': 176}, {'@': 177}, {'@': 178}, {'@': 179}, {'@': 180}, {'@': 181}, {'@': 182}, {'@': 183}, {'@': 184}, {'@': 185}, {'@': 186}, {'@': 187}, {'@': 188}, {'@': 189}, {'@': 190}, {'@': 191}, {'@': 192}, {'@': 193}, {'@': 194}, {'@': 195}, {'@': 196}, {'@': 197}, {'@': 198}, {'@': 199}, {'@': 200}, {'@': 201}, {'@': 202}, {'@': 203}, {'@': 204}, {'@': 205}, {'@': 206}, {'@': 207}, {'@': 208}, {'@': 209}, {'@': 210}, {'@': 211}, {'@': 212}, {'@': 213}, {'@': 214}, {'@': 215}, {'@': 216}, {'@': 217}, {'@': 218}, {'@': 219}, {'@': 220}, {'@': 221}, {'@': 222}, {'@': 223}, {'@': 224}, {'@': 225}, {'@': 226}, {'@': 227}, {'@': 228}, {'@': 229}, {'@': 230}, {'@': 231}, {'@': 232}, {'@': 233}, {'@': 234}, {'@': 235}, {'@': 236}, {'@': 237}, {'@': 238}, {'@': 239}, {'@': 240}, {'@': 241}, {'@': 242}, {'@': 243}, {'@': 244}, {'@': 245}, {'@': 246}, {'@': 247}, {'@': 248}, {'@': 249}, {'@': 250}, {'@': 251}, {'@': 252}, {'@': 253}, {'@': 254}, {'@': 255}, {'@': 256}, {'@': 257}, {'@': 258}, {'@': 259}, {'@': 260}, {'@': 261}, {'@': 262}, {'@': 263}, {'@': 264}, {'@': 265}, {'@': 266}, {'@': 267}, {'@': 268}, {'@': 269}, {'@': 270}, {'@': 271}, {'@': 272}, {'@': 273}, {'@': 274}, {'@': 275}, {'@': 276}, {'@': 277}, {'@': 278}, {'@': 279}, {'@': 280}, {'@': 281}, {'@': 282}, {'@': 283}, {'@': 284}, {'@': 285}, {'@': 286}, {'@': 287}, {'@': 288}, {'@': 289}, {'@': 290}, {'@': 291}, {'@': 292}, {'@': 293}, {'@': 294}, {'@': 295}, {'@': 296}, {'@': 297}, {'@': 298}, {'@': 299}, {'@': 300}, {'@': 301}, {'@': 302}, {'@': 303}, {'@': 304}, {'@': 305}, {'@': 306}, {'@': 307}, {'@': 308}, {'@': 309}, {'@': 310}, {'@': 311}, {'@': 312}, {'@': 313}, {'@': 314}, {'@': 315}, {'@': 316}, {'@': 317}, {'@': 318}, {'@': 319}, {'@': 320}, {'@': 321}, {'@': 322}, {'@': 323}, {'@': 324}, {'@': 325}, {'@': 326}, {'@': 327}, {'@': 328}, {'@': 329}, {'@': 330}, {'@': 331}, {'@': 332}, {'@': 333}, {'@': 334}, {'@': 335}, {'@': 336}, {'@': 337}, {'@': 338}, {'@': 339}, {'@': 340}, {'@': 341}, {'@': 342}, {'@': 343}, {'@': 344}, {'@': 345}, {'@': 346}, {'@': 347}, {'@': 348}, {'@': 349}, {'@': 350}, {'@': 351}, {'@': 352}, {'@': 353}, {'@': 354}, {'@': 355}, {'@': 356}, {'@': 357}, {'@': 358}, {'@': 359}, {'@': 360}, {'@': 361}, {'@': 362}, {'@': 363}, {'@': 364}, {'@': 365}, {'@': 366}, {'@': 367}, {'@': 368}, {'@': 369}, {'@': 370}, {'@': 371}, {'@': 372}, {'@': 373}, {'@': 374}, {'@': 375}, {'@': 376}, {'@': 377}, {'@': 378}, {'@': 379}, {'@': 380}, {'@': 381}, {'@': 382}, {'@': 383}, {'@': 384}, {'@': 385}, {'@': 386}, {'@': 387}, {'@': 388}, {'@': 389}, {'@': 390}, {'@': 391}, {'@': 392}, {'@': 393}, {'@': 394}, {'@': 395}, {'@': 396}, {'@': 397}, {'@': 398}, {'@': 399}, {'@': 400}, {'@': 401}, {'@': 402}, {'@': 403}, {'@': 404}, {'@': 405}, {'@': 406}, {'@': 407}, {'@': 408}, {'@': 409}, {'@': 410}, {'@': 411}, {'@': 412}, {'@': 413}, {'@': 414}, {'@': 415}, {'@': 416}, {'@': 417}, {'@': 418}, {'@': 419}, {'@': 420}, {'@': 421}, {'@': 422}, {'@': 423}, {'@': 424}, {'@': 425}, {'@': 426}, {'@': 427}, {'@': 428}, {'@': 429}, {'@': 430}, {'@': 431}, {'@': 432}, {'@': 433}, {'@': 434}, {'@': 435}, {'@': 436}, {'@': 437}, {'@': 438}, {'@': 439}, {'@': 440}, {'@': 441}, {'@': 442}, {'@': 443}, {'@': 444}, {'@': 445}, {'@': 446}, {'@': 447}, {'@': 448}, {'@': 449}, {'@': 450}, {'@': 451}, {'@': 452}, {'@': 453}, {'@': 454}, {'@': 455}, {'@': 456}, {'@': 457}, {'@': 458}, {'@': 459}, {'@': 460}, {'@': 461}, {'@': 462}, {'@': 463}, {'@': 464}, {'@': 465}, {'@': 466}, {'@': 467}, {'@': 468}, {'@': 469}, {'@': 470}, {'@': 471}, {'@': 472}, {'@': 473}, {'@': 474}, {'@': 475}, {'@': 476}, {'@': 477}, {'@': 478}, {'@': 479}, {'@': 480}, {'@': 481}, {'@': 482}, {'@': 483}, {'@': 484}, {'@': 485}, {'@': 486}, {'@': 487}, {'@': 488}, {'@': 489}, {'@': 490}, {'@': 491}, {'@': 492}, {'@': 493}, {'@': 494}, {'@': 495}, {'@': 496}, {'@': 497}, {'@': 498}, {'@': 499}, {'@': 500}, {'@': 501}, {'@': 502}, {'@': 503}, {'@': 504}, {'@': 505}, {'@': 506}, {'@': 507}, {'@': 508}, {'@': 509}, {'@': 510}, {'@': 511}, {'@': 512}, {'@': 513}, {'@': 514}, {'@': 515}, {'@': 516}, {'@': 517}, {'@': 518}, {'@': 519}, {'@': 520}, {'@': 521}, {'@': 522}, {'@': 523}, {'@': 524}, {'@': 525}, {'@': 526}, {'@': 527}, {'@': 528}, {'@': 529}, {'@': 530}, {'@': 531}, {'@': 532}, {'@': 533}, {'@': 534}, {'@': 535}, {'@': 536}, {'@': 537}, {'@': 538}, {'@': 539}, {'@': 540}, {'@': 541}, {'@': 542}, {'@': 543}, {'@': 544}, {'@': 545}, {'@': 546}, {'@': 547}, {'@': 548}], 'start': ['module', 'rest'], 'parser_type': 'lalr', '__type__': 'ParserConf'}, 'parser': {'tokens': {0: 'RSQB', 1: 'bool_op', 2: 'AND', 3: 'OR', 4: 'LPAR', 5: 'IF', 6: 'PERCENT', 7: '__ANON_10', 8: 'VBAR', 9: 'EXP', 10: '__ANON_8', 11: 'LSQB', 12: '__ANON_5', 13: 'SLASH', 14: 'IS', 15: 'MINUS', 16: 'CIRCUMFLEX', 17: 'IN', 18: 'NOTIN', 19: 'DOT', 20: 'MORETHAN', 21: 'AMPERSAND', 22: 'COLON', 23: '__ANON_6', 24: 'ISNOT', 25: 'PLUS', 26: 'STAR', 27: '__ANON_9', 28: 'AT', 29: 'LESSTHAN', 30: '__ANON_7', 31: 'COMMA', 32: 'RPAR', 33: 'python__IMAG_NUMBER', 34: 'python__OCT_NUMBER', 35: 'FALSE', 36: 'CASE', 37: 'MATCH', 38: '$END', 39: 'UNARY_NOT', 40: 'python__LONG_STRING', 41: 'python__FLOAT_NUMBER', 42: '__ANON_2', 43: 'NONE', 44: 'FOR', 45: 'LBRACE', 46: 'NAME', 47: 'python__HEX_NUMBER', 48: 'ELSE', 49: 'python__DEC_NUMBER', 50: 'python__BIN_NUMBER', 51: 'TRUE', 52: '__ANON_3', 53: 'python__STRING', 54: 'RBRACE', 55: '__ANON_4', 56: 'bool_chain{atom_expr}', 57: 'tail{atom_expr,mul_op}', 58: 'expression', 59: 'atom_expr', 60: 'bool_np{atom_expr}', 61: 'if_else{atom_expr,mul_op}', 62: 'value_np{atom_expr,mul_op}', 63: 'postfix{star_if}', 64: 'tuple', 65: 'open_chain{atom_expr,mul_op}', 66: 'unary_expr', 67: 'assign{mul_op}', 68: 'postfix{star_tail}', 69: 'postfix{tail{atom_expr,mul_op}}', 70: 'name', 71: 'number', 72: 'star_if', 73: 'unbracketed', 74: 'plain{atom_expr,mul_op}', 75: 'word_atom', 76: 'star_tail', 77: 'power', 78: 'postfix{if_else{atom_expr,mul_op}}', 79: 'postfix{assign{mul_op}}', 80: 'unary_op', 81: 'comparison{atom_expr}', 82: 'literals', 83: 'sum{atom_expr}', 84: 'not_op', 85: 'star', 86: 'bit_chain{atom_expr}', 87: 'bit_np{atom_expr}', 88: 'bare', 89: 'bool{atom_expr}', 90: 'comparison_np{atom_expr}', 91: 'body{atom_expr,mul_op}', 92: 'mul_chain{atom_expr,mul_op}', 93: 'atom', 94: 'opening{atom_expr,mul_op}', 95: 'sum_np{atom_expr}', 96: 'slice', 97: 'list', 98: 'value{atom_expr,mul_op}', 99: 'set', 100: 'postfix{atom_expr}', 101: 'string', 102: 'dict', 103: 'postfix{value_np{atom_expr,mul_op}}', 104: 'arguments', 105: 'argument', 106: '__ANON_1', 107: 'call_kwargs', 108: 'last{unbracketed_expr}', 109: 'comparison_np{unbracketed_expr}', 110: 'tail{unbracketed_expr,other_op}', 111: 'unbracketed_expr', 112: 'following', 113: 'open_chain{unbracketed_expr,other_op}', 114: 'plain{unbracketed_expr,other_op}', 115: 'bit_np{unbracketed_expr}', 116: 'closed_if', 117: 'body{unbracketed_expr,other_op}', 118: 'bit_chain{unbracketed_expr}', 119: 'sum{unbracketed_expr}', 120: 'value_np{unbracketed_expr,other_op}', 121: 'later_if', 122: 'postfix{assign{other_op}}', 123: 'bool_np{unbracketed_expr}', 124: 'assign{other_op}', 125: 'mul_chain{unbracketed_expr,other_op}', 126: 'bool{unbracketed_expr}', 127: 'postfix{tail{unbracketed_expr,other_op}}', 128: 'bool_chain{unbracketed_expr}', 129: 'value{unbracketed_expr,other_op}', 130: 'sum_np{unbracketed_expr}', 131: 'postfix{closed_if}', 132: 'postfix{unbracketed_expr}', 133: 'last_assign', 134: 'times{unbracketed_expr}', 135: 'comparison{unbracketed_expr}', 136: 'bit{unbracketed_expr}', 137: 'postfix{value_np{unbracketed_expr,other_op}}', 138: 'tail{bare_expr,mul_op}', 139: 'sum{bare_expr}', 140: 'postfix{value_np{bare_expr,mul_op}}', 141: 'value_np{bare_expr,mul_op}', 142: 'bit_chain{bare_expr}', 143: 'bare_expr', 144: 'open_chain{bare_expr,mul_op}', 145: 'bool_np{bare_expr}', 146: 'sum_np{bare_expr}', 147: 'value{bare_expr,mul_op}', 148: 'bool_chain{bare_expr}', 149: 'condition', 150: 'comparison_np{bare_expr}', 151: 'postfix{bare_expr}', 152: 'comparison{bare_expr}', 153: 'bit_np{bare_expr}', 154: 'plain{bare_expr,mul_op}', 155: 'bool{bare_expr}', 156: 'postfix{tail{bare_expr,mul_op}}', 157: 'mul_chain{bare_expr,mul_op}', 158: '__tuple_plus_2', 159: 'comp_for', 160: 'bit_chain{power}', 161: 'sum{power}', 162: 'bool_np{power}', 163: 'sum_np{power}', 164: 'bit_np{power}', 165: 'comparison_np{power}', 166: 'bool{power}', 167: 'bool_chain{power}', 168: 'comparison{power}', 169: 'sym_comp_op', 170: 'not_comp_op', 171: 'other_op', 172: 'word_comp_op', 173: '_compared_atom', 174: 'bit_op', 175: 'exp_op', 176: 'add_op', 177: 'times_op', 178: '__ANON_0', 179: 'mul_op', 180: 'bool_chain{atom}', 181: 'comparison{atom}', 182: 'comparison_np{atom}', 183: 'sum_np{atom}', 184: 'sum{atom}', 185: 'bool{atom}', 186: 'bool_np{atom}', 187: 'open_chain{atom,other_op}', 188: 'value_np{atom,other_op}', 189: 'mul_chain{atom,other_op}', 190: 'value{atom,other_op}', 191: 'bit_np{atom}', 192: 'times{atom}', 193: 'bit_chain{atom}', 194: 'bit{atom}', 195: 'sum{word_atom}', 196: 'sum_np{word_atom}', 197: 'comparison_np{word_atom}', 198: 'comparison{word_atom}', 199: 'key_value', 200: 'EQUAL', 201: 'bit{power}', 202: '__arguments_star_1', 203: '_compared', 204: 'pair', 205: 'sum{bare}', 206: 'sum_np{bare}', 207: '___sep{key_value,COMMA}_star_3', 208: 'iterable', 209: 'value_np{atom,mul_op}', 210: 'open_chain{atom,mul_op}', 211: 'value{atom,mul_op}', 212: 'mul_chain{atom,mul_op}', 213: '__module_star_0', 214: 'comp_if', 215: 'comp_expr{expression}', 216: 'group', 217: 'operation{atom}', 218: 'later_assign', 219: 'operation{bare}', 220: 'later_else', 221: 'module', 222: 'statement', 223: 'rest', 224: 'comparison{bare}', 225: 'bit_np{bare}', 226: 'open_chain{bare,mul_op}', 227: 'comparison_np{bare}', 228: 'bool_chain{bare}', 229: 'value{bare,mul_op}', 230: 'bit_chain{bare}', 231: 'bool{bare}', 232: 'bool_np{bare}', 233: 'orelse{mul_op}', 234: 'mul_chain{bare,mul_op}', 235: 'value_np{bare,mul_op}', 236: '_sep{key_value,COMMA}', 237: 'comp_expr{key_value}', 238: '_cs_list{expression}', 239: 'postfix{if_else{bare_expr,mul_op}}', 240: 'body{bare_expr,mul_op}', 241: 'if_else{bare_expr,mul_op}', 242: 'opening{bare_expr,mul_op}'}, 'states': {0: {0: (0, 403)}, 1: {1: (0, 678), 2: (0, 684), 3: (0, 595)}, 2: {4: (1, {'@': 201}), 5: (1, {'@': 201}), 6: (1, {'@': 201}), 7: (1, {'@': 201}), 8: (1, {'@': 201}), 9: (1, {'@': 201}), 10: (1, {'@': 201}), 3: (1, {'@': 201}), 11: (1, {'@': 201}), 12: (1, {'@': 201}), 13: (1, {'@': 201}), 14: (1, {'@': 201}), 15: (1, {'@': 201}), 2: (1, {'@': 201}), 16: (1, {'@': 201}), 17: (1, {'@': 201}), 0: (1, {'@': 201}), 18: (1, {'@': 201}), 19: (1, {'@': 201}), 20: (1, {'@': 201}), 21: (1, {'@': 201}), 22: (1, {'@': 201}), 23: (1, {'@': 201}), 24: (1, {'@': 201}), 25: (1, {'@': 201}), 26: (1, {'@': 201}), 27: (1, {'@': 201}), 28: (1, {'@': 201}), 29: (1, {'@': 201}), 30: (1, {'@': 201}), 31: (1, {'@': 201}), 32: (1, {'@': 201}), 33: (1, {'@': 201}), 34: (1, {'@': 201}), 35: (1, {'@': 201}), 36: (1, {'@': 201}), 37: (1, {'@': 201}), 38: (1, {'@': 201}), 39: (1, {'@': 201}), 40: (1, {'@': 201}), 41: (1, {'@': 201}), 42: (1, {'@': 201}), 43: (1, {'@': 201}), 44: (1, {'@': 201}), 45: (1, {'@': 201}), 46: (1, {'@': 201}), 47: (1, {'@': 201}), 48: (1, {'@': 201}), 49: (1, {'@': 201}), 50: (1, {'@': 201}), 51: (1, {'@': 201}), 52: (1, {'@': 201}), 53: (1, {'@': 201}), 54: (1, {'@': 201}), 55: (1, {'@': 201})}, 3: {33: (1, {'@': 528}), 34: (1, {'@': 528}), 35: (1, {'@': 528}), 12: (1, {'@': 528}), 36: (1, {'@': 528}), 37: (1, {'@': 528}), 21: (1, {'@': 528}), 38: (1, {'@': 528}), 23: (1, {'@': 528}), 39: (1, {'@': 528}), 40: (1, {'@': 528}), 41: (1, {'@': 528}), 26: (1, {'@': 528}), 42: (1, {'@': 528}), 32: (1, {'@': 528}), 43: (1, {'@': 528}), 44: (1, {'@': 528}), 4: (1, {'@': 528}), 45: (1, {'@': 528}), 6: (1, {'@': 528}), 8: (1, {'@': 528}), 9: (1, {'@': 528}), 46: (1, {'@': 528}), 31: (1, {'@': 528}), 3: (1, {'@': 528}), 11: (1, {'@': 528}), 13: (1, {'@': 528}), 47: (1, {'@': 528}), 2: (1, {'@': 528}), 49: (1, {'@': 528}), 50: (1, {'@': 528}), 16: (1, {'@': 528}), 0: (1, {'@': 528}), 19: (1, {'@': 528}), 22: (1, {'@': 528}), 51: (1, {'@': 528}), 52: (1, {'@': 528}), 53: (1, {'@': 528}), 54: (1, {'@': 528}), 55: (1, {'@': 528}), 28: (1, {'@': 528})}, 4: {33: (1, {'@': 487}), 34: (1, {'@': 487}), 35: (1, {'@': 487}), 12: (1, {'@': 487}), 36: (1, {'@': 487}), 37: (1, {'@': 487}), 21: (1, {'@': 487}), 38: (1, {'@': 487}), 23: (1, {'@': 487}), 39: (1, {'@': 487}), 40: (1, {'@': 487}), 41: (1, {'@': 487}), 42: (1, {'@': 487}), 32: (1, {'@': 487}), 43: (1, {'@': 487}), 44: (1, {'@': 487}), 4: (1, {'@': 487}), 45: (1, {'@': 487}), 5: (1, {'@': 487}), 8: (1, {'@': 487}), 3: (1, {'@': 487}), 46: (1, {'@': 487}), 31: (1, {'@': 487}), 11: (1, {'@': 487}), 2: (1, {'@': 487}), 47: (1, {'@': 487}), 48: (1, {'@': 487}), 16: (1, {'@': 487}), 49: (1, {'@': 487}), 50: (1, {'@': 487}), 0: (1, {'@': 487}), 19: (1, {'@': 487}), 22: (1, {'@': 487}), 51: (1, {'@': 487}), 52: (1, {'@': 487}), 53: (1, {'@': 487}), 54: (1, {'@': 487}), 55: (1, {'@': 487}), 26: (1, {'@': 487}), 6: (1, {'@': 487}), 13: (1, {'@': 487}), 28: (1, {'@': 487}), 9: (1, {'@': 487})}, 5: {56: (0, 388), 39: (0, 261), 57: (0, 333), 58: (0, 233), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 22: (0, 236), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 96: (0, 382), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 123})}, 6: {33: (1, {'@': 168}), 34: (1, {'@': 168}), 35: (1, {'@': 168}), 36: (1, {'@': 168}), 37: (1, {'@': 168}), 39: (1, {'@': 168}), 40: (1, {'@': 168}), 41: (1, {'@': 168}), 42: (1, {'@': 168}), 43: (1, {'@': 168}), 4: (1, {'@': 168}), 45: (1, {'@': 168}), 46: (1, {'@': 168}), 11: (1, {'@': 168}), 47: (1, {'@': 168}), 49: (1, {'@': 168}), 50: (1, {'@': 168}), 51: (1, {'@': 168}), 52: (1, {'@': 168}), 53: (1, {'@': 168}), 55: (1, {'@': 168})}, 7: {56: (0, 388), 39: (0, 261), 104: (0, 316), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 105: (0, 166), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 122), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 58: (0, 183), 32: (0, 393), 34: (0, 483), 91: (0, 497), 37: (0, 481), 106: (0, 195), 107: (0, 196), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 8: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 93: (0, 625), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 9: {32: (0, 554)}, 10: {39: (0, 261), 108: (0, 370), 109: (0, 407), 40: (0, 437), 110: (0, 378), 70: (0, 375), 111: (0, 294), 112: (0, 406), 113: (0, 715), 114: (0, 704), 115: (0, 150), 116: (0, 235), 117: (0, 152), 66: (0, 528), 118: (0, 142), 45: (0, 504), 119: (0, 217), 120: (0, 11), 73: (0, 36), 50: (0, 600), 121: (0, 165), 122: (0, 19), 123: (0, 25), 124: (0, 32), 71: (0, 661), 55: (0, 708), 42: (0, 606), 49: (0, 669), 47: (0, 675), 80: (0, 628), 53: (0, 618), 125: (0, 15), 82: (0, 593), 126: (0, 62), 84: (0, 621), 127: (0, 38), 33: (0, 283), 128: (0, 24), 88: (0, 419), 36: (0, 276), 129: (0, 109), 130: (0, 13), 131: (0, 23), 132: (0, 124), 34: (0, 483), 133: (0, 66), 37: (0, 481), 134: (0, 115), 135: (0, 111), 43: (0, 519), 46: (0, 534), 41: (0, 458), 136: (0, 116), 137: (0, 117), 51: (0, 540), 52: (0, 544), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 38: (1, {'@': 71})}, 11: {4: (0, 475), 19: (0, 584), 11: (0, 251), 33: (1, {'@': 304}), 34: (1, {'@': 304}), 5: (1, {'@': 304}), 45: (1, {'@': 304}), 46: (1, {'@': 304}), 35: (1, {'@': 304}), 36: (1, {'@': 304}), 37: (1, {'@': 304}), 47: (1, {'@': 304}), 49: (1, {'@': 304}), 50: (1, {'@': 304}), 51: (1, {'@': 304}), 38: (1, {'@': 304}), 52: (1, {'@': 304}), 53: (1, {'@': 304}), 39: (1, {'@': 304}), 40: (1, {'@': 304}), 41: (1, {'@': 304}), 42: (1, {'@': 304}), 55: (1, {'@': 304}), 43: (1, {'@': 304})}, 12: {33: (1, {'@': 271}), 35: (1, {'@': 271}), 12: (1, {'@': 271}), 37: (1, {'@': 271}), 23: (1, {'@': 271}), 25: (1, {'@': 271}), 39: (1, {'@': 271}), 41: (1, {'@': 271}), 26: (1, {'@': 271}), 42: (1, {'@': 271}), 32: (1, {'@': 271}), 4: (1, {'@': 271}), 5: (1, {'@': 271}), 6: (1, {'@': 271}), 8: (1, {'@': 271}), 31: (1, {'@': 271}), 11: (1, {'@': 271}), 2: (1, {'@': 271}), 13: (1, {'@': 271}), 15: (1, {'@': 271}), 16: (1, {'@': 271}), 0: (1, {'@': 271}), 19: (1, {'@': 271}), 22: (1, {'@': 271}), 51: (1, {'@': 271}), 54: (1, {'@': 271}), 55: (1, {'@': 271}), 28: (1, {'@': 271}), 34: (1, {'@': 271}), 36: (1, {'@': 271}), 21: (1, {'@': 271}), 38: (1, {'@': 271}), 40: (1, {'@': 271}), 43: (1, {'@': 271}), 44: (1, {'@': 271}), 45: (1, {'@': 271}), 3: (1, {'@': 271}), 9: (1, {'@': 271}), 46: (1, {'@': 271}), 47: (1, {'@': 271}), 48: (1, {'@': 271}), 49: (1, {'@': 271}), 50: (1, {'@': 271}), 52: (1, {'@': 271}), 53: (1, {'@': 271})}, 13: {33: (1, {'@': 499}), 34: (1, {'@': 499}), 35: (1, {'@': 499}), 12: (1, {'@': 499}), 36: (1, {'@': 499}), 37: (1, {'@': 499}), 21: (1, {'@': 499}), 38: (1, {'@': 499}), 23: (1, {'@': 499}), 39: (1, {'@': 499}), 40: (1, {'@': 499}), 41: (1, {'@': 499}), 26: (1, {'@': 499}), 42: (1, {'@': 499}), 43: (1, {'@': 499}), 4: (1, {'@': 499}), 45: (1, {'@': 499}), 5: (1, {'@': 499}), 6: (1, {'@': 499}), 8: (1, {'@': 499}), 3: (1, {'@': 499}), 9: (1, {'@': 499}), 46: (1, {'@': 499}), 11: (1, {'@': 499}), 2: (1, {'@': 499}), 13: (1, {'@': 499}), 47: (1, {'@': 499}), 49: (1, {'@': 499}), 50: (1, {'@': 499}), 16: (1, {'@': 499}), 19: (1, {'@': 499}), 51: (1, {'@': 499}), 52: (1, {'@': 499}), 53: (1, {'@': 499}), 55: (1, {'@': 499}), 28: (1, {'@': 499}), 30: (1, {'@': 523}), 24: (1, {'@': 523}), 7: (1, {'@': 523}), 25: (1, {'@': 523}), 10: (1, {'@': 523}), 27: (1, {'@': 523}), 14: (1, {'@': 523}), 15: (1, {'@': 523}), 17: (1, {'@': 523}), 29: (1, {'@': 523}), 18: (1, {'@': 523}), 20: (1, {'@': 523})}, 14: {138: (0, 80), 139: (0, 596), 140: (0, 693), 40: (0, 437), 141: (0, 590), 67: (0, 630), 142: (0, 615), 143: (0, 637), 45: (0, 504), 68: (0, 676), 50: (0, 600), 144: (0, 273), 70: (0, 652), 71: (0, 661), 145: (0, 706), 49: (0, 669), 47: (0, 675), 146: (0, 462), 53: (0, 618), 82: (0, 593), 147: (0, 249), 148: (0, 295), 149: (0, 496), 85: (0, 392), 150: (0, 594), 26: (0, 604), 33: (0, 283), 76: (0, 35), 151: (0, 315), 36: (0, 276), 152: (0, 457), 153: (0, 685), 154: (0, 144), 34: (0, 483), 37: (0, 481), 43: (0, 519), 155: (0, 440), 156: (0, 653), 46: (0, 534), 41: (0, 458), 88: (0, 311), 51: (0, 540), 157: (0, 536), 99: (0, 531), 79: (0, 451), 101: (0, 256), 35: (0, 365), 102: (0, 660)}, 15: {4: (1, {'@': 312}), 33: (1, {'@': 312}), 34: (1, {'@': 312}), 5: (1, {'@': 312}), 45: (1, {'@': 312}), 46: (1, {'@': 312}), 35: (1, {'@': 312}), 11: (1, {'@': 312}), 36: (1, {'@': 312}), 37: (1, {'@': 312}), 47: (1, {'@': 312}), 49: (1, {'@': 312}), 50: (1, {'@': 312}), 19: (1, {'@': 312}), 51: (1, {'@': 312}), 38: (1, {'@': 312}), 52: (1, {'@': 312}), 53: (1, {'@': 312}), 39: (1, {'@': 312}), 40: (1, {'@': 312}), 41: (1, {'@': 312}), 42: (1, {'@': 312}), 55: (1, {'@': 312}), 43: (1, {'@': 312})}, 16: {158: (0, 376), 44: (0, 327), 31: (0, 91), 159: (0, 657)}, 17: {37: (0, 481), 160: (0, 304), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 161: (0, 201), 40: (0, 437), 43: (0, 519), 162: (0, 69), 163: (0, 198), 71: (0, 661), 11: (0, 522), 33: (0, 283), 164: (0, 344), 77: (0, 72), 46: (0, 534), 165: (0, 20), 42: (0, 606), 55: (0, 708), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 166: (0, 76), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 167: (0, 206), 168: (0, 158), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 84: (0, 621), 52: (0, 544), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 18: {23: (0, 137), 169: (0, 190), 21: (0, 303), 27: (0, 427), 3: (0, 595), 14: (0, 180), 28: (0, 579), 10: (0, 155), 16: (0, 322), 170: (0, 209), 29: (0, 498), 171: (0, 642), 18: (0, 489), 12: (0, 631), 30: (0, 438), 2: (0, 684), 15: (0, 460), 172: (0, 220), 8: (0, 335), 24: (0, 640), 17: (0, 480), 9: (0, 139), 20: (0, 520), 6: (0, 644), 1: (0, 188), 7: (0, 523), 25: (0, 87), 173: (0, 238), 174: (0, 383), 175: (0, 610), 176: (0, 639), 26: (0, 121), 177: (0, 429), 13: (0, 670)}, 19: {4: (1, {'@': 209}), 33: (1, {'@': 209}), 5: (1, {'@': 209}), 34: (1, {'@': 209}), 45: (1, {'@': 209}), 46: (1, {'@': 209}), 35: (1, {'@': 209}), 11: (1, {'@': 209}), 36: (1, {'@': 209}), 37: (1, {'@': 209}), 47: (1, {'@': 209}), 49: (1, {'@': 209}), 50: (1, {'@': 209}), 19: (1, {'@': 209}), 51: (1, {'@': 209}), 38: (1, {'@': 209}), 52: (1, {'@': 209}), 53: (1, {'@': 209}), 39: (1, {'@': 209}), 40: (1, {'@': 209}), 41: (1, {'@': 209}), 42: (1, {'@': 209}), 55: (1, {'@': 209}), 43: (1, {'@': 209})}, 20: {4: (1, {'@': 380}), 5: (1, {'@': 380}), 23: (1, {'@': 380}), 8: (1, {'@': 380}), 31: (1, {'@': 380}), 11: (1, {'@': 380}), 12: (1, {'@': 380}), 32: (1, {'@': 380}), 16: (1, {'@': 380}), 44: (1, {'@': 380}), 19: (1, {'@': 380}), 21: (1, {'@': 380}), 2: (1, {'@': 494}), 3: (1, {'@': 494}), 33: (1, {'@': 380}), 34: (1, {'@': 380}), 45: (1, {'@': 380}), 46: (1, {'@': 380}), 35: (1, {'@': 380}), 36: (1, {'@': 380}), 37: (1, {'@': 380}), 47: (1, {'@': 380}), 49: (1, {'@': 380}), 50: (1, {'@': 380}), 0: (1, {'@': 380}), 22: (1, {'@': 380}), 51: (1, {'@': 380}), 38: (1, {'@': 380}), 52: (1, {'@': 380}), 53: (1, {'@': 380}), 39: (1, {'@': 380}), 40: (1, {'@': 380}), 41: (1, {'@': 380}), 54: (1, {'@': 380}), 42: (1, {'@': 380}), 43: (1, {'@': 380}), 55: (1, {'@': 380}), 48: (1, {'@': 380})}, 21: {32: (0, 495)}, 22: {23: (0, 137), 8: (0, 335), 16: (0, 322), 21: (0, 303), 174: (0, 106), 12: (0, 631), 33: (1, {'@': 471}), 34: (1, {'@': 471}), 35: (1, {'@': 471}), 36: (1, {'@': 471}), 37: (1, {'@': 471}), 38: (1, {'@': 471}), 39: (1, {'@': 471}), 40: (1, {'@': 471}), 41: (1, {'@': 471}), 26: (1, {'@': 471}), 42: (1, {'@': 471}), 32: (1, {'@': 471}), 43: (1, {'@': 471}), 44: (1, {'@': 471}), 4: (1, {'@': 471}), 45: (1, {'@': 471}), 6: (1, {'@': 471}), 9: (1, {'@': 471}), 46: (1, {'@': 471}), 31: (1, {'@': 471}), 11: (1, {'@': 471}), 13: (1, {'@': 471}), 47: (1, {'@': 471}), 49: (1, {'@': 471}), 50: (1, {'@': 471}), 0: (1, {'@': 471}), 19: (1, {'@': 471}), 22: (1, {'@': 471}), 51: (1, {'@': 471}), 52: (1, {'@': 471}), 53: (1, {'@': 471}), 54: (1, {'@': 471}), 55: (1, {'@': 471}), 28: (1, {'@': 471})}, 23: {33: (1, {'@': 76}), 34: (1, {'@': 76}), 45: (1, {'@': 76}), 46: (1, {'@': 76}), 35: (1, {'@': 76}), 36: (1, {'@': 76}), 37: (1, {'@': 76}), 47: (1, {'@': 76}), 49: (1, {'@': 76}), 50: (1, {'@': 76}), 51: (1, {'@': 76}), 38: (1, {'@': 76}), 52: (1, {'@': 76}), 53: (1, {'@': 76}), 39: (1, {'@': 76}), 40: (1, {'@': 76}), 41: (1, {'@': 76}), 42: (1, {'@': 76}), 55: (1, {'@': 76}), 43: (1, {'@': 76})}, 24: {1: (0, 492), 2: (0, 684), 3: (0, 595), 4: (1, {'@': 467}), 33: (1, {'@': 467}), 34: (1, {'@': 467}), 6: (1, {'@': 467}), 5: (1, {'@': 467}), 45: (1, {'@': 467}), 8: (1, {'@': 467}), 9: (1, {'@': 467}), 46: (1, {'@': 467}), 35: (1, {'@': 467}), 11: (1, {'@': 467}), 12: (1, {'@': 467}), 13: (1, {'@': 467}), 36: (1, {'@': 467}), 37: (1, {'@': 467}), 47: (1, {'@': 467}), 49: (1, {'@': 467}), 50: (1, {'@': 467}), 16: (1, {'@': 467}), 19: (1, {'@': 467}), 21: (1, {'@': 467}), 51: (1, {'@': 467}), 38: (1, {'@': 467}), 52: (1, {'@': 467}), 23: (1, {'@': 467}), 53: (1, {'@': 467}), 39: (1, {'@': 467}), 40: (1, {'@': 467}), 41: (1, {'@': 467}), 26: (1, {'@': 467}), 42: (1, {'@': 467}), 55: (1, {'@': 467}), 43: (1, {'@': 467}), 28: (1, {'@': 467})}, 25: {4: (1, {'@': 393}), 33: (1, {'@': 393}), 34: (1, {'@': 393}), 6: (1, {'@': 393}), 5: (1, {'@': 393}), 45: (1, {'@': 393}), 9: (1, {'@': 393}), 46: (1, {'@': 393}), 35: (1, {'@': 393}), 11: (1, {'@': 393}), 13: (1, {'@': 393}), 36: (1, {'@': 393}), 37: (1, {'@': 393}), 47: (1, {'@': 393}), 49: (1, {'@': 393}), 50: (1, {'@': 393}), 19: (1, {'@': 393}), 51: (1, {'@': 393}), 38: (1, {'@': 393}), 52: (1, {'@': 393}), 53: (1, {'@': 393}), 39: (1, {'@': 393}), 40: (1, {'@': 393}), 41: (1, {'@': 393}), 26: (1, {'@': 393}), 42: (1, {'@': 393}), 55: (1, {'@': 393}), 43: (1, {'@': 393}), 28: (1, {'@': 393}), 23: (1, {'@': 505}), 8: (1, {'@': 505}), 12: (1, {'@': 505}), 16: (1, {'@': 505}), 21: (1, {'@': 505})}, 26: {6: (1, {'@': 385}), 9: (1, {'@': 385}), 26: (1, {'@': 385}), 13: (1, {'@': 385}), 28: (1, {'@': 385}), 4: (1, {'@': 289}), 5: (1, {'@': 289}), 0: (1, {'@': 289}), 19: (1, {'@': 289}), 11: (1, {'@': 289}), 22: (1, {'@': 289}), 32: (1, {'@': 289}), 31: (1, {'@': 289}), 44: (1, {'@': 289}), 54: (1, {'@': 289}), 33: (1, {'@': 289}), 34: (1, {'@': 289}), 45: (1, {'@': 289}), 46: (1, {'@': 289}), 35: (1, {'@': 289}), 36: (1, {'@': 289}), 37: (1, {'@': 289}), 47: (1, {'@': 289}), 49: (1, {'@': 289}), 50: (1, {'@': 289}), 51: (1, {'@': 289}), 38: (1, {'@': 289}), 52: (1, {'@': 289}), 53: (1, {'@': 289}), 39: (1, {'@': 289}), 40: (1, {'@': 289}), 41: (1, {'@': 289}), 42: (1, {'@': 289}), 55: (1, {'@': 289}), 43: (1, {'@': 289})}, 27: {178: (0, 323), 6: (1, {'@': 141}), 7: (1, {'@': 141}), 8: (1, {'@': 141}), 3: (1, {'@': 141}), 10: (1, {'@': 141}), 9: (1, {'@': 141}), 12: (1, {'@': 141}), 2: (1, {'@': 141}), 14: (1, {'@': 141}), 13: (1, {'@': 141}), 15: (1, {'@': 141}), 16: (1, {'@': 141}), 17: (1, {'@': 141}), 18: (1, {'@': 141}), 20: (1, {'@': 141}), 21: (1, {'@': 141}), 23: (1, {'@': 141}), 24: (1, {'@': 141}), 25: (1, {'@': 141}), 26: (1, {'@': 141}), 27: (1, {'@': 141}), 28: (1, {'@': 141}), 29: (1, {'@': 141}), 30: (1, {'@': 141}), 4: (1, {'@': 141}), 11: (1, {'@': 141}), 19: (1, {'@': 141})}, 28: {175: (0, 146), 179: (0, 313), 13: (0, 334), 28: (0, 105), 6: (0, 100), 9: (0, 139), 26: (0, 6), 4: (1, {'@': 407}), 5: (1, {'@': 407}), 44: (1, {'@': 407}), 31: (1, {'@': 407}), 19: (1, {'@': 407}), 11: (1, {'@': 407})}, 29: {0: (1, {'@': 240}), 22: (1, {'@': 240}), 31: (1, {'@': 240}), 32: (1, {'@': 240}), 44: (1, {'@': 240}), 54: (1, {'@': 240}), 33: (1, {'@': 240}), 34: (1, {'@': 240}), 45: (1, {'@': 240}), 46: (1, {'@': 240}), 35: (1, {'@': 240}), 36: (1, {'@': 240}), 37: (1, {'@': 240}), 47: (1, {'@': 240}), 49: (1, {'@': 240}), 50: (1, {'@': 240}), 51: (1, {'@': 240}), 38: (1, {'@': 240}), 52: (1, {'@': 240}), 53: (1, {'@': 240}), 39: (1, {'@': 240}), 40: (1, {'@': 240}), 41: (1, {'@': 240}), 42: (1, {'@': 240}), 55: (1, {'@': 240}), 43: (1, {'@': 240})}, 30: {37: (0, 481), 45: (0, 504), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483), 75: (0, 186)}, 31: {33: (1, {'@': 496}), 34: (1, {'@': 496}), 4: (1, {'@': 496}), 45: (1, {'@': 496}), 5: (1, {'@': 496}), 46: (1, {'@': 496}), 35: (1, {'@': 496}), 11: (1, {'@': 496}), 36: (1, {'@': 496}), 37: (1, {'@': 496}), 47: (1, {'@': 496}), 49: (1, {'@': 496}), 50: (1, {'@': 496}), 19: (1, {'@': 496}), 51: (1, {'@': 496}), 38: (1, {'@': 496}), 52: (1, {'@': 496}), 53: (1, {'@': 496}), 39: (1, {'@': 496}), 40: (1, {'@': 496}), 41: (1, {'@': 496}), 42: (1, {'@': 496}), 55: (1, {'@': 496}), 43: (1, {'@': 496}), 30: (1, {'@': 490}), 24: (1, {'@': 490}), 7: (1, {'@': 490}), 25: (1, {'@': 490}), 10: (1, {'@': 490}), 27: (1, {'@': 490}), 14: (1, {'@': 490}), 15: (1, {'@': 490}), 17: (1, {'@': 490}), 29: (1, {'@': 490}), 18: (1, {'@': 490}), 20: (1, {'@': 490}), 23: (1, {'@': 456}), 8: (1, {'@': 456}), 12: (1, {'@': 456}), 16: (1, {'@': 456}), 21: (1, {'@': 456}), 2: (1, {'@': 493}), 3: (1, {'@': 493})}, 32: {19: (0, 356), 11: (0, 331), 4: (0, 336), 33: (1, {'@': 207}), 34: (1, {'@': 207}), 5: (1, {'@': 207}), 45: (1, {'@': 207}), 46: (1, {'@': 207}), 35: (1, {'@': 207}), 36: (1, {'@': 207}), 37: (1, {'@': 207}), 47: (1, {'@': 207}), 49: (1, {'@': 207}), 50: (1, {'@': 207}), 51: (1, {'@': 207}), 38: (1, {'@': 207}), 52: (1, {'@': 207}), 53: (1, {'@': 207}), 39: (1, {'@': 207}), 40: (1, {'@': 207}), 41: (1, {'@': 207}), 42: (1, {'@': 207}), 55: (1, {'@': 207}), 43: (1, {'@': 207})}, 33: {33: (1, {'@': 272}), 35: (1, {'@': 272}), 12: (1, {'@': 272}), 37: (1, {'@': 272}), 23: (1, {'@': 272}), 25: (1, {'@': 272}), 39: (1, {'@': 272}), 41: (1, {'@': 272}), 26: (1, {'@': 272}), 42: (1, {'@': 272}), 32: (1, {'@': 272}), 4: (1, {'@': 272}), 5: (1, {'@': 272}), 6: (1, {'@': 272}), 8: (1, {'@': 272}), 31: (1, {'@': 272}), 11: (1, {'@': 272}), 2: (1, {'@': 272}), 13: (1, {'@': 272}), 15: (1, {'@': 272}), 16: (1, {'@': 272}), 0: (1, {'@': 272}), 19: (1, {'@': 272}), 22: (1, {'@': 272}), 51: (1, {'@': 272}), 54: (1, {'@': 272}), 55: (1, {'@': 272}), 28: (1, {'@': 272}), 34: (1, {'@': 272}), 36: (1, {'@': 272}), 21: (1, {'@': 272}), 38: (1, {'@': 272}), 40: (1, {'@': 272}), 43: (1, {'@': 272}), 44: (1, {'@': 272}), 45: (1, {'@': 272}), 3: (1, {'@': 272}), 9: (1, {'@': 272}), 46: (1, {'@': 272}), 47: (1, {'@': 272}), 48: (1, {'@': 272}), 49: (1, {'@': 272}), 50: (1, {'@': 272}), 52: (1, {'@': 272}), 53: (1, {'@': 272})}, 34: {37: (0, 481), 45: (0, 504), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 75: (0, 529), 73: (0, 698), 49: (0, 669), 47: (0, 675), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 35: {4: (0, 414), 11: (0, 177), 19: (0, 167), 0: (1, {'@': 96}), 32: (1, {'@': 96}), 54: (1, {'@': 96}), 48: (1, {'@': 96})}, 36: {33: (1, {'@': 103}), 34: (1, {'@': 103}), 35: (1, {'@': 103}), 12: (1, {'@': 103}), 36: (1, {'@': 103}), 14: (1, {'@': 103}), 37: (1, {'@': 103}), 18: (1, {'@': 103}), 21: (1, {'@': 103}), 38: (1, {'@': 103}), 23: (1, {'@': 103}), 24: (1, {'@': 103}), 25: (1, {'@': 103}), 39: (1, {'@': 103}), 40: (1, {'@': 103}), 41: (1, {'@': 103}), 26: (1, {'@': 103}), 42: (1, {'@': 103}), 43: (1, {'@': 103}), 4: (1, {'@': 103}), 45: (1, {'@': 103}), 5: (1, {'@': 103}), 6: (1, {'@': 103}), 7: (1, {'@': 103}), 8: (1, {'@': 103}), 9: (1, {'@': 103}), 3: (1, {'@': 103}), 10: (1, {'@': 103}), 46: (1, {'@': 103}), 11: (1, {'@': 103}), 13: (1, {'@': 103}), 2: (1, {'@': 103}), 15: (1, {'@': 103}), 47: (1, {'@': 103}), 16: (1, {'@': 103}), 49: (1, {'@': 103}), 17: (1, {'@': 103}), 50: (1, {'@': 103}), 19: (1, {'@': 103}), 20: (1, {'@': 103}), 51: (1, {'@': 103}), 52: (1, {'@': 103}), 53: (1, {'@': 103}), 27: (1, {'@': 103}), 55: (1, {'@': 103}), 28: (1, {'@': 103}), 29: (1, {'@': 103}), 30: (1, {'@': 103})}, 37: {23: (0, 137), 169: (0, 190), 21: (0, 303), 27: (0, 427), 3: (0, 595), 14: (0, 180), 28: (0, 579), 177: (0, 309), 10: (0, 155), 16: (0, 322), 170: (0, 209), 171: (0, 302), 29: (0, 498), 174: (0, 184), 18: (0, 489), 12: (0, 631), 30: (0, 438), 15: (0, 460), 2: (0, 684), 172: (0, 220), 8: (0, 335), 176: (0, 581), 24: (0, 640), 17: (0, 480), 9: (0, 139), 20: (0, 520), 6: (0, 644), 175: (0, 254), 1: (0, 560), 7: (0, 523), 25: (0, 87), 173: (0, 239), 26: (0, 121), 13: (0, 670), 4: (1, {'@': 83}), 19: (1, {'@': 83}), 11: (1, {'@': 83})}, 38: {4: (1, {'@': 210}), 33: (1, {'@': 210}), 5: (1, {'@': 210}), 34: (1, {'@': 210}), 45: (1, {'@': 210}), 46: (1, {'@': 210}), 35: (1, {'@': 210}), 11: (1, {'@': 210}), 36: (1, {'@': 210}), 37: (1, {'@': 210}), 47: (1, {'@': 210}), 49: (1, {'@': 210}), 50: (1, {'@': 210}), 19: (1, {'@': 210}), 51: (1, {'@': 210}), 38: (1, {'@': 210}), 52: (1, {'@': 210}), 53: (1, {'@': 210}), 39: (1, {'@': 210}), 40: (1, {'@': 210}), 41: (1, {'@': 210}), 42: (1, {'@': 210}), 55: (1, {'@': 210}), 43: (1, {'@': 210})}, 39: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 79: (0, 634), 78: (0, 666), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 58: (0, 442), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 40: {33: (1, {'@': 268}), 34: (1, {'@': 268}), 35: (1, {'@': 268}), 12: (1, {'@': 268}), 36: (1, {'@': 268}), 14: (1, {'@': 268}), 37: (1, {'@': 268}), 18: (1, {'@': 268}), 21: (1, {'@': 268}), 38: (1, {'@': 268}), 24: (1, {'@': 268}), 23: (1, {'@': 268}), 25: (1, {'@': 268}), 39: (1, {'@': 268}), 40: (1, {'@': 268}), 41: (1, {'@': 268}), 26: (1, {'@': 268}), 42: (1, {'@': 268}), 32: (1, {'@': 268}), 43: (1, {'@': 268}), 44: (1, {'@': 268}), 4: (1, {'@': 268}), 45: (1, {'@': 268}), 5: (1, {'@': 268}), 6: (1, {'@': 268}), 7: (1, {'@': 268}), 8: (1, {'@': 268}), 9: (1, {'@': 268}), 10: (1, {'@': 268}), 3: (1, {'@': 268}), 31: (1, {'@': 268}), 46: (1, {'@': 268}), 11: (1, {'@': 268}), 13: (1, {'@': 268}), 2: (1, {'@': 268}), 15: (1, {'@': 268}), 47: (1, {'@': 268}), 16: (1, {'@': 268}), 49: (1, {'@': 268}), 17: (1, {'@': 268}), 50: (1, {'@': 268}), 0: (1, {'@': 268}), 19: (1, {'@': 268}), 20: (1, {'@': 268}), 22: (1, {'@': 268}), 51: (1, {'@': 268}), 52: (1, {'@': 268}), 53: (1, {'@': 268}), 27: (1, {'@': 268}), 54: (1, {'@': 268}), 55: (1, {'@': 268}), 28: (1, {'@': 268}), 29: (1, {'@': 268}), 30: (1, {'@': 268}), 48: (1, {'@': 268})}, 41: {4: (1, {'@': 439}), 5: (1, {'@': 439}), 6: (1, {'@': 439}), 8: (1, {'@': 439}), 3: (1, {'@': 439}), 9: (1, {'@': 439}), 11: (1, {'@': 439}), 12: (1, {'@': 439}), 2: (1, {'@': 439}), 13: (1, {'@': 439}), 16: (1, {'@': 439}), 0: (1, {'@': 439}), 19: (1, {'@': 439}), 21: (1, {'@': 439}), 22: (1, {'@': 439}), 23: (1, {'@': 439}), 26: (1, {'@': 439}), 28: (1, {'@': 439}), 31: (1, {'@': 439}), 32: (1, {'@': 439}), 54: (1, {'@': 439}), 44: (1, {'@': 439}), 33: (1, {'@': 439}), 34: (1, {'@': 439}), 35: (1, {'@': 439}), 36: (1, {'@': 439}), 37: (1, {'@': 439}), 38: (1, {'@': 439}), 39: (1, {'@': 439}), 40: (1, {'@': 439}), 41: (1, {'@': 439}), 42: (1, {'@': 439}), 43: (1, {'@': 439}), 45: (1, {'@': 439}), 46: (1, {'@': 439}), 47: (1, {'@': 439}), 49: (1, {'@': 439}), 50: (1, {'@': 439}), 51: (1, {'@': 439}), 52: (1, {'@': 439}), 53: (1, {'@': 439}), 55: (1, {'@': 439})}, 42: {4: (1, {'@': 417}), 5: (1, {'@': 417}), 0: (1, {'@': 417}), 19: (1, {'@': 417}), 11: (1, {'@': 417}), 22: (1, {'@': 417}), 32: (1, {'@': 417}), 31: (1, {'@': 417}), 44: (1, {'@': 417}), 54: (1, {'@': 417}), 33: (1, {'@': 417}), 34: (1, {'@': 417}), 45: (1, {'@': 417}), 46: (1, {'@': 417}), 35: (1, {'@': 417}), 36: (1, {'@': 417}), 37: (1, {'@': 417}), 47: (1, {'@': 417}), 49: (1, {'@': 417}), 50: (1, {'@': 417}), 51: (1, {'@': 417}), 38: (1, {'@': 417}), 52: (1, {'@': 417}), 53: (1, {'@': 417}), 39: (1, {'@': 417}), 40: (1, {'@': 417}), 41: (1, {'@': 417}), 42: (1, {'@': 417}), 55: (1, {'@': 417}), 43: (1, {'@': 417})}, 43: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 105: (0, 166), 32: (0, 328), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 122), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 104: (0, 380), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 58: (0, 183), 34: (0, 483), 91: (0, 497), 37: (0, 481), 106: (0, 195), 107: (0, 196), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 44: {33: (1, {'@': 78}), 34: (1, {'@': 78}), 45: (1, {'@': 78}), 46: (1, {'@': 78}), 35: (1, {'@': 78}), 36: (1, {'@': 78}), 37: (1, {'@': 78}), 47: (1, {'@': 78}), 49: (1, {'@': 78}), 50: (1, {'@': 78}), 51: (1, {'@': 78}), 38: (1, {'@': 78}), 52: (1, {'@': 78}), 53: (1, {'@': 78}), 39: (1, {'@': 78}), 40: (1, {'@': 78}), 41: (1, {'@': 78}), 42: (1, {'@': 78}), 55: (1, {'@': 78}), 43: (1, {'@': 78})}, 45: {4: (1, {'@': 419}), 5: (1, {'@': 419}), 0: (1, {'@': 419}), 19: (1, {'@': 419}), 11: (1, {'@': 419}), 22: (1, {'@': 419}), 32: (1, {'@': 419}), 31: (1, {'@': 419}), 44: (1, {'@': 419}), 54: (1, {'@': 419}), 33: (1, {'@': 419}), 34: (1, {'@': 419}), 45: (1, {'@': 419}), 46: (1, {'@': 419}), 35: (1, {'@': 419}), 36: (1, {'@': 419}), 37: (1, {'@': 419}), 47: (1, {'@': 419}), 49: (1, {'@': 419}), 50: (1, {'@': 419}), 51: (1, {'@': 419}), 38: (1, {'@': 419}), 52: (1, {'@': 419}), 53: (1, {'@': 419}), 39: (1, {'@': 419}), 40: (1, {'@': 419}), 41: (1, {'@': 419}), 42: (1, {'@': 419}), 55: (1, {'@': 419}), 43: (1, {'@': 419})}, 46: {33: (1, {'@': 470}), 34: (1, {'@': 470}), 35: (1, {'@': 470}), 36: (1, {'@': 470}), 37: (1, {'@': 470}), 38: (1, {'@': 470}), 39: (1, {'@': 470}), 40: (1, {'@': 470}), 41: (1, {'@': 470}), 26: (1, {'@': 470}), 42: (1, {'@': 470}), 32: (1, {'@': 470}), 43: (1, {'@': 470}), 44: (1, {'@': 470}), 4: (1, {'@': 470}), 45: (1, {'@': 470}), 6: (1, {'@': 470}), 9: (1, {'@': 470}), 46: (1, {'@': 470}), 31: (1, {'@': 470}), 11: (1, {'@': 470}), 13: (1, {'@': 470}), 47: (1, {'@': 470}), 49: (1, {'@': 470}), 50: (1, {'@': 470}), 0: (1, {'@': 470}), 19: (1, {'@': 470}), 22: (1, {'@': 470}), 51: (1, {'@': 470}), 52: (1, {'@': 470}), 53: (1, {'@': 470}), 54: (1, {'@': 470}), 55: (1, {'@': 470}), 28: (1, {'@': 470}), 23: (1, {'@': 533}), 8: (1, {'@': 533}), 12: (1, {'@': 533}), 16: (1, {'@': 533}), 21: (1, {'@': 533})}, 47: {4: (1, {'@': 252}), 5: (1, {'@': 252}), 0: (1, {'@': 252}), 19: (1, {'@': 252}), 11: (1, {'@': 252}), 22: (1, {'@': 252}), 32: (1, {'@': 252}), 31: (1, {'@': 252}), 54: (1, {'@': 252}), 44: (1, {'@': 252}), 48: (1, {'@': 252}), 33: (1, {'@': 252}), 34: (1, {'@': 252}), 45: (1, {'@': 252}), 46: (1, {'@': 252}), 35: (1, {'@': 252}), 36: (1, {'@': 252}), 37: (1, {'@': 252}), 47: (1, {'@': 252}), 49: (1, {'@': 252}), 50: (1, {'@': 252}), 51: (1, {'@': 252}), 38: (1, {'@': 252}), 52: (1, {'@': 252}), 53: (1, {'@': 252}), 39: (1, {'@': 252}), 40: (1, {'@': 252}), 41: (1, {'@': 252}), 42: (1, {'@': 252}), 55: (1, {'@': 252}), 43: (1, {'@': 252})}, 48: {0: (0, 454)}, 49: {33: (1, {'@': 221}), 34: (1, {'@': 221}), 45: (1, {'@': 221}), 46: (1, {'@': 221}), 35: (1, {'@': 221}), 36: (1, {'@': 221}), 37: (1, {'@': 221}), 47: (1, {'@': 221}), 49: (1, {'@': 221}), 50: (1, {'@': 221}), 51: (1, {'@': 221}), 38: (1, {'@': 221}), 52: (1, {'@': 221}), 53: (1, {'@': 221}), 39: (1, {'@': 221}), 40: (1, {'@': 221}), 41: (1, {'@': 221}), 42: (1, {'@': 221}), 55: (1, {'@': 221}), 43: (1, {'@': 221})}, 50: {4: (1, {'@': 253}), 5: (1, {'@': 253}), 0: (1, {'@': 253}), 19: (1, {'@': 253}), 11: (1, {'@': 253}), 22: (1, {'@': 253}), 32: (1, {'@': 253}), 31: (1, {'@': 253}), 54: (1, {'@': 253}), 44: (1, {'@': 253}), 48: (1, {'@': 253}), 33: (1, {'@': 253}), 34: (1, {'@': 253}), 45: (1, {'@': 253}), 46: (1, {'@': 253}), 35: (1, {'@': 253}), 36: (1, {'@': 253}), 37: (1, {'@': 253}), 47: (1, {'@': 253}), 49: (1, {'@': 253}), 50: (1, {'@': 253}), 51: (1, {'@': 253}), 38: (1, {'@': 253}), 52: (1, {'@': 253}), 53: (1, {'@': 253}), 39: (1, {'@': 253}), 40: (1, {'@': 253}), 41: (1, {'@': 253}), 42: (1, {'@': 253}), 55: (1, {'@': 253}), 43: (1, {'@': 253})}, 51: {4: (1, {'@': 438}), 5: (1, {'@': 438}), 6: (1, {'@': 438}), 8: (1, {'@': 438}), 3: (1, {'@': 438}), 9: (1, {'@': 438}), 11: (1, {'@': 438}), 12: (1, {'@': 438}), 2: (1, {'@': 438}), 13: (1, {'@': 438}), 16: (1, {'@': 438}), 0: (1, {'@': 438}), 19: (1, {'@': 438}), 21: (1, {'@': 438}), 22: (1, {'@': 438}), 23: (1, {'@': 438}), 26: (1, {'@': 438}), 28: (1, {'@': 438}), 31: (1, {'@': 438}), 32: (1, {'@': 438}), 54: (1, {'@': 438}), 44: (1, {'@': 438}), 33: (1, {'@': 438}), 34: (1, {'@': 438}), 35: (1, {'@': 438}), 36: (1, {'@': 438}), 37: (1, {'@': 438}), 38: (1, {'@': 438}), 39: (1, {'@': 438}), 40: (1, {'@': 438}), 41: (1, {'@': 438}), 42: (1, {'@': 438}), 43: (1, {'@': 438}), 45: (1, {'@': 438}), 46: (1, {'@': 438}), 47: (1, {'@': 438}), 49: (1, {'@': 438}), 50: (1, {'@': 438}), 51: (1, {'@': 438}), 52: (1, {'@': 438}), 53: (1, {'@': 438}), 55: (1, {'@': 438})}, 52: {37: (0, 481), 36: (0, 276), 70: (0, 707), 46: (0, 534)}, 53: {37: (0, 481), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 77: (0, 82), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 54: {37: (0, 481), 45: (0, 504), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 75: (0, 396), 34: (0, 483)}, 55: {33: (1, {'@': 220}), 34: (1, {'@': 220}), 45: (1, {'@': 220}), 46: (1, {'@': 220}), 35: (1, {'@': 220}), 36: (1, {'@': 220}), 37: (1, {'@': 220}), 47: (1, {'@': 220}), 49: (1, {'@': 220}), 50: (1, {'@': 220}), 51: (1, {'@': 220}), 38: (1, {'@': 220}), 52: (1, {'@': 220}), 53: (1, {'@': 220}), 39: (1, {'@': 220}), 40: (1, {'@': 220}), 41: (1, {'@': 220}), 42: (1, {'@': 220}), 55: (1, {'@': 220}), 43: (1, {'@': 220})}, 56: {54: (1, {'@': 275})}, 57: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 93: (0, 381), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 58: {33: (1, {'@': 425}), 34: (1, {'@': 425}), 4: (1, {'@': 425}), 45: (1, {'@': 425}), 46: (1, {'@': 425}), 35: (1, {'@': 425}), 31: (1, {'@': 425}), 11: (1, {'@': 425}), 36: (1, {'@': 425}), 37: (1, {'@': 425}), 47: (1, {'@': 425}), 49: (1, {'@': 425}), 50: (1, {'@': 425}), 0: (1, {'@': 425}), 19: (1, {'@': 425}), 22: (1, {'@': 425}), 51: (1, {'@': 425}), 38: (1, {'@': 425}), 52: (1, {'@': 425}), 53: (1, {'@': 425}), 39: (1, {'@': 425}), 40: (1, {'@': 425}), 41: (1, {'@': 425}), 54: (1, {'@': 425}), 42: (1, {'@': 425}), 32: (1, {'@': 425}), 43: (1, {'@': 425}), 55: (1, {'@': 425}), 44: (1, {'@': 425})}, 59: {30: (1, {'@': 271}), 24: (1, {'@': 271}), 7: (1, {'@': 271}), 25: (1, {'@': 271}), 10: (1, {'@': 271}), 27: (1, {'@': 271}), 14: (1, {'@': 271}), 15: (1, {'@': 271}), 17: (1, {'@': 271}), 29: (1, {'@': 271}), 18: (1, {'@': 271}), 20: (1, {'@': 271}), 33: (1, {'@': 519}), 34: (1, {'@': 519}), 35: (1, {'@': 519}), 12: (1, {'@': 519}), 36: (1, {'@': 519}), 37: (1, {'@': 519}), 21: (1, {'@': 519}), 38: (1, {'@': 519}), 23: (1, {'@': 519}), 39: (1, {'@': 519}), 40: (1, {'@': 519}), 41: (1, {'@': 519}), 42: (1, {'@': 519}), 32: (1, {'@': 519}), 43: (1, {'@': 519}), 44: (1, {'@': 519}), 4: (1, {'@': 519}), 45: (1, {'@': 519}), 5: (1, {'@': 519}), 8: (1, {'@': 519}), 3: (1, {'@': 519}), 46: (1, {'@': 519}), 31: (1, {'@': 519}), 11: (1, {'@': 519}), 2: (1, {'@': 519}), 47: (1, {'@': 519}), 48: (1, {'@': 519}), 16: (1, {'@': 519}), 49: (1, {'@': 519}), 50: (1, {'@': 519}), 0: (1, {'@': 519}), 19: (1, {'@': 519}), 22: (1, {'@': 519}), 51: (1, {'@': 519}), 52: (1, {'@': 519}), 53: (1, {'@': 519}), 54: (1, {'@': 519}), 55: (1, {'@': 519}), 26: (1, {'@': 519}), 6: (1, {'@': 519}), 9: (1, {'@': 519}), 13: (1, {'@': 519}), 28: (1, {'@': 519})}, 60: {33: (1, {'@': 244}), 34: (1, {'@': 244}), 35: (1, {'@': 244}), 36: (1, {'@': 244}), 37: (1, {'@': 244}), 38: (1, {'@': 244}), 39: (1, {'@': 244}), 40: (1, {'@': 244}), 41: (1, {'@': 244}), 42: (1, {'@': 244}), 32: (1, {'@': 244}), 43: (1, {'@': 244}), 44: (1, {'@': 244}), 4: (1, {'@': 244}), 45: (1, {'@': 244}), 46: (1, {'@': 244}), 31: (1, {'@': 244}), 11: (1, {'@': 244}), 47: (1, {'@': 244}), 49: (1, {'@': 244}), 50: (1, {'@': 244}), 0: (1, {'@': 244}), 19: (1, {'@': 244}), 22: (1, {'@': 244}), 51: (1, {'@': 244}), 52: (1, {'@': 244}), 53: (1, {'@': 244}), 54: (1, {'@': 244}), 55: (1, {'@': 244})}, 61: {33: (1, {'@': 80}), 34: (1, {'@': 80}), 35: (1, {'@': 80}), 36: (1, {'@': 80}), 37: (1, {'@': 80}), 38: (1, {'@': 80}), 39: (1, {'@': 80}), 40: (1, {'@': 80}), 41: (1, {'@': 80}), 42: (1, {'@': 80}), 43: (1, {'@': 80}), 45: (1, {'@': 80}), 46: (1, {'@': 80}), 47: (1, {'@': 80}), 49: (1, {'@': 80}), 50: (1, {'@': 80}), 51: (1, {'@': 80}), 52: (1, {'@': 80}), 53: (1, {'@': 80}), 55: (1, {'@': 80})}, 62: {23: (0, 137), 8: (0, 335), 16: (0, 322), 21: (0, 303), 174: (0, 533), 12: (0, 631)}, 63: {0: (0, 367)}, 64: {4: (1, {'@': 286}), 5: (1, {'@': 286}), 6: (1, {'@': 286}), 7: (1, {'@': 286}), 8: (1, {'@': 286}), 3: (1, {'@': 286}), 9: (1, {'@': 286}), 10: (1, {'@': 286}), 11: (1, {'@': 286}), 12: (1, {'@': 286}), 2: (1, {'@': 286}), 13: (1, {'@': 286}), 14: (1, {'@': 286}), 15: (1, {'@': 286}), 16: (1, {'@': 286}), 17: (1, {'@': 286}), 0: (1, {'@': 286}), 18: (1, {'@': 286}), 19: (1, {'@': 286}), 20: (1, {'@': 286}), 21: (1, {'@': 286}), 22: (1, {'@': 286}), 23: (1, {'@': 286}), 24: (1, {'@': 286}), 25: (1, {'@': 286}), 26: (1, {'@': 286}), 27: (1, {'@': 286}), 28: (1, {'@': 286}), 29: (1, {'@': 286}), 30: (1, {'@': 286}), 31: (1, {'@': 286}), 32: (1, {'@': 286}), 54: (1, {'@': 286}), 44: (1, {'@': 286}), 33: (1, {'@': 286}), 34: (1, {'@': 286}), 35: (1, {'@': 286}), 36: (1, {'@': 286}), 37: (1, {'@': 286}), 38: (1, {'@': 286}), 39: (1, {'@': 286}), 40: (1, {'@': 286}), 41: (1, {'@': 286}), 42: (1, {'@': 286}), 43: (1, {'@': 286}), 45: (1, {'@': 286}), 46: (1, {'@': 286}), 47: (1, {'@': 286}), 49: (1, {'@': 286}), 50: (1, {'@': 286}), 51: (1, {'@': 286}), 52: (1, {'@': 286}), 53: (1, {'@': 286}), 55: (1, {'@': 286})}, 65: {37: (0, 481), 180: (0, 317), 4: (0, 314), 70: (0, 307), 45: (0, 504), 39: (0, 261), 181: (0, 357), 182: (0, 422), 40: (0, 437), 183: (0, 431), 93: (0, 404), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 34: (0, 483), 185: (0, 697), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 186: (0, 423), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 66: {33: (1, {'@': 216}), 34: (1, {'@': 216}), 45: (1, {'@': 216}), 46: (1, {'@': 216}), 35: (1, {'@': 216}), 36: (1, {'@': 216}), 37: (1, {'@': 216}), 47: (1, {'@': 216}), 49: (1, {'@': 216}), 50: (1, {'@': 216}), 51: (1, {'@': 216}), 38: (1, {'@': 216}), 52: (1, {'@': 216}), 53: (1, {'@': 216}), 39: (1, {'@': 216}), 40: (1, {'@': 216}), 41: (1, {'@': 216}), 42: (1, {'@': 216}), 55: (1, {'@': 216}), 43: (1, {'@': 216})}, 67: {32: (0, 444)}, 68: {39: (0, 261), 187: (0, 575), 40: (0, 437), 70: (0, 375), 11: (0, 522), 184: (0, 689), 188: (0, 648), 64: (0, 526), 189: (0, 665), 66: (0, 528), 186: (0, 589), 45: (0, 504), 4: (0, 314), 133: (0, 545), 50: (0, 600), 93: (0, 671), 182: (0, 422), 71: (0, 661), 55: (0, 708), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 77: (0, 710), 80: (0, 628), 190: (0, 585), 53: (0, 618), 82: (0, 593), 84: (0, 621), 181: (0, 357), 191: (0, 686), 33: (0, 283), 180: (0, 317), 124: (0, 602), 192: (0, 535), 88: (0, 419), 183: (0, 431), 36: (0, 276), 34: (0, 483), 37: (0, 481), 43: (0, 519), 46: (0, 534), 193: (0, 363), 41: (0, 458), 97: (0, 525), 185: (0, 352), 51: (0, 540), 194: (0, 532), 52: (0, 544), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660)}, 69: {4: (1, {'@': 284}), 5: (1, {'@': 284}), 31: (1, {'@': 284}), 11: (1, {'@': 284}), 32: (1, {'@': 284}), 44: (1, {'@': 284}), 19: (1, {'@': 284}), 23: (1, {'@': 457}), 8: (1, {'@': 457}), 12: (1, {'@': 457}), 16: (1, {'@': 457}), 21: (1, {'@': 457}), 33: (1, {'@': 284}), 34: (1, {'@': 284}), 45: (1, {'@': 284}), 46: (1, {'@': 284}), 35: (1, {'@': 284}), 36: (1, {'@': 284}), 37: (1, {'@': 284}), 47: (1, {'@': 284}), 49: (1, {'@': 284}), 50: (1, {'@': 284}), 0: (1, {'@': 284}), 22: (1, {'@': 284}), 51: (1, {'@': 284}), 38: (1, {'@': 284}), 52: (1, {'@': 284}), 53: (1, {'@': 284}), 39: (1, {'@': 284}), 40: (1, {'@': 284}), 41: (1, {'@': 284}), 54: (1, {'@': 284}), 42: (1, {'@': 284}), 43: (1, {'@': 284}), 55: (1, {'@': 284}), 48: (1, {'@': 284})}, 70: {33: (1, {'@': 426}), 34: (1, {'@': 426}), 4: (1, {'@': 426}), 45: (1, {'@': 426}), 46: (1, {'@': 426}), 35: (1, {'@': 426}), 31: (1, {'@': 426}), 11: (1, {'@': 426}), 36: (1, {'@': 426}), 37: (1, {'@': 426}), 47: (1, {'@': 426}), 49: (1, {'@': 426}), 50: (1, {'@': 426}), 0: (1, {'@': 426}), 19: (1, {'@': 426}), 22: (1, {'@': 426}), 51: (1, {'@': 426}), 38: (1, {'@': 426}), 52: (1, {'@': 426}), 53: (1, {'@': 426}), 39: (1, {'@': 426}), 40: (1, {'@': 426}), 41: (1, {'@': 426}), 54: (1, {'@': 426}), 42: (1, {'@': 426}), 32: (1, {'@': 426}), 43: (1, {'@': 426}), 55: (1, {'@': 426}), 44: (1, {'@': 426})}, 71: {33: (1, {'@': 227}), 34: (1, {'@': 227}), 35: (1, {'@': 227}), 36: (1, {'@': 227}), 37: (1, {'@': 227}), 38: (1, {'@': 227}), 39: (1, {'@': 227}), 40: (1, {'@': 227}), 41: (1, {'@': 227}), 42: (1, {'@': 227}), 43: (1, {'@': 227}), 45: (1, {'@': 227}), 46: (1, {'@': 227}), 47: (1, {'@': 227}), 49: (1, {'@': 227}), 50: (1, {'@': 227}), 51: (1, {'@': 227}), 52: (1, {'@': 227}), 53: (1, {'@': 227}), 55: (1, {'@': 227})}, 72: {4: (1, {'@': 288}), 5: (1, {'@': 288}), 0: (1, {'@': 288}), 19: (1, {'@': 288}), 11: (1, {'@': 288}), 22: (1, {'@': 288}), 32: (1, {'@': 288}), 31: (1, {'@': 288}), 30: (1, {'@': 490}), 24: (1, {'@': 490}), 7: (1, {'@': 490}), 25: (1, {'@': 490}), 10: (1, {'@': 490}), 27: (1, {'@': 490}), 14: (1, {'@': 490}), 15: (1, {'@': 490}), 17: (1, {'@': 490}), 29: (1, {'@': 490}), 18: (1, {'@': 490}), 20: (1, {'@': 490}), 23: (1, {'@': 456}), 8: (1, {'@': 456}), 12: (1, {'@': 456}), 16: (1, {'@': 456}), 21: (1, {'@': 456}), 2: (1, {'@': 493}), 3: (1, {'@': 493}), 44: (1, {'@': 288}), 54: (1, {'@': 288}), 33: (1, {'@': 288}), 34: (1, {'@': 288}), 45: (1, {'@': 288}), 46: (1, {'@': 288}), 35: (1, {'@': 288}), 36: (1, {'@': 288}), 37: (1, {'@': 288}), 47: (1, {'@': 288}), 49: (1, {'@': 288}), 50: (1, {'@': 288}), 51: (1, {'@': 288}), 38: (1, {'@': 288}), 52: (1, {'@': 288}), 53: (1, {'@': 288}), 39: (1, {'@': 288}), 40: (1, {'@': 288}), 41: (1, {'@': 288}), 42: (1, {'@': 288}), 55: (1, {'@': 288}), 43: (1, {'@': 288})}, 73: {33: (1, {'@': 464}), 34: (1, {'@': 464}), 4: (1, {'@': 464}), 45: (1, {'@': 464}), 5: (1, {'@': 464}), 46: (1, {'@': 464}), 35: (1, {'@': 464}), 11: (1, {'@': 464}), 36: (1, {'@': 464}), 37: (1, {'@': 464}), 47: (1, {'@': 464}), 49: (1, {'@': 464}), 50: (1, {'@': 464}), 19: (1, {'@': 464}), 51: (1, {'@': 464}), 38: (1, {'@': 464}), 52: (1, {'@': 464}), 53: (1, {'@': 464}), 39: (1, {'@': 464}), 40: (1, {'@': 464}), 41: (1, {'@': 464}), 42: (1, {'@': 464}), 55: (1, {'@': 464}), 43: (1, {'@': 464})}, 74: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 93: (0, 113), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 75: {56: (0, 388), 39: (0, 261), 57: (0, 333), 58: (0, 233), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 22: (0, 236), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 96: (0, 103), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 123})}, 76: {23: (0, 137), 8: (0, 335), 16: (0, 322), 21: (0, 303), 174: (0, 234), 12: (0, 631)}, 77: {2: (1, {'@': 540}), 3: (1, {'@': 540}), 33: (1, {'@': 506}), 34: (1, {'@': 506}), 35: (1, {'@': 506}), 12: (1, {'@': 506}), 36: (1, {'@': 506}), 37: (1, {'@': 506}), 21: (1, {'@': 506}), 38: (1, {'@': 506}), 23: (1, {'@': 506}), 39: (1, {'@': 506}), 40: (1, {'@': 506}), 41: (1, {'@': 506}), 26: (1, {'@': 506}), 42: (1, {'@': 506}), 32: (1, {'@': 506}), 43: (1, {'@': 506}), 44: (1, {'@': 506}), 4: (1, {'@': 506}), 45: (1, {'@': 506}), 6: (1, {'@': 506}), 8: (1, {'@': 506}), 9: (1, {'@': 506}), 46: (1, {'@': 506}), 31: (1, {'@': 506}), 11: (1, {'@': 506}), 13: (1, {'@': 506}), 47: (1, {'@': 506}), 49: (1, {'@': 506}), 50: (1, {'@': 506}), 16: (1, {'@': 506}), 0: (1, {'@': 506}), 19: (1, {'@': 506}), 22: (1, {'@': 506}), 51: (1, {'@': 506}), 52: (1, {'@': 506}), 53: (1, {'@': 506}), 54: (1, {'@': 506}), 55: (1, {'@': 506}), 28: (1, {'@': 506})}, 78: {33: (1, {'@': 422}), 34: (1, {'@': 422}), 4: (1, {'@': 422}), 45: (1, {'@': 422}), 46: (1, {'@': 422}), 35: (1, {'@': 422}), 31: (1, {'@': 422}), 11: (1, {'@': 422}), 36: (1, {'@': 422}), 37: (1, {'@': 422}), 47: (1, {'@': 422}), 49: (1, {'@': 422}), 50: (1, {'@': 422}), 0: (1, {'@': 422}), 19: (1, {'@': 422}), 22: (1, {'@': 422}), 51: (1, {'@': 422}), 38: (1, {'@': 422}), 52: (1, {'@': 422}), 53: (1, {'@': 422}), 39: (1, {'@': 422}), 40: (1, {'@': 422}), 41: (1, {'@': 422}), 54: (1, {'@': 422}), 42: (1, {'@': 422}), 32: (1, {'@': 422}), 43: (1, {'@': 422}), 55: (1, {'@': 422}), 44: (1, {'@': 422})}, 79: {48: (0, 505)}, 80: {4: (0, 632), 11: (0, 435), 19: (0, 126), 0: (1, {'@': 95}), 32: (1, {'@': 95}), 54: (1, {'@': 95}), 48: (1, {'@': 95})}, 81: {30: (1, {'@': 273}), 24: (1, {'@': 273}), 7: (1, {'@': 273}), 25: (1, {'@': 273}), 10: (1, {'@': 273}), 27: (1, {'@': 273}), 14: (1, {'@': 273}), 15: (1, {'@': 273}), 17: (1, {'@': 273}), 29: (1, {'@': 273}), 18: (1, {'@': 273}), 20: (1, {'@': 273}), 33: (1, {'@': 527}), 34: (1, {'@': 527}), 35: (1, {'@': 527}), 12: (1, {'@': 527}), 36: (1, {'@': 527}), 37: (1, {'@': 527}), 21: (1, {'@': 527}), 38: (1, {'@': 527}), 23: (1, {'@': 527}), 39: (1, {'@': 527}), 40: (1, {'@': 527}), 41: (1, {'@': 527}), 26: (1, {'@': 527}), 42: (1, {'@': 527}), 32: (1, {'@': 527}), 43: (1, {'@': 527}), 44: (1, {'@': 527}), 4: (1, {'@': 527}), 45: (1, {'@': 527}), 6: (1, {'@': 527}), 8: (1, {'@': 527}), 9: (1, {'@': 527}), 46: (1, {'@': 527}), 31: (1, {'@': 527}), 3: (1, {'@': 527}), 11: (1, {'@': 527}), 13: (1, {'@': 527}), 47: (1, {'@': 527}), 2: (1, {'@': 527}), 49: (1, {'@': 527}), 50: (1, {'@': 527}), 16: (1, {'@': 527}), 0: (1, {'@': 527}), 19: (1, {'@': 527}), 22: (1, {'@': 527}), 51: (1, {'@': 527}), 52: (1, {'@': 527}), 53: (1, {'@': 527}), 54: (1, {'@': 527}), 55: (1, {'@': 527}), 28: (1, {'@': 527})}, 82: {33: (1, {'@': 475}), 34: (1, {'@': 475}), 4: (1, {'@': 475}), 45: (1, {'@': 475}), 46: (1, {'@': 475}), 35: (1, {'@': 475}), 31: (1, {'@': 475}), 11: (1, {'@': 475}), 36: (1, {'@': 475}), 37: (1, {'@': 475}), 47: (1, {'@': 475}), 49: (1, {'@': 475}), 50: (1, {'@': 475}), 0: (1, {'@': 475}), 19: (1, {'@': 475}), 22: (1, {'@': 475}), 51: (1, {'@': 475}), 38: (1, {'@': 475}), 52: (1, {'@': 475}), 53: (1, {'@': 475}), 39: (1, {'@': 475}), 40: (1, {'@': 475}), 41: (1, {'@': 475}), 54: (1, {'@': 475}), 42: (1, {'@': 475}), 32: (1, {'@': 475}), 43: (1, {'@': 475}), 55: (1, {'@': 475}), 44: (1, {'@': 475})}, 83: {54: (0, 2)}, 84: {32: (1, {'@': 150}), 0: (1, {'@': 150}), 54: (1, {'@': 150})}, 85: {4: (1, {'@': 341}), 5: (1, {'@': 341}), 0: (1, {'@': 341}), 19: (1, {'@': 341}), 11: (1, {'@': 341}), 22: (1, {'@': 341}), 32: (1, {'@': 341}), 31: (1, {'@': 341}), 54: (1, {'@': 341}), 44: (1, {'@': 341}), 48: (1, {'@': 341}), 33: (1, {'@': 341}), 34: (1, {'@': 341}), 35: (1, {'@': 341}), 36: (1, {'@': 341}), 37: (1, {'@': 341}), 38: (1, {'@': 341}), 39: (1, {'@': 341}), 40: (1, {'@': 341}), 41: (1, {'@': 341}), 42: (1, {'@': 341}), 43: (1, {'@': 341}), 45: (1, {'@': 341}), 46: (1, {'@': 341}), 47: (1, {'@': 341}), 49: (1, {'@': 341}), 50: (1, {'@': 341}), 51: (1, {'@': 341}), 52: (1, {'@': 341}), 53: (1, {'@': 341}), 55: (1, {'@': 341})}, 86: {6: (1, {'@': 327}), 9: (1, {'@': 327}), 26: (1, {'@': 327}), 13: (1, {'@': 327}), 28: (1, {'@': 327}), 33: (1, {'@': 495}), 34: (1, {'@': 495}), 4: (1, {'@': 495}), 45: (1, {'@': 495}), 5: (1, {'@': 495}), 46: (1, {'@': 495}), 35: (1, {'@': 495}), 11: (1, {'@': 495}), 36: (1, {'@': 495}), 37: (1, {'@': 495}), 47: (1, {'@': 495}), 49: (1, {'@': 495}), 50: (1, {'@': 495}), 19: (1, {'@': 495}), 51: (1, {'@': 495}), 38: (1, {'@': 495}), 52: (1, {'@': 495}), 53: (1, {'@': 495}), 39: (1, {'@': 495}), 40: (1, {'@': 495}), 41: (1, {'@': 495}), 42: (1, {'@': 495}), 55: (1, {'@': 495}), 43: (1, {'@': 495}), 2: (1, {'@': 488}), 3: (1, {'@': 488}), 30: (1, {'@': 268}), 24: (1, {'@': 268}), 7: (1, {'@': 268}), 25: (1, {'@': 268}), 10: (1, {'@': 268}), 27: (1, {'@': 268}), 14: (1, {'@': 268}), 15: (1, {'@': 268}), 17: (1, {'@': 268}), 29: (1, {'@': 268}), 18: (1, {'@': 268}), 20: (1, {'@': 268}), 23: (1, {'@': 444}), 8: (1, {'@': 444}), 12: (1, {'@': 444}), 16: (1, {'@': 444}), 21: (1, {'@': 444})}, 87: {33: (1, {'@': 166}), 34: (1, {'@': 166}), 35: (1, {'@': 166}), 36: (1, {'@': 166}), 37: (1, {'@': 166}), 39: (1, {'@': 166}), 40: (1, {'@': 166}), 41: (1, {'@': 166}), 42: (1, {'@': 166}), 43: (1, {'@': 166}), 4: (1, {'@': 166}), 45: (1, {'@': 166}), 46: (1, {'@': 166}), 11: (1, {'@': 166}), 47: (1, {'@': 166}), 49: (1, {'@': 166}), 50: (1, {'@': 166}), 51: (1, {'@': 166}), 52: (1, {'@': 166}), 53: (1, {'@': 166}), 55: (1, {'@': 166})}, 88: {33: (1, {'@': 243}), 34: (1, {'@': 243}), 35: (1, {'@': 243}), 36: (1, {'@': 243}), 37: (1, {'@': 243}), 38: (1, {'@': 243}), 39: (1, {'@': 243}), 40: (1, {'@': 243}), 41: (1, {'@': 243}), 42: (1, {'@': 243}), 32: (1, {'@': 243}), 43: (1, {'@': 243}), 44: (1, {'@': 243}), 4: (1, {'@': 243}), 45: (1, {'@': 243}), 46: (1, {'@': 243}), 31: (1, {'@': 243}), 11: (1, {'@': 243}), 47: (1, {'@': 243}), 49: (1, {'@': 243}), 50: (1, {'@': 243}), 0: (1, {'@': 243}), 19: (1, {'@': 243}), 22: (1, {'@': 243}), 51: (1, {'@': 243}), 52: (1, {'@': 243}), 53: (1, {'@': 243}), 54: (1, {'@': 243}), 55: (1, {'@': 243})}, 89: {4: (0, 384), 179: (0, 74), 19: (0, 373), 13: (0, 334), 28: (0, 105), 175: (0, 156), 6: (0, 100), 11: (0, 75), 9: (0, 139), 26: (0, 6), 15: (1, {'@': 291}), 5: (1, {'@': 291}), 32: (1, {'@': 291}), 25: (1, {'@': 291}), 0: (1, {'@': 291}), 54: (1, {'@': 291})}, 90: {0: (0, 187)}, 91: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 79: (0, 634), 78: (0, 666), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 58: (0, 339), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 32: (0, 543)}, 92: {195: (0, 178), 37: (0, 481), 45: (0, 504), 70: (0, 307), 39: (0, 261), 75: (0, 107), 40: (0, 437), 43: (0, 519), 71: (0, 661), 196: (0, 59), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 197: (0, 4), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483), 198: (0, 346)}, 93: {4: (1, {'@': 412}), 5: (1, {'@': 412}), 44: (1, {'@': 412}), 31: (1, {'@': 412}), 19: (1, {'@': 412}), 11: (1, {'@': 412}), 32: (1, {'@': 149})}, 94: {1: (0, 30), 2: (0, 684), 3: (0, 595), 33: (1, {'@': 507}), 34: (1, {'@': 507}), 35: (1, {'@': 507}), 12: (1, {'@': 507}), 36: (1, {'@': 507}), 37: (1, {'@': 507}), 21: (1, {'@': 507}), 38: (1, {'@': 507}), 23: (1, {'@': 507}), 39: (1, {'@': 507}), 40: (1, {'@': 507}), 41: (1, {'@': 507}), 26: (1, {'@': 507}), 42: (1, {'@': 507}), 32: (1, {'@': 507}), 43: (1, {'@': 507}), 44: (1, {'@': 507}), 4: (1, {'@': 507}), 45: (1, {'@': 507}), 6: (1, {'@': 507}), 8: (1, {'@': 507}), 9: (1, {'@': 507}), 46: (1, {'@': 507}), 31: (1, {'@': 507}), 11: (1, {'@': 507}), 13: (1, {'@': 507}), 47: (1, {'@': 507}), 49: (1, {'@': 507}), 50: (1, {'@': 507}), 16: (1, {'@': 507}), 0: (1, {'@': 507}), 19: (1, {'@': 507}), 22: (1, {'@': 507}), 51: (1, {'@': 507}), 52: (1, {'@': 507}), 53: (1, {'@': 507}), 54: (1, {'@': 507}), 55: (1, {'@': 507}), 28: (1, {'@': 507})}, 95: {33: (1, {'@': 82}), 34: (1, {'@': 82}), 45: (1, {'@': 82}), 46: (1, {'@': 82}), 35: (1, {'@': 82}), 36: (1, {'@': 82}), 37: (1, {'@': 82}), 47: (1, {'@': 82}), 49: (1, {'@': 82}), 50: (1, {'@': 82}), 51: (1, {'@': 82}), 38: (1, {'@': 82}), 52: (1, {'@': 82}), 53: (1, {'@': 82}), 39: (1, {'@': 82}), 40: (1, {'@': 82}), 41: (1, {'@': 82}), 42: (1, {'@': 82}), 55: (1, {'@': 82}), 43: (1, {'@': 82})}, 96: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 58: (0, 599), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 199: (0, 456), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 97: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 93: (0, 646), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 98: {33: (1, {'@': 473}), 34: (1, {'@': 473}), 4: (1, {'@': 473}), 45: (1, {'@': 473}), 46: (1, {'@': 473}), 35: (1, {'@': 473}), 31: (1, {'@': 473}), 11: (1, {'@': 473}), 36: (1, {'@': 473}), 37: (1, {'@': 473}), 47: (1, {'@': 473}), 49: (1, {'@': 473}), 50: (1, {'@': 473}), 0: (1, {'@': 473}), 19: (1, {'@': 473}), 22: (1, {'@': 473}), 51: (1, {'@': 473}), 38: (1, {'@': 473}), 52: (1, {'@': 473}), 53: (1, {'@': 473}), 39: (1, {'@': 473}), 40: (1, {'@': 473}), 41: (1, {'@': 473}), 54: (1, {'@': 473}), 42: (1, {'@': 473}), 32: (1, {'@': 473}), 43: (1, {'@': 473}), 55: (1, {'@': 473}), 44: (1, {'@': 473}), 30: (1, {'@': 490}), 24: (1, {'@': 490}), 7: (1, {'@': 490}), 25: (1, {'@': 490}), 10: (1, {'@': 490}), 27: (1, {'@': 490}), 14: (1, {'@': 490}), 15: (1, {'@': 490}), 17: (1, {'@': 490}), 29: (1, {'@': 490}), 18: (1, {'@': 490}), 20: (1, {'@': 490}), 23: (1, {'@': 456}), 8: (1, {'@': 456}), 12: (1, {'@': 456}), 16: (1, {'@': 456}), 21: (1, {'@': 456}), 2: (1, {'@': 493}), 3: (1, {'@': 493})}, 99: {4: (1, {'@': 93}), 0: (1, {'@': 93}), 19: (1, {'@': 93}), 11: (1, {'@': 93}), 22: (1, {'@': 93}), 32: (1, {'@': 93}), 31: (1, {'@': 93}), 44: (1, {'@': 93}), 54: (1, {'@': 93}), 33: (1, {'@': 93}), 34: (1, {'@': 93}), 45: (1, {'@': 93}), 46: (1, {'@': 93}), 35: (1, {'@': 93}), 36: (1, {'@': 93}), 37: (1, {'@': 93}), 47: (1, {'@': 93}), 49: (1, {'@': 93}), 50: (1, {'@': 93}), 51: (1, {'@': 93}), 38: (1, {'@': 93}), 52: (1, {'@': 93}), 53: (1, {'@': 93}), 39: (1, {'@': 93}), 40: (1, {'@': 93}), 41: (1, {'@': 93}), 42: (1, {'@': 93}), 55: (1, {'@': 93}), 43: (1, {'@': 93})}, 100: {33: (1, {'@': 171}), 34: (1, {'@': 171}), 35: (1, {'@': 171}), 36: (1, {'@': 171}), 37: (1, {'@': 171}), 39: (1, {'@': 171}), 40: (1, {'@': 171}), 41: (1, {'@': 171}), 42: (1, {'@': 171}), 43: (1, {'@': 171}), 4: (1, {'@': 171}), 45: (1, {'@': 171}), 46: (1, {'@': 171}), 11: (1, {'@': 171}), 47: (1, {'@': 171}), 49: (1, {'@': 171}), 50: (1, {'@': 171}), 51: (1, {'@': 171}), 52: (1, {'@': 171}), 53: (1, {'@': 171}), 55: (1, {'@': 171})}, 101: {}, 102: {33: (1, {'@': 85}), 34: (1, {'@': 85}), 45: (1, {'@': 85}), 46: (1, {'@': 85}), 35: (1, {'@': 85}), 36: (1, {'@': 85}), 37: (1, {'@': 85}), 47: (1, {'@': 85}), 49: (1, {'@': 85}), 50: (1, {'@': 85}), 51: (1, {'@': 85}), 38: (1, {'@': 85}), 52: (1, {'@': 85}), 53: (1, {'@': 85}), 39: (1, {'@': 85}), 40: (1, {'@': 85}), 41: (1, {'@': 85}), 42: (1, {'@': 85}), 55: (1, {'@': 85}), 43: (1, {'@': 85})}, 103: {0: (0, 559)}, 104: {23: (0, 137), 8: (0, 335), 16: (0, 322), 174: (0, 342), 21: (0, 303), 12: (0, 631)}, 105: {33: (1, {'@': 169}), 34: (1, {'@': 169}), 35: (1, {'@': 169}), 36: (1, {'@': 169}), 37: (1, {'@': 169}), 39: (1, {'@': 169}), 40: (1, {'@': 169}), 41: (1, {'@': 169}), 42: (1, {'@': 169}), 43: (1, {'@': 169}), 4: (1, {'@': 169}), 45: (1, {'@': 169}), 46: (1, {'@': 169}), 11: (1, {'@': 169}), 47: (1, {'@': 169}), 49: (1, {'@': 169}), 50: (1, {'@': 169}), 51: (1, {'@': 169}), 52: (1, {'@': 169}), 53: (1, {'@': 169}), 55: (1, {'@': 169})}, 106: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 93: (0, 620), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 107: {30: (1, {'@': 270}), 24: (1, {'@': 270}), 7: (1, {'@': 270}), 25: (1, {'@': 270}), 10: (1, {'@': 270}), 27: (1, {'@': 270}), 14: (1, {'@': 270}), 15: (1, {'@': 270}), 17: (1, {'@': 270}), 29: (1, {'@': 270}), 18: (1, {'@': 270}), 20: (1, {'@': 270}), 33: (1, {'@': 486}), 34: (1, {'@': 486}), 35: (1, {'@': 486}), 12: (1, {'@': 486}), 36: (1, {'@': 486}), 37: (1, {'@': 486}), 21: (1, {'@': 486}), 38: (1, {'@': 486}), 23: (1, {'@': 486}), 39: (1, {'@': 486}), 40: (1, {'@': 486}), 41: (1, {'@': 486}), 42: (1, {'@': 486}), 32: (1, {'@': 486}), 43: (1, {'@': 486}), 44: (1, {'@': 486}), 4: (1, {'@': 486}), 45: (1, {'@': 486}), 5: (1, {'@': 486}), 8: (1, {'@': 486}), 3: (1, {'@': 486}), 46: (1, {'@': 486}), 31: (1, {'@': 486}), 11: (1, {'@': 486}), 2: (1, {'@': 486}), 47: (1, {'@': 486}), 48: (1, {'@': 486}), 16: (1, {'@': 486}), 49: (1, {'@': 486}), 50: (1, {'@': 486}), 0: (1, {'@': 486}), 19: (1, {'@': 486}), 22: (1, {'@': 486}), 51: (1, {'@': 486}), 52: (1, {'@': 486}), 53: (1, {'@': 486}), 54: (1, {'@': 486}), 55: (1, {'@': 486}), 26: (1, {'@': 486}), 6: (1, {'@': 486}), 13: (1, {'@': 486}), 28: (1, {'@': 486}), 9: (1, {'@': 486})}, 108: {33: (1, {'@': 86}), 34: (1, {'@': 86}), 45: (1, {'@': 86}), 46: (1, {'@': 86}), 35: (1, {'@': 86}), 36: (1, {'@': 86}), 37: (1, {'@': 86}), 47: (1, {'@': 86}), 49: (1, {'@': 86}), 50: (1, {'@': 86}), 51: (1, {'@': 86}), 38: (1, {'@': 86}), 52: (1, {'@': 86}), 53: (1, {'@': 86}), 39: (1, {'@': 86}), 40: (1, {'@': 86}), 41: (1, {'@': 86}), 42: (1, {'@': 86}), 55: (1, {'@': 86}), 43: (1, {'@': 86})}, 109: {33: (1, {'@': 206}), 34: (1, {'@': 206}), 5: (1, {'@': 206}), 45: (1, {'@': 206}), 46: (1, {'@': 206}), 35: (1, {'@': 206}), 36: (1, {'@': 206}), 37: (1, {'@': 206}), 47: (1, {'@': 206}), 49: (1, {'@': 206}), 50: (1, {'@': 206}), 51: (1, {'@': 206}), 38: (1, {'@': 206}), 52: (1, {'@': 206}), 53: (1, {'@': 206}), 39: (1, {'@': 206}), 40: (1, {'@': 206}), 41: (1, {'@': 206}), 42: (1, {'@': 206}), 55: (1, {'@': 206}), 43: (1, {'@': 206})}, 110: {32: (0, 350)}, 111: {2: (0, 684), 1: (0, 299), 3: (0, 595)}, 112: {179: (0, 619), 13: (0, 334), 28: (0, 105), 6: (0, 100), 175: (0, 53), 9: (0, 139), 26: (0, 6)}, 113: {6: (1, {'@': 384}), 9: (1, {'@': 384}), 26: (1, {'@': 384}), 13: (1, {'@': 384}), 28: (1, {'@': 384}), 0: (1, {'@': 287}), 5: (1, {'@': 287}), 32: (1, {'@': 287}), 54: (1, {'@': 287})}, 114: {33: (1, {'@': 262}), 34: (1, {'@': 262}), 35: (1, {'@': 262}), 12: (1, {'@': 262}), 36: (1, {'@': 262}), 14: (1, {'@': 262}), 37: (1, {'@': 262}), 18: (1, {'@': 262}), 21: (1, {'@': 262}), 38: (1, {'@': 262}), 23: (1, {'@': 262}), 24: (1, {'@': 262}), 25: (1, {'@': 262}), 39: (1, {'@': 262}), 40: (1, {'@': 262}), 41: (1, {'@': 262}), 26: (1, {'@': 262}), 42: (1, {'@': 262}), 43: (1, {'@': 262}), 4: (1, {'@': 262}), 45: (1, {'@': 262}), 5: (1, {'@': 262}), 6: (1, {'@': 262}), 7: (1, {'@': 262}), 8: (1, {'@': 262}), 9: (1, {'@': 262}), 3: (1, {'@': 262}), 10: (1, {'@': 262}), 46: (1, {'@': 262}), 11: (1, {'@': 262}), 13: (1, {'@': 262}), 2: (1, {'@': 262}), 15: (1, {'@': 262}), 47: (1, {'@': 262}), 16: (1, {'@': 262}), 49: (1, {'@': 262}), 17: (1, {'@': 262}), 50: (1, {'@': 262}), 19: (1, {'@': 262}), 20: (1, {'@': 262}), 51: (1, {'@': 262}), 52: (1, {'@': 262}), 53: (1, {'@': 262}), 27: (1, {'@': 262}), 55: (1, {'@': 262}), 28: (1, {'@': 262}), 29: (1, {'@': 262}), 30: (1, {'@': 262})}, 115: {33: (1, {'@': 215}), 34: (1, {'@': 215}), 45: (1, {'@': 215}), 46: (1, {'@': 215}), 35: (1, {'@': 215}), 36: (1, {'@': 215}), 37: (1, {'@': 215}), 47: (1, {'@': 215}), 49: (1, {'@': 215}), 50: (1, {'@': 215}), 51: (1, {'@': 215}), 38: (1, {'@': 215}), 52: (1, {'@': 215}), 53: (1, {'@': 215}), 39: (1, {'@': 215}), 40: (1, {'@': 215}), 41: (1, {'@': 215}), 42: (1, {'@': 215}), 55: (1, {'@': 215}), 43: (1, {'@': 215})}, 116: {177: (0, 503), 26: (0, 121)}, 117: {4: (1, {'@': 208}), 33: (1, {'@': 208}), 5: (1, {'@': 208}), 34: (1, {'@': 208}), 45: (1, {'@': 208}), 46: (1, {'@': 208}), 35: (1, {'@': 208}), 11: (1, {'@': 208}), 36: (1, {'@': 208}), 37: (1, {'@': 208}), 47: (1, {'@': 208}), 49: (1, {'@': 208}), 50: (1, {'@': 208}), 19: (1, {'@': 208}), 51: (1, {'@': 208}), 38: (1, {'@': 208}), 52: (1, {'@': 208}), 53: (1, {'@': 208}), 39: (1, {'@': 208}), 40: (1, {'@': 208}), 41: (1, {'@': 208}), 42: (1, {'@': 208}), 55: (1, {'@': 208}), 43: (1, {'@': 208})}, 118: {6: (1, {'@': 401}), 9: (1, {'@': 401}), 26: (1, {'@': 401}), 13: (1, {'@': 401}), 28: (1, {'@': 401}), 4: (1, {'@': 395}), 33: (1, {'@': 395}), 34: (1, {'@': 395}), 5: (1, {'@': 395}), 45: (1, {'@': 395}), 46: (1, {'@': 395}), 35: (1, {'@': 395}), 11: (1, {'@': 395}), 36: (1, {'@': 395}), 37: (1, {'@': 395}), 47: (1, {'@': 395}), 49: (1, {'@': 395}), 50: (1, {'@': 395}), 19: (1, {'@': 395}), 51: (1, {'@': 395}), 38: (1, {'@': 395}), 52: (1, {'@': 395}), 53: (1, {'@': 395}), 39: (1, {'@': 395}), 40: (1, {'@': 395}), 41: (1, {'@': 395}), 42: (1, {'@': 395}), 55: (1, {'@': 395}), 43: (1, {'@': 395}), 2: (1, {'@': 488}), 3: (1, {'@': 488}), 30: (1, {'@': 268}), 24: (1, {'@': 268}), 7: (1, {'@': 268}), 25: (1, {'@': 268}), 10: (1, {'@': 268}), 27: (1, {'@': 268}), 14: (1, {'@': 268}), 15: (1, {'@': 268}), 17: (1, {'@': 268}), 29: (1, {'@': 268}), 18: (1, {'@': 268}), 20: (1, {'@': 268}), 23: (1, {'@': 444}), 8: (1, {'@': 444}), 12: (1, {'@': 444}), 16: (1, {'@': 444}), 21: (1, {'@': 444})}, 119: {54: (0, 326)}, 120: {0: (1, {'@': 241}), 22: (1, {'@': 241}), 31: (1, {'@': 241}), 32: (1, {'@': 241}), 44: (1, {'@': 241}), 54: (1, {'@': 241}), 33: (1, {'@': 241}), 34: (1, {'@': 241}), 45: (1, {'@': 241}), 46: (1, {'@': 241}), 35: (1, {'@': 241}), 36: (1, {'@': 241}), 37: (1, {'@': 241}), 47: (1, {'@': 241}), 49: (1, {'@': 241}), 50: (1, {'@': 241}), 51: (1, {'@': 241}), 38: (1, {'@': 241}), 52: (1, {'@': 241}), 53: (1, {'@': 241}), 39: (1, {'@': 241}), 40: (1, {'@': 241}), 41: (1, {'@': 241}), 42: (1, {'@': 241}), 55: (1, {'@': 241}), 43: (1, {'@': 241})}, 121: {33: (1, {'@': 172}), 34: (1, {'@': 172}), 35: (1, {'@': 172}), 36: (1, {'@': 172}), 37: (1, {'@': 172}), 39: (1, {'@': 172}), 40: (1, {'@': 172}), 41: (1, {'@': 172}), 42: (1, {'@': 172}), 43: (1, {'@': 172}), 4: (1, {'@': 172}), 45: (1, {'@': 172}), 46: (1, {'@': 172}), 11: (1, {'@': 172}), 47: (1, {'@': 172}), 49: (1, {'@': 172}), 50: (1, {'@': 172}), 51: (1, {'@': 172}), 52: (1, {'@': 172}), 53: (1, {'@': 172}), 55: (1, {'@': 172})}, 122: {200: (0, 277), 178: (0, 272), 4: (1, {'@': 141}), 5: (1, {'@': 141}), 6: (1, {'@': 141}), 7: (1, {'@': 141}), 8: (1, {'@': 141}), 9: (1, {'@': 141}), 3: (1, {'@': 141}), 31: (1, {'@': 141}), 10: (1, {'@': 141}), 11: (1, {'@': 141}), 12: (1, {'@': 141}), 13: (1, {'@': 141}), 2: (1, {'@': 141}), 14: (1, {'@': 141}), 15: (1, {'@': 141}), 16: (1, {'@': 141}), 17: (1, {'@': 141}), 18: (1, {'@': 141}), 19: (1, {'@': 141}), 20: (1, {'@': 141}), 21: (1, {'@': 141}), 23: (1, {'@': 141}), 24: (1, {'@': 141}), 25: (1, {'@': 141}), 26: (1, {'@': 141}), 27: (1, {'@': 141}), 32: (1, {'@': 141}), 28: (1, {'@': 141}), 29: (1, {'@': 141}), 30: (1, {'@': 141})}, 123: {33: (1, {'@': 84}), 34: (1, {'@': 84}), 45: (1, {'@': 84}), 46: (1, {'@': 84}), 35: (1, {'@': 84}), 36: (1, {'@': 84}), 37: (1, {'@': 84}), 47: (1, {'@': 84}), 49: (1, {'@': 84}), 50: (1, {'@': 84}), 51: (1, {'@': 84}), 38: (1, {'@': 84}), 52: (1, {'@': 84}), 53: (1, {'@': 84}), 39: (1, {'@': 84}), 40: (1, {'@': 84}), 41: (1, {'@': 84}), 42: (1, {'@': 84}), 55: (1, {'@': 84}), 43: (1, {'@': 84})}, 124: {33: (1, {'@': 102}), 34: (1, {'@': 102}), 35: (1, {'@': 102}), 12: (1, {'@': 102}), 36: (1, {'@': 102}), 14: (1, {'@': 102}), 37: (1, {'@': 102}), 18: (1, {'@': 102}), 21: (1, {'@': 102}), 38: (1, {'@': 102}), 23: (1, {'@': 102}), 24: (1, {'@': 102}), 25: (1, {'@': 102}), 39: (1, {'@': 102}), 40: (1, {'@': 102}), 41: (1, {'@': 102}), 26: (1, {'@': 102}), 42: (1, {'@': 102}), 43: (1, {'@': 102}), 4: (1, {'@': 102}), 45: (1, {'@': 102}), 5: (1, {'@': 102}), 6: (1, {'@': 102}), 7: (1, {'@': 102}), 8: (1, {'@': 102}), 9: (1, {'@': 102}), 3: (1, {'@': 102}), 10: (1, {'@': 102}), 46: (1, {'@': 102}), 11: (1, {'@': 102}), 13: (1, {'@': 102}), 2: (1, {'@': 102}), 15: (1, {'@': 102}), 47: (1, {'@': 102}), 16: (1, {'@': 102}), 49: (1, {'@': 102}), 17: (1, {'@': 102}), 50: (1, {'@': 102}), 19: (1, {'@': 102}), 20: (1, {'@': 102}), 51: (1, {'@': 102}), 52: (1, {'@': 102}), 53: (1, {'@': 102}), 27: (1, {'@': 102}), 55: (1, {'@': 102}), 28: (1, {'@': 102}), 29: (1, {'@': 102}), 30: (1, {'@': 102})}, 125: {25: (0, 87), 176: (0, 471), 15: (0, 460), 5: (1, {'@': 152}), 32: (1, {'@': 152}), 0: (1, {'@': 152}), 54: (1, {'@': 152})}, 126: {37: (0, 481), 36: (0, 276), 70: (0, 364), 46: (0, 534)}, 127: {33: (1, {'@': 463}), 34: (1, {'@': 463}), 4: (1, {'@': 463}), 45: (1, {'@': 463}), 5: (1, {'@': 463}), 46: (1, {'@': 463}), 35: (1, {'@': 463}), 11: (1, {'@': 463}), 36: (1, {'@': 463}), 37: (1, {'@': 463}), 47: (1, {'@': 463}), 49: (1, {'@': 463}), 50: (1, {'@': 463}), 19: (1, {'@': 463}), 51: (1, {'@': 463}), 38: (1, {'@': 463}), 52: (1, {'@': 463}), 53: (1, {'@': 463}), 39: (1, {'@': 463}), 40: (1, {'@': 463}), 41: (1, {'@': 463}), 42: (1, {'@': 463}), 55: (1, {'@': 463}), 43: (1, {'@': 463})}, 128: {4: (1, {'@': 342}), 5: (1, {'@': 342}), 0: (1, {'@': 342}), 19: (1, {'@': 342}), 11: (1, {'@': 342}), 22: (1, {'@': 342}), 32: (1, {'@': 342}), 31: (1, {'@': 342}), 54: (1, {'@': 342}), 44: (1, {'@': 342}), 48: (1, {'@': 342}), 33: (1, {'@': 342}), 34: (1, {'@': 342}), 35: (1, {'@': 342}), 36: (1, {'@': 342}), 37: (1, {'@': 342}), 38: (1, {'@': 342}), 39: (1, {'@': 342}), 40: (1, {'@': 342}), 41: (1, {'@': 342}), 42: (1, {'@': 342}), 43: (1, {'@': 342}), 45: (1, {'@': 342}), 46: (1, {'@': 342}), 47: (1, {'@': 342}), 49: (1, {'@': 342}), 50: (1, {'@': 342}), 51: (1, {'@': 342}), 52: (1, {'@': 342}), 53: (1, {'@': 342}), 55: (1, {'@': 342})}, 129: {4: (1, {'@': 354}), 32: (1, {'@': 354}), 0: (1, {'@': 354}), 19: (1, {'@': 354}), 11: (1, {'@': 354}), 54: (1, {'@': 354}), 48: (1, {'@': 354}), 5: (1, {'@': 354})}, 130: {0: (1, {'@': 288}), 5: (1, {'@': 288}), 32: (1, {'@': 288}), 54: (1, {'@': 288})}, 131: {195: (0, 178), 37: (0, 481), 45: (0, 504), 70: (0, 307), 39: (0, 261), 75: (0, 107), 40: (0, 437), 43: (0, 519), 71: (0, 661), 196: (0, 59), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 41: (0, 458), 198: (0, 538), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 197: (0, 4), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 132: {33: (1, {'@': 462}), 34: (1, {'@': 462}), 4: (1, {'@': 462}), 45: (1, {'@': 462}), 5: (1, {'@': 462}), 46: (1, {'@': 462}), 35: (1, {'@': 462}), 11: (1, {'@': 462}), 36: (1, {'@': 462}), 37: (1, {'@': 462}), 47: (1, {'@': 462}), 49: (1, {'@': 462}), 50: (1, {'@': 462}), 19: (1, {'@': 462}), 51: (1, {'@': 462}), 38: (1, {'@': 462}), 52: (1, {'@': 462}), 53: (1, {'@': 462}), 39: (1, {'@': 462}), 40: (1, {'@': 462}), 41: (1, {'@': 462}), 42: (1, {'@': 462}), 55: (1, {'@': 462}), 43: (1, {'@': 462})}, 133: {33: (1, {'@': 232}), 34: (1, {'@': 232}), 35: (1, {'@': 232}), 36: (1, {'@': 232}), 37: (1, {'@': 232}), 38: (1, {'@': 232}), 39: (1, {'@': 232}), 40: (1, {'@': 232}), 41: (1, {'@': 232}), 42: (1, {'@': 232}), 43: (1, {'@': 232}), 45: (1, {'@': 232}), 46: (1, {'@': 232}), 47: (1, {'@': 232}), 49: (1, {'@': 232}), 50: (1, {'@': 232}), 51: (1, {'@': 232}), 52: (1, {'@': 232}), 53: (1, {'@': 232}), 55: (1, {'@': 232})}, 134: {33: (1, {'@': 508}), 34: (1, {'@': 508}), 35: (1, {'@': 508}), 12: (1, {'@': 508}), 36: (1, {'@': 508}), 37: (1, {'@': 508}), 21: (1, {'@': 508}), 38: (1, {'@': 508}), 23: (1, {'@': 508}), 39: (1, {'@': 508}), 40: (1, {'@': 508}), 41: (1, {'@': 508}), 26: (1, {'@': 508}), 42: (1, {'@': 508}), 32: (1, {'@': 508}), 43: (1, {'@': 508}), 44: (1, {'@': 508}), 4: (1, {'@': 508}), 45: (1, {'@': 508}), 6: (1, {'@': 508}), 8: (1, {'@': 508}), 9: (1, {'@': 508}), 46: (1, {'@': 508}), 31: (1, {'@': 508}), 11: (1, {'@': 508}), 13: (1, {'@': 508}), 47: (1, {'@': 508}), 16: (1, {'@': 508}), 49: (1, {'@': 508}), 50: (1, {'@': 508}), 0: (1, {'@': 508}), 19: (1, {'@': 508}), 22: (1, {'@': 508}), 51: (1, {'@': 508}), 52: (1, {'@': 508}), 53: (1, {'@': 508}), 54: (1, {'@': 508}), 55: (1, {'@': 508}), 28: (1, {'@': 508})}, 135: {37: (0, 481), 180: (0, 317), 4: (0, 314), 70: (0, 307), 45: (0, 504), 39: (0, 261), 181: (0, 357), 191: (0, 541), 182: (0, 422), 40: (0, 437), 183: (0, 431), 93: (0, 542), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 193: (0, 363), 73: (0, 698), 49: (0, 669), 47: (0, 675), 194: (0, 78), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 34: (0, 483), 185: (0, 352), 186: (0, 589), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 136: {37: (0, 481), 45: (0, 504), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 75: (0, 255), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 137: {33: (1, {'@': 162}), 34: (1, {'@': 162}), 35: (1, {'@': 162}), 36: (1, {'@': 162}), 37: (1, {'@': 162}), 39: (1, {'@': 162}), 40: (1, {'@': 162}), 41: (1, {'@': 162}), 42: (1, {'@': 162}), 43: (1, {'@': 162}), 4: (1, {'@': 162}), 45: (1, {'@': 162}), 46: (1, {'@': 162}), 11: (1, {'@': 162}), 47: (1, {'@': 162}), 49: (1, {'@': 162}), 50: (1, {'@': 162}), 51: (1, {'@': 162}), 52: (1, {'@': 162}), 53: (1, {'@': 162}), 55: (1, {'@': 162})}, 138: {25: (0, 87), 15: (0, 460), 176: (0, 341), 33: (1, {'@': 107}), 35: (1, {'@': 107}), 12: (1, {'@': 107}), 37: (1, {'@': 107}), 23: (1, {'@': 107}), 39: (1, {'@': 107}), 41: (1, {'@': 107}), 26: (1, {'@': 107}), 42: (1, {'@': 107}), 32: (1, {'@': 107}), 4: (1, {'@': 107}), 5: (1, {'@': 107}), 6: (1, {'@': 107}), 8: (1, {'@': 107}), 31: (1, {'@': 107}), 11: (1, {'@': 107}), 2: (1, {'@': 107}), 13: (1, {'@': 107}), 16: (1, {'@': 107}), 0: (1, {'@': 107}), 19: (1, {'@': 107}), 22: (1, {'@': 107}), 51: (1, {'@': 107}), 54: (1, {'@': 107}), 55: (1, {'@': 107}), 28: (1, {'@': 107}), 34: (1, {'@': 107}), 36: (1, {'@': 107}), 21: (1, {'@': 107}), 38: (1, {'@': 107}), 40: (1, {'@': 107}), 43: (1, {'@': 107}), 44: (1, {'@': 107}), 45: (1, {'@': 107}), 3: (1, {'@': 107}), 9: (1, {'@': 107}), 46: (1, {'@': 107}), 47: (1, {'@': 107}), 48: (1, {'@': 107}), 49: (1, {'@': 107}), 50: (1, {'@': 107}), 52: (1, {'@': 107}), 53: (1, {'@': 107})}, 139: {33: (1, {'@': 176}), 34: (1, {'@': 176}), 35: (1, {'@': 176}), 36: (1, {'@': 176}), 37: (1, {'@': 176}), 39: (1, {'@': 176}), 40: (1, {'@': 176}), 41: (1, {'@': 176}), 42: (1, {'@': 176}), 43: (1, {'@': 176}), 4: (1, {'@': 176}), 45: (1, {'@': 176}), 46: (1, {'@': 176}), 11: (1, {'@': 176}), 47: (1, {'@': 176}), 49: (1, {'@': 176}), 50: (1, {'@': 176}), 51: (1, {'@': 176}), 52: (1, {'@': 176}), 53: (1, {'@': 176}), 55: (1, {'@': 176})}, 140: {32: (0, 223)}, 141: {0: (1, {'@': 337}), 22: (1, {'@': 337}), 31: (1, {'@': 337}), 32: (1, {'@': 337}), 44: (1, {'@': 337}), 54: (1, {'@': 337}), 33: (1, {'@': 337}), 34: (1, {'@': 337}), 45: (1, {'@': 337}), 46: (1, {'@': 337}), 35: (1, {'@': 337}), 36: (1, {'@': 337}), 37: (1, {'@': 337}), 47: (1, {'@': 337}), 49: (1, {'@': 337}), 50: (1, {'@': 337}), 51: (1, {'@': 337}), 38: (1, {'@': 337}), 52: (1, {'@': 337}), 53: (1, {'@': 337}), 39: (1, {'@': 337}), 40: (1, {'@': 337}), 41: (1, {'@': 337}), 42: (1, {'@': 337}), 55: (1, {'@': 337}), 43: (1, {'@': 337})}, 142: {23: (0, 137), 8: (0, 335), 16: (0, 322), 21: (0, 303), 174: (0, 353), 12: (0, 631), 4: (1, {'@': 394}), 33: (1, {'@': 394}), 34: (1, {'@': 394}), 6: (1, {'@': 394}), 5: (1, {'@': 394}), 45: (1, {'@': 394}), 9: (1, {'@': 394}), 46: (1, {'@': 394}), 35: (1, {'@': 394}), 11: (1, {'@': 394}), 13: (1, {'@': 394}), 36: (1, {'@': 394}), 37: (1, {'@': 394}), 47: (1, {'@': 394}), 49: (1, {'@': 394}), 50: (1, {'@': 394}), 19: (1, {'@': 394}), 51: (1, {'@': 394}), 38: (1, {'@': 394}), 52: (1, {'@': 394}), 53: (1, {'@': 394}), 39: (1, {'@': 394}), 40: (1, {'@': 394}), 41: (1, {'@': 394}), 26: (1, {'@': 394}), 42: (1, {'@': 394}), 55: (1, {'@': 394}), 43: (1, {'@': 394}), 28: (1, {'@': 394})}, 143: {33: (1, {'@': 263}), 34: (1, {'@': 263}), 35: (1, {'@': 263}), 12: (1, {'@': 263}), 36: (1, {'@': 263}), 14: (1, {'@': 263}), 37: (1, {'@': 263}), 18: (1, {'@': 263}), 21: (1, {'@': 263}), 38: (1, {'@': 263}), 23: (1, {'@': 263}), 24: (1, {'@': 263}), 25: (1, {'@': 263}), 39: (1, {'@': 263}), 40: (1, {'@': 263}), 41: (1, {'@': 263}), 26: (1, {'@': 263}), 42: (1, {'@': 263}), 43: (1, {'@': 263}), 4: (1, {'@': 263}), 45: (1, {'@': 263}), 5: (1, {'@': 263}), 6: (1, {'@': 263}), 7: (1, {'@': 263}), 8: (1, {'@': 263}), 9: (1, {'@': 263}), 3: (1, {'@': 263}), 10: (1, {'@': 263}), 46: (1, {'@': 263}), 11: (1, {'@': 263}), 13: (1, {'@': 263}), 2: (1, {'@': 263}), 15: (1, {'@': 263}), 47: (1, {'@': 263}), 16: (1, {'@': 263}), 49: (1, {'@': 263}), 17: (1, {'@': 263}), 50: (1, {'@': 263}), 19: (1, {'@': 263}), 20: (1, {'@': 263}), 51: (1, {'@': 263}), 52: (1, {'@': 263}), 53: (1, {'@': 263}), 27: (1, {'@': 263}), 55: (1, {'@': 263}), 28: (1, {'@': 263}), 29: (1, {'@': 263}), 30: (1, {'@': 263})}, 144: {0: (1, {'@': 94}), 32: (1, {'@': 94}), 54: (1, {'@': 94}), 48: (1, {'@': 94})}, 145: {37: (0, 481), 160: (0, 304), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 164: (0, 569), 161: (0, 201), 40: (0, 437), 43: (0, 519), 162: (0, 69), 163: (0, 198), 71: (0, 661), 11: (0, 522), 33: (0, 283), 77: (0, 571), 46: (0, 534), 165: (0, 20), 42: (0, 606), 55: (0, 708), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 166: (0, 76), 41: (0, 458), 201: (0, 578), 80: (0, 628), 88: (0, 419), 66: (0, 528), 97: (0, 525), 167: (0, 206), 168: (0, 158), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 84: (0, 621), 52: (0, 544), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 146: {37: (0, 481), 160: (0, 304), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 164: (0, 569), 161: (0, 201), 40: (0, 437), 43: (0, 519), 162: (0, 69), 163: (0, 198), 71: (0, 661), 11: (0, 522), 33: (0, 283), 77: (0, 571), 46: (0, 534), 165: (0, 20), 42: (0, 606), 55: (0, 708), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 166: (0, 76), 41: (0, 458), 201: (0, 274), 80: (0, 628), 88: (0, 419), 66: (0, 528), 97: (0, 525), 167: (0, 206), 168: (0, 158), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 84: (0, 621), 52: (0, 544), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 147: {33: (1, {'@': 461}), 34: (1, {'@': 461}), 4: (1, {'@': 461}), 45: (1, {'@': 461}), 5: (1, {'@': 461}), 46: (1, {'@': 461}), 35: (1, {'@': 461}), 11: (1, {'@': 461}), 36: (1, {'@': 461}), 37: (1, {'@': 461}), 47: (1, {'@': 461}), 49: (1, {'@': 461}), 50: (1, {'@': 461}), 19: (1, {'@': 461}), 51: (1, {'@': 461}), 38: (1, {'@': 461}), 52: (1, {'@': 461}), 53: (1, {'@': 461}), 39: (1, {'@': 461}), 40: (1, {'@': 461}), 41: (1, {'@': 461}), 42: (1, {'@': 461}), 55: (1, {'@': 461}), 43: (1, {'@': 461})}, 148: {32: (0, 358)}, 149: {0: (1, {'@': 336}), 22: (1, {'@': 336}), 31: (1, {'@': 336}), 32: (1, {'@': 336}), 44: (1, {'@': 336}), 54: (1, {'@': 336}), 33: (1, {'@': 336}), 34: (1, {'@': 336}), 45: (1, {'@': 336}), 46: (1, {'@': 336}), 35: (1, {'@': 336}), 36: (1, {'@': 336}), 37: (1, {'@': 336}), 47: (1, {'@': 336}), 49: (1, {'@': 336}), 50: (1, {'@': 336}), 51: (1, {'@': 336}), 38: (1, {'@': 336}), 52: (1, {'@': 336}), 53: (1, {'@': 336}), 39: (1, {'@': 336}), 40: (1, {'@': 336}), 41: (1, {'@': 336}), 42: (1, {'@': 336}), 55: (1, {'@': 336}), 43: (1, {'@': 336})}, 150: {28: (0, 579), 171: (0, 463), 9: (0, 139), 6: (0, 644), 175: (0, 477), 13: (0, 670), 4: (1, {'@': 307}), 33: (1, {'@': 307}), 34: (1, {'@': 307}), 5: (1, {'@': 307}), 45: (1, {'@': 307}), 46: (1, {'@': 307}), 35: (1, {'@': 307}), 11: (1, {'@': 307}), 36: (1, {'@': 307}), 37: (1, {'@': 307}), 47: (1, {'@': 307}), 49: (1, {'@': 307}), 50: (1, {'@': 307}), 19: (1, {'@': 307}), 51: (1, {'@': 307}), 38: (1, {'@': 307}), 52: (1, {'@': 307}), 53: (1, {'@': 307}), 39: (1, {'@': 307}), 40: (1, {'@': 307}), 41: (1, {'@': 307}), 42: (1, {'@': 307}), 55: (1, {'@': 307}), 43: (1, {'@': 307}), 26: (1, {'@': 400})}, 151: {4: (1, {'@': 356}), 5: (1, {'@': 356}), 0: (1, {'@': 356}), 19: (1, {'@': 356}), 11: (1, {'@': 356}), 22: (1, {'@': 356}), 32: (1, {'@': 356}), 31: (1, {'@': 356}), 54: (1, {'@': 356}), 44: (1, {'@': 356}), 48: (1, {'@': 356}), 33: (1, {'@': 356}), 34: (1, {'@': 356}), 45: (1, {'@': 356}), 46: (1, {'@': 356}), 35: (1, {'@': 356}), 36: (1, {'@': 356}), 37: (1, {'@': 356}), 47: (1, {'@': 356}), 49: (1, {'@': 356}), 50: (1, {'@': 356}), 51: (1, {'@': 356}), 38: (1, {'@': 356}), 52: (1, {'@': 356}), 53: (1, {'@': 356}), 39: (1, {'@': 356}), 40: (1, {'@': 356}), 41: (1, {'@': 356}), 42: (1, {'@': 356}), 55: (1, {'@': 356}), 43: (1, {'@': 356})}, 152: {5: (0, 385)}, 153: {33: (1, {'@': 424}), 34: (1, {'@': 424}), 4: (1, {'@': 424}), 45: (1, {'@': 424}), 46: (1, {'@': 424}), 35: (1, {'@': 424}), 31: (1, {'@': 424}), 11: (1, {'@': 424}), 36: (1, {'@': 424}), 37: (1, {'@': 424}), 47: (1, {'@': 424}), 49: (1, {'@': 424}), 50: (1, {'@': 424}), 0: (1, {'@': 424}), 19: (1, {'@': 424}), 22: (1, {'@': 424}), 51: (1, {'@': 424}), 38: (1, {'@': 424}), 52: (1, {'@': 424}), 53: (1, {'@': 424}), 39: (1, {'@': 424}), 40: (1, {'@': 424}), 41: (1, {'@': 424}), 54: (1, {'@': 424}), 42: (1, {'@': 424}), 32: (1, {'@': 424}), 43: (1, {'@': 424}), 55: (1, {'@': 424}), 44: (1, {'@': 424})}, 154: {0: (0, 702)}, 155: {33: (1, {'@': 182}), 34: (1, {'@': 182}), 35: (1, {'@': 182}), 36: (1, {'@': 182}), 37: (1, {'@': 182}), 39: (1, {'@': 182}), 40: (1, {'@': 182}), 41: (1, {'@': 182}), 42: (1, {'@': 182}), 43: (1, {'@': 182}), 4: (1, {'@': 182}), 45: (1, {'@': 182}), 46: (1, {'@': 182}), 11: (1, {'@': 182}), 47: (1, {'@': 182}), 49: (1, {'@': 182}), 50: (1, {'@': 182}), 51: (1, {'@': 182}), 52: (1, {'@': 182}), 53: (1, {'@': 182}), 55: (1, {'@': 182})}, 156: {37: (0, 481), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 77: (0, 130), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 157: {54: (0, 296)}, 158: {1: (0, 92), 2: (0, 684), 3: (0, 595)}, 159: {37: (0, 481), 180: (0, 317), 4: (0, 314), 70: (0, 307), 45: (0, 504), 39: (0, 261), 181: (0, 357), 182: (0, 422), 40: (0, 437), 183: (0, 431), 93: (0, 404), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 34: (0, 483), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 185: (0, 439), 101: (0, 256), 186: (0, 423), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 160: {4: (1, {'@': 319}), 33: (1, {'@': 319}), 5: (1, {'@': 319}), 34: (1, {'@': 319}), 45: (1, {'@': 319}), 46: (1, {'@': 319}), 35: (1, {'@': 319}), 11: (1, {'@': 319}), 36: (1, {'@': 319}), 37: (1, {'@': 319}), 47: (1, {'@': 319}), 49: (1, {'@': 319}), 50: (1, {'@': 319}), 19: (1, {'@': 319}), 51: (1, {'@': 319}), 38: (1, {'@': 319}), 52: (1, {'@': 319}), 53: (1, {'@': 319}), 39: (1, {'@': 319}), 40: (1, {'@': 319}), 41: (1, {'@': 319}), 42: (1, {'@': 319}), 55: (1, {'@': 319}), 43: (1, {'@': 319})}, 161: {4: (1, {'@': 351}), 32: (1, {'@': 351}), 0: (1, {'@': 351}), 19: (1, {'@': 351}), 11: (1, {'@': 351}), 54: (1, {'@': 351}), 48: (1, {'@': 351}), 5: (1, {'@': 351})}, 162: {4: (1, {'@': 257}), 5: (1, {'@': 257}), 6: (1, {'@': 257}), 7: (1, {'@': 257}), 8: (1, {'@': 257}), 9: (1, {'@': 257}), 10: (1, {'@': 257}), 3: (1, {'@': 257}), 11: (1, {'@': 257}), 12: (1, {'@': 257}), 13: (1, {'@': 257}), 14: (1, {'@': 257}), 15: (1, {'@': 257}), 2: (1, {'@': 257}), 16: (1, {'@': 257}), 17: (1, {'@': 257}), 0: (1, {'@': 257}), 18: (1, {'@': 257}), 19: (1, {'@': 257}), 20: (1, {'@': 257}), 21: (1, {'@': 257}), 22: (1, {'@': 257}), 23: (1, {'@': 257}), 24: (1, {'@': 257}), 25: (1, {'@': 257}), 26: (1, {'@': 257}), 27: (1, {'@': 257}), 28: (1, {'@': 257}), 29: (1, {'@': 257}), 30: (1, {'@': 257}), 31: (1, {'@': 257}), 32: (1, {'@': 257}), 54: (1, {'@': 257}), 44: (1, {'@': 257}), 33: (1, {'@': 257}), 34: (1, {'@': 257}), 35: (1, {'@': 257}), 36: (1, {'@': 257}), 37: (1, {'@': 257}), 38: (1, {'@': 257}), 39: (1, {'@': 257}), 40: (1, {'@': 257}), 41: (1, {'@': 257}), 42: (1, {'@': 257}), 43: (1, {'@': 257}), 45: (1, {'@': 257}), 46: (1, {'@': 257}), 47: (1, {'@': 257}), 49: (1, {'@': 257}), 50: (1, {'@': 257}), 51: (1, {'@': 257}), 52: (1, {'@': 257}), 53: (1, {'@': 257}), 55: (1, {'@': 257})}, 163: {158: (0, 561), 31: (0, 398), 44: (0, 327), 159: (0, 657), 0: (1, {'@': 300})}, 164: {37: (0, 481), 180: (0, 317), 4: (0, 314), 70: (0, 307), 45: (0, 504), 39: (0, 261), 181: (0, 357), 191: (0, 541), 182: (0, 422), 40: (0, 437), 183: (0, 431), 93: (0, 542), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 193: (0, 363), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 194: (0, 354), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 34: (0, 483), 185: (0, 352), 186: (0, 589), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 165: {33: (1, {'@': 75}), 34: (1, {'@': 75}), 45: (1, {'@': 75}), 46: (1, {'@': 75}), 35: (1, {'@': 75}), 36: (1, {'@': 75}), 37: (1, {'@': 75}), 47: (1, {'@': 75}), 49: (1, {'@': 75}), 50: (1, {'@': 75}), 51: (1, {'@': 75}), 38: (1, {'@': 75}), 52: (1, {'@': 75}), 53: (1, {'@': 75}), 39: (1, {'@': 75}), 40: (1, {'@': 75}), 41: (1, {'@': 75}), 42: (1, {'@': 75}), 55: (1, {'@': 75}), 43: (1, {'@': 75})}, 166: {202: (0, 417), 31: (0, 282), 32: (1, {'@': 125})}, 167: {37: (0, 481), 36: (0, 276), 70: (0, 47), 46: (0, 534)}, 168: {0: (0, 552)}, 169: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 105: (0, 166), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 122), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 104: (0, 110), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 32: (0, 151), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 58: (0, 183), 34: (0, 483), 91: (0, 497), 37: (0, 481), 106: (0, 195), 107: (0, 196), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 170: {4: (1, {'@': 315}), 33: (1, {'@': 315}), 5: (1, {'@': 315}), 34: (1, {'@': 315}), 45: (1, {'@': 315}), 46: (1, {'@': 315}), 35: (1, {'@': 315}), 11: (1, {'@': 315}), 36: (1, {'@': 315}), 37: (1, {'@': 315}), 47: (1, {'@': 315}), 49: (1, {'@': 315}), 50: (1, {'@': 315}), 19: (1, {'@': 315}), 51: (1, {'@': 315}), 38: (1, {'@': 315}), 52: (1, {'@': 315}), 53: (1, {'@': 315}), 39: (1, {'@': 315}), 40: (1, {'@': 315}), 41: (1, {'@': 315}), 42: (1, {'@': 315}), 55: (1, {'@': 315}), 43: (1, {'@': 315})}, 171: {0: (1, {'@': 242}), 22: (1, {'@': 242}), 31: (1, {'@': 242}), 32: (1, {'@': 242}), 44: (1, {'@': 242}), 54: (1, {'@': 242}), 33: (1, {'@': 242}), 34: (1, {'@': 242}), 45: (1, {'@': 242}), 46: (1, {'@': 242}), 35: (1, {'@': 242}), 36: (1, {'@': 242}), 37: (1, {'@': 242}), 47: (1, {'@': 242}), 49: (1, {'@': 242}), 50: (1, {'@': 242}), 51: (1, {'@': 242}), 38: (1, {'@': 242}), 52: (1, {'@': 242}), 53: (1, {'@': 242}), 39: (1, {'@': 242}), 40: (1, {'@': 242}), 41: (1, {'@': 242}), 42: (1, {'@': 242}), 55: (1, {'@': 242}), 43: (1, {'@': 242})}, 172: {33: (1, {'@': 219}), 34: (1, {'@': 219}), 45: (1, {'@': 219}), 46: (1, {'@': 219}), 35: (1, {'@': 219}), 36: (1, {'@': 219}), 37: (1, {'@': 219}), 47: (1, {'@': 219}), 49: (1, {'@': 219}), 50: (1, {'@': 219}), 51: (1, {'@': 219}), 38: (1, {'@': 219}), 52: (1, {'@': 219}), 53: (1, {'@': 219}), 39: (1, {'@': 219}), 40: (1, {'@': 219}), 41: (1, {'@': 219}), 42: (1, {'@': 219}), 55: (1, {'@': 219}), 43: (1, {'@': 219})}, 173: {0: (0, 182)}, 174: {6: (1, {'@': 510}), 9: (1, {'@': 510}), 26: (1, {'@': 510}), 13: (1, {'@': 510}), 28: (1, {'@': 510}), 33: (1, {'@': 472}), 34: (1, {'@': 472}), 4: (1, {'@': 472}), 45: (1, {'@': 472}), 46: (1, {'@': 472}), 35: (1, {'@': 472}), 31: (1, {'@': 472}), 11: (1, {'@': 472}), 36: (1, {'@': 472}), 37: (1, {'@': 472}), 47: (1, {'@': 472}), 49: (1, {'@': 472}), 50: (1, {'@': 472}), 0: (1, {'@': 472}), 19: (1, {'@': 472}), 22: (1, {'@': 472}), 51: (1, {'@': 472}), 38: (1, {'@': 472}), 52: (1, {'@': 472}), 53: (1, {'@': 472}), 39: (1, {'@': 472}), 40: (1, {'@': 472}), 41: (1, {'@': 472}), 54: (1, {'@': 472}), 42: (1, {'@': 472}), 32: (1, {'@': 472}), 43: (1, {'@': 472}), 55: (1, {'@': 472}), 44: (1, {'@': 472}), 2: (1, {'@': 488}), 3: (1, {'@': 488}), 30: (1, {'@': 268}), 24: (1, {'@': 268}), 7: (1, {'@': 268}), 25: (1, {'@': 268}), 10: (1, {'@': 268}), 27: (1, {'@': 268}), 14: (1, {'@': 268}), 15: (1, {'@': 268}), 17: (1, {'@': 268}), 29: (1, {'@': 268}), 18: (1, {'@': 268}), 20: (1, {'@': 268}), 23: (1, {'@': 444}), 8: (1, {'@': 444}), 12: (1, {'@': 444}), 16: (1, {'@': 444}), 21: (1, {'@': 444})}, 175: {179: (0, 227), 13: (0, 334), 26: (0, 6), 4: (0, 384), 28: (0, 105), 6: (0, 100), 11: (0, 75), 19: (0, 373), 175: (0, 17), 9: (0, 139), 2: (1, {'@': 484}), 3: (1, {'@': 484}), 24: (1, {'@': 291}), 7: (1, {'@': 291}), 25: (1, {'@': 291}), 10: (1, {'@': 291}), 20: (1, {'@': 291}), 27: (1, {'@': 291}), 14: (1, {'@': 291}), 15: (1, {'@': 291}), 17: (1, {'@': 291}), 29: (1, {'@': 291}), 18: (1, {'@': 291}), 30: (1, {'@': 291}), 23: (1, {'@': 442}), 8: (1, {'@': 442}), 12: (1, {'@': 442}), 16: (1, {'@': 442}), 21: (1, {'@': 442}), 31: (1, {'@': 405}), 44: (1, {'@': 405}), 5: (1, {'@': 405})}, 176: {4: (1, {'@': 418}), 5: (1, {'@': 418}), 0: (1, {'@': 418}), 19: (1, {'@': 418}), 11: (1, {'@': 418}), 22: (1, {'@': 418}), 32: (1, {'@': 418}), 31: (1, {'@': 418}), 44: (1, {'@': 418}), 54: (1, {'@': 418}), 33: (1, {'@': 418}), 34: (1, {'@': 418}), 45: (1, {'@': 418}), 46: (1, {'@': 418}), 35: (1, {'@': 418}), 36: (1, {'@': 418}), 37: (1, {'@': 418}), 47: (1, {'@': 418}), 49: (1, {'@': 418}), 50: (1, {'@': 418}), 51: (1, {'@': 418}), 38: (1, {'@': 418}), 52: (1, {'@': 418}), 53: (1, {'@': 418}), 39: (1, {'@': 418}), 40: (1, {'@': 418}), 41: (1, {'@': 418}), 42: (1, {'@': 418}), 55: (1, {'@': 418}), 43: (1, {'@': 418})}, 177: {56: (0, 388), 39: (0, 261), 57: (0, 333), 58: (0, 233), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 22: (0, 236), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 96: (0, 211), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 123})}, 178: {25: (0, 87), 10: (0, 155), 176: (0, 424), 203: (0, 242), 172: (0, 191), 14: (0, 180), 170: (0, 225), 29: (0, 498), 24: (0, 640), 27: (0, 427), 169: (0, 297), 17: (0, 480), 18: (0, 489), 20: (0, 520), 30: (0, 438), 15: (0, 460), 7: (0, 523)}, 179: {32: (0, 185)}, 180: {33: (1, {'@': 186}), 34: (1, {'@': 186}), 35: (1, {'@': 186}), 36: (1, {'@': 186}), 37: (1, {'@': 186}), 39: (1, {'@': 186}), 40: (1, {'@': 186}), 41: (1, {'@': 186}), 42: (1, {'@': 186}), 43: (1, {'@': 186}), 45: (1, {'@': 186}), 46: (1, {'@': 186}), 11: (1, {'@': 186}), 47: (1, {'@': 186}), 50: (1, {'@': 186}), 49: (1, {'@': 186}), 51: (1, {'@': 186}), 52: (1, {'@': 186}), 53: (1, {'@': 186}), 55: (1, {'@': 186})}, 181: {25: (0, 87), 15: (0, 460), 176: (0, 598), 33: (1, {'@': 109}), 35: (1, {'@': 109}), 12: (1, {'@': 109}), 37: (1, {'@': 109}), 23: (1, {'@': 109}), 39: (1, {'@': 109}), 41: (1, {'@': 109}), 26: (1, {'@': 109}), 42: (1, {'@': 109}), 32: (1, {'@': 109}), 4: (1, {'@': 109}), 5: (1, {'@': 109}), 6: (1, {'@': 109}), 8: (1, {'@': 109}), 31: (1, {'@': 109}), 11: (1, {'@': 109}), 2: (1, {'@': 109}), 13: (1, {'@': 109}), 16: (1, {'@': 109}), 0: (1, {'@': 109}), 19: (1, {'@': 109}), 22: (1, {'@': 109}), 51: (1, {'@': 109}), 54: (1, {'@': 109}), 55: (1, {'@': 109}), 28: (1, {'@': 109}), 34: (1, {'@': 109}), 36: (1, {'@': 109}), 21: (1, {'@': 109}), 38: (1, {'@': 109}), 40: (1, {'@': 109}), 43: (1, {'@': 109}), 44: (1, {'@': 109}), 45: (1, {'@': 109}), 3: (1, {'@': 109}), 9: (1, {'@': 109}), 46: (1, {'@': 109}), 47: (1, {'@': 109}), 48: (1, {'@': 109}), 49: (1, {'@': 109}), 50: (1, {'@': 109}), 52: (1, {'@': 109}), 53: (1, {'@': 109})}, 182: {4: (1, {'@': 155}), 5: (1, {'@': 155}), 6: (1, {'@': 155}), 7: (1, {'@': 155}), 8: (1, {'@': 155}), 9: (1, {'@': 155}), 10: (1, {'@': 155}), 3: (1, {'@': 155}), 11: (1, {'@': 155}), 12: (1, {'@': 155}), 13: (1, {'@': 155}), 14: (1, {'@': 155}), 15: (1, {'@': 155}), 2: (1, {'@': 155}), 16: (1, {'@': 155}), 17: (1, {'@': 155}), 0: (1, {'@': 155}), 18: (1, {'@': 155}), 19: (1, {'@': 155}), 20: (1, {'@': 155}), 21: (1, {'@': 155}), 22: (1, {'@': 155}), 23: (1, {'@': 155}), 24: (1, {'@': 155}), 25: (1, {'@': 155}), 26: (1, {'@': 155}), 27: (1, {'@': 155}), 28: (1, {'@': 155}), 29: (1, {'@': 155}), 30: (1, {'@': 155}), 31: (1, {'@': 155}), 32: (1, {'@': 155}), 33: (1, {'@': 155}), 34: (1, {'@': 155}), 35: (1, {'@': 155}), 36: (1, {'@': 155}), 37: (1, {'@': 155}), 38: (1, {'@': 155}), 39: (1, {'@': 155}), 40: (1, {'@': 155}), 41: (1, {'@': 155}), 42: (1, {'@': 155}), 43: (1, {'@': 155}), 44: (1, {'@': 155}), 45: (1, {'@': 155}), 46: (1, {'@': 155}), 47: (1, {'@': 155}), 48: (1, {'@': 155}), 49: (1, {'@': 155}), 50: (1, {'@': 155}), 51: (1, {'@': 155}), 52: (1, {'@': 155}), 53: (1, {'@': 155}), 54: (1, {'@': 155}), 55: (1, {'@': 155})}, 183: {31: (1, {'@': 127}), 32: (1, {'@': 127})}, 184: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 93: (0, 325), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 185: {4: (1, {'@': 256}), 5: (1, {'@': 256}), 6: (1, {'@': 256}), 7: (1, {'@': 256}), 8: (1, {'@': 256}), 9: (1, {'@': 256}), 10: (1, {'@': 256}), 3: (1, {'@': 256}), 11: (1, {'@': 256}), 12: (1, {'@': 256}), 13: (1, {'@': 256}), 14: (1, {'@': 256}), 15: (1, {'@': 256}), 2: (1, {'@': 256}), 16: (1, {'@': 256}), 17: (1, {'@': 256}), 0: (1, {'@': 256}), 18: (1, {'@': 256}), 19: (1, {'@': 256}), 20: (1, {'@': 256}), 21: (1, {'@': 256}), 22: (1, {'@': 256}), 23: (1, {'@': 256}), 24: (1, {'@': 256}), 25: (1, {'@': 256}), 26: (1, {'@': 256}), 27: (1, {'@': 256}), 28: (1, {'@': 256}), 29: (1, {'@': 256}), 30: (1, {'@': 256}), 31: (1, {'@': 256}), 32: (1, {'@': 256}), 54: (1, {'@': 256}), 44: (1, {'@': 256}), 33: (1, {'@': 256}), 34: (1, {'@': 256}), 35: (1, {'@': 256}), 36: (1, {'@': 256}), 37: (1, {'@': 256}), 38: (1, {'@': 256}), 39: (1, {'@': 256}), 40: (1, {'@': 256}), 41: (1, {'@': 256}), 42: (1, {'@': 256}), 43: (1, {'@': 256}), 45: (1, {'@': 256}), 46: (1, {'@': 256}), 47: (1, {'@': 256}), 49: (1, {'@': 256}), 50: (1, {'@': 256}), 51: (1, {'@': 256}), 52: (1, {'@': 256}), 53: (1, {'@': 256}), 55: (1, {'@': 256})}, 186: {33: (1, {'@': 531}), 34: (1, {'@': 531}), 35: (1, {'@': 531}), 12: (1, {'@': 531}), 36: (1, {'@': 531}), 37: (1, {'@': 531}), 21: (1, {'@': 531}), 38: (1, {'@': 531}), 23: (1, {'@': 531}), 39: (1, {'@': 531}), 40: (1, {'@': 531}), 41: (1, {'@': 531}), 26: (1, {'@': 531}), 42: (1, {'@': 531}), 32: (1, {'@': 531}), 43: (1, {'@': 531}), 44: (1, {'@': 531}), 4: (1, {'@': 531}), 45: (1, {'@': 531}), 6: (1, {'@': 531}), 8: (1, {'@': 531}), 3: (1, {'@': 531}), 9: (1, {'@': 531}), 46: (1, {'@': 531}), 31: (1, {'@': 531}), 11: (1, {'@': 531}), 2: (1, {'@': 531}), 13: (1, {'@': 531}), 47: (1, {'@': 531}), 49: (1, {'@': 531}), 50: (1, {'@': 531}), 16: (1, {'@': 531}), 0: (1, {'@': 531}), 19: (1, {'@': 531}), 22: (1, {'@': 531}), 51: (1, {'@': 531}), 52: (1, {'@': 531}), 53: (1, {'@': 531}), 54: (1, {'@': 531}), 55: (1, {'@': 531}), 28: (1, {'@': 531})}, 187: {4: (1, {'@': 420}), 5: (1, {'@': 420}), 0: (1, {'@': 420}), 19: (1, {'@': 420}), 11: (1, {'@': 420}), 22: (1, {'@': 420}), 32: (1, {'@': 420}), 31: (1, {'@': 420}), 44: (1, {'@': 420}), 54: (1, {'@': 420}), 33: (1, {'@': 420}), 34: (1, {'@': 420}), 45: (1, {'@': 420}), 46: (1, {'@': 420}), 35: (1, {'@': 420}), 36: (1, {'@': 420}), 37: (1, {'@': 420}), 47: (1, {'@': 420}), 49: (1, {'@': 420}), 50: (1, {'@': 420}), 51: (1, {'@': 420}), 38: (1, {'@': 420}), 52: (1, {'@': 420}), 53: (1, {'@': 420}), 39: (1, {'@': 420}), 40: (1, {'@': 420}), 41: (1, {'@': 420}), 42: (1, {'@': 420}), 55: (1, {'@': 420}), 43: (1, {'@': 420})}, 188: {37: (0, 481), 45: (0, 504), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 502), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 189: {37: (0, 481), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 77: (0, 663), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 190: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 93: (0, 123), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 191: {37: (0, 481), 45: (0, 504), 70: (0, 307), 39: (0, 261), 195: (0, 232), 40: (0, 437), 43: (0, 519), 71: (0, 661), 196: (0, 12), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 41: (0, 458), 75: (0, 205), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 192: {56: (0, 388), 39: (0, 261), 57: (0, 333), 58: (0, 233), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 96: (0, 221), 63: (0, 507), 64: (0, 526), 65: (0, 466), 22: (0, 236), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 123})}, 193: {4: (1, {'@': 411}), 5: (1, {'@': 411}), 0: (1, {'@': 411}), 19: (1, {'@': 411}), 11: (1, {'@': 411}), 22: (1, {'@': 411}), 32: (1, {'@': 411}), 31: (1, {'@': 411}), 44: (1, {'@': 411}), 54: (1, {'@': 411}), 33: (1, {'@': 411}), 34: (1, {'@': 411}), 45: (1, {'@': 411}), 46: (1, {'@': 411}), 35: (1, {'@': 411}), 36: (1, {'@': 411}), 37: (1, {'@': 411}), 47: (1, {'@': 411}), 49: (1, {'@': 411}), 50: (1, {'@': 411}), 51: (1, {'@': 411}), 38: (1, {'@': 411}), 52: (1, {'@': 411}), 53: (1, {'@': 411}), 39: (1, {'@': 411}), 40: (1, {'@': 411}), 41: (1, {'@': 411}), 42: (1, {'@': 411}), 55: (1, {'@': 411}), 43: (1, {'@': 411})}, 194: {33: (1, {'@': 228}), 34: (1, {'@': 228}), 35: (1, {'@': 228}), 36: (1, {'@': 228}), 37: (1, {'@': 228}), 38: (1, {'@': 228}), 39: (1, {'@': 228}), 40: (1, {'@': 228}), 41: (1, {'@': 228}), 42: (1, {'@': 228}), 43: (1, {'@': 228}), 45: (1, {'@': 228}), 46: (1, {'@': 228}), 47: (1, {'@': 228}), 49: (1, {'@': 228}), 50: (1, {'@': 228}), 51: (1, {'@': 228}), 52: (1, {'@': 228}), 53: (1, {'@': 228}), 55: (1, {'@': 228})}, 195: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 58: (0, 320), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 79: (0, 634), 78: (0, 666), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 196: {31: (1, {'@': 129}), 32: (1, {'@': 129})}, 197: {37: (0, 481), 160: (0, 304), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 164: (0, 569), 161: (0, 201), 40: (0, 437), 43: (0, 519), 162: (0, 69), 163: (0, 198), 71: (0, 661), 11: (0, 522), 33: (0, 283), 77: (0, 571), 46: (0, 534), 165: (0, 20), 42: (0, 606), 55: (0, 708), 201: (0, 132), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 166: (0, 76), 41: (0, 458), 80: (0, 628), 88: (0, 419), 66: (0, 528), 97: (0, 525), 167: (0, 206), 168: (0, 158), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 84: (0, 621), 52: (0, 544), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 198: {30: (1, {'@': 491}), 24: (1, {'@': 491}), 7: (1, {'@': 491}), 25: (1, {'@': 491}), 10: (1, {'@': 491}), 27: (1, {'@': 491}), 14: (1, {'@': 491}), 15: (1, {'@': 491}), 17: (1, {'@': 491}), 29: (1, {'@': 491}), 18: (1, {'@': 491}), 20: (1, {'@': 491}), 4: (1, {'@': 451}), 5: (1, {'@': 451}), 23: (1, {'@': 451}), 8: (1, {'@': 451}), 3: (1, {'@': 451}), 31: (1, {'@': 451}), 11: (1, {'@': 451}), 12: (1, {'@': 451}), 2: (1, {'@': 451}), 32: (1, {'@': 451}), 16: (1, {'@': 451}), 44: (1, {'@': 451}), 19: (1, {'@': 451}), 21: (1, {'@': 451}), 33: (1, {'@': 451}), 34: (1, {'@': 451}), 35: (1, {'@': 451}), 36: (1, {'@': 451}), 37: (1, {'@': 451}), 38: (1, {'@': 451}), 39: (1, {'@': 451}), 40: (1, {'@': 451}), 41: (1, {'@': 451}), 42: (1, {'@': 451}), 43: (1, {'@': 451}), 45: (1, {'@': 451}), 46: (1, {'@': 451}), 47: (1, {'@': 451}), 49: (1, {'@': 451}), 50: (1, {'@': 451}), 0: (1, {'@': 451}), 22: (1, {'@': 451}), 51: (1, {'@': 451}), 52: (1, {'@': 451}), 53: (1, {'@': 451}), 54: (1, {'@': 451}), 55: (1, {'@': 451}), 48: (1, {'@': 451})}, 199: {54: (0, 286)}, 200: {31: (0, 420), 54: (1, {'@': 301})}, 201: {25: (0, 87), 10: (0, 155), 172: (0, 191), 18: (0, 489), 169: (0, 673), 176: (0, 436), 14: (0, 180), 170: (0, 225), 29: (0, 498), 24: (0, 640), 27: (0, 427), 17: (0, 480), 203: (0, 421), 20: (0, 520), 30: (0, 438), 15: (0, 460), 7: (0, 523)}, 202: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 93: (0, 655), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 203: {138: (0, 80), 139: (0, 596), 140: (0, 693), 40: (0, 437), 141: (0, 590), 67: (0, 630), 142: (0, 615), 143: (0, 637), 45: (0, 504), 68: (0, 676), 50: (0, 600), 144: (0, 273), 70: (0, 652), 71: (0, 661), 145: (0, 706), 49: (0, 669), 47: (0, 675), 146: (0, 462), 53: (0, 618), 82: (0, 593), 147: (0, 249), 148: (0, 295), 85: (0, 392), 150: (0, 594), 26: (0, 604), 33: (0, 283), 76: (0, 35), 151: (0, 315), 36: (0, 276), 152: (0, 457), 153: (0, 685), 154: (0, 144), 34: (0, 483), 37: (0, 481), 149: (0, 79), 43: (0, 519), 155: (0, 440), 156: (0, 653), 46: (0, 534), 41: (0, 458), 88: (0, 311), 51: (0, 540), 157: (0, 536), 99: (0, 531), 79: (0, 451), 101: (0, 256), 35: (0, 365), 102: (0, 660)}, 204: {33: (1, {'@': 225}), 34: (1, {'@': 225}), 45: (1, {'@': 225}), 46: (1, {'@': 225}), 35: (1, {'@': 225}), 36: (1, {'@': 225}), 37: (1, {'@': 225}), 47: (1, {'@': 225}), 49: (1, {'@': 225}), 50: (1, {'@': 225}), 51: (1, {'@': 225}), 38: (1, {'@': 225}), 52: (1, {'@': 225}), 53: (1, {'@': 225}), 39: (1, {'@': 225}), 40: (1, {'@': 225}), 41: (1, {'@': 225}), 42: (1, {'@': 225}), 55: (1, {'@': 225}), 43: (1, {'@': 225})}, 205: {33: (1, {'@': 270}), 35: (1, {'@': 270}), 12: (1, {'@': 270}), 37: (1, {'@': 270}), 23: (1, {'@': 270}), 25: (1, {'@': 270}), 39: (1, {'@': 270}), 41: (1, {'@': 270}), 26: (1, {'@': 270}), 42: (1, {'@': 270}), 32: (1, {'@': 270}), 4: (1, {'@': 270}), 5: (1, {'@': 270}), 6: (1, {'@': 270}), 8: (1, {'@': 270}), 31: (1, {'@': 270}), 11: (1, {'@': 270}), 2: (1, {'@': 270}), 13: (1, {'@': 270}), 15: (1, {'@': 270}), 16: (1, {'@': 270}), 0: (1, {'@': 270}), 19: (1, {'@': 270}), 22: (1, {'@': 270}), 51: (1, {'@': 270}), 54: (1, {'@': 270}), 55: (1, {'@': 270}), 28: (1, {'@': 270}), 34: (1, {'@': 270}), 36: (1, {'@': 270}), 21: (1, {'@': 270}), 38: (1, {'@': 270}), 40: (1, {'@': 270}), 43: (1, {'@': 270}), 44: (1, {'@': 270}), 45: (1, {'@': 270}), 3: (1, {'@': 270}), 9: (1, {'@': 270}), 46: (1, {'@': 270}), 47: (1, {'@': 270}), 48: (1, {'@': 270}), 49: (1, {'@': 270}), 50: (1, {'@': 270}), 52: (1, {'@': 270}), 53: (1, {'@': 270})}, 206: {2: (0, 684), 1: (0, 54), 3: (0, 595), 4: (1, {'@': 381}), 5: (1, {'@': 381}), 23: (1, {'@': 381}), 8: (1, {'@': 381}), 31: (1, {'@': 381}), 11: (1, {'@': 381}), 12: (1, {'@': 381}), 32: (1, {'@': 381}), 16: (1, {'@': 381}), 44: (1, {'@': 381}), 19: (1, {'@': 381}), 21: (1, {'@': 381}), 33: (1, {'@': 381}), 34: (1, {'@': 381}), 45: (1, {'@': 381}), 46: (1, {'@': 381}), 35: (1, {'@': 381}), 36: (1, {'@': 381}), 37: (1, {'@': 381}), 47: (1, {'@': 381}), 49: (1, {'@': 381}), 50: (1, {'@': 381}), 0: (1, {'@': 381}), 22: (1, {'@': 381}), 51: (1, {'@': 381}), 38: (1, {'@': 381}), 52: (1, {'@': 381}), 53: (1, {'@': 381}), 39: (1, {'@': 381}), 40: (1, {'@': 381}), 41: (1, {'@': 381}), 54: (1, {'@': 381}), 42: (1, {'@': 381}), 43: (1, {'@': 381}), 55: (1, {'@': 381}), 48: (1, {'@': 381})}, 207: {32: (0, 42)}, 208: {4: (1, {'@': 251}), 5: (1, {'@': 251}), 0: (1, {'@': 251}), 19: (1, {'@': 251}), 11: (1, {'@': 251}), 22: (1, {'@': 251}), 32: (1, {'@': 251}), 31: (1, {'@': 251}), 54: (1, {'@': 251}), 44: (1, {'@': 251}), 48: (1, {'@': 251}), 33: (1, {'@': 251}), 34: (1, {'@': 251}), 45: (1, {'@': 251}), 46: (1, {'@': 251}), 35: (1, {'@': 251}), 36: (1, {'@': 251}), 37: (1, {'@': 251}), 47: (1, {'@': 251}), 49: (1, {'@': 251}), 50: (1, {'@': 251}), 51: (1, {'@': 251}), 38: (1, {'@': 251}), 52: (1, {'@': 251}), 53: (1, {'@': 251}), 39: (1, {'@': 251}), 40: (1, {'@': 251}), 41: (1, {'@': 251}), 42: (1, {'@': 251}), 55: (1, {'@': 251}), 43: (1, {'@': 251})}, 209: {37: (0, 481), 45: (0, 504), 70: (0, 307), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 46: (0, 534), 49: (0, 669), 47: (0, 675), 41: (0, 458), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483), 88: (0, 108)}, 210: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 184: (0, 222), 204: (0, 41), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 183: (0, 214), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 93: (0, 40), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 211: {0: (0, 50)}, 212: {31: (1, {'@': 544}), 32: (1, {'@': 544})}, 213: {195: (0, 178), 37: (0, 481), 45: (0, 504), 70: (0, 307), 39: (0, 261), 75: (0, 107), 198: (0, 416), 40: (0, 437), 43: (0, 519), 71: (0, 661), 196: (0, 59), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 197: (0, 4), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 214: {33: (1, {'@': 269}), 34: (1, {'@': 269}), 35: (1, {'@': 269}), 12: (1, {'@': 269}), 36: (1, {'@': 269}), 14: (1, {'@': 269}), 37: (1, {'@': 269}), 18: (1, {'@': 269}), 21: (1, {'@': 269}), 38: (1, {'@': 269}), 24: (1, {'@': 269}), 23: (1, {'@': 269}), 25: (1, {'@': 269}), 39: (1, {'@': 269}), 40: (1, {'@': 269}), 41: (1, {'@': 269}), 26: (1, {'@': 269}), 42: (1, {'@': 269}), 32: (1, {'@': 269}), 43: (1, {'@': 269}), 44: (1, {'@': 269}), 4: (1, {'@': 269}), 45: (1, {'@': 269}), 5: (1, {'@': 269}), 6: (1, {'@': 269}), 7: (1, {'@': 269}), 8: (1, {'@': 269}), 9: (1, {'@': 269}), 10: (1, {'@': 269}), 3: (1, {'@': 269}), 31: (1, {'@': 269}), 46: (1, {'@': 269}), 11: (1, {'@': 269}), 13: (1, {'@': 269}), 2: (1, {'@': 269}), 15: (1, {'@': 269}), 47: (1, {'@': 269}), 16: (1, {'@': 269}), 49: (1, {'@': 269}), 17: (1, {'@': 269}), 50: (1, {'@': 269}), 0: (1, {'@': 269}), 19: (1, {'@': 269}), 20: (1, {'@': 269}), 22: (1, {'@': 269}), 51: (1, {'@': 269}), 52: (1, {'@': 269}), 53: (1, {'@': 269}), 27: (1, {'@': 269}), 54: (1, {'@': 269}), 55: (1, {'@': 269}), 28: (1, {'@': 269}), 29: (1, {'@': 269}), 30: (1, {'@': 269}), 48: (1, {'@': 269})}, 215: {158: (0, 561), 31: (0, 398), 44: (0, 327), 22: (0, 39), 159: (0, 657), 54: (1, {'@': 300})}, 216: {33: (1, {'@': 423}), 34: (1, {'@': 423}), 4: (1, {'@': 423}), 45: (1, {'@': 423}), 46: (1, {'@': 423}), 35: (1, {'@': 423}), 31: (1, {'@': 423}), 11: (1, {'@': 423}), 36: (1, {'@': 423}), 37: (1, {'@': 423}), 47: (1, {'@': 423}), 49: (1, {'@': 423}), 50: (1, {'@': 423}), 0: (1, {'@': 423}), 19: (1, {'@': 423}), 22: (1, {'@': 423}), 51: (1, {'@': 423}), 38: (1, {'@': 423}), 52: (1, {'@': 423}), 53: (1, {'@': 423}), 39: (1, {'@': 423}), 40: (1, {'@': 423}), 41: (1, {'@': 423}), 54: (1, {'@': 423}), 42: (1, {'@': 423}), 32: (1, {'@': 423}), 43: (1, {'@': 423}), 55: (1, {'@': 423}), 44: (1, {'@': 423})}, 217: {25: (0, 87), 169: (0, 577), 10: (0, 155), 172: (0, 191), 15: (0, 460), 14: (0, 180), 170: (0, 225), 29: (0, 498), 24: (0, 640), 27: (0, 427), 17: (0, 480), 18: (0, 489), 20: (0, 520), 30: (0, 438), 203: (0, 508), 176: (0, 418), 7: (0, 523)}, 218: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 105: (0, 166), 66: (0, 528), 67: (0, 470), 104: (0, 557), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 122), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 58: (0, 183), 34: (0, 483), 91: (0, 497), 37: (0, 481), 106: (0, 195), 107: (0, 196), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 32: (0, 586), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 219: {4: (1, {'@': 264}), 6: (1, {'@': 264}), 7: (1, {'@': 264}), 8: (1, {'@': 264}), 9: (1, {'@': 264}), 3: (1, {'@': 264}), 10: (1, {'@': 264}), 11: (1, {'@': 264}), 12: (1, {'@': 264}), 13: (1, {'@': 264}), 2: (1, {'@': 264}), 14: (1, {'@': 264}), 15: (1, {'@': 264}), 16: (1, {'@': 264}), 17: (1, {'@': 264}), 0: (1, {'@': 264}), 18: (1, {'@': 264}), 19: (1, {'@': 264}), 20: (1, {'@': 264}), 21: (1, {'@': 264}), 24: (1, {'@': 264}), 23: (1, {'@': 264}), 25: (1, {'@': 264}), 26: (1, {'@': 264}), 27: (1, {'@': 264}), 54: (1, {'@': 264}), 32: (1, {'@': 264}), 28: (1, {'@': 264}), 29: (1, {'@': 264}), 30: (1, {'@': 264}), 48: (1, {'@': 264}), 5: (1, {'@': 264})}, 220: {37: (0, 481), 45: (0, 504), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 75: (0, 102), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 221: {0: (0, 171)}, 222: {25: (0, 87), 10: (0, 155), 14: (0, 180), 20: (0, 520), 170: (0, 225), 29: (0, 498), 30: (0, 438), 176: (0, 341), 169: (0, 651), 27: (0, 427), 17: (0, 480), 18: (0, 489), 172: (0, 191), 24: (0, 640), 15: (0, 460), 7: (0, 523), 203: (0, 448), 33: (1, {'@': 107}), 35: (1, {'@': 107}), 12: (1, {'@': 107}), 37: (1, {'@': 107}), 23: (1, {'@': 107}), 39: (1, {'@': 107}), 41: (1, {'@': 107}), 26: (1, {'@': 107}), 42: (1, {'@': 107}), 32: (1, {'@': 107}), 4: (1, {'@': 107}), 5: (1, {'@': 107}), 6: (1, {'@': 107}), 8: (1, {'@': 107}), 31: (1, {'@': 107}), 11: (1, {'@': 107}), 2: (1, {'@': 107}), 13: (1, {'@': 107}), 16: (1, {'@': 107}), 0: (1, {'@': 107}), 19: (1, {'@': 107}), 22: (1, {'@': 107}), 51: (1, {'@': 107}), 54: (1, {'@': 107}), 55: (1, {'@': 107}), 28: (1, {'@': 107}), 34: (1, {'@': 107}), 36: (1, {'@': 107}), 21: (1, {'@': 107}), 38: (1, {'@': 107}), 40: (1, {'@': 107}), 43: (1, {'@': 107}), 44: (1, {'@': 107}), 45: (1, {'@': 107}), 3: (1, {'@': 107}), 9: (1, {'@': 107}), 46: (1, {'@': 107}), 47: (1, {'@': 107}), 48: (1, {'@': 107}), 49: (1, {'@': 107}), 50: (1, {'@': 107}), 52: (1, {'@': 107}), 53: (1, {'@': 107})}, 223: {4: (1, {'@': 133}), 5: (1, {'@': 133}), 6: (1, {'@': 133}), 7: (1, {'@': 133}), 8: (1, {'@': 133}), 9: (1, {'@': 133}), 10: (1, {'@': 133}), 3: (1, {'@': 133}), 11: (1, {'@': 133}), 12: (1, {'@': 133}), 13: (1, {'@': 133}), 14: (1, {'@': 133}), 15: (1, {'@': 133}), 2: (1, {'@': 133}), 16: (1, {'@': 133}), 17: (1, {'@': 133}), 0: (1, {'@': 133}), 18: (1, {'@': 133}), 19: (1, {'@': 133}), 20: (1, {'@': 133}), 21: (1, {'@': 133}), 22: (1, {'@': 133}), 23: (1, {'@': 133}), 24: (1, {'@': 133}), 25: (1, {'@': 133}), 26: (1, {'@': 133}), 27: (1, {'@': 133}), 28: (1, {'@': 133}), 29: (1, {'@': 133}), 30: (1, {'@': 133}), 31: (1, {'@': 133}), 32: (1, {'@': 133}), 33: (1, {'@': 133}), 34: (1, {'@': 133}), 35: (1, {'@': 133}), 36: (1, {'@': 133}), 37: (1, {'@': 133}), 38: (1, {'@': 133}), 39: (1, {'@': 133}), 40: (1, {'@': 133}), 41: (1, {'@': 133}), 42: (1, {'@': 133}), 43: (1, {'@': 133}), 44: (1, {'@': 133}), 45: (1, {'@': 133}), 46: (1, {'@': 133}), 47: (1, {'@': 133}), 48: (1, {'@': 133}), 49: (1, {'@': 133}), 50: (1, {'@': 133}), 51: (1, {'@': 133}), 52: (1, {'@': 133}), 53: (1, {'@': 133}), 54: (1, {'@': 133}), 55: (1, {'@': 133})}, 224: {4: (1, {'@': 440}), 5: (1, {'@': 440}), 6: (1, {'@': 440}), 8: (1, {'@': 440}), 3: (1, {'@': 440}), 9: (1, {'@': 440}), 11: (1, {'@': 440}), 12: (1, {'@': 440}), 2: (1, {'@': 440}), 13: (1, {'@': 440}), 16: (1, {'@': 440}), 0: (1, {'@': 440}), 19: (1, {'@': 440}), 21: (1, {'@': 440}), 22: (1, {'@': 440}), 23: (1, {'@': 440}), 26: (1, {'@': 440}), 28: (1, {'@': 440}), 31: (1, {'@': 440}), 32: (1, {'@': 440}), 54: (1, {'@': 440}), 44: (1, {'@': 440}), 33: (1, {'@': 440}), 34: (1, {'@': 440}), 35: (1, {'@': 440}), 36: (1, {'@': 440}), 37: (1, {'@': 440}), 38: (1, {'@': 440}), 39: (1, {'@': 440}), 40: (1, {'@': 440}), 41: (1, {'@': 440}), 42: (1, {'@': 440}), 43: (1, {'@': 440}), 45: (1, {'@': 440}), 46: (1, {'@': 440}), 47: (1, {'@': 440}), 49: (1, {'@': 440}), 50: (1, {'@': 440}), 51: (1, {'@': 440}), 52: (1, {'@': 440}), 53: (1, {'@': 440}), 55: (1, {'@': 440})}, 225: {37: (0, 481), 45: (0, 504), 70: (0, 307), 205: (0, 181), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 46: (0, 534), 88: (0, 33), 49: (0, 669), 47: (0, 675), 41: (0, 458), 53: (0, 618), 51: (0, 540), 206: (0, 230), 82: (0, 593), 36: (0, 276), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 226: {24: (1, {'@': 292}), 7: (1, {'@': 292}), 25: (1, {'@': 292}), 10: (1, {'@': 292}), 20: (1, {'@': 292}), 27: (1, {'@': 292}), 14: (1, {'@': 292}), 15: (1, {'@': 292}), 17: (1, {'@': 292}), 29: (1, {'@': 292}), 18: (1, {'@': 292}), 30: (1, {'@': 292}), 4: (1, {'@': 437}), 5: (1, {'@': 437}), 6: (1, {'@': 437}), 8: (1, {'@': 437}), 3: (1, {'@': 437}), 9: (1, {'@': 437}), 31: (1, {'@': 437}), 11: (1, {'@': 437}), 12: (1, {'@': 437}), 2: (1, {'@': 437}), 13: (1, {'@': 437}), 16: (1, {'@': 437}), 19: (1, {'@': 437}), 21: (1, {'@': 437}), 23: (1, {'@': 437}), 26: (1, {'@': 437}), 28: (1, {'@': 437}), 44: (1, {'@': 437}), 32: (1, {'@': 144})}, 227: {37: (0, 481), 180: (0, 317), 4: (0, 314), 70: (0, 307), 45: (0, 504), 39: (0, 261), 191: (0, 564), 181: (0, 357), 182: (0, 422), 40: (0, 437), 183: (0, 431), 93: (0, 412), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 193: (0, 363), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 77: (0, 710), 64: (0, 526), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 34: (0, 483), 185: (0, 352), 186: (0, 589), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 228: {32: (0, 623)}, 229: {207: (0, 200), 44: (0, 327), 159: (0, 56), 31: (0, 96), 54: (1, {'@': 302})}, 230: {33: (1, {'@': 273}), 35: (1, {'@': 273}), 12: (1, {'@': 273}), 37: (1, {'@': 273}), 23: (1, {'@': 273}), 25: (1, {'@': 273}), 39: (1, {'@': 273}), 41: (1, {'@': 273}), 26: (1, {'@': 273}), 42: (1, {'@': 273}), 32: (1, {'@': 273}), 4: (1, {'@': 273}), 5: (1, {'@': 273}), 6: (1, {'@': 273}), 8: (1, {'@': 273}), 31: (1, {'@': 273}), 11: (1, {'@': 273}), 2: (1, {'@': 273}), 13: (1, {'@': 273}), 15: (1, {'@': 273}), 16: (1, {'@': 273}), 0: (1, {'@': 273}), 19: (1, {'@': 273}), 22: (1, {'@': 273}), 51: (1, {'@': 273}), 54: (1, {'@': 273}), 55: (1, {'@': 273}), 28: (1, {'@': 273}), 34: (1, {'@': 273}), 36: (1, {'@': 273}), 21: (1, {'@': 273}), 38: (1, {'@': 273}), 40: (1, {'@': 273}), 43: (1, {'@': 273}), 44: (1, {'@': 273}), 45: (1, {'@': 273}), 3: (1, {'@': 273}), 9: (1, {'@': 273}), 46: (1, {'@': 273}), 47: (1, {'@': 273}), 48: (1, {'@': 273}), 49: (1, {'@': 273}), 50: (1, {'@': 273}), 52: (1, {'@': 273}), 53: (1, {'@': 273})}, 231: {37: (0, 481), 160: (0, 304), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 164: (0, 569), 161: (0, 201), 40: (0, 437), 43: (0, 519), 162: (0, 69), 163: (0, 198), 71: (0, 661), 11: (0, 522), 33: (0, 283), 77: (0, 571), 46: (0, 534), 165: (0, 20), 42: (0, 606), 55: (0, 708), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 166: (0, 76), 41: (0, 458), 80: (0, 628), 88: (0, 419), 66: (0, 528), 97: (0, 525), 167: (0, 206), 168: (0, 158), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 84: (0, 621), 52: (0, 544), 99: (0, 531), 201: (0, 216), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 232: {25: (0, 87), 176: (0, 424), 15: (0, 460), 33: (1, {'@': 108}), 35: (1, {'@': 108}), 12: (1, {'@': 108}), 37: (1, {'@': 108}), 23: (1, {'@': 108}), 39: (1, {'@': 108}), 41: (1, {'@': 108}), 26: (1, {'@': 108}), 42: (1, {'@': 108}), 32: (1, {'@': 108}), 4: (1, {'@': 108}), 5: (1, {'@': 108}), 6: (1, {'@': 108}), 8: (1, {'@': 108}), 31: (1, {'@': 108}), 11: (1, {'@': 108}), 2: (1, {'@': 108}), 13: (1, {'@': 108}), 16: (1, {'@': 108}), 0: (1, {'@': 108}), 19: (1, {'@': 108}), 22: (1, {'@': 108}), 51: (1, {'@': 108}), 54: (1, {'@': 108}), 55: (1, {'@': 108}), 28: (1, {'@': 108}), 34: (1, {'@': 108}), 36: (1, {'@': 108}), 21: (1, {'@': 108}), 38: (1, {'@': 108}), 40: (1, {'@': 108}), 43: (1, {'@': 108}), 44: (1, {'@': 108}), 45: (1, {'@': 108}), 3: (1, {'@': 108}), 9: (1, {'@': 108}), 46: (1, {'@': 108}), 47: (1, {'@': 108}), 48: (1, {'@': 108}), 49: (1, {'@': 108}), 50: (1, {'@': 108}), 52: (1, {'@': 108}), 53: (1, {'@': 108})}, 233: {22: (0, 452), 0: (1, {'@': 116})}, 234: {37: (0, 481), 180: (0, 317), 4: (0, 314), 70: (0, 307), 45: (0, 504), 39: (0, 261), 181: (0, 357), 182: (0, 422), 40: (0, 437), 183: (0, 431), 93: (0, 404), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 34: (0, 483), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 185: (0, 450), 101: (0, 256), 186: (0, 423), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 235: {11: (0, 662), 19: (0, 558), 4: (0, 601)}, 236: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 22: (0, 556), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 58: (0, 635), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 79: (0, 634), 78: (0, 666), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 122})}, 237: {33: (1, {'@': 79}), 34: (1, {'@': 79}), 35: (1, {'@': 79}), 36: (1, {'@': 79}), 37: (1, {'@': 79}), 38: (1, {'@': 79}), 39: (1, {'@': 79}), 40: (1, {'@': 79}), 41: (1, {'@': 79}), 42: (1, {'@': 79}), 43: (1, {'@': 79}), 45: (1, {'@': 79}), 46: (1, {'@': 79}), 47: (1, {'@': 79}), 49: (1, {'@': 79}), 50: (1, {'@': 79}), 51: (1, {'@': 79}), 52: (1, {'@': 79}), 53: (1, {'@': 79}), 55: (1, {'@': 79})}, 238: {33: (1, {'@': 231}), 34: (1, {'@': 231}), 35: (1, {'@': 231}), 36: (1, {'@': 231}), 37: (1, {'@': 231}), 38: (1, {'@': 231}), 39: (1, {'@': 231}), 40: (1, {'@': 231}), 41: (1, {'@': 231}), 42: (1, {'@': 231}), 43: (1, {'@': 231}), 45: (1, {'@': 231}), 46: (1, {'@': 231}), 47: (1, {'@': 231}), 49: (1, {'@': 231}), 50: (1, {'@': 231}), 51: (1, {'@': 231}), 52: (1, {'@': 231}), 53: (1, {'@': 231}), 55: (1, {'@': 231})}, 239: {33: (1, {'@': 224}), 34: (1, {'@': 224}), 45: (1, {'@': 224}), 46: (1, {'@': 224}), 35: (1, {'@': 224}), 36: (1, {'@': 224}), 37: (1, {'@': 224}), 47: (1, {'@': 224}), 49: (1, {'@': 224}), 50: (1, {'@': 224}), 51: (1, {'@': 224}), 38: (1, {'@': 224}), 52: (1, {'@': 224}), 53: (1, {'@': 224}), 39: (1, {'@': 224}), 40: (1, {'@': 224}), 41: (1, {'@': 224}), 42: (1, {'@': 224}), 55: (1, {'@': 224}), 43: (1, {'@': 224})}, 240: {4: (1, {'@': 414}), 5: (1, {'@': 414}), 0: (1, {'@': 414}), 19: (1, {'@': 414}), 11: (1, {'@': 414}), 22: (1, {'@': 414}), 32: (1, {'@': 414}), 31: (1, {'@': 414}), 44: (1, {'@': 414}), 54: (1, {'@': 414}), 33: (1, {'@': 414}), 34: (1, {'@': 414}), 45: (1, {'@': 414}), 46: (1, {'@': 414}), 35: (1, {'@': 414}), 36: (1, {'@': 414}), 37: (1, {'@': 414}), 47: (1, {'@': 414}), 49: (1, {'@': 414}), 50: (1, {'@': 414}), 51: (1, {'@': 414}), 38: (1, {'@': 414}), 52: (1, {'@': 414}), 53: (1, {'@': 414}), 39: (1, {'@': 414}), 40: (1, {'@': 414}), 41: (1, {'@': 414}), 42: (1, {'@': 414}), 55: (1, {'@': 414}), 43: (1, {'@': 414})}, 241: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 184: (0, 222), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 204: (0, 271), 53: (0, 618), 51: (0, 540), 183: (0, 214), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 93: (0, 40), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 242: {33: (1, {'@': 520}), 34: (1, {'@': 520}), 35: (1, {'@': 520}), 12: (1, {'@': 520}), 36: (1, {'@': 520}), 37: (1, {'@': 520}), 21: (1, {'@': 520}), 38: (1, {'@': 520}), 23: (1, {'@': 520}), 39: (1, {'@': 520}), 40: (1, {'@': 520}), 41: (1, {'@': 520}), 42: (1, {'@': 520}), 32: (1, {'@': 520}), 43: (1, {'@': 520}), 44: (1, {'@': 520}), 4: (1, {'@': 520}), 45: (1, {'@': 520}), 5: (1, {'@': 520}), 8: (1, {'@': 520}), 3: (1, {'@': 520}), 46: (1, {'@': 520}), 31: (1, {'@': 520}), 11: (1, {'@': 520}), 2: (1, {'@': 520}), 47: (1, {'@': 520}), 48: (1, {'@': 520}), 16: (1, {'@': 520}), 49: (1, {'@': 520}), 50: (1, {'@': 520}), 0: (1, {'@': 520}), 19: (1, {'@': 520}), 22: (1, {'@': 520}), 51: (1, {'@': 520}), 52: (1, {'@': 520}), 53: (1, {'@': 520}), 54: (1, {'@': 520}), 55: (1, {'@': 520}), 26: (1, {'@': 520}), 6: (1, {'@': 520}), 9: (1, {'@': 520}), 13: (1, {'@': 520}), 28: (1, {'@': 520})}, 243: {33: (1, {'@': 340}), 34: (1, {'@': 340}), 4: (1, {'@': 340}), 45: (1, {'@': 340}), 46: (1, {'@': 340}), 35: (1, {'@': 340}), 31: (1, {'@': 340}), 11: (1, {'@': 340}), 36: (1, {'@': 340}), 37: (1, {'@': 340}), 47: (1, {'@': 340}), 49: (1, {'@': 340}), 50: (1, {'@': 340}), 0: (1, {'@': 340}), 19: (1, {'@': 340}), 22: (1, {'@': 340}), 51: (1, {'@': 340}), 38: (1, {'@': 340}), 52: (1, {'@': 340}), 53: (1, {'@': 340}), 39: (1, {'@': 340}), 40: (1, {'@': 340}), 41: (1, {'@': 340}), 54: (1, {'@': 340}), 42: (1, {'@': 340}), 32: (1, {'@': 340}), 43: (1, {'@': 340}), 55: (1, {'@': 340}), 44: (1, {'@': 340})}, 244: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 180: (0, 317), 181: (0, 357), 182: (0, 422), 40: (0, 437), 183: (0, 431), 43: (0, 519), 71: (0, 661), 93: (0, 118), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 191: (0, 530), 193: (0, 363), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 185: (0, 352), 186: (0, 589), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 245: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 105: (0, 166), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 122), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 104: (0, 649), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 58: (0, 183), 34: (0, 483), 91: (0, 497), 37: (0, 481), 106: (0, 195), 32: (0, 285), 107: (0, 196), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 246: {31: (1, {'@': 543}), 32: (1, {'@': 543})}, 247: {11: (0, 562), 4: (0, 301), 19: (0, 700), 0: (1, {'@': 237}), 22: (1, {'@': 237}), 31: (1, {'@': 237}), 32: (1, {'@': 237}), 44: (1, {'@': 237}), 54: (1, {'@': 237}), 33: (1, {'@': 237}), 34: (1, {'@': 237}), 45: (1, {'@': 237}), 46: (1, {'@': 237}), 35: (1, {'@': 237}), 36: (1, {'@': 237}), 37: (1, {'@': 237}), 47: (1, {'@': 237}), 49: (1, {'@': 237}), 50: (1, {'@': 237}), 51: (1, {'@': 237}), 38: (1, {'@': 237}), 52: (1, {'@': 237}), 53: (1, {'@': 237}), 39: (1, {'@': 237}), 40: (1, {'@': 237}), 41: (1, {'@': 237}), 42: (1, {'@': 237}), 55: (1, {'@': 237}), 43: (1, {'@': 237})}, 248: {37: (0, 481), 160: (0, 304), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 161: (0, 201), 40: (0, 437), 43: (0, 519), 162: (0, 69), 163: (0, 198), 71: (0, 661), 11: (0, 522), 33: (0, 283), 164: (0, 193), 77: (0, 72), 46: (0, 534), 165: (0, 20), 42: (0, 606), 55: (0, 708), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 166: (0, 76), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 167: (0, 206), 168: (0, 158), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 84: (0, 621), 52: (0, 544), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 249: {0: (1, {'@': 245}), 32: (1, {'@': 245}), 54: (1, {'@': 245}), 48: (1, {'@': 245}), 5: (1, {'@': 245})}, 250: {4: (1, {'@': 432}), 32: (1, {'@': 432}), 0: (1, {'@': 432}), 19: (1, {'@': 432}), 11: (1, {'@': 432}), 54: (1, {'@': 432}), 48: (1, {'@': 432}), 5: (1, {'@': 432})}, 251: {56: (0, 388), 39: (0, 261), 57: (0, 333), 58: (0, 233), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 22: (0, 236), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 96: (0, 500), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 123})}, 252: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 59: (0, 89), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 83: (0, 125), 93: (0, 486), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 95: (0, 551), 75: (0, 656), 77: (0, 710), 64: (0, 526), 41: (0, 458), 65: (0, 466), 208: (0, 293), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 92: (0, 524), 84: (0, 621), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 253: {4: (1, {'@': 386}), 0: (1, {'@': 386}), 19: (1, {'@': 386}), 11: (1, {'@': 386})}, 254: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 93: (0, 49), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 255: {4: (1, {'@': 516}), 6: (1, {'@': 516}), 8: (1, {'@': 516}), 3: (1, {'@': 516}), 9: (1, {'@': 516}), 11: (1, {'@': 516}), 12: (1, {'@': 516}), 2: (1, {'@': 516}), 13: (1, {'@': 516}), 16: (1, {'@': 516}), 0: (1, {'@': 516}), 19: (1, {'@': 516}), 21: (1, {'@': 516}), 23: (1, {'@': 516}), 26: (1, {'@': 516}), 54: (1, {'@': 516}), 32: (1, {'@': 516}), 28: (1, {'@': 516}), 48: (1, {'@': 516}), 5: (1, {'@': 516})}, 256: {4: (1, {'@': 193}), 5: (1, {'@': 193}), 6: (1, {'@': 193}), 7: (1, {'@': 193}), 8: (1, {'@': 193}), 9: (1, {'@': 193}), 10: (1, {'@': 193}), 3: (1, {'@': 193}), 11: (1, {'@': 193}), 12: (1, {'@': 193}), 13: (1, {'@': 193}), 14: (1, {'@': 193}), 15: (1, {'@': 193}), 2: (1, {'@': 193}), 16: (1, {'@': 193}), 17: (1, {'@': 193}), 0: (1, {'@': 193}), 18: (1, {'@': 193}), 19: (1, {'@': 193}), 20: (1, {'@': 193}), 21: (1, {'@': 193}), 22: (1, {'@': 193}), 23: (1, {'@': 193}), 24: (1, {'@': 193}), 25: (1, {'@': 193}), 26: (1, {'@': 193}), 27: (1, {'@': 193}), 28: (1, {'@': 193}), 29: (1, {'@': 193}), 30: (1, {'@': 193}), 31: (1, {'@': 193}), 32: (1, {'@': 193}), 33: (1, {'@': 193}), 34: (1, {'@': 193}), 35: (1, {'@': 193}), 36: (1, {'@': 193}), 37: (1, {'@': 193}), 38: (1, {'@': 193}), 39: (1, {'@': 193}), 40: (1, {'@': 193}), 41: (1, {'@': 193}), 42: (1, {'@': 193}), 43: (1, {'@': 193}), 44: (1, {'@': 193}), 45: (1, {'@': 193}), 46: (1, {'@': 193}), 47: (1, {'@': 193}), 48: (1, {'@': 193}), 49: (1, {'@': 193}), 50: (1, {'@': 193}), 51: (1, {'@': 193}), 52: (1, {'@': 193}), 53: (1, {'@': 193}), 54: (1, {'@': 193}), 55: (1, {'@': 193})}, 257: {56: (0, 388), 39: (0, 261), 57: (0, 333), 58: (0, 233), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 22: (0, 236), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 96: (0, 259), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 123})}, 258: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 79: (0, 634), 78: (0, 666), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 58: (0, 362), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 114})}, 259: {0: (0, 129)}, 260: {33: (1, {'@': 529}), 34: (1, {'@': 529}), 35: (1, {'@': 529}), 12: (1, {'@': 529}), 36: (1, {'@': 529}), 37: (1, {'@': 529}), 21: (1, {'@': 529}), 38: (1, {'@': 529}), 23: (1, {'@': 529}), 39: (1, {'@': 529}), 40: (1, {'@': 529}), 41: (1, {'@': 529}), 26: (1, {'@': 529}), 42: (1, {'@': 529}), 32: (1, {'@': 529}), 43: (1, {'@': 529}), 44: (1, {'@': 529}), 4: (1, {'@': 529}), 45: (1, {'@': 529}), 6: (1, {'@': 529}), 8: (1, {'@': 529}), 9: (1, {'@': 529}), 46: (1, {'@': 529}), 31: (1, {'@': 529}), 3: (1, {'@': 529}), 11: (1, {'@': 529}), 13: (1, {'@': 529}), 47: (1, {'@': 529}), 2: (1, {'@': 529}), 49: (1, {'@': 529}), 50: (1, {'@': 529}), 16: (1, {'@': 529}), 0: (1, {'@': 529}), 19: (1, {'@': 529}), 22: (1, {'@': 529}), 51: (1, {'@': 529}), 52: (1, {'@': 529}), 53: (1, {'@': 529}), 54: (1, {'@': 529}), 55: (1, {'@': 529}), 28: (1, {'@': 529})}, 261: {51: (1, {'@': 160}), 45: (1, {'@': 160}), 33: (1, {'@': 160}), 34: (1, {'@': 160}), 53: (1, {'@': 160}), 46: (1, {'@': 160}), 40: (1, {'@': 160}), 50: (1, {'@': 160}), 41: (1, {'@': 160}), 35: (1, {'@': 160}), 47: (1, {'@': 160}), 36: (1, {'@': 160}), 37: (1, {'@': 160}), 43: (1, {'@': 160}), 49: (1, {'@': 160})}, 262: {138: (0, 80), 139: (0, 596), 140: (0, 693), 40: (0, 437), 141: (0, 590), 67: (0, 630), 142: (0, 615), 143: (0, 637), 149: (0, 465), 45: (0, 504), 68: (0, 676), 50: (0, 600), 144: (0, 273), 70: (0, 652), 71: (0, 661), 145: (0, 706), 49: (0, 669), 47: (0, 675), 146: (0, 462), 53: (0, 618), 82: (0, 593), 147: (0, 249), 148: (0, 295), 85: (0, 392), 150: (0, 594), 26: (0, 604), 33: (0, 283), 76: (0, 35), 151: (0, 315), 36: (0, 276), 152: (0, 457), 153: (0, 685), 154: (0, 144), 34: (0, 483), 37: (0, 481), 43: (0, 519), 155: (0, 440), 156: (0, 653), 46: (0, 534), 41: (0, 458), 88: (0, 311), 51: (0, 540), 157: (0, 536), 99: (0, 531), 79: (0, 451), 101: (0, 256), 35: (0, 365), 102: (0, 660)}, 263: {17: (0, 252), 4: (0, 384), 19: (0, 373), 11: (0, 75)}, 264: {0: (1, {'@': 389})}, 265: {4: (1, {'@': 267}), 6: (1, {'@': 267}), 7: (1, {'@': 267}), 8: (1, {'@': 267}), 9: (1, {'@': 267}), 3: (1, {'@': 267}), 10: (1, {'@': 267}), 11: (1, {'@': 267}), 12: (1, {'@': 267}), 13: (1, {'@': 267}), 2: (1, {'@': 267}), 14: (1, {'@': 267}), 15: (1, {'@': 267}), 16: (1, {'@': 267}), 17: (1, {'@': 267}), 0: (1, {'@': 267}), 18: (1, {'@': 267}), 19: (1, {'@': 267}), 20: (1, {'@': 267}), 21: (1, {'@': 267}), 24: (1, {'@': 267}), 23: (1, {'@': 267}), 25: (1, {'@': 267}), 26: (1, {'@': 267}), 27: (1, {'@': 267}), 54: (1, {'@': 267}), 32: (1, {'@': 267}), 28: (1, {'@': 267}), 29: (1, {'@': 267}), 30: (1, {'@': 267}), 48: (1, {'@': 267}), 5: (1, {'@': 267})}, 266: {13: (0, 334), 28: (0, 105), 175: (0, 453), 6: (0, 100), 9: (0, 139), 26: (0, 6), 179: (0, 517), 33: (1, {'@': 363}), 34: (1, {'@': 363}), 4: (1, {'@': 363}), 45: (1, {'@': 363}), 5: (1, {'@': 363}), 46: (1, {'@': 363}), 35: (1, {'@': 363}), 31: (1, {'@': 363}), 11: (1, {'@': 363}), 36: (1, {'@': 363}), 37: (1, {'@': 363}), 47: (1, {'@': 363}), 48: (1, {'@': 363}), 49: (1, {'@': 363}), 50: (1, {'@': 363}), 0: (1, {'@': 363}), 19: (1, {'@': 363}), 22: (1, {'@': 363}), 51: (1, {'@': 363}), 38: (1, {'@': 363}), 52: (1, {'@': 363}), 53: (1, {'@': 363}), 39: (1, {'@': 363}), 40: (1, {'@': 363}), 41: (1, {'@': 363}), 54: (1, {'@': 363}), 42: (1, {'@': 363}), 32: (1, {'@': 363}), 43: (1, {'@': 363}), 55: (1, {'@': 363}), 44: (1, {'@': 363})}, 267: {37: (0, 481), 180: (0, 317), 4: (0, 314), 70: (0, 307), 45: (0, 504), 39: (0, 261), 181: (0, 357), 182: (0, 422), 40: (0, 437), 183: (0, 431), 93: (0, 270), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 193: (0, 363), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 77: (0, 710), 64: (0, 526), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 34: (0, 483), 185: (0, 352), 186: (0, 589), 53: (0, 618), 51: (0, 540), 191: (0, 691), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 268: {31: (1, {'@': 128}), 32: (1, {'@': 128})}, 269: {33: (1, {'@': 501}), 34: (1, {'@': 501}), 35: (1, {'@': 501}), 12: (1, {'@': 501}), 36: (1, {'@': 501}), 37: (1, {'@': 501}), 21: (1, {'@': 501}), 38: (1, {'@': 501}), 23: (1, {'@': 501}), 39: (1, {'@': 501}), 40: (1, {'@': 501}), 41: (1, {'@': 501}), 26: (1, {'@': 501}), 42: (1, {'@': 501}), 43: (1, {'@': 501}), 4: (1, {'@': 501}), 45: (1, {'@': 501}), 5: (1, {'@': 501}), 6: (1, {'@': 501}), 8: (1, {'@': 501}), 3: (1, {'@': 501}), 9: (1, {'@': 501}), 46: (1, {'@': 501}), 11: (1, {'@': 501}), 2: (1, {'@': 501}), 13: (1, {'@': 501}), 47: (1, {'@': 501}), 49: (1, {'@': 501}), 50: (1, {'@': 501}), 16: (1, {'@': 501}), 19: (1, {'@': 501}), 51: (1, {'@': 501}), 52: (1, {'@': 501}), 53: (1, {'@': 501}), 55: (1, {'@': 501}), 28: (1, {'@': 501})}, 270: {6: (1, {'@': 480}), 9: (1, {'@': 480}), 26: (1, {'@': 480}), 13: (1, {'@': 480}), 28: (1, {'@': 480}), 4: (1, {'@': 429}), 32: (1, {'@': 429}), 0: (1, {'@': 429}), 19: (1, {'@': 429}), 11: (1, {'@': 429}), 54: (1, {'@': 429}), 48: (1, {'@': 429}), 2: (1, {'@': 488}), 3: (1, {'@': 488}), 30: (1, {'@': 268}), 24: (1, {'@': 268}), 7: (1, {'@': 268}), 25: (1, {'@': 268}), 10: (1, {'@': 268}), 27: (1, {'@': 268}), 14: (1, {'@': 268}), 15: (1, {'@': 268}), 17: (1, {'@': 268}), 29: (1, {'@': 268}), 18: (1, {'@': 268}), 20: (1, {'@': 268}), 23: (1, {'@': 444}), 8: (1, {'@': 444}), 12: (1, {'@': 444}), 16: (1, {'@': 444}), 21: (1, {'@': 444}), 5: (1, {'@': 429})}, 271: {4: (1, {'@': 448}), 5: (1, {'@': 448}), 6: (1, {'@': 448}), 8: (1, {'@': 448}), 9: (1, {'@': 448}), 3: (1, {'@': 448}), 11: (1, {'@': 448}), 12: (1, {'@': 448}), 13: (1, {'@': 448}), 2: (1, {'@': 448}), 48: (1, {'@': 448}), 16: (1, {'@': 448}), 0: (1, {'@': 448}), 19: (1, {'@': 448}), 21: (1, {'@': 448}), 23: (1, {'@': 448}), 26: (1, {'@': 448}), 54: (1, {'@': 448}), 32: (1, {'@': 448}), 28: (1, {'@': 448}), 33: (1, {'@': 448}), 34: (1, {'@': 448}), 35: (1, {'@': 448}), 36: (1, {'@': 448}), 37: (1, {'@': 448}), 38: (1, {'@': 448}), 39: (1, {'@': 448}), 40: (1, {'@': 448}), 41: (1, {'@': 448}), 42: (1, {'@': 448}), 43: (1, {'@': 448}), 45: (1, {'@': 448}), 46: (1, {'@': 448}), 47: (1, {'@': 448}), 49: (1, {'@': 448}), 50: (1, {'@': 448}), 51: (1, {'@': 448}), 52: (1, {'@': 448}), 53: (1, {'@': 448}), 55: (1, {'@': 448}), 44: (1, {'@': 448}), 31: (1, {'@': 448}), 22: (1, {'@': 448})}, 272: {39: (0, 261), 67: (0, 128), 93: (0, 645), 40: (0, 437), 191: (0, 266), 11: (0, 522), 184: (0, 689), 64: (0, 526), 66: (0, 528), 186: (0, 589), 45: (0, 504), 4: (0, 314), 50: (0, 600), 209: (0, 612), 182: (0, 422), 210: (0, 607), 70: (0, 652), 71: (0, 661), 55: (0, 708), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 77: (0, 710), 80: (0, 628), 211: (0, 85), 53: (0, 618), 82: (0, 593), 84: (0, 621), 181: (0, 357), 33: (0, 283), 180: (0, 317), 88: (0, 419), 183: (0, 431), 36: (0, 276), 34: (0, 483), 37: (0, 481), 43: (0, 519), 46: (0, 534), 193: (0, 363), 212: (0, 366), 41: (0, 458), 97: (0, 525), 185: (0, 352), 51: (0, 540), 52: (0, 544), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660)}, 273: {13: (0, 334), 28: (0, 105), 179: (0, 627), 6: (0, 100), 9: (0, 139), 175: (0, 461), 26: (0, 6)}, 274: {4: (1, {'@': 409}), 5: (1, {'@': 409}), 44: (1, {'@': 409}), 31: (1, {'@': 409}), 19: (1, {'@': 409}), 11: (1, {'@': 409}), 32: (1, {'@': 146})}, 275: {0: (1, {'@': 390})}, 276: {4: (1, {'@': 205}), 5: (1, {'@': 205}), 6: (1, {'@': 205}), 7: (1, {'@': 205}), 8: (1, {'@': 205}), 9: (1, {'@': 205}), 10: (1, {'@': 205}), 3: (1, {'@': 205}), 11: (1, {'@': 205}), 12: (1, {'@': 205}), 13: (1, {'@': 205}), 14: (1, {'@': 205}), 15: (1, {'@': 205}), 2: (1, {'@': 205}), 29: (1, {'@': 205}), 16: (1, {'@': 205}), 17: (1, {'@': 205}), 0: (1, {'@': 205}), 18: (1, {'@': 205}), 19: (1, {'@': 205}), 20: (1, {'@': 205}), 21: (1, {'@': 205}), 22: (1, {'@': 205}), 23: (1, {'@': 205}), 24: (1, {'@': 205}), 25: (1, {'@': 205}), 26: (1, {'@': 205}), 27: (1, {'@': 205}), 28: (1, {'@': 205}), 178: (1, {'@': 205}), 30: (1, {'@': 205}), 200: (1, {'@': 205}), 32: (1, {'@': 205}), 31: (1, {'@': 205}), 33: (1, {'@': 205}), 34: (1, {'@': 205}), 35: (1, {'@': 205}), 36: (1, {'@': 205}), 37: (1, {'@': 205}), 38: (1, {'@': 205}), 39: (1, {'@': 205}), 40: (1, {'@': 205}), 41: (1, {'@': 205}), 42: (1, {'@': 205}), 43: (1, {'@': 205}), 44: (1, {'@': 205}), 45: (1, {'@': 205}), 46: (1, {'@': 205}), 47: (1, {'@': 205}), 48: (1, {'@': 205}), 49: (1, {'@': 205}), 50: (1, {'@': 205}), 51: (1, {'@': 205}), 52: (1, {'@': 205}), 53: (1, {'@': 205}), 54: (1, {'@': 205}), 55: (1, {'@': 205})}, 277: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 79: (0, 634), 78: (0, 666), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 58: (0, 268), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 278: {11: (0, 5), 4: (0, 7), 19: (0, 288), 0: (1, {'@': 295})}, 279: {4: (1, {'@': 308}), 33: (1, {'@': 308}), 34: (1, {'@': 308}), 5: (1, {'@': 308}), 45: (1, {'@': 308}), 46: (1, {'@': 308}), 35: (1, {'@': 308}), 11: (1, {'@': 308}), 36: (1, {'@': 308}), 37: (1, {'@': 308}), 47: (1, {'@': 308}), 49: (1, {'@': 308}), 50: (1, {'@': 308}), 19: (1, {'@': 308}), 51: (1, {'@': 308}), 38: (1, {'@': 308}), 52: (1, {'@': 308}), 53: (1, {'@': 308}), 39: (1, {'@': 308}), 40: (1, {'@': 308}), 41: (1, {'@': 308}), 42: (1, {'@': 308}), 55: (1, {'@': 308}), 43: (1, {'@': 308})}, 280: {37: (0, 481), 36: (0, 276), 46: (0, 534), 70: (0, 45)}, 281: {33: (1, {'@': 325}), 34: (1, {'@': 325}), 45: (1, {'@': 325}), 46: (1, {'@': 325}), 35: (1, {'@': 325}), 36: (1, {'@': 325}), 37: (1, {'@': 325}), 47: (1, {'@': 325}), 49: (1, {'@': 325}), 50: (1, {'@': 325}), 51: (1, {'@': 325}), 38: (1, {'@': 325}), 52: (1, {'@': 325}), 53: (1, {'@': 325}), 39: (1, {'@': 325}), 40: (1, {'@': 325}), 41: (1, {'@': 325}), 42: (1, {'@': 325}), 55: (1, {'@': 325}), 43: (1, {'@': 325})}, 282: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 105: (0, 246), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 122), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 58: (0, 183), 34: (0, 483), 91: (0, 497), 37: (0, 481), 106: (0, 195), 107: (0, 196), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 283: {4: (1, {'@': 65}), 5: (1, {'@': 65}), 6: (1, {'@': 65}), 7: (1, {'@': 65}), 8: (1, {'@': 65}), 9: (1, {'@': 65}), 10: (1, {'@': 65}), 3: (1, {'@': 65}), 11: (1, {'@': 65}), 12: (1, {'@': 65}), 13: (1, {'@': 65}), 14: (1, {'@': 65}), 15: (1, {'@': 65}), 2: (1, {'@': 65}), 16: (1, {'@': 65}), 17: (1, {'@': 65}), 0: (1, {'@': 65}), 18: (1, {'@': 65}), 19: (1, {'@': 65}), 20: (1, {'@': 65}), 21: (1, {'@': 65}), 22: (1, {'@': 65}), 23: (1, {'@': 65}), 24: (1, {'@': 65}), 25: (1, {'@': 65}), 26: (1, {'@': 65}), 27: (1, {'@': 65}), 28: (1, {'@': 65}), 29: (1, {'@': 65}), 30: (1, {'@': 65}), 31: (1, {'@': 65}), 32: (1, {'@': 65}), 33: (1, {'@': 65}), 34: (1, {'@': 65}), 35: (1, {'@': 65}), 36: (1, {'@': 65}), 37: (1, {'@': 65}), 38: (1, {'@': 65}), 39: (1, {'@': 65}), 40: (1, {'@': 65}), 41: (1, {'@': 65}), 42: (1, {'@': 65}), 43: (1, {'@': 65}), 44: (1, {'@': 65}), 45: (1, {'@': 65}), 46: (1, {'@': 65}), 47: (1, {'@': 65}), 48: (1, {'@': 65}), 49: (1, {'@': 65}), 50: (1, {'@': 65}), 51: (1, {'@': 65}), 52: (1, {'@': 65}), 53: (1, {'@': 65}), 54: (1, {'@': 65}), 55: (1, {'@': 65})}, 284: {4: (1, {'@': 513}), 6: (1, {'@': 513}), 8: (1, {'@': 513}), 9: (1, {'@': 513}), 3: (1, {'@': 513}), 11: (1, {'@': 513}), 12: (1, {'@': 513}), 13: (1, {'@': 513}), 2: (1, {'@': 513}), 16: (1, {'@': 513}), 0: (1, {'@': 513}), 19: (1, {'@': 513}), 21: (1, {'@': 513}), 23: (1, {'@': 513}), 26: (1, {'@': 513}), 54: (1, {'@': 513}), 32: (1, {'@': 513}), 28: (1, {'@': 513}), 48: (1, {'@': 513}), 5: (1, {'@': 513})}, 285: {4: (1, {'@': 265}), 6: (1, {'@': 265}), 7: (1, {'@': 265}), 8: (1, {'@': 265}), 9: (1, {'@': 265}), 3: (1, {'@': 265}), 10: (1, {'@': 265}), 11: (1, {'@': 265}), 12: (1, {'@': 265}), 13: (1, {'@': 265}), 2: (1, {'@': 265}), 14: (1, {'@': 265}), 15: (1, {'@': 265}), 16: (1, {'@': 265}), 17: (1, {'@': 265}), 0: (1, {'@': 265}), 18: (1, {'@': 265}), 19: (1, {'@': 265}), 20: (1, {'@': 265}), 21: (1, {'@': 265}), 24: (1, {'@': 265}), 23: (1, {'@': 265}), 25: (1, {'@': 265}), 26: (1, {'@': 265}), 27: (1, {'@': 265}), 54: (1, {'@': 265}), 32: (1, {'@': 265}), 28: (1, {'@': 265}), 29: (1, {'@': 265}), 30: (1, {'@': 265}), 48: (1, {'@': 265}), 5: (1, {'@': 265})}, 286: {4: (1, {'@': 200}), 5: (1, {'@': 200}), 6: (1, {'@': 200}), 7: (1, {'@': 200}), 8: (1, {'@': 200}), 9: (1, {'@': 200}), 10: (1, {'@': 200}), 3: (1, {'@': 200}), 11: (1, {'@': 200}), 12: (1, {'@': 200}), 13: (1, {'@': 200}), 14: (1, {'@': 200}), 15: (1, {'@': 200}), 2: (1, {'@': 200}), 16: (1, {'@': 200}), 17: (1, {'@': 200}), 0: (1, {'@': 200}), 18: (1, {'@': 200}), 19: (1, {'@': 200}), 20: (1, {'@': 200}), 21: (1, {'@': 200}), 22: (1, {'@': 200}), 23: (1, {'@': 200}), 24: (1, {'@': 200}), 25: (1, {'@': 200}), 26: (1, {'@': 200}), 27: (1, {'@': 200}), 28: (1, {'@': 200}), 29: (1, {'@': 200}), 30: (1, {'@': 200}), 31: (1, {'@': 200}), 32: (1, {'@': 200}), 33: (1, {'@': 200}), 34: (1, {'@': 200}), 35: (1, {'@': 200}), 36: (1, {'@': 200}), 37: (1, {'@': 200}), 38: (1, {'@': 200}), 39: (1, {'@': 200}), 40: (1, {'@': 200}), 41: (1, {'@': 200}), 42: (1, {'@': 200}), 43: (1, {'@': 200}), 44: (1, {'@': 200}), 45: (1, {'@': 200}), 46: (1, {'@': 200}), 47: (1, {'@': 200}), 48: (1, {'@': 200}), 49: (1, {'@': 200}), 50: (1, {'@': 200}), 51: (1, {'@': 200}), 52: (1, {'@': 200}), 53: (1, {'@': 200}), 54: (1, {'@': 200}), 55: (1, {'@': 200})}, 287: {4: (1, {'@': 266}), 6: (1, {'@': 266}), 7: (1, {'@': 266}), 8: (1, {'@': 266}), 9: (1, {'@': 266}), 3: (1, {'@': 266}), 10: (1, {'@': 266}), 11: (1, {'@': 266}), 12: (1, {'@': 266}), 13: (1, {'@': 266}), 2: (1, {'@': 266}), 14: (1, {'@': 266}), 15: (1, {'@': 266}), 16: (1, {'@': 266}), 17: (1, {'@': 266}), 0: (1, {'@': 266}), 18: (1, {'@': 266}), 19: (1, {'@': 266}), 20: (1, {'@': 266}), 21: (1, {'@': 266}), 24: (1, {'@': 266}), 23: (1, {'@': 266}), 25: (1, {'@': 266}), 26: (1, {'@': 266}), 27: (1, {'@': 266}), 54: (1, {'@': 266}), 32: (1, {'@': 266}), 28: (1, {'@': 266}), 29: (1, {'@': 266}), 30: (1, {'@': 266}), 48: (1, {'@': 266}), 5: (1, {'@': 266})}, 288: {37: (0, 481), 36: (0, 276), 46: (0, 534), 70: (0, 264)}, 289: {0: (0, 377)}, 290: {6: (1, {'@': 481}), 9: (1, {'@': 481}), 26: (1, {'@': 481}), 13: (1, {'@': 481}), 28: (1, {'@': 481}), 4: (1, {'@': 431}), 32: (1, {'@': 431}), 0: (1, {'@': 431}), 19: (1, {'@': 431}), 11: (1, {'@': 431}), 54: (1, {'@': 431}), 48: (1, {'@': 431}), 5: (1, {'@': 431})}, 291: {39: (0, 261), 108: (0, 370), 109: (0, 407), 40: (0, 437), 110: (0, 378), 112: (0, 360), 70: (0, 375), 111: (0, 294), 113: (0, 715), 114: (0, 704), 115: (0, 150), 116: (0, 235), 117: (0, 152), 66: (0, 528), 118: (0, 142), 45: (0, 504), 119: (0, 217), 120: (0, 11), 73: (0, 36), 50: (0, 600), 121: (0, 165), 122: (0, 19), 123: (0, 25), 124: (0, 32), 71: (0, 661), 55: (0, 708), 213: (0, 566), 42: (0, 606), 49: (0, 669), 47: (0, 675), 80: (0, 628), 53: (0, 618), 125: (0, 15), 82: (0, 593), 126: (0, 62), 84: (0, 621), 127: (0, 38), 33: (0, 283), 128: (0, 24), 88: (0, 419), 36: (0, 276), 129: (0, 109), 130: (0, 13), 131: (0, 23), 132: (0, 124), 34: (0, 483), 133: (0, 66), 37: (0, 481), 134: (0, 115), 135: (0, 111), 43: (0, 519), 46: (0, 534), 41: (0, 458), 136: (0, 116), 137: (0, 117), 51: (0, 540), 52: (0, 544), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 38: (1, {'@': 69})}, 292: {4: (1, {'@': 156}), 5: (1, {'@': 156}), 6: (1, {'@': 156}), 7: (1, {'@': 156}), 8: (1, {'@': 156}), 9: (1, {'@': 156}), 10: (1, {'@': 156}), 3: (1, {'@': 156}), 11: (1, {'@': 156}), 12: (1, {'@': 156}), 13: (1, {'@': 156}), 14: (1, {'@': 156}), 15: (1, {'@': 156}), 2: (1, {'@': 156}), 16: (1, {'@': 156}), 17: (1, {'@': 156}), 0: (1, {'@': 156}), 18: (1, {'@': 156}), 19: (1, {'@': 156}), 20: (1, {'@': 156}), 21: (1, {'@': 156}), 22: (1, {'@': 156}), 23: (1, {'@': 156}), 24: (1, {'@': 156}), 25: (1, {'@': 156}), 26: (1, {'@': 156}), 27: (1, {'@': 156}), 28: (1, {'@': 156}), 29: (1, {'@': 156}), 30: (1, {'@': 156}), 31: (1, {'@': 156}), 32: (1, {'@': 156}), 33: (1, {'@': 156}), 34: (1, {'@': 156}), 35: (1, {'@': 156}), 36: (1, {'@': 156}), 37: (1, {'@': 156}), 38: (1, {'@': 156}), 39: (1, {'@': 156}), 40: (1, {'@': 156}), 41: (1, {'@': 156}), 42: (1, {'@': 156}), 43: (1, {'@': 156}), 44: (1, {'@': 156}), 45: (1, {'@': 156}), 46: (1, {'@': 156}), 47: (1, {'@': 156}), 48: (1, {'@': 156}), 49: (1, {'@': 156}), 50: (1, {'@': 156}), 51: (1, {'@': 156}), 52: (1, {'@': 156}), 53: (1, {'@': 156}), 54: (1, {'@': 156}), 55: (1, {'@': 156})}, 293: {5: (0, 14), 214: (0, 84), 32: (1, {'@': 151}), 0: (1, {'@': 151}), 54: (1, {'@': 151})}, 294: {28: (0, 579), 171: (0, 244), 175: (0, 459), 9: (0, 139), 4: (0, 511), 19: (0, 464), 6: (0, 644), 11: (0, 433), 13: (0, 670), 30: (1, {'@': 522}), 24: (1, {'@': 522}), 7: (1, {'@': 522}), 25: (1, {'@': 522}), 10: (1, {'@': 522}), 27: (1, {'@': 522}), 14: (1, {'@': 522}), 15: (1, {'@': 522}), 17: (1, {'@': 522}), 29: (1, {'@': 522}), 18: (1, {'@': 522}), 20: (1, {'@': 522}), 23: (1, {'@': 504}), 8: (1, {'@': 504}), 12: (1, {'@': 504}), 16: (1, {'@': 504}), 21: (1, {'@': 504}), 33: (1, {'@': 303}), 34: (1, {'@': 303}), 5: (1, {'@': 303}), 45: (1, {'@': 303}), 46: (1, {'@': 303}), 35: (1, {'@': 303}), 36: (1, {'@': 303}), 37: (1, {'@': 303}), 47: (1, {'@': 303}), 49: (1, {'@': 303}), 50: (1, {'@': 303}), 51: (1, {'@': 303}), 38: (1, {'@': 303}), 52: (1, {'@': 303}), 53: (1, {'@': 303}), 39: (1, {'@': 303}), 40: (1, {'@': 303}), 41: (1, {'@': 303}), 42: (1, {'@': 303}), 55: (1, {'@': 303}), 43: (1, {'@': 303}), 2: (1, {'@': 525}), 3: (1, {'@': 525}), 26: (1, {'@': 399})}, 295: {1: (0, 136), 2: (0, 684), 3: (0, 595), 4: (1, {'@': 477}), 6: (1, {'@': 477}), 23: (1, {'@': 477}), 8: (1, {'@': 477}), 9: (1, {'@': 477}), 26: (1, {'@': 477}), 11: (1, {'@': 477}), 54: (1, {'@': 477}), 13: (1, {'@': 477}), 12: (1, {'@': 477}), 32: (1, {'@': 477}), 16: (1, {'@': 477}), 28: (1, {'@': 477}), 0: (1, {'@': 477}), 19: (1, {'@': 477}), 21: (1, {'@': 477}), 48: (1, {'@': 477}), 5: (1, {'@': 477})}, 296: {4: (1, {'@': 142}), 5: (1, {'@': 142}), 6: (1, {'@': 142}), 7: (1, {'@': 142}), 8: (1, {'@': 142}), 9: (1, {'@': 142}), 10: (1, {'@': 142}), 3: (1, {'@': 142}), 11: (1, {'@': 142}), 12: (1, {'@': 142}), 13: (1, {'@': 142}), 14: (1, {'@': 142}), 15: (1, {'@': 142}), 2: (1, {'@': 142}), 16: (1, {'@': 142}), 17: (1, {'@': 142}), 0: (1, {'@': 142}), 18: (1, {'@': 142}), 19: (1, {'@': 142}), 20: (1, {'@': 142}), 21: (1, {'@': 142}), 22: (1, {'@': 142}), 23: (1, {'@': 142}), 24: (1, {'@': 142}), 25: (1, {'@': 142}), 26: (1, {'@': 142}), 27: (1, {'@': 142}), 28: (1, {'@': 142}), 29: (1, {'@': 142}), 30: (1, {'@': 142}), 31: (1, {'@': 142}), 32: (1, {'@': 142}), 33: (1, {'@': 142}), 34: (1, {'@': 142}), 35: (1, {'@': 142}), 36: (1, {'@': 142}), 37: (1, {'@': 142}), 38: (1, {'@': 142}), 39: (1, {'@': 142}), 40: (1, {'@': 142}), 41: (1, {'@': 142}), 42: (1, {'@': 142}), 43: (1, {'@': 142}), 44: (1, {'@': 142}), 45: (1, {'@': 142}), 46: (1, {'@': 142}), 47: (1, {'@': 142}), 48: (1, {'@': 142}), 49: (1, {'@': 142}), 50: (1, {'@': 142}), 51: (1, {'@': 142}), 52: (1, {'@': 142}), 53: (1, {'@': 142}), 54: (1, {'@': 142}), 55: (1, {'@': 142})}, 297: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 184: (0, 222), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 204: (0, 681), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 183: (0, 214), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 93: (0, 40), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 298: {37: (0, 481), 36: (0, 276), 70: (0, 374), 46: (0, 534)}, 299: {195: (0, 178), 37: (0, 481), 45: (0, 504), 70: (0, 307), 39: (0, 261), 75: (0, 107), 40: (0, 437), 43: (0, 519), 71: (0, 661), 196: (0, 59), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 41: (0, 458), 198: (0, 509), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 197: (0, 4), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 300: {33: (1, {'@': 365}), 34: (1, {'@': 365}), 4: (1, {'@': 365}), 45: (1, {'@': 365}), 5: (1, {'@': 365}), 46: (1, {'@': 365}), 35: (1, {'@': 365}), 31: (1, {'@': 365}), 11: (1, {'@': 365}), 36: (1, {'@': 365}), 37: (1, {'@': 365}), 47: (1, {'@': 365}), 48: (1, {'@': 365}), 49: (1, {'@': 365}), 50: (1, {'@': 365}), 0: (1, {'@': 365}), 19: (1, {'@': 365}), 22: (1, {'@': 365}), 51: (1, {'@': 365}), 38: (1, {'@': 365}), 52: (1, {'@': 365}), 53: (1, {'@': 365}), 39: (1, {'@': 365}), 40: (1, {'@': 365}), 41: (1, {'@': 365}), 54: (1, {'@': 365}), 42: (1, {'@': 365}), 32: (1, {'@': 365}), 43: (1, {'@': 365}), 55: (1, {'@': 365}), 44: (1, {'@': 365})}, 301: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 105: (0, 166), 66: (0, 528), 67: (0, 470), 45: (0, 504), 32: (0, 149), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 122), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 104: (0, 67), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 58: (0, 183), 34: (0, 483), 91: (0, 497), 37: (0, 481), 106: (0, 195), 107: (0, 196), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 302: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 93: (0, 172), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 303: {33: (1, {'@': 163}), 34: (1, {'@': 163}), 35: (1, {'@': 163}), 36: (1, {'@': 163}), 37: (1, {'@': 163}), 39: (1, {'@': 163}), 40: (1, {'@': 163}), 41: (1, {'@': 163}), 42: (1, {'@': 163}), 43: (1, {'@': 163}), 4: (1, {'@': 163}), 45: (1, {'@': 163}), 46: (1, {'@': 163}), 11: (1, {'@': 163}), 47: (1, {'@': 163}), 49: (1, {'@': 163}), 50: (1, {'@': 163}), 51: (1, {'@': 163}), 52: (1, {'@': 163}), 53: (1, {'@': 163}), 55: (1, {'@': 163})}, 304: {23: (0, 137), 8: (0, 335), 16: (0, 322), 174: (0, 8), 21: (0, 303), 12: (0, 631), 4: (1, {'@': 285}), 5: (1, {'@': 285}), 31: (1, {'@': 285}), 11: (1, {'@': 285}), 32: (1, {'@': 285}), 44: (1, {'@': 285}), 19: (1, {'@': 285}), 33: (1, {'@': 285}), 34: (1, {'@': 285}), 45: (1, {'@': 285}), 46: (1, {'@': 285}), 35: (1, {'@': 285}), 36: (1, {'@': 285}), 37: (1, {'@': 285}), 47: (1, {'@': 285}), 49: (1, {'@': 285}), 50: (1, {'@': 285}), 0: (1, {'@': 285}), 22: (1, {'@': 285}), 51: (1, {'@': 285}), 38: (1, {'@': 285}), 52: (1, {'@': 285}), 53: (1, {'@': 285}), 39: (1, {'@': 285}), 40: (1, {'@': 285}), 41: (1, {'@': 285}), 54: (1, {'@': 285}), 42: (1, {'@': 285}), 43: (1, {'@': 285}), 55: (1, {'@': 285}), 48: (1, {'@': 285})}, 305: {33: (1, {'@': 212}), 34: (1, {'@': 212}), 45: (1, {'@': 212}), 46: (1, {'@': 212}), 35: (1, {'@': 212}), 36: (1, {'@': 212}), 37: (1, {'@': 212}), 47: (1, {'@': 212}), 49: (1, {'@': 212}), 50: (1, {'@': 212}), 51: (1, {'@': 212}), 38: (1, {'@': 212}), 52: (1, {'@': 212}), 53: (1, {'@': 212}), 39: (1, {'@': 212}), 40: (1, {'@': 212}), 41: (1, {'@': 212}), 42: (1, {'@': 212}), 55: (1, {'@': 212}), 43: (1, {'@': 212})}, 306: {4: (1, {'@': 450}), 5: (1, {'@': 450}), 6: (1, {'@': 450}), 8: (1, {'@': 450}), 3: (1, {'@': 450}), 9: (1, {'@': 450}), 11: (1, {'@': 450}), 12: (1, {'@': 450}), 2: (1, {'@': 450}), 13: (1, {'@': 450}), 48: (1, {'@': 450}), 16: (1, {'@': 450}), 0: (1, {'@': 450}), 19: (1, {'@': 450}), 21: (1, {'@': 450}), 23: (1, {'@': 450}), 26: (1, {'@': 450}), 54: (1, {'@': 450}), 32: (1, {'@': 450}), 28: (1, {'@': 450}), 33: (1, {'@': 450}), 34: (1, {'@': 450}), 35: (1, {'@': 450}), 36: (1, {'@': 450}), 37: (1, {'@': 450}), 38: (1, {'@': 450}), 39: (1, {'@': 450}), 40: (1, {'@': 450}), 41: (1, {'@': 450}), 42: (1, {'@': 450}), 43: (1, {'@': 450}), 45: (1, {'@': 450}), 46: (1, {'@': 450}), 47: (1, {'@': 450}), 49: (1, {'@': 450}), 50: (1, {'@': 450}), 51: (1, {'@': 450}), 52: (1, {'@': 450}), 53: (1, {'@': 450}), 55: (1, {'@': 450}), 44: (1, {'@': 450}), 31: (1, {'@': 450}), 22: (1, {'@': 450})}, 307: {33: (1, {'@': 141}), 34: (1, {'@': 141}), 35: (1, {'@': 141}), 12: (1, {'@': 141}), 36: (1, {'@': 141}), 37: (1, {'@': 141}), 21: (1, {'@': 141}), 38: (1, {'@': 141}), 23: (1, {'@': 141}), 39: (1, {'@': 141}), 40: (1, {'@': 141}), 41: (1, {'@': 141}), 42: (1, {'@': 141}), 32: (1, {'@': 141}), 43: (1, {'@': 141}), 44: (1, {'@': 141}), 4: (1, {'@': 141}), 45: (1, {'@': 141}), 5: (1, {'@': 141}), 8: (1, {'@': 141}), 46: (1, {'@': 141}), 31: (1, {'@': 141}), 11: (1, {'@': 141}), 47: (1, {'@': 141}), 48: (1, {'@': 141}), 16: (1, {'@': 141}), 49: (1, {'@': 141}), 50: (1, {'@': 141}), 0: (1, {'@': 141}), 19: (1, {'@': 141}), 22: (1, {'@': 141}), 51: (1, {'@': 141}), 52: (1, {'@': 141}), 53: (1, {'@': 141}), 54: (1, {'@': 141}), 55: (1, {'@': 141}), 7: (1, {'@': 141}), 3: (1, {'@': 141}), 10: (1, {'@': 141}), 2: (1, {'@': 141}), 14: (1, {'@': 141}), 15: (1, {'@': 141}), 29: (1, {'@': 141}), 17: (1, {'@': 141}), 18: (1, {'@': 141}), 20: (1, {'@': 141}), 24: (1, {'@': 141}), 25: (1, {'@': 141}), 27: (1, {'@': 141}), 30: (1, {'@': 141}), 26: (1, {'@': 141}), 6: (1, {'@': 141}), 9: (1, {'@': 141}), 13: (1, {'@': 141}), 28: (1, {'@': 141})}, 308: {4: (1, {'@': 492}), 5: (1, {'@': 492}), 7: (1, {'@': 492}), 8: (1, {'@': 492}), 44: (1, {'@': 492}), 3: (1, {'@': 492}), 10: (1, {'@': 492}), 31: (1, {'@': 492}), 11: (1, {'@': 492}), 12: (1, {'@': 492}), 2: (1, {'@': 492}), 14: (1, {'@': 492}), 15: (1, {'@': 492}), 16: (1, {'@': 492}), 17: (1, {'@': 492}), 18: (1, {'@': 492}), 19: (1, {'@': 492}), 20: (1, {'@': 492}), 21: (1, {'@': 492}), 24: (1, {'@': 492}), 23: (1, {'@': 492}), 25: (1, {'@': 492}), 27: (1, {'@': 492}), 32: (1, {'@': 492}), 29: (1, {'@': 492}), 30: (1, {'@': 492}), 33: (1, {'@': 492}), 34: (1, {'@': 492}), 35: (1, {'@': 492}), 36: (1, {'@': 492}), 37: (1, {'@': 492}), 38: (1, {'@': 492}), 39: (1, {'@': 492}), 40: (1, {'@': 492}), 41: (1, {'@': 492}), 42: (1, {'@': 492}), 43: (1, {'@': 492}), 45: (1, {'@': 492}), 46: (1, {'@': 492}), 47: (1, {'@': 492}), 49: (1, {'@': 492}), 50: (1, {'@': 492}), 0: (1, {'@': 492}), 22: (1, {'@': 492}), 51: (1, {'@': 492}), 52: (1, {'@': 492}), 53: (1, {'@': 492}), 54: (1, {'@': 492}), 55: (1, {'@': 492}), 48: (1, {'@': 492})}, 309: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 93: (0, 55)}, 310: {6: (1, {'@': 482}), 9: (1, {'@': 482}), 26: (1, {'@': 482}), 13: (1, {'@': 482}), 28: (1, {'@': 482}), 33: (1, {'@': 433}), 34: (1, {'@': 433}), 4: (1, {'@': 433}), 45: (1, {'@': 433}), 5: (1, {'@': 433}), 46: (1, {'@': 433}), 35: (1, {'@': 433}), 31: (1, {'@': 433}), 11: (1, {'@': 433}), 36: (1, {'@': 433}), 37: (1, {'@': 433}), 47: (1, {'@': 433}), 48: (1, {'@': 433}), 49: (1, {'@': 433}), 50: (1, {'@': 433}), 0: (1, {'@': 433}), 19: (1, {'@': 433}), 22: (1, {'@': 433}), 51: (1, {'@': 433}), 38: (1, {'@': 433}), 52: (1, {'@': 433}), 53: (1, {'@': 433}), 39: (1, {'@': 433}), 40: (1, {'@': 433}), 41: (1, {'@': 433}), 54: (1, {'@': 433}), 42: (1, {'@': 433}), 32: (1, {'@': 433}), 43: (1, {'@': 433}), 55: (1, {'@': 433}), 44: (1, {'@': 433}), 2: (1, {'@': 488}), 3: (1, {'@': 488}), 30: (1, {'@': 268}), 24: (1, {'@': 268}), 7: (1, {'@': 268}), 25: (1, {'@': 268}), 10: (1, {'@': 268}), 27: (1, {'@': 268}), 14: (1, {'@': 268}), 15: (1, {'@': 268}), 17: (1, {'@': 268}), 29: (1, {'@': 268}), 18: (1, {'@': 268}), 20: (1, {'@': 268}), 23: (1, {'@': 444}), 8: (1, {'@': 444}), 12: (1, {'@': 444}), 16: (1, {'@': 444}), 21: (1, {'@': 444})}, 311: {4: (1, {'@': 105}), 6: (1, {'@': 105}), 7: (1, {'@': 105}), 8: (1, {'@': 105}), 9: (1, {'@': 105}), 3: (1, {'@': 105}), 10: (1, {'@': 105}), 11: (1, {'@': 105}), 12: (1, {'@': 105}), 13: (1, {'@': 105}), 2: (1, {'@': 105}), 14: (1, {'@': 105}), 15: (1, {'@': 105}), 16: (1, {'@': 105}), 17: (1, {'@': 105}), 0: (1, {'@': 105}), 18: (1, {'@': 105}), 19: (1, {'@': 105}), 20: (1, {'@': 105}), 21: (1, {'@': 105}), 24: (1, {'@': 105}), 23: (1, {'@': 105}), 25: (1, {'@': 105}), 26: (1, {'@': 105}), 27: (1, {'@': 105}), 54: (1, {'@': 105}), 32: (1, {'@': 105}), 28: (1, {'@': 105}), 29: (1, {'@': 105}), 30: (1, {'@': 105}), 48: (1, {'@': 105}), 5: (1, {'@': 105})}, 312: {37: (0, 481), 36: (0, 276), 70: (0, 287), 46: (0, 534)}, 313: {37: (0, 481), 180: (0, 317), 4: (0, 314), 70: (0, 307), 45: (0, 504), 39: (0, 261), 181: (0, 357), 191: (0, 541), 182: (0, 422), 40: (0, 437), 183: (0, 431), 93: (0, 542), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 193: (0, 363), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 194: (0, 329), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 34: (0, 483), 185: (0, 352), 186: (0, 589), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 314: {56: (0, 388), 39: (0, 261), 59: (0, 175), 57: (0, 333), 60: (0, 401), 40: (0, 437), 61: (0, 247), 58: (0, 16), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 79: (0, 634), 78: (0, 666), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 92: (0, 93), 86: (0, 405), 87: (0, 28), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 226), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 215: (0, 148), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 216: (0, 140), 103: (0, 692)}, 315: {4: (1, {'@': 104}), 6: (1, {'@': 104}), 7: (1, {'@': 104}), 8: (1, {'@': 104}), 9: (1, {'@': 104}), 3: (1, {'@': 104}), 10: (1, {'@': 104}), 11: (1, {'@': 104}), 12: (1, {'@': 104}), 13: (1, {'@': 104}), 2: (1, {'@': 104}), 14: (1, {'@': 104}), 15: (1, {'@': 104}), 16: (1, {'@': 104}), 17: (1, {'@': 104}), 0: (1, {'@': 104}), 18: (1, {'@': 104}), 19: (1, {'@': 104}), 20: (1, {'@': 104}), 21: (1, {'@': 104}), 24: (1, {'@': 104}), 23: (1, {'@': 104}), 25: (1, {'@': 104}), 26: (1, {'@': 104}), 27: (1, {'@': 104}), 54: (1, {'@': 104}), 32: (1, {'@': 104}), 28: (1, {'@': 104}), 29: (1, {'@': 104}), 30: (1, {'@': 104}), 48: (1, {'@': 104}), 5: (1, {'@': 104})}, 316: {32: (0, 361)}, 317: {1: (0, 696), 2: (0, 684), 3: (0, 595), 4: (1, {'@': 377}), 5: (1, {'@': 377}), 6: (1, {'@': 377}), 8: (1, {'@': 377}), 9: (1, {'@': 377}), 11: (1, {'@': 377}), 12: (1, {'@': 377}), 13: (1, {'@': 377}), 48: (1, {'@': 377}), 16: (1, {'@': 377}), 0: (1, {'@': 377}), 19: (1, {'@': 377}), 21: (1, {'@': 377}), 23: (1, {'@': 377}), 26: (1, {'@': 377}), 54: (1, {'@': 377}), 32: (1, {'@': 377}), 28: (1, {'@': 377}), 33: (1, {'@': 377}), 34: (1, {'@': 377}), 45: (1, {'@': 377}), 46: (1, {'@': 377}), 35: (1, {'@': 377}), 36: (1, {'@': 377}), 37: (1, {'@': 377}), 47: (1, {'@': 377}), 49: (1, {'@': 377}), 50: (1, {'@': 377}), 51: (1, {'@': 377}), 38: (1, {'@': 377}), 52: (1, {'@': 377}), 53: (1, {'@': 377}), 39: (1, {'@': 377}), 40: (1, {'@': 377}), 41: (1, {'@': 377}), 42: (1, {'@': 377}), 55: (1, {'@': 377}), 43: (1, {'@': 377}), 31: (1, {'@': 377}), 22: (1, {'@': 377}), 44: (1, {'@': 377})}, 318: {4: (1, {'@': 316}), 33: (1, {'@': 316}), 5: (1, {'@': 316}), 34: (1, {'@': 316}), 45: (1, {'@': 316}), 46: (1, {'@': 316}), 35: (1, {'@': 316}), 11: (1, {'@': 316}), 36: (1, {'@': 316}), 37: (1, {'@': 316}), 47: (1, {'@': 316}), 49: (1, {'@': 316}), 50: (1, {'@': 316}), 19: (1, {'@': 316}), 51: (1, {'@': 316}), 38: (1, {'@': 316}), 52: (1, {'@': 316}), 53: (1, {'@': 316}), 39: (1, {'@': 316}), 40: (1, {'@': 316}), 41: (1, {'@': 316}), 42: (1, {'@': 316}), 55: (1, {'@': 316}), 43: (1, {'@': 316})}, 319: {4: (1, {'@': 199}), 5: (1, {'@': 199}), 6: (1, {'@': 199}), 7: (1, {'@': 199}), 8: (1, {'@': 199}), 9: (1, {'@': 199}), 10: (1, {'@': 199}), 3: (1, {'@': 199}), 11: (1, {'@': 199}), 12: (1, {'@': 199}), 13: (1, {'@': 199}), 14: (1, {'@': 199}), 15: (1, {'@': 199}), 2: (1, {'@': 199}), 16: (1, {'@': 199}), 17: (1, {'@': 199}), 0: (1, {'@': 199}), 18: (1, {'@': 199}), 19: (1, {'@': 199}), 20: (1, {'@': 199}), 21: (1, {'@': 199}), 22: (1, {'@': 199}), 23: (1, {'@': 199}), 24: (1, {'@': 199}), 25: (1, {'@': 199}), 26: (1, {'@': 199}), 27: (1, {'@': 199}), 28: (1, {'@': 199}), 29: (1, {'@': 199}), 30: (1, {'@': 199}), 31: (1, {'@': 199}), 32: (1, {'@': 199}), 33: (1, {'@': 199}), 34: (1, {'@': 199}), 35: (1, {'@': 199}), 36: (1, {'@': 199}), 37: (1, {'@': 199}), 38: (1, {'@': 199}), 39: (1, {'@': 199}), 40: (1, {'@': 199}), 41: (1, {'@': 199}), 42: (1, {'@': 199}), 43: (1, {'@': 199}), 44: (1, {'@': 199}), 45: (1, {'@': 199}), 46: (1, {'@': 199}), 47: (1, {'@': 199}), 48: (1, {'@': 199}), 49: (1, {'@': 199}), 50: (1, {'@': 199}), 51: (1, {'@': 199}), 52: (1, {'@': 199}), 53: (1, {'@': 199}), 54: (1, {'@': 199}), 55: (1, {'@': 199})}, 320: {31: (1, {'@': 126}), 32: (1, {'@': 126})}, 321: {33: (1, {'@': 434}), 34: (1, {'@': 434}), 4: (1, {'@': 434}), 45: (1, {'@': 434}), 5: (1, {'@': 434}), 46: (1, {'@': 434}), 35: (1, {'@': 434}), 31: (1, {'@': 434}), 11: (1, {'@': 434}), 36: (1, {'@': 434}), 37: (1, {'@': 434}), 47: (1, {'@': 434}), 48: (1, {'@': 434}), 49: (1, {'@': 434}), 50: (1, {'@': 434}), 0: (1, {'@': 434}), 19: (1, {'@': 434}), 22: (1, {'@': 434}), 51: (1, {'@': 434}), 38: (1, {'@': 434}), 52: (1, {'@': 434}), 53: (1, {'@': 434}), 39: (1, {'@': 434}), 40: (1, {'@': 434}), 41: (1, {'@': 434}), 54: (1, {'@': 434}), 42: (1, {'@': 434}), 32: (1, {'@': 434}), 43: (1, {'@': 434}), 55: (1, {'@': 434}), 44: (1, {'@': 434}), 30: (1, {'@': 490}), 24: (1, {'@': 490}), 7: (1, {'@': 490}), 25: (1, {'@': 490}), 10: (1, {'@': 490}), 27: (1, {'@': 490}), 14: (1, {'@': 490}), 15: (1, {'@': 490}), 17: (1, {'@': 490}), 29: (1, {'@': 490}), 18: (1, {'@': 490}), 20: (1, {'@': 490}), 23: (1, {'@': 456}), 8: (1, {'@': 456}), 12: (1, {'@': 456}), 16: (1, {'@': 456}), 21: (1, {'@': 456}), 2: (1, {'@': 493}), 3: (1, {'@': 493})}, 322: {33: (1, {'@': 165}), 34: (1, {'@': 165}), 35: (1, {'@': 165}), 36: (1, {'@': 165}), 37: (1, {'@': 165}), 39: (1, {'@': 165}), 40: (1, {'@': 165}), 41: (1, {'@': 165}), 42: (1, {'@': 165}), 43: (1, {'@': 165}), 4: (1, {'@': 165}), 45: (1, {'@': 165}), 46: (1, {'@': 165}), 11: (1, {'@': 165}), 47: (1, {'@': 165}), 49: (1, {'@': 165}), 50: (1, {'@': 165}), 51: (1, {'@': 165}), 52: (1, {'@': 165}), 53: (1, {'@': 165}), 55: (1, {'@': 165})}, 323: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 27), 39: (0, 261), 93: (0, 18), 40: (0, 437), 217: (0, 668), 218: (0, 95), 11: (0, 522), 43: (0, 519), 71: (0, 661), 33: (0, 283), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 77: (0, 710), 64: (0, 526), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 36: (0, 276), 82: (0, 593), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 324: {56: (0, 388), 39: (0, 261), 59: (0, 175), 57: (0, 333), 60: (0, 401), 40: (0, 437), 61: (0, 247), 58: (0, 677), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 42: (0, 606), 72: (0, 611), 73: (0, 698), 49: (0, 669), 47: (0, 675), 74: (0, 695), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 92: (0, 93), 86: (0, 405), 87: (0, 28), 88: (0, 419), 89: (0, 399), 90: (0, 355), 36: (0, 276), 34: (0, 483), 91: (0, 497), 37: (0, 481), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 226), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 215: (0, 148), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 216: (0, 140), 103: (0, 692)}, 325: {33: (1, {'@': 222}), 34: (1, {'@': 222}), 45: (1, {'@': 222}), 46: (1, {'@': 222}), 35: (1, {'@': 222}), 36: (1, {'@': 222}), 37: (1, {'@': 222}), 47: (1, {'@': 222}), 49: (1, {'@': 222}), 50: (1, {'@': 222}), 51: (1, {'@': 222}), 38: (1, {'@': 222}), 52: (1, {'@': 222}), 53: (1, {'@': 222}), 39: (1, {'@': 222}), 40: (1, {'@': 222}), 41: (1, {'@': 222}), 42: (1, {'@': 222}), 55: (1, {'@': 222}), 43: (1, {'@': 222})}, 326: {4: (1, {'@': 143}), 5: (1, {'@': 143}), 6: (1, {'@': 143}), 7: (1, {'@': 143}), 8: (1, {'@': 143}), 9: (1, {'@': 143}), 10: (1, {'@': 143}), 3: (1, {'@': 143}), 11: (1, {'@': 143}), 12: (1, {'@': 143}), 13: (1, {'@': 143}), 14: (1, {'@': 143}), 15: (1, {'@': 143}), 2: (1, {'@': 143}), 16: (1, {'@': 143}), 17: (1, {'@': 143}), 0: (1, {'@': 143}), 18: (1, {'@': 143}), 19: (1, {'@': 143}), 20: (1, {'@': 143}), 21: (1, {'@': 143}), 22: (1, {'@': 143}), 23: (1, {'@': 143}), 24: (1, {'@': 143}), 25: (1, {'@': 143}), 26: (1, {'@': 143}), 27: (1, {'@': 143}), 28: (1, {'@': 143}), 29: (1, {'@': 143}), 30: (1, {'@': 143}), 31: (1, {'@': 143}), 32: (1, {'@': 143}), 33: (1, {'@': 143}), 34: (1, {'@': 143}), 35: (1, {'@': 143}), 36: (1, {'@': 143}), 37: (1, {'@': 143}), 38: (1, {'@': 143}), 39: (1, {'@': 143}), 40: (1, {'@': 143}), 41: (1, {'@': 143}), 42: (1, {'@': 143}), 43: (1, {'@': 143}), 44: (1, {'@': 143}), 45: (1, {'@': 143}), 46: (1, {'@': 143}), 47: (1, {'@': 143}), 48: (1, {'@': 143}), 49: (1, {'@': 143}), 50: (1, {'@': 143}), 51: (1, {'@': 143}), 52: (1, {'@': 143}), 53: (1, {'@': 143}), 54: (1, {'@': 143}), 55: (1, {'@': 143})}, 327: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 59: (0, 263), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 93: (0, 486), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 77: (0, 710), 64: (0, 526), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 328: {4: (1, {'@': 322}), 33: (1, {'@': 322}), 5: (1, {'@': 322}), 34: (1, {'@': 322}), 45: (1, {'@': 322}), 46: (1, {'@': 322}), 35: (1, {'@': 322}), 11: (1, {'@': 322}), 36: (1, {'@': 322}), 37: (1, {'@': 322}), 47: (1, {'@': 322}), 49: (1, {'@': 322}), 50: (1, {'@': 322}), 19: (1, {'@': 322}), 51: (1, {'@': 322}), 38: (1, {'@': 322}), 52: (1, {'@': 322}), 53: (1, {'@': 322}), 39: (1, {'@': 322}), 40: (1, {'@': 322}), 41: (1, {'@': 322}), 42: (1, {'@': 322}), 55: (1, {'@': 322}), 43: (1, {'@': 322})}, 329: {4: (1, {'@': 408}), 5: (1, {'@': 408}), 44: (1, {'@': 408}), 31: (1, {'@': 408}), 19: (1, {'@': 408}), 11: (1, {'@': 408}), 32: (1, {'@': 145})}, 330: {33: (1, {'@': 211}), 34: (1, {'@': 211}), 45: (1, {'@': 211}), 46: (1, {'@': 211}), 35: (1, {'@': 211}), 36: (1, {'@': 211}), 37: (1, {'@': 211}), 47: (1, {'@': 211}), 49: (1, {'@': 211}), 50: (1, {'@': 211}), 51: (1, {'@': 211}), 38: (1, {'@': 211}), 52: (1, {'@': 211}), 53: (1, {'@': 211}), 39: (1, {'@': 211}), 40: (1, {'@': 211}), 41: (1, {'@': 211}), 42: (1, {'@': 211}), 55: (1, {'@': 211}), 43: (1, {'@': 211})}, 331: {56: (0, 388), 39: (0, 261), 57: (0, 333), 58: (0, 233), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 22: (0, 236), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 96: (0, 289), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 123})}, 332: {4: (1, {'@': 362}), 32: (1, {'@': 362}), 0: (1, {'@': 362}), 19: (1, {'@': 362}), 11: (1, {'@': 362}), 54: (1, {'@': 362}), 48: (1, {'@': 362}), 5: (1, {'@': 362})}, 333: {4: (0, 553), 19: (0, 280), 11: (0, 430), 5: (1, {'@': 404}), 0: (1, {'@': 236}), 22: (1, {'@': 236}), 31: (1, {'@': 236}), 32: (1, {'@': 236}), 44: (1, {'@': 236}), 54: (1, {'@': 236}), 33: (1, {'@': 236}), 34: (1, {'@': 236}), 45: (1, {'@': 236}), 46: (1, {'@': 236}), 35: (1, {'@': 236}), 36: (1, {'@': 236}), 37: (1, {'@': 236}), 47: (1, {'@': 236}), 49: (1, {'@': 236}), 50: (1, {'@': 236}), 51: (1, {'@': 236}), 38: (1, {'@': 236}), 52: (1, {'@': 236}), 53: (1, {'@': 236}), 39: (1, {'@': 236}), 40: (1, {'@': 236}), 41: (1, {'@': 236}), 42: (1, {'@': 236}), 55: (1, {'@': 236}), 43: (1, {'@': 236})}, 334: {33: (1, {'@': 170}), 34: (1, {'@': 170}), 35: (1, {'@': 170}), 36: (1, {'@': 170}), 37: (1, {'@': 170}), 39: (1, {'@': 170}), 40: (1, {'@': 170}), 41: (1, {'@': 170}), 42: (1, {'@': 170}), 43: (1, {'@': 170}), 4: (1, {'@': 170}), 45: (1, {'@': 170}), 46: (1, {'@': 170}), 11: (1, {'@': 170}), 47: (1, {'@': 170}), 49: (1, {'@': 170}), 50: (1, {'@': 170}), 51: (1, {'@': 170}), 52: (1, {'@': 170}), 53: (1, {'@': 170}), 55: (1, {'@': 170})}, 335: {33: (1, {'@': 164}), 34: (1, {'@': 164}), 35: (1, {'@': 164}), 36: (1, {'@': 164}), 37: (1, {'@': 164}), 39: (1, {'@': 164}), 40: (1, {'@': 164}), 41: (1, {'@': 164}), 42: (1, {'@': 164}), 43: (1, {'@': 164}), 4: (1, {'@': 164}), 45: (1, {'@': 164}), 46: (1, {'@': 164}), 11: (1, {'@': 164}), 47: (1, {'@': 164}), 49: (1, {'@': 164}), 50: (1, {'@': 164}), 51: (1, {'@': 164}), 52: (1, {'@': 164}), 53: (1, {'@': 164}), 55: (1, {'@': 164})}, 336: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 105: (0, 166), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 122), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 58: (0, 183), 34: (0, 483), 91: (0, 497), 37: (0, 481), 106: (0, 195), 107: (0, 196), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 104: (0, 626), 94: (0, 527), 95: (0, 478), 41: (0, 458), 32: (0, 506), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 337: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 93: (0, 567), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 338: {4: (1, {'@': 398}), 33: (1, {'@': 398}), 34: (1, {'@': 398}), 5: (1, {'@': 398}), 45: (1, {'@': 398}), 46: (1, {'@': 398}), 35: (1, {'@': 398}), 11: (1, {'@': 398}), 36: (1, {'@': 398}), 37: (1, {'@': 398}), 47: (1, {'@': 398}), 49: (1, {'@': 398}), 50: (1, {'@': 398}), 19: (1, {'@': 398}), 51: (1, {'@': 398}), 38: (1, {'@': 398}), 52: (1, {'@': 398}), 53: (1, {'@': 398}), 39: (1, {'@': 398}), 40: (1, {'@': 398}), 41: (1, {'@': 398}), 42: (1, {'@': 398}), 55: (1, {'@': 398}), 43: (1, {'@': 398})}, 339: {31: (1, {'@': 545}), 32: (1, {'@': 545}), 0: (1, {'@': 545}), 54: (1, {'@': 545})}, 340: {195: (0, 178), 37: (0, 481), 45: (0, 504), 70: (0, 307), 39: (0, 261), 75: (0, 107), 40: (0, 437), 198: (0, 224), 43: (0, 519), 71: (0, 661), 196: (0, 59), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 197: (0, 4), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 341: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 93: (0, 687), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 342: {37: (0, 481), 180: (0, 317), 4: (0, 314), 70: (0, 307), 45: (0, 504), 39: (0, 261), 185: (0, 134), 181: (0, 357), 182: (0, 422), 40: (0, 437), 183: (0, 431), 93: (0, 404), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 34: (0, 483), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 186: (0, 423), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 343: {37: (0, 481), 36: (0, 276), 70: (0, 120), 46: (0, 534)}, 344: {4: (1, {'@': 411}), 5: (1, {'@': 411}), 44: (1, {'@': 411}), 31: (1, {'@': 411}), 19: (1, {'@': 411}), 11: (1, {'@': 411}), 32: (1, {'@': 148})}, 345: {0: (0, 332)}, 346: {4: (1, {'@': 454}), 5: (1, {'@': 454}), 23: (1, {'@': 454}), 8: (1, {'@': 454}), 3: (1, {'@': 454}), 31: (1, {'@': 454}), 11: (1, {'@': 454}), 12: (1, {'@': 454}), 2: (1, {'@': 454}), 32: (1, {'@': 454}), 16: (1, {'@': 454}), 44: (1, {'@': 454}), 19: (1, {'@': 454}), 21: (1, {'@': 454}), 33: (1, {'@': 454}), 34: (1, {'@': 454}), 35: (1, {'@': 454}), 36: (1, {'@': 454}), 37: (1, {'@': 454}), 38: (1, {'@': 454}), 39: (1, {'@': 454}), 40: (1, {'@': 454}), 41: (1, {'@': 454}), 42: (1, {'@': 454}), 43: (1, {'@': 454}), 45: (1, {'@': 454}), 46: (1, {'@': 454}), 47: (1, {'@': 454}), 49: (1, {'@': 454}), 50: (1, {'@': 454}), 0: (1, {'@': 454}), 22: (1, {'@': 454}), 51: (1, {'@': 454}), 52: (1, {'@': 454}), 53: (1, {'@': 454}), 54: (1, {'@': 454}), 55: (1, {'@': 454}), 48: (1, {'@': 454})}, 347: {33: (1, {'@': 213}), 34: (1, {'@': 213}), 45: (1, {'@': 213}), 46: (1, {'@': 213}), 35: (1, {'@': 213}), 36: (1, {'@': 213}), 37: (1, {'@': 213}), 47: (1, {'@': 213}), 49: (1, {'@': 213}), 50: (1, {'@': 213}), 51: (1, {'@': 213}), 38: (1, {'@': 213}), 52: (1, {'@': 213}), 53: (1, {'@': 213}), 39: (1, {'@': 213}), 40: (1, {'@': 213}), 41: (1, {'@': 213}), 42: (1, {'@': 213}), 55: (1, {'@': 213}), 43: (1, {'@': 213})}, 348: {4: (1, {'@': 317}), 33: (1, {'@': 317}), 5: (1, {'@': 317}), 34: (1, {'@': 317}), 45: (1, {'@': 317}), 46: (1, {'@': 317}), 35: (1, {'@': 317}), 11: (1, {'@': 317}), 36: (1, {'@': 317}), 37: (1, {'@': 317}), 47: (1, {'@': 317}), 49: (1, {'@': 317}), 50: (1, {'@': 317}), 19: (1, {'@': 317}), 51: (1, {'@': 317}), 38: (1, {'@': 317}), 52: (1, {'@': 317}), 53: (1, {'@': 317}), 39: (1, {'@': 317}), 40: (1, {'@': 317}), 41: (1, {'@': 317}), 42: (1, {'@': 317}), 55: (1, {'@': 317}), 43: (1, {'@': 317})}, 349: {48: (0, 410)}, 350: {4: (1, {'@': 355}), 5: (1, {'@': 355}), 0: (1, {'@': 355}), 19: (1, {'@': 355}), 11: (1, {'@': 355}), 22: (1, {'@': 355}), 32: (1, {'@': 355}), 31: (1, {'@': 355}), 54: (1, {'@': 355}), 44: (1, {'@': 355}), 48: (1, {'@': 355}), 33: (1, {'@': 355}), 34: (1, {'@': 355}), 45: (1, {'@': 355}), 46: (1, {'@': 355}), 35: (1, {'@': 355}), 36: (1, {'@': 355}), 37: (1, {'@': 355}), 47: (1, {'@': 355}), 49: (1, {'@': 355}), 50: (1, {'@': 355}), 51: (1, {'@': 355}), 38: (1, {'@': 355}), 52: (1, {'@': 355}), 53: (1, {'@': 355}), 39: (1, {'@': 355}), 40: (1, {'@': 355}), 41: (1, {'@': 355}), 42: (1, {'@': 355}), 55: (1, {'@': 355}), 43: (1, {'@': 355})}, 351: {4: (1, {'@': 258}), 5: (1, {'@': 258}), 6: (1, {'@': 258}), 7: (1, {'@': 258}), 8: (1, {'@': 258}), 9: (1, {'@': 258}), 10: (1, {'@': 258}), 3: (1, {'@': 258}), 11: (1, {'@': 258}), 12: (1, {'@': 258}), 13: (1, {'@': 258}), 14: (1, {'@': 258}), 15: (1, {'@': 258}), 2: (1, {'@': 258}), 16: (1, {'@': 258}), 17: (1, {'@': 258}), 0: (1, {'@': 258}), 18: (1, {'@': 258}), 19: (1, {'@': 258}), 20: (1, {'@': 258}), 21: (1, {'@': 258}), 22: (1, {'@': 258}), 23: (1, {'@': 258}), 24: (1, {'@': 258}), 25: (1, {'@': 258}), 26: (1, {'@': 258}), 27: (1, {'@': 258}), 28: (1, {'@': 258}), 29: (1, {'@': 258}), 30: (1, {'@': 258}), 31: (1, {'@': 258}), 32: (1, {'@': 258}), 54: (1, {'@': 258}), 44: (1, {'@': 258}), 33: (1, {'@': 258}), 34: (1, {'@': 258}), 35: (1, {'@': 258}), 36: (1, {'@': 258}), 37: (1, {'@': 258}), 38: (1, {'@': 258}), 39: (1, {'@': 258}), 40: (1, {'@': 258}), 41: (1, {'@': 258}), 42: (1, {'@': 258}), 43: (1, {'@': 258}), 45: (1, {'@': 258}), 46: (1, {'@': 258}), 47: (1, {'@': 258}), 49: (1, {'@': 258}), 50: (1, {'@': 258}), 51: (1, {'@': 258}), 52: (1, {'@': 258}), 53: (1, {'@': 258}), 55: (1, {'@': 258})}, 352: {174: (0, 159), 23: (0, 137), 8: (0, 335), 16: (0, 322), 21: (0, 303), 12: (0, 631)}, 353: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 93: (0, 425), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 354: {4: (1, {'@': 346}), 32: (1, {'@': 346}), 0: (1, {'@': 346}), 19: (1, {'@': 346}), 11: (1, {'@': 346}), 54: (1, {'@': 346}), 48: (1, {'@': 346}), 5: (1, {'@': 346})}, 355: {4: (1, {'@': 372}), 5: (1, {'@': 372}), 6: (1, {'@': 372}), 23: (1, {'@': 372}), 8: (1, {'@': 372}), 9: (1, {'@': 372}), 26: (1, {'@': 372}), 11: (1, {'@': 372}), 12: (1, {'@': 372}), 13: (1, {'@': 372}), 16: (1, {'@': 372}), 21: (1, {'@': 372}), 28: (1, {'@': 372}), 0: (1, {'@': 372}), 19: (1, {'@': 372}), 22: (1, {'@': 372}), 2: (1, {'@': 485}), 3: (1, {'@': 485}), 31: (1, {'@': 372}), 32: (1, {'@': 372}), 54: (1, {'@': 372}), 44: (1, {'@': 372}), 33: (1, {'@': 372}), 34: (1, {'@': 372}), 35: (1, {'@': 372}), 36: (1, {'@': 372}), 37: (1, {'@': 372}), 38: (1, {'@': 372}), 39: (1, {'@': 372}), 40: (1, {'@': 372}), 41: (1, {'@': 372}), 42: (1, {'@': 372}), 43: (1, {'@': 372}), 45: (1, {'@': 372}), 46: (1, {'@': 372}), 47: (1, {'@': 372}), 49: (1, {'@': 372}), 50: (1, {'@': 372}), 51: (1, {'@': 372}), 52: (1, {'@': 372}), 53: (1, {'@': 372}), 55: (1, {'@': 372})}, 356: {37: (0, 481), 36: (0, 276), 70: (0, 160), 46: (0, 534)}, 357: {2: (0, 684), 1: (0, 131), 3: (0, 595)}, 358: {4: (1, {'@': 134}), 5: (1, {'@': 134}), 6: (1, {'@': 134}), 7: (1, {'@': 134}), 8: (1, {'@': 134}), 9: (1, {'@': 134}), 10: (1, {'@': 134}), 3: (1, {'@': 134}), 11: (1, {'@': 134}), 12: (1, {'@': 134}), 13: (1, {'@': 134}), 14: (1, {'@': 134}), 15: (1, {'@': 134}), 2: (1, {'@': 134}), 16: (1, {'@': 134}), 17: (1, {'@': 134}), 0: (1, {'@': 134}), 18: (1, {'@': 134}), 19: (1, {'@': 134}), 20: (1, {'@': 134}), 21: (1, {'@': 134}), 22: (1, {'@': 134}), 23: (1, {'@': 134}), 24: (1, {'@': 134}), 25: (1, {'@': 134}), 26: (1, {'@': 134}), 27: (1, {'@': 134}), 28: (1, {'@': 134}), 29: (1, {'@': 134}), 30: (1, {'@': 134}), 31: (1, {'@': 134}), 32: (1, {'@': 134}), 33: (1, {'@': 134}), 34: (1, {'@': 134}), 35: (1, {'@': 134}), 36: (1, {'@': 134}), 37: (1, {'@': 134}), 38: (1, {'@': 134}), 39: (1, {'@': 134}), 40: (1, {'@': 134}), 41: (1, {'@': 134}), 42: (1, {'@': 134}), 43: (1, {'@': 134}), 44: (1, {'@': 134}), 45: (1, {'@': 134}), 46: (1, {'@': 134}), 47: (1, {'@': 134}), 48: (1, {'@': 134}), 49: (1, {'@': 134}), 50: (1, {'@': 134}), 51: (1, {'@': 134}), 52: (1, {'@': 134}), 53: (1, {'@': 134}), 54: (1, {'@': 134}), 55: (1, {'@': 134})}, 359: {4: (1, {'@': 374}), 5: (1, {'@': 374}), 6: (1, {'@': 374}), 23: (1, {'@': 374}), 8: (1, {'@': 374}), 9: (1, {'@': 374}), 26: (1, {'@': 374}), 11: (1, {'@': 374}), 12: (1, {'@': 374}), 13: (1, {'@': 374}), 22: (1, {'@': 374}), 16: (1, {'@': 374}), 28: (1, {'@': 374}), 0: (1, {'@': 374}), 19: (1, {'@': 374}), 21: (1, {'@': 374}), 31: (1, {'@': 374}), 32: (1, {'@': 374}), 54: (1, {'@': 374}), 44: (1, {'@': 374}), 33: (1, {'@': 374}), 34: (1, {'@': 374}), 35: (1, {'@': 374}), 36: (1, {'@': 374}), 37: (1, {'@': 374}), 38: (1, {'@': 374}), 39: (1, {'@': 374}), 40: (1, {'@': 374}), 41: (1, {'@': 374}), 42: (1, {'@': 374}), 43: (1, {'@': 374}), 45: (1, {'@': 374}), 46: (1, {'@': 374}), 47: (1, {'@': 374}), 49: (1, {'@': 374}), 50: (1, {'@': 374}), 51: (1, {'@': 374}), 52: (1, {'@': 374}), 53: (1, {'@': 374}), 55: (1, {'@': 374})}, 360: {33: (1, {'@': 541}), 34: (1, {'@': 541}), 35: (1, {'@': 541}), 36: (1, {'@': 541}), 37: (1, {'@': 541}), 38: (1, {'@': 541}), 39: (1, {'@': 541}), 40: (1, {'@': 541}), 41: (1, {'@': 541}), 42: (1, {'@': 541}), 43: (1, {'@': 541}), 45: (1, {'@': 541}), 46: (1, {'@': 541}), 47: (1, {'@': 541}), 49: (1, {'@': 541}), 50: (1, {'@': 541}), 51: (1, {'@': 541}), 52: (1, {'@': 541}), 53: (1, {'@': 541}), 55: (1, {'@': 541})}, 361: {0: (1, {'@': 387})}, 362: {0: (1, {'@': 113})}, 363: {23: (0, 137), 8: (0, 335), 16: (0, 322), 21: (0, 303), 12: (0, 631), 174: (0, 484), 33: (1, {'@': 283}), 34: (1, {'@': 283}), 4: (1, {'@': 283}), 6: (1, {'@': 283}), 45: (1, {'@': 283}), 5: (1, {'@': 283}), 9: (1, {'@': 283}), 46: (1, {'@': 283}), 35: (1, {'@': 283}), 11: (1, {'@': 283}), 13: (1, {'@': 283}), 36: (1, {'@': 283}), 37: (1, {'@': 283}), 47: (1, {'@': 283}), 49: (1, {'@': 283}), 50: (1, {'@': 283}), 19: (1, {'@': 283}), 51: (1, {'@': 283}), 38: (1, {'@': 283}), 52: (1, {'@': 283}), 53: (1, {'@': 283}), 39: (1, {'@': 283}), 40: (1, {'@': 283}), 41: (1, {'@': 283}), 26: (1, {'@': 283}), 42: (1, {'@': 283}), 55: (1, {'@': 283}), 43: (1, {'@': 283}), 28: (1, {'@': 283}), 31: (1, {'@': 283}), 0: (1, {'@': 283}), 22: (1, {'@': 283}), 54: (1, {'@': 283}), 32: (1, {'@': 283}), 44: (1, {'@': 283}), 48: (1, {'@': 283})}, 364: {4: (1, {'@': 361}), 32: (1, {'@': 361}), 0: (1, {'@': 361}), 19: (1, {'@': 361}), 11: (1, {'@': 361}), 54: (1, {'@': 361}), 48: (1, {'@': 361}), 5: (1, {'@': 361})}, 365: {4: (1, {'@': 191}), 5: (1, {'@': 191}), 6: (1, {'@': 191}), 7: (1, {'@': 191}), 8: (1, {'@': 191}), 9: (1, {'@': 191}), 10: (1, {'@': 191}), 3: (1, {'@': 191}), 11: (1, {'@': 191}), 12: (1, {'@': 191}), 13: (1, {'@': 191}), 14: (1, {'@': 191}), 15: (1, {'@': 191}), 2: (1, {'@': 191}), 16: (1, {'@': 191}), 17: (1, {'@': 191}), 0: (1, {'@': 191}), 18: (1, {'@': 191}), 19: (1, {'@': 191}), 20: (1, {'@': 191}), 21: (1, {'@': 191}), 22: (1, {'@': 191}), 23: (1, {'@': 191}), 24: (1, {'@': 191}), 25: (1, {'@': 191}), 26: (1, {'@': 191}), 27: (1, {'@': 191}), 28: (1, {'@': 191}), 29: (1, {'@': 191}), 30: (1, {'@': 191}), 31: (1, {'@': 191}), 32: (1, {'@': 191}), 33: (1, {'@': 191}), 34: (1, {'@': 191}), 35: (1, {'@': 191}), 36: (1, {'@': 191}), 37: (1, {'@': 191}), 38: (1, {'@': 191}), 39: (1, {'@': 191}), 40: (1, {'@': 191}), 41: (1, {'@': 191}), 42: (1, {'@': 191}), 43: (1, {'@': 191}), 44: (1, {'@': 191}), 45: (1, {'@': 191}), 46: (1, {'@': 191}), 47: (1, {'@': 191}), 48: (1, {'@': 191}), 49: (1, {'@': 191}), 50: (1, {'@': 191}), 51: (1, {'@': 191}), 52: (1, {'@': 191}), 53: (1, {'@': 191}), 54: (1, {'@': 191}), 55: (1, {'@': 191})}, 366: {33: (1, {'@': 368}), 34: (1, {'@': 368}), 4: (1, {'@': 368}), 45: (1, {'@': 368}), 5: (1, {'@': 368}), 46: (1, {'@': 368}), 35: (1, {'@': 368}), 31: (1, {'@': 368}), 11: (1, {'@': 368}), 36: (1, {'@': 368}), 37: (1, {'@': 368}), 47: (1, {'@': 368}), 48: (1, {'@': 368}), 49: (1, {'@': 368}), 50: (1, {'@': 368}), 0: (1, {'@': 368}), 19: (1, {'@': 368}), 22: (1, {'@': 368}), 51: (1, {'@': 368}), 38: (1, {'@': 368}), 52: (1, {'@': 368}), 53: (1, {'@': 368}), 39: (1, {'@': 368}), 40: (1, {'@': 368}), 41: (1, {'@': 368}), 54: (1, {'@': 368}), 42: (1, {'@': 368}), 32: (1, {'@': 368}), 43: (1, {'@': 368}), 55: (1, {'@': 368}), 44: (1, {'@': 368})}, 367: {4: (1, {'@': 196}), 5: (1, {'@': 196}), 6: (1, {'@': 196}), 7: (1, {'@': 196}), 8: (1, {'@': 196}), 9: (1, {'@': 196}), 10: (1, {'@': 196}), 3: (1, {'@': 196}), 11: (1, {'@': 196}), 12: (1, {'@': 196}), 13: (1, {'@': 196}), 14: (1, {'@': 196}), 15: (1, {'@': 196}), 2: (1, {'@': 196}), 16: (1, {'@': 196}), 17: (1, {'@': 196}), 0: (1, {'@': 196}), 18: (1, {'@': 196}), 19: (1, {'@': 196}), 20: (1, {'@': 196}), 21: (1, {'@': 196}), 22: (1, {'@': 196}), 23: (1, {'@': 196}), 24: (1, {'@': 196}), 25: (1, {'@': 196}), 26: (1, {'@': 196}), 27: (1, {'@': 196}), 28: (1, {'@': 196}), 29: (1, {'@': 196}), 30: (1, {'@': 196}), 31: (1, {'@': 196}), 32: (1, {'@': 196}), 33: (1, {'@': 196}), 34: (1, {'@': 196}), 35: (1, {'@': 196}), 36: (1, {'@': 196}), 37: (1, {'@': 196}), 38: (1, {'@': 196}), 39: (1, {'@': 196}), 40: (1, {'@': 196}), 41: (1, {'@': 196}), 42: (1, {'@': 196}), 43: (1, {'@': 196}), 44: (1, {'@': 196}), 45: (1, {'@': 196}), 46: (1, {'@': 196}), 47: (1, {'@': 196}), 48: (1, {'@': 196}), 49: (1, {'@': 196}), 50: (1, {'@': 196}), 51: (1, {'@': 196}), 52: (1, {'@': 196}), 53: (1, {'@': 196}), 54: (1, {'@': 196}), 55: (1, {'@': 196})}, 368: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 105: (0, 166), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 122), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 32: (0, 240), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 104: (0, 9), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 58: (0, 183), 34: (0, 483), 91: (0, 497), 37: (0, 481), 106: (0, 195), 107: (0, 196), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 369: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 93: (0, 613), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 370: {33: (1, {'@': 77}), 34: (1, {'@': 77}), 45: (1, {'@': 77}), 46: (1, {'@': 77}), 35: (1, {'@': 77}), 36: (1, {'@': 77}), 37: (1, {'@': 77}), 47: (1, {'@': 77}), 49: (1, {'@': 77}), 50: (1, {'@': 77}), 51: (1, {'@': 77}), 38: (1, {'@': 77}), 52: (1, {'@': 77}), 53: (1, {'@': 77}), 39: (1, {'@': 77}), 40: (1, {'@': 77}), 41: (1, {'@': 77}), 42: (1, {'@': 77}), 55: (1, {'@': 77}), 43: (1, {'@': 77})}, 371: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 79: (0, 634), 78: (0, 666), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 32: (0, 493), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 58: (0, 472), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 372: {37: (0, 481), 36: (0, 276), 70: (0, 548), 46: (0, 534)}, 373: {37: (0, 481), 36: (0, 276), 70: (0, 351), 46: (0, 534)}, 374: {4: (1, {'@': 415}), 5: (1, {'@': 415}), 0: (1, {'@': 415}), 19: (1, {'@': 415}), 11: (1, {'@': 415}), 22: (1, {'@': 415}), 32: (1, {'@': 415}), 31: (1, {'@': 415}), 44: (1, {'@': 415}), 54: (1, {'@': 415}), 33: (1, {'@': 415}), 34: (1, {'@': 415}), 45: (1, {'@': 415}), 46: (1, {'@': 415}), 35: (1, {'@': 415}), 36: (1, {'@': 415}), 37: (1, {'@': 415}), 47: (1, {'@': 415}), 49: (1, {'@': 415}), 50: (1, {'@': 415}), 51: (1, {'@': 415}), 38: (1, {'@': 415}), 52: (1, {'@': 415}), 53: (1, {'@': 415}), 39: (1, {'@': 415}), 40: (1, {'@': 415}), 41: (1, {'@': 415}), 42: (1, {'@': 415}), 55: (1, {'@': 415}), 43: (1, {'@': 415})}, 375: {178: (0, 68), 33: (1, {'@': 141}), 34: (1, {'@': 141}), 35: (1, {'@': 141}), 12: (1, {'@': 141}), 36: (1, {'@': 141}), 14: (1, {'@': 141}), 37: (1, {'@': 141}), 18: (1, {'@': 141}), 21: (1, {'@': 141}), 38: (1, {'@': 141}), 23: (1, {'@': 141}), 24: (1, {'@': 141}), 25: (1, {'@': 141}), 39: (1, {'@': 141}), 40: (1, {'@': 141}), 41: (1, {'@': 141}), 26: (1, {'@': 141}), 42: (1, {'@': 141}), 43: (1, {'@': 141}), 4: (1, {'@': 141}), 45: (1, {'@': 141}), 5: (1, {'@': 141}), 6: (1, {'@': 141}), 7: (1, {'@': 141}), 8: (1, {'@': 141}), 9: (1, {'@': 141}), 3: (1, {'@': 141}), 10: (1, {'@': 141}), 46: (1, {'@': 141}), 11: (1, {'@': 141}), 13: (1, {'@': 141}), 2: (1, {'@': 141}), 15: (1, {'@': 141}), 47: (1, {'@': 141}), 16: (1, {'@': 141}), 49: (1, {'@': 141}), 17: (1, {'@': 141}), 50: (1, {'@': 141}), 19: (1, {'@': 141}), 20: (1, {'@': 141}), 51: (1, {'@': 141}), 52: (1, {'@': 141}), 53: (1, {'@': 141}), 27: (1, {'@': 141}), 55: (1, {'@': 141}), 28: (1, {'@': 141}), 29: (1, {'@': 141}), 30: (1, {'@': 141})}, 376: {31: (0, 371), 32: (0, 319)}, 377: {4: (1, {'@': 320}), 33: (1, {'@': 320}), 5: (1, {'@': 320}), 34: (1, {'@': 320}), 45: (1, {'@': 320}), 46: (1, {'@': 320}), 35: (1, {'@': 320}), 11: (1, {'@': 320}), 36: (1, {'@': 320}), 37: (1, {'@': 320}), 47: (1, {'@': 320}), 49: (1, {'@': 320}), 50: (1, {'@': 320}), 19: (1, {'@': 320}), 51: (1, {'@': 320}), 38: (1, {'@': 320}), 52: (1, {'@': 320}), 53: (1, {'@': 320}), 39: (1, {'@': 320}), 40: (1, {'@': 320}), 41: (1, {'@': 320}), 42: (1, {'@': 320}), 55: (1, {'@': 320}), 43: (1, {'@': 320})}, 378: {4: (0, 43), 19: (0, 372), 11: (0, 643), 33: (1, {'@': 74}), 34: (1, {'@': 74}), 45: (1, {'@': 74}), 46: (1, {'@': 74}), 35: (1, {'@': 74}), 36: (1, {'@': 74}), 37: (1, {'@': 74}), 47: (1, {'@': 74}), 49: (1, {'@': 74}), 50: (1, {'@': 74}), 51: (1, {'@': 74}), 38: (1, {'@': 74}), 52: (1, {'@': 74}), 53: (1, {'@': 74}), 39: (1, {'@': 74}), 40: (1, {'@': 74}), 41: (1, {'@': 74}), 42: (1, {'@': 74}), 55: (1, {'@': 74}), 43: (1, {'@': 74}), 5: (1, {'@': 218})}, 379: {37: (0, 481), 45: (0, 504), 70: (0, 27), 88: (0, 37), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 46: (0, 534), 219: (0, 237), 49: (0, 669), 47: (0, 675), 41: (0, 458), 218: (0, 61), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483), 220: (0, 44)}, 380: {32: (0, 546)}, 381: {33: (1, {'@': 326}), 34: (1, {'@': 326}), 45: (1, {'@': 326}), 46: (1, {'@': 326}), 35: (1, {'@': 326}), 36: (1, {'@': 326}), 37: (1, {'@': 326}), 47: (1, {'@': 326}), 49: (1, {'@': 326}), 50: (1, {'@': 326}), 51: (1, {'@': 326}), 38: (1, {'@': 326}), 52: (1, {'@': 326}), 53: (1, {'@': 326}), 39: (1, {'@': 326}), 40: (1, {'@': 326}), 41: (1, {'@': 326}), 42: (1, {'@': 326}), 55: (1, {'@': 326}), 43: (1, {'@': 326})}, 382: {0: (0, 275)}, 383: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 93: (0, 397), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 384: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 104: (0, 179), 64: (0, 526), 65: (0, 466), 105: (0, 166), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 32: (0, 162), 69: (0, 688), 70: (0, 122), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 58: (0, 183), 34: (0, 483), 91: (0, 497), 37: (0, 481), 106: (0, 195), 107: (0, 196), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 385: {138: (0, 80), 139: (0, 596), 140: (0, 693), 40: (0, 437), 141: (0, 590), 67: (0, 630), 142: (0, 615), 143: (0, 637), 45: (0, 504), 149: (0, 712), 68: (0, 676), 50: (0, 600), 144: (0, 273), 70: (0, 652), 71: (0, 661), 145: (0, 706), 49: (0, 669), 47: (0, 675), 146: (0, 462), 53: (0, 618), 82: (0, 593), 147: (0, 249), 148: (0, 295), 85: (0, 392), 150: (0, 594), 26: (0, 604), 33: (0, 283), 76: (0, 35), 151: (0, 315), 36: (0, 276), 152: (0, 457), 153: (0, 685), 154: (0, 144), 34: (0, 483), 37: (0, 481), 43: (0, 519), 155: (0, 440), 156: (0, 653), 46: (0, 534), 41: (0, 458), 88: (0, 311), 51: (0, 540), 157: (0, 536), 99: (0, 531), 79: (0, 451), 101: (0, 256), 35: (0, 365), 102: (0, 660)}, 386: {4: (1, {'@': 311}), 33: (1, {'@': 311}), 34: (1, {'@': 311}), 5: (1, {'@': 311}), 45: (1, {'@': 311}), 46: (1, {'@': 311}), 35: (1, {'@': 311}), 11: (1, {'@': 311}), 36: (1, {'@': 311}), 37: (1, {'@': 311}), 47: (1, {'@': 311}), 49: (1, {'@': 311}), 50: (1, {'@': 311}), 19: (1, {'@': 311}), 51: (1, {'@': 311}), 38: (1, {'@': 311}), 52: (1, {'@': 311}), 53: (1, {'@': 311}), 39: (1, {'@': 311}), 40: (1, {'@': 311}), 41: (1, {'@': 311}), 42: (1, {'@': 311}), 55: (1, {'@': 311}), 43: (1, {'@': 311})}, 387: {33: (1, {'@': 530}), 34: (1, {'@': 530}), 35: (1, {'@': 530}), 12: (1, {'@': 530}), 36: (1, {'@': 530}), 37: (1, {'@': 530}), 21: (1, {'@': 530}), 38: (1, {'@': 530}), 23: (1, {'@': 530}), 39: (1, {'@': 530}), 40: (1, {'@': 530}), 41: (1, {'@': 530}), 26: (1, {'@': 530}), 42: (1, {'@': 530}), 32: (1, {'@': 530}), 43: (1, {'@': 530}), 44: (1, {'@': 530}), 4: (1, {'@': 530}), 45: (1, {'@': 530}), 6: (1, {'@': 530}), 8: (1, {'@': 530}), 3: (1, {'@': 530}), 9: (1, {'@': 530}), 46: (1, {'@': 530}), 31: (1, {'@': 530}), 11: (1, {'@': 530}), 2: (1, {'@': 530}), 13: (1, {'@': 530}), 47: (1, {'@': 530}), 49: (1, {'@': 530}), 50: (1, {'@': 530}), 16: (1, {'@': 530}), 0: (1, {'@': 530}), 19: (1, {'@': 530}), 22: (1, {'@': 530}), 51: (1, {'@': 530}), 52: (1, {'@': 530}), 53: (1, {'@': 530}), 54: (1, {'@': 530}), 55: (1, {'@': 530}), 28: (1, {'@': 530})}, 388: {1: (0, 34), 2: (0, 684), 3: (0, 595), 4: (1, {'@': 373}), 5: (1, {'@': 373}), 6: (1, {'@': 373}), 23: (1, {'@': 373}), 8: (1, {'@': 373}), 9: (1, {'@': 373}), 26: (1, {'@': 373}), 11: (1, {'@': 373}), 12: (1, {'@': 373}), 13: (1, {'@': 373}), 16: (1, {'@': 373}), 21: (1, {'@': 373}), 28: (1, {'@': 373}), 0: (1, {'@': 373}), 19: (1, {'@': 373}), 22: (1, {'@': 373}), 31: (1, {'@': 373}), 32: (1, {'@': 373}), 54: (1, {'@': 373}), 44: (1, {'@': 373}), 33: (1, {'@': 373}), 34: (1, {'@': 373}), 35: (1, {'@': 373}), 36: (1, {'@': 373}), 37: (1, {'@': 373}), 38: (1, {'@': 373}), 39: (1, {'@': 373}), 40: (1, {'@': 373}), 41: (1, {'@': 373}), 42: (1, {'@': 373}), 43: (1, {'@': 373}), 45: (1, {'@': 373}), 46: (1, {'@': 373}), 47: (1, {'@': 373}), 49: (1, {'@': 373}), 50: (1, {'@': 373}), 51: (1, {'@': 373}), 52: (1, {'@': 373}), 53: (1, {'@': 373}), 55: (1, {'@': 373})}, 389: {4: (1, {'@': 349}), 32: (1, {'@': 349}), 0: (1, {'@': 349}), 19: (1, {'@': 349}), 11: (1, {'@': 349}), 54: (1, {'@': 349}), 48: (1, {'@': 349}), 5: (1, {'@': 349})}, 390: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 221: (0, 555), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 222: (0, 291), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 58: (0, 510), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 35: (0, 365), 101: (0, 256), 102: (0, 660), 103: (0, 692), 38: (1, {'@': 70})}, 391: {33: (1, {'@': 226}), 34: (1, {'@': 226}), 35: (1, {'@': 226}), 36: (1, {'@': 226}), 37: (1, {'@': 226}), 38: (1, {'@': 226}), 39: (1, {'@': 226}), 40: (1, {'@': 226}), 41: (1, {'@': 226}), 42: (1, {'@': 226}), 43: (1, {'@': 226}), 45: (1, {'@': 226}), 46: (1, {'@': 226}), 47: (1, {'@': 226}), 49: (1, {'@': 226}), 50: (1, {'@': 226}), 51: (1, {'@': 226}), 52: (1, {'@': 226}), 53: (1, {'@': 226}), 55: (1, {'@': 226})}, 392: {4: (1, {'@': 97}), 5: (1, {'@': 97}), 0: (1, {'@': 97}), 19: (1, {'@': 97}), 11: (1, {'@': 97}), 22: (1, {'@': 97}), 32: (1, {'@': 97}), 31: (1, {'@': 97}), 54: (1, {'@': 97}), 44: (1, {'@': 97}), 48: (1, {'@': 97}), 33: (1, {'@': 97}), 34: (1, {'@': 97}), 45: (1, {'@': 97}), 46: (1, {'@': 97}), 35: (1, {'@': 97}), 36: (1, {'@': 97}), 37: (1, {'@': 97}), 47: (1, {'@': 97}), 49: (1, {'@': 97}), 50: (1, {'@': 97}), 51: (1, {'@': 97}), 38: (1, {'@': 97}), 52: (1, {'@': 97}), 53: (1, {'@': 97}), 39: (1, {'@': 97}), 40: (1, {'@': 97}), 41: (1, {'@': 97}), 42: (1, {'@': 97}), 55: (1, {'@': 97}), 43: (1, {'@': 97})}, 393: {0: (1, {'@': 388})}, 394: {33: (1, {'@': 364}), 34: (1, {'@': 364}), 4: (1, {'@': 364}), 45: (1, {'@': 364}), 5: (1, {'@': 364}), 46: (1, {'@': 364}), 35: (1, {'@': 364}), 31: (1, {'@': 364}), 11: (1, {'@': 364}), 36: (1, {'@': 364}), 37: (1, {'@': 364}), 47: (1, {'@': 364}), 48: (1, {'@': 364}), 49: (1, {'@': 364}), 50: (1, {'@': 364}), 0: (1, {'@': 364}), 19: (1, {'@': 364}), 22: (1, {'@': 364}), 51: (1, {'@': 364}), 38: (1, {'@': 364}), 52: (1, {'@': 364}), 53: (1, {'@': 364}), 39: (1, {'@': 364}), 40: (1, {'@': 364}), 41: (1, {'@': 364}), 54: (1, {'@': 364}), 42: (1, {'@': 364}), 32: (1, {'@': 364}), 43: (1, {'@': 364}), 55: (1, {'@': 364}), 44: (1, {'@': 364})}, 395: {175: (0, 145), 179: (0, 568), 13: (0, 334), 28: (0, 105), 6: (0, 100), 9: (0, 139), 26: (0, 6), 4: (1, {'@': 407}), 5: (1, {'@': 407}), 0: (1, {'@': 407}), 19: (1, {'@': 407}), 11: (1, {'@': 407}), 22: (1, {'@': 407}), 32: (1, {'@': 407}), 31: (1, {'@': 407}), 44: (1, {'@': 407}), 54: (1, {'@': 407}), 33: (1, {'@': 407}), 34: (1, {'@': 407}), 45: (1, {'@': 407}), 46: (1, {'@': 407}), 35: (1, {'@': 407}), 36: (1, {'@': 407}), 37: (1, {'@': 407}), 47: (1, {'@': 407}), 49: (1, {'@': 407}), 50: (1, {'@': 407}), 51: (1, {'@': 407}), 38: (1, {'@': 407}), 52: (1, {'@': 407}), 53: (1, {'@': 407}), 39: (1, {'@': 407}), 40: (1, {'@': 407}), 41: (1, {'@': 407}), 42: (1, {'@': 407}), 55: (1, {'@': 407}), 43: (1, {'@': 407})}, 396: {4: (1, {'@': 455}), 5: (1, {'@': 455}), 23: (1, {'@': 455}), 8: (1, {'@': 455}), 3: (1, {'@': 455}), 31: (1, {'@': 455}), 11: (1, {'@': 455}), 12: (1, {'@': 455}), 2: (1, {'@': 455}), 32: (1, {'@': 455}), 16: (1, {'@': 455}), 44: (1, {'@': 455}), 19: (1, {'@': 455}), 21: (1, {'@': 455}), 33: (1, {'@': 455}), 34: (1, {'@': 455}), 35: (1, {'@': 455}), 36: (1, {'@': 455}), 37: (1, {'@': 455}), 38: (1, {'@': 455}), 39: (1, {'@': 455}), 40: (1, {'@': 455}), 41: (1, {'@': 455}), 42: (1, {'@': 455}), 43: (1, {'@': 455}), 45: (1, {'@': 455}), 46: (1, {'@': 455}), 47: (1, {'@': 455}), 49: (1, {'@': 455}), 50: (1, {'@': 455}), 0: (1, {'@': 455}), 22: (1, {'@': 455}), 51: (1, {'@': 455}), 52: (1, {'@': 455}), 53: (1, {'@': 455}), 54: (1, {'@': 455}), 55: (1, {'@': 455}), 48: (1, {'@': 455})}, 397: {33: (1, {'@': 229}), 34: (1, {'@': 229}), 35: (1, {'@': 229}), 36: (1, {'@': 229}), 37: (1, {'@': 229}), 38: (1, {'@': 229}), 39: (1, {'@': 229}), 40: (1, {'@': 229}), 41: (1, {'@': 229}), 42: (1, {'@': 229}), 43: (1, {'@': 229}), 45: (1, {'@': 229}), 46: (1, {'@': 229}), 47: (1, {'@': 229}), 49: (1, {'@': 229}), 50: (1, {'@': 229}), 51: (1, {'@': 229}), 52: (1, {'@': 229}), 53: (1, {'@': 229}), 55: (1, {'@': 229})}, 398: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 79: (0, 634), 78: (0, 666), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 58: (0, 339), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 54: (1, {'@': 299}), 0: (1, {'@': 299})}, 399: {23: (0, 137), 8: (0, 335), 16: (0, 322), 174: (0, 647), 21: (0, 303), 12: (0, 631)}, 400: {39: (0, 261), 108: (0, 370), 109: (0, 407), 40: (0, 437), 110: (0, 378), 112: (0, 360), 70: (0, 375), 111: (0, 294), 113: (0, 715), 114: (0, 704), 115: (0, 150), 116: (0, 235), 117: (0, 152), 66: (0, 528), 118: (0, 142), 45: (0, 504), 119: (0, 217), 120: (0, 11), 73: (0, 36), 50: (0, 600), 121: (0, 165), 122: (0, 19), 123: (0, 25), 124: (0, 32), 71: (0, 661), 55: (0, 708), 42: (0, 606), 49: (0, 669), 47: (0, 675), 80: (0, 628), 53: (0, 618), 125: (0, 15), 82: (0, 593), 126: (0, 62), 84: (0, 621), 127: (0, 38), 33: (0, 283), 128: (0, 24), 213: (0, 10), 88: (0, 419), 36: (0, 276), 129: (0, 109), 130: (0, 13), 131: (0, 23), 132: (0, 124), 34: (0, 483), 133: (0, 66), 37: (0, 481), 134: (0, 115), 135: (0, 111), 43: (0, 519), 223: (0, 101), 46: (0, 534), 41: (0, 458), 136: (0, 116), 137: (0, 117), 51: (0, 540), 52: (0, 544), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660)}, 401: {4: (1, {'@': 276}), 5: (1, {'@': 276}), 6: (1, {'@': 276}), 9: (1, {'@': 276}), 26: (1, {'@': 276}), 11: (1, {'@': 276}), 13: (1, {'@': 276}), 28: (1, {'@': 276}), 0: (1, {'@': 276}), 19: (1, {'@': 276}), 22: (1, {'@': 276}), 23: (1, {'@': 443}), 8: (1, {'@': 443}), 12: (1, {'@': 443}), 16: (1, {'@': 443}), 21: (1, {'@': 443}), 31: (1, {'@': 276}), 32: (1, {'@': 276}), 54: (1, {'@': 276}), 44: (1, {'@': 276}), 33: (1, {'@': 276}), 34: (1, {'@': 276}), 45: (1, {'@': 276}), 46: (1, {'@': 276}), 35: (1, {'@': 276}), 36: (1, {'@': 276}), 37: (1, {'@': 276}), 47: (1, {'@': 276}), 49: (1, {'@': 276}), 50: (1, {'@': 276}), 51: (1, {'@': 276}), 38: (1, {'@': 276}), 52: (1, {'@': 276}), 53: (1, {'@': 276}), 39: (1, {'@': 276}), 40: (1, {'@': 276}), 41: (1, {'@': 276}), 42: (1, {'@': 276}), 55: (1, {'@': 276}), 43: (1, {'@': 276})}, 402: {32: (0, 330)}, 403: {4: (1, {'@': 358}), 5: (1, {'@': 358}), 0: (1, {'@': 358}), 19: (1, {'@': 358}), 11: (1, {'@': 358}), 22: (1, {'@': 358}), 32: (1, {'@': 358}), 31: (1, {'@': 358}), 54: (1, {'@': 358}), 44: (1, {'@': 358}), 48: (1, {'@': 358}), 33: (1, {'@': 358}), 34: (1, {'@': 358}), 45: (1, {'@': 358}), 46: (1, {'@': 358}), 35: (1, {'@': 358}), 36: (1, {'@': 358}), 37: (1, {'@': 358}), 47: (1, {'@': 358}), 49: (1, {'@': 358}), 50: (1, {'@': 358}), 51: (1, {'@': 358}), 38: (1, {'@': 358}), 52: (1, {'@': 358}), 53: (1, {'@': 358}), 39: (1, {'@': 358}), 40: (1, {'@': 358}), 41: (1, {'@': 358}), 42: (1, {'@': 358}), 55: (1, {'@': 358}), 43: (1, {'@': 358})}, 404: {2: (1, {'@': 488}), 3: (1, {'@': 488}), 30: (1, {'@': 268}), 24: (1, {'@': 268}), 7: (1, {'@': 268}), 25: (1, {'@': 268}), 10: (1, {'@': 268}), 27: (1, {'@': 268}), 14: (1, {'@': 268}), 15: (1, {'@': 268}), 17: (1, {'@': 268}), 29: (1, {'@': 268}), 18: (1, {'@': 268}), 20: (1, {'@': 268}), 4: (1, {'@': 444}), 5: (1, {'@': 444}), 6: (1, {'@': 444}), 8: (1, {'@': 444}), 9: (1, {'@': 444}), 11: (1, {'@': 444}), 12: (1, {'@': 444}), 13: (1, {'@': 444}), 48: (1, {'@': 444}), 16: (1, {'@': 444}), 0: (1, {'@': 444}), 19: (1, {'@': 444}), 21: (1, {'@': 444}), 23: (1, {'@': 444}), 26: (1, {'@': 444}), 54: (1, {'@': 444}), 32: (1, {'@': 444}), 28: (1, {'@': 444}), 33: (1, {'@': 444}), 35: (1, {'@': 444}), 37: (1, {'@': 444}), 39: (1, {'@': 444}), 41: (1, {'@': 444}), 42: (1, {'@': 444}), 31: (1, {'@': 444}), 22: (1, {'@': 444}), 51: (1, {'@': 444}), 55: (1, {'@': 444}), 34: (1, {'@': 444}), 36: (1, {'@': 444}), 38: (1, {'@': 444}), 40: (1, {'@': 444}), 43: (1, {'@': 444}), 44: (1, {'@': 444}), 45: (1, {'@': 444}), 46: (1, {'@': 444}), 47: (1, {'@': 444}), 49: (1, {'@': 444}), 50: (1, {'@': 444}), 52: (1, {'@': 444}), 53: (1, {'@': 444})}, 405: {23: (0, 137), 8: (0, 335), 16: (0, 322), 21: (0, 303), 12: (0, 631), 174: (0, 474), 4: (1, {'@': 277}), 5: (1, {'@': 277}), 6: (1, {'@': 277}), 9: (1, {'@': 277}), 26: (1, {'@': 277}), 11: (1, {'@': 277}), 13: (1, {'@': 277}), 28: (1, {'@': 277}), 0: (1, {'@': 277}), 19: (1, {'@': 277}), 22: (1, {'@': 277}), 31: (1, {'@': 277}), 32: (1, {'@': 277}), 54: (1, {'@': 277}), 44: (1, {'@': 277}), 33: (1, {'@': 277}), 34: (1, {'@': 277}), 45: (1, {'@': 277}), 46: (1, {'@': 277}), 35: (1, {'@': 277}), 36: (1, {'@': 277}), 37: (1, {'@': 277}), 47: (1, {'@': 277}), 49: (1, {'@': 277}), 50: (1, {'@': 277}), 51: (1, {'@': 277}), 38: (1, {'@': 277}), 52: (1, {'@': 277}), 53: (1, {'@': 277}), 39: (1, {'@': 277}), 40: (1, {'@': 277}), 41: (1, {'@': 277}), 42: (1, {'@': 277}), 55: (1, {'@': 277}), 43: (1, {'@': 277})}, 406: {33: (1, {'@': 542}), 34: (1, {'@': 542}), 35: (1, {'@': 542}), 36: (1, {'@': 542}), 37: (1, {'@': 542}), 38: (1, {'@': 542}), 39: (1, {'@': 542}), 40: (1, {'@': 542}), 41: (1, {'@': 542}), 42: (1, {'@': 542}), 43: (1, {'@': 542}), 45: (1, {'@': 542}), 46: (1, {'@': 542}), 47: (1, {'@': 542}), 49: (1, {'@': 542}), 50: (1, {'@': 542}), 51: (1, {'@': 542}), 52: (1, {'@': 542}), 53: (1, {'@': 542}), 55: (1, {'@': 542})}, 407: {4: (1, {'@': 466}), 33: (1, {'@': 466}), 34: (1, {'@': 466}), 6: (1, {'@': 466}), 5: (1, {'@': 466}), 45: (1, {'@': 466}), 8: (1, {'@': 466}), 9: (1, {'@': 466}), 46: (1, {'@': 466}), 35: (1, {'@': 466}), 11: (1, {'@': 466}), 12: (1, {'@': 466}), 13: (1, {'@': 466}), 36: (1, {'@': 466}), 37: (1, {'@': 466}), 47: (1, {'@': 466}), 49: (1, {'@': 466}), 50: (1, {'@': 466}), 16: (1, {'@': 466}), 19: (1, {'@': 466}), 21: (1, {'@': 466}), 51: (1, {'@': 466}), 38: (1, {'@': 466}), 52: (1, {'@': 466}), 23: (1, {'@': 466}), 53: (1, {'@': 466}), 39: (1, {'@': 466}), 40: (1, {'@': 466}), 41: (1, {'@': 466}), 26: (1, {'@': 466}), 42: (1, {'@': 466}), 55: (1, {'@': 466}), 43: (1, {'@': 466}), 28: (1, {'@': 466}), 2: (1, {'@': 526}), 3: (1, {'@': 526})}, 408: {37: (0, 481), 160: (0, 304), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 164: (0, 569), 161: (0, 201), 40: (0, 437), 43: (0, 519), 162: (0, 69), 163: (0, 198), 71: (0, 661), 11: (0, 522), 33: (0, 283), 77: (0, 571), 46: (0, 534), 165: (0, 20), 42: (0, 606), 55: (0, 708), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 166: (0, 76), 41: (0, 458), 80: (0, 628), 88: (0, 419), 66: (0, 528), 97: (0, 525), 167: (0, 206), 168: (0, 158), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 84: (0, 621), 52: (0, 544), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483), 201: (0, 690)}, 409: {4: (1, {'@': 430}), 32: (1, {'@': 430}), 0: (1, {'@': 430}), 19: (1, {'@': 430}), 11: (1, {'@': 430}), 54: (1, {'@': 430}), 48: (1, {'@': 430}), 5: (1, {'@': 430}), 30: (1, {'@': 490}), 24: (1, {'@': 490}), 7: (1, {'@': 490}), 25: (1, {'@': 490}), 10: (1, {'@': 490}), 27: (1, {'@': 490}), 14: (1, {'@': 490}), 15: (1, {'@': 490}), 17: (1, {'@': 490}), 29: (1, {'@': 490}), 18: (1, {'@': 490}), 20: (1, {'@': 490}), 23: (1, {'@': 456}), 8: (1, {'@': 456}), 12: (1, {'@': 456}), 16: (1, {'@': 456}), 21: (1, {'@': 456}), 2: (1, {'@': 493}), 3: (1, {'@': 493})}, 410: {37: (0, 481), 224: (0, 1), 45: (0, 504), 70: (0, 652), 225: (0, 603), 88: (0, 573), 40: (0, 437), 205: (0, 434), 226: (0, 112), 43: (0, 519), 71: (0, 661), 227: (0, 77), 33: (0, 283), 228: (0, 94), 229: (0, 88), 46: (0, 534), 49: (0, 669), 47: (0, 675), 41: (0, 458), 230: (0, 22), 206: (0, 81), 34: (0, 483), 53: (0, 618), 231: (0, 104), 232: (0, 46), 51: (0, 540), 233: (0, 487), 82: (0, 593), 36: (0, 276), 99: (0, 531), 234: (0, 70), 67: (0, 60), 101: (0, 256), 35: (0, 365), 102: (0, 660), 235: (0, 243), 50: (0, 600)}, 411: {22: (0, 587), 0: (1, {'@': 112})}, 412: {6: (1, {'@': 384}), 9: (1, {'@': 384}), 26: (1, {'@': 384}), 13: (1, {'@': 384}), 28: (1, {'@': 384}), 4: (1, {'@': 287}), 5: (1, {'@': 287}), 0: (1, {'@': 287}), 19: (1, {'@': 287}), 11: (1, {'@': 287}), 22: (1, {'@': 287}), 32: (1, {'@': 287}), 31: (1, {'@': 287}), 44: (1, {'@': 287}), 54: (1, {'@': 287}), 2: (1, {'@': 488}), 3: (1, {'@': 488}), 30: (1, {'@': 268}), 24: (1, {'@': 268}), 7: (1, {'@': 268}), 25: (1, {'@': 268}), 10: (1, {'@': 268}), 27: (1, {'@': 268}), 14: (1, {'@': 268}), 15: (1, {'@': 268}), 17: (1, {'@': 268}), 29: (1, {'@': 268}), 18: (1, {'@': 268}), 20: (1, {'@': 268}), 23: (1, {'@': 444}), 8: (1, {'@': 444}), 12: (1, {'@': 444}), 16: (1, {'@': 444}), 21: (1, {'@': 444}), 33: (1, {'@': 287}), 34: (1, {'@': 287}), 45: (1, {'@': 287}), 46: (1, {'@': 287}), 35: (1, {'@': 287}), 36: (1, {'@': 287}), 37: (1, {'@': 287}), 47: (1, {'@': 287}), 49: (1, {'@': 287}), 50: (1, {'@': 287}), 51: (1, {'@': 287}), 38: (1, {'@': 287}), 52: (1, {'@': 287}), 53: (1, {'@': 287}), 39: (1, {'@': 287}), 40: (1, {'@': 287}), 41: (1, {'@': 287}), 42: (1, {'@': 287}), 55: (1, {'@': 287}), 43: (1, {'@': 287})}, 413: {33: (1, {'@': 366}), 34: (1, {'@': 366}), 4: (1, {'@': 366}), 45: (1, {'@': 366}), 5: (1, {'@': 366}), 46: (1, {'@': 366}), 35: (1, {'@': 366}), 31: (1, {'@': 366}), 11: (1, {'@': 366}), 36: (1, {'@': 366}), 37: (1, {'@': 366}), 47: (1, {'@': 366}), 48: (1, {'@': 366}), 49: (1, {'@': 366}), 50: (1, {'@': 366}), 0: (1, {'@': 366}), 19: (1, {'@': 366}), 22: (1, {'@': 366}), 51: (1, {'@': 366}), 38: (1, {'@': 366}), 52: (1, {'@': 366}), 53: (1, {'@': 366}), 39: (1, {'@': 366}), 40: (1, {'@': 366}), 41: (1, {'@': 366}), 54: (1, {'@': 366}), 42: (1, {'@': 366}), 32: (1, {'@': 366}), 43: (1, {'@': 366}), 55: (1, {'@': 366}), 44: (1, {'@': 366})}, 414: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 105: (0, 166), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 122), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 32: (0, 208), 36: (0, 276), 90: (0, 355), 58: (0, 183), 34: (0, 483), 91: (0, 497), 37: (0, 481), 106: (0, 195), 107: (0, 196), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 104: (0, 228)}, 415: {4: (1, {'@': 375}), 5: (1, {'@': 375}), 6: (1, {'@': 375}), 23: (1, {'@': 375}), 8: (1, {'@': 375}), 9: (1, {'@': 375}), 26: (1, {'@': 375}), 11: (1, {'@': 375}), 12: (1, {'@': 375}), 13: (1, {'@': 375}), 22: (1, {'@': 375}), 16: (1, {'@': 375}), 28: (1, {'@': 375}), 0: (1, {'@': 375}), 19: (1, {'@': 375}), 21: (1, {'@': 375}), 31: (1, {'@': 375}), 32: (1, {'@': 375}), 54: (1, {'@': 375}), 44: (1, {'@': 375}), 33: (1, {'@': 375}), 34: (1, {'@': 375}), 35: (1, {'@': 375}), 36: (1, {'@': 375}), 37: (1, {'@': 375}), 38: (1, {'@': 375}), 39: (1, {'@': 375}), 40: (1, {'@': 375}), 41: (1, {'@': 375}), 42: (1, {'@': 375}), 43: (1, {'@': 375}), 45: (1, {'@': 375}), 46: (1, {'@': 375}), 47: (1, {'@': 375}), 49: (1, {'@': 375}), 50: (1, {'@': 375}), 51: (1, {'@': 375}), 52: (1, {'@': 375}), 53: (1, {'@': 375}), 55: (1, {'@': 375})}, 416: {4: (1, {'@': 515}), 6: (1, {'@': 515}), 8: (1, {'@': 515}), 3: (1, {'@': 515}), 9: (1, {'@': 515}), 11: (1, {'@': 515}), 12: (1, {'@': 515}), 2: (1, {'@': 515}), 13: (1, {'@': 515}), 16: (1, {'@': 515}), 0: (1, {'@': 515}), 19: (1, {'@': 515}), 21: (1, {'@': 515}), 23: (1, {'@': 515}), 26: (1, {'@': 515}), 54: (1, {'@': 515}), 32: (1, {'@': 515}), 28: (1, {'@': 515}), 48: (1, {'@': 515}), 5: (1, {'@': 515})}, 417: {31: (0, 447), 32: (1, {'@': 124})}, 418: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 93: (0, 550), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 419: {4: (1, {'@': 138}), 5: (1, {'@': 138}), 6: (1, {'@': 138}), 7: (1, {'@': 138}), 8: (1, {'@': 138}), 9: (1, {'@': 138}), 10: (1, {'@': 138}), 3: (1, {'@': 138}), 11: (1, {'@': 138}), 12: (1, {'@': 138}), 13: (1, {'@': 138}), 14: (1, {'@': 138}), 15: (1, {'@': 138}), 2: (1, {'@': 138}), 16: (1, {'@': 138}), 17: (1, {'@': 138}), 0: (1, {'@': 138}), 18: (1, {'@': 138}), 19: (1, {'@': 138}), 20: (1, {'@': 138}), 21: (1, {'@': 138}), 22: (1, {'@': 138}), 23: (1, {'@': 138}), 24: (1, {'@': 138}), 25: (1, {'@': 138}), 26: (1, {'@': 138}), 27: (1, {'@': 138}), 28: (1, {'@': 138}), 29: (1, {'@': 138}), 30: (1, {'@': 138}), 31: (1, {'@': 138}), 32: (1, {'@': 138}), 33: (1, {'@': 138}), 34: (1, {'@': 138}), 35: (1, {'@': 138}), 36: (1, {'@': 138}), 37: (1, {'@': 138}), 38: (1, {'@': 138}), 39: (1, {'@': 138}), 40: (1, {'@': 138}), 41: (1, {'@': 138}), 42: (1, {'@': 138}), 43: (1, {'@': 138}), 44: (1, {'@': 138}), 45: (1, {'@': 138}), 46: (1, {'@': 138}), 47: (1, {'@': 138}), 48: (1, {'@': 138}), 49: (1, {'@': 138}), 50: (1, {'@': 138}), 51: (1, {'@': 138}), 52: (1, {'@': 138}), 53: (1, {'@': 138}), 54: (1, {'@': 138}), 55: (1, {'@': 138})}, 420: {56: (0, 388), 39: (0, 261), 199: (0, 469), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 58: (0, 599), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 421: {4: (1, {'@': 452}), 5: (1, {'@': 452}), 23: (1, {'@': 452}), 8: (1, {'@': 452}), 3: (1, {'@': 452}), 31: (1, {'@': 452}), 11: (1, {'@': 452}), 12: (1, {'@': 452}), 2: (1, {'@': 452}), 32: (1, {'@': 452}), 16: (1, {'@': 452}), 44: (1, {'@': 452}), 19: (1, {'@': 452}), 21: (1, {'@': 452}), 33: (1, {'@': 452}), 34: (1, {'@': 452}), 35: (1, {'@': 452}), 36: (1, {'@': 452}), 37: (1, {'@': 452}), 38: (1, {'@': 452}), 39: (1, {'@': 452}), 40: (1, {'@': 452}), 41: (1, {'@': 452}), 42: (1, {'@': 452}), 43: (1, {'@': 452}), 45: (1, {'@': 452}), 46: (1, {'@': 452}), 47: (1, {'@': 452}), 49: (1, {'@': 452}), 50: (1, {'@': 452}), 0: (1, {'@': 452}), 22: (1, {'@': 452}), 51: (1, {'@': 452}), 52: (1, {'@': 452}), 53: (1, {'@': 452}), 54: (1, {'@': 452}), 55: (1, {'@': 452}), 48: (1, {'@': 452})}, 422: {2: (1, {'@': 489}), 3: (1, {'@': 489}), 4: (1, {'@': 376}), 5: (1, {'@': 376}), 6: (1, {'@': 376}), 8: (1, {'@': 376}), 9: (1, {'@': 376}), 11: (1, {'@': 376}), 12: (1, {'@': 376}), 13: (1, {'@': 376}), 48: (1, {'@': 376}), 16: (1, {'@': 376}), 0: (1, {'@': 376}), 19: (1, {'@': 376}), 21: (1, {'@': 376}), 23: (1, {'@': 376}), 26: (1, {'@': 376}), 54: (1, {'@': 376}), 32: (1, {'@': 376}), 28: (1, {'@': 376}), 33: (1, {'@': 376}), 34: (1, {'@': 376}), 45: (1, {'@': 376}), 46: (1, {'@': 376}), 35: (1, {'@': 376}), 36: (1, {'@': 376}), 37: (1, {'@': 376}), 47: (1, {'@': 376}), 49: (1, {'@': 376}), 50: (1, {'@': 376}), 51: (1, {'@': 376}), 38: (1, {'@': 376}), 52: (1, {'@': 376}), 53: (1, {'@': 376}), 39: (1, {'@': 376}), 40: (1, {'@': 376}), 41: (1, {'@': 376}), 42: (1, {'@': 376}), 55: (1, {'@': 376}), 43: (1, {'@': 376}), 31: (1, {'@': 376}), 22: (1, {'@': 376}), 44: (1, {'@': 376})}, 423: {4: (1, {'@': 445}), 5: (1, {'@': 445}), 6: (1, {'@': 445}), 8: (1, {'@': 445}), 9: (1, {'@': 445}), 11: (1, {'@': 445}), 12: (1, {'@': 445}), 13: (1, {'@': 445}), 48: (1, {'@': 445}), 16: (1, {'@': 445}), 0: (1, {'@': 445}), 19: (1, {'@': 445}), 21: (1, {'@': 445}), 23: (1, {'@': 445}), 26: (1, {'@': 445}), 54: (1, {'@': 445}), 32: (1, {'@': 445}), 28: (1, {'@': 445}), 33: (1, {'@': 445}), 35: (1, {'@': 445}), 37: (1, {'@': 445}), 39: (1, {'@': 445}), 41: (1, {'@': 445}), 42: (1, {'@': 445}), 31: (1, {'@': 445}), 22: (1, {'@': 445}), 51: (1, {'@': 445}), 55: (1, {'@': 445}), 34: (1, {'@': 445}), 36: (1, {'@': 445}), 38: (1, {'@': 445}), 40: (1, {'@': 445}), 43: (1, {'@': 445}), 44: (1, {'@': 445}), 45: (1, {'@': 445}), 46: (1, {'@': 445}), 47: (1, {'@': 445}), 49: (1, {'@': 445}), 50: (1, {'@': 445}), 52: (1, {'@': 445}), 53: (1, {'@': 445})}, 424: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 93: (0, 624), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 425: {33: (1, {'@': 469}), 34: (1, {'@': 469}), 35: (1, {'@': 469}), 12: (1, {'@': 469}), 36: (1, {'@': 469}), 37: (1, {'@': 469}), 21: (1, {'@': 469}), 38: (1, {'@': 469}), 23: (1, {'@': 469}), 39: (1, {'@': 469}), 40: (1, {'@': 469}), 41: (1, {'@': 469}), 26: (1, {'@': 469}), 42: (1, {'@': 469}), 43: (1, {'@': 469}), 4: (1, {'@': 469}), 45: (1, {'@': 469}), 5: (1, {'@': 469}), 6: (1, {'@': 469}), 8: (1, {'@': 469}), 9: (1, {'@': 469}), 46: (1, {'@': 469}), 11: (1, {'@': 469}), 13: (1, {'@': 469}), 47: (1, {'@': 469}), 16: (1, {'@': 469}), 49: (1, {'@': 469}), 50: (1, {'@': 469}), 19: (1, {'@': 469}), 51: (1, {'@': 469}), 52: (1, {'@': 469}), 53: (1, {'@': 469}), 55: (1, {'@': 469}), 28: (1, {'@': 469})}, 426: {4: (0, 384), 19: (0, 373), 175: (0, 248), 179: (0, 445), 13: (0, 334), 28: (0, 105), 6: (0, 100), 11: (0, 75), 9: (0, 139), 26: (0, 6), 2: (1, {'@': 484}), 3: (1, {'@': 484}), 24: (1, {'@': 291}), 7: (1, {'@': 291}), 25: (1, {'@': 291}), 10: (1, {'@': 291}), 20: (1, {'@': 291}), 27: (1, {'@': 291}), 14: (1, {'@': 291}), 15: (1, {'@': 291}), 17: (1, {'@': 291}), 29: (1, {'@': 291}), 18: (1, {'@': 291}), 30: (1, {'@': 291}), 23: (1, {'@': 442}), 8: (1, {'@': 442}), 12: (1, {'@': 442}), 16: (1, {'@': 442}), 21: (1, {'@': 442}), 0: (1, {'@': 405}), 5: (1, {'@': 405}), 22: (1, {'@': 405}), 31: (1, {'@': 405}), 32: (1, {'@': 405}), 44: (1, {'@': 405}), 54: (1, {'@': 405}), 33: (1, {'@': 405}), 34: (1, {'@': 405}), 45: (1, {'@': 405}), 46: (1, {'@': 405}), 35: (1, {'@': 405}), 36: (1, {'@': 405}), 37: (1, {'@': 405}), 47: (1, {'@': 405}), 49: (1, {'@': 405}), 50: (1, {'@': 405}), 51: (1, {'@': 405}), 38: (1, {'@': 405}), 52: (1, {'@': 405}), 53: (1, {'@': 405}), 39: (1, {'@': 405}), 40: (1, {'@': 405}), 41: (1, {'@': 405}), 42: (1, {'@': 405}), 55: (1, {'@': 405}), 43: (1, {'@': 405})}, 427: {33: (1, {'@': 183}), 34: (1, {'@': 183}), 35: (1, {'@': 183}), 36: (1, {'@': 183}), 37: (1, {'@': 183}), 39: (1, {'@': 183}), 40: (1, {'@': 183}), 41: (1, {'@': 183}), 42: (1, {'@': 183}), 43: (1, {'@': 183}), 4: (1, {'@': 183}), 45: (1, {'@': 183}), 46: (1, {'@': 183}), 11: (1, {'@': 183}), 47: (1, {'@': 183}), 49: (1, {'@': 183}), 50: (1, {'@': 183}), 51: (1, {'@': 183}), 52: (1, {'@': 183}), 53: (1, {'@': 183}), 55: (1, {'@': 183})}, 428: {33: (1, {'@': 223}), 34: (1, {'@': 223}), 45: (1, {'@': 223}), 46: (1, {'@': 223}), 35: (1, {'@': 223}), 36: (1, {'@': 223}), 37: (1, {'@': 223}), 47: (1, {'@': 223}), 49: (1, {'@': 223}), 50: (1, {'@': 223}), 51: (1, {'@': 223}), 38: (1, {'@': 223}), 52: (1, {'@': 223}), 53: (1, {'@': 223}), 39: (1, {'@': 223}), 40: (1, {'@': 223}), 41: (1, {'@': 223}), 42: (1, {'@': 223}), 55: (1, {'@': 223}), 43: (1, {'@': 223})}, 429: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 93: (0, 71), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 430: {56: (0, 388), 39: (0, 261), 57: (0, 333), 58: (0, 233), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 22: (0, 236), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 96: (0, 90), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 123})}, 431: {4: (1, {'@': 446}), 5: (1, {'@': 446}), 6: (1, {'@': 446}), 8: (1, {'@': 446}), 9: (1, {'@': 446}), 3: (1, {'@': 446}), 11: (1, {'@': 446}), 12: (1, {'@': 446}), 13: (1, {'@': 446}), 2: (1, {'@': 446}), 48: (1, {'@': 446}), 16: (1, {'@': 446}), 0: (1, {'@': 446}), 19: (1, {'@': 446}), 21: (1, {'@': 446}), 23: (1, {'@': 446}), 26: (1, {'@': 446}), 54: (1, {'@': 446}), 32: (1, {'@': 446}), 28: (1, {'@': 446}), 30: (1, {'@': 269}), 24: (1, {'@': 269}), 7: (1, {'@': 269}), 25: (1, {'@': 269}), 10: (1, {'@': 269}), 27: (1, {'@': 269}), 14: (1, {'@': 269}), 15: (1, {'@': 269}), 17: (1, {'@': 269}), 29: (1, {'@': 269}), 18: (1, {'@': 269}), 20: (1, {'@': 269}), 33: (1, {'@': 446}), 34: (1, {'@': 446}), 35: (1, {'@': 446}), 36: (1, {'@': 446}), 37: (1, {'@': 446}), 38: (1, {'@': 446}), 39: (1, {'@': 446}), 40: (1, {'@': 446}), 41: (1, {'@': 446}), 42: (1, {'@': 446}), 43: (1, {'@': 446}), 45: (1, {'@': 446}), 46: (1, {'@': 446}), 47: (1, {'@': 446}), 49: (1, {'@': 446}), 50: (1, {'@': 446}), 51: (1, {'@': 446}), 52: (1, {'@': 446}), 53: (1, {'@': 446}), 55: (1, {'@': 446}), 44: (1, {'@': 446}), 31: (1, {'@': 446}), 22: (1, {'@': 446})}, 432: {0: (1, {'@': 117})}, 433: {56: (0, 388), 39: (0, 261), 57: (0, 333), 58: (0, 233), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 22: (0, 236), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 96: (0, 699), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 123})}, 434: {25: (0, 87), 10: (0, 155), 172: (0, 191), 176: (0, 598), 203: (0, 3), 14: (0, 180), 169: (0, 617), 29: (0, 498), 170: (0, 225), 24: (0, 640), 27: (0, 427), 17: (0, 480), 18: (0, 489), 20: (0, 520), 30: (0, 438), 15: (0, 460), 7: (0, 523)}, 435: {56: (0, 388), 39: (0, 261), 57: (0, 333), 58: (0, 233), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 22: (0, 236), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 96: (0, 345), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 123})}, 436: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 93: (0, 308)}, 437: {4: (1, {'@': 67}), 5: (1, {'@': 67}), 6: (1, {'@': 67}), 7: (1, {'@': 67}), 8: (1, {'@': 67}), 9: (1, {'@': 67}), 10: (1, {'@': 67}), 3: (1, {'@': 67}), 11: (1, {'@': 67}), 12: (1, {'@': 67}), 13: (1, {'@': 67}), 14: (1, {'@': 67}), 15: (1, {'@': 67}), 2: (1, {'@': 67}), 16: (1, {'@': 67}), 17: (1, {'@': 67}), 0: (1, {'@': 67}), 18: (1, {'@': 67}), 19: (1, {'@': 67}), 20: (1, {'@': 67}), 21: (1, {'@': 67}), 22: (1, {'@': 67}), 23: (1, {'@': 67}), 24: (1, {'@': 67}), 25: (1, {'@': 67}), 26: (1, {'@': 67}), 27: (1, {'@': 67}), 28: (1, {'@': 67}), 29: (1, {'@': 67}), 30: (1, {'@': 67}), 31: (1, {'@': 67}), 32: (1, {'@': 67}), 33: (1, {'@': 67}), 34: (1, {'@': 67}), 35: (1, {'@': 67}), 36: (1, {'@': 67}), 37: (1, {'@': 67}), 38: (1, {'@': 67}), 39: (1, {'@': 67}), 40: (1, {'@': 67}), 41: (1, {'@': 67}), 42: (1, {'@': 67}), 43: (1, {'@': 67}), 44: (1, {'@': 67}), 45: (1, {'@': 67}), 46: (1, {'@': 67}), 47: (1, {'@': 67}), 48: (1, {'@': 67}), 49: (1, {'@': 67}), 50: (1, {'@': 67}), 51: (1, {'@': 67}), 52: (1, {'@': 67}), 53: (1, {'@': 67}), 54: (1, {'@': 67}), 55: (1, {'@': 67})}, 438: {33: (1, {'@': 181}), 34: (1, {'@': 181}), 35: (1, {'@': 181}), 36: (1, {'@': 181}), 37: (1, {'@': 181}), 39: (1, {'@': 181}), 40: (1, {'@': 181}), 41: (1, {'@': 181}), 42: (1, {'@': 181}), 43: (1, {'@': 181}), 4: (1, {'@': 181}), 45: (1, {'@': 181}), 46: (1, {'@': 181}), 11: (1, {'@': 181}), 47: (1, {'@': 181}), 49: (1, {'@': 181}), 50: (1, {'@': 181}), 51: (1, {'@': 181}), 52: (1, {'@': 181}), 53: (1, {'@': 181}), 55: (1, {'@': 181})}, 439: {33: (1, {'@': 378}), 34: (1, {'@': 378}), 35: (1, {'@': 378}), 12: (1, {'@': 378}), 36: (1, {'@': 378}), 37: (1, {'@': 378}), 21: (1, {'@': 378}), 38: (1, {'@': 378}), 23: (1, {'@': 378}), 39: (1, {'@': 378}), 40: (1, {'@': 378}), 41: (1, {'@': 378}), 26: (1, {'@': 378}), 42: (1, {'@': 378}), 43: (1, {'@': 378}), 4: (1, {'@': 378}), 45: (1, {'@': 378}), 5: (1, {'@': 378}), 6: (1, {'@': 378}), 8: (1, {'@': 378}), 9: (1, {'@': 378}), 46: (1, {'@': 378}), 11: (1, {'@': 378}), 13: (1, {'@': 378}), 47: (1, {'@': 378}), 16: (1, {'@': 378}), 49: (1, {'@': 378}), 50: (1, {'@': 378}), 19: (1, {'@': 378}), 51: (1, {'@': 378}), 52: (1, {'@': 378}), 53: (1, {'@': 378}), 55: (1, {'@': 378}), 28: (1, {'@': 378}), 32: (1, {'@': 378}), 44: (1, {'@': 378}), 31: (1, {'@': 378}), 0: (1, {'@': 378}), 22: (1, {'@': 378}), 54: (1, {'@': 378}), 48: (1, {'@': 378})}, 440: {23: (0, 137), 8: (0, 335), 16: (0, 322), 21: (0, 303), 174: (0, 65), 12: (0, 631)}, 441: {4: (1, {'@': 357}), 5: (1, {'@': 357}), 0: (1, {'@': 357}), 19: (1, {'@': 357}), 11: (1, {'@': 357}), 22: (1, {'@': 357}), 32: (1, {'@': 357}), 31: (1, {'@': 357}), 54: (1, {'@': 357}), 44: (1, {'@': 357}), 48: (1, {'@': 357}), 33: (1, {'@': 357}), 34: (1, {'@': 357}), 45: (1, {'@': 357}), 46: (1, {'@': 357}), 35: (1, {'@': 357}), 36: (1, {'@': 357}), 37: (1, {'@': 357}), 47: (1, {'@': 357}), 49: (1, {'@': 357}), 50: (1, {'@': 357}), 51: (1, {'@': 357}), 38: (1, {'@': 357}), 52: (1, {'@': 357}), 53: (1, {'@': 357}), 39: (1, {'@': 357}), 40: (1, {'@': 357}), 41: (1, {'@': 357}), 42: (1, {'@': 357}), 55: (1, {'@': 357}), 43: (1, {'@': 357})}, 442: {31: (1, {'@': 202}), 54: (1, {'@': 202}), 44: (1, {'@': 202})}, 443: {37: (0, 481), 180: (0, 317), 4: (0, 314), 70: (0, 307), 45: (0, 504), 39: (0, 261), 181: (0, 357), 191: (0, 541), 182: (0, 422), 40: (0, 437), 183: (0, 431), 93: (0, 542), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 193: (0, 363), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 34: (0, 483), 185: (0, 352), 186: (0, 589), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 194: (0, 147), 50: (0, 600)}, 444: {0: (1, {'@': 335}), 22: (1, {'@': 335}), 31: (1, {'@': 335}), 32: (1, {'@': 335}), 44: (1, {'@': 335}), 54: (1, {'@': 335}), 33: (1, {'@': 335}), 34: (1, {'@': 335}), 45: (1, {'@': 335}), 46: (1, {'@': 335}), 35: (1, {'@': 335}), 36: (1, {'@': 335}), 37: (1, {'@': 335}), 47: (1, {'@': 335}), 49: (1, {'@': 335}), 50: (1, {'@': 335}), 51: (1, {'@': 335}), 38: (1, {'@': 335}), 52: (1, {'@': 335}), 53: (1, {'@': 335}), 39: (1, {'@': 335}), 40: (1, {'@': 335}), 41: (1, {'@': 335}), 42: (1, {'@': 335}), 55: (1, {'@': 335}), 43: (1, {'@': 335})}, 445: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 180: (0, 317), 181: (0, 357), 182: (0, 422), 40: (0, 437), 183: (0, 431), 43: (0, 519), 71: (0, 661), 93: (0, 412), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 193: (0, 363), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 185: (0, 352), 186: (0, 589), 51: (0, 540), 82: (0, 593), 36: (0, 276), 191: (0, 672), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 446: {32: (0, 580)}, 447: {56: (0, 388), 39: (0, 261), 105: (0, 212), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 122), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 58: (0, 183), 34: (0, 483), 91: (0, 497), 37: (0, 481), 106: (0, 195), 107: (0, 196), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 448: {33: (1, {'@': 106}), 34: (1, {'@': 106}), 35: (1, {'@': 106}), 12: (1, {'@': 106}), 36: (1, {'@': 106}), 37: (1, {'@': 106}), 21: (1, {'@': 106}), 38: (1, {'@': 106}), 23: (1, {'@': 106}), 39: (1, {'@': 106}), 40: (1, {'@': 106}), 41: (1, {'@': 106}), 26: (1, {'@': 106}), 42: (1, {'@': 106}), 32: (1, {'@': 106}), 43: (1, {'@': 106}), 44: (1, {'@': 106}), 4: (1, {'@': 106}), 45: (1, {'@': 106}), 5: (1, {'@': 106}), 6: (1, {'@': 106}), 8: (1, {'@': 106}), 9: (1, {'@': 106}), 3: (1, {'@': 106}), 31: (1, {'@': 106}), 46: (1, {'@': 106}), 11: (1, {'@': 106}), 13: (1, {'@': 106}), 2: (1, {'@': 106}), 47: (1, {'@': 106}), 16: (1, {'@': 106}), 49: (1, {'@': 106}), 50: (1, {'@': 106}), 0: (1, {'@': 106}), 19: (1, {'@': 106}), 22: (1, {'@': 106}), 51: (1, {'@': 106}), 52: (1, {'@': 106}), 53: (1, {'@': 106}), 54: (1, {'@': 106}), 55: (1, {'@': 106}), 28: (1, {'@': 106}), 48: (1, {'@': 106})}, 449: {37: (0, 481), 77: (0, 31), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 160: (0, 304), 161: (0, 201), 40: (0, 437), 43: (0, 519), 71: (0, 661), 162: (0, 69), 33: (0, 283), 11: (0, 522), 163: (0, 198), 55: (0, 708), 46: (0, 534), 42: (0, 606), 165: (0, 20), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 41: (0, 458), 166: (0, 76), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 167: (0, 206), 53: (0, 618), 168: (0, 158), 51: (0, 540), 164: (0, 73), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 450: {4: (1, {'@': 382}), 5: (1, {'@': 382}), 23: (1, {'@': 382}), 8: (1, {'@': 382}), 31: (1, {'@': 382}), 11: (1, {'@': 382}), 12: (1, {'@': 382}), 32: (1, {'@': 382}), 16: (1, {'@': 382}), 44: (1, {'@': 382}), 19: (1, {'@': 382}), 21: (1, {'@': 382}), 33: (1, {'@': 382}), 34: (1, {'@': 382}), 35: (1, {'@': 382}), 36: (1, {'@': 382}), 37: (1, {'@': 382}), 38: (1, {'@': 382}), 39: (1, {'@': 382}), 40: (1, {'@': 382}), 41: (1, {'@': 382}), 42: (1, {'@': 382}), 43: (1, {'@': 382}), 45: (1, {'@': 382}), 46: (1, {'@': 382}), 47: (1, {'@': 382}), 49: (1, {'@': 382}), 50: (1, {'@': 382}), 0: (1, {'@': 382}), 22: (1, {'@': 382}), 51: (1, {'@': 382}), 52: (1, {'@': 382}), 53: (1, {'@': 382}), 54: (1, {'@': 382}), 55: (1, {'@': 382}), 48: (1, {'@': 382})}, 451: {4: (1, {'@': 248}), 32: (1, {'@': 248}), 0: (1, {'@': 248}), 19: (1, {'@': 248}), 11: (1, {'@': 248}), 54: (1, {'@': 248}), 48: (1, {'@': 248}), 5: (1, {'@': 248})}, 452: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 22: (0, 258), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 79: (0, 634), 78: (0, 666), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 58: (0, 411), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 115})}, 453: {37: (0, 481), 160: (0, 304), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 201: (0, 300), 164: (0, 569), 161: (0, 201), 40: (0, 437), 43: (0, 519), 162: (0, 69), 163: (0, 198), 71: (0, 661), 11: (0, 522), 33: (0, 283), 77: (0, 571), 46: (0, 534), 165: (0, 20), 42: (0, 606), 55: (0, 708), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 166: (0, 76), 41: (0, 458), 80: (0, 628), 88: (0, 419), 66: (0, 528), 97: (0, 525), 167: (0, 206), 168: (0, 158), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 84: (0, 621), 52: (0, 544), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 454: {4: (1, {'@': 416}), 5: (1, {'@': 416}), 0: (1, {'@': 416}), 19: (1, {'@': 416}), 11: (1, {'@': 416}), 22: (1, {'@': 416}), 32: (1, {'@': 416}), 31: (1, {'@': 416}), 44: (1, {'@': 416}), 54: (1, {'@': 416}), 33: (1, {'@': 416}), 34: (1, {'@': 416}), 45: (1, {'@': 416}), 46: (1, {'@': 416}), 35: (1, {'@': 416}), 36: (1, {'@': 416}), 37: (1, {'@': 416}), 47: (1, {'@': 416}), 49: (1, {'@': 416}), 50: (1, {'@': 416}), 51: (1, {'@': 416}), 38: (1, {'@': 416}), 52: (1, {'@': 416}), 53: (1, {'@': 416}), 39: (1, {'@': 416}), 40: (1, {'@': 416}), 41: (1, {'@': 416}), 42: (1, {'@': 416}), 55: (1, {'@': 416}), 43: (1, {'@': 416})}, 455: {0: (1, {'@': 110})}, 456: {31: (1, {'@': 547}), 54: (1, {'@': 547})}, 457: {1: (0, 213), 2: (0, 684), 3: (0, 595)}, 458: {4: (1, {'@': 64}), 5: (1, {'@': 64}), 6: (1, {'@': 64}), 7: (1, {'@': 64}), 8: (1, {'@': 64}), 9: (1, {'@': 64}), 10: (1, {'@': 64}), 3: (1, {'@': 64}), 11: (1, {'@': 64}), 12: (1, {'@': 64}), 13: (1, {'@': 64}), 14: (1, {'@': 64}), 15: (1, {'@': 64}), 2: (1, {'@': 64}), 16: (1, {'@': 64}), 17: (1, {'@': 64}), 0: (1, {'@': 64}), 18: (1, {'@': 64}), 19: (1, {'@': 64}), 20: (1, {'@': 64}), 21: (1, {'@': 64}), 22: (1, {'@': 64}), 23: (1, {'@': 64}), 24: (1, {'@': 64}), 25: (1, {'@': 64}), 26: (1, {'@': 64}), 27: (1, {'@': 64}), 28: (1, {'@': 64}), 29: (1, {'@': 64}), 30: (1, {'@': 64}), 31: (1, {'@': 64}), 32: (1, {'@': 64}), 33: (1, {'@': 64}), 34: (1, {'@': 64}), 35: (1, {'@': 64}), 36: (1, {'@': 64}), 37: (1, {'@': 64}), 38: (1, {'@': 64}), 39: (1, {'@': 64}), 40: (1, {'@': 64}), 41: (1, {'@': 64}), 42: (1, {'@': 64}), 43: (1, {'@': 64}), 44: (1, {'@': 64}), 45: (1, {'@': 64}), 46: (1, {'@': 64}), 47: (1, {'@': 64}), 48: (1, {'@': 64}), 49: (1, {'@': 64}), 50: (1, {'@': 64}), 51: (1, {'@': 64}), 52: (1, {'@': 64}), 53: (1, {'@': 64}), 54: (1, {'@': 64}), 55: (1, {'@': 64})}, 459: {37: (0, 481), 160: (0, 304), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 77: (0, 468), 161: (0, 201), 40: (0, 437), 43: (0, 519), 162: (0, 69), 163: (0, 198), 71: (0, 661), 11: (0, 522), 33: (0, 283), 46: (0, 534), 165: (0, 20), 42: (0, 606), 55: (0, 708), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 166: (0, 76), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 167: (0, 206), 168: (0, 158), 53: (0, 618), 164: (0, 386), 51: (0, 540), 82: (0, 593), 36: (0, 276), 84: (0, 621), 52: (0, 544), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 460: {33: (1, {'@': 167}), 34: (1, {'@': 167}), 35: (1, {'@': 167}), 36: (1, {'@': 167}), 37: (1, {'@': 167}), 39: (1, {'@': 167}), 40: (1, {'@': 167}), 41: (1, {'@': 167}), 42: (1, {'@': 167}), 43: (1, {'@': 167}), 4: (1, {'@': 167}), 45: (1, {'@': 167}), 46: (1, {'@': 167}), 11: (1, {'@': 167}), 47: (1, {'@': 167}), 49: (1, {'@': 167}), 50: (1, {'@': 167}), 51: (1, {'@': 167}), 52: (1, {'@': 167}), 53: (1, {'@': 167}), 55: (1, {'@': 167})}, 461: {37: (0, 481), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 77: (0, 250), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 462: {30: (1, {'@': 535}), 24: (1, {'@': 535}), 7: (1, {'@': 535}), 25: (1, {'@': 535}), 10: (1, {'@': 535}), 27: (1, {'@': 535}), 14: (1, {'@': 535}), 15: (1, {'@': 535}), 17: (1, {'@': 535}), 29: (1, {'@': 535}), 18: (1, {'@': 535}), 20: (1, {'@': 535}), 4: (1, {'@': 512}), 6: (1, {'@': 512}), 8: (1, {'@': 512}), 9: (1, {'@': 512}), 3: (1, {'@': 512}), 11: (1, {'@': 512}), 12: (1, {'@': 512}), 13: (1, {'@': 512}), 2: (1, {'@': 512}), 16: (1, {'@': 512}), 0: (1, {'@': 512}), 19: (1, {'@': 512}), 21: (1, {'@': 512}), 23: (1, {'@': 512}), 26: (1, {'@': 512}), 54: (1, {'@': 512}), 32: (1, {'@': 512}), 28: (1, {'@': 512}), 48: (1, {'@': 512}), 5: (1, {'@': 512})}, 463: {37: (0, 481), 180: (0, 317), 4: (0, 314), 70: (0, 307), 45: (0, 504), 39: (0, 261), 181: (0, 357), 191: (0, 541), 182: (0, 422), 40: (0, 437), 183: (0, 431), 93: (0, 542), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 193: (0, 363), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 34: (0, 483), 185: (0, 352), 186: (0, 589), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 194: (0, 279)}, 464: {37: (0, 481), 36: (0, 276), 70: (0, 114), 46: (0, 534)}, 465: {48: (0, 565)}, 466: {175: (0, 547), 13: (0, 334), 28: (0, 105), 179: (0, 473), 6: (0, 100), 9: (0, 139), 26: (0, 6)}, 467: {37: (0, 481), 160: (0, 304), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 161: (0, 201), 40: (0, 437), 43: (0, 519), 71: (0, 661), 162: (0, 69), 33: (0, 283), 11: (0, 522), 163: (0, 198), 77: (0, 321), 55: (0, 708), 46: (0, 534), 42: (0, 606), 165: (0, 20), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 41: (0, 458), 166: (0, 76), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 167: (0, 206), 53: (0, 618), 168: (0, 158), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 164: (0, 683), 50: (0, 600), 34: (0, 483)}, 468: {4: (1, {'@': 396}), 33: (1, {'@': 396}), 34: (1, {'@': 396}), 5: (1, {'@': 396}), 45: (1, {'@': 396}), 46: (1, {'@': 396}), 35: (1, {'@': 396}), 11: (1, {'@': 396}), 36: (1, {'@': 396}), 37: (1, {'@': 396}), 47: (1, {'@': 396}), 49: (1, {'@': 396}), 50: (1, {'@': 396}), 19: (1, {'@': 396}), 51: (1, {'@': 396}), 38: (1, {'@': 396}), 52: (1, {'@': 396}), 53: (1, {'@': 396}), 39: (1, {'@': 396}), 40: (1, {'@': 396}), 41: (1, {'@': 396}), 42: (1, {'@': 396}), 55: (1, {'@': 396}), 43: (1, {'@': 396}), 30: (1, {'@': 490}), 24: (1, {'@': 490}), 7: (1, {'@': 490}), 25: (1, {'@': 490}), 10: (1, {'@': 490}), 27: (1, {'@': 490}), 14: (1, {'@': 490}), 15: (1, {'@': 490}), 17: (1, {'@': 490}), 29: (1, {'@': 490}), 18: (1, {'@': 490}), 20: (1, {'@': 490}), 23: (1, {'@': 456}), 8: (1, {'@': 456}), 12: (1, {'@': 456}), 16: (1, {'@': 456}), 21: (1, {'@': 456}), 2: (1, {'@': 493}), 3: (1, {'@': 493})}, 469: {31: (1, {'@': 548}), 54: (1, {'@': 548})}, 470: {11: (0, 588), 19: (0, 592), 4: (0, 169), 0: (1, {'@': 331}), 5: (1, {'@': 331}), 22: (1, {'@': 331}), 31: (1, {'@': 331}), 32: (1, {'@': 331}), 44: (1, {'@': 331}), 54: (1, {'@': 331}), 33: (1, {'@': 331}), 34: (1, {'@': 331}), 45: (1, {'@': 331}), 46: (1, {'@': 331}), 35: (1, {'@': 331}), 36: (1, {'@': 331}), 37: (1, {'@': 331}), 47: (1, {'@': 331}), 49: (1, {'@': 331}), 50: (1, {'@': 331}), 51: (1, {'@': 331}), 38: (1, {'@': 331}), 52: (1, {'@': 331}), 53: (1, {'@': 331}), 39: (1, {'@': 331}), 40: (1, {'@': 331}), 41: (1, {'@': 331}), 42: (1, {'@': 331}), 55: (1, {'@': 331}), 43: (1, {'@': 331})}, 471: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 93: (0, 64), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 472: {31: (1, {'@': 546}), 32: (1, {'@': 546}), 0: (1, {'@': 546}), 54: (1, {'@': 546})}, 473: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 93: (0, 26), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 474: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 93: (0, 415), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 475: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 105: (0, 166), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 122), 71: (0, 661), 104: (0, 446), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 58: (0, 183), 34: (0, 483), 91: (0, 497), 37: (0, 481), 106: (0, 195), 107: (0, 196), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 32: (0, 485), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 476: {33: (1, {'@': 379}), 34: (1, {'@': 379}), 35: (1, {'@': 379}), 12: (1, {'@': 379}), 36: (1, {'@': 379}), 37: (1, {'@': 379}), 21: (1, {'@': 379}), 38: (1, {'@': 379}), 23: (1, {'@': 379}), 39: (1, {'@': 379}), 40: (1, {'@': 379}), 41: (1, {'@': 379}), 26: (1, {'@': 379}), 42: (1, {'@': 379}), 43: (1, {'@': 379}), 4: (1, {'@': 379}), 45: (1, {'@': 379}), 5: (1, {'@': 379}), 6: (1, {'@': 379}), 8: (1, {'@': 379}), 9: (1, {'@': 379}), 46: (1, {'@': 379}), 11: (1, {'@': 379}), 13: (1, {'@': 379}), 47: (1, {'@': 379}), 16: (1, {'@': 379}), 49: (1, {'@': 379}), 50: (1, {'@': 379}), 19: (1, {'@': 379}), 51: (1, {'@': 379}), 52: (1, {'@': 379}), 53: (1, {'@': 379}), 55: (1, {'@': 379}), 28: (1, {'@': 379}), 32: (1, {'@': 379}), 44: (1, {'@': 379}), 31: (1, {'@': 379}), 0: (1, {'@': 379}), 22: (1, {'@': 379}), 54: (1, {'@': 379}), 48: (1, {'@': 379})}, 477: {37: (0, 481), 160: (0, 304), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 164: (0, 569), 161: (0, 201), 40: (0, 437), 43: (0, 519), 162: (0, 69), 163: (0, 198), 71: (0, 661), 11: (0, 522), 33: (0, 283), 77: (0, 571), 46: (0, 534), 165: (0, 20), 42: (0, 606), 55: (0, 708), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 166: (0, 76), 41: (0, 458), 80: (0, 628), 88: (0, 419), 66: (0, 528), 97: (0, 525), 167: (0, 206), 168: (0, 158), 53: (0, 618), 51: (0, 540), 201: (0, 591), 82: (0, 593), 36: (0, 276), 84: (0, 621), 52: (0, 544), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 478: {24: (1, {'@': 292}), 7: (1, {'@': 292}), 25: (1, {'@': 292}), 10: (1, {'@': 292}), 20: (1, {'@': 292}), 27: (1, {'@': 292}), 14: (1, {'@': 292}), 15: (1, {'@': 292}), 17: (1, {'@': 292}), 29: (1, {'@': 292}), 18: (1, {'@': 292}), 30: (1, {'@': 292}), 4: (1, {'@': 437}), 5: (1, {'@': 437}), 6: (1, {'@': 437}), 8: (1, {'@': 437}), 3: (1, {'@': 437}), 9: (1, {'@': 437}), 11: (1, {'@': 437}), 12: (1, {'@': 437}), 2: (1, {'@': 437}), 13: (1, {'@': 437}), 16: (1, {'@': 437}), 0: (1, {'@': 437}), 19: (1, {'@': 437}), 21: (1, {'@': 437}), 22: (1, {'@': 437}), 23: (1, {'@': 437}), 26: (1, {'@': 437}), 28: (1, {'@': 437}), 31: (1, {'@': 437}), 32: (1, {'@': 437}), 54: (1, {'@': 437}), 44: (1, {'@': 437}), 33: (1, {'@': 437}), 34: (1, {'@': 437}), 35: (1, {'@': 437}), 36: (1, {'@': 437}), 37: (1, {'@': 437}), 38: (1, {'@': 437}), 39: (1, {'@': 437}), 40: (1, {'@': 437}), 41: (1, {'@': 437}), 42: (1, {'@': 437}), 43: (1, {'@': 437}), 45: (1, {'@': 437}), 46: (1, {'@': 437}), 47: (1, {'@': 437}), 49: (1, {'@': 437}), 50: (1, {'@': 437}), 51: (1, {'@': 437}), 52: (1, {'@': 437}), 53: (1, {'@': 437}), 55: (1, {'@': 437})}, 479: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 180: (0, 317), 93: (0, 310), 181: (0, 357), 182: (0, 422), 40: (0, 437), 183: (0, 431), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 193: (0, 363), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 185: (0, 352), 186: (0, 589), 51: (0, 540), 191: (0, 413), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 480: {33: (1, {'@': 185}), 34: (1, {'@': 185}), 35: (1, {'@': 185}), 36: (1, {'@': 185}), 37: (1, {'@': 185}), 39: (1, {'@': 185}), 40: (1, {'@': 185}), 41: (1, {'@': 185}), 42: (1, {'@': 185}), 43: (1, {'@': 185}), 45: (1, {'@': 185}), 46: (1, {'@': 185}), 11: (1, {'@': 185}), 47: (1, {'@': 185}), 50: (1, {'@': 185}), 49: (1, {'@': 185}), 51: (1, {'@': 185}), 52: (1, {'@': 185}), 53: (1, {'@': 185}), 55: (1, {'@': 185})}, 481: {4: (1, {'@': 204}), 5: (1, {'@': 204}), 6: (1, {'@': 204}), 7: (1, {'@': 204}), 8: (1, {'@': 204}), 9: (1, {'@': 204}), 10: (1, {'@': 204}), 3: (1, {'@': 204}), 11: (1, {'@': 204}), 12: (1, {'@': 204}), 13: (1, {'@': 204}), 14: (1, {'@': 204}), 15: (1, {'@': 204}), 2: (1, {'@': 204}), 29: (1, {'@': 204}), 16: (1, {'@': 204}), 17: (1, {'@': 204}), 0: (1, {'@': 204}), 18: (1, {'@': 204}), 19: (1, {'@': 204}), 20: (1, {'@': 204}), 21: (1, {'@': 204}), 22: (1, {'@': 204}), 23: (1, {'@': 204}), 24: (1, {'@': 204}), 25: (1, {'@': 204}), 26: (1, {'@': 204}), 27: (1, {'@': 204}), 28: (1, {'@': 204}), 178: (1, {'@': 204}), 30: (1, {'@': 204}), 200: (1, {'@': 204}), 32: (1, {'@': 204}), 31: (1, {'@': 204}), 33: (1, {'@': 204}), 34: (1, {'@': 204}), 35: (1, {'@': 204}), 36: (1, {'@': 204}), 37: (1, {'@': 204}), 38: (1, {'@': 204}), 39: (1, {'@': 204}), 40: (1, {'@': 204}), 41: (1, {'@': 204}), 42: (1, {'@': 204}), 43: (1, {'@': 204}), 44: (1, {'@': 204}), 45: (1, {'@': 204}), 46: (1, {'@': 204}), 47: (1, {'@': 204}), 48: (1, {'@': 204}), 49: (1, {'@': 204}), 50: (1, {'@': 204}), 51: (1, {'@': 204}), 52: (1, {'@': 204}), 53: (1, {'@': 204}), 54: (1, {'@': 204}), 55: (1, {'@': 204})}, 482: {33: (1, {'@': 260}), 34: (1, {'@': 260}), 35: (1, {'@': 260}), 12: (1, {'@': 260}), 36: (1, {'@': 260}), 14: (1, {'@': 260}), 37: (1, {'@': 260}), 18: (1, {'@': 260}), 21: (1, {'@': 260}), 38: (1, {'@': 260}), 23: (1, {'@': 260}), 24: (1, {'@': 260}), 25: (1, {'@': 260}), 39: (1, {'@': 260}), 40: (1, {'@': 260}), 41: (1, {'@': 260}), 26: (1, {'@': 260}), 42: (1, {'@': 260}), 43: (1, {'@': 260}), 4: (1, {'@': 260}), 45: (1, {'@': 260}), 5: (1, {'@': 260}), 6: (1, {'@': 260}), 7: (1, {'@': 260}), 8: (1, {'@': 260}), 9: (1, {'@': 260}), 3: (1, {'@': 260}), 10: (1, {'@': 260}), 46: (1, {'@': 260}), 11: (1, {'@': 260}), 13: (1, {'@': 260}), 2: (1, {'@': 260}), 15: (1, {'@': 260}), 47: (1, {'@': 260}), 16: (1, {'@': 260}), 49: (1, {'@': 260}), 17: (1, {'@': 260}), 50: (1, {'@': 260}), 19: (1, {'@': 260}), 20: (1, {'@': 260}), 51: (1, {'@': 260}), 52: (1, {'@': 260}), 53: (1, {'@': 260}), 27: (1, {'@': 260}), 55: (1, {'@': 260}), 28: (1, {'@': 260}), 29: (1, {'@': 260}), 30: (1, {'@': 260})}, 483: {4: (1, {'@': 63}), 5: (1, {'@': 63}), 6: (1, {'@': 63}), 7: (1, {'@': 63}), 8: (1, {'@': 63}), 9: (1, {'@': 63}), 10: (1, {'@': 63}), 3: (1, {'@': 63}), 11: (1, {'@': 63}), 12: (1, {'@': 63}), 13: (1, {'@': 63}), 14: (1, {'@': 63}), 15: (1, {'@': 63}), 2: (1, {'@': 63}), 16: (1, {'@': 63}), 17: (1, {'@': 63}), 0: (1, {'@': 63}), 18: (1, {'@': 63}), 19: (1, {'@': 63}), 20: (1, {'@': 63}), 21: (1, {'@': 63}), 22: (1, {'@': 63}), 23: (1, {'@': 63}), 24: (1, {'@': 63}), 25: (1, {'@': 63}), 26: (1, {'@': 63}), 27: (1, {'@': 63}), 28: (1, {'@': 63}), 29: (1, {'@': 63}), 30: (1, {'@': 63}), 31: (1, {'@': 63}), 32: (1, {'@': 63}), 33: (1, {'@': 63}), 34: (1, {'@': 63}), 35: (1, {'@': 63}), 36: (1, {'@': 63}), 37: (1, {'@': 63}), 38: (1, {'@': 63}), 39: (1, {'@': 63}), 40: (1, {'@': 63}), 41: (1, {'@': 63}), 42: (1, {'@': 63}), 43: (1, {'@': 63}), 44: (1, {'@': 63}), 45: (1, {'@': 63}), 46: (1, {'@': 63}), 47: (1, {'@': 63}), 48: (1, {'@': 63}), 49: (1, {'@': 63}), 50: (1, {'@': 63}), 51: (1, {'@': 63}), 52: (1, {'@': 63}), 53: (1, {'@': 63}), 54: (1, {'@': 63}), 55: (1, {'@': 63})}, 484: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 93: (0, 476), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 485: {4: (1, {'@': 314}), 33: (1, {'@': 314}), 5: (1, {'@': 314}), 34: (1, {'@': 314}), 45: (1, {'@': 314}), 46: (1, {'@': 314}), 35: (1, {'@': 314}), 11: (1, {'@': 314}), 36: (1, {'@': 314}), 37: (1, {'@': 314}), 47: (1, {'@': 314}), 49: (1, {'@': 314}), 50: (1, {'@': 314}), 19: (1, {'@': 314}), 51: (1, {'@': 314}), 38: (1, {'@': 314}), 52: (1, {'@': 314}), 53: (1, {'@': 314}), 39: (1, {'@': 314}), 40: (1, {'@': 314}), 41: (1, {'@': 314}), 42: (1, {'@': 314}), 55: (1, {'@': 314}), 43: (1, {'@': 314})}, 486: {4: (1, {'@': 101}), 5: (1, {'@': 101}), 6: (1, {'@': 101}), 7: (1, {'@': 101}), 8: (1, {'@': 101}), 9: (1, {'@': 101}), 10: (1, {'@': 101}), 3: (1, {'@': 101}), 11: (1, {'@': 101}), 12: (1, {'@': 101}), 13: (1, {'@': 101}), 14: (1, {'@': 101}), 15: (1, {'@': 101}), 2: (1, {'@': 101}), 16: (1, {'@': 101}), 17: (1, {'@': 101}), 0: (1, {'@': 101}), 18: (1, {'@': 101}), 19: (1, {'@': 101}), 20: (1, {'@': 101}), 21: (1, {'@': 101}), 22: (1, {'@': 101}), 23: (1, {'@': 101}), 24: (1, {'@': 101}), 25: (1, {'@': 101}), 26: (1, {'@': 101}), 27: (1, {'@': 101}), 28: (1, {'@': 101}), 29: (1, {'@': 101}), 30: (1, {'@': 101}), 31: (1, {'@': 101}), 32: (1, {'@': 101}), 54: (1, {'@': 101}), 44: (1, {'@': 101}), 33: (1, {'@': 101}), 34: (1, {'@': 101}), 35: (1, {'@': 101}), 36: (1, {'@': 101}), 37: (1, {'@': 101}), 38: (1, {'@': 101}), 39: (1, {'@': 101}), 40: (1, {'@': 101}), 41: (1, {'@': 101}), 42: (1, {'@': 101}), 43: (1, {'@': 101}), 45: (1, {'@': 101}), 46: (1, {'@': 101}), 47: (1, {'@': 101}), 49: (1, {'@': 101}), 50: (1, {'@': 101}), 51: (1, {'@': 101}), 52: (1, {'@': 101}), 53: (1, {'@': 101}), 55: (1, {'@': 101})}, 487: {4: (1, {'@': 329}), 0: (1, {'@': 329}), 19: (1, {'@': 329}), 11: (1, {'@': 329}), 22: (1, {'@': 329}), 32: (1, {'@': 329}), 31: (1, {'@': 329}), 44: (1, {'@': 329}), 54: (1, {'@': 329}), 33: (1, {'@': 329}), 34: (1, {'@': 329}), 45: (1, {'@': 329}), 46: (1, {'@': 329}), 35: (1, {'@': 329}), 36: (1, {'@': 329}), 37: (1, {'@': 329}), 47: (1, {'@': 329}), 49: (1, {'@': 329}), 50: (1, {'@': 329}), 51: (1, {'@': 329}), 38: (1, {'@': 329}), 52: (1, {'@': 329}), 53: (1, {'@': 329}), 39: (1, {'@': 329}), 40: (1, {'@': 329}), 41: (1, {'@': 329}), 42: (1, {'@': 329}), 55: (1, {'@': 329}), 43: (1, {'@': 329})}, 488: {0: (1, {'@': 330}), 5: (1, {'@': 330}), 22: (1, {'@': 330}), 31: (1, {'@': 330}), 32: (1, {'@': 330}), 44: (1, {'@': 330}), 54: (1, {'@': 330}), 33: (1, {'@': 330}), 34: (1, {'@': 330}), 45: (1, {'@': 330}), 46: (1, {'@': 330}), 35: (1, {'@': 330}), 36: (1, {'@': 330}), 37: (1, {'@': 330}), 47: (1, {'@': 330}), 49: (1, {'@': 330}), 50: (1, {'@': 330}), 51: (1, {'@': 330}), 38: (1, {'@': 330}), 52: (1, {'@': 330}), 53: (1, {'@': 330}), 39: (1, {'@': 330}), 40: (1, {'@': 330}), 41: (1, {'@': 330}), 42: (1, {'@': 330}), 55: (1, {'@': 330}), 43: (1, {'@': 330})}, 489: {33: (1, {'@': 187}), 34: (1, {'@': 187}), 35: (1, {'@': 187}), 36: (1, {'@': 187}), 37: (1, {'@': 187}), 39: (1, {'@': 187}), 40: (1, {'@': 187}), 41: (1, {'@': 187}), 42: (1, {'@': 187}), 43: (1, {'@': 187}), 45: (1, {'@': 187}), 46: (1, {'@': 187}), 11: (1, {'@': 187}), 47: (1, {'@': 187}), 50: (1, {'@': 187}), 49: (1, {'@': 187}), 51: (1, {'@': 187}), 52: (1, {'@': 187}), 53: (1, {'@': 187}), 55: (1, {'@': 187})}, 490: {4: (0, 368), 11: (0, 491), 19: (0, 298), 0: (1, {'@': 406}), 5: (1, {'@': 406}), 22: (1, {'@': 406}), 31: (1, {'@': 406}), 32: (1, {'@': 406}), 44: (1, {'@': 406}), 54: (1, {'@': 406}), 33: (1, {'@': 406}), 34: (1, {'@': 406}), 45: (1, {'@': 406}), 46: (1, {'@': 406}), 35: (1, {'@': 406}), 36: (1, {'@': 406}), 37: (1, {'@': 406}), 47: (1, {'@': 406}), 49: (1, {'@': 406}), 50: (1, {'@': 406}), 51: (1, {'@': 406}), 38: (1, {'@': 406}), 52: (1, {'@': 406}), 53: (1, {'@': 406}), 39: (1, {'@': 406}), 40: (1, {'@': 406}), 41: (1, {'@': 406}), 42: (1, {'@': 406}), 55: (1, {'@': 406}), 43: (1, {'@': 406})}, 491: {56: (0, 388), 39: (0, 261), 57: (0, 333), 58: (0, 233), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 22: (0, 236), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 96: (0, 48), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 123})}, 492: {37: (0, 481), 45: (0, 504), 70: (0, 307), 39: (0, 261), 40: (0, 437), 75: (0, 682), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 493: {4: (1, {'@': 198}), 5: (1, {'@': 198}), 6: (1, {'@': 198}), 7: (1, {'@': 198}), 8: (1, {'@': 198}), 9: (1, {'@': 198}), 10: (1, {'@': 198}), 3: (1, {'@': 198}), 11: (1, {'@': 198}), 12: (1, {'@': 198}), 13: (1, {'@': 198}), 14: (1, {'@': 198}), 15: (1, {'@': 198}), 2: (1, {'@': 198}), 16: (1, {'@': 198}), 17: (1, {'@': 198}), 0: (1, {'@': 198}), 18: (1, {'@': 198}), 19: (1, {'@': 198}), 20: (1, {'@': 198}), 21: (1, {'@': 198}), 22: (1, {'@': 198}), 23: (1, {'@': 198}), 24: (1, {'@': 198}), 25: (1, {'@': 198}), 26: (1, {'@': 198}), 27: (1, {'@': 198}), 28: (1, {'@': 198}), 29: (1, {'@': 198}), 30: (1, {'@': 198}), 31: (1, {'@': 198}), 32: (1, {'@': 198}), 33: (1, {'@': 198}), 34: (1, {'@': 198}), 35: (1, {'@': 198}), 36: (1, {'@': 198}), 37: (1, {'@': 198}), 38: (1, {'@': 198}), 39: (1, {'@': 198}), 40: (1, {'@': 198}), 41: (1, {'@': 198}), 42: (1, {'@': 198}), 43: (1, {'@': 198}), 44: (1, {'@': 198}), 45: (1, {'@': 198}), 46: (1, {'@': 198}), 47: (1, {'@': 198}), 48: (1, {'@': 198}), 49: (1, {'@': 198}), 50: (1, {'@': 198}), 51: (1, {'@': 198}), 52: (1, {'@': 198}), 53: (1, {'@': 198}), 54: (1, {'@': 198}), 55: (1, {'@': 198})}, 494: {4: (1, {'@': 412}), 5: (1, {'@': 412}), 0: (1, {'@': 412}), 19: (1, {'@': 412}), 11: (1, {'@': 412}), 22: (1, {'@': 412}), 32: (1, {'@': 412}), 31: (1, {'@': 412}), 44: (1, {'@': 412}), 54: (1, {'@': 412}), 33: (1, {'@': 412}), 34: (1, {'@': 412}), 45: (1, {'@': 412}), 46: (1, {'@': 412}), 35: (1, {'@': 412}), 36: (1, {'@': 412}), 37: (1, {'@': 412}), 47: (1, {'@': 412}), 49: (1, {'@': 412}), 50: (1, {'@': 412}), 51: (1, {'@': 412}), 38: (1, {'@': 412}), 52: (1, {'@': 412}), 53: (1, {'@': 412}), 39: (1, {'@': 412}), 40: (1, {'@': 412}), 41: (1, {'@': 412}), 42: (1, {'@': 412}), 55: (1, {'@': 412}), 43: (1, {'@': 412})}, 495: {0: (1, {'@': 239}), 22: (1, {'@': 239}), 31: (1, {'@': 239}), 32: (1, {'@': 239}), 44: (1, {'@': 239}), 54: (1, {'@': 239}), 33: (1, {'@': 239}), 34: (1, {'@': 239}), 45: (1, {'@': 239}), 46: (1, {'@': 239}), 35: (1, {'@': 239}), 36: (1, {'@': 239}), 37: (1, {'@': 239}), 47: (1, {'@': 239}), 49: (1, {'@': 239}), 50: (1, {'@': 239}), 51: (1, {'@': 239}), 38: (1, {'@': 239}), 52: (1, {'@': 239}), 53: (1, {'@': 239}), 39: (1, {'@': 239}), 40: (1, {'@': 239}), 41: (1, {'@': 239}), 42: (1, {'@': 239}), 55: (1, {'@': 239}), 43: (1, {'@': 239})}, 496: {0: (1, {'@': 154}), 32: (1, {'@': 154}), 54: (1, {'@': 154})}, 497: {5: (0, 539)}, 498: {33: (1, {'@': 179}), 34: (1, {'@': 179}), 35: (1, {'@': 179}), 36: (1, {'@': 179}), 37: (1, {'@': 179}), 39: (1, {'@': 179}), 40: (1, {'@': 179}), 41: (1, {'@': 179}), 42: (1, {'@': 179}), 43: (1, {'@': 179}), 4: (1, {'@': 179}), 45: (1, {'@': 179}), 46: (1, {'@': 179}), 11: (1, {'@': 179}), 47: (1, {'@': 179}), 49: (1, {'@': 179}), 50: (1, {'@': 179}), 51: (1, {'@': 179}), 52: (1, {'@': 179}), 53: (1, {'@': 179}), 55: (1, {'@': 179})}, 499: {33: (1, {'@': 468}), 34: (1, {'@': 468}), 35: (1, {'@': 468}), 12: (1, {'@': 468}), 36: (1, {'@': 468}), 37: (1, {'@': 468}), 21: (1, {'@': 468}), 38: (1, {'@': 468}), 23: (1, {'@': 468}), 39: (1, {'@': 468}), 40: (1, {'@': 468}), 41: (1, {'@': 468}), 26: (1, {'@': 468}), 42: (1, {'@': 468}), 43: (1, {'@': 468}), 4: (1, {'@': 468}), 45: (1, {'@': 468}), 5: (1, {'@': 468}), 6: (1, {'@': 468}), 8: (1, {'@': 468}), 9: (1, {'@': 468}), 46: (1, {'@': 468}), 11: (1, {'@': 468}), 13: (1, {'@': 468}), 47: (1, {'@': 468}), 16: (1, {'@': 468}), 49: (1, {'@': 468}), 50: (1, {'@': 468}), 19: (1, {'@': 468}), 51: (1, {'@': 468}), 52: (1, {'@': 468}), 53: (1, {'@': 468}), 55: (1, {'@': 468}), 28: (1, {'@': 468})}, 500: {0: (0, 318)}, 501: {6: (1, {'@': 328}), 9: (1, {'@': 328}), 26: (1, {'@': 328}), 13: (1, {'@': 328}), 28: (1, {'@': 328}), 33: (1, {'@': 497}), 34: (1, {'@': 497}), 4: (1, {'@': 497}), 45: (1, {'@': 497}), 5: (1, {'@': 497}), 46: (1, {'@': 497}), 35: (1, {'@': 497}), 11: (1, {'@': 497}), 36: (1, {'@': 497}), 37: (1, {'@': 497}), 47: (1, {'@': 497}), 49: (1, {'@': 497}), 50: (1, {'@': 497}), 19: (1, {'@': 497}), 51: (1, {'@': 497}), 38: (1, {'@': 497}), 52: (1, {'@': 497}), 53: (1, {'@': 497}), 39: (1, {'@': 497}), 40: (1, {'@': 497}), 41: (1, {'@': 497}), 42: (1, {'@': 497}), 55: (1, {'@': 497}), 43: (1, {'@': 497})}, 502: {33: (1, {'@': 230}), 34: (1, {'@': 230}), 35: (1, {'@': 230}), 36: (1, {'@': 230}), 37: (1, {'@': 230}), 38: (1, {'@': 230}), 39: (1, {'@': 230}), 40: (1, {'@': 230}), 41: (1, {'@': 230}), 42: (1, {'@': 230}), 43: (1, {'@': 230}), 45: (1, {'@': 230}), 46: (1, {'@': 230}), 47: (1, {'@': 230}), 49: (1, {'@': 230}), 50: (1, {'@': 230}), 51: (1, {'@': 230}), 52: (1, {'@': 230}), 53: (1, {'@': 230}), 55: (1, {'@': 230})}, 503: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 93: (0, 281), 50: (0, 600)}, 504: {56: (0, 388), 39: (0, 261), 58: (0, 215), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 236: (0, 83), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 237: (0, 119), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 199: (0, 229), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 238: (0, 199), 215: (0, 157), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 505: {37: (0, 481), 224: (0, 1), 45: (0, 504), 70: (0, 652), 225: (0, 603), 88: (0, 573), 40: (0, 437), 205: (0, 434), 226: (0, 112), 43: (0, 519), 71: (0, 661), 227: (0, 77), 33: (0, 283), 228: (0, 94), 229: (0, 88), 46: (0, 534), 49: (0, 669), 47: (0, 675), 41: (0, 458), 233: (0, 99), 230: (0, 22), 206: (0, 81), 34: (0, 483), 53: (0, 618), 231: (0, 104), 232: (0, 46), 51: (0, 540), 82: (0, 593), 36: (0, 276), 99: (0, 531), 234: (0, 70), 67: (0, 60), 101: (0, 256), 35: (0, 365), 102: (0, 660), 235: (0, 243), 50: (0, 600)}, 506: {4: (1, {'@': 318}), 33: (1, {'@': 318}), 5: (1, {'@': 318}), 34: (1, {'@': 318}), 45: (1, {'@': 318}), 46: (1, {'@': 318}), 35: (1, {'@': 318}), 11: (1, {'@': 318}), 36: (1, {'@': 318}), 37: (1, {'@': 318}), 47: (1, {'@': 318}), 49: (1, {'@': 318}), 50: (1, {'@': 318}), 19: (1, {'@': 318}), 51: (1, {'@': 318}), 38: (1, {'@': 318}), 52: (1, {'@': 318}), 53: (1, {'@': 318}), 39: (1, {'@': 318}), 40: (1, {'@': 318}), 41: (1, {'@': 318}), 42: (1, {'@': 318}), 55: (1, {'@': 318}), 43: (1, {'@': 318})}, 507: {0: (1, {'@': 92}), 22: (1, {'@': 92}), 31: (1, {'@': 92}), 32: (1, {'@': 92}), 44: (1, {'@': 92}), 54: (1, {'@': 92}), 33: (1, {'@': 92}), 34: (1, {'@': 92}), 45: (1, {'@': 92}), 46: (1, {'@': 92}), 35: (1, {'@': 92}), 36: (1, {'@': 92}), 37: (1, {'@': 92}), 47: (1, {'@': 92}), 49: (1, {'@': 92}), 50: (1, {'@': 92}), 51: (1, {'@': 92}), 38: (1, {'@': 92}), 52: (1, {'@': 92}), 53: (1, {'@': 92}), 39: (1, {'@': 92}), 40: (1, {'@': 92}), 41: (1, {'@': 92}), 42: (1, {'@': 92}), 55: (1, {'@': 92}), 43: (1, {'@': 92})}, 508: {33: (1, {'@': 500}), 34: (1, {'@': 500}), 35: (1, {'@': 500}), 12: (1, {'@': 500}), 36: (1, {'@': 500}), 37: (1, {'@': 500}), 21: (1, {'@': 500}), 38: (1, {'@': 500}), 23: (1, {'@': 500}), 39: (1, {'@': 500}), 40: (1, {'@': 500}), 41: (1, {'@': 500}), 26: (1, {'@': 500}), 42: (1, {'@': 500}), 43: (1, {'@': 500}), 4: (1, {'@': 500}), 45: (1, {'@': 500}), 5: (1, {'@': 500}), 6: (1, {'@': 500}), 8: (1, {'@': 500}), 3: (1, {'@': 500}), 9: (1, {'@': 500}), 46: (1, {'@': 500}), 11: (1, {'@': 500}), 2: (1, {'@': 500}), 13: (1, {'@': 500}), 47: (1, {'@': 500}), 49: (1, {'@': 500}), 50: (1, {'@': 500}), 16: (1, {'@': 500}), 19: (1, {'@': 500}), 51: (1, {'@': 500}), 52: (1, {'@': 500}), 53: (1, {'@': 500}), 55: (1, {'@': 500}), 28: (1, {'@': 500})}, 509: {33: (1, {'@': 502}), 34: (1, {'@': 502}), 35: (1, {'@': 502}), 12: (1, {'@': 502}), 36: (1, {'@': 502}), 37: (1, {'@': 502}), 21: (1, {'@': 502}), 38: (1, {'@': 502}), 23: (1, {'@': 502}), 39: (1, {'@': 502}), 40: (1, {'@': 502}), 41: (1, {'@': 502}), 26: (1, {'@': 502}), 42: (1, {'@': 502}), 43: (1, {'@': 502}), 4: (1, {'@': 502}), 45: (1, {'@': 502}), 5: (1, {'@': 502}), 6: (1, {'@': 502}), 8: (1, {'@': 502}), 3: (1, {'@': 502}), 9: (1, {'@': 502}), 46: (1, {'@': 502}), 11: (1, {'@': 502}), 2: (1, {'@': 502}), 13: (1, {'@': 502}), 47: (1, {'@': 502}), 49: (1, {'@': 502}), 50: (1, {'@': 502}), 16: (1, {'@': 502}), 19: (1, {'@': 502}), 51: (1, {'@': 502}), 52: (1, {'@': 502}), 53: (1, {'@': 502}), 55: (1, {'@': 502}), 28: (1, {'@': 502})}, 510: {33: (1, {'@': 72}), 34: (1, {'@': 72}), 35: (1, {'@': 72}), 36: (1, {'@': 72}), 37: (1, {'@': 72}), 38: (1, {'@': 72}), 39: (1, {'@': 72}), 40: (1, {'@': 72}), 41: (1, {'@': 72}), 42: (1, {'@': 72}), 43: (1, {'@': 72}), 45: (1, {'@': 72}), 46: (1, {'@': 72}), 47: (1, {'@': 72}), 49: (1, {'@': 72}), 50: (1, {'@': 72}), 51: (1, {'@': 72}), 52: (1, {'@': 72}), 53: (1, {'@': 72}), 55: (1, {'@': 72})}, 511: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 105: (0, 166), 66: (0, 528), 67: (0, 470), 104: (0, 597), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 122), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 32: (0, 622), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 58: (0, 183), 34: (0, 483), 91: (0, 497), 37: (0, 481), 106: (0, 195), 107: (0, 196), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 512: {4: (1, {'@': 447}), 5: (1, {'@': 447}), 6: (1, {'@': 447}), 8: (1, {'@': 447}), 9: (1, {'@': 447}), 3: (1, {'@': 447}), 11: (1, {'@': 447}), 12: (1, {'@': 447}), 13: (1, {'@': 447}), 2: (1, {'@': 447}), 48: (1, {'@': 447}), 16: (1, {'@': 447}), 0: (1, {'@': 447}), 19: (1, {'@': 447}), 21: (1, {'@': 447}), 23: (1, {'@': 447}), 26: (1, {'@': 447}), 54: (1, {'@': 447}), 32: (1, {'@': 447}), 28: (1, {'@': 447}), 33: (1, {'@': 447}), 34: (1, {'@': 447}), 35: (1, {'@': 447}), 36: (1, {'@': 447}), 37: (1, {'@': 447}), 38: (1, {'@': 447}), 39: (1, {'@': 447}), 40: (1, {'@': 447}), 41: (1, {'@': 447}), 42: (1, {'@': 447}), 43: (1, {'@': 447}), 45: (1, {'@': 447}), 46: (1, {'@': 447}), 47: (1, {'@': 447}), 49: (1, {'@': 447}), 50: (1, {'@': 447}), 51: (1, {'@': 447}), 52: (1, {'@': 447}), 53: (1, {'@': 447}), 55: (1, {'@': 447}), 44: (1, {'@': 447}), 31: (1, {'@': 447}), 22: (1, {'@': 447})}, 513: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 93: (0, 609), 50: (0, 600)}, 514: {0: (0, 680)}, 515: {25: (0, 87), 203: (0, 51), 10: (0, 155), 172: (0, 191), 169: (0, 210), 14: (0, 180), 170: (0, 225), 29: (0, 498), 30: (0, 438), 24: (0, 640), 27: (0, 427), 17: (0, 480), 18: (0, 489), 20: (0, 520), 176: (0, 471), 15: (0, 460), 7: (0, 523)}, 516: {5: (1, {'@': 458}), 0: (1, {'@': 293})}, 517: {37: (0, 481), 180: (0, 317), 4: (0, 314), 70: (0, 307), 45: (0, 504), 39: (0, 261), 181: (0, 357), 191: (0, 541), 182: (0, 422), 40: (0, 437), 183: (0, 431), 93: (0, 542), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 193: (0, 363), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 34: (0, 483), 185: (0, 352), 186: (0, 589), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 194: (0, 394), 50: (0, 600)}, 518: {37: (0, 481), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 77: (0, 608), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 519: {4: (1, {'@': 189}), 5: (1, {'@': 189}), 6: (1, {'@': 189}), 7: (1, {'@': 189}), 8: (1, {'@': 189}), 9: (1, {'@': 189}), 10: (1, {'@': 189}), 3: (1, {'@': 189}), 11: (1, {'@': 189}), 12: (1, {'@': 189}), 13: (1, {'@': 189}), 14: (1, {'@': 189}), 15: (1, {'@': 189}), 2: (1, {'@': 189}), 16: (1, {'@': 189}), 17: (1, {'@': 189}), 0: (1, {'@': 189}), 18: (1, {'@': 189}), 19: (1, {'@': 189}), 20: (1, {'@': 189}), 21: (1, {'@': 189}), 22: (1, {'@': 189}), 23: (1, {'@': 189}), 24: (1, {'@': 189}), 25: (1, {'@': 189}), 26: (1, {'@': 189}), 27: (1, {'@': 189}), 28: (1, {'@': 189}), 29: (1, {'@': 189}), 30: (1, {'@': 189}), 31: (1, {'@': 189}), 32: (1, {'@': 189}), 33: (1, {'@': 189}), 34: (1, {'@': 189}), 35: (1, {'@': 189}), 36: (1, {'@': 189}), 37: (1, {'@': 189}), 38: (1, {'@': 189}), 39: (1, {'@': 189}), 40: (1, {'@': 189}), 41: (1, {'@': 189}), 42: (1, {'@': 189}), 43: (1, {'@': 189}), 44: (1, {'@': 189}), 45: (1, {'@': 189}), 46: (1, {'@': 189}), 47: (1, {'@': 189}), 48: (1, {'@': 189}), 49: (1, {'@': 189}), 50: (1, {'@': 189}), 51: (1, {'@': 189}), 52: (1, {'@': 189}), 53: (1, {'@': 189}), 54: (1, {'@': 189}), 55: (1, {'@': 189})}, 520: {33: (1, {'@': 180}), 34: (1, {'@': 180}), 35: (1, {'@': 180}), 36: (1, {'@': 180}), 37: (1, {'@': 180}), 39: (1, {'@': 180}), 40: (1, {'@': 180}), 41: (1, {'@': 180}), 42: (1, {'@': 180}), 43: (1, {'@': 180}), 4: (1, {'@': 180}), 45: (1, {'@': 180}), 46: (1, {'@': 180}), 11: (1, {'@': 180}), 47: (1, {'@': 180}), 49: (1, {'@': 180}), 50: (1, {'@': 180}), 51: (1, {'@': 180}), 52: (1, {'@': 180}), 53: (1, {'@': 180}), 55: (1, {'@': 180})}, 521: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 93: (0, 501), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 522: {56: (0, 388), 39: (0, 261), 58: (0, 163), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 215: (0, 154), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 238: (0, 63), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 523: {33: (1, {'@': 184}), 34: (1, {'@': 184}), 35: (1, {'@': 184}), 36: (1, {'@': 184}), 37: (1, {'@': 184}), 39: (1, {'@': 184}), 40: (1, {'@': 184}), 41: (1, {'@': 184}), 42: (1, {'@': 184}), 43: (1, {'@': 184}), 4: (1, {'@': 184}), 45: (1, {'@': 184}), 46: (1, {'@': 184}), 11: (1, {'@': 184}), 47: (1, {'@': 184}), 49: (1, {'@': 184}), 50: (1, {'@': 184}), 51: (1, {'@': 184}), 52: (1, {'@': 184}), 53: (1, {'@': 184}), 55: (1, {'@': 184})}, 524: {5: (1, {'@': 153}), 32: (1, {'@': 153}), 0: (1, {'@': 153}), 54: (1, {'@': 153})}, 525: {4: (1, {'@': 137}), 5: (1, {'@': 137}), 6: (1, {'@': 137}), 7: (1, {'@': 137}), 8: (1, {'@': 137}), 9: (1, {'@': 137}), 10: (1, {'@': 137}), 3: (1, {'@': 137}), 11: (1, {'@': 137}), 12: (1, {'@': 137}), 13: (1, {'@': 137}), 14: (1, {'@': 137}), 15: (1, {'@': 137}), 2: (1, {'@': 137}), 16: (1, {'@': 137}), 17: (1, {'@': 137}), 0: (1, {'@': 137}), 18: (1, {'@': 137}), 19: (1, {'@': 137}), 20: (1, {'@': 137}), 21: (1, {'@': 137}), 22: (1, {'@': 137}), 23: (1, {'@': 137}), 24: (1, {'@': 137}), 25: (1, {'@': 137}), 26: (1, {'@': 137}), 27: (1, {'@': 137}), 28: (1, {'@': 137}), 29: (1, {'@': 137}), 30: (1, {'@': 137}), 31: (1, {'@': 137}), 32: (1, {'@': 137}), 33: (1, {'@': 137}), 34: (1, {'@': 137}), 35: (1, {'@': 137}), 36: (1, {'@': 137}), 37: (1, {'@': 137}), 38: (1, {'@': 137}), 39: (1, {'@': 137}), 40: (1, {'@': 137}), 41: (1, {'@': 137}), 42: (1, {'@': 137}), 43: (1, {'@': 137}), 44: (1, {'@': 137}), 45: (1, {'@': 137}), 46: (1, {'@': 137}), 47: (1, {'@': 137}), 48: (1, {'@': 137}), 49: (1, {'@': 137}), 50: (1, {'@': 137}), 51: (1, {'@': 137}), 52: (1, {'@': 137}), 53: (1, {'@': 137}), 54: (1, {'@': 137}), 55: (1, {'@': 137})}, 526: {4: (1, {'@': 131}), 5: (1, {'@': 131}), 6: (1, {'@': 131}), 7: (1, {'@': 131}), 8: (1, {'@': 131}), 9: (1, {'@': 131}), 10: (1, {'@': 131}), 3: (1, {'@': 131}), 11: (1, {'@': 131}), 12: (1, {'@': 131}), 13: (1, {'@': 131}), 14: (1, {'@': 131}), 15: (1, {'@': 131}), 2: (1, {'@': 131}), 16: (1, {'@': 131}), 17: (1, {'@': 131}), 0: (1, {'@': 131}), 18: (1, {'@': 131}), 19: (1, {'@': 131}), 20: (1, {'@': 131}), 21: (1, {'@': 131}), 22: (1, {'@': 131}), 23: (1, {'@': 131}), 24: (1, {'@': 131}), 25: (1, {'@': 131}), 26: (1, {'@': 131}), 27: (1, {'@': 131}), 28: (1, {'@': 131}), 29: (1, {'@': 131}), 30: (1, {'@': 131}), 31: (1, {'@': 131}), 32: (1, {'@': 131}), 33: (1, {'@': 131}), 34: (1, {'@': 131}), 35: (1, {'@': 131}), 36: (1, {'@': 131}), 37: (1, {'@': 131}), 38: (1, {'@': 131}), 39: (1, {'@': 131}), 40: (1, {'@': 131}), 41: (1, {'@': 131}), 42: (1, {'@': 131}), 43: (1, {'@': 131}), 44: (1, {'@': 131}), 45: (1, {'@': 131}), 46: (1, {'@': 131}), 47: (1, {'@': 131}), 48: (1, {'@': 131}), 49: (1, {'@': 131}), 50: (1, {'@': 131}), 51: (1, {'@': 131}), 52: (1, {'@': 131}), 53: (1, {'@': 131}), 54: (1, {'@': 131}), 55: (1, {'@': 131})}, 527: {0: (1, {'@': 89}), 22: (1, {'@': 89}), 31: (1, {'@': 89}), 32: (1, {'@': 89}), 44: (1, {'@': 89}), 54: (1, {'@': 89}), 33: (1, {'@': 89}), 34: (1, {'@': 89}), 45: (1, {'@': 89}), 46: (1, {'@': 89}), 35: (1, {'@': 89}), 36: (1, {'@': 89}), 37: (1, {'@': 89}), 47: (1, {'@': 89}), 49: (1, {'@': 89}), 50: (1, {'@': 89}), 51: (1, {'@': 89}), 38: (1, {'@': 89}), 52: (1, {'@': 89}), 53: (1, {'@': 89}), 39: (1, {'@': 89}), 40: (1, {'@': 89}), 41: (1, {'@': 89}), 42: (1, {'@': 89}), 55: (1, {'@': 89}), 43: (1, {'@': 89})}, 528: {4: (1, {'@': 139}), 5: (1, {'@': 139}), 6: (1, {'@': 139}), 7: (1, {'@': 139}), 8: (1, {'@': 139}), 9: (1, {'@': 139}), 10: (1, {'@': 139}), 3: (1, {'@': 139}), 11: (1, {'@': 139}), 12: (1, {'@': 139}), 13: (1, {'@': 139}), 14: (1, {'@': 139}), 15: (1, {'@': 139}), 2: (1, {'@': 139}), 16: (1, {'@': 139}), 17: (1, {'@': 139}), 0: (1, {'@': 139}), 18: (1, {'@': 139}), 19: (1, {'@': 139}), 20: (1, {'@': 139}), 21: (1, {'@': 139}), 22: (1, {'@': 139}), 23: (1, {'@': 139}), 24: (1, {'@': 139}), 25: (1, {'@': 139}), 26: (1, {'@': 139}), 27: (1, {'@': 139}), 28: (1, {'@': 139}), 29: (1, {'@': 139}), 30: (1, {'@': 139}), 31: (1, {'@': 139}), 32: (1, {'@': 139}), 33: (1, {'@': 139}), 34: (1, {'@': 139}), 35: (1, {'@': 139}), 36: (1, {'@': 139}), 37: (1, {'@': 139}), 38: (1, {'@': 139}), 39: (1, {'@': 139}), 40: (1, {'@': 139}), 41: (1, {'@': 139}), 42: (1, {'@': 139}), 43: (1, {'@': 139}), 44: (1, {'@': 139}), 45: (1, {'@': 139}), 46: (1, {'@': 139}), 47: (1, {'@': 139}), 48: (1, {'@': 139}), 49: (1, {'@': 139}), 50: (1, {'@': 139}), 51: (1, {'@': 139}), 52: (1, {'@': 139}), 53: (1, {'@': 139}), 54: (1, {'@': 139}), 55: (1, {'@': 139})}, 529: {4: (1, {'@': 441}), 5: (1, {'@': 441}), 6: (1, {'@': 441}), 8: (1, {'@': 441}), 3: (1, {'@': 441}), 9: (1, {'@': 441}), 11: (1, {'@': 441}), 12: (1, {'@': 441}), 2: (1, {'@': 441}), 13: (1, {'@': 441}), 16: (1, {'@': 441}), 0: (1, {'@': 441}), 19: (1, {'@': 441}), 21: (1, {'@': 441}), 22: (1, {'@': 441}), 23: (1, {'@': 441}), 26: (1, {'@': 441}), 28: (1, {'@': 441}), 31: (1, {'@': 441}), 32: (1, {'@': 441}), 54: (1, {'@': 441}), 44: (1, {'@': 441}), 33: (1, {'@': 441}), 34: (1, {'@': 441}), 35: (1, {'@': 441}), 36: (1, {'@': 441}), 37: (1, {'@': 441}), 38: (1, {'@': 441}), 39: (1, {'@': 441}), 40: (1, {'@': 441}), 41: (1, {'@': 441}), 42: (1, {'@': 441}), 43: (1, {'@': 441}), 45: (1, {'@': 441}), 46: (1, {'@': 441}), 47: (1, {'@': 441}), 49: (1, {'@': 441}), 50: (1, {'@': 441}), 51: (1, {'@': 441}), 52: (1, {'@': 441}), 53: (1, {'@': 441}), 55: (1, {'@': 441})}, 530: {4: (1, {'@': 310}), 33: (1, {'@': 310}), 34: (1, {'@': 310}), 5: (1, {'@': 310}), 45: (1, {'@': 310}), 46: (1, {'@': 310}), 35: (1, {'@': 310}), 11: (1, {'@': 310}), 36: (1, {'@': 310}), 37: (1, {'@': 310}), 47: (1, {'@': 310}), 49: (1, {'@': 310}), 50: (1, {'@': 310}), 19: (1, {'@': 310}), 51: (1, {'@': 310}), 38: (1, {'@': 310}), 52: (1, {'@': 310}), 53: (1, {'@': 310}), 39: (1, {'@': 310}), 40: (1, {'@': 310}), 41: (1, {'@': 310}), 42: (1, {'@': 310}), 55: (1, {'@': 310}), 43: (1, {'@': 310})}, 531: {4: (1, {'@': 194}), 5: (1, {'@': 194}), 6: (1, {'@': 194}), 7: (1, {'@': 194}), 8: (1, {'@': 194}), 9: (1, {'@': 194}), 10: (1, {'@': 194}), 3: (1, {'@': 194}), 11: (1, {'@': 194}), 12: (1, {'@': 194}), 13: (1, {'@': 194}), 14: (1, {'@': 194}), 15: (1, {'@': 194}), 2: (1, {'@': 194}), 16: (1, {'@': 194}), 17: (1, {'@': 194}), 0: (1, {'@': 194}), 18: (1, {'@': 194}), 19: (1, {'@': 194}), 20: (1, {'@': 194}), 21: (1, {'@': 194}), 22: (1, {'@': 194}), 23: (1, {'@': 194}), 24: (1, {'@': 194}), 25: (1, {'@': 194}), 26: (1, {'@': 194}), 27: (1, {'@': 194}), 28: (1, {'@': 194}), 29: (1, {'@': 194}), 30: (1, {'@': 194}), 31: (1, {'@': 194}), 32: (1, {'@': 194}), 33: (1, {'@': 194}), 34: (1, {'@': 194}), 35: (1, {'@': 194}), 36: (1, {'@': 194}), 37: (1, {'@': 194}), 38: (1, {'@': 194}), 39: (1, {'@': 194}), 40: (1, {'@': 194}), 41: (1, {'@': 194}), 42: (1, {'@': 194}), 43: (1, {'@': 194}), 44: (1, {'@': 194}), 45: (1, {'@': 194}), 46: (1, {'@': 194}), 47: (1, {'@': 194}), 48: (1, {'@': 194}), 49: (1, {'@': 194}), 50: (1, {'@': 194}), 51: (1, {'@': 194}), 52: (1, {'@': 194}), 53: (1, {'@': 194}), 54: (1, {'@': 194}), 55: (1, {'@': 194})}, 532: {177: (0, 202), 26: (0, 121)}, 533: {37: (0, 481), 180: (0, 317), 4: (0, 314), 70: (0, 307), 45: (0, 504), 39: (0, 261), 185: (0, 499), 181: (0, 357), 182: (0, 422), 40: (0, 437), 183: (0, 431), 93: (0, 404), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 34: (0, 483), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 186: (0, 423), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 534: {4: (1, {'@': 203}), 5: (1, {'@': 203}), 6: (1, {'@': 203}), 7: (1, {'@': 203}), 8: (1, {'@': 203}), 9: (1, {'@': 203}), 10: (1, {'@': 203}), 3: (1, {'@': 203}), 11: (1, {'@': 203}), 12: (1, {'@': 203}), 13: (1, {'@': 203}), 14: (1, {'@': 203}), 15: (1, {'@': 203}), 2: (1, {'@': 203}), 29: (1, {'@': 203}), 16: (1, {'@': 203}), 17: (1, {'@': 203}), 0: (1, {'@': 203}), 18: (1, {'@': 203}), 19: (1, {'@': 203}), 20: (1, {'@': 203}), 21: (1, {'@': 203}), 22: (1, {'@': 203}), 23: (1, {'@': 203}), 24: (1, {'@': 203}), 25: (1, {'@': 203}), 26: (1, {'@': 203}), 27: (1, {'@': 203}), 28: (1, {'@': 203}), 178: (1, {'@': 203}), 30: (1, {'@': 203}), 200: (1, {'@': 203}), 32: (1, {'@': 203}), 31: (1, {'@': 203}), 33: (1, {'@': 203}), 34: (1, {'@': 203}), 35: (1, {'@': 203}), 36: (1, {'@': 203}), 37: (1, {'@': 203}), 38: (1, {'@': 203}), 39: (1, {'@': 203}), 40: (1, {'@': 203}), 41: (1, {'@': 203}), 42: (1, {'@': 203}), 43: (1, {'@': 203}), 44: (1, {'@': 203}), 45: (1, {'@': 203}), 46: (1, {'@': 203}), 47: (1, {'@': 203}), 48: (1, {'@': 203}), 49: (1, {'@': 203}), 50: (1, {'@': 203}), 51: (1, {'@': 203}), 52: (1, {'@': 203}), 53: (1, {'@': 203}), 54: (1, {'@': 203}), 55: (1, {'@': 203})}, 535: {33: (1, {'@': 87}), 34: (1, {'@': 87}), 45: (1, {'@': 87}), 46: (1, {'@': 87}), 35: (1, {'@': 87}), 36: (1, {'@': 87}), 37: (1, {'@': 87}), 47: (1, {'@': 87}), 49: (1, {'@': 87}), 50: (1, {'@': 87}), 51: (1, {'@': 87}), 38: (1, {'@': 87}), 52: (1, {'@': 87}), 53: (1, {'@': 87}), 39: (1, {'@': 87}), 40: (1, {'@': 87}), 41: (1, {'@': 87}), 42: (1, {'@': 87}), 55: (1, {'@': 87}), 43: (1, {'@': 87})}, 536: {4: (1, {'@': 350}), 32: (1, {'@': 350}), 0: (1, {'@': 350}), 19: (1, {'@': 350}), 11: (1, {'@': 350}), 54: (1, {'@': 350}), 48: (1, {'@': 350}), 5: (1, {'@': 350})}, 537: {37: (0, 481), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 77: (0, 338), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 538: {4: (1, {'@': 449}), 5: (1, {'@': 449}), 6: (1, {'@': 449}), 8: (1, {'@': 449}), 3: (1, {'@': 449}), 9: (1, {'@': 449}), 11: (1, {'@': 449}), 12: (1, {'@': 449}), 2: (1, {'@': 449}), 13: (1, {'@': 449}), 48: (1, {'@': 449}), 16: (1, {'@': 449}), 0: (1, {'@': 449}), 19: (1, {'@': 449}), 21: (1, {'@': 449}), 23: (1, {'@': 449}), 26: (1, {'@': 449}), 54: (1, {'@': 449}), 32: (1, {'@': 449}), 28: (1, {'@': 449}), 33: (1, {'@': 449}), 34: (1, {'@': 449}), 35: (1, {'@': 449}), 36: (1, {'@': 449}), 37: (1, {'@': 449}), 38: (1, {'@': 449}), 39: (1, {'@': 449}), 40: (1, {'@': 449}), 41: (1, {'@': 449}), 42: (1, {'@': 449}), 43: (1, {'@': 449}), 45: (1, {'@': 449}), 46: (1, {'@': 449}), 47: (1, {'@': 449}), 49: (1, {'@': 449}), 50: (1, {'@': 449}), 51: (1, {'@': 449}), 52: (1, {'@': 449}), 53: (1, {'@': 449}), 55: (1, {'@': 449}), 44: (1, {'@': 449}), 31: (1, {'@': 449}), 22: (1, {'@': 449})}, 539: {138: (0, 80), 139: (0, 596), 140: (0, 693), 40: (0, 437), 141: (0, 590), 67: (0, 630), 142: (0, 615), 143: (0, 637), 45: (0, 504), 68: (0, 676), 50: (0, 600), 144: (0, 273), 70: (0, 652), 71: (0, 661), 145: (0, 706), 49: (0, 669), 47: (0, 675), 146: (0, 462), 53: (0, 618), 82: (0, 593), 147: (0, 249), 148: (0, 295), 85: (0, 392), 150: (0, 594), 26: (0, 604), 33: (0, 283), 76: (0, 35), 151: (0, 315), 36: (0, 276), 152: (0, 457), 153: (0, 685), 154: (0, 144), 34: (0, 483), 37: (0, 481), 43: (0, 519), 155: (0, 440), 156: (0, 653), 46: (0, 534), 149: (0, 349), 41: (0, 458), 88: (0, 311), 51: (0, 540), 157: (0, 536), 99: (0, 531), 79: (0, 451), 101: (0, 256), 35: (0, 365), 102: (0, 660)}, 540: {4: (1, {'@': 190}), 5: (1, {'@': 190}), 6: (1, {'@': 190}), 7: (1, {'@': 190}), 8: (1, {'@': 190}), 9: (1, {'@': 190}), 10: (1, {'@': 190}), 3: (1, {'@': 190}), 11: (1, {'@': 190}), 12: (1, {'@': 190}), 13: (1, {'@': 190}), 14: (1, {'@': 190}), 15: (1, {'@': 190}), 2: (1, {'@': 190}), 16: (1, {'@': 190}), 17: (1, {'@': 190}), 0: (1, {'@': 190}), 18: (1, {'@': 190}), 19: (1, {'@': 190}), 20: (1, {'@': 190}), 21: (1, {'@': 190}), 22: (1, {'@': 190}), 23: (1, {'@': 190}), 24: (1, {'@': 190}), 25: (1, {'@': 190}), 26: (1, {'@': 190}), 27: (1, {'@': 190}), 28: (1, {'@': 190}), 29: (1, {'@': 190}), 30: (1, {'@': 190}), 31: (1, {'@': 190}), 32: (1, {'@': 190}), 33: (1, {'@': 190}), 34: (1, {'@': 190}), 35: (1, {'@': 190}), 36: (1, {'@': 190}), 37: (1, {'@': 190}), 38: (1, {'@': 190}), 39: (1, {'@': 190}), 40: (1, {'@': 190}), 41: (1, {'@': 190}), 42: (1, {'@': 190}), 43: (1, {'@': 190}), 44: (1, {'@': 190}), 45: (1, {'@': 190}), 46: (1, {'@': 190}), 47: (1, {'@': 190}), 48: (1, {'@': 190}), 49: (1, {'@': 190}), 50: (1, {'@': 190}), 51: (1, {'@': 190}), 52: (1, {'@': 190}), 53: (1, {'@': 190}), 54: (1, {'@': 190}), 55: (1, {'@': 190})}, 541: {33: (1, {'@': 279}), 34: (1, {'@': 279}), 35: (1, {'@': 279}), 36: (1, {'@': 279}), 37: (1, {'@': 279}), 38: (1, {'@': 279}), 39: (1, {'@': 279}), 40: (1, {'@': 279}), 41: (1, {'@': 279}), 42: (1, {'@': 279}), 32: (1, {'@': 279}), 43: (1, {'@': 279}), 44: (1, {'@': 279}), 4: (1, {'@': 279}), 45: (1, {'@': 279}), 46: (1, {'@': 279}), 31: (1, {'@': 279}), 11: (1, {'@': 279}), 47: (1, {'@': 279}), 49: (1, {'@': 279}), 50: (1, {'@': 279}), 0: (1, {'@': 279}), 19: (1, {'@': 279}), 22: (1, {'@': 279}), 51: (1, {'@': 279}), 52: (1, {'@': 279}), 53: (1, {'@': 279}), 54: (1, {'@': 279}), 55: (1, {'@': 279}), 5: (1, {'@': 279}), 48: (1, {'@': 279})}, 542: {2: (1, {'@': 488}), 3: (1, {'@': 488}), 30: (1, {'@': 268}), 24: (1, {'@': 268}), 7: (1, {'@': 268}), 25: (1, {'@': 268}), 10: (1, {'@': 268}), 27: (1, {'@': 268}), 14: (1, {'@': 268}), 15: (1, {'@': 268}), 17: (1, {'@': 268}), 29: (1, {'@': 268}), 18: (1, {'@': 268}), 20: (1, {'@': 268}), 33: (1, {'@': 278}), 34: (1, {'@': 278}), 35: (1, {'@': 278}), 36: (1, {'@': 278}), 37: (1, {'@': 278}), 38: (1, {'@': 278}), 39: (1, {'@': 278}), 40: (1, {'@': 278}), 41: (1, {'@': 278}), 42: (1, {'@': 278}), 32: (1, {'@': 278}), 43: (1, {'@': 278}), 44: (1, {'@': 278}), 4: (1, {'@': 278}), 45: (1, {'@': 278}), 46: (1, {'@': 278}), 31: (1, {'@': 278}), 11: (1, {'@': 278}), 47: (1, {'@': 278}), 49: (1, {'@': 278}), 50: (1, {'@': 278}), 0: (1, {'@': 278}), 19: (1, {'@': 278}), 22: (1, {'@': 278}), 51: (1, {'@': 278}), 52: (1, {'@': 278}), 53: (1, {'@': 278}), 54: (1, {'@': 278}), 55: (1, {'@': 278}), 23: (1, {'@': 444}), 8: (1, {'@': 444}), 12: (1, {'@': 444}), 16: (1, {'@': 444}), 21: (1, {'@': 444}), 5: (1, {'@': 278}), 48: (1, {'@': 278})}, 543: {4: (1, {'@': 197}), 5: (1, {'@': 197}), 6: (1, {'@': 197}), 7: (1, {'@': 197}), 8: (1, {'@': 197}), 9: (1, {'@': 197}), 10: (1, {'@': 197}), 3: (1, {'@': 197}), 11: (1, {'@': 197}), 12: (1, {'@': 197}), 13: (1, {'@': 197}), 14: (1, {'@': 197}), 15: (1, {'@': 197}), 2: (1, {'@': 197}), 16: (1, {'@': 197}), 17: (1, {'@': 197}), 0: (1, {'@': 197}), 18: (1, {'@': 197}), 19: (1, {'@': 197}), 20: (1, {'@': 197}), 21: (1, {'@': 197}), 22: (1, {'@': 197}), 23: (1, {'@': 197}), 24: (1, {'@': 197}), 25: (1, {'@': 197}), 26: (1, {'@': 197}), 27: (1, {'@': 197}), 28: (1, {'@': 197}), 29: (1, {'@': 197}), 30: (1, {'@': 197}), 31: (1, {'@': 197}), 32: (1, {'@': 197}), 33: (1, {'@': 197}), 34: (1, {'@': 197}), 35: (1, {'@': 197}), 36: (1, {'@': 197}), 37: (1, {'@': 197}), 38: (1, {'@': 197}), 39: (1, {'@': 197}), 40: (1, {'@': 197}), 41: (1, {'@': 197}), 42: (1, {'@': 197}), 43: (1, {'@': 197}), 44: (1, {'@': 197}), 45: (1, {'@': 197}), 46: (1, {'@': 197}), 47: (1, {'@': 197}), 48: (1, {'@': 197}), 49: (1, {'@': 197}), 50: (1, {'@': 197}), 51: (1, {'@': 197}), 52: (1, {'@': 197}), 53: (1, {'@': 197}), 54: (1, {'@': 197}), 55: (1, {'@': 197})}, 544: {33: (1, {'@': 158}), 34: (1, {'@': 158}), 35: (1, {'@': 158}), 36: (1, {'@': 158}), 37: (1, {'@': 158}), 39: (1, {'@': 158}), 40: (1, {'@': 158}), 41: (1, {'@': 158}), 26: (1, {'@': 158}), 42: (1, {'@': 158}), 43: (1, {'@': 158}), 45: (1, {'@': 158}), 4: (1, {'@': 158}), 46: (1, {'@': 158}), 11: (1, {'@': 158}), 47: (1, {'@': 158}), 49: (1, {'@': 158}), 50: (1, {'@': 158}), 51: (1, {'@': 158}), 52: (1, {'@': 158}), 53: (1, {'@': 158}), 55: (1, {'@': 158})}, 545: {33: (1, {'@': 88}), 34: (1, {'@': 88}), 45: (1, {'@': 88}), 46: (1, {'@': 88}), 35: (1, {'@': 88}), 36: (1, {'@': 88}), 37: (1, {'@': 88}), 47: (1, {'@': 88}), 49: (1, {'@': 88}), 50: (1, {'@': 88}), 51: (1, {'@': 88}), 38: (1, {'@': 88}), 52: (1, {'@': 88}), 53: (1, {'@': 88}), 39: (1, {'@': 88}), 40: (1, {'@': 88}), 41: (1, {'@': 88}), 42: (1, {'@': 88}), 55: (1, {'@': 88}), 43: (1, {'@': 88})}, 546: {4: (1, {'@': 321}), 33: (1, {'@': 321}), 5: (1, {'@': 321}), 34: (1, {'@': 321}), 45: (1, {'@': 321}), 46: (1, {'@': 321}), 35: (1, {'@': 321}), 11: (1, {'@': 321}), 36: (1, {'@': 321}), 37: (1, {'@': 321}), 47: (1, {'@': 321}), 49: (1, {'@': 321}), 50: (1, {'@': 321}), 19: (1, {'@': 321}), 51: (1, {'@': 321}), 38: (1, {'@': 321}), 52: (1, {'@': 321}), 53: (1, {'@': 321}), 39: (1, {'@': 321}), 40: (1, {'@': 321}), 41: (1, {'@': 321}), 42: (1, {'@': 321}), 55: (1, {'@': 321}), 43: (1, {'@': 321})}, 547: {37: (0, 481), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483), 77: (0, 641)}, 548: {4: (1, {'@': 323}), 33: (1, {'@': 323}), 5: (1, {'@': 323}), 34: (1, {'@': 323}), 45: (1, {'@': 323}), 46: (1, {'@': 323}), 35: (1, {'@': 323}), 11: (1, {'@': 323}), 36: (1, {'@': 323}), 37: (1, {'@': 323}), 47: (1, {'@': 323}), 49: (1, {'@': 323}), 50: (1, {'@': 323}), 19: (1, {'@': 323}), 51: (1, {'@': 323}), 38: (1, {'@': 323}), 52: (1, {'@': 323}), 53: (1, {'@': 323}), 39: (1, {'@': 323}), 40: (1, {'@': 323}), 41: (1, {'@': 323}), 42: (1, {'@': 323}), 55: (1, {'@': 323}), 43: (1, {'@': 323})}, 549: {4: (1, {'@': 408}), 5: (1, {'@': 408}), 0: (1, {'@': 408}), 19: (1, {'@': 408}), 11: (1, {'@': 408}), 22: (1, {'@': 408}), 32: (1, {'@': 408}), 31: (1, {'@': 408}), 44: (1, {'@': 408}), 54: (1, {'@': 408}), 33: (1, {'@': 408}), 34: (1, {'@': 408}), 45: (1, {'@': 408}), 46: (1, {'@': 408}), 35: (1, {'@': 408}), 36: (1, {'@': 408}), 37: (1, {'@': 408}), 47: (1, {'@': 408}), 49: (1, {'@': 408}), 50: (1, {'@': 408}), 51: (1, {'@': 408}), 38: (1, {'@': 408}), 52: (1, {'@': 408}), 53: (1, {'@': 408}), 39: (1, {'@': 408}), 40: (1, {'@': 408}), 41: (1, {'@': 408}), 42: (1, {'@': 408}), 55: (1, {'@': 408}), 43: (1, {'@': 408})}, 550: {33: (1, {'@': 524}), 34: (1, {'@': 524}), 35: (1, {'@': 524}), 12: (1, {'@': 524}), 36: (1, {'@': 524}), 14: (1, {'@': 524}), 37: (1, {'@': 524}), 18: (1, {'@': 524}), 21: (1, {'@': 524}), 38: (1, {'@': 524}), 24: (1, {'@': 524}), 23: (1, {'@': 524}), 25: (1, {'@': 524}), 39: (1, {'@': 524}), 40: (1, {'@': 524}), 41: (1, {'@': 524}), 26: (1, {'@': 524}), 42: (1, {'@': 524}), 43: (1, {'@': 524}), 4: (1, {'@': 524}), 45: (1, {'@': 524}), 5: (1, {'@': 524}), 6: (1, {'@': 524}), 7: (1, {'@': 524}), 8: (1, {'@': 524}), 3: (1, {'@': 524}), 10: (1, {'@': 524}), 9: (1, {'@': 524}), 46: (1, {'@': 524}), 11: (1, {'@': 524}), 2: (1, {'@': 524}), 13: (1, {'@': 524}), 15: (1, {'@': 524}), 47: (1, {'@': 524}), 49: (1, {'@': 524}), 50: (1, {'@': 524}), 17: (1, {'@': 524}), 16: (1, {'@': 524}), 19: (1, {'@': 524}), 20: (1, {'@': 524}), 51: (1, {'@': 524}), 52: (1, {'@': 524}), 53: (1, {'@': 524}), 27: (1, {'@': 524}), 55: (1, {'@': 524}), 28: (1, {'@': 524}), 29: (1, {'@': 524}), 30: (1, {'@': 524})}, 551: {15: (1, {'@': 292}), 5: (1, {'@': 292}), 32: (1, {'@': 292}), 25: (1, {'@': 292}), 0: (1, {'@': 292}), 54: (1, {'@': 292})}, 552: {0: (1, {'@': 338}), 22: (1, {'@': 338}), 31: (1, {'@': 338}), 32: (1, {'@': 338}), 44: (1, {'@': 338}), 54: (1, {'@': 338}), 33: (1, {'@': 338}), 34: (1, {'@': 338}), 45: (1, {'@': 338}), 46: (1, {'@': 338}), 35: (1, {'@': 338}), 36: (1, {'@': 338}), 37: (1, {'@': 338}), 47: (1, {'@': 338}), 49: (1, {'@': 338}), 50: (1, {'@': 338}), 51: (1, {'@': 338}), 38: (1, {'@': 338}), 52: (1, {'@': 338}), 53: (1, {'@': 338}), 39: (1, {'@': 338}), 40: (1, {'@': 338}), 41: (1, {'@': 338}), 42: (1, {'@': 338}), 55: (1, {'@': 338}), 43: (1, {'@': 338})}, 553: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 32: (0, 176), 63: (0, 507), 64: (0, 526), 65: (0, 466), 105: (0, 166), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 104: (0, 207), 50: (0, 600), 69: (0, 688), 70: (0, 122), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 58: (0, 183), 34: (0, 483), 91: (0, 497), 37: (0, 481), 106: (0, 195), 107: (0, 196), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 554: {4: (1, {'@': 413}), 5: (1, {'@': 413}), 0: (1, {'@': 413}), 19: (1, {'@': 413}), 11: (1, {'@': 413}), 22: (1, {'@': 413}), 32: (1, {'@': 413}), 31: (1, {'@': 413}), 44: (1, {'@': 413}), 54: (1, {'@': 413}), 33: (1, {'@': 413}), 34: (1, {'@': 413}), 45: (1, {'@': 413}), 46: (1, {'@': 413}), 35: (1, {'@': 413}), 36: (1, {'@': 413}), 37: (1, {'@': 413}), 47: (1, {'@': 413}), 49: (1, {'@': 413}), 50: (1, {'@': 413}), 51: (1, {'@': 413}), 38: (1, {'@': 413}), 52: (1, {'@': 413}), 53: (1, {'@': 413}), 39: (1, {'@': 413}), 40: (1, {'@': 413}), 41: (1, {'@': 413}), 42: (1, {'@': 413}), 55: (1, {'@': 413}), 43: (1, {'@': 413})}, 555: {}, 556: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 79: (0, 634), 78: (0, 666), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 58: (0, 694), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 121})}, 557: {32: (0, 161)}, 558: {37: (0, 481), 36: (0, 276), 70: (0, 347), 46: (0, 534)}, 559: {4: (1, {'@': 259}), 5: (1, {'@': 259}), 6: (1, {'@': 259}), 7: (1, {'@': 259}), 8: (1, {'@': 259}), 9: (1, {'@': 259}), 10: (1, {'@': 259}), 3: (1, {'@': 259}), 11: (1, {'@': 259}), 12: (1, {'@': 259}), 13: (1, {'@': 259}), 14: (1, {'@': 259}), 15: (1, {'@': 259}), 2: (1, {'@': 259}), 16: (1, {'@': 259}), 17: (1, {'@': 259}), 0: (1, {'@': 259}), 18: (1, {'@': 259}), 19: (1, {'@': 259}), 20: (1, {'@': 259}), 21: (1, {'@': 259}), 22: (1, {'@': 259}), 23: (1, {'@': 259}), 24: (1, {'@': 259}), 25: (1, {'@': 259}), 26: (1, {'@': 259}), 27: (1, {'@': 259}), 28: (1, {'@': 259}), 29: (1, {'@': 259}), 30: (1, {'@': 259}), 31: (1, {'@': 259}), 32: (1, {'@': 259}), 54: (1, {'@': 259}), 44: (1, {'@': 259}), 33: (1, {'@': 259}), 34: (1, {'@': 259}), 35: (1, {'@': 259}), 36: (1, {'@': 259}), 37: (1, {'@': 259}), 38: (1, {'@': 259}), 39: (1, {'@': 259}), 40: (1, {'@': 259}), 41: (1, {'@': 259}), 42: (1, {'@': 259}), 43: (1, {'@': 259}), 45: (1, {'@': 259}), 46: (1, {'@': 259}), 47: (1, {'@': 259}), 49: (1, {'@': 259}), 50: (1, {'@': 259}), 51: (1, {'@': 259}), 52: (1, {'@': 259}), 53: (1, {'@': 259}), 55: (1, {'@': 259})}, 560: {37: (0, 481), 45: (0, 504), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 428), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 561: {31: (0, 659), 54: (1, {'@': 298}), 0: (1, {'@': 298})}, 562: {56: (0, 388), 39: (0, 261), 57: (0, 333), 58: (0, 233), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 22: (0, 236), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 96: (0, 168), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 123})}, 563: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 184: (0, 222), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 204: (0, 674), 53: (0, 618), 51: (0, 540), 183: (0, 214), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 93: (0, 40), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 564: {4: (1, {'@': 410}), 5: (1, {'@': 410}), 44: (1, {'@': 410}), 31: (1, {'@': 410}), 19: (1, {'@': 410}), 11: (1, {'@': 410}), 32: (1, {'@': 147})}, 565: {37: (0, 481), 224: (0, 1), 45: (0, 504), 70: (0, 652), 225: (0, 603), 88: (0, 573), 40: (0, 437), 205: (0, 434), 226: (0, 112), 43: (0, 519), 71: (0, 661), 227: (0, 77), 33: (0, 283), 228: (0, 94), 229: (0, 88), 46: (0, 534), 49: (0, 669), 47: (0, 675), 41: (0, 458), 230: (0, 22), 206: (0, 81), 34: (0, 483), 53: (0, 618), 231: (0, 104), 232: (0, 46), 51: (0, 540), 82: (0, 593), 36: (0, 276), 99: (0, 531), 234: (0, 70), 233: (0, 253), 67: (0, 60), 101: (0, 256), 35: (0, 365), 102: (0, 660), 235: (0, 243), 50: (0, 600)}, 566: {39: (0, 261), 108: (0, 370), 109: (0, 407), 40: (0, 437), 110: (0, 378), 70: (0, 375), 111: (0, 294), 112: (0, 406), 113: (0, 715), 114: (0, 704), 115: (0, 150), 116: (0, 235), 117: (0, 152), 66: (0, 528), 118: (0, 142), 45: (0, 504), 119: (0, 217), 120: (0, 11), 73: (0, 36), 50: (0, 600), 121: (0, 165), 122: (0, 19), 123: (0, 25), 124: (0, 32), 71: (0, 661), 55: (0, 708), 42: (0, 606), 49: (0, 669), 47: (0, 675), 80: (0, 628), 53: (0, 618), 125: (0, 15), 82: (0, 593), 126: (0, 62), 84: (0, 621), 127: (0, 38), 33: (0, 283), 128: (0, 24), 88: (0, 419), 36: (0, 276), 129: (0, 109), 130: (0, 13), 131: (0, 23), 132: (0, 124), 34: (0, 483), 133: (0, 66), 37: (0, 481), 134: (0, 115), 135: (0, 111), 43: (0, 519), 46: (0, 534), 41: (0, 458), 136: (0, 116), 137: (0, 117), 51: (0, 540), 52: (0, 544), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 38: (1, {'@': 68})}, 567: {4: (1, {'@': 536}), 6: (1, {'@': 536}), 7: (1, {'@': 536}), 8: (1, {'@': 536}), 9: (1, {'@': 536}), 10: (1, {'@': 536}), 3: (1, {'@': 536}), 11: (1, {'@': 536}), 12: (1, {'@': 536}), 13: (1, {'@': 536}), 14: (1, {'@': 536}), 15: (1, {'@': 536}), 2: (1, {'@': 536}), 16: (1, {'@': 536}), 17: (1, {'@': 536}), 0: (1, {'@': 536}), 18: (1, {'@': 536}), 19: (1, {'@': 536}), 20: (1, {'@': 536}), 21: (1, {'@': 536}), 24: (1, {'@': 536}), 23: (1, {'@': 536}), 25: (1, {'@': 536}), 26: (1, {'@': 536}), 27: (1, {'@': 536}), 54: (1, {'@': 536}), 32: (1, {'@': 536}), 28: (1, {'@': 536}), 29: (1, {'@': 536}), 30: (1, {'@': 536}), 48: (1, {'@': 536}), 5: (1, {'@': 536})}, 568: {37: (0, 481), 180: (0, 317), 4: (0, 314), 70: (0, 307), 45: (0, 504), 39: (0, 261), 181: (0, 357), 191: (0, 541), 182: (0, 422), 40: (0, 437), 183: (0, 431), 93: (0, 542), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 193: (0, 363), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 194: (0, 549), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 34: (0, 483), 185: (0, 352), 186: (0, 589), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 569: {33: (1, {'@': 281}), 34: (1, {'@': 281}), 35: (1, {'@': 281}), 36: (1, {'@': 281}), 37: (1, {'@': 281}), 38: (1, {'@': 281}), 39: (1, {'@': 281}), 40: (1, {'@': 281}), 41: (1, {'@': 281}), 42: (1, {'@': 281}), 32: (1, {'@': 281}), 43: (1, {'@': 281}), 44: (1, {'@': 281}), 4: (1, {'@': 281}), 45: (1, {'@': 281}), 5: (1, {'@': 281}), 46: (1, {'@': 281}), 31: (1, {'@': 281}), 11: (1, {'@': 281}), 47: (1, {'@': 281}), 49: (1, {'@': 281}), 50: (1, {'@': 281}), 0: (1, {'@': 281}), 19: (1, {'@': 281}), 22: (1, {'@': 281}), 51: (1, {'@': 281}), 52: (1, {'@': 281}), 53: (1, {'@': 281}), 54: (1, {'@': 281}), 55: (1, {'@': 281}), 48: (1, {'@': 281})}, 570: {4: (1, {'@': 359}), 32: (1, {'@': 359}), 0: (1, {'@': 359}), 19: (1, {'@': 359}), 11: (1, {'@': 359}), 54: (1, {'@': 359}), 48: (1, {'@': 359}), 5: (1, {'@': 359})}, 571: {30: (1, {'@': 490}), 24: (1, {'@': 490}), 7: (1, {'@': 490}), 25: (1, {'@': 490}), 10: (1, {'@': 490}), 27: (1, {'@': 490}), 14: (1, {'@': 490}), 15: (1, {'@': 490}), 17: (1, {'@': 490}), 29: (1, {'@': 490}), 18: (1, {'@': 490}), 20: (1, {'@': 490}), 23: (1, {'@': 456}), 8: (1, {'@': 456}), 12: (1, {'@': 456}), 16: (1, {'@': 456}), 21: (1, {'@': 456}), 33: (1, {'@': 280}), 34: (1, {'@': 280}), 35: (1, {'@': 280}), 36: (1, {'@': 280}), 37: (1, {'@': 280}), 38: (1, {'@': 280}), 39: (1, {'@': 280}), 40: (1, {'@': 280}), 41: (1, {'@': 280}), 42: (1, {'@': 280}), 32: (1, {'@': 280}), 43: (1, {'@': 280}), 44: (1, {'@': 280}), 4: (1, {'@': 280}), 45: (1, {'@': 280}), 5: (1, {'@': 280}), 46: (1, {'@': 280}), 31: (1, {'@': 280}), 11: (1, {'@': 280}), 47: (1, {'@': 280}), 49: (1, {'@': 280}), 50: (1, {'@': 280}), 0: (1, {'@': 280}), 19: (1, {'@': 280}), 22: (1, {'@': 280}), 51: (1, {'@': 280}), 52: (1, {'@': 280}), 53: (1, {'@': 280}), 54: (1, {'@': 280}), 55: (1, {'@': 280}), 2: (1, {'@': 493}), 3: (1, {'@': 493}), 48: (1, {'@': 280})}, 572: {0: (0, 292)}, 573: {179: (0, 605), 13: (0, 334), 28: (0, 105), 175: (0, 713), 6: (0, 100), 9: (0, 139), 26: (0, 6), 2: (1, {'@': 539}), 3: (1, {'@': 539}), 30: (1, {'@': 272}), 24: (1, {'@': 272}), 7: (1, {'@': 272}), 25: (1, {'@': 272}), 10: (1, {'@': 272}), 27: (1, {'@': 272}), 14: (1, {'@': 272}), 15: (1, {'@': 272}), 17: (1, {'@': 272}), 29: (1, {'@': 272}), 18: (1, {'@': 272}), 20: (1, {'@': 272}), 33: (1, {'@': 339}), 34: (1, {'@': 339}), 4: (1, {'@': 339}), 45: (1, {'@': 339}), 46: (1, {'@': 339}), 35: (1, {'@': 339}), 31: (1, {'@': 339}), 11: (1, {'@': 339}), 36: (1, {'@': 339}), 37: (1, {'@': 339}), 47: (1, {'@': 339}), 49: (1, {'@': 339}), 50: (1, {'@': 339}), 0: (1, {'@': 339}), 19: (1, {'@': 339}), 22: (1, {'@': 339}), 51: (1, {'@': 339}), 38: (1, {'@': 339}), 52: (1, {'@': 339}), 53: (1, {'@': 339}), 39: (1, {'@': 339}), 40: (1, {'@': 339}), 41: (1, {'@': 339}), 54: (1, {'@': 339}), 42: (1, {'@': 339}), 32: (1, {'@': 339}), 43: (1, {'@': 339}), 55: (1, {'@': 339}), 44: (1, {'@': 339}), 23: (1, {'@': 532}), 8: (1, {'@': 532}), 12: (1, {'@': 532}), 16: (1, {'@': 532}), 21: (1, {'@': 532})}, 574: {4: (1, {'@': 100}), 5: (1, {'@': 100}), 6: (1, {'@': 100}), 7: (1, {'@': 100}), 8: (1, {'@': 100}), 9: (1, {'@': 100}), 10: (1, {'@': 100}), 3: (1, {'@': 100}), 11: (1, {'@': 100}), 12: (1, {'@': 100}), 13: (1, {'@': 100}), 14: (1, {'@': 100}), 15: (1, {'@': 100}), 2: (1, {'@': 100}), 16: (1, {'@': 100}), 17: (1, {'@': 100}), 0: (1, {'@': 100}), 18: (1, {'@': 100}), 19: (1, {'@': 100}), 20: (1, {'@': 100}), 21: (1, {'@': 100}), 22: (1, {'@': 100}), 23: (1, {'@': 100}), 24: (1, {'@': 100}), 25: (1, {'@': 100}), 26: (1, {'@': 100}), 27: (1, {'@': 100}), 28: (1, {'@': 100}), 29: (1, {'@': 100}), 30: (1, {'@': 100}), 31: (1, {'@': 100}), 32: (1, {'@': 100}), 54: (1, {'@': 100}), 44: (1, {'@': 100}), 33: (1, {'@': 100}), 34: (1, {'@': 100}), 35: (1, {'@': 100}), 36: (1, {'@': 100}), 37: (1, {'@': 100}), 38: (1, {'@': 100}), 39: (1, {'@': 100}), 40: (1, {'@': 100}), 41: (1, {'@': 100}), 42: (1, {'@': 100}), 43: (1, {'@': 100}), 45: (1, {'@': 100}), 46: (1, {'@': 100}), 47: (1, {'@': 100}), 49: (1, {'@': 100}), 50: (1, {'@': 100}), 51: (1, {'@': 100}), 52: (1, {'@': 100}), 53: (1, {'@': 100}), 55: (1, {'@': 100})}, 575: {28: (0, 579), 175: (0, 518), 171: (0, 521), 26: (0, 121), 9: (0, 139), 6: (0, 644), 177: (0, 513), 13: (0, 670)}, 576: {4: (1, {'@': 360}), 32: (1, {'@': 360}), 0: (1, {'@': 360}), 19: (1, {'@': 360}), 11: (1, {'@': 360}), 54: (1, {'@': 360}), 48: (1, {'@': 360}), 5: (1, {'@': 360})}, 577: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 184: (0, 222), 40: (0, 437), 43: (0, 519), 71: (0, 661), 204: (0, 269), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 183: (0, 214), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 93: (0, 40), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 578: {4: (1, {'@': 409}), 5: (1, {'@': 409}), 0: (1, {'@': 409}), 19: (1, {'@': 409}), 11: (1, {'@': 409}), 22: (1, {'@': 409}), 32: (1, {'@': 409}), 31: (1, {'@': 409}), 44: (1, {'@': 409}), 54: (1, {'@': 409}), 33: (1, {'@': 409}), 34: (1, {'@': 409}), 45: (1, {'@': 409}), 46: (1, {'@': 409}), 35: (1, {'@': 409}), 36: (1, {'@': 409}), 37: (1, {'@': 409}), 47: (1, {'@': 409}), 49: (1, {'@': 409}), 50: (1, {'@': 409}), 51: (1, {'@': 409}), 38: (1, {'@': 409}), 52: (1, {'@': 409}), 53: (1, {'@': 409}), 39: (1, {'@': 409}), 40: (1, {'@': 409}), 41: (1, {'@': 409}), 42: (1, {'@': 409}), 55: (1, {'@': 409}), 43: (1, {'@': 409})}, 579: {33: (1, {'@': 173}), 34: (1, {'@': 173}), 35: (1, {'@': 173}), 36: (1, {'@': 173}), 37: (1, {'@': 173}), 39: (1, {'@': 173}), 40: (1, {'@': 173}), 41: (1, {'@': 173}), 42: (1, {'@': 173}), 43: (1, {'@': 173}), 4: (1, {'@': 173}), 45: (1, {'@': 173}), 46: (1, {'@': 173}), 11: (1, {'@': 173}), 47: (1, {'@': 173}), 49: (1, {'@': 173}), 50: (1, {'@': 173}), 51: (1, {'@': 173}), 52: (1, {'@': 173}), 53: (1, {'@': 173}), 55: (1, {'@': 173})}, 580: {4: (1, {'@': 313}), 33: (1, {'@': 313}), 5: (1, {'@': 313}), 34: (1, {'@': 313}), 45: (1, {'@': 313}), 46: (1, {'@': 313}), 35: (1, {'@': 313}), 11: (1, {'@': 313}), 36: (1, {'@': 313}), 37: (1, {'@': 313}), 47: (1, {'@': 313}), 49: (1, {'@': 313}), 50: (1, {'@': 313}), 19: (1, {'@': 313}), 51: (1, {'@': 313}), 38: (1, {'@': 313}), 52: (1, {'@': 313}), 53: (1, {'@': 313}), 39: (1, {'@': 313}), 40: (1, {'@': 313}), 41: (1, {'@': 313}), 42: (1, {'@': 313}), 55: (1, {'@': 313}), 43: (1, {'@': 313})}, 581: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 93: (0, 204), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 582: {32: (0, 570)}, 583: {0: (1, {'@': 296})}, 584: {37: (0, 481), 36: (0, 276), 70: (0, 170), 46: (0, 534)}, 585: {4: (1, {'@': 305}), 33: (1, {'@': 305}), 34: (1, {'@': 305}), 5: (1, {'@': 305}), 45: (1, {'@': 305}), 46: (1, {'@': 305}), 35: (1, {'@': 305}), 11: (1, {'@': 305}), 36: (1, {'@': 305}), 37: (1, {'@': 305}), 47: (1, {'@': 305}), 49: (1, {'@': 305}), 50: (1, {'@': 305}), 19: (1, {'@': 305}), 51: (1, {'@': 305}), 38: (1, {'@': 305}), 52: (1, {'@': 305}), 53: (1, {'@': 305}), 39: (1, {'@': 305}), 40: (1, {'@': 305}), 41: (1, {'@': 305}), 42: (1, {'@': 305}), 55: (1, {'@': 305}), 43: (1, {'@': 305})}, 586: {4: (1, {'@': 352}), 32: (1, {'@': 352}), 0: (1, {'@': 352}), 19: (1, {'@': 352}), 11: (1, {'@': 352}), 54: (1, {'@': 352}), 48: (1, {'@': 352}), 5: (1, {'@': 352})}, 587: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 79: (0, 634), 78: (0, 666), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 58: (0, 455), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 111})}, 588: {56: (0, 388), 39: (0, 261), 57: (0, 333), 58: (0, 233), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 22: (0, 236), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 96: (0, 0), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 123})}, 589: {33: (1, {'@': 282}), 34: (1, {'@': 282}), 4: (1, {'@': 282}), 6: (1, {'@': 282}), 45: (1, {'@': 282}), 5: (1, {'@': 282}), 9: (1, {'@': 282}), 46: (1, {'@': 282}), 35: (1, {'@': 282}), 11: (1, {'@': 282}), 13: (1, {'@': 282}), 36: (1, {'@': 282}), 37: (1, {'@': 282}), 47: (1, {'@': 282}), 49: (1, {'@': 282}), 50: (1, {'@': 282}), 19: (1, {'@': 282}), 51: (1, {'@': 282}), 38: (1, {'@': 282}), 52: (1, {'@': 282}), 53: (1, {'@': 282}), 39: (1, {'@': 282}), 40: (1, {'@': 282}), 41: (1, {'@': 282}), 26: (1, {'@': 282}), 42: (1, {'@': 282}), 55: (1, {'@': 282}), 43: (1, {'@': 282}), 28: (1, {'@': 282}), 23: (1, {'@': 445}), 8: (1, {'@': 445}), 12: (1, {'@': 445}), 16: (1, {'@': 445}), 21: (1, {'@': 445}), 31: (1, {'@': 282}), 0: (1, {'@': 282}), 22: (1, {'@': 282}), 54: (1, {'@': 282}), 32: (1, {'@': 282}), 44: (1, {'@': 282}), 48: (1, {'@': 282})}, 590: {4: (0, 218), 19: (0, 52), 11: (0, 257), 0: (1, {'@': 344}), 32: (1, {'@': 344}), 54: (1, {'@': 344}), 48: (1, {'@': 344}), 5: (1, {'@': 344})}, 591: {4: (1, {'@': 309}), 33: (1, {'@': 309}), 34: (1, {'@': 309}), 5: (1, {'@': 309}), 45: (1, {'@': 309}), 46: (1, {'@': 309}), 35: (1, {'@': 309}), 11: (1, {'@': 309}), 36: (1, {'@': 309}), 37: (1, {'@': 309}), 47: (1, {'@': 309}), 49: (1, {'@': 309}), 50: (1, {'@': 309}), 19: (1, {'@': 309}), 51: (1, {'@': 309}), 38: (1, {'@': 309}), 52: (1, {'@': 309}), 53: (1, {'@': 309}), 39: (1, {'@': 309}), 40: (1, {'@': 309}), 41: (1, {'@': 309}), 42: (1, {'@': 309}), 55: (1, {'@': 309}), 43: (1, {'@': 309})}, 592: {37: (0, 481), 36: (0, 276), 46: (0, 534), 70: (0, 441)}, 593: {4: (1, {'@': 140}), 5: (1, {'@': 140}), 6: (1, {'@': 140}), 7: (1, {'@': 140}), 8: (1, {'@': 140}), 9: (1, {'@': 140}), 10: (1, {'@': 140}), 3: (1, {'@': 140}), 11: (1, {'@': 140}), 12: (1, {'@': 140}), 13: (1, {'@': 140}), 14: (1, {'@': 140}), 15: (1, {'@': 140}), 2: (1, {'@': 140}), 16: (1, {'@': 140}), 17: (1, {'@': 140}), 0: (1, {'@': 140}), 18: (1, {'@': 140}), 19: (1, {'@': 140}), 20: (1, {'@': 140}), 21: (1, {'@': 140}), 22: (1, {'@': 140}), 23: (1, {'@': 140}), 24: (1, {'@': 140}), 25: (1, {'@': 140}), 26: (1, {'@': 140}), 27: (1, {'@': 140}), 28: (1, {'@': 140}), 29: (1, {'@': 140}), 30: (1, {'@': 140}), 31: (1, {'@': 140}), 32: (1, {'@': 140}), 33: (1, {'@': 140}), 34: (1, {'@': 140}), 35: (1, {'@': 140}), 36: (1, {'@': 140}), 37: (1, {'@': 140}), 38: (1, {'@': 140}), 39: (1, {'@': 140}), 40: (1, {'@': 140}), 41: (1, {'@': 140}), 42: (1, {'@': 140}), 43: (1, {'@': 140}), 44: (1, {'@': 140}), 45: (1, {'@': 140}), 46: (1, {'@': 140}), 47: (1, {'@': 140}), 48: (1, {'@': 140}), 49: (1, {'@': 140}), 50: (1, {'@': 140}), 51: (1, {'@': 140}), 52: (1, {'@': 140}), 53: (1, {'@': 140}), 54: (1, {'@': 140}), 55: (1, {'@': 140})}, 594: {4: (1, {'@': 476}), 6: (1, {'@': 476}), 23: (1, {'@': 476}), 8: (1, {'@': 476}), 9: (1, {'@': 476}), 26: (1, {'@': 476}), 11: (1, {'@': 476}), 54: (1, {'@': 476}), 13: (1, {'@': 476}), 12: (1, {'@': 476}), 32: (1, {'@': 476}), 16: (1, {'@': 476}), 28: (1, {'@': 476}), 0: (1, {'@': 476}), 19: (1, {'@': 476}), 21: (1, {'@': 476}), 2: (1, {'@': 538}), 3: (1, {'@': 538}), 48: (1, {'@': 476}), 5: (1, {'@': 476})}, 595: {33: (1, {'@': 177}), 34: (1, {'@': 177}), 35: (1, {'@': 177}), 36: (1, {'@': 177}), 37: (1, {'@': 177}), 39: (1, {'@': 177}), 40: (1, {'@': 177}), 41: (1, {'@': 177}), 42: (1, {'@': 177}), 43: (1, {'@': 177}), 45: (1, {'@': 177}), 46: (1, {'@': 177}), 11: (1, {'@': 177}), 47: (1, {'@': 177}), 50: (1, {'@': 177}), 49: (1, {'@': 177}), 51: (1, {'@': 177}), 52: (1, {'@': 177}), 53: (1, {'@': 177}), 55: (1, {'@': 177})}, 596: {25: (0, 87), 10: (0, 155), 15: (0, 460), 14: (0, 180), 20: (0, 520), 170: (0, 225), 29: (0, 498), 24: (0, 640), 203: (0, 284), 169: (0, 563), 27: (0, 427), 17: (0, 480), 18: (0, 489), 172: (0, 191), 30: (0, 438), 176: (0, 337), 7: (0, 523)}, 597: {32: (0, 482)}, 598: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 93: (0, 654)}, 599: {22: (0, 39)}, 600: {4: (1, {'@': 62}), 5: (1, {'@': 62}), 6: (1, {'@': 62}), 7: (1, {'@': 62}), 8: (1, {'@': 62}), 9: (1, {'@': 62}), 10: (1, {'@': 62}), 3: (1, {'@': 62}), 11: (1, {'@': 62}), 12: (1, {'@': 62}), 13: (1, {'@': 62}), 14: (1, {'@': 62}), 15: (1, {'@': 62}), 2: (1, {'@': 62}), 16: (1, {'@': 62}), 17: (1, {'@': 62}), 0: (1, {'@': 62}), 18: (1, {'@': 62}), 19: (1, {'@': 62}), 20: (1, {'@': 62}), 21: (1, {'@': 62}), 22: (1, {'@': 62}), 23: (1, {'@': 62}), 24: (1, {'@': 62}), 25: (1, {'@': 62}), 26: (1, {'@': 62}), 27: (1, {'@': 62}), 28: (1, {'@': 62}), 29: (1, {'@': 62}), 30: (1, {'@': 62}), 31: (1, {'@': 62}), 32: (1, {'@': 62}), 33: (1, {'@': 62}), 34: (1, {'@': 62}), 35: (1, {'@': 62}), 36: (1, {'@': 62}), 37: (1, {'@': 62}), 38: (1, {'@': 62}), 39: (1, {'@': 62}), 40: (1, {'@': 62}), 41: (1, {'@': 62}), 42: (1, {'@': 62}), 43: (1, {'@': 62}), 44: (1, {'@': 62}), 45: (1, {'@': 62}), 46: (1, {'@': 62}), 47: (1, {'@': 62}), 48: (1, {'@': 62}), 49: (1, {'@': 62}), 50: (1, {'@': 62}), 51: (1, {'@': 62}), 52: (1, {'@': 62}), 53: (1, {'@': 62}), 54: (1, {'@': 62}), 55: (1, {'@': 62})}, 601: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 105: (0, 166), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 104: (0, 402), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 122), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 58: (0, 183), 34: (0, 483), 91: (0, 497), 37: (0, 481), 106: (0, 195), 107: (0, 196), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 32: (0, 305), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 602: {4: (1, {'@': 306}), 33: (1, {'@': 306}), 34: (1, {'@': 306}), 5: (1, {'@': 306}), 45: (1, {'@': 306}), 46: (1, {'@': 306}), 35: (1, {'@': 306}), 11: (1, {'@': 306}), 36: (1, {'@': 306}), 37: (1, {'@': 306}), 47: (1, {'@': 306}), 49: (1, {'@': 306}), 50: (1, {'@': 306}), 19: (1, {'@': 306}), 51: (1, {'@': 306}), 38: (1, {'@': 306}), 52: (1, {'@': 306}), 53: (1, {'@': 306}), 39: (1, {'@': 306}), 40: (1, {'@': 306}), 41: (1, {'@': 306}), 42: (1, {'@': 306}), 55: (1, {'@': 306}), 43: (1, {'@': 306})}, 603: {13: (0, 334), 28: (0, 105), 175: (0, 231), 6: (0, 100), 9: (0, 139), 179: (0, 135), 26: (0, 6), 33: (1, {'@': 421}), 34: (1, {'@': 421}), 4: (1, {'@': 421}), 45: (1, {'@': 421}), 46: (1, {'@': 421}), 35: (1, {'@': 421}), 31: (1, {'@': 421}), 11: (1, {'@': 421}), 36: (1, {'@': 421}), 37: (1, {'@': 421}), 47: (1, {'@': 421}), 49: (1, {'@': 421}), 50: (1, {'@': 421}), 0: (1, {'@': 421}), 19: (1, {'@': 421}), 22: (1, {'@': 421}), 51: (1, {'@': 421}), 38: (1, {'@': 421}), 52: (1, {'@': 421}), 53: (1, {'@': 421}), 39: (1, {'@': 421}), 40: (1, {'@': 421}), 41: (1, {'@': 421}), 54: (1, {'@': 421}), 42: (1, {'@': 421}), 32: (1, {'@': 421}), 43: (1, {'@': 421}), 55: (1, {'@': 421}), 44: (1, {'@': 421})}, 604: {39: (0, 261), 93: (0, 645), 40: (0, 437), 191: (0, 266), 11: (0, 522), 184: (0, 689), 64: (0, 526), 66: (0, 528), 186: (0, 589), 45: (0, 504), 4: (0, 314), 50: (0, 600), 209: (0, 612), 182: (0, 422), 210: (0, 607), 71: (0, 661), 55: (0, 708), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 77: (0, 710), 80: (0, 628), 53: (0, 618), 82: (0, 593), 84: (0, 621), 70: (0, 307), 181: (0, 357), 33: (0, 283), 180: (0, 317), 88: (0, 419), 183: (0, 431), 36: (0, 276), 34: (0, 483), 37: (0, 481), 43: (0, 519), 46: (0, 534), 193: (0, 363), 212: (0, 366), 41: (0, 458), 97: (0, 525), 185: (0, 352), 51: (0, 540), 52: (0, 544), 99: (0, 531), 211: (0, 664), 101: (0, 256), 35: (0, 365), 102: (0, 660)}, 605: {37: (0, 481), 180: (0, 317), 4: (0, 314), 70: (0, 307), 45: (0, 504), 39: (0, 261), 93: (0, 174), 181: (0, 357), 182: (0, 422), 40: (0, 437), 183: (0, 431), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 193: (0, 363), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 77: (0, 710), 64: (0, 526), 41: (0, 458), 80: (0, 628), 191: (0, 153), 66: (0, 528), 88: (0, 419), 97: (0, 525), 34: (0, 483), 185: (0, 352), 186: (0, 589), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 606: {33: (1, {'@': 157}), 34: (1, {'@': 157}), 35: (1, {'@': 157}), 36: (1, {'@': 157}), 37: (1, {'@': 157}), 39: (1, {'@': 157}), 40: (1, {'@': 157}), 41: (1, {'@': 157}), 26: (1, {'@': 157}), 42: (1, {'@': 157}), 43: (1, {'@': 157}), 45: (1, {'@': 157}), 4: (1, {'@': 157}), 46: (1, {'@': 157}), 11: (1, {'@': 157}), 47: (1, {'@': 157}), 49: (1, {'@': 157}), 50: (1, {'@': 157}), 51: (1, {'@': 157}), 52: (1, {'@': 157}), 53: (1, {'@': 157}), 55: (1, {'@': 157})}, 607: {175: (0, 189), 179: (0, 369), 13: (0, 334), 28: (0, 105), 6: (0, 100), 9: (0, 139), 26: (0, 6)}, 608: {33: (1, {'@': 498}), 34: (1, {'@': 498}), 4: (1, {'@': 498}), 45: (1, {'@': 498}), 5: (1, {'@': 498}), 46: (1, {'@': 498}), 35: (1, {'@': 498}), 11: (1, {'@': 498}), 36: (1, {'@': 498}), 37: (1, {'@': 498}), 47: (1, {'@': 498}), 49: (1, {'@': 498}), 50: (1, {'@': 498}), 19: (1, {'@': 498}), 51: (1, {'@': 498}), 38: (1, {'@': 498}), 52: (1, {'@': 498}), 53: (1, {'@': 498}), 39: (1, {'@': 498}), 40: (1, {'@': 498}), 41: (1, {'@': 498}), 42: (1, {'@': 498}), 55: (1, {'@': 498}), 43: (1, {'@': 498})}, 609: {33: (1, {'@': 234}), 34: (1, {'@': 234}), 35: (1, {'@': 234}), 36: (1, {'@': 234}), 37: (1, {'@': 234}), 38: (1, {'@': 234}), 39: (1, {'@': 234}), 40: (1, {'@': 234}), 41: (1, {'@': 234}), 42: (1, {'@': 234}), 43: (1, {'@': 234}), 45: (1, {'@': 234}), 46: (1, {'@': 234}), 47: (1, {'@': 234}), 49: (1, {'@': 234}), 50: (1, {'@': 234}), 51: (1, {'@': 234}), 52: (1, {'@': 234}), 53: (1, {'@': 234}), 55: (1, {'@': 234})}, 610: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 93: (0, 194), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 611: {19: (0, 343), 4: (0, 679), 11: (0, 192), 0: (1, {'@': 91}), 22: (1, {'@': 91}), 31: (1, {'@': 91}), 32: (1, {'@': 91}), 44: (1, {'@': 91}), 54: (1, {'@': 91}), 33: (1, {'@': 91}), 34: (1, {'@': 91}), 45: (1, {'@': 91}), 46: (1, {'@': 91}), 35: (1, {'@': 91}), 36: (1, {'@': 91}), 37: (1, {'@': 91}), 47: (1, {'@': 91}), 49: (1, {'@': 91}), 50: (1, {'@': 91}), 51: (1, {'@': 91}), 38: (1, {'@': 91}), 52: (1, {'@': 91}), 53: (1, {'@': 91}), 39: (1, {'@': 91}), 40: (1, {'@': 91}), 41: (1, {'@': 91}), 42: (1, {'@': 91}), 55: (1, {'@': 91}), 43: (1, {'@': 91})}, 612: {33: (1, {'@': 255}), 34: (1, {'@': 255}), 35: (1, {'@': 255}), 36: (1, {'@': 255}), 37: (1, {'@': 255}), 38: (1, {'@': 255}), 39: (1, {'@': 255}), 40: (1, {'@': 255}), 41: (1, {'@': 255}), 42: (1, {'@': 255}), 32: (1, {'@': 255}), 43: (1, {'@': 255}), 44: (1, {'@': 255}), 4: (1, {'@': 255}), 45: (1, {'@': 255}), 5: (1, {'@': 255}), 46: (1, {'@': 255}), 31: (1, {'@': 255}), 11: (1, {'@': 255}), 47: (1, {'@': 255}), 48: (1, {'@': 255}), 49: (1, {'@': 255}), 50: (1, {'@': 255}), 0: (1, {'@': 255}), 19: (1, {'@': 255}), 22: (1, {'@': 255}), 51: (1, {'@': 255}), 52: (1, {'@': 255}), 53: (1, {'@': 255}), 54: (1, {'@': 255}), 55: (1, {'@': 255})}, 613: {6: (1, {'@': 483}), 9: (1, {'@': 483}), 26: (1, {'@': 483}), 13: (1, {'@': 483}), 28: (1, {'@': 483}), 33: (1, {'@': 435}), 34: (1, {'@': 435}), 4: (1, {'@': 435}), 45: (1, {'@': 435}), 5: (1, {'@': 435}), 46: (1, {'@': 435}), 35: (1, {'@': 435}), 31: (1, {'@': 435}), 11: (1, {'@': 435}), 36: (1, {'@': 435}), 37: (1, {'@': 435}), 47: (1, {'@': 435}), 48: (1, {'@': 435}), 49: (1, {'@': 435}), 50: (1, {'@': 435}), 0: (1, {'@': 435}), 19: (1, {'@': 435}), 22: (1, {'@': 435}), 51: (1, {'@': 435}), 38: (1, {'@': 435}), 52: (1, {'@': 435}), 53: (1, {'@': 435}), 39: (1, {'@': 435}), 40: (1, {'@': 435}), 41: (1, {'@': 435}), 54: (1, {'@': 435}), 42: (1, {'@': 435}), 32: (1, {'@': 435}), 43: (1, {'@': 435}), 55: (1, {'@': 435}), 44: (1, {'@': 435})}, 614: {1: (0, 340), 2: (0, 684), 3: (0, 595)}, 615: {174: (0, 97), 23: (0, 137), 8: (0, 335), 16: (0, 322), 21: (0, 303), 12: (0, 631), 4: (1, {'@': 428}), 6: (1, {'@': 428}), 9: (1, {'@': 428}), 26: (1, {'@': 428}), 11: (1, {'@': 428}), 54: (1, {'@': 428}), 13: (1, {'@': 428}), 32: (1, {'@': 428}), 28: (1, {'@': 428}), 0: (1, {'@': 428}), 19: (1, {'@': 428}), 48: (1, {'@': 428}), 5: (1, {'@': 428})}, 616: {56: (0, 388), 39: (0, 261), 57: (0, 333), 58: (0, 233), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 22: (0, 236), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 96: (0, 703), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 123})}, 617: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 184: (0, 222), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 204: (0, 260), 53: (0, 618), 51: (0, 540), 183: (0, 214), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 93: (0, 40), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 618: {4: (1, {'@': 66}), 5: (1, {'@': 66}), 6: (1, {'@': 66}), 7: (1, {'@': 66}), 8: (1, {'@': 66}), 9: (1, {'@': 66}), 10: (1, {'@': 66}), 3: (1, {'@': 66}), 11: (1, {'@': 66}), 12: (1, {'@': 66}), 13: (1, {'@': 66}), 14: (1, {'@': 66}), 15: (1, {'@': 66}), 2: (1, {'@': 66}), 16: (1, {'@': 66}), 17: (1, {'@': 66}), 0: (1, {'@': 66}), 18: (1, {'@': 66}), 19: (1, {'@': 66}), 20: (1, {'@': 66}), 21: (1, {'@': 66}), 22: (1, {'@': 66}), 23: (1, {'@': 66}), 24: (1, {'@': 66}), 25: (1, {'@': 66}), 26: (1, {'@': 66}), 27: (1, {'@': 66}), 28: (1, {'@': 66}), 29: (1, {'@': 66}), 30: (1, {'@': 66}), 31: (1, {'@': 66}), 32: (1, {'@': 66}), 33: (1, {'@': 66}), 34: (1, {'@': 66}), 35: (1, {'@': 66}), 36: (1, {'@': 66}), 37: (1, {'@': 66}), 38: (1, {'@': 66}), 39: (1, {'@': 66}), 40: (1, {'@': 66}), 41: (1, {'@': 66}), 42: (1, {'@': 66}), 43: (1, {'@': 66}), 44: (1, {'@': 66}), 45: (1, {'@': 66}), 46: (1, {'@': 66}), 47: (1, {'@': 66}), 48: (1, {'@': 66}), 49: (1, {'@': 66}), 50: (1, {'@': 66}), 51: (1, {'@': 66}), 52: (1, {'@': 66}), 53: (1, {'@': 66}), 54: (1, {'@': 66}), 55: (1, {'@': 66})}, 619: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 93: (0, 633), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 620: {33: (1, {'@': 509}), 34: (1, {'@': 509}), 35: (1, {'@': 509}), 12: (1, {'@': 509}), 36: (1, {'@': 509}), 37: (1, {'@': 509}), 21: (1, {'@': 509}), 38: (1, {'@': 509}), 23: (1, {'@': 509}), 39: (1, {'@': 509}), 40: (1, {'@': 509}), 41: (1, {'@': 509}), 26: (1, {'@': 509}), 42: (1, {'@': 509}), 32: (1, {'@': 509}), 43: (1, {'@': 509}), 44: (1, {'@': 509}), 4: (1, {'@': 509}), 45: (1, {'@': 509}), 6: (1, {'@': 509}), 8: (1, {'@': 509}), 9: (1, {'@': 509}), 46: (1, {'@': 509}), 31: (1, {'@': 509}), 11: (1, {'@': 509}), 13: (1, {'@': 509}), 47: (1, {'@': 509}), 16: (1, {'@': 509}), 49: (1, {'@': 509}), 50: (1, {'@': 509}), 0: (1, {'@': 509}), 19: (1, {'@': 509}), 22: (1, {'@': 509}), 51: (1, {'@': 509}), 52: (1, {'@': 509}), 53: (1, {'@': 509}), 54: (1, {'@': 509}), 55: (1, {'@': 509}), 28: (1, {'@': 509})}, 621: {138: (0, 711), 139: (0, 596), 239: (0, 583), 240: (0, 650), 140: (0, 693), 40: (0, 437), 141: (0, 590), 67: (0, 630), 154: (0, 516), 142: (0, 615), 143: (0, 637), 241: (0, 278), 45: (0, 504), 50: (0, 600), 144: (0, 273), 70: (0, 652), 71: (0, 661), 145: (0, 706), 49: (0, 669), 47: (0, 675), 146: (0, 462), 53: (0, 618), 82: (0, 593), 147: (0, 249), 148: (0, 295), 150: (0, 594), 33: (0, 283), 151: (0, 315), 36: (0, 276), 152: (0, 457), 153: (0, 685), 34: (0, 483), 37: (0, 481), 43: (0, 519), 155: (0, 440), 156: (0, 653), 46: (0, 534), 242: (0, 572), 41: (0, 458), 88: (0, 311), 51: (0, 540), 157: (0, 536), 99: (0, 531), 79: (0, 451), 101: (0, 256), 35: (0, 365), 102: (0, 660)}, 622: {33: (1, {'@': 261}), 34: (1, {'@': 261}), 35: (1, {'@': 261}), 12: (1, {'@': 261}), 36: (1, {'@': 261}), 14: (1, {'@': 261}), 37: (1, {'@': 261}), 18: (1, {'@': 261}), 21: (1, {'@': 261}), 38: (1, {'@': 261}), 23: (1, {'@': 261}), 24: (1, {'@': 261}), 25: (1, {'@': 261}), 39: (1, {'@': 261}), 40: (1, {'@': 261}), 41: (1, {'@': 261}), 26: (1, {'@': 261}), 42: (1, {'@': 261}), 43: (1, {'@': 261}), 4: (1, {'@': 261}), 45: (1, {'@': 261}), 5: (1, {'@': 261}), 6: (1, {'@': 261}), 7: (1, {'@': 261}), 8: (1, {'@': 261}), 9: (1, {'@': 261}), 3: (1, {'@': 261}), 10: (1, {'@': 261}), 46: (1, {'@': 261}), 11: (1, {'@': 261}), 13: (1, {'@': 261}), 2: (1, {'@': 261}), 15: (1, {'@': 261}), 47: (1, {'@': 261}), 16: (1, {'@': 261}), 49: (1, {'@': 261}), 17: (1, {'@': 261}), 50: (1, {'@': 261}), 19: (1, {'@': 261}), 20: (1, {'@': 261}), 51: (1, {'@': 261}), 52: (1, {'@': 261}), 53: (1, {'@': 261}), 27: (1, {'@': 261}), 55: (1, {'@': 261}), 28: (1, {'@': 261}), 29: (1, {'@': 261}), 30: (1, {'@': 261})}, 623: {4: (1, {'@': 250}), 5: (1, {'@': 250}), 0: (1, {'@': 250}), 19: (1, {'@': 250}), 11: (1, {'@': 250}), 22: (1, {'@': 250}), 32: (1, {'@': 250}), 31: (1, {'@': 250}), 54: (1, {'@': 250}), 44: (1, {'@': 250}), 48: (1, {'@': 250}), 33: (1, {'@': 250}), 34: (1, {'@': 250}), 45: (1, {'@': 250}), 46: (1, {'@': 250}), 35: (1, {'@': 250}), 36: (1, {'@': 250}), 37: (1, {'@': 250}), 47: (1, {'@': 250}), 49: (1, {'@': 250}), 50: (1, {'@': 250}), 51: (1, {'@': 250}), 38: (1, {'@': 250}), 52: (1, {'@': 250}), 53: (1, {'@': 250}), 39: (1, {'@': 250}), 40: (1, {'@': 250}), 41: (1, {'@': 250}), 42: (1, {'@': 250}), 55: (1, {'@': 250}), 43: (1, {'@': 250})}, 624: {33: (1, {'@': 370}), 34: (1, {'@': 370}), 35: (1, {'@': 370}), 12: (1, {'@': 370}), 36: (1, {'@': 370}), 14: (1, {'@': 370}), 37: (1, {'@': 370}), 18: (1, {'@': 370}), 21: (1, {'@': 370}), 38: (1, {'@': 370}), 24: (1, {'@': 370}), 23: (1, {'@': 370}), 25: (1, {'@': 370}), 39: (1, {'@': 370}), 40: (1, {'@': 370}), 41: (1, {'@': 370}), 42: (1, {'@': 370}), 32: (1, {'@': 370}), 43: (1, {'@': 370}), 44: (1, {'@': 370}), 4: (1, {'@': 370}), 45: (1, {'@': 370}), 5: (1, {'@': 370}), 7: (1, {'@': 370}), 8: (1, {'@': 370}), 3: (1, {'@': 370}), 10: (1, {'@': 370}), 46: (1, {'@': 370}), 31: (1, {'@': 370}), 11: (1, {'@': 370}), 2: (1, {'@': 370}), 47: (1, {'@': 370}), 15: (1, {'@': 370}), 48: (1, {'@': 370}), 16: (1, {'@': 370}), 49: (1, {'@': 370}), 17: (1, {'@': 370}), 50: (1, {'@': 370}), 0: (1, {'@': 370}), 19: (1, {'@': 370}), 20: (1, {'@': 370}), 22: (1, {'@': 370}), 51: (1, {'@': 370}), 52: (1, {'@': 370}), 53: (1, {'@': 370}), 27: (1, {'@': 370}), 54: (1, {'@': 370}), 55: (1, {'@': 370}), 29: (1, {'@': 370}), 30: (1, {'@': 370}), 26: (1, {'@': 370}), 6: (1, {'@': 370}), 9: (1, {'@': 370}), 13: (1, {'@': 370}), 28: (1, {'@': 370})}, 625: {4: (1, {'@': 383}), 5: (1, {'@': 383}), 23: (1, {'@': 383}), 8: (1, {'@': 383}), 31: (1, {'@': 383}), 11: (1, {'@': 383}), 12: (1, {'@': 383}), 32: (1, {'@': 383}), 16: (1, {'@': 383}), 44: (1, {'@': 383}), 19: (1, {'@': 383}), 21: (1, {'@': 383}), 33: (1, {'@': 383}), 34: (1, {'@': 383}), 35: (1, {'@': 383}), 36: (1, {'@': 383}), 37: (1, {'@': 383}), 38: (1, {'@': 383}), 39: (1, {'@': 383}), 40: (1, {'@': 383}), 41: (1, {'@': 383}), 42: (1, {'@': 383}), 43: (1, {'@': 383}), 45: (1, {'@': 383}), 46: (1, {'@': 383}), 47: (1, {'@': 383}), 49: (1, {'@': 383}), 50: (1, {'@': 383}), 0: (1, {'@': 383}), 22: (1, {'@': 383}), 51: (1, {'@': 383}), 52: (1, {'@': 383}), 53: (1, {'@': 383}), 54: (1, {'@': 383}), 55: (1, {'@': 383}), 48: (1, {'@': 383})}, 626: {32: (0, 348)}, 627: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 93: (0, 290), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 628: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 79: (0, 634), 78: (0, 666), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 58: (0, 173), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 629: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 93: (0, 714), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 630: {11: (0, 588), 19: (0, 592), 4: (0, 169), 0: (1, {'@': 246}), 32: (1, {'@': 246}), 54: (1, {'@': 246}), 48: (1, {'@': 246}), 5: (1, {'@': 246})}, 631: {33: (1, {'@': 161}), 34: (1, {'@': 161}), 35: (1, {'@': 161}), 36: (1, {'@': 161}), 37: (1, {'@': 161}), 39: (1, {'@': 161}), 40: (1, {'@': 161}), 41: (1, {'@': 161}), 42: (1, {'@': 161}), 43: (1, {'@': 161}), 4: (1, {'@': 161}), 45: (1, {'@': 161}), 46: (1, {'@': 161}), 11: (1, {'@': 161}), 47: (1, {'@': 161}), 49: (1, {'@': 161}), 50: (1, {'@': 161}), 51: (1, {'@': 161}), 52: (1, {'@': 161}), 53: (1, {'@': 161}), 55: (1, {'@': 161})}, 632: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 32: (0, 576), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 105: (0, 166), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 122), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 104: (0, 582), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 58: (0, 183), 34: (0, 483), 91: (0, 497), 37: (0, 481), 106: (0, 195), 107: (0, 196), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 633: {6: (1, {'@': 511}), 9: (1, {'@': 511}), 26: (1, {'@': 511}), 13: (1, {'@': 511}), 28: (1, {'@': 511}), 33: (1, {'@': 474}), 34: (1, {'@': 474}), 4: (1, {'@': 474}), 45: (1, {'@': 474}), 46: (1, {'@': 474}), 35: (1, {'@': 474}), 31: (1, {'@': 474}), 11: (1, {'@': 474}), 36: (1, {'@': 474}), 37: (1, {'@': 474}), 47: (1, {'@': 474}), 49: (1, {'@': 474}), 50: (1, {'@': 474}), 0: (1, {'@': 474}), 19: (1, {'@': 474}), 22: (1, {'@': 474}), 51: (1, {'@': 474}), 38: (1, {'@': 474}), 52: (1, {'@': 474}), 53: (1, {'@': 474}), 39: (1, {'@': 474}), 40: (1, {'@': 474}), 41: (1, {'@': 474}), 54: (1, {'@': 474}), 42: (1, {'@': 474}), 32: (1, {'@': 474}), 43: (1, {'@': 474}), 55: (1, {'@': 474}), 44: (1, {'@': 474})}, 634: {4: (1, {'@': 333}), 5: (1, {'@': 333}), 0: (1, {'@': 333}), 19: (1, {'@': 333}), 11: (1, {'@': 333}), 22: (1, {'@': 333}), 32: (1, {'@': 333}), 31: (1, {'@': 333}), 44: (1, {'@': 333}), 54: (1, {'@': 333}), 33: (1, {'@': 333}), 34: (1, {'@': 333}), 45: (1, {'@': 333}), 46: (1, {'@': 333}), 35: (1, {'@': 333}), 36: (1, {'@': 333}), 37: (1, {'@': 333}), 47: (1, {'@': 333}), 49: (1, {'@': 333}), 50: (1, {'@': 333}), 51: (1, {'@': 333}), 38: (1, {'@': 333}), 52: (1, {'@': 333}), 53: (1, {'@': 333}), 39: (1, {'@': 333}), 40: (1, {'@': 333}), 41: (1, {'@': 333}), 42: (1, {'@': 333}), 55: (1, {'@': 333}), 43: (1, {'@': 333})}, 635: {22: (0, 638), 0: (1, {'@': 119})}, 636: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 180: (0, 317), 181: (0, 357), 182: (0, 422), 40: (0, 437), 183: (0, 431), 43: (0, 519), 71: (0, 661), 93: (0, 86), 33: (0, 283), 11: (0, 522), 184: (0, 689), 55: (0, 708), 46: (0, 534), 42: (0, 606), 193: (0, 363), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 185: (0, 352), 186: (0, 589), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 191: (0, 127)}, 637: {4: (0, 245), 179: (0, 267), 13: (0, 334), 175: (0, 705), 28: (0, 105), 11: (0, 616), 6: (0, 100), 9: (0, 139), 19: (0, 312), 26: (0, 6), 30: (1, {'@': 534}), 24: (1, {'@': 534}), 7: (1, {'@': 534}), 25: (1, {'@': 534}), 10: (1, {'@': 534}), 27: (1, {'@': 534}), 14: (1, {'@': 534}), 15: (1, {'@': 534}), 17: (1, {'@': 534}), 29: (1, {'@': 534}), 18: (1, {'@': 534}), 20: (1, {'@': 534}), 0: (1, {'@': 343}), 32: (1, {'@': 343}), 54: (1, {'@': 343}), 2: (1, {'@': 537}), 3: (1, {'@': 537}), 23: (1, {'@': 517}), 8: (1, {'@': 517}), 12: (1, {'@': 517}), 16: (1, {'@': 517}), 21: (1, {'@': 517}), 48: (1, {'@': 343}), 5: (1, {'@': 343})}, 638: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 58: (0, 432), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 79: (0, 634), 78: (0, 666), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 118})}, 639: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 93: (0, 133), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 640: {51: (1, {'@': 188}), 45: (1, {'@': 188}), 33: (1, {'@': 188}), 34: (1, {'@': 188}), 53: (1, {'@': 188}), 46: (1, {'@': 188}), 40: (1, {'@': 188}), 41: (1, {'@': 188}), 35: (1, {'@': 188}), 50: (1, {'@': 188}), 47: (1, {'@': 188}), 37: (1, {'@': 188}), 36: (1, {'@': 188}), 43: (1, {'@': 188}), 49: (1, {'@': 188})}, 641: {4: (1, {'@': 290}), 5: (1, {'@': 290}), 0: (1, {'@': 290}), 19: (1, {'@': 290}), 11: (1, {'@': 290}), 22: (1, {'@': 290}), 32: (1, {'@': 290}), 31: (1, {'@': 290}), 44: (1, {'@': 290}), 54: (1, {'@': 290}), 33: (1, {'@': 290}), 34: (1, {'@': 290}), 45: (1, {'@': 290}), 46: (1, {'@': 290}), 35: (1, {'@': 290}), 36: (1, {'@': 290}), 37: (1, {'@': 290}), 47: (1, {'@': 290}), 49: (1, {'@': 290}), 50: (1, {'@': 290}), 51: (1, {'@': 290}), 38: (1, {'@': 290}), 52: (1, {'@': 290}), 53: (1, {'@': 290}), 39: (1, {'@': 290}), 40: (1, {'@': 290}), 41: (1, {'@': 290}), 42: (1, {'@': 290}), 55: (1, {'@': 290}), 43: (1, {'@': 290})}, 642: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 93: (0, 391), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 643: {56: (0, 388), 39: (0, 261), 57: (0, 333), 58: (0, 233), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 22: (0, 236), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 96: (0, 514), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 123})}, 644: {33: (1, {'@': 175}), 34: (1, {'@': 175}), 35: (1, {'@': 175}), 36: (1, {'@': 175}), 37: (1, {'@': 175}), 39: (1, {'@': 175}), 40: (1, {'@': 175}), 41: (1, {'@': 175}), 42: (1, {'@': 175}), 43: (1, {'@': 175}), 4: (1, {'@': 175}), 45: (1, {'@': 175}), 46: (1, {'@': 175}), 11: (1, {'@': 175}), 47: (1, {'@': 175}), 49: (1, {'@': 175}), 50: (1, {'@': 175}), 51: (1, {'@': 175}), 52: (1, {'@': 175}), 53: (1, {'@': 175}), 55: (1, {'@': 175})}, 645: {13: (0, 334), 28: (0, 105), 26: (0, 6), 175: (0, 467), 6: (0, 100), 9: (0, 139), 179: (0, 479), 30: (1, {'@': 268}), 24: (1, {'@': 268}), 7: (1, {'@': 268}), 25: (1, {'@': 268}), 10: (1, {'@': 268}), 27: (1, {'@': 268}), 14: (1, {'@': 268}), 15: (1, {'@': 268}), 17: (1, {'@': 268}), 29: (1, {'@': 268}), 18: (1, {'@': 268}), 20: (1, {'@': 268}), 33: (1, {'@': 254}), 34: (1, {'@': 254}), 35: (1, {'@': 254}), 36: (1, {'@': 254}), 37: (1, {'@': 254}), 38: (1, {'@': 254}), 39: (1, {'@': 254}), 40: (1, {'@': 254}), 41: (1, {'@': 254}), 42: (1, {'@': 254}), 32: (1, {'@': 254}), 43: (1, {'@': 254}), 44: (1, {'@': 254}), 4: (1, {'@': 254}), 45: (1, {'@': 254}), 5: (1, {'@': 254}), 46: (1, {'@': 254}), 31: (1, {'@': 254}), 11: (1, {'@': 254}), 47: (1, {'@': 254}), 48: (1, {'@': 254}), 49: (1, {'@': 254}), 50: (1, {'@': 254}), 0: (1, {'@': 254}), 19: (1, {'@': 254}), 22: (1, {'@': 254}), 51: (1, {'@': 254}), 52: (1, {'@': 254}), 53: (1, {'@': 254}), 54: (1, {'@': 254}), 55: (1, {'@': 254}), 2: (1, {'@': 488}), 3: (1, {'@': 488}), 23: (1, {'@': 444}), 8: (1, {'@': 444}), 12: (1, {'@': 444}), 16: (1, {'@': 444}), 21: (1, {'@': 444})}, 646: {4: (1, {'@': 479}), 6: (1, {'@': 479}), 23: (1, {'@': 479}), 8: (1, {'@': 479}), 9: (1, {'@': 479}), 26: (1, {'@': 479}), 11: (1, {'@': 479}), 12: (1, {'@': 479}), 54: (1, {'@': 479}), 13: (1, {'@': 479}), 32: (1, {'@': 479}), 16: (1, {'@': 479}), 28: (1, {'@': 479}), 0: (1, {'@': 479}), 19: (1, {'@': 479}), 21: (1, {'@': 479}), 48: (1, {'@': 479}), 5: (1, {'@': 479})}, 647: {37: (0, 481), 180: (0, 317), 4: (0, 314), 70: (0, 307), 45: (0, 504), 39: (0, 261), 181: (0, 357), 182: (0, 422), 40: (0, 437), 183: (0, 431), 93: (0, 404), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 184: (0, 689), 185: (0, 359), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 34: (0, 483), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 186: (0, 423), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 648: {33: (1, {'@': 392}), 34: (1, {'@': 392}), 35: (1, {'@': 392}), 36: (1, {'@': 392}), 37: (1, {'@': 392}), 38: (1, {'@': 392}), 39: (1, {'@': 392}), 40: (1, {'@': 392}), 41: (1, {'@': 392}), 42: (1, {'@': 392}), 43: (1, {'@': 392}), 4: (1, {'@': 392}), 45: (1, {'@': 392}), 5: (1, {'@': 392}), 46: (1, {'@': 392}), 11: (1, {'@': 392}), 47: (1, {'@': 392}), 49: (1, {'@': 392}), 50: (1, {'@': 392}), 19: (1, {'@': 392}), 51: (1, {'@': 392}), 52: (1, {'@': 392}), 53: (1, {'@': 392}), 55: (1, {'@': 392})}, 649: {32: (0, 219)}, 650: {5: (0, 262)}, 651: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 184: (0, 138), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 183: (0, 214), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 93: (0, 40), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 652: {178: (0, 272), 4: (1, {'@': 141}), 5: (1, {'@': 141}), 6: (1, {'@': 141}), 7: (1, {'@': 141}), 8: (1, {'@': 141}), 9: (1, {'@': 141}), 10: (1, {'@': 141}), 3: (1, {'@': 141}), 11: (1, {'@': 141}), 12: (1, {'@': 141}), 13: (1, {'@': 141}), 14: (1, {'@': 141}), 15: (1, {'@': 141}), 2: (1, {'@': 141}), 16: (1, {'@': 141}), 17: (1, {'@': 141}), 0: (1, {'@': 141}), 18: (1, {'@': 141}), 19: (1, {'@': 141}), 20: (1, {'@': 141}), 21: (1, {'@': 141}), 22: (1, {'@': 141}), 23: (1, {'@': 141}), 24: (1, {'@': 141}), 25: (1, {'@': 141}), 26: (1, {'@': 141}), 27: (1, {'@': 141}), 28: (1, {'@': 141}), 29: (1, {'@': 141}), 30: (1, {'@': 141}), 54: (1, {'@': 141}), 32: (1, {'@': 141}), 31: (1, {'@': 141}), 44: (1, {'@': 141}), 48: (1, {'@': 141}), 33: (1, {'@': 141}), 34: (1, {'@': 141}), 35: (1, {'@': 141}), 36: (1, {'@': 141}), 37: (1, {'@': 141}), 38: (1, {'@': 141}), 39: (1, {'@': 141}), 40: (1, {'@': 141}), 41: (1, {'@': 141}), 42: (1, {'@': 141}), 43: (1, {'@': 141}), 45: (1, {'@': 141}), 46: (1, {'@': 141}), 47: (1, {'@': 141}), 49: (1, {'@': 141}), 50: (1, {'@': 141}), 51: (1, {'@': 141}), 52: (1, {'@': 141}), 53: (1, {'@': 141}), 55: (1, {'@': 141})}, 653: {4: (1, {'@': 249}), 32: (1, {'@': 249}), 0: (1, {'@': 249}), 19: (1, {'@': 249}), 11: (1, {'@': 249}), 54: (1, {'@': 249}), 48: (1, {'@': 249}), 5: (1, {'@': 249})}, 654: {33: (1, {'@': 371}), 34: (1, {'@': 371}), 35: (1, {'@': 371}), 12: (1, {'@': 371}), 36: (1, {'@': 371}), 37: (1, {'@': 371}), 21: (1, {'@': 371}), 38: (1, {'@': 371}), 23: (1, {'@': 371}), 25: (1, {'@': 371}), 39: (1, {'@': 371}), 41: (1, {'@': 371}), 40: (1, {'@': 371}), 26: (1, {'@': 371}), 42: (1, {'@': 371}), 32: (1, {'@': 371}), 43: (1, {'@': 371}), 44: (1, {'@': 371}), 4: (1, {'@': 371}), 45: (1, {'@': 371}), 5: (1, {'@': 371}), 6: (1, {'@': 371}), 8: (1, {'@': 371}), 3: (1, {'@': 371}), 9: (1, {'@': 371}), 31: (1, {'@': 371}), 46: (1, {'@': 371}), 11: (1, {'@': 371}), 2: (1, {'@': 371}), 13: (1, {'@': 371}), 15: (1, {'@': 371}), 47: (1, {'@': 371}), 48: (1, {'@': 371}), 16: (1, {'@': 371}), 49: (1, {'@': 371}), 50: (1, {'@': 371}), 0: (1, {'@': 371}), 19: (1, {'@': 371}), 22: (1, {'@': 371}), 51: (1, {'@': 371}), 52: (1, {'@': 371}), 53: (1, {'@': 371}), 54: (1, {'@': 371}), 55: (1, {'@': 371}), 28: (1, {'@': 371}), 14: (1, {'@': 371}), 18: (1, {'@': 371}), 24: (1, {'@': 371}), 7: (1, {'@': 371}), 10: (1, {'@': 371}), 17: (1, {'@': 371}), 20: (1, {'@': 371}), 27: (1, {'@': 371}), 29: (1, {'@': 371}), 30: (1, {'@': 371})}, 655: {33: (1, {'@': 233}), 34: (1, {'@': 233}), 35: (1, {'@': 233}), 36: (1, {'@': 233}), 37: (1, {'@': 233}), 38: (1, {'@': 233}), 39: (1, {'@': 233}), 40: (1, {'@': 233}), 41: (1, {'@': 233}), 42: (1, {'@': 233}), 43: (1, {'@': 233}), 45: (1, {'@': 233}), 46: (1, {'@': 233}), 47: (1, {'@': 233}), 49: (1, {'@': 233}), 50: (1, {'@': 233}), 51: (1, {'@': 233}), 52: (1, {'@': 233}), 53: (1, {'@': 233}), 55: (1, {'@': 233})}, 656: {4: (1, {'@': 132}), 5: (1, {'@': 132}), 6: (1, {'@': 132}), 7: (1, {'@': 132}), 8: (1, {'@': 132}), 9: (1, {'@': 132}), 10: (1, {'@': 132}), 3: (1, {'@': 132}), 11: (1, {'@': 132}), 12: (1, {'@': 132}), 13: (1, {'@': 132}), 14: (1, {'@': 132}), 15: (1, {'@': 132}), 2: (1, {'@': 132}), 16: (1, {'@': 132}), 17: (1, {'@': 132}), 0: (1, {'@': 132}), 18: (1, {'@': 132}), 19: (1, {'@': 132}), 20: (1, {'@': 132}), 21: (1, {'@': 132}), 22: (1, {'@': 132}), 23: (1, {'@': 132}), 24: (1, {'@': 132}), 25: (1, {'@': 132}), 26: (1, {'@': 132}), 27: (1, {'@': 132}), 28: (1, {'@': 132}), 29: (1, {'@': 132}), 30: (1, {'@': 132}), 31: (1, {'@': 132}), 32: (1, {'@': 132}), 33: (1, {'@': 132}), 34: (1, {'@': 132}), 35: (1, {'@': 132}), 36: (1, {'@': 132}), 37: (1, {'@': 132}), 38: (1, {'@': 132}), 39: (1, {'@': 132}), 40: (1, {'@': 132}), 41: (1, {'@': 132}), 42: (1, {'@': 132}), 43: (1, {'@': 132}), 44: (1, {'@': 132}), 45: (1, {'@': 132}), 46: (1, {'@': 132}), 47: (1, {'@': 132}), 48: (1, {'@': 132}), 49: (1, {'@': 132}), 50: (1, {'@': 132}), 51: (1, {'@': 132}), 52: (1, {'@': 132}), 53: (1, {'@': 132}), 54: (1, {'@': 132}), 55: (1, {'@': 132})}, 657: {32: (1, {'@': 274}), 54: (1, {'@': 274}), 0: (1, {'@': 274})}, 658: {4: (0, 414), 5: (0, 203), 19: (0, 167), 11: (0, 177), 0: (1, {'@': 90}), 22: (1, {'@': 90}), 31: (1, {'@': 90}), 32: (1, {'@': 90}), 44: (1, {'@': 90}), 54: (1, {'@': 90}), 33: (1, {'@': 90}), 34: (1, {'@': 90}), 45: (1, {'@': 90}), 46: (1, {'@': 90}), 35: (1, {'@': 90}), 36: (1, {'@': 90}), 37: (1, {'@': 90}), 47: (1, {'@': 90}), 49: (1, {'@': 90}), 50: (1, {'@': 90}), 51: (1, {'@': 90}), 38: (1, {'@': 90}), 52: (1, {'@': 90}), 53: (1, {'@': 90}), 39: (1, {'@': 90}), 40: (1, {'@': 90}), 41: (1, {'@': 90}), 42: (1, {'@': 90}), 55: (1, {'@': 90}), 43: (1, {'@': 90})}, 659: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 79: (0, 634), 78: (0, 666), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 58: (0, 472), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 54: (1, {'@': 297}), 0: (1, {'@': 297})}, 660: {4: (1, {'@': 195}), 5: (1, {'@': 195}), 6: (1, {'@': 195}), 7: (1, {'@': 195}), 8: (1, {'@': 195}), 9: (1, {'@': 195}), 10: (1, {'@': 195}), 3: (1, {'@': 195}), 11: (1, {'@': 195}), 12: (1, {'@': 195}), 13: (1, {'@': 195}), 14: (1, {'@': 195}), 15: (1, {'@': 195}), 2: (1, {'@': 195}), 16: (1, {'@': 195}), 17: (1, {'@': 195}), 0: (1, {'@': 195}), 18: (1, {'@': 195}), 19: (1, {'@': 195}), 20: (1, {'@': 195}), 21: (1, {'@': 195}), 22: (1, {'@': 195}), 23: (1, {'@': 195}), 24: (1, {'@': 195}), 25: (1, {'@': 195}), 26: (1, {'@': 195}), 27: (1, {'@': 195}), 28: (1, {'@': 195}), 29: (1, {'@': 195}), 30: (1, {'@': 195}), 31: (1, {'@': 195}), 32: (1, {'@': 195}), 33: (1, {'@': 195}), 34: (1, {'@': 195}), 35: (1, {'@': 195}), 36: (1, {'@': 195}), 37: (1, {'@': 195}), 38: (1, {'@': 195}), 39: (1, {'@': 195}), 40: (1, {'@': 195}), 41: (1, {'@': 195}), 42: (1, {'@': 195}), 43: (1, {'@': 195}), 44: (1, {'@': 195}), 45: (1, {'@': 195}), 46: (1, {'@': 195}), 47: (1, {'@': 195}), 48: (1, {'@': 195}), 49: (1, {'@': 195}), 50: (1, {'@': 195}), 51: (1, {'@': 195}), 52: (1, {'@': 195}), 53: (1, {'@': 195}), 54: (1, {'@': 195}), 55: (1, {'@': 195})}, 661: {4: (1, {'@': 192}), 5: (1, {'@': 192}), 6: (1, {'@': 192}), 7: (1, {'@': 192}), 8: (1, {'@': 192}), 9: (1, {'@': 192}), 10: (1, {'@': 192}), 3: (1, {'@': 192}), 11: (1, {'@': 192}), 12: (1, {'@': 192}), 13: (1, {'@': 192}), 14: (1, {'@': 192}), 15: (1, {'@': 192}), 2: (1, {'@': 192}), 16: (1, {'@': 192}), 17: (1, {'@': 192}), 0: (1, {'@': 192}), 18: (1, {'@': 192}), 19: (1, {'@': 192}), 20: (1, {'@': 192}), 21: (1, {'@': 192}), 22: (1, {'@': 192}), 23: (1, {'@': 192}), 24: (1, {'@': 192}), 25: (1, {'@': 192}), 26: (1, {'@': 192}), 27: (1, {'@': 192}), 28: (1, {'@': 192}), 29: (1, {'@': 192}), 30: (1, {'@': 192}), 31: (1, {'@': 192}), 32: (1, {'@': 192}), 33: (1, {'@': 192}), 34: (1, {'@': 192}), 35: (1, {'@': 192}), 36: (1, {'@': 192}), 37: (1, {'@': 192}), 38: (1, {'@': 192}), 39: (1, {'@': 192}), 40: (1, {'@': 192}), 41: (1, {'@': 192}), 42: (1, {'@': 192}), 43: (1, {'@': 192}), 44: (1, {'@': 192}), 45: (1, {'@': 192}), 46: (1, {'@': 192}), 47: (1, {'@': 192}), 48: (1, {'@': 192}), 49: (1, {'@': 192}), 50: (1, {'@': 192}), 51: (1, {'@': 192}), 52: (1, {'@': 192}), 53: (1, {'@': 192}), 54: (1, {'@': 192}), 55: (1, {'@': 192})}, 662: {56: (0, 388), 39: (0, 261), 57: (0, 333), 58: (0, 233), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 22: (0, 236), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 652), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 96: (0, 709), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 34: (0, 483), 91: (0, 497), 37: (0, 481), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692), 0: (1, {'@': 123})}, 663: {33: (1, {'@': 436}), 34: (1, {'@': 436}), 4: (1, {'@': 436}), 45: (1, {'@': 436}), 5: (1, {'@': 436}), 46: (1, {'@': 436}), 35: (1, {'@': 436}), 31: (1, {'@': 436}), 11: (1, {'@': 436}), 36: (1, {'@': 436}), 37: (1, {'@': 436}), 47: (1, {'@': 436}), 48: (1, {'@': 436}), 49: (1, {'@': 436}), 50: (1, {'@': 436}), 0: (1, {'@': 436}), 19: (1, {'@': 436}), 22: (1, {'@': 436}), 51: (1, {'@': 436}), 38: (1, {'@': 436}), 52: (1, {'@': 436}), 53: (1, {'@': 436}), 39: (1, {'@': 436}), 40: (1, {'@': 436}), 41: (1, {'@': 436}), 54: (1, {'@': 436}), 42: (1, {'@': 436}), 32: (1, {'@': 436}), 43: (1, {'@': 436}), 55: (1, {'@': 436}), 44: (1, {'@': 436})}, 664: {4: (1, {'@': 99}), 5: (1, {'@': 99}), 0: (1, {'@': 99}), 19: (1, {'@': 99}), 11: (1, {'@': 99}), 22: (1, {'@': 99}), 32: (1, {'@': 99}), 31: (1, {'@': 99}), 54: (1, {'@': 99}), 44: (1, {'@': 99}), 48: (1, {'@': 99}), 33: (1, {'@': 99}), 34: (1, {'@': 99}), 45: (1, {'@': 99}), 46: (1, {'@': 99}), 35: (1, {'@': 99}), 36: (1, {'@': 99}), 37: (1, {'@': 99}), 47: (1, {'@': 99}), 49: (1, {'@': 99}), 50: (1, {'@': 99}), 51: (1, {'@': 99}), 38: (1, {'@': 99}), 52: (1, {'@': 99}), 53: (1, {'@': 99}), 39: (1, {'@': 99}), 40: (1, {'@': 99}), 41: (1, {'@': 99}), 42: (1, {'@': 99}), 55: (1, {'@': 99}), 43: (1, {'@': 99})}, 665: {33: (1, {'@': 465}), 34: (1, {'@': 465}), 4: (1, {'@': 465}), 45: (1, {'@': 465}), 5: (1, {'@': 465}), 46: (1, {'@': 465}), 35: (1, {'@': 465}), 11: (1, {'@': 465}), 36: (1, {'@': 465}), 37: (1, {'@': 465}), 47: (1, {'@': 465}), 49: (1, {'@': 465}), 50: (1, {'@': 465}), 19: (1, {'@': 465}), 51: (1, {'@': 465}), 38: (1, {'@': 465}), 52: (1, {'@': 465}), 53: (1, {'@': 465}), 39: (1, {'@': 465}), 40: (1, {'@': 465}), 41: (1, {'@': 465}), 42: (1, {'@': 465}), 55: (1, {'@': 465}), 43: (1, {'@': 465})}, 666: {0: (1, {'@': 238}), 22: (1, {'@': 238}), 31: (1, {'@': 238}), 32: (1, {'@': 238}), 44: (1, {'@': 238}), 54: (1, {'@': 238}), 33: (1, {'@': 238}), 34: (1, {'@': 238}), 45: (1, {'@': 238}), 46: (1, {'@': 238}), 35: (1, {'@': 238}), 36: (1, {'@': 238}), 37: (1, {'@': 238}), 47: (1, {'@': 238}), 49: (1, {'@': 238}), 50: (1, {'@': 238}), 51: (1, {'@': 238}), 38: (1, {'@': 238}), 52: (1, {'@': 238}), 53: (1, {'@': 238}), 39: (1, {'@': 238}), 40: (1, {'@': 238}), 41: (1, {'@': 238}), 42: (1, {'@': 238}), 55: (1, {'@': 238}), 43: (1, {'@': 238})}, 667: {4: (1, {'@': 453}), 5: (1, {'@': 453}), 23: (1, {'@': 453}), 8: (1, {'@': 453}), 3: (1, {'@': 453}), 31: (1, {'@': 453}), 11: (1, {'@': 453}), 12: (1, {'@': 453}), 2: (1, {'@': 453}), 32: (1, {'@': 453}), 16: (1, {'@': 453}), 44: (1, {'@': 453}), 19: (1, {'@': 453}), 21: (1, {'@': 453}), 33: (1, {'@': 453}), 34: (1, {'@': 453}), 35: (1, {'@': 453}), 36: (1, {'@': 453}), 37: (1, {'@': 453}), 38: (1, {'@': 453}), 39: (1, {'@': 453}), 40: (1, {'@': 453}), 41: (1, {'@': 453}), 42: (1, {'@': 453}), 43: (1, {'@': 453}), 45: (1, {'@': 453}), 46: (1, {'@': 453}), 47: (1, {'@': 453}), 49: (1, {'@': 453}), 50: (1, {'@': 453}), 0: (1, {'@': 453}), 22: (1, {'@': 453}), 51: (1, {'@': 453}), 52: (1, {'@': 453}), 53: (1, {'@': 453}), 54: (1, {'@': 453}), 55: (1, {'@': 453}), 48: (1, {'@': 453})}, 668: {33: (1, {'@': 81}), 34: (1, {'@': 81}), 45: (1, {'@': 81}), 46: (1, {'@': 81}), 35: (1, {'@': 81}), 36: (1, {'@': 81}), 37: (1, {'@': 81}), 47: (1, {'@': 81}), 49: (1, {'@': 81}), 50: (1, {'@': 81}), 51: (1, {'@': 81}), 38: (1, {'@': 81}), 52: (1, {'@': 81}), 53: (1, {'@': 81}), 39: (1, {'@': 81}), 40: (1, {'@': 81}), 41: (1, {'@': 81}), 42: (1, {'@': 81}), 55: (1, {'@': 81}), 43: (1, {'@': 81})}, 669: {4: (1, {'@': 60}), 5: (1, {'@': 60}), 6: (1, {'@': 60}), 7: (1, {'@': 60}), 8: (1, {'@': 60}), 9: (1, {'@': 60}), 10: (1, {'@': 60}), 3: (1, {'@': 60}), 11: (1, {'@': 60}), 12: (1, {'@': 60}), 13: (1, {'@': 60}), 14: (1, {'@': 60}), 15: (1, {'@': 60}), 2: (1, {'@': 60}), 16: (1, {'@': 60}), 17: (1, {'@': 60}), 0: (1, {'@': 60}), 18: (1, {'@': 60}), 19: (1, {'@': 60}), 20: (1, {'@': 60}), 21: (1, {'@': 60}), 22: (1, {'@': 60}), 23: (1, {'@': 60}), 24: (1, {'@': 60}), 25: (1, {'@': 60}), 26: (1, {'@': 60}), 27: (1, {'@': 60}), 28: (1, {'@': 60}), 29: (1, {'@': 60}), 30: (1, {'@': 60}), 31: (1, {'@': 60}), 32: (1, {'@': 60}), 33: (1, {'@': 60}), 34: (1, {'@': 60}), 35: (1, {'@': 60}), 36: (1, {'@': 60}), 37: (1, {'@': 60}), 38: (1, {'@': 60}), 39: (1, {'@': 60}), 40: (1, {'@': 60}), 41: (1, {'@': 60}), 42: (1, {'@': 60}), 43: (1, {'@': 60}), 44: (1, {'@': 60}), 45: (1, {'@': 60}), 46: (1, {'@': 60}), 47: (1, {'@': 60}), 48: (1, {'@': 60}), 49: (1, {'@': 60}), 50: (1, {'@': 60}), 51: (1, {'@': 60}), 52: (1, {'@': 60}), 53: (1, {'@': 60}), 54: (1, {'@': 60}), 55: (1, {'@': 60})}, 670: {33: (1, {'@': 174}), 34: (1, {'@': 174}), 35: (1, {'@': 174}), 36: (1, {'@': 174}), 37: (1, {'@': 174}), 39: (1, {'@': 174}), 40: (1, {'@': 174}), 41: (1, {'@': 174}), 42: (1, {'@': 174}), 43: (1, {'@': 174}), 4: (1, {'@': 174}), 45: (1, {'@': 174}), 46: (1, {'@': 174}), 11: (1, {'@': 174}), 47: (1, {'@': 174}), 49: (1, {'@': 174}), 50: (1, {'@': 174}), 51: (1, {'@': 174}), 52: (1, {'@': 174}), 53: (1, {'@': 174}), 55: (1, {'@': 174})}, 671: {175: (0, 449), 28: (0, 579), 171: (0, 636), 9: (0, 139), 6: (0, 644), 13: (0, 670), 30: (1, {'@': 268}), 24: (1, {'@': 268}), 7: (1, {'@': 268}), 25: (1, {'@': 268}), 10: (1, {'@': 268}), 27: (1, {'@': 268}), 14: (1, {'@': 268}), 15: (1, {'@': 268}), 17: (1, {'@': 268}), 29: (1, {'@': 268}), 18: (1, {'@': 268}), 20: (1, {'@': 268}), 33: (1, {'@': 391}), 34: (1, {'@': 391}), 35: (1, {'@': 391}), 36: (1, {'@': 391}), 37: (1, {'@': 391}), 38: (1, {'@': 391}), 39: (1, {'@': 391}), 40: (1, {'@': 391}), 41: (1, {'@': 391}), 42: (1, {'@': 391}), 43: (1, {'@': 391}), 4: (1, {'@': 391}), 45: (1, {'@': 391}), 5: (1, {'@': 391}), 46: (1, {'@': 391}), 11: (1, {'@': 391}), 47: (1, {'@': 391}), 49: (1, {'@': 391}), 50: (1, {'@': 391}), 19: (1, {'@': 391}), 51: (1, {'@': 391}), 52: (1, {'@': 391}), 53: (1, {'@': 391}), 55: (1, {'@': 391}), 2: (1, {'@': 488}), 3: (1, {'@': 488}), 23: (1, {'@': 444}), 8: (1, {'@': 444}), 12: (1, {'@': 444}), 16: (1, {'@': 444}), 21: (1, {'@': 444}), 26: (1, {'@': 278})}, 672: {4: (1, {'@': 410}), 5: (1, {'@': 410}), 0: (1, {'@': 410}), 19: (1, {'@': 410}), 11: (1, {'@': 410}), 22: (1, {'@': 410}), 32: (1, {'@': 410}), 31: (1, {'@': 410}), 44: (1, {'@': 410}), 54: (1, {'@': 410}), 33: (1, {'@': 410}), 34: (1, {'@': 410}), 45: (1, {'@': 410}), 46: (1, {'@': 410}), 35: (1, {'@': 410}), 36: (1, {'@': 410}), 37: (1, {'@': 410}), 47: (1, {'@': 410}), 49: (1, {'@': 410}), 50: (1, {'@': 410}), 51: (1, {'@': 410}), 38: (1, {'@': 410}), 52: (1, {'@': 410}), 53: (1, {'@': 410}), 39: (1, {'@': 410}), 40: (1, {'@': 410}), 41: (1, {'@': 410}), 42: (1, {'@': 410}), 55: (1, {'@': 410}), 43: (1, {'@': 410})}, 673: {37: (0, 481), 45: (0, 504), 4: (0, 314), 70: (0, 307), 39: (0, 261), 184: (0, 222), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 64: (0, 526), 77: (0, 710), 41: (0, 458), 204: (0, 667), 80: (0, 628), 66: (0, 528), 88: (0, 419), 34: (0, 483), 97: (0, 525), 53: (0, 618), 51: (0, 540), 183: (0, 214), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 93: (0, 40), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600)}, 674: {4: (1, {'@': 514}), 6: (1, {'@': 514}), 8: (1, {'@': 514}), 9: (1, {'@': 514}), 3: (1, {'@': 514}), 11: (1, {'@': 514}), 12: (1, {'@': 514}), 13: (1, {'@': 514}), 2: (1, {'@': 514}), 16: (1, {'@': 514}), 0: (1, {'@': 514}), 19: (1, {'@': 514}), 21: (1, {'@': 514}), 23: (1, {'@': 514}), 26: (1, {'@': 514}), 54: (1, {'@': 514}), 32: (1, {'@': 514}), 28: (1, {'@': 514}), 48: (1, {'@': 514}), 5: (1, {'@': 514})}, 675: {4: (1, {'@': 61}), 5: (1, {'@': 61}), 6: (1, {'@': 61}), 7: (1, {'@': 61}), 8: (1, {'@': 61}), 9: (1, {'@': 61}), 10: (1, {'@': 61}), 3: (1, {'@': 61}), 11: (1, {'@': 61}), 12: (1, {'@': 61}), 13: (1, {'@': 61}), 14: (1, {'@': 61}), 15: (1, {'@': 61}), 2: (1, {'@': 61}), 16: (1, {'@': 61}), 17: (1, {'@': 61}), 0: (1, {'@': 61}), 18: (1, {'@': 61}), 19: (1, {'@': 61}), 20: (1, {'@': 61}), 21: (1, {'@': 61}), 22: (1, {'@': 61}), 23: (1, {'@': 61}), 24: (1, {'@': 61}), 25: (1, {'@': 61}), 26: (1, {'@': 61}), 27: (1, {'@': 61}), 28: (1, {'@': 61}), 29: (1, {'@': 61}), 30: (1, {'@': 61}), 31: (1, {'@': 61}), 32: (1, {'@': 61}), 33: (1, {'@': 61}), 34: (1, {'@': 61}), 35: (1, {'@': 61}), 36: (1, {'@': 61}), 37: (1, {'@': 61}), 38: (1, {'@': 61}), 39: (1, {'@': 61}), 40: (1, {'@': 61}), 41: (1, {'@': 61}), 42: (1, {'@': 61}), 43: (1, {'@': 61}), 44: (1, {'@': 61}), 45: (1, {'@': 61}), 46: (1, {'@': 61}), 47: (1, {'@': 61}), 48: (1, {'@': 61}), 49: (1, {'@': 61}), 50: (1, {'@': 61}), 51: (1, {'@': 61}), 52: (1, {'@': 61}), 53: (1, {'@': 61}), 54: (1, {'@': 61}), 55: (1, {'@': 61})}, 676: {4: (1, {'@': 98}), 5: (1, {'@': 98}), 0: (1, {'@': 98}), 19: (1, {'@': 98}), 11: (1, {'@': 98}), 22: (1, {'@': 98}), 32: (1, {'@': 98}), 31: (1, {'@': 98}), 54: (1, {'@': 98}), 44: (1, {'@': 98}), 48: (1, {'@': 98}), 33: (1, {'@': 98}), 34: (1, {'@': 98}), 45: (1, {'@': 98}), 46: (1, {'@': 98}), 35: (1, {'@': 98}), 36: (1, {'@': 98}), 37: (1, {'@': 98}), 47: (1, {'@': 98}), 49: (1, {'@': 98}), 50: (1, {'@': 98}), 51: (1, {'@': 98}), 38: (1, {'@': 98}), 52: (1, {'@': 98}), 53: (1, {'@': 98}), 39: (1, {'@': 98}), 40: (1, {'@': 98}), 41: (1, {'@': 98}), 42: (1, {'@': 98}), 55: (1, {'@': 98}), 43: (1, {'@': 98})}, 677: {44: (0, 327), 159: (0, 657)}, 678: {195: (0, 178), 37: (0, 481), 45: (0, 504), 70: (0, 307), 39: (0, 261), 75: (0, 107), 40: (0, 437), 43: (0, 519), 71: (0, 661), 196: (0, 59), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 198: (0, 387), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 197: (0, 4), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 679: {56: (0, 388), 39: (0, 261), 57: (0, 333), 59: (0, 426), 60: (0, 401), 40: (0, 437), 61: (0, 247), 11: (0, 522), 62: (0, 490), 63: (0, 507), 64: (0, 526), 65: (0, 466), 105: (0, 166), 66: (0, 528), 67: (0, 470), 45: (0, 504), 4: (0, 314), 68: (0, 676), 50: (0, 600), 69: (0, 688), 70: (0, 122), 71: (0, 661), 55: (0, 708), 72: (0, 611), 42: (0, 606), 73: (0, 698), 74: (0, 695), 49: (0, 669), 47: (0, 675), 75: (0, 656), 76: (0, 658), 77: (0, 710), 78: (0, 666), 79: (0, 634), 80: (0, 628), 81: (0, 614), 53: (0, 618), 82: (0, 593), 83: (0, 515), 84: (0, 621), 85: (0, 392), 104: (0, 21), 26: (0, 604), 33: (0, 283), 86: (0, 405), 87: (0, 395), 88: (0, 419), 89: (0, 399), 36: (0, 276), 90: (0, 355), 58: (0, 183), 34: (0, 483), 91: (0, 497), 37: (0, 481), 106: (0, 195), 107: (0, 196), 92: (0, 494), 43: (0, 519), 93: (0, 486), 46: (0, 534), 94: (0, 527), 95: (0, 478), 41: (0, 458), 97: (0, 525), 32: (0, 29), 51: (0, 540), 98: (0, 488), 52: (0, 544), 99: (0, 531), 100: (0, 574), 101: (0, 256), 35: (0, 365), 102: (0, 660), 103: (0, 692)}, 680: {4: (1, {'@': 324}), 33: (1, {'@': 324}), 5: (1, {'@': 324}), 34: (1, {'@': 324}), 45: (1, {'@': 324}), 46: (1, {'@': 324}), 35: (1, {'@': 324}), 11: (1, {'@': 324}), 36: (1, {'@': 324}), 37: (1, {'@': 324}), 47: (1, {'@': 324}), 49: (1, {'@': 324}), 50: (1, {'@': 324}), 19: (1, {'@': 324}), 51: (1, {'@': 324}), 38: (1, {'@': 324}), 52: (1, {'@': 324}), 53: (1, {'@': 324}), 39: (1, {'@': 324}), 40: (1, {'@': 324}), 41: (1, {'@': 324}), 42: (1, {'@': 324}), 55: (1, {'@': 324}), 43: (1, {'@': 324})}, 681: {33: (1, {'@': 521}), 34: (1, {'@': 521}), 35: (1, {'@': 521}), 12: (1, {'@': 521}), 36: (1, {'@': 521}), 37: (1, {'@': 521}), 21: (1, {'@': 521}), 38: (1, {'@': 521}), 23: (1, {'@': 521}), 39: (1, {'@': 521}), 40: (1, {'@': 521}), 41: (1, {'@': 521}), 42: (1, {'@': 521}), 32: (1, {'@': 521}), 43: (1, {'@': 521}), 44: (1, {'@': 521}), 4: (1, {'@': 521}), 45: (1, {'@': 521}), 5: (1, {'@': 521}), 8: (1, {'@': 521}), 3: (1, {'@': 521}), 46: (1, {'@': 521}), 31: (1, {'@': 521}), 11: (1, {'@': 521}), 2: (1, {'@': 521}), 47: (1, {'@': 521}), 48: (1, {'@': 521}), 16: (1, {'@': 521}), 49: (1, {'@': 521}), 50: (1, {'@': 521}), 0: (1, {'@': 521}), 19: (1, {'@': 521}), 22: (1, {'@': 521}), 51: (1, {'@': 521}), 52: (1, {'@': 521}), 53: (1, {'@': 521}), 54: (1, {'@': 521}), 55: (1, {'@': 521}), 26: (1, {'@': 521}), 6: (1, {'@': 521}), 9: (1, {'@': 521}), 13: (1, {'@': 521}), 28: (1, {'@': 521})}, 682: {33: (1, {'@': 503}), 34: (1, {'@': 503}), 35: (1, {'@': 503}), 12: (1, {'@': 503}), 36: (1, {'@': 503}), 37: (1, {'@': 503}), 21: (1, {'@': 503}), 38: (1, {'@': 503}), 23: (1, {'@': 503}), 39: (1, {'@': 503}), 40: (1, {'@': 503}), 41: (1, {'@': 503}), 26: (1, {'@': 503}), 42: (1, {'@': 503}), 43: (1, {'@': 503}), 4: (1, {'@': 503}), 45: (1, {'@': 503}), 5: (1, {'@': 503}), 6: (1, {'@': 503}), 8: (1, {'@': 503}), 3: (1, {'@': 503}), 9: (1, {'@': 503}), 46: (1, {'@': 503}), 11: (1, {'@': 503}), 2: (1, {'@': 503}), 13: (1, {'@': 503}), 47: (1, {'@': 503}), 49: (1, {'@': 503}), 50: (1, {'@': 503}), 16: (1, {'@': 503}), 19: (1, {'@': 503}), 51: (1, {'@': 503}), 52: (1, {'@': 503}), 53: (1, {'@': 503}), 55: (1, {'@': 503}), 28: (1, {'@': 503})}, 683: {33: (1, {'@': 367}), 34: (1, {'@': 367}), 4: (1, {'@': 367}), 45: (1, {'@': 367}), 5: (1, {'@': 367}), 46: (1, {'@': 367}), 35: (1, {'@': 367}), 31: (1, {'@': 367}), 11: (1, {'@': 367}), 36: (1, {'@': 367}), 37: (1, {'@': 367}), 47: (1, {'@': 367}), 48: (1, {'@': 367}), 49: (1, {'@': 367}), 50: (1, {'@': 367}), 0: (1, {'@': 367}), 19: (1, {'@': 367}), 22: (1, {'@': 367}), 51: (1, {'@': 367}), 38: (1, {'@': 367}), 52: (1, {'@': 367}), 53: (1, {'@': 367}), 39: (1, {'@': 367}), 40: (1, {'@': 367}), 41: (1, {'@': 367}), 54: (1, {'@': 367}), 42: (1, {'@': 367}), 32: (1, {'@': 367}), 43: (1, {'@': 367}), 55: (1, {'@': 367}), 44: (1, {'@': 367})}, 684: {33: (1, {'@': 178}), 34: (1, {'@': 178}), 35: (1, {'@': 178}), 36: (1, {'@': 178}), 37: (1, {'@': 178}), 39: (1, {'@': 178}), 40: (1, {'@': 178}), 41: (1, {'@': 178}), 42: (1, {'@': 178}), 43: (1, {'@': 178}), 45: (1, {'@': 178}), 46: (1, {'@': 178}), 11: (1, {'@': 178}), 47: (1, {'@': 178}), 50: (1, {'@': 178}), 49: (1, {'@': 178}), 51: (1, {'@': 178}), 52: (1, {'@': 178}), 53: (1, {'@': 178}), 55: (1, {'@': 178})}, 685: {179: (0, 164), 13: (0, 334), 175: (0, 408), 28: (0, 105), 6: (0, 100), 9: (0, 139), 26: (0, 6), 4: (1, {'@': 345}), 32: (1, {'@': 345}), 0: (1, {'@': 345}), 19: (1, {'@': 345}), 11: (1, {'@': 345}), 54: (1, {'@': 345}), 48: (1, {'@': 345}), 5: (1, {'@': 345})}, 686: {28: (0, 579), 175: (0, 197), 9: (0, 139), 6: (0, 644), 171: (0, 443), 13: (0, 670), 33: (1, {'@': 460}), 34: (1, {'@': 460}), 4: (1, {'@': 460}), 45: (1, {'@': 460}), 5: (1, {'@': 460}), 46: (1, {'@': 460}), 35: (1, {'@': 460}), 11: (1, {'@': 460}), 36: (1, {'@': 460}), 37: (1, {'@': 460}), 47: (1, {'@': 460}), 49: (1, {'@': 460}), 50: (1, {'@': 460}), 19: (1, {'@': 460}), 51: (1, {'@': 460}), 38: (1, {'@': 460}), 52: (1, {'@': 460}), 53: (1, {'@': 460}), 39: (1, {'@': 460}), 40: (1, {'@': 460}), 41: (1, {'@': 460}), 42: (1, {'@': 460}), 55: (1, {'@': 460}), 43: (1, {'@': 460}), 26: (1, {'@': 279})}, 687: {12: (1, {'@': 369}), 14: (1, {'@': 369}), 18: (1, {'@': 369}), 21: (1, {'@': 369}), 24: (1, {'@': 369}), 23: (1, {'@': 369}), 25: (1, {'@': 369}), 26: (1, {'@': 369}), 32: (1, {'@': 369}), 4: (1, {'@': 369}), 5: (1, {'@': 369}), 6: (1, {'@': 369}), 7: (1, {'@': 369}), 8: (1, {'@': 369}), 9: (1, {'@': 369}), 10: (1, {'@': 369}), 3: (1, {'@': 369}), 11: (1, {'@': 369}), 13: (1, {'@': 369}), 2: (1, {'@': 369}), 15: (1, {'@': 369}), 48: (1, {'@': 369}), 16: (1, {'@': 369}), 17: (1, {'@': 369}), 0: (1, {'@': 369}), 19: (1, {'@': 369}), 20: (1, {'@': 369}), 27: (1, {'@': 369}), 54: (1, {'@': 369}), 28: (1, {'@': 369}), 29: (1, {'@': 369}), 30: (1, {'@': 369}), 33: (1, {'@': 369}), 34: (1, {'@': 369}), 35: (1, {'@': 369}), 36: (1, {'@': 369}), 37: (1, {'@': 369}), 38: (1, {'@': 369}), 39: (1, {'@': 369}), 40: (1, {'@': 369}), 41: (1, {'@': 369}), 42: (1, {'@': 369}), 43: (1, {'@': 369}), 45: (1, {'@': 369}), 46: (1, {'@': 369}), 47: (1, {'@': 369}), 49: (1, {'@': 369}), 50: (1, {'@': 369}), 51: (1, {'@': 369}), 52: (1, {'@': 369}), 53: (1, {'@': 369}), 55: (1, {'@': 369}), 44: (1, {'@': 369}), 31: (1, {'@': 369}), 22: (1, {'@': 369})}, 688: {4: (1, {'@': 334}), 5: (1, {'@': 334}), 0: (1, {'@': 334}), 19: (1, {'@': 334}), 11: (1, {'@': 334}), 22: (1, {'@': 334}), 32: (1, {'@': 334}), 31: (1, {'@': 334}), 44: (1, {'@': 334}), 54: (1, {'@': 334}), 33: (1, {'@': 334}), 34: (1, {'@': 334}), 45: (1, {'@': 334}), 46: (1, {'@': 334}), 35: (1, {'@': 334}), 36: (1, {'@': 334}), 37: (1, {'@': 334}), 47: (1, {'@': 334}), 49: (1, {'@': 334}), 50: (1, {'@': 334}), 51: (1, {'@': 334}), 38: (1, {'@': 334}), 52: (1, {'@': 334}), 53: (1, {'@': 334}), 39: (1, {'@': 334}), 40: (1, {'@': 334}), 41: (1, {'@': 334}), 42: (1, {'@': 334}), 55: (1, {'@': 334}), 43: (1, {'@': 334})}, 689: {25: (0, 87), 10: (0, 155), 203: (0, 512), 14: (0, 180), 20: (0, 520), 170: (0, 225), 29: (0, 498), 24: (0, 640), 176: (0, 341), 169: (0, 241), 27: (0, 427), 17: (0, 480), 18: (0, 489), 172: (0, 191), 30: (0, 438), 15: (0, 460), 7: (0, 523)}, 690: {4: (1, {'@': 347}), 32: (1, {'@': 347}), 0: (1, {'@': 347}), 19: (1, {'@': 347}), 11: (1, {'@': 347}), 54: (1, {'@': 347}), 48: (1, {'@': 347}), 5: (1, {'@': 347})}, 691: {4: (1, {'@': 348}), 32: (1, {'@': 348}), 0: (1, {'@': 348}), 19: (1, {'@': 348}), 11: (1, {'@': 348}), 54: (1, {'@': 348}), 48: (1, {'@': 348}), 5: (1, {'@': 348})}, 692: {4: (1, {'@': 332}), 5: (1, {'@': 332}), 0: (1, {'@': 332}), 19: (1, {'@': 332}), 11: (1, {'@': 332}), 22: (1, {'@': 332}), 32: (1, {'@': 332}), 31: (1, {'@': 332}), 44: (1, {'@': 332}), 54: (1, {'@': 332}), 33: (1, {'@': 332}), 34: (1, {'@': 332}), 45: (1, {'@': 332}), 46: (1, {'@': 332}), 35: (1, {'@': 332}), 36: (1, {'@': 332}), 37: (1, {'@': 332}), 47: (1, {'@': 332}), 49: (1, {'@': 332}), 50: (1, {'@': 332}), 51: (1, {'@': 332}), 38: (1, {'@': 332}), 52: (1, {'@': 332}), 53: (1, {'@': 332}), 39: (1, {'@': 332}), 40: (1, {'@': 332}), 41: (1, {'@': 332}), 42: (1, {'@': 332}), 55: (1, {'@': 332}), 43: (1, {'@': 332})}, 693: {4: (1, {'@': 247}), 32: (1, {'@': 247}), 0: (1, {'@': 247}), 19: (1, {'@': 247}), 11: (1, {'@': 247}), 54: (1, {'@': 247}), 48: (1, {'@': 247}), 5: (1, {'@': 247})}, 694: {0: (1, {'@': 120})}, 695: {5: (1, {'@': 403}), 0: (1, {'@': 235}), 22: (1, {'@': 235}), 31: (1, {'@': 235}), 32: (1, {'@': 235}), 44: (1, {'@': 235}), 54: (1, {'@': 235}), 33: (1, {'@': 235}), 34: (1, {'@': 235}), 45: (1, {'@': 235}), 46: (1, {'@': 235}), 35: (1, {'@': 235}), 36: (1, {'@': 235}), 37: (1, {'@': 235}), 47: (1, {'@': 235}), 49: (1, {'@': 235}), 50: (1, {'@': 235}), 51: (1, {'@': 235}), 38: (1, {'@': 235}), 52: (1, {'@': 235}), 53: (1, {'@': 235}), 39: (1, {'@': 235}), 40: (1, {'@': 235}), 41: (1, {'@': 235}), 42: (1, {'@': 235}), 55: (1, {'@': 235}), 43: (1, {'@': 235})}, 696: {37: (0, 481), 45: (0, 504), 70: (0, 307), 39: (0, 261), 40: (0, 437), 43: (0, 519), 71: (0, 661), 33: (0, 283), 11: (0, 522), 55: (0, 708), 46: (0, 534), 42: (0, 606), 73: (0, 698), 49: (0, 669), 47: (0, 675), 41: (0, 458), 80: (0, 628), 66: (0, 528), 88: (0, 419), 75: (0, 306), 97: (0, 525), 53: (0, 618), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 697: {4: (1, {'@': 478}), 6: (1, {'@': 478}), 23: (1, {'@': 478}), 8: (1, {'@': 478}), 9: (1, {'@': 478}), 26: (1, {'@': 478}), 11: (1, {'@': 478}), 12: (1, {'@': 478}), 54: (1, {'@': 478}), 13: (1, {'@': 478}), 32: (1, {'@': 478}), 16: (1, {'@': 478}), 28: (1, {'@': 478}), 0: (1, {'@': 478}), 19: (1, {'@': 478}), 21: (1, {'@': 478}), 48: (1, {'@': 478}), 5: (1, {'@': 478})}, 698: {4: (1, {'@': 135}), 5: (1, {'@': 135}), 6: (1, {'@': 135}), 7: (1, {'@': 135}), 8: (1, {'@': 135}), 9: (1, {'@': 135}), 10: (1, {'@': 135}), 3: (1, {'@': 135}), 11: (1, {'@': 135}), 12: (1, {'@': 135}), 13: (1, {'@': 135}), 14: (1, {'@': 135}), 15: (1, {'@': 135}), 2: (1, {'@': 135}), 16: (1, {'@': 135}), 17: (1, {'@': 135}), 0: (1, {'@': 135}), 18: (1, {'@': 135}), 19: (1, {'@': 135}), 20: (1, {'@': 135}), 21: (1, {'@': 135}), 22: (1, {'@': 135}), 23: (1, {'@': 135}), 24: (1, {'@': 135}), 25: (1, {'@': 135}), 26: (1, {'@': 135}), 27: (1, {'@': 135}), 28: (1, {'@': 135}), 29: (1, {'@': 135}), 30: (1, {'@': 135}), 31: (1, {'@': 135}), 32: (1, {'@': 135}), 33: (1, {'@': 135}), 34: (1, {'@': 135}), 35: (1, {'@': 135}), 36: (1, {'@': 135}), 37: (1, {'@': 135}), 38: (1, {'@': 135}), 39: (1, {'@': 135}), 40: (1, {'@': 135}), 41: (1, {'@': 135}), 42: (1, {'@': 135}), 43: (1, {'@': 135}), 44: (1, {'@': 135}), 45: (1, {'@': 135}), 46: (1, {'@': 135}), 47: (1, {'@': 135}), 48: (1, {'@': 135}), 49: (1, {'@': 135}), 50: (1, {'@': 135}), 51: (1, {'@': 135}), 52: (1, {'@': 135}), 53: (1, {'@': 135}), 54: (1, {'@': 135}), 55: (1, {'@': 135})}, 699: {0: (0, 143)}, 700: {37: (0, 481), 36: (0, 276), 70: (0, 141), 46: (0, 534)}, 701: {33: (1, {'@': 214}), 34: (1, {'@': 214}), 45: (1, {'@': 214}), 46: (1, {'@': 214}), 35: (1, {'@': 214}), 36: (1, {'@': 214}), 37: (1, {'@': 214}), 47: (1, {'@': 214}), 49: (1, {'@': 214}), 50: (1, {'@': 214}), 51: (1, {'@': 214}), 38: (1, {'@': 214}), 52: (1, {'@': 214}), 53: (1, {'@': 214}), 39: (1, {'@': 214}), 40: (1, {'@': 214}), 41: (1, {'@': 214}), 42: (1, {'@': 214}), 55: (1, {'@': 214}), 43: (1, {'@': 214})}, 702: {4: (1, {'@': 136}), 5: (1, {'@': 136}), 6: (1, {'@': 136}), 7: (1, {'@': 136}), 8: (1, {'@': 136}), 9: (1, {'@': 136}), 10: (1, {'@': 136}), 3: (1, {'@': 136}), 11: (1, {'@': 136}), 12: (1, {'@': 136}), 13: (1, {'@': 136}), 14: (1, {'@': 136}), 15: (1, {'@': 136}), 2: (1, {'@': 136}), 16: (1, {'@': 136}), 17: (1, {'@': 136}), 0: (1, {'@': 136}), 18: (1, {'@': 136}), 19: (1, {'@': 136}), 20: (1, {'@': 136}), 21: (1, {'@': 136}), 22: (1, {'@': 136}), 23: (1, {'@': 136}), 24: (1, {'@': 136}), 25: (1, {'@': 136}), 26: (1, {'@': 136}), 27: (1, {'@': 136}), 28: (1, {'@': 136}), 29: (1, {'@': 136}), 30: (1, {'@': 136}), 31: (1, {'@': 136}), 32: (1, {'@': 136}), 33: (1, {'@': 136}), 34: (1, {'@': 136}), 35: (1, {'@': 136}), 36: (1, {'@': 136}), 37: (1, {'@': 136}), 38: (1, {'@': 136}), 39: (1, {'@': 136}), 40: (1, {'@': 136}), 41: (1, {'@': 136}), 42: (1, {'@': 136}), 43: (1, {'@': 136}), 44: (1, {'@': 136}), 45: (1, {'@': 136}), 46: (1, {'@': 136}), 47: (1, {'@': 136}), 48: (1, {'@': 136}), 49: (1, {'@': 136}), 50: (1, {'@': 136}), 51: (1, {'@': 136}), 52: (1, {'@': 136}), 53: (1, {'@': 136}), 54: (1, {'@': 136}), 55: (1, {'@': 136})}, 703: {0: (0, 265)}, 704: {33: (1, {'@': 73}), 34: (1, {'@': 73}), 45: (1, {'@': 73}), 46: (1, {'@': 73}), 35: (1, {'@': 73}), 36: (1, {'@': 73}), 37: (1, {'@': 73}), 47: (1, {'@': 73}), 49: (1, {'@': 73}), 50: (1, {'@': 73}), 51: (1, {'@': 73}), 38: (1, {'@': 73}), 52: (1, {'@': 73}), 53: (1, {'@': 73}), 39: (1, {'@': 73}), 40: (1, {'@': 73}), 41: (1, {'@': 73}), 42: (1, {'@': 73}), 55: (1, {'@': 73}), 43: (1, {'@': 73}), 5: (1, {'@': 217})}, 705: {37: (0, 481), 160: (0, 304), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 161: (0, 201), 40: (0, 437), 77: (0, 409), 43: (0, 519), 71: (0, 661), 162: (0, 69), 33: (0, 283), 11: (0, 522), 163: (0, 198), 55: (0, 708), 46: (0, 534), 42: (0, 606), 165: (0, 20), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 41: (0, 458), 166: (0, 76), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 167: (0, 206), 53: (0, 618), 168: (0, 158), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483), 164: (0, 389)}, 706: {4: (1, {'@': 427}), 6: (1, {'@': 427}), 9: (1, {'@': 427}), 26: (1, {'@': 427}), 11: (1, {'@': 427}), 54: (1, {'@': 427}), 13: (1, {'@': 427}), 32: (1, {'@': 427}), 28: (1, {'@': 427}), 0: (1, {'@': 427}), 19: (1, {'@': 427}), 23: (1, {'@': 518}), 8: (1, {'@': 518}), 12: (1, {'@': 518}), 16: (1, {'@': 518}), 21: (1, {'@': 518}), 48: (1, {'@': 427}), 5: (1, {'@': 427})}, 707: {4: (1, {'@': 353}), 32: (1, {'@': 353}), 0: (1, {'@': 353}), 19: (1, {'@': 353}), 11: (1, {'@': 353}), 54: (1, {'@': 353}), 48: (1, {'@': 353}), 5: (1, {'@': 353})}, 708: {33: (1, {'@': 159}), 34: (1, {'@': 159}), 35: (1, {'@': 159}), 36: (1, {'@': 159}), 37: (1, {'@': 159}), 39: (1, {'@': 159}), 40: (1, {'@': 159}), 41: (1, {'@': 159}), 26: (1, {'@': 159}), 42: (1, {'@': 159}), 43: (1, {'@': 159}), 45: (1, {'@': 159}), 4: (1, {'@': 159}), 46: (1, {'@': 159}), 11: (1, {'@': 159}), 47: (1, {'@': 159}), 49: (1, {'@': 159}), 50: (1, {'@': 159}), 51: (1, {'@': 159}), 52: (1, {'@': 159}), 53: (1, {'@': 159}), 55: (1, {'@': 159})}, 709: {0: (0, 701)}, 710: {4: (1, {'@': 130}), 5: (1, {'@': 130}), 6: (1, {'@': 130}), 7: (1, {'@': 130}), 8: (1, {'@': 130}), 9: (1, {'@': 130}), 10: (1, {'@': 130}), 3: (1, {'@': 130}), 11: (1, {'@': 130}), 12: (1, {'@': 130}), 13: (1, {'@': 130}), 14: (1, {'@': 130}), 15: (1, {'@': 130}), 2: (1, {'@': 130}), 16: (1, {'@': 130}), 17: (1, {'@': 130}), 0: (1, {'@': 130}), 18: (1, {'@': 130}), 19: (1, {'@': 130}), 20: (1, {'@': 130}), 21: (1, {'@': 130}), 22: (1, {'@': 130}), 23: (1, {'@': 130}), 24: (1, {'@': 130}), 25: (1, {'@': 130}), 26: (1, {'@': 130}), 27: (1, {'@': 130}), 28: (1, {'@': 130}), 29: (1, {'@': 130}), 30: (1, {'@': 130}), 31: (1, {'@': 130}), 32: (1, {'@': 130}), 33: (1, {'@': 130}), 34: (1, {'@': 130}), 35: (1, {'@': 130}), 36: (1, {'@': 130}), 37: (1, {'@': 130}), 38: (1, {'@': 130}), 39: (1, {'@': 130}), 40: (1, {'@': 130}), 41: (1, {'@': 130}), 42: (1, {'@': 130}), 43: (1, {'@': 130}), 44: (1, {'@': 130}), 45: (1, {'@': 130}), 46: (1, {'@': 130}), 47: (1, {'@': 130}), 48: (1, {'@': 130}), 49: (1, {'@': 130}), 50: (1, {'@': 130}), 51: (1, {'@': 130}), 52: (1, {'@': 130}), 53: (1, {'@': 130}), 54: (1, {'@': 130}), 55: (1, {'@': 130})}, 711: {4: (0, 632), 11: (0, 435), 19: (0, 126), 5: (1, {'@': 459}), 0: (1, {'@': 294})}, 712: {48: (0, 379)}, 713: {37: (0, 481), 160: (0, 304), 45: (0, 504), 4: (0, 324), 70: (0, 307), 39: (0, 261), 161: (0, 201), 40: (0, 437), 43: (0, 519), 71: (0, 661), 162: (0, 69), 33: (0, 283), 11: (0, 522), 163: (0, 198), 77: (0, 98), 55: (0, 708), 46: (0, 534), 42: (0, 606), 165: (0, 20), 73: (0, 698), 49: (0, 669), 47: (0, 675), 75: (0, 656), 164: (0, 58), 41: (0, 458), 166: (0, 76), 80: (0, 628), 66: (0, 528), 88: (0, 419), 97: (0, 525), 167: (0, 206), 53: (0, 618), 168: (0, 158), 51: (0, 540), 82: (0, 593), 36: (0, 276), 52: (0, 544), 84: (0, 621), 99: (0, 531), 101: (0, 256), 35: (0, 365), 102: (0, 660), 50: (0, 600), 34: (0, 483)}, 714: {6: (1, {'@': 402}), 9: (1, {'@': 402}), 26: (1, {'@': 402}), 13: (1, {'@': 402}), 28: (1, {'@': 402}), 4: (1, {'@': 397}), 33: (1, {'@': 397}), 34: (1, {'@': 397}), 5: (1, {'@': 397}), 45: (1, {'@': 397}), 46: (1, {'@': 397}), 35: (1, {'@': 397}), 11: (1, {'@': 397}), 36: (1, {'@': 397}), 37: (1, {'@': 397}), 47: (1, {'@': 397}), 49: (1, {'@': 397}), 50: (1, {'@': 397}), 19: (1, {'@': 397}), 51: (1, {'@': 397}), 38: (1, {'@': 397}), 52: (1, {'@': 397}), 53: (1, {'@': 397}), 39: (1, {'@': 397}), 40: (1, {'@': 397}), 41: (1, {'@': 397}), 42: (1, {'@': 397}), 55: (1, {'@': 397}), 43: (1, {'@': 397})}, 715: {28: (0, 579), 171: (0, 629), 175: (0, 537), 26: (0, 121), 9: (0, 139), 6: (0, 644), 177: (0, 57), 13: (0, 670)}}, 'start_states': {'module': 390, 'rest': 400}, 'end_states': {'rest': 101, 'module': 555}}, '__type__': 'ParsingFrontend'}, 'rules': [{'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}, {'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}, {'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}, {'@': 133}, {'@': 134}, {'@': 135}, {'@': 136}, {'@': 137}, {'@': 138}, {'@': 139}, {'@': 140}, {'@': 141}, {'@': 142}, {'@': 143}, {'@': 144}, {'@': 145}, {'@': 146}, {'@': 147}, {'@': 148}, {'@': 149}, {'@': 150}, {'@': 151}, {'@': 152}, {'@': 153}, {'@': 154}, {'@': 155}, {'@': 156}, {'@': 157}, {'@': 158}, {'@': 159}, {'@': 160}, {'@': 161}, {'@': 162}, {'@': 163}, {'@': 164}, {'@': 165}, {'@': 166}, {'@': 167}, {'@': 168}, {'@': 169}, {'@': 170}, {'@': 171}, {'@': 172}, {'@': 173}, {'@': 174}, {'@': 175}, {'@': 176}, {'@': 177}, {'@': 178}, {'@': 179}, {'@': 180}, {'@': 181}, {'@': 182}, {'@': 183}, {'@': 184}, {'@': 185}, {'@': 186}, {'@': 187}, {'@': 188}, {'@': 189}, {'@': 190}, {'@': 191}, {'@': 192}, {'@': 193}, {'@': 194}, {'@': 195}, {'@': 196}, {'@': 197}, {'@': 198}, {'@': 199}, {'@': 200}, {'@': 201}, {'@': 202}, {'@': 203}, {'@': 204}, {'@': 205}, {'@': 206}, {'@': 207}, {'@': 208}, {'@': 209}, {'@': 210}, {'@': 211}, {'@': 212}, {'@': 213}, {'@': 214}, {'@': 215}, {'@': 216}, {'@': 217}, {'@': 218}, {'@': 219}, {'@': 220}, {'@': 221}, {'@': 222}, {'@': 223}, {'@': 224}, {'@': 225}, {'@': 226}, {'@': 227}, {'@': 228}, {'@': 229}, {'@': 230}, {'@': 231}, {'@': 232}, {'@': 233}, {'@': 234}, {'@': 235}, {'@': 236}, {'@': 237}, {'@': 238}, {'@': 239}, {'@': 240}, {'@': 241}, {'@': 242}, {'@': 243}, {'@': 244}, {'@': 245}, {'@': 246}, {'@': 247}, {'@': 248}, {'@': 249}, {'@': 250}, {'@': 251}, {'@': 252}, {'@': 253}, {'@': 254}, {'@': 255}, {'@': 256}, {'@': 257}, {'@': 258}, {'@': 259}, {'@': 260}, {'@': 261}, {'@': 262}, {'@': 263}, {'@': 264}, {'@': 265}, {'@': 266}, {'@': 267}, {'@': 268}, {'@': 269}, {'@': 270}, {'@': 271}, {'@': 272}, {'@': 273}, {'@': 274}, {'@': 275}, {'@': 276}, {'@': 277}, {'@': 278}, {'@': 279}, {'@': 280}, {'@': 281}, {'@': 282}, {'@': 283}, {'@': 284}, {'@': 285}, {'@': 286}, {'@': 287}, {'@': 288}, {'@': 289}, {'@': 290}, {'@': 291}, {'@': 292}, {'@': 293}, {'@': 294}, {'@': 295}, {'@': 296}, {'@': 297}, {'@': 298}, {'@': 299}, {'@': 300}, {'@': 301}, {'@': 302}, {'@': 303}, {'@': 304}, {'@': 305}, {'@': 306}, {'@': 307}, {'@': 308}, {'@': 309}, {'@': 310}, {'@': 311}, {'@': 312}, {'@': 313}, {'@': 314}, {'@': 315}, {'@': 316}, {'@': 317}, {'@': 318}, {'@': 319}, {'@': 320}, {'@': 321}, {'@': 322}, {'@': 323}, {'@': 324}, {'@': 325}, {'@': 326}, {'@': 327}, {'@': 328}, {'@': 329}, {'@': 330}, {'@': 331}, {'@': 332}, {'@': 333}, {'@': 334}, {'@': 335}, {'@': 336}, {'@': 337}, {'@': 338}, {'@': 339}, {'@': 340}, {'@': 341}, {'@': 342}, {'@': 343}, {'@': 344}, {'@': 345}, {'@': 346}, {'@': 347}, {'@': 348}, {'@': 349}, {'@': 350}, {'@': 351}, {'@': 352}, {'@': 353}, {'@': 354}, {'@': 355}, {'@': 356}, {'@': 357}, {'@': 358}, {'@': 359}, {'@': 360}, {'@': 361}, {'@': 362}, {'@': 363}, {'@': 364}, {'@': 365}, {'@': 366}, {'@': 367}, {'@': 368}, {'@': 369}, {'@': 370}, {'@': 371}, {'@': 372}, {'@': 373}, {'@': 374}, {'@': 375}, {'@': 376}, {'@': 377}, {'@': 378}, {'@': 379}, {'@': 380}, {'@': 381}, {'@': 382}, {'@': 383}, {'@': 384}, {'@': 385}, {'@': 386}, {'@': 387}, {'@': 388}, {'@': 389}, {'@': 390}, {'@': 391}, {'@': 392}, {'@': 393}, {'@': 394}, {'@': 395}, {'@': 396}, {'@': 397}, {'@': 398}, {'@': 399}, {'@': 400}, {'@': 401}, {'@': 402}, {'@': 403}, {'@': 404}, {'@': 405}, {'@': 406}, {'@': 407}, {'@': 408}, {'@': 409}, {'@': 410}, {'@': 411}, {'@': 412}, {'@': 413}, {'@': 414}, {'@': 415}, {'@': 416}, {'@': 417}, {'@': 418}, {'@': 419}, {'@': 420}, {'@': 421}, {'@': 422}, {'@': 423}, {'@': 424}, {'@': 425}, {'@': 426}, {'@': 427}, {'@': 428}, {'@': 429}, {'@': 430}, {'@': 431}, {'@': 432}, {'@': 433}, {'@': 434}, {'@': 435}, {'@': 436}, {'@': 437}, {'@': 438}, {'@': 439}, {'@': 440}, {'@': 441}, {'@': 442}, {'@': 443}, {'@': 444}, {'@': 445}, {'@': 446}, {'@': 447}, {'@': 448}, {'@': 449}, {'@': 450}, {'@': 451}, {'@': 452}, {'@': 453}, {'@': 454}, {'@': 455}, {'@': 456}, {'@': 457}, {'@': 458}, {'@': 459}, {'@': 460}, {'@': 461}, {'@': 462}, {'@': 463}, {'@': 464}, {'@': 465}, {'@': 466}, {'@': 467}, {'@': 468}, {'@': 469}, {'@': 470}, {'@': 471}, {'@': 472}, {'@': 473}, {'@': 474}, {'@': 475}, {'@': 476}, {'@': 477}, {'@': 478}, {'@': 479}, {'@': 480}, {'@': 481}, {'@': 482}, {'@': 483}, {'@': 484}, {'@': 485}, {'@': 486}, {'@': 487}, {'@': 488}, {'@': 489}, {'@': 490}, {'@': 491}, {'@': 492}, {'@': 493}, {'@': 494}, {'@': 495}, {'@': 496}, {'@': 497}, {'@': 498}, {'@': 499}, {'@': 500}, {'@': 501}, {'@': 502}, {'@': 503}, {'@': 504}, {'@': 505}, {'@': 506}, {'@': 507}, {'@': 508}, {'@': 509}, {'@': 510}, {'@': 511}, {'@': 512}, {'@': 513}, {'@': 514}, {'@': 515}, {'@': 516}, {'@': 517}, {'@': 518}, {'@': 519}, {'@': 520}, {'@': 521}, {'@': 522}, {'@': 523}, {'@': 524}, {'@': 525}, {'@': 526}, {'@': 527}, {'@': 528}, {'@': 529}, {'@': 530}, {'@': 531}, {'@': 532}, {'@': 533}, {'@': 534}, {'@': 535}, {'@': 536}, {'@': 537}, {'@': 538}, {'@': 539}, {'@': 540}, {'@': 541}, {'@': 542}, {'@': 543}, {'@': 544}, {'@': 545}, {'@': 546}, {'@': 547}, {'@': 548}], 'options': {'debug': False, 'strict': False, 'keep_all_tokens': False, 'tree_class': None, 'cache': False, 'cache_grammar': False, 'postlex': None, 'parser': 'lalr', 'lexer': 'contextual', 'transformer': None, 'start': ['module', 'rest'], 'priority': 'normal', 'ambiguity': 'auto', 'regex': False, 'propagate_positions': True, 'lexer_callbacks': {}, 'maybe_placeholders': True, 'edit_terminals': None, 'g_regex_flags': 0, 'use_bytes': False, 'ordered_sets': True, 'import_paths': [], 'source_path': None, '_plugins': {}}, '__type__': 'Lark'}
+)
+MEMO = (
+{0: {'name': 'python__STRING', 'pattern': {'value': '([ubf]?r?|r[ubf])("(?!"").*?(?<!\\\\)(\\\\\\\\)*?"|\'(?!\'\').*?(?<!\\\\)(\\\\\\\\)*?\')', 'flags': ['i'], 'raw': '/([ubf]?r?|r[ubf])("(?!"").*?(?<!\\\\)(\\\\\\\\)*?"|\'(?!\'\').*?(?<!\\\\)(\\\\\\\\)*?\')/i', '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 1: {'name': 'python__LONG_STRING', 'pattern': {'value': '([ubf]?r?|r[ubf])(""".*?(?<!\\\\)(\\\\\\\\)*?"""|\'\'\'.*?(?<!\\\\)(\\\\\\\\)*?\'\'\')', 'flags': ['s', 'i'], 'raw': '/([ubf]?r?|r[ubf])(""".*?(?<!\\\\)(\\\\\\\\)*?"""|\'\'\'.*?(?<!\\\\)(\\\\\\\\)*?\'\'\')/is', '_width': [6, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 2: {'name': 'python__DEC_NUMBER', 'pattern': {'value': '(?:0(?:(?:_)?0)*(?![1-9])|[1-9](?:(?:_)?[0-9])*)', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 3: {'name': 'python__HEX_NUMBER', 'pattern': {'value': '0(?:x|X)(?:(?:_)?(?:[0-9]|[a-f]|[A-F]))+', 'flags': [], 'raw': None, '_width': [3, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 4: {'name': 'python__OCT_NUMBER', 'pattern': {'value': '0(?:o|O)(?:(?:_)?[0-7])+', 'flags': [], 'raw': None, '_width': [3, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 5: {'name': 'python__BIN_NUMBER', 'pattern': {'value': '0(?:b|B)(?:(?:_)?[0-1])+', 'flags': [], 'raw': None, '_width': [3, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 6: {'name': 'python__FLOAT_NUMBER', 'pattern': {'value': '(?:[0-9](?:(?:_)?[0-9])*(?:e|E)(?:(?:\\+|\\-))?[0-9](?:(?:_)?[0-9])*|(?:[0-9](?:(?:_)?[0-9])*\\.(?:[0-9](?:(?:_)?[0-9])*)?|\\.[0-9](?:(?:_)?[0-9])*)(?:(?:e|E)(?:(?:\\+|\\-))?[0-9](?:(?:_)?[0-9])*)?)', 'flags': [], 'raw': None, '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 7: {'name': 'python__IMAG_NUMBER', 'pattern': {'value': '(?:(?:[0-9](?:(?:_)?[0-9])*(?:e|E)(?:(?:\\+|\\-))?[0-9](?:(?:_)?[0-9])*|(?:[0-9](?:(?:_)?[0-9])*\\.(?:[0-9](?:(?:_)?[0-9])*)?|\\.[0-9](?:(?:_)?[0-9])*)(?:(?:e|E)(?:(?:\\+|\\-))?[0-9](?:(?:_)?[0-9])*)?)|[0-9](?:(?:_)?[0-9])*)(?:J|j)', 'flags': [], 'raw': None, '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 8: {'name': 'WS', 'pattern': {'value': '(?:[ \t\x0c\r\n])+', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 9: {'name': 'NEWLINE', 'pattern': {'value': '(?:(?:\r)?\n)+', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 10: {'name': 'CPP_COMMENT', 'pattern': {'value': '\\/\\/[^\n]*', 'flags': [], 'raw': '/\\/\\/[^\\n]*/', '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 11: {'name': 'UNARY_NOT', 'pattern': {'value': '\\[not\\b', 'flags': [], 'raw': '/\\[not\\b/', '_width': [4, 4], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 12: {'name': 'OR', 'pattern': {'value': 'or', 'flags': [], 'raw': '"or"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 13: {'name': 'AND', 'pattern': {'value': 'and', 'flags': [], 'raw': '"and"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 14: {'name': 'IN', 'pattern': {'value': 'in', 'flags': [], 'raw': '"in"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 15: {'name': 'IS', 'pattern': {'value': 'is', 'flags': [], 'raw': '"is"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 16: {'name': 'ISNOT', 'pattern': {'value': 'is not\\b', 'flags': [], 'raw': '/is not\\b/', '_width': [6, 6], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 17: {'name': 'NOTIN', 'pattern': {'value': 'not in\\b', 'flags': [], 'raw': '/not in\\b/', '_width': [6, 6], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 18: {'name': 'NONE', 'pattern': {'value': 'none', 'flags': [], 'raw': '"none"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 19: {'name': 'TRUE', 'pattern': {'value': 'true', 'flags': [], 'raw': '"true"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 20: {'name': 'FALSE', 'pattern': {'value': 'false', 'flags': [], 'raw': '"false"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 21: {'name': 'NAME', 'pattern': {'value': '(?!(?:and|else|exp|false|for|if|in|is|none|or|true)\\b)[^\\W\\d]\\w*', 'flags': [], 'raw': '/(?!(?:and|else|exp|false|for|if|in|is|none|or|true)\\b)[^\\W\\d]\\w*/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 22: {'name': 'IF', 'pattern': {'value': 'if', 'flags': [], 'raw': '"if"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 23: {'name': 'ELSE', 'pattern': {'value': 'else', 'flags': [], 'raw': '"else"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 24: {'name': '__ANON_0', 'pattern': {'value': '<-', 'flags': [], 'raw': '"<-"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 25: {'name': 'STAR', 'pattern': {'value': '*', 'flags': [], 'raw': '"*"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 26: {'name': 'COLON', 'pattern': {'value': ':', 'flags': [], 'raw': '":"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 27: {'name': 'COMMA', 'pattern': {'value': ',', 'flags': [], 'raw': '","', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 28: {'name': '__ANON_1', 'pattern': {'value': '**', 'flags': [], 'raw': '"**"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 29: {'name': 'EQUAL', 'pattern': {'value': '=', 'flags': [], 'raw': '"="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 30: {'name': 'LPAR', 'pattern': {'value': '(', 'flags': [], 'raw': '"("', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 31: {'name': 'RPAR', 'pattern': {'value': ')', 'flags': [], 'raw': '")"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 32: {'name': 'LSQB', 'pattern': {'value': '[', 'flags': [], 'raw': '"["', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 33: {'name': 'RSQB', 'pattern': {'value': ']', 'flags': [], 'raw': '"]"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 34: {'name': 'LBRACE', 'pattern': {'value': '{', 'flags': [], 'raw': '"{"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 35: {'name': 'RBRACE', 'pattern': {'value': '}', 'flags': [], 'raw': '"}"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 36: {'name': 'FOR', 'pattern': {'value': 'for', 'flags': [], 'raw': '"for"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 37: {'name': '__ANON_2', 'pattern': {'value': '[+', 'flags': [], 'raw': '"[+"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 38: {'name': '__ANON_3', 'pattern': {'value': '[-', 'flags': [], 'raw': '"[-"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 39: {'name': '__ANON_4', 'pattern': {'value': '[~', 'flags': [], 'raw': '"[~"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 40: {'name': '__ANON_5', 'pattern': {'value': '<<', 'flags': [], 'raw': '"<<"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 41: {'name': '__ANON_6', 'pattern': {'value': '>>', 'flags': [], 'raw': '">>"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 42: {'name': 'AMPERSAND', 'pattern': {'value': '&', 'flags': [], 'raw': '"&"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 43: {'name': 'VBAR', 'pattern': {'value': '|', 'flags': [], 'raw': '"|"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 44: {'name': 'CIRCUMFLEX', 'pattern': {'value': '^', 'flags': [], 'raw': '"^"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 45: {'name': 'PLUS', 'pattern': {'value': '+', 'flags': [], 'raw': '"+"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 46: {'name': 'MINUS', 'pattern': {'value': '-', 'flags': [], 'raw': '"-"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 47: {'name': 'AT', 'pattern': {'value': '@', 'flags': [], 'raw': '"@"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 48: {'name': 'SLASH', 'pattern': {'value': '/', 'flags': [], 'raw': '"/"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 49: {'name': 'PERCENT', 'pattern': {'value': '%', 'flags': [], 'raw': '"%"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 50: {'name': 'EXP', 'pattern': {'value': 'exp', 'flags': [], 'raw': '"exp"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 51: {'name': 'LESSTHAN', 'pattern': {'value': '<', 'flags': [], 'raw': '"<"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 52: {'name': 'MORETHAN', 'pattern': {'value': '>', 'flags': [], 'raw': '">"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 53: {'name': '__ANON_7', 'pattern': {'value': '==', 'flags': [], 'raw': '"=="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 54: {'name': '__ANON_8', 'pattern': {'value': '>=', 'flags': [], 'raw': '">="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 55: {'name': '__ANON_9', 'pattern': {'value': '<=', 'flags': [], 'raw': '"<="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 56: {'name': '__ANON_10', 'pattern': {'value': '!=', 'flags': [], 'raw': '"!="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 57: {'name': 'MATCH', 'pattern': {'value': 'match', 'flags': [], 'raw': '"match"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 58: {'name': 'CASE', 'pattern': {'value': 'case', 'flags': [], 'raw': '"case"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 59: {'name': 'DOT', 'pattern': {'value': '.', 'flags': [], 'raw': '"."', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 60: {'origin': {'name': 'number', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'python__DEC_NUMBER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 61: {'origin': {'name': 'number', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'python__HEX_NUMBER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 62: {'origin': {'name': 'number', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'python__BIN_NUMBER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 63: {'origin': {'name': 'number', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'python__OCT_NUMBER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 64: {'origin': {'name': 'number', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'python__FLOAT_NUMBER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 65: {'origin': {'name': 'number', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'python__IMAG_NUMBER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 66: {'origin': {'name': 'string', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'python__STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 67: {'origin': {'name': 'string', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'python__LONG_STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 68: {'origin': {'name': 'module', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'statement', '__type__': 'NonTerminal'}, {'name': '__module_star_0', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 69: {'origin': {'name': 'module', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'statement', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 70: {'origin': {'name': 'module', '__type__': 'NonTerminal'}, 'expansion': [], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (True,), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 71: {'origin': {'name': 'rest', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__module_star_0', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 72: {'origin': {'name': 'statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'expr_statement', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 73: {'origin': {'name': 'following', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'plain{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'expr_statement', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 74: {'origin': {'name': 'following', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'expr_statement', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 75: {'origin': {'name': 'following', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'later_if', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'expr_statement', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 76: {'origin': {'name': 'following', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'postfix{closed_if}', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'expr_statement', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 77: {'origin': {'name': 'following', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'last{unbracketed_expr}', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'expr_statement', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 78: {'origin': {'name': 'later_if', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'body{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, {'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'condition', '__type__': 'NonTerminal'}, {'name': 'ELSE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'later_else', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'if_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 79: {'origin': {'name': 'later_else', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'operation{bare}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 80: {'origin': {'name': 'later_else', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'later_assign', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 81: {'origin': {'name': 'later_assign', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'name', '__type__': 'NonTerminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'operation{atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'assign_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 82: {'origin': {'name': 'later_assign', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'name', '__type__': 'NonTerminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'later_assign', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'assign_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 83: {'origin': {'name': 'closed_if', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'body{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, {'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'condition', '__type__': 'NonTerminal'}, {'name': 'ELSE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'bare', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'if_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 84: {'origin': {'name': '_compared_atom', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sym_comp_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 85: {'origin': {'name': '_compared_atom', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'word_comp_op', '__type__': 'NonTerminal'}, {'name': 'word_atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 86: {'origin': {'name': '_compared_atom', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'not_comp_op', '__type__': 'NonTerminal'}, {'name': 'bare', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 87: {'origin': {'name': 'last_assign', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'name', '__type__': 'NonTerminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'times{atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'assign_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 88: {'origin': {'name': 'last_assign', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'name', '__type__': 'NonTerminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'last_assign', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'assign_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 89: {'origin': {'name': 'expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'opening{atom_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 90: {'origin': {'name': 'expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_tail', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 91: {'origin': {'name': 'expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_if', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 92: {'origin': {'name': 'expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'postfix{star_if}', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 93: {'origin': {'name': 'star_if', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_tail', '__type__': 'NonTerminal'}, {'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'condition', '__type__': 'NonTerminal'}, {'name': 'ELSE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'orelse{mul_op}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'if_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 94: {'origin': {'name': 'condition', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'plain{bare_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 95: {'origin': {'name': 'condition', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{bare_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 96: {'origin': {'name': 'condition', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_tail', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 97: {'origin': {'name': 'star_tail', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 98: {'origin': {'name': 'star_tail', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'postfix{star_tail}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 99: {'origin': {'name': 'star', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'value{atom,mul_op}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'star_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 100: {'origin': {'name': 'atom_expr', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'postfix{atom_expr}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 101: {'origin': {'name': 'atom_expr', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 102: {'origin': {'name': 'unbracketed_expr', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'postfix{unbracketed_expr}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 103: {'origin': {'name': 'unbracketed_expr', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unbracketed', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 104: {'origin': {'name': 'bare_expr', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'postfix{bare_expr}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 105: {'origin': {'name': 'bare_expr', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 106: {'origin': {'name': 'pair', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{atom}', '__type__': 'NonTerminal'}, {'name': '_compared', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'comp_oper', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 107: {'origin': {'name': '_compared', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sym_comp_op', '__type__': 'NonTerminal'}, {'name': 'sum{atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 108: {'origin': {'name': '_compared', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'word_comp_op', '__type__': 'NonTerminal'}, {'name': 'sum{word_atom}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 109: {'origin': {'name': '_compared', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'not_comp_op', '__type__': 'NonTerminal'}, {'name': 'sum{bare}', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 110: {'origin': {'name': 'slice', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 111: {'origin': {'name': 'slice', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (False, False, False, False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 112: {'origin': {'name': 'slice', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (False, False, False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 113: {'origin': {'name': 'slice', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (False, False, True, False, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 114: {'origin': {'name': 'slice', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (False, False, True, False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 115: {'origin': {'name': 'slice', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (False, False, True, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 116: {'origin': {'name': 'slice', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (False, True, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 117: {'origin': {'name': 'slice', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (True, False, False, False, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 118: {'origin': {'name': 'slice', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 8, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (True, False, False, False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 119: {'origin': {'name': 'slice', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 9, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (True, False, False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 120: {'origin': {'name': 'slice', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 10, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (True, False, True, False, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 121: {'origin': {'name': 'slice', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 11, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (True, False, True, False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 122: {'origin': {'name': 'slice', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 12, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (True, False, True, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 123: {'origin': {'name': 'slice', '__type__': 'NonTerminal'}, 'expansion': [], 'order': 13, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (True, True, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 124: {'origin': {'name': 'arguments', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'argument', '__type__': 'NonTerminal'}, {'name': '__arguments_star_1', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 125: {'origin': {'name': 'arguments', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'argument', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 126: {'origin': {'name': 'call_kwargs', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_1', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 127: {'origin': {'name': 'argument', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 128: {'origin': {'name': 'argument', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'name', '__type__': 'NonTerminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'keyword', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 129: {'origin': {'name': 'argument', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'call_kwargs', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 130: {'origin': {'name': 'atom', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'power', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 131: {'origin': {'name': 'atom', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tuple', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'tuple_literal', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 132: {'origin': {'name': 'power', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'word_atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 133: {'origin': {'name': 'power', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'group', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'sum_atom', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 134: {'origin': {'name': 'power', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'comp_expr{expression}', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': 'gen_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 135: {'origin': {'name': 'word_atom', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unbracketed', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 136: {'origin': {'name': 'word_atom', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'comp_expr{expression}', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'list_comp', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 137: {'origin': {'name': 'word_atom', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'list', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'list_literal', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 138: {'origin': {'name': 'unbracketed', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 139: {'origin': {'name': 'unbracketed', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unary_expr', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 140: {'origin': {'name': 'bare', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'literals', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 141: {'origin': {'name': 'bare', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'name', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'variable', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 142: {'origin': {'name': 'bare', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'comp_expr{expression}', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': 'set_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 143: {'origin': {'name': 'bare', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'comp_expr{key_value}', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'dict_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 144: {'origin': {'name': 'group', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum_np{atom_expr}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 145: {'origin': {'name': 'group', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{atom_expr}', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'bit{atom}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 146: {'origin': {'name': 'group', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{atom_expr}', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'bit{power}', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 147: {'origin': {'name': 'group', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom_expr', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'bit_np{atom}', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 148: {'origin': {'name': 'group', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom_expr', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'bit_np{power}', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 149: {'origin': {'name': 'group', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'mul_chain{atom_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 150: {'origin': {'name': 'comp_for', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FOR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'atom_expr', '__type__': 'NonTerminal'}, {'name': 'IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'iterable', '__type__': 'NonTerminal'}, {'name': 'comp_if', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 151: {'origin': {'name': 'comp_for', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FOR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'atom_expr', '__type__': 'NonTerminal'}, {'name': 'IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'iterable', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, False, False, False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 152: {'origin': {'name': 'iterable', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{atom_expr}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 153: {'origin': {'name': 'iterable', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'mul_chain{atom_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 154: {'origin': {'name': 'comp_if', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'condition', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 155: {'origin': {'name': 'unary_expr', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unary_op', '__type__': 'NonTerminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 156: {'origin': {'name': 'unary_expr', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'not_op', '__type__': 'NonTerminal'}, {'name': 'opening{bare_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 157: {'origin': {'name': 'unary_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_2', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'unary_add', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 158: {'origin': {'name': 'unary_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_3', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': 'unary_neg', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 159: {'origin': {'name': 'unary_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_4', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': 'unary_invert', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 160: {'origin': {'name': 'not_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'UNARY_NOT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'unary_not', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 161: {'origin': {'name': 'bit_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_5', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 162: {'origin': {'name': 'bit_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_6', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 163: {'origin': {'name': 'bit_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'AMPERSAND', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 164: {'origin': {'name': 'bit_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'VBAR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 165: {'origin': {'name': 'bit_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CIRCUMFLEX', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 166: {'origin': {'name': 'add_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PLUS', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 167: {'origin': {'name': 'add_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MINUS', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 168: {'origin': {'name': 'mul_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STAR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 169: {'origin': {'name': 'mul_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'AT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 170: {'origin': {'name': 'mul_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SLASH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 171: {'origin': {'name': 'mul_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PERCENT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 172: {'origin': {'name': 'times_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STAR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'mul_op', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 173: {'origin': {'name': 'other_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'AT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'mul_op', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 174: {'origin': {'name': 'other_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SLASH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': 'mul_op', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 175: {'origin': {'name': 'other_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PERCENT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': 'mul_op', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 176: {'origin': {'name': 'exp_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'EXP', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'mul_op', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 177: {'origin': {'name': 'bool_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'OR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 178: {'origin': {'name': 'bool_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'AND', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 179: {'origin': {'name': 'sym_comp_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LESSTHAN', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'comp_op', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 180: {'origin': {'name': 'sym_comp_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MORETHAN', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': 'comp_op', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 181: {'origin': {'name': 'sym_comp_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_7', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': 'comp_op', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 182: {'origin': {'name': 'sym_comp_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_8', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': 'comp_op', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 183: {'origin': {'name': 'sym_comp_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_9', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': 'comp_op', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 184: {'origin': {'name': 'sym_comp_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_10', 'filter_out': False, '__type__': 'Terminal'}], 'order': 5, 'alias': 'comp_op', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 185: {'origin': {'name': 'word_comp_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IN', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'comp_op', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 186: {'origin': {'name': 'word_comp_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IS', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': 'comp_op', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 187: {'origin': {'name': 'word_comp_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NOTIN', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': 'comp_op', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 188: {'origin': {'name': 'not_comp_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ISNOT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'comp_op', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 189: {'origin': {'name': 'literals', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NONE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'const_none', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 190: {'origin': {'name': 'literals', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TRUE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': 'const_true', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 191: {'origin': {'name': 'literals', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FALSE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': 'const_false', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 192: {'origin': {'name': 'literals', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'number', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'const_number', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 193: {'origin': {'name': 'literals', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'string', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'const_string', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 194: {'origin': {'name': 'literals', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'set', '__type__': 'NonTerminal'}], 'order': 5, 'alias': 'set_literal', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 195: {'origin': {'name': 'literals', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'dict', '__type__': 'NonTerminal'}], 'order': 6, 'alias': 'dict_literal', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 196: {'origin': {'name': 'list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': '_cs_list{expression}', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 197: {'origin': {'name': 'tuple', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 198: {'origin': {'name': 'tuple', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': '__tuple_plus_2', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 199: {'origin': {'name': 'tuple', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': '__tuple_plus_2', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 200: {'origin': {'name': 'set', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '_cs_list{expression}', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 201: {'origin': {'name': 'dict', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '_sep{key_value,COMMA}', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 202: {'origin': {'name': 'key_value', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 203: {'origin': {'name': 'name', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 204: {'origin': {'name': 'name', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MATCH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 205: {'origin': {'name': 'name', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CASE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 206: {'origin': {'name': 'plain{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'plain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 207: {'origin': {'name': 'plain{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'assign{other_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'plain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 208: {'origin': {'name': 'tail{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'postfix{value_np{unbracketed_expr,other_op}}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'tail'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 209: {'origin': {'name': 'tail{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'postfix{assign{other_op}}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'tail'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 210: {'origin': {'name': 'tail{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'postfix{tail{unbracketed_expr,other_op}}', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'tail'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 211: {'origin': {'name': 'postfix{closed_if}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'closed_if', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arguments', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 212: {'origin': {'name': 'postfix{closed_if}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'closed_if', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 213: {'origin': {'name': 'postfix{closed_if}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'closed_if', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'name', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'attr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 214: {'origin': {'name': 'postfix{closed_if}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'closed_if', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'subscript', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 215: {'origin': {'name': 'last{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'times{unbracketed_expr}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'last'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 216: {'origin': {'name': 'last{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'last_assign', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'last'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 217: {'origin': {'name': 'body{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'plain{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'body'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 218: {'origin': {'name': 'body{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'body'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 219: {'origin': {'name': 'operation{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare', '__type__': 'NonTerminal'}, {'name': 'other_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'operation'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 220: {'origin': {'name': 'operation{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare', '__type__': 'NonTerminal'}, {'name': 'times_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'operation'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 221: {'origin': {'name': 'operation{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'operation'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 222: {'origin': {'name': 'operation{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare', '__type__': 'NonTerminal'}, {'name': 'bit_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'bit_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'operation'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 223: {'origin': {'name': 'operation{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare', '__type__': 'NonTerminal'}, {'name': 'bool_op', '__type__': 'NonTerminal'}, {'name': 'word_atom', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'bool_oper', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'operation'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 224: {'origin': {'name': 'operation{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare', '__type__': 'NonTerminal'}, {'name': '_compared_atom', '__type__': 'NonTerminal'}], 'order': 5, 'alias': 'comp_oper', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'operation'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 225: {'origin': {'name': 'operation{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare', '__type__': 'NonTerminal'}, {'name': 'add_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 6, 'alias': 'sum', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'operation'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 226: {'origin': {'name': 'operation{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}, {'name': 'other_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'operation'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 227: {'origin': {'name': 'operation{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}, {'name': 'times_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'operation'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 228: {'origin': {'name': 'operation{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'operation'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 229: {'origin': {'name': 'operation{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}, {'name': 'bit_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'bit_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'operation'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 230: {'origin': {'name': 'operation{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}, {'name': 'bool_op', '__type__': 'NonTerminal'}, {'name': 'word_atom', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'bool_oper', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'operation'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 231: {'origin': {'name': 'operation{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}, {'name': '_compared_atom', '__type__': 'NonTerminal'}], 'order': 5, 'alias': 'comp_oper', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'operation'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 232: {'origin': {'name': 'operation{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}, {'name': 'add_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 6, 'alias': 'sum', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'operation'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 233: {'origin': {'name': 'times{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit{atom}', '__type__': 'NonTerminal'}, {'name': 'times_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'times'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 234: {'origin': {'name': 'times{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{atom,other_op}', '__type__': 'NonTerminal'}, {'name': 'times_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'times'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 235: {'origin': {'name': 'opening{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'plain{atom_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'opening'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 236: {'origin': {'name': 'opening{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{atom_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'opening'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 237: {'origin': {'name': 'opening{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_else{atom_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'opening'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 238: {'origin': {'name': 'opening{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'postfix{if_else{atom_expr,mul_op}}', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'opening'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 239: {'origin': {'name': 'postfix{star_if}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_if', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arguments', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 240: {'origin': {'name': 'postfix{star_if}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_if', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 241: {'origin': {'name': 'postfix{star_if}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_if', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'name', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'attr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 242: {'origin': {'name': 'postfix{star_if}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_if', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'subscript', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 243: {'origin': {'name': 'orelse{mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value{bare,mul_op}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'orelse'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 244: {'origin': {'name': 'orelse{mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'assign{mul_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'orelse'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 245: {'origin': {'name': 'plain{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value{bare_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'plain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 246: {'origin': {'name': 'plain{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'assign{mul_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'plain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 247: {'origin': {'name': 'tail{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'postfix{value_np{bare_expr,mul_op}}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'tail'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 248: {'origin': {'name': 'tail{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'postfix{assign{mul_op}}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'tail'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 249: {'origin': {'name': 'tail{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'postfix{tail{bare_expr,mul_op}}', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'tail'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 250: {'origin': {'name': 'postfix{star_tail}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_tail', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arguments', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 251: {'origin': {'name': 'postfix{star_tail}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_tail', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 252: {'origin': {'name': 'postfix{star_tail}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_tail', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'name', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'attr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 253: {'origin': {'name': 'postfix{star_tail}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_tail', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'subscript', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 254: {'origin': {'name': 'value{atom,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 255: {'origin': {'name': 'value{atom,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value_np{atom,mul_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 256: {'origin': {'name': 'postfix{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom_expr', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arguments', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 257: {'origin': {'name': 'postfix{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom_expr', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 258: {'origin': {'name': 'postfix{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom_expr', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'name', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'attr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 259: {'origin': {'name': 'postfix{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom_expr', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'subscript', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 260: {'origin': {'name': 'postfix{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unbracketed_expr', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arguments', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 261: {'origin': {'name': 'postfix{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unbracketed_expr', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 262: {'origin': {'name': 'postfix{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unbracketed_expr', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'name', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'attr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 263: {'origin': {'name': 'postfix{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unbracketed_expr', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'subscript', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 264: {'origin': {'name': 'postfix{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare_expr', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arguments', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 265: {'origin': {'name': 'postfix{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare_expr', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 266: {'origin': {'name': 'postfix{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare_expr', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'name', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'attr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 267: {'origin': {'name': 'postfix{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare_expr', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'subscript', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 268: {'origin': {'name': 'sum{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'sum'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 269: {'origin': {'name': 'sum{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum_np{atom}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'sum'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 270: {'origin': {'name': 'sum{word_atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'word_atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'sum'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 271: {'origin': {'name': 'sum{word_atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum_np{word_atom}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'sum'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 272: {'origin': {'name': 'sum{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'sum'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 273: {'origin': {'name': 'sum{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum_np{bare}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'sum'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 274: {'origin': {'name': 'comp_expr{expression}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'comp_for', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'comp_expr'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 275: {'origin': {'name': 'comp_expr{key_value}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'key_value', '__type__': 'NonTerminal'}, {'name': 'comp_for', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'comp_expr'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 276: {'origin': {'name': 'bit_np{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_np{atom_expr}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bit_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 277: {'origin': {'name': 'bit_np{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_chain{atom_expr}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bit_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 278: {'origin': {'name': 'bit{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bit'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 279: {'origin': {'name': 'bit{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{atom}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bit'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 280: {'origin': {'name': 'bit{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'power', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bit'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 281: {'origin': {'name': 'bit{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{power}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bit'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 282: {'origin': {'name': 'bit_np{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_np{atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bit_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 283: {'origin': {'name': 'bit_np{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_chain{atom}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bit_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 284: {'origin': {'name': 'bit_np{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_np{power}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bit_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 285: {'origin': {'name': 'bit_np{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_chain{power}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bit_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 286: {'origin': {'name': 'sum_np{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{atom_expr}', '__type__': 'NonTerminal'}, {'name': 'add_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'sum', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'sum_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 287: {'origin': {'name': 'mul_chain{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom_expr', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 288: {'origin': {'name': 'mul_chain{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom_expr', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'power', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 289: {'origin': {'name': 'mul_chain{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{atom_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 290: {'origin': {'name': 'mul_chain{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{atom_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'power', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 291: {'origin': {'name': 'sum{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'sum'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 292: {'origin': {'name': 'sum{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum_np{atom_expr}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'sum'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 293: {'origin': {'name': 'opening{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'plain{bare_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'opening'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 294: {'origin': {'name': 'opening{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{bare_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'opening'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 295: {'origin': {'name': 'opening{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_else{bare_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'opening'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 296: {'origin': {'name': 'opening{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'postfix{if_else{bare_expr,mul_op}}', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'opening'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 297: {'origin': {'name': '_cs_list{expression}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': '__tuple_plus_2', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', '_cs_list'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 298: {'origin': {'name': '_cs_list{expression}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': '__tuple_plus_2', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', '_cs_list'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 299: {'origin': {'name': '_cs_list{expression}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', '_cs_list'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 300: {'origin': {'name': '_cs_list{expression}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', '_cs_list'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 301: {'origin': {'name': '_sep{key_value,COMMA}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'key_value', '__type__': 'NonTerminal'}, {'name': '___sep{key_value,COMMA}_star_3', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', '_sep'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 302: {'origin': {'name': '_sep{key_value,COMMA}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'key_value', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', '_sep'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 303: {'origin': {'name': 'value{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unbracketed_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 304: {'origin': {'name': 'value{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value_np{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 305: {'origin': {'name': 'assign{other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'name', '__type__': 'NonTerminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'value{atom,other_op}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'assign_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'assign'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 306: {'origin': {'name': 'assign{other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'name', '__type__': 'NonTerminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'assign{other_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'assign_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'assign'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 307: {'origin': {'name': 'value_np{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{unbracketed_expr}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 308: {'origin': {'name': 'value_np{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{unbracketed_expr}', '__type__': 'NonTerminal'}, {'name': 'other_op', '__type__': 'NonTerminal'}, {'name': 'bit{atom}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 309: {'origin': {'name': 'value_np{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{unbracketed_expr}', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'bit{power}', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 310: {'origin': {'name': 'value_np{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unbracketed_expr', '__type__': 'NonTerminal'}, {'name': 'other_op', '__type__': 'NonTerminal'}, {'name': 'bit_np{atom}', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 311: {'origin': {'name': 'value_np{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unbracketed_expr', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'bit_np{power}', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 312: {'origin': {'name': 'value_np{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'mul_chain{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 313: {'origin': {'name': 'postfix{value_np{unbracketed_expr,other_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value_np{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arguments', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 314: {'origin': {'name': 'postfix{value_np{unbracketed_expr,other_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value_np{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 315: {'origin': {'name': 'postfix{value_np{unbracketed_expr,other_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value_np{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'name', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'attr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 316: {'origin': {'name': 'postfix{value_np{unbracketed_expr,other_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value_np{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'subscript', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 317: {'origin': {'name': 'postfix{assign{other_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'assign{other_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arguments', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 318: {'origin': {'name': 'postfix{assign{other_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'assign{other_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 319: {'origin': {'name': 'postfix{assign{other_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'assign{other_op}', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'name', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'attr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 320: {'origin': {'name': 'postfix{assign{other_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'assign{other_op}', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'subscript', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 321: {'origin': {'name': 'postfix{tail{unbracketed_expr,other_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arguments', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 322: {'origin': {'name': 'postfix{tail{unbracketed_expr,other_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 323: {'origin': {'name': 'postfix{tail{unbracketed_expr,other_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'name', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'attr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 324: {'origin': {'name': 'postfix{tail{unbracketed_expr,other_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'subscript', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 325: {'origin': {'name': 'times{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit{unbracketed_expr}', '__type__': 'NonTerminal'}, {'name': 'times_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'times'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 326: {'origin': {'name': 'times{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, {'name': 'times_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'times'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 327: {'origin': {'name': 'open_chain{atom,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}, {'name': 'other_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'open_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 328: {'origin': {'name': 'open_chain{atom,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{atom,other_op}', '__type__': 'NonTerminal'}, {'name': 'other_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'open_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 329: {'origin': {'name': 'if_else{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'body{atom_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'condition', '__type__': 'NonTerminal'}, {'name': 'ELSE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'orelse{mul_op}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'if_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'if_else'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 330: {'origin': {'name': 'plain{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value{atom_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'plain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 331: {'origin': {'name': 'plain{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'assign{mul_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'plain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 332: {'origin': {'name': 'tail{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'postfix{value_np{atom_expr,mul_op}}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'tail'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 333: {'origin': {'name': 'tail{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'postfix{assign{mul_op}}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'tail'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 334: {'origin': {'name': 'tail{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'postfix{tail{atom_expr,mul_op}}', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'tail'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 335: {'origin': {'name': 'postfix{if_else{atom_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_else{atom_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arguments', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 336: {'origin': {'name': 'postfix{if_else{atom_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_else{atom_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 337: {'origin': {'name': 'postfix{if_else{atom_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_else{atom_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'name', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'attr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 338: {'origin': {'name': 'postfix{if_else{atom_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_else{atom_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'subscript', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 339: {'origin': {'name': 'value{bare,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 340: {'origin': {'name': 'value{bare,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value_np{bare,mul_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 341: {'origin': {'name': 'assign{mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'name', '__type__': 'NonTerminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'value{atom,mul_op}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'assign_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'assign'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 342: {'origin': {'name': 'assign{mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'name', '__type__': 'NonTerminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'assign{mul_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'assign_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'assign'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 343: {'origin': {'name': 'value{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 344: {'origin': {'name': 'value{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value_np{bare_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 345: {'origin': {'name': 'value_np{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{bare_expr}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 346: {'origin': {'name': 'value_np{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{bare_expr}', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'bit{atom}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 347: {'origin': {'name': 'value_np{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{bare_expr}', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'bit{power}', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 348: {'origin': {'name': 'value_np{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare_expr', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'bit_np{atom}', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 349: {'origin': {'name': 'value_np{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare_expr', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'bit_np{power}', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 350: {'origin': {'name': 'value_np{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'mul_chain{bare_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 351: {'origin': {'name': 'postfix{value_np{bare_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value_np{bare_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arguments', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 352: {'origin': {'name': 'postfix{value_np{bare_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value_np{bare_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 353: {'origin': {'name': 'postfix{value_np{bare_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value_np{bare_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'name', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'attr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 354: {'origin': {'name': 'postfix{value_np{bare_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value_np{bare_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'subscript', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 355: {'origin': {'name': 'postfix{assign{mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'assign{mul_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arguments', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 356: {'origin': {'name': 'postfix{assign{mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'assign{mul_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 357: {'origin': {'name': 'postfix{assign{mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'assign{mul_op}', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'name', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'attr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 358: {'origin': {'name': 'postfix{assign{mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'assign{mul_op}', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'subscript', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 359: {'origin': {'name': 'postfix{tail{bare_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{bare_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arguments', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 360: {'origin': {'name': 'postfix{tail{bare_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{bare_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 361: {'origin': {'name': 'postfix{tail{bare_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{bare_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'name', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'attr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 362: {'origin': {'name': 'postfix{tail{bare_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{bare_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'subscript', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 363: {'origin': {'name': 'value_np{atom,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 364: {'origin': {'name': 'value_np{atom,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{atom}', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'bit{atom}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 365: {'origin': {'name': 'value_np{atom,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{atom}', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'bit{power}', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 366: {'origin': {'name': 'value_np{atom,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'bit_np{atom}', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 367: {'origin': {'name': 'value_np{atom,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'bit_np{power}', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 368: {'origin': {'name': 'value_np{atom,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'mul_chain{atom,mul_op}', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 369: {'origin': {'name': 'sum_np{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{atom}', '__type__': 'NonTerminal'}, {'name': 'add_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'sum', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'sum_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 370: {'origin': {'name': 'sum_np{word_atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{word_atom}', '__type__': 'NonTerminal'}, {'name': 'add_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'sum', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'sum_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 371: {'origin': {'name': 'sum_np{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{bare}', '__type__': 'NonTerminal'}, {'name': 'add_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'sum', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'sum_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 372: {'origin': {'name': 'bool_np{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_np{atom_expr}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 373: {'origin': {'name': 'bool_np{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_chain{atom_expr}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 374: {'origin': {'name': 'bit_chain{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool{atom_expr}', '__type__': 'NonTerminal'}, {'name': 'bit_op', '__type__': 'NonTerminal'}, {'name': 'bool{atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'bit_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bit_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 375: {'origin': {'name': 'bit_chain{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_chain{atom_expr}', '__type__': 'NonTerminal'}, {'name': 'bit_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'bit_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bit_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 376: {'origin': {'name': 'bool_np{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_np{atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 377: {'origin': {'name': 'bool_np{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_chain{atom}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 378: {'origin': {'name': 'bit_chain{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool{atom}', '__type__': 'NonTerminal'}, {'name': 'bit_op', '__type__': 'NonTerminal'}, {'name': 'bool{atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'bit_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bit_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 379: {'origin': {'name': 'bit_chain{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_chain{atom}', '__type__': 'NonTerminal'}, {'name': 'bit_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'bit_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bit_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 380: {'origin': {'name': 'bool_np{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_np{power}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 381: {'origin': {'name': 'bool_np{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_chain{power}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 382: {'origin': {'name': 'bit_chain{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool{power}', '__type__': 'NonTerminal'}, {'name': 'bit_op', '__type__': 'NonTerminal'}, {'name': 'bool{atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'bit_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bit_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 383: {'origin': {'name': 'bit_chain{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_chain{power}', '__type__': 'NonTerminal'}, {'name': 'bit_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'bit_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bit_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 384: {'origin': {'name': 'open_chain{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom_expr', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'open_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 385: {'origin': {'name': 'open_chain{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{atom_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'open_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 386: {'origin': {'name': 'if_else{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'body{bare_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'condition', '__type__': 'NonTerminal'}, {'name': 'ELSE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'orelse{mul_op}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'if_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'if_else'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 387: {'origin': {'name': 'postfix{if_else{bare_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_else{bare_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arguments', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 388: {'origin': {'name': 'postfix{if_else{bare_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_else{bare_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 389: {'origin': {'name': 'postfix{if_else{bare_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_else{bare_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'name', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'attr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 390: {'origin': {'name': 'postfix{if_else{bare_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_else{bare_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'subscript', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 391: {'origin': {'name': 'value{atom,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 392: {'origin': {'name': 'value{atom,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value_np{atom,other_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 393: {'origin': {'name': 'bit_np{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_np{unbracketed_expr}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bit_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 394: {'origin': {'name': 'bit_np{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_chain{unbracketed_expr}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bit_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 395: {'origin': {'name': 'mul_chain{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unbracketed_expr', '__type__': 'NonTerminal'}, {'name': 'other_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 396: {'origin': {'name': 'mul_chain{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unbracketed_expr', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'power', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 397: {'origin': {'name': 'mul_chain{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, {'name': 'other_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 398: {'origin': {'name': 'mul_chain{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'power', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 399: {'origin': {'name': 'bit{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unbracketed_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bit'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 400: {'origin': {'name': 'bit{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{unbracketed_expr}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bit'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 401: {'origin': {'name': 'open_chain{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unbracketed_expr', '__type__': 'NonTerminal'}, {'name': 'other_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'open_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 402: {'origin': {'name': 'open_chain{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{unbracketed_expr,other_op}', '__type__': 'NonTerminal'}, {'name': 'other_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'open_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 403: {'origin': {'name': 'body{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'plain{atom_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'body'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 404: {'origin': {'name': 'body{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{atom_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'body'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 405: {'origin': {'name': 'value{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 406: {'origin': {'name': 'value{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value_np{atom_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 407: {'origin': {'name': 'value_np{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{atom_expr}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 408: {'origin': {'name': 'value_np{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{atom_expr}', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'bit{atom}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 409: {'origin': {'name': 'value_np{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{atom_expr}', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'bit{power}', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 410: {'origin': {'name': 'value_np{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom_expr', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'bit_np{atom}', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 411: {'origin': {'name': 'value_np{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom_expr', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'bit_np{power}', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 412: {'origin': {'name': 'value_np{atom_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'mul_chain{atom_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 413: {'origin': {'name': 'postfix{value_np{atom_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value_np{atom_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arguments', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 414: {'origin': {'name': 'postfix{value_np{atom_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value_np{atom_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 415: {'origin': {'name': 'postfix{value_np{atom_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value_np{atom_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'name', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'attr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 416: {'origin': {'name': 'postfix{value_np{atom_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value_np{atom_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'subscript', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 417: {'origin': {'name': 'postfix{tail{atom_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{atom_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arguments', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 418: {'origin': {'name': 'postfix{tail{atom_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{atom_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'call_expr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 419: {'origin': {'name': 'postfix{tail{atom_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{atom_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'name', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'attr', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 420: {'origin': {'name': 'postfix{tail{atom_expr,mul_op}}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{atom_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'subscript', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'postfix'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 421: {'origin': {'name': 'value_np{bare,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{bare}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 422: {'origin': {'name': 'value_np{bare,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{bare}', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'bit{atom}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 423: {'origin': {'name': 'value_np{bare,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{bare}', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'bit{power}', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 424: {'origin': {'name': 'value_np{bare,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'bit_np{atom}', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 425: {'origin': {'name': 'value_np{bare,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'bit_np{power}', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 426: {'origin': {'name': 'value_np{bare,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'mul_chain{bare,mul_op}', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 427: {'origin': {'name': 'bit_np{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_np{bare_expr}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bit_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 428: {'origin': {'name': 'bit_np{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_chain{bare_expr}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bit_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 429: {'origin': {'name': 'mul_chain{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare_expr', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 430: {'origin': {'name': 'mul_chain{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare_expr', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'power', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 431: {'origin': {'name': 'mul_chain{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{bare_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 432: {'origin': {'name': 'mul_chain{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{bare_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'power', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 433: {'origin': {'name': 'mul_chain{atom,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 434: {'origin': {'name': 'mul_chain{atom,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'power', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 435: {'origin': {'name': 'mul_chain{atom,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{atom,mul_op}', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 436: {'origin': {'name': 'mul_chain{atom,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{atom,mul_op}', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'power', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 437: {'origin': {'name': 'comparison_np{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum_np{atom_expr}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 438: {'origin': {'name': 'comparison_np{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{atom_expr}', '__type__': 'NonTerminal'}, {'name': '_compared', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'comp_oper', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 439: {'origin': {'name': 'comparison_np{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{atom_expr}', '__type__': 'NonTerminal'}, {'name': 'sym_comp_op', '__type__': 'NonTerminal'}, {'name': 'pair', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'comp_oper', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 440: {'origin': {'name': 'bool_chain{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison{atom_expr}', '__type__': 'NonTerminal'}, {'name': 'bool_op', '__type__': 'NonTerminal'}, {'name': 'comparison{word_atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'bool_oper', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bool_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 441: {'origin': {'name': 'bool_chain{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_chain{atom_expr}', '__type__': 'NonTerminal'}, {'name': 'bool_op', '__type__': 'NonTerminal'}, {'name': 'word_atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'bool_oper', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bool_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 442: {'origin': {'name': 'bool{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 443: {'origin': {'name': 'bool{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_np{atom_expr}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 444: {'origin': {'name': 'bool{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 445: {'origin': {'name': 'bool{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_np{atom}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 446: {'origin': {'name': 'comparison_np{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum_np{atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 447: {'origin': {'name': 'comparison_np{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{atom}', '__type__': 'NonTerminal'}, {'name': '_compared', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'comp_oper', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 448: {'origin': {'name': 'comparison_np{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{atom}', '__type__': 'NonTerminal'}, {'name': 'sym_comp_op', '__type__': 'NonTerminal'}, {'name': 'pair', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'comp_oper', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 449: {'origin': {'name': 'bool_chain{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison{atom}', '__type__': 'NonTerminal'}, {'name': 'bool_op', '__type__': 'NonTerminal'}, {'name': 'comparison{word_atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'bool_oper', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bool_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 450: {'origin': {'name': 'bool_chain{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_chain{atom}', '__type__': 'NonTerminal'}, {'name': 'bool_op', '__type__': 'NonTerminal'}, {'name': 'word_atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'bool_oper', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bool_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 451: {'origin': {'name': 'comparison_np{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum_np{power}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 452: {'origin': {'name': 'comparison_np{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{power}', '__type__': 'NonTerminal'}, {'name': '_compared', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'comp_oper', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 453: {'origin': {'name': 'comparison_np{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{power}', '__type__': 'NonTerminal'}, {'name': 'sym_comp_op', '__type__': 'NonTerminal'}, {'name': 'pair', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'comp_oper', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 454: {'origin': {'name': 'bool_chain{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison{power}', '__type__': 'NonTerminal'}, {'name': 'bool_op', '__type__': 'NonTerminal'}, {'name': 'comparison{word_atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'bool_oper', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bool_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 455: {'origin': {'name': 'bool_chain{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_chain{power}', '__type__': 'NonTerminal'}, {'name': 'bool_op', '__type__': 'NonTerminal'}, {'name': 'word_atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'bool_oper', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bool_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 456: {'origin': {'name': 'bool{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'power', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 457: {'origin': {'name': 'bool{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_np{power}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 458: {'origin': {'name': 'body{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'plain{bare_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'body'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 459: {'origin': {'name': 'body{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tail{bare_expr,mul_op}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'body'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 460: {'origin': {'name': 'value_np{atom,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 461: {'origin': {'name': 'value_np{atom,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{atom}', '__type__': 'NonTerminal'}, {'name': 'other_op', '__type__': 'NonTerminal'}, {'name': 'bit{atom}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 462: {'origin': {'name': 'value_np{atom,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_np{atom}', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'bit{power}', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 463: {'origin': {'name': 'value_np{atom,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}, {'name': 'other_op', '__type__': 'NonTerminal'}, {'name': 'bit_np{atom}', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 464: {'origin': {'name': 'value_np{atom,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'bit_np{power}', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 465: {'origin': {'name': 'value_np{atom,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'mul_chain{atom,other_op}', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'value_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 466: {'origin': {'name': 'bool_np{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_np{unbracketed_expr}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 467: {'origin': {'name': 'bool_np{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_chain{unbracketed_expr}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 468: {'origin': {'name': 'bit_chain{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool{unbracketed_expr}', '__type__': 'NonTerminal'}, {'name': 'bit_op', '__type__': 'NonTerminal'}, {'name': 'bool{atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'bit_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bit_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 469: {'origin': {'name': 'bit_chain{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_chain{unbracketed_expr}', '__type__': 'NonTerminal'}, {'name': 'bit_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'bit_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bit_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 470: {'origin': {'name': 'bit_np{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_np{bare}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bit_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 471: {'origin': {'name': 'bit_np{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_chain{bare}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bit_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 472: {'origin': {'name': 'mul_chain{bare,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 473: {'origin': {'name': 'mul_chain{bare,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'power', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 474: {'origin': {'name': 'mul_chain{bare,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{bare,mul_op}', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 475: {'origin': {'name': 'mul_chain{bare,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{bare,mul_op}', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'power', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 476: {'origin': {'name': 'bool_np{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_np{bare_expr}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 477: {'origin': {'name': 'bool_np{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_chain{bare_expr}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 478: {'origin': {'name': 'bit_chain{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool{bare_expr}', '__type__': 'NonTerminal'}, {'name': 'bit_op', '__type__': 'NonTerminal'}, {'name': 'bool{atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'bit_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bit_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 479: {'origin': {'name': 'bit_chain{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_chain{bare_expr}', '__type__': 'NonTerminal'}, {'name': 'bit_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'bit_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bit_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 480: {'origin': {'name': 'open_chain{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare_expr', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'open_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 481: {'origin': {'name': 'open_chain{bare_expr,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{bare_expr,mul_op}', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'open_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 482: {'origin': {'name': 'open_chain{atom,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'open_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 483: {'origin': {'name': 'open_chain{atom,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{atom,mul_op}', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'open_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 484: {'origin': {'name': 'comparison{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 485: {'origin': {'name': 'comparison{atom_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_np{atom_expr}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 486: {'origin': {'name': 'comparison{word_atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'word_atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 487: {'origin': {'name': 'comparison{word_atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_np{word_atom}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 488: {'origin': {'name': 'comparison{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 489: {'origin': {'name': 'comparison{atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_np{atom}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 490: {'origin': {'name': 'sum{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'power', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'sum'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 491: {'origin': {'name': 'sum{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum_np{power}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'sum'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 492: {'origin': {'name': 'sum_np{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{power}', '__type__': 'NonTerminal'}, {'name': 'add_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'sum', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'sum_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 493: {'origin': {'name': 'comparison{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'power', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 494: {'origin': {'name': 'comparison{power}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_np{power}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 495: {'origin': {'name': 'mul_chain{atom,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}, {'name': 'other_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 496: {'origin': {'name': 'mul_chain{atom,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'atom', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'power', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 497: {'origin': {'name': 'mul_chain{atom,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{atom,other_op}', '__type__': 'NonTerminal'}, {'name': 'other_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 498: {'origin': {'name': 'mul_chain{atom,other_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{atom,other_op}', '__type__': 'NonTerminal'}, {'name': 'exp_op', '__type__': 'NonTerminal'}, {'name': 'power', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'mul_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 499: {'origin': {'name': 'comparison_np{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum_np{unbracketed_expr}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 500: {'origin': {'name': 'comparison_np{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{unbracketed_expr}', '__type__': 'NonTerminal'}, {'name': '_compared', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'comp_oper', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 501: {'origin': {'name': 'comparison_np{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{unbracketed_expr}', '__type__': 'NonTerminal'}, {'name': 'sym_comp_op', '__type__': 'NonTerminal'}, {'name': 'pair', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'comp_oper', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 502: {'origin': {'name': 'bool_chain{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison{unbracketed_expr}', '__type__': 'NonTerminal'}, {'name': 'bool_op', '__type__': 'NonTerminal'}, {'name': 'comparison{word_atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'bool_oper', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bool_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 503: {'origin': {'name': 'bool_chain{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_chain{unbracketed_expr}', '__type__': 'NonTerminal'}, {'name': 'bool_op', '__type__': 'NonTerminal'}, {'name': 'word_atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'bool_oper', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bool_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 504: {'origin': {'name': 'bool{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unbracketed_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 505: {'origin': {'name': 'bool{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_np{unbracketed_expr}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 506: {'origin': {'name': 'bool_np{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_np{bare}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 507: {'origin': {'name': 'bool_np{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_chain{bare}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 508: {'origin': {'name': 'bit_chain{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool{bare}', '__type__': 'NonTerminal'}, {'name': 'bit_op', '__type__': 'NonTerminal'}, {'name': 'bool{atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'bit_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bit_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 509: {'origin': {'name': 'bit_chain{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bit_chain{bare}', '__type__': 'NonTerminal'}, {'name': 'bit_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'bit_expr', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bit_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 510: {'origin': {'name': 'open_chain{bare,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'open_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 511: {'origin': {'name': 'open_chain{bare,mul_op}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'open_chain{bare,mul_op}', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'product', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'open_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 512: {'origin': {'name': 'comparison_np{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum_np{bare_expr}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 513: {'origin': {'name': 'comparison_np{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{bare_expr}', '__type__': 'NonTerminal'}, {'name': '_compared', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'comp_oper', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 514: {'origin': {'name': 'comparison_np{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{bare_expr}', '__type__': 'NonTerminal'}, {'name': 'sym_comp_op', '__type__': 'NonTerminal'}, {'name': 'pair', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'comp_oper', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 515: {'origin': {'name': 'bool_chain{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison{bare_expr}', '__type__': 'NonTerminal'}, {'name': 'bool_op', '__type__': 'NonTerminal'}, {'name': 'comparison{word_atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'bool_oper', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bool_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 516: {'origin': {'name': 'bool_chain{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_chain{bare_expr}', '__type__': 'NonTerminal'}, {'name': 'bool_op', '__type__': 'NonTerminal'}, {'name': 'word_atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'bool_oper', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bool_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 517: {'origin': {'name': 'bool{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 518: {'origin': {'name': 'bool{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_np{bare_expr}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 519: {'origin': {'name': 'comparison_np{word_atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum_np{word_atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 520: {'origin': {'name': 'comparison_np{word_atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{word_atom}', '__type__': 'NonTerminal'}, {'name': '_compared', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'comp_oper', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 521: {'origin': {'name': 'comparison_np{word_atom}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{word_atom}', '__type__': 'NonTerminal'}, {'name': 'sym_comp_op', '__type__': 'NonTerminal'}, {'name': 'pair', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'comp_oper', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 522: {'origin': {'name': 'sum{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unbracketed_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'sum'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 523: {'origin': {'name': 'sum{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum_np{unbracketed_expr}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'sum'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 524: {'origin': {'name': 'sum_np{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{unbracketed_expr}', '__type__': 'NonTerminal'}, {'name': 'add_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'sum', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'sum_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 525: {'origin': {'name': 'comparison{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unbracketed_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 526: {'origin': {'name': 'comparison{unbracketed_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_np{unbracketed_expr}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 527: {'origin': {'name': 'comparison_np{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum_np{bare}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 528: {'origin': {'name': 'comparison_np{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{bare}', '__type__': 'NonTerminal'}, {'name': '_compared', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'comp_oper', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 529: {'origin': {'name': 'comparison_np{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{bare}', '__type__': 'NonTerminal'}, {'name': 'sym_comp_op', '__type__': 'NonTerminal'}, {'name': 'pair', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'comp_oper', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 530: {'origin': {'name': 'bool_chain{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison{bare}', '__type__': 'NonTerminal'}, {'name': 'bool_op', '__type__': 'NonTerminal'}, {'name': 'comparison{word_atom}', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'bool_oper', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bool_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 531: {'origin': {'name': 'bool_chain{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_chain{bare}', '__type__': 'NonTerminal'}, {'name': 'bool_op', '__type__': 'NonTerminal'}, {'name': 'word_atom', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'bool_oper', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'bool_chain'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 532: {'origin': {'name': 'bool{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 533: {'origin': {'name': 'bool{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool_np{bare}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'bool'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 534: {'origin': {'name': 'sum{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'sum'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 535: {'origin': {'name': 'sum{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum_np{bare_expr}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'sum'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 536: {'origin': {'name': 'sum_np{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sum{bare_expr}', '__type__': 'NonTerminal'}, {'name': 'add_op', '__type__': 'NonTerminal'}, {'name': 'atom', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'sum', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': Token('RULE', 'sum_np'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 537: {'origin': {'name': 'comparison{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare_expr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 538: {'origin': {'name': 'comparison{bare_expr}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_np{bare_expr}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 539: {'origin': {'name': 'comparison{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bare', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 540: {'origin': {'name': 'comparison{bare}', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison_np{bare}', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': Token('RULE', 'comparison'), 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 541: {'origin': {'name': '__module_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'following', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 542: {'origin': {'name': '__module_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__module_star_0', '__type__': 'NonTerminal'}, {'name': 'following', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 543: {'origin': {'name': '__arguments_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'argument', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 544: {'origin': {'name': '__arguments_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__arguments_star_1', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'argument', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 545: {'origin': {'name': '__tuple_plus_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 546: {'origin': {'name': '__tuple_plus_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__tuple_plus_2', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 547: {'origin': {'name': '___sep{key_value,COMMA}_star_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'key_value', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 548: {'origin': {'name': '___sep{key_value,COMMA}_star_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': '___sep{key_value,COMMA}_star_3', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'key_value', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}}
+)
+Shift = 0
+Reduce = 1
+def Lark_StandAlone(**kwargs):
+  return Lark._load_from_dict(DATA, MEMO, **kwargs)
+
+
+from typing import cast  # noqa: E402
+
+# Generated by scripts/standalone.py from grammar_lalr.lark, do not edit.
+GRAMMAR_KEY = "b94a65b242ce877fa181494e2e89a49969476a4556ad5e0a09c693222605df7e"
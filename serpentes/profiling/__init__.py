@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import sys
+import time
+import tracemalloc
+import typing
+
+__all__ = (
+    "Event",
+    "Profiler",
+    "add_listener",
+    "remove_listener",
+    "enabled",
+    "profiled",
+    "stage",
+    "count_rules",
+)
+
+
+class Event(typing.NamedTuple):
+    stage: str
+    elapsed: float
+    # Peak bytes allocated during the stage, only known while tracemalloc is tracing.
+    peak: int | None
+    details: dict[str, typing.Any]
+
+
+Listener: typing.TypeAlias = typing.Callable[[Event], None]
+
+LISTENERS: list[Listener] = []
+
+# [start, peak] of every stage currently running, so nested stages don't lose the
+# peak of the stage around them when they reset it.
+RUNNING: list[list[int]] = []
+
+
+def add_listener(listener: Listener) -> None:
+    LISTENERS.append(listener)
+
+
+def remove_listener(listener: Listener) -> None:
+    with contextlib.suppress(ValueError):
+        LISTENERS.remove(listener)
+
+
+def enabled() -> bool:
+    return bool(LISTENERS)
+
+
+def profiled() -> bool:
+    # Only profilers read the time spent in each rule, metrics alone don't pay for it.
+    return any(isinstance(listener, Profiler) for listener in LISTENERS)
+
+
+@contextlib.contextmanager
+def stage(name: str, **details: typing.Any) -> typing.Iterator[dict[str, typing.Any]]:
+    if not LISTENERS:
+        yield details
+        return
+
+    tracing = tracemalloc.is_tracing()
+
+    if tracing:
+        current, peak = tracemalloc.get_traced_memory()
+
+        if RUNNING:
+            RUNNING[-1][1] = max(RUNNING[-1][1], peak)
+
+        tracemalloc.reset_peak()
+        RUNNING.append([current, current])
+
+    start = time.perf_counter()
+
+    try:
+        yield details
+    except BaseException as error:
+        details.setdefault("error", type(error).__name__)
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        allocated = None
+
+        if tracing:
+            begin, peak = RUNNING.pop()
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            allocated = peak - begin
+
+            if RUNNING:
+                RUNNING[-1][1] = max(RUNNING[-1][1], peak)
+
+        event = Event(name, elapsed, allocated, details)
+
+        for listener in tuple(LISTENERS):
+            listener(event)
+
+
+def count_rules(transformer: typing.Any) -> dict[str, list[typing.Any]]:
+    # Children are transformed before their parent's callback runs, so the time
+    # recorded for a rule excludes the rules below it.
+    rules: dict[str, list[typing.Any]] = {}
+    call = transformer._call_userfunc
+
+    def timed(tree: typing.Any, new_children: typing.Any = None) -> typing.Any:
+        start = time.perf_counter()
+
+        try:
+            return call(tree, new_children)
+        finally:
+            record = rules.setdefault(str(tree.data), [0, 0.0])
+            record[0] += 1
+            record[1] += time.perf_counter() - start
+
+    transformer._call_userfunc = timed
+    return rules
+
+
+class Profiler:
+    def __init__(self, memory: bool = True) -> None:
+        self.memory = memory
+        self.started = False
+
+        self.stages: dict[str, list[typing.Any]] = {}
+        self.rules: dict[str, list[typing.Any]] = {}
+
+    def __call__(self, event: Event) -> None:
+        name = event.stage
+
+        if parser := event.details.get("parser"):
+            name = f"{name} ({parser})"
+
+        record = self.stages.setdefault(name, [0, 0.0, None])
+        record[0] += 1
+        record[1] += event.elapsed
+
+        if event.peak is not None:
+            record[2] = max(record[2] or 0, event.peak)
+
+        for name, (count, elapsed) in event.details.get("rules", {}).items():
+            rule = self.rules.setdefault(name, [0, 0.0])
+            rule[0] += count
+            rule[1] += elapsed
+
+    def __enter__(self) -> Profiler:
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started = True
+
+        add_listener(self)
+        return self
+
+    def __exit__(self, *_: typing.Any) -> None:
+        remove_listener(self)
+
+        if self.started:
+            tracemalloc.stop()
+            self.started = False
+
+    def as_dict(self) -> dict[str, typing.Any]:
+        return {
+            "stages": {
+                name: {"calls": count, "time": elapsed, "peak": peak}
+                for name, (count, elapsed, peak) in self.stages.items()
+            },
+            "rules": {
+                name: {"calls": count, "time": elapsed}
+                for name, (count, elapsed) in self.rules.items()
+            },
+        }
+
+    def report(self) -> str:
+        lines = [f"{'stage':<16} {'calls':>8} {'total (ms)':>12} {'peak (KiB)':>12}"]
+
+        for name, (count, elapsed, peak) in sorted(
+            self.stages.items(), key=lambda item: -item[1][1]
+        ):
+            memory = "-" if peak is None else f"{peak / 1024:.1f}"
+            lines.append(f"{name:<16} {count:>8} {elapsed * 1000:>12.3f} {memory:>12}")
+
+        if self.rules:
+            lines.append("")
+            lines.append(
+                f"{'rule':<16} {'calls':>8} {'total (ms)':>12} {'mean (us)':>12}"
+            )
+
+            for name, (count, elapsed) in sorted(
+                self.rules.items(), key=lambda item: -item[1][1]
+            ):
+                lines.append(
+                    f"{name:<16} {count:>8} {elapsed * 1000:>12.3f}"
+                    f" {elapsed / count * 1e6:>12.2f}"
+                )
+
+        return "\n".join(lines)
+
+    def dump(self, path: str = "-") -> None:
+        if path == "-":
+            print(self.report(), file=sys.stderr)
+            return
+
+        with open(path, "w") as fp:
+            json.dump(self.as_dict(), fp, indent=2)
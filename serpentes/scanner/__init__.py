@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import re
+
+__all__ = ("StatementScanner", "split_statements")
+
+TOKEN = re.compile(
+    r"""
+    (?P<space>[ \t\f\r]+)
+    | (?P<newline>\n)
+    | (?P<comment>//[^\n]*)
+    | (?P<string>[ubfrUBFR]{0,2}(?:\"\"\"[\s\S]*?\"\"\"|'''[\s\S]*?'''
+        |"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'))
+    | (?P<quote>[ubfrUBFR]{0,2}["'])
+    | (?P<name>[^\W\d]\w*)
+    | (?P<number>\.?\d[\w.]*)
+    | (?P<unary>\[(?:not\b|[+\-~]))
+    | (?P<open>[(\[{])
+    | (?P<close>[)\]}])
+    | (?P<operator><-|\*\*|<<|>>|[<>=!]=|[-+*/%@<>|^&~.,:=])
+    | (?P<other>.)
+    """,
+    re.VERBOSE,
+)
+
+# Keywords which can only continue the expression in front of them.
+CONTINUATIONS = frozenset({"or", "and", "in", "is", "not", "if", "else", "for", "exp"})
+
+
+class StatementScanner:
+    def __init__(self) -> None:
+        self.text = str()
+        self.pos = 0
+        self.line = 1
+
+        self.depth = 0
+        self.dangling = False
+        self.content = False
+        self.boundary = False
+
+        # Set once the text has something the parser will reject, so statements may not
+        # end where the scanner thinks they do.
+        self.unsure = False
+
+        self.start = 0
+        self.start_line = 1
+
+    def starts_statement(self, kind: str, value: str) -> bool:
+        if kind == "name":
+            return value not in CONTINUATIONS
+
+        return kind in {"string", "number", "unary"} or value == "{"
+
+    def scan(self, final: bool) -> list[tuple[int, str]]:
+        chunks: list[tuple[int, str]] = []
+        text = self.text
+
+        limit = len(text) if final else text.rfind("\n") + 1
+        pos = self.pos
+
+        while pos < limit and (match := TOKEN.match(text, pos, limit)):
+            kind = match.lastgroup or "other"
+            value = match.group()
+
+            # An unterminated string may still be completed by the next feed.
+            if kind == "quote" and not final:
+                break
+
+            pos = match.end()
+
+            if kind in {"quote", "other"}:
+                self.unsure = True
+
+            if kind == "newline":
+                self.line += 1
+                self.boundary = self.depth == 0 and self.content and not self.dangling
+                continue
+
+            elif kind in {"space", "comment"}:
+                continue
+
+            # Statements start with their line, so they keep the columns of their tokens.
+            if self.boundary and self.starts_statement(kind, value):
+                start = text.rfind("\n", self.start, match.start()) + 1
+                chunks.append((self.start_line, text[self.start : start]))
+                self.start, self.start_line = start, self.line
+
+            self.boundary = False
+            self.content = True
+            self.line += value.count("\n")
+
+            if kind in {"open", "unary"}:
+                self.depth += 1
+
+            elif kind == "close":
+                self.unsure = self.unsure or self.depth == 0
+                self.depth = max(self.depth - 1, 0)
+
+            if self.depth == 0:
+                self.dangling = kind == "operator" or (
+                    kind == "name" and value in CONTINUATIONS
+                )
+
+        self.pos = pos
+
+        if final and self.content:
+            self.unsure = self.unsure or self.depth > 0 or self.dangling
+            chunks.append((self.start_line, text[self.start :]))
+            self.start, self.content = len(text), False
+
+        # Drop everything that was handed out already, keeping the buffer bounded.
+        if self.start:
+            self.text = text[self.start :]
+            self.pos -= self.start
+            self.start = 0
+
+        return chunks
+
+    def feed(self, text: str, final: bool = False) -> list[tuple[int, str]]:
+        self.text += text
+        return self.scan(final)
+
+
+def split_statements(text: str) -> list[tuple[int, str]]:
+    return StatementScanner().feed(text, final=True)
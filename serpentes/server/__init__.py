@@ -0,0 +1,723 @@
+from __future__ import annotations
+
+import collections
+import contextlib
+import json
+import marshal
+import os
+import selectors
+import signal
+import socket
+import struct
+import sys
+import time
+import traceback
+import typing
+from multiprocessing.connection import Connection
+from multiprocessing.context import ForkServerContext, SpawnContext
+from types import CodeType
+
+if typing.TYPE_CHECKING:
+    from ..engine import Key
+
+__all__ = ("socket_path", "ServerError", "Server", "Client")
+
+FRAME = struct.Struct(">I")
+MAX_FRAME = 64 * 1024 * 1024
+
+
+class ServerError(RuntimeError):
+    pass
+
+
+def socket_path() -> str:
+    if path := os.environ.get("SERPENTES_SOCKET"):
+        return path
+
+    from ..cache import cache_dir
+
+    return cache_dir("server.sock")
+
+
+def send_frame(conn: socket.socket, data: bytes, fds: list[int] | None = None) -> None:
+    if fds:
+        socket.send_fds(conn, [FRAME.pack(len(data))], fds)
+        conn.sendall(data)
+    else:
+        conn.sendall(FRAME.pack(len(data)) + data)
+
+
+def recv_exact(conn: socket.socket, size: int) -> bytes:
+    data = bytearray()
+
+    while len(data) < size:
+        if not (chunk := conn.recv(size - len(data))):
+            raise ConnectionError("Connection closed in the middle of a frame")
+
+        data += chunk
+
+    return bytes(data)
+
+
+def recv_frame(conn: socket.socket, fds: int = 0) -> tuple[bytes, list[int]]:
+    received: list[int] = []
+
+    if fds:
+        header, received, _, _ = socket.recv_fds(conn, FRAME.size, fds)
+
+        if not header:
+            raise ConnectionError("Connection closed before a frame")
+
+        header += recv_exact(conn, FRAME.size - len(header))
+    else:
+        header = recv_exact(conn, FRAME.size)
+
+    (size,) = FRAME.unpack(header)
+
+    if size > MAX_FRAME:
+        raise ValueError(f"Frame of {size} bytes is too large")
+
+    return recv_exact(conn, size), received
+
+
+def send_message(conn: socket.socket, message: dict[str, typing.Any], **kwargs) -> None:
+    send_frame(conn, json.dumps(message).encode(), **kwargs)
+
+
+def recv_message(
+    conn: socket.socket, fds: int = 0
+) -> tuple[dict[str, typing.Any], list[int]]:
+    data, received = recv_frame(conn, fds)
+    return json.loads(data), received
+
+
+class Pending:
+    # A request still being read, with the descriptors that came along with it.
+    def __init__(self, deadline: float) -> None:
+        self.deadline = deadline
+        self.data = bytearray()
+        self.fds: list[int] = []
+
+    def close(self) -> None:
+        for fd in self.fds:
+            os.close(fd)
+
+        self.fds.clear()
+
+
+class Compiling:
+    # A request waiting for its code to come back from a worker.
+    def __init__(
+        self,
+        conn: socket.socket,
+        request: dict[str, typing.Any],
+        fds: list[int],
+        key: Key,
+        text: str,
+    ) -> None:
+        self.conn = conn
+        self.request = request
+        self.fds = fds
+        self.key = key
+        self.text = text
+
+    def close(self) -> None:
+        for fd in self.fds:
+            os.close(fd)
+
+        self.fds.clear()
+
+
+def work(conn: Connection, parser: str) -> None:
+    from ..compiler import warm
+    from ..engine import compile_marshal
+
+    warm(parser)
+
+    # Compiles until the server hangs up, errors go back as their message.
+    while True:
+        try:
+            text, path, parser, optimize = conn.recv()
+        except EOFError:
+            return
+
+        try:
+            conn.send((True, compile_marshal(text, path, parser, optimize)))
+        except Exception as error:
+            conn.send((False, f"{type(error).__name__}: {error}"))
+
+
+class Worker:
+    # A compile process with the request it is working on. Unlike an executor, its pipe
+    # needs no thread in the server.
+    def __init__(
+        self, context: ForkServerContext | SpawnContext, parser: str = "lalr"
+    ) -> None:
+        self.conn, conn = context.Pipe()
+        self.process = context.Process(target=work, args=(conn, parser), daemon=True)
+        self.process.start()
+        conn.close()
+
+        self.compiling: Compiling | None = None
+
+    def submit(self, compiling: Compiling) -> None:
+        request = compiling.request
+        parser, optimize = request.get("parser", "lalr"), request.get("optimize", 0)
+
+        self.conn.send((compiling.text, request["path"], parser, optimize))
+        self.compiling = compiling
+
+    def close(self) -> None:
+        self.conn.close()
+        self.process.terminate()
+        self.process.join()
+
+
+class Server:
+    def __init__(
+        self,
+        path: str | None = None,
+        max_children: int | None = None,
+        cache_size: int = 1024,
+        timeout: float = 10.0,
+    ) -> None:
+        self.path = path or socket_path()
+        self.max_children = max_children or os.cpu_count() or 1
+        self.timeout = timeout
+
+        from ..engine import CodeCache
+
+        self.cache = CodeCache(cache_size, "server")
+        self.selector = selectors.DefaultSelector()
+        self.listener: socket.socket | None = None
+
+        # Compiles run in worker processes the loop reads from like any connection. An
+        # executor would start threads here, and children are forked from this process.
+        self.workers: list[Worker] = []
+        self.idle: list[Worker] = []
+        self.queued: collections.deque[Compiling] = collections.deque()
+
+        # Running children by pid, with the connection waiting for their exit status.
+        self.children: dict[int, socket.socket] = {}
+        # Connections whose request hasn't fully arrived yet.
+        self.pending: dict[socket.socket, Pending] = {}
+        self.accepting = False
+        self.stopping = False
+
+    def warm(self) -> None:
+        for _ in range(self.max_children):
+            self.start()
+
+        # Every worker has compiled once before the first request.
+        for worker in self.workers:
+            worker.conn.send(("1", "<warm>", "lalr", 0))
+
+        for worker in self.workers:
+            worker.conn.recv()
+
+    def start(self) -> Worker:
+        from ..engine import context
+
+        worker = Worker(context())
+        self.workers.append(worker)
+        self.idle.append(worker)
+        self.selector.register(worker.conn, selectors.EVENT_READ, worker)
+
+        return worker
+
+    def busy(self) -> bool:
+        return len(self.children) >= self.max_children or not self.idle
+
+    def bind(self) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                try:
+                    probe.connect(self.path)
+                except ConnectionRefusedError:
+                    os.unlink(self.path)
+                else:
+                    raise ServerError(f"A server is already listening on {self.path}")
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        # The socket is created private, there's no window where others can connect.
+        umask = os.umask(0o177)
+
+        try:
+            self.listener.bind(self.path)
+        finally:
+            os.umask(umask)
+
+        self.listener.listen(self.max_children * 4)
+        self.listener.setblocking(False)
+
+        self.resume()
+
+    def stop(self, *_: typing.Any) -> None:
+        # A second signal doesn't wait for running children anymore.
+        if self.stopping:
+            for pid in self.children:
+                with contextlib.suppress(ProcessLookupError):
+                    os.kill(pid, signal.SIGTERM)
+
+        self.stopping = True
+
+    def pause(self) -> None:
+        if self.listener is not None and self.accepting:
+            self.selector.unregister(self.listener)
+            self.accepting = False
+
+    def resume(self) -> None:
+        if self.listener is not None and not self.accepting:
+            self.selector.register(self.listener, selectors.EVENT_READ)
+            self.accepting = True
+
+    def close_listener(self) -> None:
+        if self.listener is None:
+            return
+
+        self.pause()
+        self.listener.close()
+        self.listener = None
+
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)
+
+    def serve(self) -> None:
+        self.warm()
+        self.bind()
+
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        try:
+            while not self.stopping or self.children or self.compiling():
+                if self.stopping:
+                    self.close_listener()
+
+                for key, _ in self.selector.select(timeout=0.1):
+                    conn = typing.cast(socket.socket, key.fileobj)
+
+                    if conn is self.listener:
+                        self.accept()
+                    elif isinstance(key.data, Worker):
+                        self.compiled(key.data)
+                    elif conn in self.pending:
+                        self.receive(conn)
+                    else:
+                        self.disconnected(conn)
+
+                self.expire()
+                self.reap()
+        finally:
+            for conn in list(self.pending):
+                self.drop(conn)
+
+            for compiling in self.compiling():
+                compiling.close()
+                compiling.conn.close()
+
+            self.close_listener()
+            self.selector.close()
+
+            for worker in self.workers:
+                worker.close()
+
+    def accept(self) -> None:
+        assert self.listener is not None
+
+        try:
+            conn, _ = self.listener.accept()
+        except BlockingIOError:
+            return
+
+        # Requests are read as they arrive, a slow client doesn't hold up the others.
+        conn.setblocking(False)
+        self.pending[conn] = Pending(time.monotonic() + self.timeout)
+        self.selector.register(conn, selectors.EVENT_READ)
+
+    def receive(self, conn: socket.socket) -> None:
+        pending = self.pending[conn]
+
+        try:
+            data, fds, _, _ = socket.recv_fds(conn, 65536, 3)
+        except BlockingIOError:
+            return
+        except OSError:
+            data, fds = b"", []
+
+        pending.fds += fds
+
+        if not data:
+            self.drop(conn)
+            return
+
+        pending.data += data
+
+        try:
+            if len(pending.data) < FRAME.size:
+                return
+
+            (size,) = FRAME.unpack_from(pending.data)
+
+            if size > MAX_FRAME:
+                raise ValueError(f"Frame of {size} bytes is too large")
+
+            if len(pending.data) < FRAME.size + size:
+                return
+
+            request = json.loads(pending.data[FRAME.size : FRAME.size + size])
+        except Exception as error:
+            self.fail(conn, error)
+            return
+
+        del self.pending[conn]
+        self.selector.unregister(conn)
+
+        conn.setblocking(True)
+        conn.settimeout(self.timeout)
+
+        try:
+            self.handle(conn, request, pending.fds)
+        except Exception as error:
+            self.fail(conn, error)
+
+    def expire(self) -> None:
+        now = time.monotonic()
+
+        for conn, pending in list(self.pending.items()):
+            if pending.deadline <= now:
+                self.fail(conn, TimeoutError("Timed out waiting for the request"))
+
+    def fail(self, conn: socket.socket, error: Exception) -> None:
+        self.reject(conn, f"{type(error).__name__}: {error}")
+
+    def reject(self, conn: socket.socket, message: str) -> None:
+        with contextlib.suppress(OSError):
+            send_message(conn, {"ok": False, "error": message})
+
+        if conn in self.pending:
+            self.drop(conn)
+        else:
+            conn.close()
+
+    def drop(self, conn: socket.socket) -> None:
+        self.selector.unregister(conn)
+        self.pending.pop(conn).close()
+        conn.close()
+
+    def handle(
+        self, conn: socket.socket, request: dict[str, typing.Any], fds: list[int]
+    ) -> None:
+        path = request["path"]
+        parser, optimize = request.get("parser", "lalr"), request.get("optimize", 0)
+
+        try:
+            if request["op"] not in {"compile", "run"}:
+                raise ValueError(f"Unknown operation: {request['op']}")
+
+            with open(path, "rb") as fp:
+                text = fp.read().decode()
+
+            key = self.cache.key(text, path, parser, optimize)
+            code = self.cache.get(key)
+        except BaseException:
+            for fd in fds:
+                os.close(fd)
+
+            raise
+
+        if code is not None:
+            self.respond(conn, request, fds, code)
+            return
+
+        self.submit(Compiling(conn, request, fds, key, text))
+
+        # Pending clients wait in the listen backlog until a compile is done.
+        if self.busy():
+            self.pause()
+
+    def compiling(self) -> list[Compiling]:
+        running = [worker.compiling for worker in self.workers if worker.compiling]
+        return [*running, *self.queued]
+
+    def submit(self, compiling: Compiling) -> None:
+        if not self.idle:
+            self.queued.append(compiling)
+            return
+
+        worker = self.idle.pop()
+
+        try:
+            worker.submit(compiling)
+        except OSError:
+            # The worker is gone, its end of the pipe shows up in the loop.
+            worker.compiling = compiling
+
+    def compiled(self, worker: Worker) -> None:
+        compiling, worker.compiling = worker.compiling, None
+
+        try:
+            ok, result = worker.conn.recv()
+        except (EOFError, OSError):
+            # A lost worker is replaced, the request it was compiling fails.
+            self.selector.unregister(worker.conn)
+            self.workers.remove(worker)
+            worker.close()
+
+            if worker in self.idle:
+                self.idle.remove(worker)
+            self.start()
+
+            ok, result = False, "ServerError: A compile worker exited"
+        else:
+            self.idle.append(worker)
+
+        if compiling is not None:
+            self.finish(compiling, ok, result)
+
+        if self.queued and self.idle:
+            self.submit(self.queued.popleft())
+
+        if not self.busy():
+            self.resume()
+
+    def finish(self, compiling: Compiling, ok: bool, result: typing.Any) -> None:
+        if not ok:
+            compiling.close()
+            self.reject(compiling.conn, result)
+            return
+
+        code = marshal.loads(result)
+        self.cache.put(compiling.key, code)
+
+        try:
+            self.respond(compiling.conn, compiling.request, compiling.fds, code)
+        except Exception as error:
+            self.fail(compiling.conn, error)
+
+    def respond(
+        self,
+        conn: socket.socket,
+        request: dict[str, typing.Any],
+        fds: list[int],
+        code: CodeType,
+    ) -> None:
+        try:
+            if request["op"] == "compile":
+                send_message(conn, {"ok": True})
+                send_frame(conn, marshal.dumps(code))
+                conn.close()
+
+            elif request["op"] == "run":
+                if len(fds) != 3:
+                    raise ValueError("`run` needs the client's stdin, stdout and stderr")
+
+                self.spawn(conn, code, request, fds)
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+    def spawn(
+        self,
+        conn: socket.socket,
+        code: CodeType,
+        request: dict[str, typing.Any],
+        fds: list[int],
+    ) -> None:
+        pid = os.fork()
+
+        if pid == 0:
+            self.child(code, request, fds)
+
+        # The child is watched before the reply, a client gone by then still gets it reaped.
+        self.children[pid] = conn
+        self.selector.register(conn, selectors.EVENT_READ, pid)
+
+        # Pending clients wait in the listen backlog until a child exits.
+        if self.busy():
+            self.pause()
+
+        try:
+            send_message(conn, {"ok": True, "pid": pid})
+        except OSError:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+
+        # The only thing left to read is the client hanging up early.
+        conn.setblocking(False)
+
+    def child(
+        self, code: CodeType, request: dict[str, typing.Any], fds: list[int]
+    ) -> None:
+        status = 0
+
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+
+            if self.listener is not None:
+                self.listener.close()
+
+            for conn in self.children.values():
+                conn.close()
+
+            for conn, pending in self.pending.items():
+                pending.close()
+                conn.close()
+
+            for compiling in self.compiling():
+                compiling.close()
+                compiling.conn.close()
+
+            for worker in self.workers:
+                worker.conn.close()
+
+            for target, fd in enumerate(fds):
+                os.dup2(fd, target)
+
+            sys.stdin = open(0, "r", closefd=False)
+            sys.stdout = open(1, "w", closefd=False)
+            sys.stderr = open(2, "w", closefd=False)
+
+            os.chdir(request.get("cwd", os.getcwd()))
+            os.environ.clear()
+            os.environ.update(request.get("env", {}))
+            sys.argv = [request["path"], *request.get("argv", [])]
+
+            exec(code, {"__name__": "__main__", "__file__": request["path"]})
+
+        except SystemExit as error:
+            status = (
+                error.code if isinstance(error.code, int) else int(error.code is not None)
+            )
+        except BaseException as error:
+            # The frame of this method isn't part of the script's traceback.
+            if (tb := error.__traceback__) is not None and tb.tb_next is not None:
+                error = error.with_traceback(tb.tb_next)
+
+            traceback.print_exception(error)
+            status = 1
+
+        finally:
+            with contextlib.suppress(Exception):
+                sys.stdout.flush()
+                sys.stderr.flush()
+
+            os._exit(status)
+
+    def disconnected(self, conn: socket.socket) -> None:
+        pid = self.selector.get_key(conn).data
+
+        try:
+            if conn.recv(1):
+                return
+        except BlockingIOError:
+            return
+        except OSError:
+            pass
+
+        with contextlib.suppress(ProcessLookupError):
+            os.kill(pid, signal.SIGTERM)
+
+    def reap(self) -> None:
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+
+            if pid == 0:
+                return
+
+            if (conn := self.children.pop(pid, None)) is None:
+                continue
+
+            # Only connections still open are in the selector.
+            if conn.fileno() != -1:
+                self.selector.unregister(conn)
+
+            with contextlib.suppress(OSError):
+                conn.setblocking(True)
+                send_message(conn, {"status": os.waitstatus_to_exitcode(status)})
+
+            conn.close()
+
+            if not self.busy():
+                self.resume()
+
+
+class Client:
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path or socket_path()
+
+    def connect(self) -> socket.socket:
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            conn.connect(self.path)
+        except OSError:
+            conn.close()
+            raise
+
+        return conn
+
+    def request(
+        self, op: str, path: str, parser: str, optimize: int, **data: typing.Any
+    ) -> dict[str, typing.Any]:
+        return {
+            "op": op,
+            "path": os.path.abspath(path),
+            "parser": parser,
+            "optimize": optimize,
+            **data,
+        }
+
+    def compile(self, path: str, parser: str = "lalr", optimize: int = 0) -> CodeType:
+        with self.connect() as conn:
+            send_message(conn, self.request("compile", path, parser, optimize))
+            response, _ = recv_message(conn)
+
+            if not response["ok"]:
+                raise ServerError(response["error"])
+
+            code, _ = recv_frame(conn)
+
+        return marshal.loads(code)
+
+    def run(
+        self,
+        path: str,
+        argv: typing.Sequence[str] = (),
+        parser: str = "lalr",
+        optimize: int = 0,
+    ) -> int:
+        for stream in (sys.stdout, sys.stderr):
+            stream.flush()
+
+        with self.connect() as conn:
+            request = self.request(
+                "run",
+                path,
+                parser,
+                optimize,
+                argv=list(argv),
+                cwd=os.getcwd(),
+                env=dict(os.environ),
+            )
+            send_message(conn, request, fds=[0, 1, 2])
+
+            response, _ = recv_message(conn)
+
+            if not response["ok"]:
+                raise ServerError(response["error"])
+
+            # Hanging up makes the server terminate the child.
+            try:
+                response, _ = recv_message(conn)
+            except KeyboardInterrupt:
+                return 128 + signal.SIGINT
+
+        return response["status"]
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import ast
+import re
+import sys
+import traceback
+import typing
+
+from ..metrics import source as count_source
+from ..optimizer import LEVELS, fold
+from ..parser import (
+    AstTransformer,
+    InteractiveParser,
+    LexerState,
+    LexerThread,
+    LineCounter,
+    ParseError,
+    SrpParser,
+    TextSlice,
+    Token,
+    Tree,
+    UnexpectedCharacters,
+    UnexpectedInput,
+    get_parser,
+)
+from ..profiling import stage
+
+__all__ = ("Session", "run_stream", "repl", "statements_rule")
+
+# A long string may span several inputs, everything else ends on its own line.
+LONG_STRING = re.compile(r"[ubfrUBFR]{0,2}(\"\"\"|\'\'\')")
+
+
+def statements_rule(lark: typing.Any) -> str:
+    # The rule lark makes of `following*` in `module`, statements after the first one are
+    # collected in it.
+    for rule in lark.rules:
+        expansion = [symbol.name for symbol in rule.expansion]
+
+        if rule.origin.name == "module" and len(expansion) == 2:
+            if expansion[0] == "statement":
+                return expansion[1]
+
+    raise ValueError("The grammar has no rule for the statements of a module.")
+
+
+class Session:
+    def __init__(
+        self,
+        namespace: dict[str, typing.Any] | None = None,
+        filename: str = "<stdin>",
+        optimize: int = 0,
+    ) -> None:
+        if optimize not in LEVELS:
+            raise ValueError(f"Unknown optimization level: {optimize}")
+
+        self.namespace = namespace if namespace is not None else {"__name__": "__main__"}
+        self.filename = filename
+        self.optimize = optimize
+
+        # Streaming needs LALR, Earley only produces a tree once the input is over.
+        self.lark = get_parser("lalr")
+        self.transformer = AstTransformer(optimize=optimize)
+        self.statements = statements_rule(self.lark)
+
+        self.reset()
+
+    def reset(self) -> None:
+        self.parser: InteractiveParser = self.lark.parse_interactive(start="module")
+        self.pending: tuple[int, int, str] | None = None
+
+        # The first statement is left on its own at the bottom of the stack, it's complete
+        # once reduced there.
+        self.first = False
+
+        state = self.parser.parser_state
+        self.completed = state.parse_conf.states[state.parse_conf.start_state][
+            "statement"
+        ][1]
+
+        # Text from the line where the statements which didn't run yet start, and their
+        # position. Once LALR rejects the input, it's kept to be parsed at once on close.
+        self.text: list[str] = []
+        self.line = 1
+        self.start = (1, 1)
+        self.rejected = False
+
+    def lex(self, text: str, line: int, column: int) -> LexerThread:
+        counter = LineCounter("\n")
+        counter.line, counter.column, counter.line_start_pos = line, column + 1, -column
+
+        return LexerThread(
+            self.parser.lexer_thread.lexer, LexerState(TextSlice.cast_from(text), counter)
+        )
+
+    def feed(self, text: str, line: int = 1, mode: str = "exec") -> None:
+        column = 0
+        count_source(text)
+
+        if not self.text:
+            self.line, self.start = line, (line, 1)
+
+        self.text.append(text)
+
+        if self.rejected:
+            return
+
+        if self.pending is not None:
+            line, column, head = self.pending
+            text, self.pending = head + text, None
+
+        try:
+            for token in self.lex(text, line, column).lex(self.parser.parser_state):
+                self.parser.feed_token(token)
+
+                if self.flush(mode):
+                    self.keep(token)
+
+        except UnexpectedCharacters as error:
+            if not LONG_STRING.match(text, error.pos_in_stream):
+                self.rejected = True
+                return
+
+            self.pending = (error.line, error.column - 1, text[error.pos_in_stream :])
+
+        except UnexpectedInput:
+            self.rejected = True
+
+    def keep(self, token: Token) -> None:
+        # Statements from `token` on haven't run, the text before them is dropped. Tokens of
+        # the lexer always carry their position.
+        line, column = typing.cast(int, token.line), typing.cast(int, token.column)
+        text = "".join(self.text)
+        start = 0
+
+        for _ in range(line - self.line):
+            start = text.index("\n", start) + 1
+
+        self.text, self.line, self.start = [text[start:]], line, (line, column)
+
+    def flush(self, mode: str = "exec") -> bool:
+        state = self.parser.parser_state
+        stack = state.value_stack
+        ran = False
+
+        if not self.first and len(state.state_stack) > 1:
+            if state.state_stack[1] == self.completed:
+                self.first = ran = True
+                self.execute(stack[0], mode)
+
+        # Those after it pile up in the tree above it once the next statement starts.
+        if len(stack) < 2:
+            return ran
+
+        following = stack[1]
+
+        if not isinstance(following, Tree) or following.data != self.statements:
+            return ran
+
+        # The children list is reused for every statement after it, so it is emptied.
+        statements = following.children[:]
+        del following.children[:]
+
+        for statement in statements:
+            self.execute(statement, mode)
+
+        return ran or bool(statements)
+
+    def complete(self) -> bool:
+        if self.rejected:
+            return True
+
+        if self.pending is not None or "$END" not in self.parser.choices():
+            return False
+
+        try:
+            self.parser.copy().feed_eof()
+        except UnexpectedInput:
+            return False
+
+        return True
+
+    def close(self, mode: str = "exec") -> None:
+        if self.rejected:
+            return self.close_rejected(mode)
+
+        if self.pending is not None:
+            line, column, _ = self.pending
+            raise ParseError(
+                "unterminated string", (self.filename, line, column + 1, None)
+            )
+
+        first = self.first
+
+        try:
+            module = self.parser.feed_eof()
+        except UnexpectedInput:
+            # LALR may reject the input only once it ends, that is left to Earley too.
+            return self.close_rejected(mode)
+
+        self.reset()
+
+        for statement in module.children[1 if first else 0 :]:
+            if statement is not None:
+                self.execute(statement, mode)
+
+    def close_rejected(self, mode: str = "exec") -> None:
+        # What LALR rejected is left to Earley, from the first statement that didn't run.
+        # Blank lines and spaces in front keep it at its position.
+        line, column = self.start
+        text = "\n" * (line - 1) + " " * (column - 1) + "".join(self.text)[column - 1 :]
+        first = not self.first
+
+        try:
+            module = SrpParser().parse(text, first)
+        except ParseError as error:
+            raise error.located(self.filename) from None
+        finally:
+            self.reset()
+
+        # Children of a module are all statements, never tokens.
+        for statement in module.children:
+            if statement is not None:
+                self.execute(typing.cast(Tree, statement), mode)
+
+    def execute(self, statement: Tree, mode: str = "exec") -> typing.Any:
+        with stage("transform"):
+            node = fold(self.transformer.transform(statement), self.optimize)
+
+        # Statements which build nothing are left out, like in a whole module.
+        if not isinstance(node, ast.stmt):
+            return
+
+        if mode == "single":
+            module: ast.mod = ast.Interactive(body=[node])
+        else:
+            module = ast.Module(body=[node], type_ignores=[])
+
+        with stage("compile"):
+            code = compile(module, self.filename, mode)
+
+        with stage("exec"):
+            exec(code, self.namespace)
+
+
+def trim(error: BaseException) -> BaseException:
+    # Frames of the session itself aren't part of what the user typed.
+    tb = error.__traceback__
+
+    while tb is not None and tb.tb_frame.f_code.co_filename == __file__:
+        tb = tb.tb_next
+
+    return error.with_traceback(tb)
+
+
+def run_stream(
+    path: str, optimize: int = 0, namespace: dict[str, typing.Any] | None = None
+) -> dict[str, typing.Any]:
+    session = Session(
+        (
+            namespace
+            if namespace is not None
+            else {"__name__": "__main__", "__file__": path}
+        ),
+        path,
+        optimize,
+    )
+
+    with open(path, "r") as fp:
+        for line, text in enumerate(fp, 1):
+            session.feed(text, line)
+
+    session.close()
+    return session.namespace
+
+
+def repl(optimize: int = 0, banner: bool = True) -> None:
+    from .. import __version__
+
+    session = Session(optimize=optimize)
+    line = 0
+
+    if banner:
+        print(f"Serpentes {__version__} on Python {sys.version.split()[0]}")
+
+    while True:
+        try:
+            text = input("... " if line and not session.complete() else ">>> ")
+        except EOFError:
+            print()
+            return
+        except KeyboardInterrupt:
+            print("\nKeyboardInterrupt")
+            session.reset()
+            line = 0
+            continue
+
+        line += 1
+
+        try:
+            session.feed(text + "\n", line, "single")
+
+            if session.complete():
+                session.close("single")
+                line = 0
+
+        except ParseError as error:
+            print(f"{type(error).__name__}: {error}", file=sys.stderr)
+            session.reset()
+            line = 0
+
+        except SystemExit:
+            raise
+
+        except BaseException as error:
+            session.reset()
+            line = 0
+
+            traceback.print_exception(trim(error))
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import ast
+import json
+import os
+import re
+import typing
+
+from ..cache import source_mode, write_atomic
+from ..compiler import SourceWriter, build_source, find_sources
+
+__all__ = (
+    "transpile_source",
+    "transpile_file",
+    "transpile_tree",
+    "output_path",
+    "map_path",
+    "load_map",
+    "resolve",
+    "resolve_traceback",
+)
+
+MAP_VERSION = 1
+MAP_SUFFIX = ".map"
+
+FRAME = re.compile(
+    r'^(?P<indent>\s*)File "(?P<path>[^"]+\.py)", line (?P<line>\d+)(?P<rest>.*)$'
+)
+CARETS = re.compile(r"^\s*[~^]+\s*$")
+
+Position: typing.TypeAlias = "tuple[int, int, int, int]"
+
+
+def positions(module: ast.Module, generated: ast.Module) -> list[Position]:
+    # `ast.unparse` mostly keeps the shape of the tree. Where it doesn't, like a constant
+    # tuple parsed back as a tuple display, only that subtree is left out.
+    found: set[Position] = set()
+    pairs: list[tuple[typing.Any, typing.Any]] = [(module, generated)]
+
+    while pairs:
+        original, output = pairs.pop()
+
+        if not isinstance(original, ast.AST) or type(original) is not type(output):
+            continue
+
+        if isinstance(original, (ast.expr, ast.stmt)):
+            found.add(
+                (output.lineno, output.col_offset, original.lineno, original.col_offset)
+            )
+
+        for (_, left), (_, right) in zip(
+            ast.iter_fields(original), ast.iter_fields(output)
+        ):
+            if isinstance(left, list) and isinstance(right, list):
+                if len(left) == len(right):
+                    pairs.extend(zip(left, right))
+            else:
+                pairs.append((left, right))
+
+    return sorted(found)
+
+
+class SetDisplays(ast.NodeTransformer):
+    # Folded sets are `frozenset` constants, which unparse as a call of whatever `frozenset`
+    # names where the file runs. A set display builds the same values.
+    def visit_Constant(self, node: ast.Constant) -> ast.expr:
+        if not isinstance(node.value, frozenset):
+            return node
+
+        items: list[ast.expr] = [ast.Constant(value=item) for item in node.value]
+        # `{*()}` is the only empty set without a name.
+        empty = ast.Starred(value=ast.Tuple(elts=[], ctx=ast.Load()), ctx=ast.Load())
+        result = ast.Set(elts=items or [empty])
+
+        for child in ast.walk(result):
+            ast.copy_location(child, node)
+
+        return result
+
+
+def line_table(found: list[Position], lines: int) -> list[int | None]:
+    table: list[int | None] = [None] * lines
+
+    # Sorted by output position, so the leftmost node of a line decides where it maps.
+    for line, _, source_line, _ in found:
+        if table[line - 1] is None:
+            table[line - 1] = source_line
+
+    return table
+
+
+def transpile_source(
+    text: str, parser: str = "lalr", optimize: int = 0
+) -> tuple[str, dict[str, typing.Any]]:
+    module = SetDisplays().visit(build_source(text, parser, optimize=optimize))
+
+    writer = SourceWriter()
+    python = writer.write(module) + writer.close()
+
+    found = positions(module, ast.parse(python))
+
+    return python, {
+        "version": MAP_VERSION,
+        "lines": line_table(found, python.count("\n")),
+        "positions": found,
+    }
+
+
+def output_path(source: str, root: str | None = None, output: str | None = None) -> str:
+    if output is None:
+        return os.path.splitext(source)[0] + ".py"
+
+    if root is None:
+        return output
+
+    relative = os.path.relpath(os.path.splitext(source)[0] + ".py", root)
+    return os.path.join(output, relative)
+
+
+def map_path(path: str) -> str:
+    return path + MAP_SUFFIX
+
+
+def transpile_file(
+    source: str,
+    output: str | None = None,
+    parser: str = "lalr",
+    optimize: int = 0,
+    force: bool = False,
+) -> str:
+    output = output or output_path(source)
+
+    # Only files written by a previous transpile are overwritten without `force`.
+    if not force and os.path.exists(output) and not os.path.exists(map_path(output)):
+        raise FileExistsError(f"{output} exists and wasn't transpiled by serpentes")
+
+    with open(source, "r") as fp:
+        python, mapping = transpile_source(fp.read(), parser, optimize)
+
+    mapping["source"] = os.path.relpath(source, os.path.dirname(os.path.abspath(output)))
+
+    # The outputs are shipped in place of the source, so they are as readable as it is.
+    mode = source_mode(source)
+
+    write_atomic(output, python.encode(), mode)
+    write_atomic(
+        map_path(output), json.dumps(mapping, separators=(",", ":")).encode(), mode
+    )
+
+    return output
+
+
+def transpile_tree(
+    root: str,
+    output: str | None = None,
+    parser: str = "lalr",
+    optimize: int = 0,
+    force: bool = False,
+) -> typing.Iterator[tuple[str, str | None, Exception | None]]:
+    directory = None if os.path.isfile(root) else root
+
+    for source in find_sources(root):
+        target = output_path(source, directory, output)
+
+        try:
+            yield source, transpile_file(source, target, parser, optimize, force), None
+        except Exception as error:
+            yield source, None, error
+
+
+def load_map(path: str) -> dict[str, typing.Any] | None:
+    try:
+        with open(map_path(path), "r") as fp:
+            mapping = json.load(fp)
+    except (OSError, ValueError):
+        return None
+
+    return mapping if mapping.get("version") == MAP_VERSION else None
+
+
+def resolve(path: str, line: int, column: int | None = None) -> tuple[str, int] | None:
+    if (mapping := load_map(path)) is None:
+        return None
+
+    source = os.path.normpath(os.path.join(os.path.dirname(path), mapping["source"]))
+
+    # Nodes which start at or before the column, the last one is the innermost.
+    if column is not None:
+        starts = [
+            source_line
+            for output_line, output_column, source_line, _ in mapping["positions"]
+            if output_line == line and output_column <= column
+        ]
+
+        if starts:
+            return source, starts[-1]
+
+    lines = mapping["lines"]
+
+    # Lines without a node of their own belong to the closest line above them.
+    for index in range(min(line, len(lines)) - 1, -1, -1):
+        if lines[index] is not None:
+            return source, lines[index]
+
+    return None
+
+
+def source_line(path: str, line: int) -> str | None:
+    try:
+        with open(path, "r") as fp:
+            for number, text in enumerate(fp, 1):
+                if number == line:
+                    return text.strip()
+    except OSError:
+        pass
+
+    return None
+
+
+def resolve_traceback(text: str) -> str:
+    lines = text.splitlines()
+    output: list[str] = []
+    index = 0
+
+    while index < len(lines):
+        start, match = index, FRAME.match(lines[index])
+        index += 1
+
+        if match is None or load_map(match["path"]) is None:
+            output.append(lines[index - 1])
+            continue
+
+        indent = match["indent"] + "  "
+        quoted, column = False, None
+
+        # The quoted line and its carets point into the `.py` file, so they're replaced.
+        if index < len(lines) and lines[index].startswith(indent):
+            quoted = True
+            index += 1
+
+            if index < len(lines) and CARETS.match(lines[index]):
+                # Python strips the quoted line, generated statements are never indented.
+                carets = lines[index]
+                column = len(carets) - len(carets.lstrip()) - len(indent)
+                index += 1
+
+        if (found := resolve(match["path"], int(match["line"]), column)) is None:
+            output.extend(lines[start:index])
+            continue
+
+        source, line = found
+        output.append(f'{match["indent"]}File "{source}", line {line}{match["rest"]}')
+
+        if quoted and (code := source_line(source, line)) is not None:
+            output.append(f"{indent}{code}")
+
+    return "\n".join(output) + ("\n" if text.endswith("\n") else "")